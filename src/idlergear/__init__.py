@@ -1,9 +1,17 @@
 """IdlerGear - Knowledge management API for AI-assisted development."""
 
-try:
-    from importlib.metadata import version as get_version
 
-    __version__ = get_version("idlergear")
-except Exception:
-    # Fallback for development/editable installs
-    __version__ = "0.3.1"
+def __getattr__(name: str):
+    # Resolved lazily: importlib.metadata costs ~30ms, which dominates the
+    # start-up of light entry points such as idlergear-context
+    if name == "__version__":
+        try:
+            from importlib.metadata import version as get_version
+
+            value = get_version("idlergear")
+        except Exception:
+            # Fallback for development/editable installs
+            value = "0.3.1"
+        globals()["__version__"] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
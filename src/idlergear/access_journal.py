@@ -0,0 +1,330 @@
+"""Append-only journal of task and note accesses.
+
+Reading a task or note used to bump ``accessed``/``access_count`` by
+re-rendering and rewriting its markdown file, so every ``task_show`` was a
+full file write that churned git diffs and editor watchers. Accesses are
+instead appended to one small journal:
+
+    .idlergear/access_journal.jsonl
+        {"kind": "task", "id": 3, "ts": "2026-10-19T09:12:44.120391Z"}
+        {"kind": "task", "id": 3, "fold": 184}
+
+Loading an item merges its pending accesses into the in-memory view and
+computes ``relevance_score`` from the merged fields. Pending accesses are
+folded into the frontmatter whenever the file is rewritten anyway (update,
+close) and by ``compact()``, which runs once the journal grows past
+``COMPACT_BYTES``.
+
+A fold record marks the item's accesses before byte offset ``fold`` as
+written to its file; accesses appended after that offset stay pending.
+
+Processes coordinate through ``flock`` on ``access_journal.lock``: appends
+take it shared, folds and compaction take it exclusive. So an access is
+folded at most once, and compaction can empty a fully folded journal
+without losing appends. Compaction appends each item's fold record just
+before moving its rewritten file into place; a crash in between loses that
+item's pending accesses rather than counting them twice.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from idlergear.storage import now_iso, parse_frontmatter, render_frontmatter
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None  # No cross-process locking on Windows
+
+JOURNAL_NAME = "access_journal.jsonl"
+LOCK_NAME = "access_journal.lock"
+
+# Fold everything into the markdown files once the journal is this large
+COMPACT_BYTES = 64 * 1024
+
+ItemKey = Tuple[str, int]
+
+
+class AccessJournal:
+    """Access journal for one .idlergear directory.
+
+    The parsed journal is cached and extended incrementally, so merging
+    pending accesses into each item of a listing costs one ``stat()``.
+
+    Example:
+        >>> journal = get_access_journal(Path(".idlergear"))
+        >>> journal.record("task", 3)
+        >>> journal.merge("task", {"id": 3, "access_count": 1, ...})
+        {'id': 3, 'access_count': 2, 'accessed': '...', 'relevance_score': ...}
+    """
+
+    def __init__(self, idlergear_dir: Path):
+        """Initialize access journal.
+
+        Args:
+            idlergear_dir: The project's .idlergear directory
+        """
+        self.idlergear_dir = Path(idlergear_dir)
+        self.path = self.idlergear_dir / JOURNAL_NAME
+        self.lock_path = self.idlergear_dir / LOCK_NAME
+
+        self._lock = threading.Lock()
+        # Set while this thread holds the journal flock
+        self._held = threading.local()
+        self._inode: Optional[int] = None
+        self._offset = 0
+        # Pending (offset, timestamp) accesses per item
+        self._pending: Dict[ItemKey, List[Tuple[int, str]]] = {}
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def record(self, kind: str, item_id: int) -> str:
+        """Append an access to the journal.
+
+        Args:
+            kind: Item kind ("task" or "note")
+            item_id: Item ID
+
+        Returns:
+            The access timestamp
+        """
+        timestamp = now_iso()
+        nested = self._holding()
+        with self._flock(exclusive=False):
+            size = self._append({"kind": kind, "id": item_id, "ts": timestamp})
+        # Not from inside a fold, which has already snapshotted its accesses
+        if size > COMPACT_BYTES and not nested:
+            self.compact()
+        return timestamp
+
+    def _append(self, record: Dict[str, Any]) -> int:
+        """Append one record with a single write; return the new size."""
+        self.idlergear_dir.mkdir(parents=True, exist_ok=True)
+        line = (json.dumps(record) + "\n").encode()
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+            return os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+
+    def _holding(self) -> bool:
+        return getattr(self._held, "depth", 0) > 0
+
+    @contextmanager
+    def _flock(self, exclusive: bool) -> Iterator[None]:
+        """Hold the cross-process journal lock (re-entrant per thread)."""
+        if fcntl is None or self._holding():
+            # The outer hold is exclusive whenever it matters: records
+            # nested in a fold or compaction only append
+            yield
+            return
+        self.idlergear_dir.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            self._held.depth = 1
+            try:
+                yield
+            finally:
+                self._held.depth = 0
+        finally:
+            os.close(fd)  # Releases the lock
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """Hold the journal lock exclusively, e.g. around rewriting item files.
+
+        Folds and compaction in this thread still run; other threads and
+        processes wait, and appends queue until the lock is released.
+        """
+        with self._flock(exclusive=True):
+            yield
+
+    @contextmanager
+    def folding(
+        self, kind: str, item_id: int, filepath: Path
+    ) -> Iterator[Tuple[Dict[str, Any], str]]:
+        """Read an item's file to rewrite it, with pending accesses folded in.
+
+        The file is read under the exclusive journal lock, with ``accessed``
+        and ``access_count`` updated from the journal; the body of the
+        ``with`` block writes it back. Once it has, the accesses are marked
+        folded, still under the lock, so no other fold or compaction can
+        count them again.
+
+        Args:
+            kind: Item kind ("task" or "note")
+            item_id: Item ID
+            filepath: The item's markdown file
+
+        Yields:
+            Tuple of (frontmatter, body) of the file
+        """
+        with self._flock(exclusive=True):
+            frontmatter, body = parse_frontmatter(filepath.read_text())
+            upto, pending = self._snapshot((kind, item_id))
+            _apply(frontmatter, pending)
+            yield frontmatter, body
+            if pending:
+                self._append({"kind": kind, "id": item_id, "fold": upto})
+
+    def compact(self) -> int:
+        """Fold all pending accesses into their files and empty the journal.
+
+        Returns:
+            Number of items whose files were updated
+        """
+        from idlergear.notes import get_notes_dir
+        from idlergear.relevance import item_relevance
+        from idlergear.tasks import get_tasks_dir
+
+        project_path = self.idlergear_dir.parent
+        dirs = {"task": get_tasks_dir(project_path), "note": get_notes_dir(project_path)}
+
+        with self._flock(exclusive=True):
+            # Appends wait for the lock, so this is the whole journal
+            with self._lock:
+                self._refresh()
+                upto, pending = self._offset, dict(self._pending)
+
+            files: Dict[ItemKey, Path] = {}
+            for kind, directory in dirs.items():
+                if directory is None or not directory.exists():
+                    continue
+                for filepath in directory.glob("*.md"):
+                    frontmatter, _ = parse_frontmatter(filepath.read_text())
+                    if (kind, frontmatter.get("id")) in pending:
+                        files[(kind, frontmatter["id"])] = filepath
+
+            updated = 0
+            for (kind, item_id), accesses in pending.items():
+                filepath = files.get((kind, item_id))
+                if filepath is None or not accesses:
+                    continue  # Deleted item: its accesses are dropped
+                frontmatter, body = parse_frontmatter(filepath.read_text())
+                _apply(frontmatter, [ts for _, ts in accesses])
+                score = item_relevance(frontmatter)
+                if score is not None:
+                    frontmatter["relevance_score"] = score
+                tmp = filepath.with_name(filepath.name + ".tmp")
+                tmp.write_text(render_frontmatter(frontmatter, body.strip() + "\n"))
+                self._append({"kind": kind, "id": item_id, "fold": upto})
+                os.replace(tmp, filepath)
+                updated += 1
+
+            # Everything is folded: start a new (empty) journal file, which
+            # readers notice by its inode
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_bytes(b"")
+            tmp.replace(self.path)
+            with self._lock:
+                self._inode = None  # Re-read from scratch next time
+        return updated
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def merge(self, kind: str, item: Dict[str, Any], score: bool = True) -> Dict[str, Any]:
+        """Merge pending accesses into a loaded item and score its relevance.
+
+        Args:
+            kind: Item kind ("task" or "note")
+            item: Item as loaded from its file (modified in place)
+            score: Compute relevance_score now; listings pass False and
+                score all items in one batch instead
+
+        Returns:
+            The item, with current access fields and relevance_score
+        """
+        from idlergear.relevance import item_relevance
+
+        if item.get("id") is not None:
+            _, pending = self._snapshot((kind, item["id"]))
+            _apply(item, pending)
+        if score:
+            relevance = item_relevance(item)
+            if relevance is not None:
+                item["relevance_score"] = relevance
+        return item
+
+    def _snapshot(self, key: ItemKey) -> Tuple[int, List[str]]:
+        """Return (journal offset, pending access timestamps) for an item."""
+        with self._lock:
+            self._refresh()
+            return self._offset, [ts for _, ts in self._pending.get(key, ())]
+
+    def _refresh(self) -> None:
+        """Parse records appended since the last call."""
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            self._inode, self._offset, self._pending = None, 0, {}
+            return
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Replaced by compaction (here or in another process)
+            self._inode, self._offset, self._pending = stat.st_ino, 0, {}
+        if stat.st_size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(stat.st_size - self._offset)
+        # A torn final line is picked up on the next refresh
+        end = data.rfind(b"\n") + 1
+        offset = self._offset
+        for raw in data[:end].splitlines(keepends=True):
+            try:
+                record = json.loads(raw)
+                key = (record["kind"], record["id"])
+            except (ValueError, KeyError, TypeError):
+                offset += len(raw)
+                continue
+            if "fold" in record:
+                upto = record["fold"]
+                kept = [a for a in self._pending.get(key, ()) if a[0] >= upto]
+                if kept:
+                    self._pending[key] = kept
+                else:
+                    self._pending.pop(key, None)
+            elif "ts" in record:
+                self._pending.setdefault(key, []).append((offset, record["ts"]))
+            offset += len(raw)
+        self._offset = offset
+
+
+def _apply(fields: Dict[str, Any], timestamps: List[str]) -> None:
+    """Add accesses to an item's or frontmatter's access fields."""
+    if not timestamps:
+        return
+    fields["access_count"] = (fields.get("access_count") or 0) + len(timestamps)
+    latest = max(timestamps)
+    accessed = fields.get("accessed")
+    if isinstance(accessed, datetime):  # Unquoted timestamp in hand-edited YAML
+        accessed = accessed.isoformat().replace("+00:00", "Z")
+    if not accessed or accessed < latest:
+        fields["accessed"] = latest
+
+
+_journals: Dict[Path, AccessJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_access_journal(idlergear_dir: Path) -> AccessJournal:
+    """Get the shared AccessJournal for a .idlergear directory."""
+    key = Path(idlergear_dir).resolve()
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = _journals[key] = AccessJournal(key)
+        return journal
@@ -0,0 +1,504 @@
+"""Rotating, time-indexed file access log.
+
+Every file access checked against the registry is recorded. A single
+ever-growing ``access_log.jsonl`` made each audit re-read months of
+history; instead the log is split into daily segments:
+
+    .idlergear/
+        access_log.jsonl               # Today's segment (human-readable)
+        access_log/
+            2026-10-18.jsonl.gz        # Earlier days, compressed on rotation
+            index.db                   # Segment time ranges + hourly rollups
+
+``index.db`` is a SQLite database holding a sparse time index (one row per
+segment with its first/last timestamp) and hourly rollups keyed by file,
+agent and tool. An audit of the last N hours sums the rollups for whole
+hours and scans only the segment holding the partial hour at the start of
+the window, so its cost does not grow with the age of the log.
+
+Appends are buffered in memory and written by a background thread (and at
+exit); call ``flush()`` to write immediately. Each flush runs inside a
+SQLite write transaction, which also serializes flushes, rotations and
+rollup updates across processes sharing the log.
+"""
+
+from __future__ import annotations
+
+import atexit
+import gzip
+import json
+import math
+import shutil
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+ACTIVE_NAME = "access_log.jsonl"
+SEGMENT_DIR = "access_log"
+INDEX_NAME = "index.db"
+
+# Background writer: flush after this many seconds or buffered entries
+FLUSH_INTERVAL = 1.0
+FLUSH_SIZE = 256
+
+HOUR = 3600
+
+
+def _parse_timestamp(value: Any) -> Optional[float]:
+    """Return a POSIX timestamp for an ISO string, or None if unparseable."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _day(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).date().isoformat()
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat()
+
+
+class AccessLog:
+    """Buffered, daily-rotated access log with a SQLite time index.
+
+    Example:
+        >>> log = get_access_log(Path(".idlergear"))
+        >>> log.append({"timestamp": "...", "tool": "Read", "file_path": "a.py"})
+        >>> log.summarize(datetime.now(timezone.utc) - timedelta(hours=24))
+        {'a.py': {'count': 1, 'last_accessed': '...', 'agents': [...], 'tools': ['Read']}}
+    """
+
+    def __init__(self, idlergear_dir: Path):
+        """Initialize access log.
+
+        Args:
+            idlergear_dir: The project's .idlergear directory
+        """
+        self.idlergear_dir = Path(idlergear_dir)
+        self.active_path = self.idlergear_dir / ACTIVE_NAME
+        self.segment_dir = self.idlergear_dir / SEGMENT_DIR
+        self.index_path = self.segment_dir / INDEX_NAME
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()  # Guards the buffer
+        self._flush_lock = threading.Lock()  # One flush at a time
+        self._wakeup = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._conn: Optional[sqlite3.Connection] = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Queue an entry; the background writer appends it shortly.
+
+        Args:
+            entry: JSON-serializable access record with "timestamp" (ISO)
+                and "file_path"; "agent_id" and "tool" feed the rollups
+        """
+        with self._lock:
+            self._buffer.append(entry)
+            pending = len(self._buffer)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="access-log-writer", daemon=True
+                )
+                self._writer.start()
+        if pending >= FLUSH_SIZE:
+            self._wakeup.set()
+
+    def _run_writer(self) -> None:
+        while True:
+            self._wakeup.wait(FLUSH_INTERVAL)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                pass  # Logging must never take the host process down
+
+    def flush(self) -> int:
+        """Write buffered entries to the active segment and the index.
+
+        Returns:
+            Number of entries written
+        """
+        with self._flush_lock:
+            with self._lock:
+                entries, self._buffer = self._buffer, []
+            if not entries:
+                self._index_pending_legacy()
+                return 0
+
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                active_day = self._active_day(conn)
+                lines: List[str] = []
+                stamps: List[float] = []
+                rollups: Dict[Tuple[int, str, str, str], Tuple[int, float]] = {}
+
+                for entry in entries:
+                    ts = _parse_timestamp(entry.get("timestamp"))
+                    day = _day(ts) if ts is not None else None
+                    if day and active_day and day > active_day:
+                        # First entry of a new day: close out the old segment
+                        self._write_active(conn, active_day, lines, stamps)
+                        self._rotate(conn, active_day)
+                        lines, stamps = [], []
+                        active_day = day
+                    active_day = active_day or day or _day(time.time())
+                    lines.append(json.dumps(entry))
+                    if ts is not None:
+                        stamps.append(ts)
+                    self._add_rollup(rollups, entry, ts)
+
+                self._write_active(conn, active_day, lines, stamps)
+                self._save_rollups(conn, rollups)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return len(entries)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.segment_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.index_path),
+                check_same_thread=False,
+                isolation_level=None,
+                timeout=30,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(
+                """
+                -- Sparse time index: one row per daily segment
+                CREATE TABLE IF NOT EXISTS segments (
+                    day TEXT PRIMARY KEY,
+                    path TEXT NOT NULL,
+                    start_ts REAL,
+                    end_ts REAL,
+                    count INTEGER NOT NULL DEFAULT 0
+                );
+
+                -- Hourly per-file/agent/tool rollups
+                CREATE TABLE IF NOT EXISTS rollups (
+                    hour INTEGER NOT NULL,
+                    file_path TEXT NOT NULL,
+                    agent_id TEXT NOT NULL,
+                    tool TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    last_ts REAL NOT NULL,
+                    PRIMARY KEY (hour, file_path, agent_id, tool)
+                ) WITHOUT ROWID;
+                """
+            )
+            self._conn = conn
+        return self._conn
+
+    def _index_pending_legacy(self) -> None:
+        """Index a legacy log before reading, even with nothing to write."""
+        if self.index_path.exists() or not self.active_path.exists():
+            return
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._active_day(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _active_day(self, conn: sqlite3.Connection) -> Optional[str]:
+        """Return the day of the active segment, indexing a legacy log first."""
+        row = conn.execute(
+            "SELECT day FROM segments WHERE path = ?", (ACTIVE_NAME,)
+        ).fetchone()
+        if row:
+            return row[0]
+        if self.active_path.exists() and self.active_path.stat().st_size:
+            return self._index_legacy(conn)
+        return None
+
+    def _index_legacy(self, conn: sqlite3.Connection) -> Optional[str]:
+        """Split an unindexed (pre-rotation) log into daily segments."""
+        by_day: Dict[str, List[str]] = {}
+        rollups: Dict[Tuple[int, str, str, str], Tuple[int, float]] = {}
+        bounds: Dict[str, List[float]] = {}
+        day = None
+        with open(self.active_path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    entry = {}
+                ts = _parse_timestamp(entry.get("timestamp")) if isinstance(entry, dict) else None
+                if ts is not None:
+                    day = _day(ts)
+                    span = bounds.setdefault(day, [ts, ts])
+                    span[0], span[1] = min(span[0], ts), max(span[1], ts)
+                    self._add_rollup(rollups, entry, ts)
+                # Undated lines stay with the preceding entries
+                by_day.setdefault(day or "", []).append(line.rstrip("\n"))
+
+        days = sorted(by_day)
+        if not days:
+            return None
+        for old_day in days[:-1]:
+            name = f"{SEGMENT_DIR}/{old_day or 'undated'}.jsonl.gz"
+            with gzip.open(self.idlergear_dir / name, "at") as out:
+                out.write("\n".join(by_day[old_day]) + "\n")
+            self._record_segment(conn, old_day, name, bounds.get(old_day), len(by_day[old_day]))
+
+        last = days[-1]
+        tmp = self.active_path.with_suffix(".jsonl.tmp")
+        tmp.write_text("\n".join(by_day[last]) + "\n")
+        tmp.replace(self.active_path)
+        self._record_segment(conn, last, ACTIVE_NAME, bounds.get(last), len(by_day[last]))
+        self._save_rollups(conn, rollups)
+        return last
+
+    def _record_segment(
+        self,
+        conn: sqlite3.Connection,
+        day: str,
+        path: str,
+        span: Optional[List[float]],
+        count: int,
+    ) -> None:
+        start, end = span if span else (None, None)
+        conn.execute(
+            """
+            INSERT INTO segments (day, path, start_ts, end_ts, count)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(day) DO UPDATE SET
+                path = excluded.path,
+                start_ts = min(coalesce(start_ts, excluded.start_ts), excluded.start_ts),
+                end_ts = max(coalesce(end_ts, excluded.end_ts), excluded.end_ts),
+                count = count + excluded.count
+            """,
+            (day, path, start, end, count),
+        )
+
+    def _write_active(
+        self,
+        conn: sqlite3.Connection,
+        day: str,
+        lines: List[str],
+        stamps: List[float],
+    ) -> None:
+        if not lines:
+            return
+        with open(self.active_path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+        span = [min(stamps), max(stamps)] if stamps else None
+        self._record_segment(conn, day, ACTIVE_NAME, span, len(lines))
+
+    def _rotate(self, conn: sqlite3.Connection, day: str) -> None:
+        """Compress the active segment into access_log/<day>.jsonl.gz."""
+        name = f"{SEGMENT_DIR}/{day}.jsonl.gz"
+        if self.active_path.exists():
+            # Appending makes a multi-member gzip, which reads back as one
+            with open(self.active_path, "rb") as src, gzip.open(
+                self.idlergear_dir / name, "ab"
+            ) as dst:
+                shutil.copyfileobj(src, dst)
+            self.active_path.unlink()
+        conn.execute("UPDATE segments SET path = ? WHERE day = ?", (name, day))
+
+    @staticmethod
+    def _add_rollup(
+        rollups: Dict[Tuple[int, str, str, str], Tuple[int, float]],
+        entry: Dict[str, Any],
+        ts: Optional[float],
+    ) -> None:
+        file_path = entry.get("file_path")
+        if ts is None or not file_path:
+            return
+        key = (
+            int(ts // HOUR),
+            str(file_path),
+            str(entry.get("agent_id") or "unknown"),
+            str(entry.get("tool") or "unknown"),
+        )
+        count, last = rollups.get(key, (0, ts))
+        rollups[key] = (count + 1, max(last, ts))
+
+    @staticmethod
+    def _save_rollups(
+        conn: sqlite3.Connection,
+        rollups: Dict[Tuple[int, str, str, str], Tuple[int, float]],
+    ) -> None:
+        conn.executemany(
+            """
+            INSERT INTO rollups (hour, file_path, agent_id, tool, count, last_ts)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(hour, file_path, agent_id, tool) DO UPDATE SET
+                count = count + excluded.count,
+                last_ts = max(last_ts, excluded.last_ts)
+            """,
+            [(*key, count, last) for key, (count, last) in rollups.items()],
+        )
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def exists(self) -> bool:
+        """Check whether anything has been logged."""
+        return self.active_path.exists() or self.index_path.exists() or bool(self._buffer)
+
+    def iter_entries(
+        self, since: datetime, until: Optional[datetime] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield entries in [since, until), reading only overlapping segments.
+
+        Args:
+            since: Start of the range (timezone-aware)
+            until: Optional end of the range (exclusive)
+        """
+        self.flush()
+        start = since.timestamp()
+        end = until.timestamp() if until else math.inf
+        yield from self._scan(start, end)
+
+    def _scan(self, start: float, end: float) -> Iterator[Dict[str, Any]]:
+        if not self.index_path.exists():
+            return
+        conn = self._connect()
+        rows = conn.execute(
+            """
+            SELECT path FROM segments
+            WHERE end_ts >= ? AND start_ts < ?
+            ORDER BY start_ts
+            """,
+            (start, min(end, 1e18)),
+        ).fetchall()
+        for (name,) in rows:
+            path = self.idlergear_dir / name
+            opener = gzip.open if name.endswith(".gz") else open
+            try:
+                with opener(path, "rt") as f:
+                    for line in f:
+                        try:
+                            entry = json.loads(line)
+                        except json.JSONDecodeError:
+                            continue  # Skip malformed lines
+                        ts = _parse_timestamp(entry.get("timestamp"))
+                        if ts is not None and start <= ts < end:
+                            yield entry
+            except FileNotFoundError:
+                continue  # Rotated by another process meanwhile
+
+    def summarize(self, since: datetime) -> Dict[str, Dict[str, Any]]:
+        """Aggregate accesses since a point in time, by file.
+
+        Whole hours come from the rollups; only the partial hour at the
+        start of the window is read from its segment.
+
+        Args:
+            since: Start of the window (timezone-aware)
+
+        Returns:
+            Dictionary mapping file path to {"count", "last_accessed",
+            "agents", "tools"}
+        """
+        self.flush()
+        if not self.index_path.exists():
+            return {}
+        conn = self._connect()
+
+        cutoff = since.timestamp()
+        first_full_hour = math.ceil(cutoff / HOUR)
+        stats: Dict[str, Dict[str, Any]] = {}
+
+        def add(file_path: str, agent: str, tool: str, count: int, last: float) -> None:
+            data = stats.setdefault(
+                file_path, {"count": 0, "last": last, "agents": {}, "tools": {}}
+            )
+            data["count"] += count
+            data["last"] = max(data["last"], last)
+            data["agents"].setdefault(agent, None)
+            data["tools"].setdefault(tool, None)
+
+        # Partial first hour: exact, from the one segment covering it
+        for entry in self._scan(cutoff, first_full_hour * HOUR):
+            if entry.get("file_path"):
+                add(
+                    str(entry["file_path"]),
+                    str(entry.get("agent_id") or "unknown"),
+                    str(entry.get("tool") or "unknown"),
+                    1,
+                    _parse_timestamp(entry.get("timestamp")),
+                )
+
+        rows = conn.execute(
+            """
+            SELECT file_path, agent_id, tool, SUM(count), MAX(last_ts)
+            FROM rollups WHERE hour >= ?
+            GROUP BY file_path, agent_id, tool
+            ORDER BY file_path, MIN(hour)
+            """,
+            (first_full_hour,),
+        )
+        for row in rows:
+            add(*row)
+
+        return {
+            file_path: {
+                "count": data["count"],
+                "last_accessed": _iso(data["last"]),
+                "agents": list(data["agents"]),
+                "tools": list(data["tools"]),
+            }
+            for file_path, data in stats.items()
+        }
+
+    def close(self) -> None:
+        """Flush and close the index connection."""
+        self.flush()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+_logs: Dict[Path, AccessLog] = {}
+_logs_lock = threading.Lock()
+
+
+def get_access_log(idlergear_dir: Path) -> AccessLog:
+    """Get the shared AccessLog for a .idlergear directory."""
+    key = Path(idlergear_dir).resolve()
+    with _logs_lock:
+        log = _logs.get(key)
+        if log is None:
+            log = _logs[key] = AccessLog(key)
+        return log
+
+
+def flush_access_logs() -> None:
+    """Flush every open access log (also runs at interpreter exit)."""
+    with _logs_lock:
+        logs = list(_logs.values())
+    for log in logs:
+        try:
+            log.flush()
+        except Exception:
+            pass
+
+
+atexit.register(flush_access_logs)
@@ -0,0 +1,306 @@
+"""Persistent caches for values derived from project files.
+
+Expensive per-file work (doc extraction, scans, blame, ...) is cached under
+``.idlergear/cache/<name>.json`` and keyed by the content hash of the file
+it was derived from, so only files whose content changed are reprocessed.
+A (size, mtime) check short-circuits hashing for untouched files.
+
+Values are stored as JSON (dataclasses via ``asdict``) and rebuilt with
+``from_jsonable``, so loading a cache never runs code from it. Caches are local, ephemeral and safe to delete;
+a version mismatch, a malformed entry or a corrupt file is simply a miss.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import threading
+import types
+import typing
+from pathlib import Path
+from typing import Any, Callable
+
+from idlergear.config import find_idlergear_root
+
+# Bump when the layout of cached values changes incompatibly
+CACHE_FORMAT = 2
+
+_MISSING = object()
+
+
+def get_cache_dir(project_path: Path | None = None) -> Path | None:
+    """Get the .idlergear/cache directory."""
+    if project_path is None:
+        project_path = find_idlergear_root()
+    if project_path is None:
+        return None
+    return Path(project_path) / ".idlergear" / "cache"
+
+
+def file_hash(path: str | Path) -> str:
+    """Return the BLAKE2b content hash of a file."""
+    hasher = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _version_tag() -> str:
+    from idlergear import __version__
+
+    return f"{CACHE_FORMAT}:{__version__}"
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert a value (dataclasses included) to its JSON form."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return value
+
+
+@functools.lru_cache(maxsize=None)
+def _field_types(cls: type) -> dict[str, Any]:
+    return typing.get_type_hints(cls)
+
+
+def from_jsonable(tp: Any, data: Any) -> Any:
+    """Rebuild a value of type tp from its JSON form.
+
+    Handles dataclasses (nested and recursive), ``list[...]``,
+    ``tuple[...]``, ``dict[str, ...]`` and optional types; other values are
+    returned as they are.
+
+    Raises:
+        TypeError: If data does not have the shape tp describes
+    """
+    if data is None:
+        return None
+    if dataclasses.is_dataclass(tp):
+        if not isinstance(data, dict):
+            raise TypeError(f"Expected an object for {tp.__name__}")
+        hints = _field_types(tp)
+        return tp(
+            **{
+                f.name: from_jsonable(hints[f.name], data[f.name])
+                for f in dataclasses.fields(tp)
+                if f.init and f.name in data
+            }
+        )
+
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin in (list, tuple):
+        if not isinstance(data, list):
+            raise TypeError(f"Expected an array for {tp}")
+        if origin is list:
+            return [from_jsonable(args[0], item) for item in data]
+        if len(args) == 2 and args[1] is Ellipsis:
+            return tuple(from_jsonable(args[0], item) for item in data)
+        if len(args) != len(data):
+            raise TypeError(f"Expected {len(args)} items for {tp}")
+        return tuple(from_jsonable(arg, item) for arg, item in zip(args, data))
+    if origin is dict:
+        if not isinstance(data, dict):
+            raise TypeError(f"Expected an object for {tp}")
+        return {key: from_jsonable(args[1], item) for key, item in data.items()}
+    if origin in (typing.Union, types.UnionType):
+        options = [arg for arg in args if arg is not type(None)]
+        return from_jsonable(options[0], data) if len(options) == 1 else data
+    return data
+
+
+def _valid_entry(entry: Any) -> bool:
+    """Check a loaded entry has the (size, mtime_ns, hash, extra, value) shape."""
+    return (
+        isinstance(entry, list)
+        and len(entry) == 5
+        and isinstance(entry[0], int)
+        and isinstance(entry[1], int)
+        and isinstance(entry[2], str)
+        and isinstance(entry[3], str)
+    )
+
+
+class FileHashCache:
+    """Cache of values derived from files, keyed by file content hash.
+
+    Entries map a key (usually a relative path) to
+    ``(size, mtime_ns, content_hash, extra, value)``, the value in its JSON
+    form. ``extra`` lets callers fold other inputs (e.g. a directory
+    listing) into the fingerprint.
+
+    Example:
+        >>> cache = FileHashCache("docs", value_type=RustModule)
+        >>> module = cache.get_or_compute("src/lib.rs", path, parse_rust_file)
+        >>> cache.save()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        project_path: Path | None = None,
+        value_type: Any = None,
+    ):
+        """Open (lazily) the named cache.
+
+        Args:
+            name: Cache name, used as the file name
+            project_path: Project root (auto-detected if not provided). If no
+                project is found the cache lives in memory only.
+            value_type: Type values are rebuilt as (e.g. a dataclass or
+                ``list[tuple[int, str]]``); plain JSON values if None
+        """
+        cache_dir = get_cache_dir(project_path)
+        self.path = cache_dir / f"{name}.json" if cache_dir else None
+        self.value_type = value_type
+        self._entries: dict[str, tuple] | None = None
+        self._dirty = False
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> dict[str, tuple]:
+        if self._entries is not None:
+            return self._entries
+        entries: dict[str, tuple] = {}
+        if self.path is not None and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text())
+            except (OSError, ValueError):
+                data = None
+            if (
+                isinstance(data, dict)
+                and data.get("version") == _version_tag()
+                and isinstance(data.get("entries"), dict)
+            ):
+                entries = {
+                    key: tuple(entry)
+                    for key, entry in data["entries"].items()
+                    if _valid_entry(entry)
+                }
+        self._entries = entries
+        return entries
+
+    def _decode(self, stored: Any) -> Any:
+        """Rebuild a stored value, or _MISSING if it does not fit value_type."""
+        if self.value_type is None:
+            return stored
+        try:
+            return from_jsonable(self.value_type, stored)
+        except (TypeError, KeyError, ValueError, IndexError):
+            return _MISSING
+
+    def _lookup(self, key: str, path: Path, extra: str) -> tuple[Any, tuple]:
+        """Return (value or _MISSING, fingerprint) for key."""
+        stat = path.stat()
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is not None:
+            size, mtime_ns, digest, entry_extra, stored = entry
+            if entry_extra == extra:
+                if size == stat.st_size and mtime_ns == stat.st_mtime_ns:
+                    return self._decode(stored), entry[:4]
+                new_digest = file_hash(path)
+                if new_digest == digest:
+                    # Touched but unchanged: refresh the stat shortcut
+                    entries[key] = (stat.st_size, stat.st_mtime_ns, digest, extra, stored)
+                    self._dirty = True
+                    return self._decode(stored), entries[key][:4]
+                return _MISSING, (stat.st_size, stat.st_mtime_ns, new_digest, extra)
+        return _MISSING, (stat.st_size, stat.st_mtime_ns, file_hash(path), extra)
+
+    def get(self, key: str, path: str | Path, extra: str = "") -> Any:
+        """Return the cached value for key if path is unchanged, else None."""
+        with self._lock:
+            value, _ = self._lookup(key, Path(path), extra)
+            return None if value is _MISSING else value
+
+    def get_or_compute(
+        self,
+        key: str,
+        path: str | Path,
+        compute: Callable[[Path], Any],
+        extra: str = "",
+    ) -> Any:
+        """Return the cached value for key, recomputing it if path changed.
+
+        Args:
+            key: Cache key
+            path: File the value is derived from
+            compute: Called with path on a miss; its result is cached
+            extra: Additional fingerprint input
+
+        Returns:
+            The cached or freshly computed value
+        """
+        path = Path(path)
+        with self._lock:
+            value, fingerprint = self._lookup(key, path, extra)
+        if value is not _MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = compute(path)
+        with self._lock:
+            self._load()[key] = (*fingerprint, to_jsonable(value))
+            self._dirty = True
+        return value
+
+    def put(self, key: str, path: str | Path, value: Any, extra: str = "") -> None:
+        """Store a value for key derived from path."""
+        path = Path(path)
+        stat = path.stat()
+        with self._lock:
+            self._load()[key] = (
+                stat.st_size,
+                stat.st_mtime_ns,
+                file_hash(path),
+                extra,
+                to_jsonable(value),
+            )
+            self._dirty = True
+
+    def keys(self) -> list[str]:
+        """List cached keys."""
+        with self._lock:
+            return list(self._load())
+
+    def prune(self, keep: Callable[[str], bool]) -> int:
+        """Drop entries whose key fails keep(key). Returns number dropped."""
+        with self._lock:
+            entries = self._load()
+            stale = [k for k in entries if not keep(k)]
+            for k in stale:
+                del entries[k]
+            if stale:
+                self._dirty = True
+            return len(stale)
+
+    def clear(self) -> None:
+        """Remove all entries (and the cache file)."""
+        with self._lock:
+            self._entries = {}
+            self._dirty = False
+            if self.path is not None and self.path.exists():
+                self.path.unlink()
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed (atomic replace)."""
+        with self._lock:
+            if not self._dirty or self.path is None or self._entries is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".tmp.{os.getpid()}.{threading.get_ident()}")
+            tmp.write_text(
+                json.dumps(
+                    {"version": _version_tag(), "entries": self._entries},
+                    separators=(",", ":"),
+                )
+            )
+            os.replace(tmp, self.path)
+            self._dirty = False
@@ -0,0 +1,99 @@
+"""Lazily loaded sub-command groups of the ``idlergear`` CLI.
+
+Each group (``idlergear task``, ``idlergear graph``, ...) lives in its own
+module here and is imported only when it is invoked, so ``idlergear task
+list`` or a hook calling ``idlergear daemon start`` does not pay for
+building the other ~200 commands. ``idlergear --help`` lists the groups
+from ``SUBCOMMANDS`` without importing any of them.
+
+To add a group, create ``cli_commands/<name>.py`` defining ``<name>_app =
+typer.Typer(help=...)`` and register it in ``SUBCOMMANDS`` with the same
+help text.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+import typer
+from typer.core import TyperGroup
+
+# Command name -> (Typer attribute in cli_commands/<name>.py, help text)
+SUBCOMMANDS: dict[str, tuple[str, str]] = {
+    "task": ("task_app", "Task management (→ GitHub Issues)"),
+    "note": ("note_app", "Quick notes capture"),
+    "vision": ("vision_app", "Project vision management"),
+    "plan": ("plan_app", "Plan management (→ GitHub Projects)"),
+    "milestone": ("milestone_app", "Milestone management (→ GitHub Milestones)"),
+    "reference": ("reference_app", "Reference docs (→ GitHub Wiki)"),
+    "run": ("run_app", "Script execution and logs"),
+    "label": ("label_app", "Label management (→ GitHub Labels)"),
+    "config": ("config_app", "Configuration management"),
+    "daemon": ("daemon_app", "Daemon control"),
+    "mcp": ("mcp_app", "MCP server management"),
+    "project": ("project_app", "Kanban project boards (→ GitHub Projects v2)"),
+    "session": ("session_app", "Session state persistence"),
+    "goose": ("goose_app", "Goose integration and configuration"),
+    "otel": ("otel_app", "OpenTelemetry log collection"),
+    "test": ("test_app", "Test framework detection and status"),
+    "docs": ("docs_app", "Python API documentation generation"),
+    "agents": ("agents_app", "AGENTS.md generation and management"),
+    "secrets": ("secrets_app", "Secure local secrets management"),
+    "release": ("release_app", "Release management (GitHub Releases)"),
+    "file": ("file_app", "File registry and annotations (track file status)"),
+    "plugin": (
+        "plugin_app",
+        "Plugin management and integration (Langfuse, LlamaIndex, Mem0)",
+    ),
+    "graph": ("graph_app", "Knowledge graph queries and population"),
+    "knowledge": ("knowledge_app", "Knowledge decay and relevance management"),
+    "upstream": ("upstream_app", "Report bugs and features to IdlerGear upstream"),
+    "hooks": ("hooks_app", "Manage Claude Code hooks for IdlerGear enforcement"),
+    "wiki": ("wiki_app", "GitHub Wiki synchronization commands"),
+    "watch": ("watch_app", "Watch mode for proactive knowledge capture"),
+    "priorities": ("priorities_app", "Manage project priorities registry"),
+}
+
+
+def load_subcommand(name: str) -> typer.Typer:
+    """Import a sub-command group's module and return its Typer app."""
+    attr, _ = SUBCOMMANDS[name]
+    module = importlib.import_module(f"{__name__}.{name}")
+    return getattr(module, attr)
+
+
+class LazyTyperGroup(TyperGroup):
+    """Root command group that resolves ``SUBCOMMANDS`` on first use.
+
+    Help output lists the groups as placeholders built from the registered
+    help text; anything else (running a command, ``idlergear task
+    --help``, shell completion) imports the group's module.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._listing = False
+
+    def list_commands(self, ctx: typer.Context) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in SUBCOMMANDS if name not in names]
+
+    def get_command(self, ctx: typer.Context, cmd_name: str) -> Any:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in SUBCOMMANDS:
+            return command
+        if self._listing:
+            return TyperGroup(name=cmd_name, help=SUBCOMMANDS[cmd_name][1])
+
+        group = typer.main.get_group(load_subcommand(cmd_name))
+        group.name = cmd_name
+        self.commands[cmd_name] = group
+        return group
+
+    def format_help(self, ctx: typer.Context, formatter: Any) -> None:
+        self._listing = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
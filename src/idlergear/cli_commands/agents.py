@@ -0,0 +1,372 @@
+"""`idlergear agents` commands."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from idlergear.cli import OutputFormat
+
+agents_app = typer.Typer(help="AGENTS.md generation and management")
+
+
+# ============================================================================
+# Agents Commands (AGENTS.md generation)
+# ============================================================================
+
+
+@agents_app.command("init")
+def agents_init(
+    ctx: typer.Context,
+    lang: Optional[str] = typer.Option(
+        None,
+        "--lang",
+        "-l",
+        help="Language (python, rust, javascript, go, java). Auto-detects if not specified.",
+    ),
+    with_claude: bool = typer.Option(
+        True, "--with-claude/--no-claude", help="Also generate CLAUDE.md"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would be generated without writing"
+    ),
+):
+    """Initialize AGENTS.md with language-specific defaults.
+
+    Auto-detects the project language if --lang is not specified.
+    Generates build, test, lint, and format commands appropriate for the language.
+
+    Examples:
+        idlergear agents init              # Auto-detect language
+        idlergear agents init --lang python
+        idlergear agents init --dry-run
+    """
+    from pathlib import Path
+
+    from idlergear.agents import (
+        Language,
+        TEMPLATES,
+        detect_language,
+        generate_agents_md,
+        generate_claude_md,
+    )
+    from idlergear.config import find_idlergear_root
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+    project_path = find_idlergear_root() or Path.cwd()
+
+    # Detect or use specified language
+    if lang:
+        try:
+            language = Language(lang.lower())
+        except ValueError:
+            if output_format == OutputFormat.JSON:
+                typer.echo(
+                    json.dumps(
+                        {
+                            "error": f"Unknown language: {lang}",
+                            "supported": [
+                                l.value for l in Language if l != Language.UNKNOWN
+                            ],
+                        }
+                    )
+                )
+            else:
+                typer.secho(f"Unknown language: {lang}", fg=typer.colors.RED)
+                typer.echo(
+                    f"Supported: {', '.join(l.value for l in Language if l != Language.UNKNOWN)}"
+                )
+            raise typer.Exit(1)
+    else:
+        language = detect_language(project_path)
+
+    if language == Language.UNKNOWN:
+        if output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "error": "Could not detect language",
+                        "hint": "Use --lang to specify",
+                    }
+                )
+            )
+        else:
+            typer.secho("Could not detect project language.", fg=typer.colors.YELLOW)
+            typer.echo("Use --lang to specify: python, rust, javascript, go, java")
+        raise typer.Exit(1)
+
+    template = TEMPLATES[language]
+
+    # Generate content
+    agents_content = generate_agents_md(template, include_idlergear=True)
+    claude_content = (
+        generate_claude_md(template, include_idlergear=True) if with_claude else None
+    )
+
+    if dry_run:
+        if output_format == OutputFormat.JSON:
+            result = {
+                "dry_run": True,
+                "language": language.value,
+                "files": {"AGENTS.md": len(agents_content)},
+            }
+            if claude_content:
+                result["files"]["CLAUDE.md"] = len(claude_content)
+            typer.echo(json.dumps(result))
+        else:
+            typer.secho(
+                f"Would generate for language: {language.value}", fg=typer.colors.CYAN
+            )
+            typer.echo()
+            typer.secho("--- AGENTS.md ---", fg=typer.colors.YELLOW)
+            typer.echo(
+                agents_content[:500] + "..."
+                if len(agents_content) > 500
+                else agents_content
+            )
+            if claude_content:
+                typer.echo()
+                typer.secho("--- CLAUDE.md ---", fg=typer.colors.YELLOW)
+                typer.echo(
+                    claude_content[:300] + "..."
+                    if len(claude_content) > 300
+                    else claude_content
+                )
+        return
+
+    # Write files
+    agents_path = project_path / "AGENTS.md"
+    created_agents = not agents_path.exists()
+    agents_path.write_text(agents_content)
+
+    created_claude = False
+    if claude_content:
+        claude_path = project_path / "CLAUDE.md"
+        created_claude = not claude_path.exists()
+        claude_path.write_text(claude_content)
+
+    if output_format == OutputFormat.JSON:
+        result = {
+            "success": True,
+            "language": language.value,
+            "files": {
+                "AGENTS.md": "created" if created_agents else "updated",
+            },
+        }
+        if claude_content:
+            result["files"]["CLAUDE.md"] = "created" if created_claude else "updated"
+        typer.echo(json.dumps(result))
+    else:
+        typer.secho(f"✓ Generated for {language.value}", fg=typer.colors.GREEN)
+        action = "Created" if created_agents else "Updated"
+        typer.echo(f"  {action}: AGENTS.md")
+        if claude_content:
+            action = "Created" if created_claude else "Updated"
+            typer.echo(f"  {action}: CLAUDE.md")
+
+
+@agents_app.command("check")
+def agents_check(
+    ctx: typer.Context,
+):
+    """Validate existing AGENTS.md file.
+
+    Checks for common issues like missing sections, empty code blocks, and TODOs.
+    """
+    from pathlib import Path
+
+    from idlergear.agents import validate_agents_md
+    from idlergear.config import find_idlergear_root
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+    project_path = find_idlergear_root() or Path.cwd()
+
+    agents_path = project_path / "AGENTS.md"
+
+    if not agents_path.exists():
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": "AGENTS.md not found", "valid": False}))
+        else:
+            typer.secho("AGENTS.md not found.", fg=typer.colors.RED)
+            typer.echo("Run 'idlergear agents init' to create one.")
+        raise typer.Exit(1)
+
+    content = agents_path.read_text()
+    issues = validate_agents_md(content)
+
+    if output_format == OutputFormat.JSON:
+        typer.echo(json.dumps({"valid": len(issues) == 0, "issues": issues}))
+    else:
+        if issues:
+            typer.secho(f"Found {len(issues)} issue(s):", fg=typer.colors.YELLOW)
+            for issue in issues:
+                typer.echo(f"  - {issue}")
+        else:
+            typer.secho("✓ AGENTS.md is valid", fg=typer.colors.GREEN)
+
+
+@agents_app.command("update")
+def agents_update(
+    ctx: typer.Context,
+    lang: Optional[str] = typer.Option(
+        None,
+        "--lang",
+        "-l",
+        help="Language to update template for",
+    ),
+    preserve_custom: bool = typer.Option(
+        True,
+        "--preserve/--no-preserve",
+        help="Preserve custom sections when updating",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would change without writing"
+    ),
+):
+    """Update AGENTS.md with latest template while preserving customizations.
+
+    Merges new template defaults with your existing customizations.
+    Use --no-preserve to completely replace with fresh template.
+    """
+    from pathlib import Path
+
+    from idlergear.agents import (
+        Language,
+        TEMPLATES,
+        detect_language,
+        update_agents_md,
+        generate_agents_md,
+    )
+    from idlergear.config import find_idlergear_root
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+    project_path = find_idlergear_root() or Path.cwd()
+
+    agents_path = project_path / "AGENTS.md"
+
+    if not agents_path.exists():
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": "AGENTS.md not found"}))
+        else:
+            typer.secho("AGENTS.md not found.", fg=typer.colors.RED)
+            typer.echo("Run 'idlergear agents init' to create one.")
+        raise typer.Exit(1)
+
+    # Determine language
+    if lang:
+        try:
+            language = Language(lang.lower())
+        except ValueError:
+            if output_format == OutputFormat.JSON:
+                typer.echo(json.dumps({"error": f"Unknown language: {lang}"}))
+            else:
+                typer.secho(f"Unknown language: {lang}", fg=typer.colors.RED)
+            raise typer.Exit(1)
+    else:
+        language = detect_language(project_path)
+
+    if language == Language.UNKNOWN:
+        if output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps({"error": "Could not detect language", "hint": "Use --lang"})
+            )
+        else:
+            typer.secho(
+                "Could not detect language. Use --lang.", fg=typer.colors.YELLOW
+            )
+        raise typer.Exit(1)
+
+    template = TEMPLATES[language]
+    existing_content = agents_path.read_text()
+
+    if preserve_custom:
+        new_content = update_agents_md(existing_content, template, preserve_custom=True)
+    else:
+        new_content = generate_agents_md(template, include_idlergear=True)
+
+    if dry_run:
+        if output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "dry_run": True,
+                        "language": language.value,
+                        "preserve_custom": preserve_custom,
+                        "would_change": existing_content != new_content,
+                    }
+                )
+            )
+        else:
+            if existing_content == new_content:
+                typer.echo("No changes needed.")
+            else:
+                typer.secho("Would update AGENTS.md", fg=typer.colors.CYAN)
+                typer.echo(f"  Language: {language.value}")
+                typer.echo(f"  Preserve custom: {preserve_custom}")
+        return
+
+    if existing_content == new_content:
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"success": True, "changed": False}))
+        else:
+            typer.echo("AGENTS.md is already up to date.")
+        return
+
+    agents_path.write_text(new_content)
+
+    if output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps({"success": True, "changed": True, "language": language.value})
+        )
+    else:
+        typer.secho("✓ Updated AGENTS.md", fg=typer.colors.GREEN)
+
+
+@agents_app.command("show")
+def agents_show(
+    ctx: typer.Context,
+):
+    """Show detected language and available templates."""
+    from pathlib import Path
+
+    from idlergear.agents import Language, TEMPLATES, detect_language
+    from idlergear.config import find_idlergear_root
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+    project_path = find_idlergear_root() or Path.cwd()
+
+    detected = detect_language(project_path)
+    agents_exists = (project_path / "AGENTS.md").exists()
+    claude_exists = (project_path / "CLAUDE.md").exists()
+
+    if output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                {
+                    "detected_language": (
+                        detected.value if detected != Language.UNKNOWN else None
+                    ),
+                    "agents_md_exists": agents_exists,
+                    "claude_md_exists": claude_exists,
+                    "available_templates": [
+                        l.value for l in Language if l != Language.UNKNOWN
+                    ],
+                }
+            )
+        )
+    else:
+        typer.secho("Project Status:", fg=typer.colors.CYAN, bold=True)
+        if detected != Language.UNKNOWN:
+            typer.echo(f"  Detected language: {detected.value}")
+        else:
+            typer.echo("  Detected language: (unknown)")
+        typer.echo(f"  AGENTS.md: {'exists' if agents_exists else 'not found'}")
+        typer.echo(f"  CLAUDE.md: {'exists' if claude_exists else 'not found'}")
+        typer.echo()
+        typer.secho("Available Templates:", fg=typer.colors.CYAN, bold=True)
+        for lang in Language:
+            if lang != Language.UNKNOWN:
+                template = TEMPLATES[lang]
+                commands = ", ".join(template.commands.keys())
+                typer.echo(f"  {lang.value}: {commands}")
@@ -0,0 +1,163 @@
+"""`idlergear config` commands."""
+
+import typer
+
+config_app = typer.Typer(help="Configuration management")
+
+
+# Config commands
+@config_app.command("get")
+def config_get(key: str):
+    """Get a configuration value."""
+    from idlergear.config import find_idlergear_root, get_config_value
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    value = get_config_value(key)
+    if value is None:
+        typer.echo(f"{key}: (not set)")
+    else:
+        typer.echo(f"{key}: {value}")
+
+
+@config_app.command("set")
+def config_set(key: str, value: str):
+    """Set a configuration value.
+
+    Values are automatically converted to the correct type based on schema:
+    - Booleans: "true", "false", "yes", "no", "1", "0"
+    - Integers: "123", "456"
+    - Strings: anything else
+    """
+    from idlergear.config import CONFIG_SCHEMAS, find_idlergear_root, set_config_value
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    # Parse value based on schema type
+    parsed_value: str | bool | int | float = value
+    parts = key.split(".")
+    if len(parts) >= 2 and parts[0] in CONFIG_SCHEMAS:
+        schema = CONFIG_SCHEMAS[parts[0]]
+        field_path = parts[1:]
+        current = schema
+        for part in field_path:
+            if isinstance(current, dict) and part in current:
+                current = current[part]
+
+        if isinstance(current, dict) and "type" in current:
+            expected_type = current["type"]
+
+            # Convert value to expected type
+            if expected_type == "boolean":
+                if value.lower() in ("true", "yes", "1"):
+                    parsed_value = True
+                elif value.lower() in ("false", "no", "0"):
+                    parsed_value = False
+                else:
+                    typer.secho(
+                        f"Invalid boolean value: {value}. Use: true, false, yes, no, 1, or 0",
+                        fg=typer.colors.RED,
+                    )
+                    raise typer.Exit(1)
+            elif expected_type == "integer":
+                try:
+                    parsed_value = int(value)
+                except ValueError:
+                    typer.secho(
+                        f"Invalid integer value: {value}",
+                        fg=typer.colors.RED,
+                    )
+                    raise typer.Exit(1)
+            elif expected_type == "float":
+                try:
+                    parsed_value = float(value)
+                except ValueError:
+                    typer.secho(
+                        f"Invalid float value: {value}",
+                        fg=typer.colors.RED,
+                    )
+                    raise typer.Exit(1)
+
+    try:
+        set_config_value(key, parsed_value)
+        typer.secho(f"Set {key} = {parsed_value}", fg=typer.colors.GREEN)
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@config_app.command("backend")
+def config_backend(
+    backend_type: str = typer.Argument(
+        None,
+        help="Backend type: task, note, reference, plan, vision",
+    ),
+    backend_name: str = typer.Argument(
+        None,
+        help="Backend name to use (e.g., local, github)",
+    ),
+):
+    """Configure or show backend settings.
+
+    Without arguments, shows all backend configurations.
+    With one argument, shows the backend for that type.
+    With two arguments, sets the backend for that type.
+
+    Examples:
+        idlergear config backend              # Show all backends
+        idlergear config backend task         # Show task backend
+        idlergear config backend task github  # Set task backend to github
+    """
+    from idlergear.backends import get_configured_backend_name, list_available_backends
+    from idlergear.config import find_idlergear_root, set_config_value
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    all_types = ["task", "note", "reference", "plan", "vision"]
+
+    if backend_type is None:
+        # Show all backend configurations
+        typer.echo("Backend configurations:")
+        for t in all_types:
+            name = get_configured_backend_name(t)
+            available = list_available_backends(t)
+            typer.echo(f"  {t:12} = {name}  (available: {', '.join(available)})")
+        return
+
+    if backend_type not in all_types:
+        typer.secho(f"Unknown backend type: {backend_type}", fg=typer.colors.RED)
+        typer.echo(f"Valid types: {', '.join(all_types)}")
+        raise typer.Exit(1)
+
+    if backend_name is None:
+        # Show backend for this type
+        name = get_configured_backend_name(backend_type)
+        available = list_available_backends(backend_type)
+        typer.echo(f"{backend_type} backend: {name}")
+        typer.echo(f"Available backends: {', '.join(available)}")
+        return
+
+    # Set backend
+    available = list_available_backends(backend_type)
+    if backend_name not in available:
+        typer.secho(f"Unknown backend: {backend_name}", fg=typer.colors.RED)
+        typer.echo(f"Available backends for {backend_type}: {', '.join(available)}")
+        raise typer.Exit(1)
+
+    set_config_value(f"backends.{backend_type}", backend_name)
+    typer.secho(f"Set {backend_type} backend to {backend_name}", fg=typer.colors.GREEN)
@@ -0,0 +1,469 @@
+"""`idlergear daemon` commands."""
+
+import typer
+
+daemon_app = typer.Typer(help="Daemon control")
+
+
+# Daemon commands
+@daemon_app.command("start")
+def daemon_start(
+    foreground: bool = typer.Option(
+        False, "--foreground", "-f", help="Run in foreground"
+    ),
+):
+    """Start the IdlerGear daemon."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.daemon.lifecycle import DaemonLifecycle
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    lifecycle = DaemonLifecycle(root)
+
+    if lifecycle.is_running():
+        typer.echo(f"Daemon already running (PID {lifecycle.get_pid()})")
+        return
+
+    if foreground:
+        typer.echo("Starting daemon in foreground...")
+        from idlergear.daemon.server import run_daemon
+
+        run_daemon(root)
+    else:
+        typer.echo("Starting daemon...")
+        try:
+            pid = lifecycle.start(wait=True)
+            typer.secho(f"Daemon started (PID {pid})", fg=typer.colors.GREEN)
+        except RuntimeError as e:
+            typer.secho(f"Failed to start daemon: {e}", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+
+@daemon_app.command("stop")
+def daemon_stop():
+    """Stop the IdlerGear daemon."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.daemon.lifecycle import DaemonLifecycle
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    lifecycle = DaemonLifecycle(root)
+
+    if not lifecycle.is_running():
+        typer.echo("Daemon is not running.")
+        return
+
+    typer.echo("Stopping daemon...")
+    if lifecycle.stop():
+        typer.secho("Daemon stopped.", fg=typer.colors.GREEN)
+    else:
+        typer.secho("Failed to stop daemon.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@daemon_app.command("status")
+def daemon_status():
+    """Check daemon status."""
+    import asyncio
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.daemon.lifecycle import DaemonLifecycle
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    lifecycle = DaemonLifecycle(root)
+    status = asyncio.run(lifecycle.get_status())
+
+    if status.get("running"):
+        typer.secho("Daemon: running", fg=typer.colors.GREEN)
+        typer.echo(f"  PID: {status.get('pid')}")
+        typer.echo(f"  Socket: {status.get('socket')}")
+        if status.get("connections") is not None:
+            typer.echo(f"  Connections: {status.get('connections')}")
+        if not status.get("healthy", True):
+            typer.secho(
+                f"  Warning: {status.get('error', 'Not healthy')}",
+                fg=typer.colors.YELLOW,
+            )
+    else:
+        typer.secho("Daemon: not running", fg=typer.colors.YELLOW)
+        typer.echo(f"  Socket: {status.get('socket')}")
+
+
+@daemon_app.command("queue")
+def daemon_queue_command(
+    command: str = typer.Argument(..., help="Command to queue for execution"),
+    priority: int = typer.Option(
+        5, "--priority", "-p", help="Priority (1-10, higher = more urgent)"
+    ),
+    wait: bool = typer.Option(
+        False, "--wait", "-w", help="Wait for command to complete"
+    ),
+):
+    """Queue a command for execution by any available AI agent."""
+    import asyncio
+    from idlergear.config import find_idlergear_root
+    from idlergear.daemon.client import DaemonClient
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    async def queue_cmd():
+        async with DaemonClient(root) as client:
+            cmd_id = await client.queue_command(command, priority=priority)
+            typer.secho(f"Command queued: {cmd_id}", fg=typer.colors.GREEN)
+
+            if wait:
+                typer.echo("Waiting for command to complete...")
+                # Poll for result
+                while True:
+                    result = await client.get_command_result(cmd_id)
+                    if result:
+                        typer.echo("\nResult:")
+                        if result.get("success"):
+                            typer.secho(result.get("output", ""), fg=typer.colors.GREEN)
+                        else:
+                            typer.secho(
+                                f"Error: {result.get('error')}", fg=typer.colors.RED
+                            )
+                        break
+                    await asyncio.sleep(1)
+
+            return cmd_id
+
+    try:
+        asyncio.run(queue_cmd())
+    except Exception as e:
+        typer.secho(f"Failed to queue command: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@daemon_app.command("agents")
+def daemon_agents():
+    """List all active AI agents connected to the daemon."""
+    import asyncio
+    from idlergear.config import find_idlergear_root
+    from idlergear.daemon.client import DaemonClient
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    async def list_agents():
+        socket_path = root / "daemon.sock"
+        async with DaemonClient(socket_path) as client:
+            agents = await client.list_agents()
+
+            if not agents:
+                typer.echo("No active agents.")
+                return
+
+            typer.echo(f"\nActive agents ({len(agents)}):\n")
+            for agent in agents:
+                status_color = {
+                    "active": typer.colors.GREEN,
+                    "idle": typer.colors.YELLOW,
+                    "busy": typer.colors.CYAN,
+                }.get(agent.get("status", "unknown"), typer.colors.WHITE)
+
+                typer.secho(
+                    f"  • {agent['name']}", fg=typer.colors.BRIGHT_WHITE, bold=True
+                )
+                typer.echo(f"    ID:     {agent['agent_id']}")
+                typer.secho(f"    Status: {agent['status']}", fg=status_color)
+                typer.echo(f"    Type:   {agent.get('agent_type', 'unknown')}")
+                if agent.get("current_task"):
+                    typer.echo(f"    Task:   {agent['current_task']}")
+                typer.echo()
+
+    try:
+        asyncio.run(list_agents())
+    except Exception as e:
+        typer.secho(f"Failed to list agents: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@daemon_app.command("send")
+def daemon_send_message(
+    message: str = typer.Argument(..., help="Message to broadcast to all agents"),
+):
+    """Send a message to all active AI agents."""
+    import asyncio
+    from idlergear.config import find_idlergear_root
+    from idlergear.daemon.client import DaemonClient
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    async def send_msg():
+        async with DaemonClient(root) as client:
+            await client.broadcast_event(
+                {
+                    "type": "user_message",
+                    "message": message,
+                    "timestamp": asyncio.get_event_loop().time(),
+                }
+            )
+            typer.secho("Message sent to all agents.", fg=typer.colors.GREEN)
+
+    try:
+        asyncio.run(send_msg())
+    except Exception as e:
+        typer.secho(f"Failed to send message: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@daemon_app.command("queue-list")
+def daemon_queue_list():
+    """List all queued commands."""
+    import asyncio
+    from idlergear.config import find_idlergear_root
+    from idlergear.daemon.client import DaemonClient
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    async def list_queue():
+        async with DaemonClient(root) as client:
+            commands = await client.list_queued_commands()
+
+            if not commands:
+                typer.echo("No queued commands.")
+                return
+
+            typer.echo(f"\nQueued commands ({len(commands)}):\n")
+            for cmd in commands:
+                status_color = {
+                    "pending": typer.colors.YELLOW,
+                    "assigned": typer.colors.CYAN,
+                    "running": typer.colors.BLUE,
+                    "completed": typer.colors.GREEN,
+                    "failed": typer.colors.RED,
+                }.get(cmd.get("status", "unknown"), typer.colors.WHITE)
+
+                typer.secho(
+                    f"  [{cmd['id'][:8]}]", fg=typer.colors.BRIGHT_WHITE, bold=True
+                )
+                typer.secho(f"    Status:   {cmd['status']}", fg=status_color)
+                typer.echo(f"    Command:  {cmd['command'][:60]}...")
+                typer.echo(f"    Priority: {cmd.get('priority', 5)}")
+                if cmd.get("assigned_to"):
+                    typer.echo(f"    Agent:    {cmd['assigned_to']}")
+                typer.echo()
+
+    try:
+        asyncio.run(list_queue())
+    except Exception as e:
+        typer.secho(f"Failed to list queue: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@daemon_app.command("cleanup")
+def daemon_cleanup(
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show what would be removed without removing"
+    ),
+    all_agents: bool = typer.Option(
+        False, "--all", help="Remove all presence files (nuclear option)"
+    ),
+):
+    """Clean up stale agent presence files.
+
+    An agent is considered stale if:
+    - Presence file exists but daemon is not running OR
+    - Agent is not in daemon's active registry OR
+    - last_heartbeat is older than 5 minutes
+
+    Examples:
+        idlergear daemon cleanup --dry-run    # Preview stale agents
+        idlergear daemon cleanup               # Remove stale agents
+        idlergear daemon cleanup --all         # Remove all presence files
+    """
+    import json
+    from datetime import datetime, timezone, timedelta
+    from idlergear.config import find_idlergear_root
+    from idlergear.daemon.lifecycle import DaemonLifecycle
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    idlergear_dir = root / ".idlergear"
+    agents_dir = idlergear_dir / "agents"
+
+    if not agents_dir.exists():
+        typer.echo("No agents directory found.")
+        return
+
+    # Get all presence files
+    presence_files = [f for f in agents_dir.glob("*.json") if f.name != "agents.json"]
+
+    if not presence_files:
+        typer.echo("No agent presence files found.")
+        return
+
+    # Check if daemon is running
+    lifecycle = DaemonLifecycle(idlergear_dir)
+    daemon_running = lifecycle.is_running()
+
+    # Get active agents from daemon registry
+    active_agent_ids = set()
+    if daemon_running:
+        try:
+            import asyncio
+            from idlergear.daemon.client import DaemonClient
+
+            async def get_active():
+                async with DaemonClient(root) as client:
+                    agents = await client.list_agents()
+                    return {a["agent_id"] for a in agents}
+
+            active_agent_ids = asyncio.run(get_active())
+        except Exception:
+            # If we can't get active agents, assume none are active
+            pass
+
+    # Identify stale presence files
+    stale_files = []
+    kept_files = []
+    staleness_cutoff = datetime.now(timezone.utc) - timedelta(minutes=5)
+
+    for presence_file in presence_files:
+        try:
+            data = json.loads(presence_file.read_text())
+            agent_id = data.get("agent_id", presence_file.stem)
+            last_heartbeat_str = data.get("last_heartbeat")
+
+            # Determine if stale
+            is_stale = False
+
+            if all_agents:
+                # --all flag: consider all files stale
+                is_stale = True
+            elif not daemon_running:
+                # Daemon not running: all are considered stale
+                is_stale = True
+            elif agent_id not in active_agent_ids:
+                # Not in daemon registry: stale
+                is_stale = True
+            elif last_heartbeat_str:
+                # Check heartbeat age
+                try:
+                    last_heartbeat = datetime.fromisoformat(
+                        last_heartbeat_str.replace("Z", "+00:00")
+                    )
+                    if last_heartbeat < staleness_cutoff:
+                        is_stale = True
+                except (ValueError, AttributeError):
+                    # Can't parse heartbeat, consider stale
+                    is_stale = True
+
+            if is_stale:
+                stale_files.append((presence_file, data))
+            else:
+                kept_files.append((presence_file, data))
+
+        except (json.JSONDecodeError, OSError):
+            # Malformed file, consider it stale
+            stale_files.append((presence_file, {}))
+
+    # Display results
+    if not stale_files:
+        typer.secho("✓ No stale agent presence files found.", fg=typer.colors.GREEN)
+        if kept_files:
+            typer.echo(f"  {len(kept_files)} active agent(s) present")
+        return
+
+    # Show what will be removed
+    typer.echo(f"\nFound {len(stale_files)} stale agent presence file(s):\n")
+
+    for presence_file, data in stale_files:
+        agent_id = data.get("agent_id", presence_file.stem)
+        agent_type = data.get("agent_type", "unknown")
+        connected_at = data.get("connected_at", "unknown")
+        last_hb = data.get("last_heartbeat", "unknown")
+
+        # Calculate age
+        try:
+            if last_hb and last_hb != "unknown":
+                hb_time = datetime.fromisoformat(last_hb.replace("Z", "+00:00"))
+                age = datetime.now(timezone.utc) - hb_time
+                age_str = (
+                    f"{age.days}d {age.seconds // 3600}h ago"
+                    if age.days > 0
+                    else f"{age.seconds // 3600}h {(age.seconds % 3600) // 60}m ago"
+                )
+            else:
+                age_str = "unknown"
+        except (ValueError, AttributeError):
+            age_str = "unknown"
+
+        typer.echo(f"  • {agent_id}")
+        typer.echo(f"    Type: {agent_type}")
+        typer.echo(f"    Last seen: {age_str}")
+        typer.echo()
+
+    if kept_files:
+        typer.echo(f"Keeping {len(kept_files)} active agent(s)\n")
+
+    # Dry run or actual cleanup
+    if dry_run:
+        typer.echo(f"Dry run: Would remove {len(stale_files)} presence file(s)")
+        typer.echo("Run without --dry-run to actually remove them")
+        return
+
+    # Actual cleanup
+    removed = 0
+    for presence_file, data in stale_files:
+        try:
+            presence_file.unlink()
+            removed += 1
+        except OSError as e:
+            agent_id = data.get("agent_id", presence_file.stem)
+            typer.secho(f"  ✗ Failed to remove {agent_id}: {e}", fg=typer.colors.RED)
+
+    typer.secho(
+        f"\n✓ Removed {removed}/{len(stale_files)} stale presence file(s)",
+        fg=typer.colors.GREEN,
+    )
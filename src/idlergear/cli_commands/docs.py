@@ -0,0 +1,729 @@
+"""`idlergear docs` commands."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from idlergear.cli import OutputFormat
+
+docs_app = typer.Typer(help="Python API documentation generation")
+
+
+# Documentation generation commands
+@docs_app.command("generate")
+def docs_generate(
+    ctx: typer.Context,
+    package: str = typer.Argument(..., help="Python package name to document"),
+    output: Optional[str] = typer.Option(
+        None, "--output", "-o", help="Output file path (default: stdout)"
+    ),
+    format: str = typer.Option(
+        "json", "--format", "-f", help="Output format: json, markdown"
+    ),
+    include_private: bool = typer.Option(
+        False, "--private", "-p", help="Include private modules"
+    ),
+    max_depth: Optional[int] = typer.Option(
+        None, "--depth", "-d", help="Maximum submodule depth"
+    ),
+):
+    """Generate API documentation for a Python package.
+
+    Requires pdoc: pip install 'idlergear[docs]'
+
+    Examples:
+        idlergear docs generate mypackage
+        idlergear docs generate mypackage -f markdown -o docs/api.md
+        idlergear docs generate mypackage --depth 2
+    """
+    from idlergear.docs import (
+        check_pdoc_available,
+        generate_docs_json,
+        generate_docs_markdown,
+    )
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+
+    if not check_pdoc_available():
+        if output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "error": "pdoc not installed",
+                        "install": "pip install 'idlergear[docs]'",
+                    }
+                )
+            )
+        else:
+            typer.secho(
+                "pdoc is not installed. Install with: pip install 'idlergear[docs]'",
+                fg=typer.colors.RED,
+            )
+        raise typer.Exit(1)
+
+    try:
+        if format == "markdown":
+            result = generate_docs_markdown(
+                package, include_private=include_private, max_depth=max_depth
+            )
+        else:
+            result = generate_docs_json(
+                package, include_private=include_private, max_depth=max_depth
+            )
+
+        if output:
+            Path(output).write_text(result)
+            if output_format == OutputFormat.JSON:
+                typer.echo(json.dumps({"status": "success", "output": output}))
+            else:
+                typer.secho(f"Documentation written to {output}", fg=typer.colors.GREEN)
+        else:
+            typer.echo(result)
+
+    except ModuleNotFoundError as e:
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": str(e)}))
+        else:
+            typer.secho(f"Module not found: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": str(e)}))
+        else:
+            typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@docs_app.command("module")
+def docs_module(
+    ctx: typer.Context,
+    module: str = typer.Argument(..., help="Python module name to document"),
+):
+    """Generate documentation for a single Python module.
+
+    Examples:
+        idlergear docs module idlergear.tasks
+        idlergear docs module json
+    """
+    from idlergear.docs import check_pdoc_available, generate_module_docs
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+
+    if not check_pdoc_available():
+        if output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "error": "pdoc not installed",
+                        "install": "pip install 'idlergear[docs]'",
+                    }
+                )
+            )
+        else:
+            typer.secho(
+                "pdoc is not installed. Install with: pip install 'idlergear[docs]'",
+                fg=typer.colors.RED,
+            )
+        raise typer.Exit(1)
+
+    try:
+        doc = generate_module_docs(module)
+
+        if output_format == OutputFormat.JSON:
+            typer.echo(doc.to_json())
+        else:
+            typer.secho(f"Module: {doc.name}", bold=True)
+            if doc.docstring:
+                typer.echo()
+                # First paragraph only
+                first_para = doc.docstring.split("\n\n")[0]
+                typer.echo(first_para)
+
+            if doc.functions:
+                typer.echo()
+                typer.secho("Functions:", bold=True)
+                for func in doc.functions:
+                    typer.echo(f"  {func.name}{func.signature}")
+
+            if doc.classes:
+                typer.echo()
+                typer.secho("Classes:", bold=True)
+                for cls in doc.classes:
+                    bases = f"({', '.join(cls.bases)})" if cls.bases else ""
+                    typer.echo(f"  {cls.name}{bases}")
+
+            if doc.submodules:
+                typer.echo()
+                typer.secho("Submodules:", bold=True)
+                for sub in doc.submodules:
+                    typer.echo(f"  {sub}")
+
+    except ModuleNotFoundError as e:
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": str(e)}))
+        else:
+            typer.secho(f"Module not found: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": str(e)}))
+        else:
+            typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@docs_app.command("check")
+def docs_check(
+    ctx: typer.Context,
+    lang: str = typer.Option(
+        "all", "--lang", "-l", help="Language to check: python, rust, dotnet, all"
+    ),
+):
+    """Check if documentation generation is available.
+
+    Checks if pdoc (Python), cargo (Rust), and dotnet (.NET) are installed.
+    """
+    from idlergear.docs import check_pdoc_available
+    from idlergear.docs_rust import check_cargo_available
+    from idlergear.docs_dotnet import check_dotnet_available
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+
+    result: dict[str, dict[str, bool]] = {}
+    if lang in ("python", "all"):
+        result["python"] = {"available": check_pdoc_available()}
+    if lang in ("rust", "all"):
+        result["rust"] = {"available": check_cargo_available()}
+    if lang in ("dotnet", "all"):
+        result["dotnet"] = {"available": check_dotnet_available()}
+
+    if output_format == OutputFormat.JSON:
+        typer.echo(json.dumps(result))
+    else:
+        if "python" in result:
+            if result["python"]["available"]:
+                typer.secho("✓ Python (pdoc) is installed", fg=typer.colors.GREEN)
+            else:
+                typer.secho("✗ Python (pdoc) is not installed", fg=typer.colors.RED)
+                typer.echo("  Install with: pip install 'idlergear[docs]'")
+        if "rust" in result:
+            if result["rust"]["available"]:
+                typer.secho("✓ Rust (cargo) is installed", fg=typer.colors.GREEN)
+            else:
+                typer.secho("✗ Rust (cargo) is not installed", fg=typer.colors.RED)
+                typer.echo("  Install from: https://rustup.rs/")
+        if "dotnet" in result:
+            if result["dotnet"]["available"]:
+                typer.secho("✓ .NET (dotnet) is installed", fg=typer.colors.GREEN)
+            else:
+                typer.secho("✗ .NET (dotnet) is not installed", fg=typer.colors.RED)
+                typer.echo("  Install from: https://dotnet.microsoft.com/")
+
+
+@docs_app.command("summary")
+def docs_summary(
+    ctx: typer.Context,
+    package: str = typer.Argument(..., help="Package name or path to summarize"),
+    mode: str = typer.Option(
+        "standard", "--mode", "-m", help="Summary mode: minimal, standard, detailed"
+    ),
+    lang: str = typer.Option(
+        "auto", "--lang", "-l", help="Language: python, rust, dotnet, auto"
+    ),
+    include_private: bool = typer.Option(
+        False, "--private", "-p", help="Include private modules"
+    ),
+    max_depth: Optional[int] = typer.Option(
+        None, "--depth", "-d", help="Maximum submodule depth"
+    ),
+):
+    """Generate token-efficient API summary for AI consumption.
+
+    Supports Python, Rust, and .NET projects with auto-detection.
+
+    Summary modes:
+    - minimal: ~500 tokens - function/class names only
+    - standard: ~2000 tokens - first-line docstrings
+    - detailed: ~5000 tokens - full docstrings, parameters
+
+    Examples:
+        idlergear docs summary idlergear --mode minimal
+        idlergear docs summary requests --mode standard --depth 1
+        idlergear docs summary /path/to/rust/project --lang rust
+        idlergear docs summary /path/to/dotnet/project --lang dotnet
+        idlergear docs summary . --lang auto  # Auto-detect language
+    """
+    from pathlib import Path
+    from idlergear.docs import (
+        check_pdoc_available,
+        generate_summary_json,
+        detect_python_project,
+    )
+    from idlergear.docs_rust import (
+        detect_rust_project,
+        generate_rust_summary_json,
+    )
+    from idlergear.docs_dotnet import (
+        detect_dotnet_project,
+        find_xml_docs,
+        load_xml_docs,
+        generate_dotnet_summary,
+    )
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+
+    if mode not in ("minimal", "standard", "detailed"):
+        typer.secho(f"Invalid mode: {mode}. Use minimal, standard, or detailed.")
+        raise typer.Exit(1)
+
+    # Auto-detect language if needed
+    detected_lang = lang
+    if lang == "auto":
+        path = Path(package)
+        if path.exists():
+            rust_project = detect_rust_project(path)
+            if rust_project["detected"]:
+                detected_lang = "rust"
+            else:
+                dotnet_project = detect_dotnet_project(path)
+                if dotnet_project["detected"]:
+                    detected_lang = "dotnet"
+                else:
+                    python_project = detect_python_project(path)
+                    if python_project["detected"]:
+                        detected_lang = "python"
+                    else:
+                        detected_lang = "python"  # Default
+        else:
+            # Assume it's a Python module name
+            detected_lang = "python"
+
+    try:
+        if detected_lang == "rust":
+            result = generate_rust_summary_json(package, mode=mode)  # type: ignore
+            typer.echo(result)
+        elif detected_lang == "dotnet":
+            path = Path(package)
+            xml_docs = find_xml_docs(path)
+            if not xml_docs:
+                if output_format == OutputFormat.JSON:
+                    typer.echo(
+                        json.dumps(
+                            {
+                                "error": "No XML documentation files found",
+                                "hint": "Build with <GenerateDocumentationFile>true</GenerateDocumentationFile>",
+                            }
+                        )
+                    )
+                else:
+                    typer.secho(
+                        "No XML documentation files found.",
+                        fg=typer.colors.RED,
+                    )
+                    typer.echo(
+                        "  Build with: dotnet build -p:GenerateDocumentationFile=true"
+                    )
+                raise typer.Exit(1)
+
+            # Parse first XML docs file
+            assembly = load_xml_docs(xml_docs[0])
+            summary = generate_dotnet_summary(assembly, mode=mode)
+            typer.echo(json.dumps(summary, indent=2))
+        else:
+            if not check_pdoc_available():
+                if output_format == OutputFormat.JSON:
+                    typer.echo(
+                        json.dumps(
+                            {
+                                "error": "pdoc not installed",
+                                "install": "pip install 'idlergear[docs]'",
+                            }
+                        )
+                    )
+                else:
+                    typer.secho(
+                        "pdoc is not installed. Install with: pip install 'idlergear[docs]'",
+                        fg=typer.colors.RED,
+                    )
+                raise typer.Exit(1)
+
+            result = generate_summary_json(
+                package,
+                mode=mode,  # type: ignore
+                include_private=include_private,
+                max_depth=max_depth,
+            )
+            typer.echo(result)
+
+    except Exception as e:
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": str(e)}))
+        else:
+            typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@docs_app.command("build")
+def docs_build(
+    ctx: typer.Context,
+    package: str = typer.Argument(
+        None, help="Package name or path (auto-detects if not provided)"
+    ),
+    lang: str = typer.Option(
+        "auto", "--lang", "-l", help="Language: python, rust, dotnet, auto"
+    ),
+    output: str = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Output directory (Python: docs/api, Rust: target/doc, .NET: docs/api)",
+    ),
+    open_browser: bool = typer.Option(
+        False, "--open", help="Open docs in browser after build"
+    ),
+    logo: Optional[str] = typer.Option(
+        None, "--logo", help="Path to logo image (Python only)"
+    ),
+    favicon: Optional[str] = typer.Option(
+        None, "--favicon", help="Path to favicon (Python only)"
+    ),
+    configuration: str = typer.Option(
+        "Debug", "--config", "-c", help="Build configuration (.NET only)"
+    ),
+):
+    """Build HTML documentation.
+
+    Uses pdoc for Python, cargo doc for Rust, dotnet build for .NET.
+    Auto-detects project language if not specified.
+
+    Examples:
+        idlergear docs build                    # Auto-detect package
+        idlergear docs build mypackage          # Explicit Python package
+        idlergear docs build . --lang rust      # Rust project in current dir
+        idlergear docs build . --lang dotnet    # .NET project in current dir
+        idlergear docs build --open             # Build and open in browser
+    """
+    from pathlib import Path
+    from idlergear.docs import (
+        build_html_docs,
+        check_pdoc_available,
+        detect_python_project,
+    )
+    from idlergear.docs_rust import (
+        build_rust_docs,
+        check_cargo_available,
+        detect_rust_project,
+    )
+    from idlergear.docs_dotnet import (
+        build_dotnet_docs,
+        check_dotnet_available,
+        detect_dotnet_project,
+    )
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+
+    # Auto-detect language if needed
+    detected_lang = lang
+    if lang == "auto":
+        path = Path(package) if package else Path(".")
+        rust_project = detect_rust_project(path)
+        if rust_project["detected"]:
+            detected_lang = "rust"
+        else:
+            dotnet_project = detect_dotnet_project(path)
+            if dotnet_project["detected"]:
+                detected_lang = "dotnet"
+            else:
+                detected_lang = "python"
+
+    if detected_lang == "rust":
+        if not check_cargo_available():
+            if output_format == OutputFormat.JSON:
+                typer.echo(json.dumps({"error": "cargo not found"}))
+            else:
+                typer.secho(
+                    "cargo is not found. Install from https://rustup.rs/",
+                    fg=typer.colors.RED,
+                )
+            raise typer.Exit(1)
+
+        path = Path(package) if package else Path(".")
+        if output_format != OutputFormat.JSON:
+            typer.echo(f"Building Rust docs for: {path}")
+
+        result = build_rust_docs(path, open_browser=open_browser)
+
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps(result))
+        else:
+            if result["success"]:
+                typer.secho("✓ Documentation built successfully", fg=typer.colors.GREEN)
+                typer.echo(f"  Output: {result['output_dir']}")
+                typer.echo(f"  Files: {result['count']}")
+            else:
+                typer.secho(
+                    f"✗ Build failed: {result.get('error')}", fg=typer.colors.RED
+                )
+                raise typer.Exit(1)
+    elif detected_lang == "dotnet":
+        if not check_dotnet_available():
+            if output_format == OutputFormat.JSON:
+                typer.echo(json.dumps({"error": "dotnet not found"}))
+            else:
+                typer.secho(
+                    "dotnet is not found. Install from https://dotnet.microsoft.com/",
+                    fg=typer.colors.RED,
+                )
+            raise typer.Exit(1)
+
+        path = Path(package) if package else Path(".")
+        if output_format != OutputFormat.JSON:
+            typer.echo(f"Building .NET docs for: {path}")
+
+        result = build_dotnet_docs(path, configuration=configuration)
+
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps(result))
+        else:
+            if result["success"]:
+                typer.secho(
+                    "✓ XML documentation built successfully", fg=typer.colors.GREEN
+                )
+                typer.echo(f"  XML files: {len(result.get('xml_files', []))}")
+                for xml_file in result.get("xml_files", []):
+                    typer.echo(f"    - {xml_file}")
+            else:
+                errors = result.get("errors", ["Unknown error"])
+                typer.secho(f"✗ Build failed: {errors[0]}", fg=typer.colors.RED)
+                raise typer.Exit(1)
+    else:
+        if not check_pdoc_available():
+            if output_format == OutputFormat.JSON:
+                typer.echo(
+                    json.dumps(
+                        {
+                            "error": "pdoc not installed",
+                            "install": "pip install 'idlergear[docs]'",
+                        }
+                    )
+                )
+            else:
+                typer.secho(
+                    "pdoc is not installed. Install with: pip install 'idlergear[docs]'",
+                    fg=typer.colors.RED,
+                )
+            raise typer.Exit(1)
+
+        # Auto-detect package if not provided
+        if not package:
+            project = detect_python_project()
+            if project.get("packages"):
+                package = project["packages"][0]
+                if output_format != OutputFormat.JSON:
+                    typer.echo(f"Detected package: {package}")
+            else:
+                if output_format == OutputFormat.JSON:
+                    typer.echo(json.dumps({"error": "Could not detect Python package"}))
+                else:
+                    typer.secho(
+                        "Could not detect Python package. Specify one explicitly.",
+                        fg=typer.colors.RED,
+                    )
+                raise typer.Exit(1)
+
+        output_dir = output or "docs/api"
+        result = build_html_docs(
+            package, output_dir=output_dir, logo=logo, favicon=favicon
+        )
+
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps(result))
+        else:
+            if result["success"]:
+                typer.secho("✓ Documentation built successfully", fg=typer.colors.GREEN)
+                typer.echo(f"  Output: {result['output_dir']}")
+                typer.echo(f"  Files: {result['count']}")
+            else:
+                typer.secho(
+                    f"✗ Build failed: {result.get('error')}", fg=typer.colors.RED
+                )
+                raise typer.Exit(1)
+
+
+@docs_app.command("serve")
+def docs_serve(
+    ctx: typer.Context,
+    docs_dir: str = typer.Argument(
+        "docs/api", help="Directory containing HTML documentation"
+    ),
+    port: int = typer.Option(8080, "--port", "-p", help="Port to serve on"),
+    host: str = typer.Option("127.0.0.1", "--host", "-h", help="Host to bind to"),
+    no_browser: bool = typer.Option(False, "--no-browser", help="Don't open browser"),
+):
+    """Serve HTML documentation locally for preview.
+
+    Examples:
+        idlergear docs serve                    # Serve docs/api on port 8080
+        idlergear docs serve --port 9000        # Custom port
+        idlergear docs serve ./my-docs          # Custom directory
+    """
+    import http.server
+    import socketserver
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+    docs_path = Path(docs_dir)
+
+    if not docs_path.exists():
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": f"Directory not found: {docs_path}"}))
+        else:
+            typer.secho(f"Directory not found: {docs_path}", fg=typer.colors.RED)
+            typer.echo("  Run 'idlergear docs build' first to generate documentation.")
+        raise typer.Exit(1)
+
+    # Check if docs exist
+    html_files = list(docs_path.glob("*.html"))
+    if not html_files:
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": f"No HTML files in {docs_path}"}))
+        else:
+            typer.secho(f"No HTML files found in {docs_path}", fg=typer.colors.RED)
+            typer.echo("  Run 'idlergear docs build' first to generate documentation.")
+        raise typer.Exit(1)
+
+    url = f"http://{host}:{port}"
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(docs_path), **kwargs)
+
+        def log_message(self, format, *args):
+            if output_format != OutputFormat.JSON:
+                typer.echo(f"  {args[0]}")
+
+    if output_format == OutputFormat.JSON:
+        typer.echo(json.dumps({"url": url, "docs_dir": str(docs_path.absolute())}))
+    else:
+        typer.secho(f"Serving documentation at {url}", fg=typer.colors.GREEN)
+        typer.echo(f"  Directory: {docs_path.absolute()}")
+        typer.echo("  Press Ctrl+C to stop")
+
+    if not no_browser:
+        import threading
+        import webbrowser
+
+        threading.Timer(0.5, lambda: webbrowser.open(url)).start()
+
+    try:
+        with socketserver.TCPServer((host, port), Handler) as httpd:
+            httpd.serve_forever()
+    except KeyboardInterrupt:
+        if output_format != OutputFormat.JSON:
+            typer.echo("\nServer stopped.")
+    except OSError as e:
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": str(e)}))
+        else:
+            typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@docs_app.command("detect")
+def docs_detect(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory to analyze"),
+):
+    """Detect project for documentation.
+
+    Detects Python, Rust, and .NET projects, showing package name, version,
+    source directory, and configuration.
+
+    Examples:
+        idlergear docs detect
+        idlergear docs detect /path/to/project
+    """
+    from idlergear.docs import detect_python_project
+    from idlergear.docs_rust import detect_rust_project
+    from idlergear.docs_dotnet import detect_dotnet_project
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+
+    # Check Rust first, then .NET, then Python
+    rust_result = detect_rust_project(path)
+    if rust_result["detected"]:
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps(rust_result))
+        else:
+            typer.secho("✓ Rust project detected", fg=typer.colors.GREEN)
+            if rust_result.get("name"):
+                typer.echo(f"  Name: {rust_result['name']}")
+            if rust_result.get("version"):
+                typer.echo(f"  Version: {rust_result['version']}")
+            if rust_result.get("edition"):
+                typer.echo(f"  Edition: {rust_result['edition']}")
+            if rust_result.get("config_file"):
+                typer.echo(f"  Config: {rust_result['config_file']}")
+            if rust_result.get("source_dir"):
+                typer.echo(f"  Source: {rust_result['source_dir']}/")
+            if rust_result.get("crate_type"):
+                typer.echo(f"  Type: {rust_result['crate_type']}")
+            if rust_result.get("is_workspace"):
+                typer.echo("  Workspace: yes")
+                if rust_result.get("workspace_members"):
+                    typer.echo(
+                        f"  Members: {', '.join(rust_result['workspace_members'])}"
+                    )
+        return
+
+    dotnet_result = detect_dotnet_project(path)
+    if dotnet_result["detected"]:
+        dotnet_result["language"] = "dotnet"
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps(dotnet_result))
+        else:
+            typer.secho("✓ .NET project detected", fg=typer.colors.GREEN)
+            if dotnet_result.get("name"):
+                typer.echo(f"  Name: {dotnet_result['name']}")
+            if dotnet_result.get("config_file"):
+                typer.echo(f"  Config: {dotnet_result['config_file']}")
+            if dotnet_result.get("projects"):
+                typer.echo(f"  Projects: {len(dotnet_result['projects'])}")
+                for proj in dotnet_result["projects"][:5]:  # Limit display
+                    typer.echo(f"    - {proj['name']} ({proj['type']})")
+            if dotnet_result.get("target_frameworks"):
+                typer.echo(
+                    f"  Frameworks: {', '.join(dotnet_result['target_frameworks'])}"
+                )
+            if dotnet_result.get("xml_docs"):
+                typer.echo(f"  XML docs: {len(dotnet_result['xml_docs'])} files")
+        return
+
+    python_result = detect_python_project(path)
+    if python_result["detected"]:
+        python_result["language"] = "python"
+        if output_format == OutputFormat.JSON:
+            typer.echo(json.dumps(python_result))
+        else:
+            typer.secho("✓ Python project detected", fg=typer.colors.GREEN)
+            if python_result.get("name"):
+                typer.echo(f"  Name: {python_result['name']}")
+            if python_result.get("version"):
+                typer.echo(f"  Version: {python_result['version']}")
+            if python_result.get("config_file"):
+                typer.echo(f"  Config: {python_result['config_file']}")
+            if python_result.get("source_dir"):
+                typer.echo(f"  Source: {python_result['source_dir']}/")
+            if python_result.get("packages"):
+                typer.echo(f"  Packages: {', '.join(python_result['packages'])}")
+        return
+
+    # None detected
+    if output_format == OutputFormat.JSON:
+        typer.echo(json.dumps({"path": path, "detected": False}))
+    else:
+        typer.secho(
+            "✗ No Python, Rust, or .NET project detected", fg=typer.colors.YELLOW
+        )
+        typer.echo(f"  Path: {path}")
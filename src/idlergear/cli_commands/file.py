@@ -0,0 +1,660 @@
+"""`idlergear file` commands."""
+
+import json
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+
+file_app = typer.Typer(help="File registry and annotations (track file status)")
+
+
+# ============================================
+# File Registry Commands
+# ============================================
+
+
+@file_app.command("register")
+def file_register(
+    path: str = typer.Argument(..., help="File path to register"),
+    status: str = typer.Option(
+        "current",
+        "--status",
+        "-s",
+        help="File status: current, deprecated, archived, problematic",
+    ),
+    reason: Optional[str] = typer.Option(
+        None, "--reason", "-r", help="Reason for status"
+    ),
+):
+    """Register a file with explicit status."""
+    from idlergear.file_registry import FileRegistry, FileStatus
+
+    try:
+        status_enum = FileStatus(status)
+    except ValueError:
+        typer.secho(
+            f"Invalid status: {status}. Must be one of: current, deprecated, archived, problematic",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    registry = FileRegistry()
+    registry.register_file(path, status_enum, reason=reason)
+
+    # Status color mapping
+    color = {
+        FileStatus.CURRENT: typer.colors.GREEN,
+        FileStatus.DEPRECATED: typer.colors.YELLOW,
+        FileStatus.ARCHIVED: typer.colors.BLUE,
+        FileStatus.PROBLEMATIC: typer.colors.RED,
+    }[status_enum]
+
+    typer.secho(f"✅ Registered {path} as {status}", fg=color)
+    if reason:
+        typer.secho(f"   Reason: {reason}", fg=typer.colors.BRIGHT_BLACK)
+
+
+@file_app.command("deprecate")
+def file_deprecate(
+    path: str = typer.Argument(..., help="File path to deprecate"),
+    successor: Optional[str] = typer.Option(
+        None, "--successor", "-s", help="Current version path"
+    ),
+    reason: str = typer.Option(..., "--reason", "-r", help="Reason for deprecation"),
+):
+    """Mark a file as deprecated."""
+    from idlergear.file_registry import FileRegistry
+
+    registry = FileRegistry()
+    registry.deprecate_file(path, successor=successor, reason=reason)
+
+    typer.secho(f"⚠️  Deprecated {path}", fg=typer.colors.YELLOW)
+    if successor:
+        typer.secho(f"   Current version: {successor}", fg=typer.colors.GREEN)
+    typer.secho(f"   Reason: {reason}", fg=typer.colors.BRIGHT_BLACK)
+
+
+@file_app.command("status")
+def file_status(
+    path: str = typer.Argument(..., help="File path to check"),
+):
+    """Show status of a file."""
+    from idlergear.file_registry import FileRegistry
+
+    registry = FileRegistry()
+    entry = registry.get_entry(path)
+
+    if not entry:
+        typer.secho(f"File not registered: {path}", fg=typer.colors.BRIGHT_BLACK)
+        status = registry.get_status(path)
+        if status:
+            typer.secho(f"Matches pattern rule: {status.value}", fg=typer.colors.YELLOW)
+        else:
+            typer.secho("No status information available", fg=typer.colors.BRIGHT_BLACK)
+        raise typer.Exit(0)
+
+    # Status color mapping
+    color = {
+        "current": typer.colors.GREEN,
+        "deprecated": typer.colors.YELLOW,
+        "archived": typer.colors.BLUE,
+        "problematic": typer.colors.RED,
+    }[entry.status.value]
+
+    status_symbols = {
+        "current": "✅",
+        "deprecated": "⚠️ ",
+        "archived": "📦",
+        "problematic": "❌",
+    }
+
+    symbol = status_symbols[entry.status.value]
+    typer.secho(f"\n{symbol} {path}", fg=color, bold=True)
+    typer.secho(f"Status: {entry.status.value}", fg=color)
+
+    if entry.reason:
+        typer.secho(f"Reason: {entry.reason}", fg=typer.colors.BRIGHT_BLACK)
+
+    if entry.current_version:
+        typer.secho(f"Current version: {entry.current_version}", fg=typer.colors.GREEN)
+
+    if entry.deprecated_at:
+        typer.secho(
+            f"Deprecated at: {entry.deprecated_at}", fg=typer.colors.BRIGHT_BLACK
+        )
+
+    if entry.description:
+        typer.secho(f"\nDescription: {entry.description}", fg=typer.colors.CYAN)
+
+    if entry.tags:
+        typer.secho(f"Tags: {', '.join(entry.tags)}", fg=typer.colors.MAGENTA)
+
+    if entry.components:
+        typer.secho(f"Components: {', '.join(entry.components)}", fg=typer.colors.BLUE)
+
+    if entry.related_files:
+        typer.secho("Related files:", fg=typer.colors.YELLOW)
+        for rf in entry.related_files:
+            typer.secho(f"  - {rf}", fg=typer.colors.BRIGHT_BLACK)
+
+    typer.echo()
+
+
+@file_app.command("list")
+def file_list(
+    status: Optional[str] = typer.Option(
+        None, "--status", "-s", help="Filter by status"
+    ),
+):
+    """List all registered files."""
+    from idlergear.file_registry import FileRegistry, FileStatus
+
+    registry = FileRegistry()
+
+    status_filter = None
+    if status:
+        try:
+            status_filter = FileStatus(status)
+        except ValueError:
+            typer.secho(
+                f"Invalid status: {status}. Must be one of: current, deprecated, archived, problematic",
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(1)
+
+    files = registry.list_files(status_filter)
+
+    if not files:
+        typer.secho("No files registered", fg=typer.colors.BRIGHT_BLACK)
+        raise typer.Exit(0)
+
+    # Group by status
+    by_status = {}
+    for entry in files:
+        status_key = entry.status.value
+        if status_key not in by_status:
+            by_status[status_key] = []
+        by_status[status_key].append(entry)
+
+    # Display
+    typer.secho(
+        f"\n📁 Registered Files ({len(files)} total)\n",
+        fg=typer.colors.BRIGHT_CYAN,
+        bold=True,
+    )
+
+    status_order = ["current", "deprecated", "archived", "problematic"]
+    status_colors = {
+        "current": typer.colors.GREEN,
+        "deprecated": typer.colors.YELLOW,
+        "archived": typer.colors.BLUE,
+        "problematic": typer.colors.RED,
+    }
+    status_symbols = {
+        "current": "✅",
+        "deprecated": "⚠️ ",
+        "archived": "📦",
+        "problematic": "❌",
+    }
+
+    for status_key in status_order:
+        if status_key not in by_status:
+            continue
+
+        entries = by_status[status_key]
+        color = status_colors[status_key]
+        symbol = status_symbols[status_key]
+
+        typer.secho(
+            f"{symbol} {status_key.upper()} ({len(entries)} files)", fg=color, bold=True
+        )
+
+        for entry in sorted(entries, key=lambda e: e.path):
+            typer.secho(f"  {entry.path}", fg=color)
+            if entry.reason:
+                typer.secho(f"    → {entry.reason}", fg=typer.colors.BRIGHT_BLACK)
+            if entry.current_version:
+                typer.secho(
+                    f"    → Use: {entry.current_version}", fg=typer.colors.GREEN
+                )
+
+        typer.echo()
+
+
+@file_app.command("annotate")
+def file_annotate(
+    path: str = typer.Argument(..., help="File path to annotate"),
+    description: Optional[str] = typer.Option(
+        None, "--description", "-d", help="File description"
+    ),
+    tags: Optional[List[str]] = typer.Option(
+        None, "--tag", "-t", help="Tags (can be specified multiple times)"
+    ),
+    components: Optional[List[str]] = typer.Option(
+        None, "--component", "-c", help="Components (can be specified multiple times)"
+    ),
+):
+    """Annotate a file with description, tags, and components."""
+    from idlergear.file_registry import FileRegistry
+
+    registry = FileRegistry()
+    entry = registry.annotate_file(
+        path,
+        description=description,
+        tags=tags or [],
+        components=components or [],
+    )
+
+    typer.secho(f"✅ Annotated {path}", fg=typer.colors.GREEN)
+
+    if description:
+        typer.secho(f"   Description: {description}", fg=typer.colors.CYAN)
+    if tags:
+        typer.secho(f"   Tags: {', '.join(tags)}", fg=typer.colors.MAGENTA)
+    if components:
+        typer.secho(f"   Components: {', '.join(components)}", fg=typer.colors.BLUE)
+
+
+@file_app.command("search")
+def file_search(
+    query: Optional[str] = typer.Option(
+        None, "--query", "-q", help="Search in descriptions"
+    ),
+    tags: Optional[List[str]] = typer.Option(
+        None, "--tag", "-t", help="Filter by tags"
+    ),
+    components: Optional[List[str]] = typer.Option(
+        None, "--component", "-c", help="Filter by components"
+    ),
+    status: Optional[str] = typer.Option(
+        None, "--status", "-s", help="Filter by status"
+    ),
+):
+    """Search files by annotations."""
+    from idlergear.file_registry import FileRegistry, FileStatus
+
+    registry = FileRegistry()
+
+    status_filter = None
+    if status:
+        try:
+            status_filter = FileStatus(status)
+        except ValueError:
+            typer.secho(f"Invalid status: {status}", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+    results = registry.search_files(
+        query=query,
+        tags=tags or [],
+        components=components or [],
+        status=status_filter,
+    )
+
+    if not results:
+        typer.secho("No files found", fg=typer.colors.BRIGHT_BLACK)
+        raise typer.Exit(0)
+
+    typer.secho(
+        f"\n🔍 Found {len(results)} files\n", fg=typer.colors.BRIGHT_CYAN, bold=True
+    )
+
+    for entry in results:
+        # Status color
+        color = {
+            "current": typer.colors.GREEN,
+            "deprecated": typer.colors.YELLOW,
+            "archived": typer.colors.BLUE,
+            "problematic": typer.colors.RED,
+        }.get(entry.status.value, typer.colors.WHITE)
+
+        typer.secho(f"📄 {entry.path}", fg=color, bold=True)
+
+        if entry.description:
+            typer.secho(f"   {entry.description}", fg=typer.colors.BRIGHT_BLACK)
+
+        if entry.tags:
+            typer.secho(f"   Tags: {', '.join(entry.tags)}", fg=typer.colors.MAGENTA)
+
+        if entry.components:
+            typer.secho(
+                f"   Components: {', '.join(entry.components)}", fg=typer.colors.BLUE
+            )
+
+        typer.echo()
+
+
+@file_app.command("audit")
+def file_audit(
+    ctx: typer.Context,
+    since: int = typer.Option(
+        24, "--since", help="Audit access log for last N hours (default: 24)"
+    ),
+    include_code: bool = typer.Option(
+        False, "--include-code", help="Include static code analysis"
+    ),
+    output: Optional[str] = typer.Option(
+        None, "--output", "-o", help="Output format: json or text (default: text)"
+    ),
+):
+    """Audit project for deprecated file usage.
+
+    Scans:
+    - Access log for recent deprecated file access
+    - (Optional) Code for string references to deprecated files
+
+    Examples:
+      idlergear file audit
+      idlergear file audit --since 48 --include-code
+      idlergear file audit --output json
+    """
+    from idlergear.file_registry import FileRegistry
+
+    registry = FileRegistry()
+    report = registry.audit_project(since_hours=since, include_code_scan=include_code)
+
+    # JSON output
+    if output == "json" or ctx.obj.get("output_mode") == "json":
+        typer.echo(json.dumps(report, indent=2))
+        return
+
+    # Text output
+    typer.secho(
+        "\n📋 File Registry Audit Report", fg=typer.colors.BRIGHT_BLUE, bold=True
+    )
+    typer.secho("=" * 60, fg=typer.colors.BRIGHT_BLUE)
+
+    # Accessed files section
+    accessed = report["accessed"]
+    if accessed:
+        typer.secho(
+            f"\n⚠️  Deprecated Files Recently Accessed ({len(accessed)}):",
+            fg=typer.colors.YELLOW,
+            bold=True,
+        )
+        for item in accessed:
+            typer.secho(f"\n  ✗ {item['file']}", fg=typer.colors.RED, bold=True)
+            if item.get("current_version"):
+                typer.secho(
+                    f"    Current version: {item['current_version']}",
+                    fg=typer.colors.GREEN,
+                )
+            typer.secho(f"    Access count: {item['access_count']}")
+            typer.secho(f"    Last accessed: {item['last_accessed']}")
+            if item.get("accessed_by"):
+                agents = ", ".join(item["accessed_by"])
+                typer.secho(f"    Accessed by: {agents}")
+            if item.get("tools_used"):
+                tools = ", ".join(item["tools_used"])
+                typer.secho(f"    Tools used: {tools}")
+    else:
+        typer.secho(
+            f"\n✅ No deprecated files accessed in last {since} hours",
+            fg=typer.colors.GREEN,
+        )
+
+    # Code references section
+    if include_code:
+        code_refs = report["code_references"]
+        if code_refs:
+            typer.secho(
+                f"\n⚠️  Deprecated Files Referenced in Code ({len(code_refs)}):",
+                fg=typer.colors.YELLOW,
+                bold=True,
+            )
+            for ref in code_refs:
+                typer.secho(
+                    f"\n  ⚠️  {ref['file']}:{ref['line']}",
+                    fg=typer.colors.YELLOW,
+                    bold=True,
+                )
+                typer.secho(
+                    f"    References: {ref['deprecated_file']}", fg=typer.colors.RED
+                )
+                if ref.get("current_version"):
+                    typer.secho(
+                        f"    Suggestion: Update to {ref['current_version']}",
+                        fg=typer.colors.GREEN,
+                    )
+                typer.secho(
+                    f"    Code: {ref['code'][:80]}{'...' if len(ref['code']) > 80 else ''}"
+                )
+        else:
+            typer.secho(
+                "\n✅ No deprecated file references found in code",
+                fg=typer.colors.GREEN,
+            )
+
+    # Summary
+    typer.secho("\n" + "=" * 60, fg=typer.colors.BRIGHT_BLUE)
+    typer.secho("Summary:", fg=typer.colors.BRIGHT_BLUE, bold=True)
+    typer.echo(f"  Audit period: Last {report['summary']['audit_period_hours']} hours")
+    typer.echo(
+        f"  Deprecated files accessed: {report['summary']['deprecated_files_accessed']}"
+    )
+    if include_code:
+        typer.echo(
+            f"  Code references found: {report['summary']['code_references_found']}"
+        )
+
+    if (
+        report["summary"]["deprecated_files_accessed"] > 0
+        or report["summary"]["code_references_found"] > 0
+    ):
+        typer.secho("\n💡 Action Required:", fg=typer.colors.CYAN, bold=True)
+        typer.echo("  - Review and update references to deprecated files")
+        typer.echo("  - Use 'idlergear file status <path>' to find current versions")
+        typer.echo("  - Consider adding to pre-commit hook for automated checks")
+
+    typer.echo()
+
+
+@file_app.command("unregister")
+def file_unregister(
+    path: str = typer.Argument(..., help="File path to unregister"),
+):
+    """Remove a file from the registry."""
+    from idlergear.file_registry import FileRegistry
+
+    registry = FileRegistry()
+
+    if not registry.unregister(path):
+        typer.secho(f"File not registered: {path}", fg=typer.colors.YELLOW)
+        raise typer.Exit(1)
+
+    typer.secho(f"✅ Unregistered {path}", fg=typer.colors.GREEN)
+
+
+@file_app.command("export")
+def file_export(
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Target directory (default: .idlergear/file_annotations/)",
+    ),
+):
+    """Export annotations as one human-readable JSON file per annotated file."""
+    from idlergear.file_annotation_storage import SQLiteAnnotationStorage
+
+    storage = SQLiteAnnotationStorage()
+    count = storage.export_json(output)
+    storage.close()
+
+    typer.secho(
+        f"✅ Exported {count} annotations to {output or storage.base_path}",
+        fg=typer.colors.GREEN,
+    )
+
+
+@file_app.command("scan")
+def file_scan(
+    ctx: typer.Context,
+    auto: bool = typer.Option(
+        False, "--auto", help="Automatically apply high-confidence suggestions"
+    ),
+    confidence: str = typer.Option(
+        "low", "--confidence", "-c", help="Minimum confidence: high, medium, low"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show suggestions without applying"
+    ),
+    output: Optional[str] = typer.Option(
+        None, "--output", "-o", help="Output format: json or text"
+    ),
+):
+    """Auto-detect versioned files and suggest registry entries.
+
+    Scans project for:
+    - Git rename history (high confidence)
+    - Filename patterns (_old, _v1, .bak, timestamps)
+    - Archive directories (archive/, old/, backup/)
+
+    Examples:
+        idlergear file scan                    # Interactive mode
+        idlergear file scan --auto             # Auto-apply high confidence
+        idlergear file scan --confidence high  # Only show high confidence
+        idlergear file scan --dry-run          # Preview without applying
+    """
+    from idlergear.file_registry import FileRegistry
+    from idlergear.file_registry_scanner import FileRegistryScanner
+
+    scanner = FileRegistryScanner()
+    suggestions = scanner.scan(min_confidence=confidence)
+
+    if not suggestions:
+        typer.secho("✅ No versioned files detected", fg=typer.colors.GREEN)
+        return
+
+    # JSON output
+    if output == "json" or (
+        hasattr(ctx.obj, "output_mode") and ctx.obj.output_mode == "json"
+    ):
+        result = {
+            "suggestions": [
+                {
+                    "file_path": s.file_path,
+                    "suggested_status": s.suggested_status.value,
+                    "confidence": s.confidence,
+                    "reason": s.reason,
+                    "current_version": s.current_version,
+                    "evidence": s.evidence,
+                }
+                for s in suggestions
+            ],
+            "total": len(suggestions),
+        }
+        typer.echo(json.dumps(result, indent=2))
+        return
+
+    # Text output
+    typer.secho(
+        "\n🔍 File Registry Auto-Detection Report",
+        fg=typer.colors.BRIGHT_BLUE,
+        bold=True,
+    )
+    typer.secho(f"Found {len(suggestions)} suggestions\n", fg=typer.colors.CYAN)
+
+    # Group by confidence
+    grouped = scanner.group_suggestions_by_confidence(suggestions)
+
+    registry = FileRegistry()
+    applied = 0
+    skipped = 0
+
+    for conf_level in ["high", "medium", "low"]:
+        conf_suggestions = grouped.get(conf_level, [])
+        if not conf_suggestions:
+            continue
+
+        # Confidence color
+        conf_color = {
+            "high": typer.colors.GREEN,
+            "medium": typer.colors.YELLOW,
+            "low": typer.colors.WHITE,
+        }[conf_level]
+
+        typer.secho(
+            f"\n{conf_level.upper()} CONFIDENCE ({len(conf_suggestions)}):",
+            fg=conf_color,
+            bold=True,
+        )
+        typer.secho("=" * 60, fg=conf_color)
+
+        for suggestion in conf_suggestions:
+            typer.echo()
+            typer.secho(f"  📄 {suggestion.file_path}", fg=typer.colors.CYAN, bold=True)
+            typer.echo(f"     Status: {suggestion.suggested_status.value}")
+            typer.echo(f"     Reason: {suggestion.reason}")
+
+            if suggestion.current_version:
+                typer.secho(
+                    f"     Current: {suggestion.current_version}", fg=typer.colors.GREEN
+                )
+
+            if suggestion.evidence:
+                typer.echo("     Evidence:")
+                for ev in suggestion.evidence:
+                    typer.echo(f"       - {ev}")
+
+            # Auto-apply logic
+            should_apply = False
+
+            if dry_run:
+                typer.secho("     [DRY RUN - Would register]", fg=typer.colors.MAGENTA)
+                continue
+
+            if auto and conf_level == "high":
+                should_apply = True
+                typer.secho("     [AUTO-APPLYING]", fg=typer.colors.GREEN)
+            elif not auto:
+                # Interactive mode
+                response = typer.prompt(
+                    "     Apply this suggestion? [Y/n/skip]",
+                    default="y",
+                    show_default=False,
+                )
+                should_apply = response.lower() in ["y", "yes", ""]
+                if response.lower() in ["skip", "s"]:
+                    skipped += 1
+                    continue
+
+            # Apply suggestion
+            if should_apply:
+                try:
+                    if suggestion.suggested_status.value == "deprecated":
+                        registry.deprecate(
+                            suggestion.file_path,
+                            successor=suggestion.current_version,
+                            reason=suggestion.reason,
+                        )
+                    else:
+                        registry.register(
+                            suggestion.file_path,
+                            status=suggestion.suggested_status,
+                            reason=suggestion.reason,
+                        )
+
+                    typer.secho(
+                        f"     ✅ Registered as {suggestion.suggested_status.value}",
+                        fg=typer.colors.GREEN,
+                    )
+                    applied += 1
+
+                except Exception as e:
+                    typer.secho(f"     ❌ Failed to register: {e}", fg=typer.colors.RED)
+            else:
+                skipped += 1
+
+    # Summary
+    if not dry_run:
+        typer.secho("\n" + "=" * 60, fg=typer.colors.BRIGHT_BLUE)
+        typer.secho("Summary:", fg=typer.colors.BRIGHT_BLUE, bold=True)
+        typer.echo(f"  Total suggestions: {len(suggestions)}")
+        typer.echo(f"  Applied: {applied}")
+        typer.echo(f"  Skipped: {skipped}")
+
+        if applied > 0:
+            typer.secho("\n✅ Registry updated successfully", fg=typer.colors.GREEN)
+    else:
+        typer.secho("\n💡 Run without --dry-run to apply changes", fg=typer.colors.CYAN)
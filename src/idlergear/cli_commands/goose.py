@@ -0,0 +1,32 @@
+"""`idlergear goose` commands."""
+
+from pathlib import Path
+
+import typer
+
+goose_app = typer.Typer(help="Goose integration and configuration")
+
+
+# Goose commands
+@goose_app.command("init")
+def goose_init(
+    path: str = typer.Argument(".", help="Project directory"),
+    force: bool = typer.Option(False, "--force", help="Overwrite existing .goosehints"),
+):
+    """Generate .goosehints file with IdlerGear and MCP server recommendations."""
+    from pathlib import Path
+    from .goose import generate_goosehints
+
+    generate_goosehints(Path(path), force=force)
+
+
+@goose_app.command("register")
+def goose_register():
+    """Register IdlerGear as a Goose GUI extension.
+
+    Currently provides manual registration instructions.
+    Automatic registration will be implemented after researching Goose's extension API.
+    """
+    from .goose import register_goose_extension
+
+    register_goose_extension()
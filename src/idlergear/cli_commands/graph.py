@@ -0,0 +1,951 @@
+"""`idlergear graph` commands."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+graph_app = typer.Typer(help="Knowledge graph queries and population")
+
+
+# ============================================================================
+# Graph Commands
+# ============================================================================
+
+
+@graph_app.command("populate")
+def graph_populate(
+    ctx: typer.Context,
+    max_commits: int = typer.Option(
+        100, "--max-commits", help="Maximum commits to index"
+    ),
+    code_dir: str = typer.Option(
+        "src", "--code-dir", help="Directory to scan for code"
+    ),
+    incremental: bool = typer.Option(
+        True, "--incremental/--full", help="Skip already-indexed data"
+    ),
+    verbose: bool = typer.Option(
+        True, "--verbose/--quiet", help="Print progress messages"
+    ),
+    jobs: int = typer.Option(
+        4, "--jobs", "-j", help="Maximum populators running at once (1 = sequential)"
+    ),
+    profile: bool = typer.Option(
+        False, "--profile", help="Print a per-stage timing report"
+    ),
+    rebuild: bool = typer.Option(
+        False,
+        "--rebuild",
+        help="Rebuild the graph from scratch with bulk loading, then swap it in",
+    ),
+):
+    """Populate entire knowledge graph in one command.
+
+    Runs all populators: git history, code symbols, tasks, commit-task links, references, and wiki.
+    Independent populators run concurrently. Safe to re-run with --incremental (default).
+    With --rebuild, a new graph is bulk loaded next to the current one, which stays
+    readable until the finished graph replaces it.
+    """
+    from idlergear.graph import populate_all
+    from idlergear.graph.database import GraphLockedError
+    from idlergear.graph.populate_all import format_profile, populate_in_daemon
+    from pathlib import Path
+
+    project_path = Path.cwd()
+
+    try:
+        try:
+            results = populate_all(
+                project_path=project_path,
+                max_commits=max_commits,
+                code_directory=code_dir,
+                incremental=incremental,
+                verbose=verbose,
+                max_workers=jobs,
+                profile=profile,
+                rebuild=rebuild,
+            )
+        except GraphLockedError:
+            # The daemon holds the graph open for writing; populate through it
+            if verbose:
+                typer.echo("Graph is open in the daemon; populating there...")
+            results = populate_in_daemon(
+                max_commits=max_commits,
+                code_directory=code_dir,
+                incremental=incremental,
+                profile=profile,
+                rebuild=rebuild,
+            )
+
+        if ctx.obj.output_format == "json":
+            typer.echo(json.dumps(results, indent=2))
+        elif profile:
+            typer.echo("\nStage timings:")
+            typer.echo(format_profile(results["profile"]))
+        # Human output is handled by populate_all's verbose mode
+
+    except Exception as e:
+        typer.secho(
+            f"Failed to populate knowledge graph: {e}", fg=typer.colors.RED, err=True
+        )
+        raise typer.Exit(1)
+
+
+@graph_app.command("schema")
+def graph_schema(ctx: typer.Context):
+    """Show knowledge graph schema (node types, relationship types, counts)."""
+    try:
+        from idlergear.graph.database import get_database
+
+        db = get_database()
+
+        # Query for node types and counts
+        node_query = """
+        MATCH (n)
+        RETURN labels(n)[0] AS type, COUNT(*) AS count
+        ORDER BY count DESC
+        """
+        node_results = db.execute(node_query)
+
+        # Query for relationship types and counts
+        rel_query = """
+        MATCH ()-[r]->()
+        RETURN type(r) AS type, COUNT(*) AS count
+        ORDER BY count DESC
+        """
+        rel_results = db.execute(rel_query)
+
+        if ctx.obj.get("output_mode") == "json":
+            output = {
+                "node_types": [{"type": r[0], "count": r[1]} for r in node_results],
+                "relationship_types": [
+                    {"type": r[0], "count": r[1]} for r in rel_results
+                ],
+            }
+            typer.echo(json.dumps(output, indent=2))
+        else:
+            typer.secho(
+                "\n📊 Knowledge Graph Schema\n", fg=typer.colors.BRIGHT_BLUE, bold=True
+            )
+
+            typer.secho("Node Types:", fg=typer.colors.GREEN, bold=True)
+            for node_type, count in node_results:
+                typer.echo(f"  {node_type}: {count:,}")
+
+            typer.secho("\nRelationship Types:", fg=typer.colors.GREEN, bold=True)
+            for rel_type, count in rel_results:
+                typer.echo(f"  {rel_type}: {count:,}")
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to get schema: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("stats")
+def graph_stats(ctx: typer.Context):
+    """Show knowledge graph statistics (total nodes, relationships)."""
+    try:
+        from idlergear.graph.database import get_database
+
+        db = get_database()
+
+        # Count total nodes
+        node_count_query = "MATCH (n) RETURN COUNT(n) AS count"
+        node_count = db.execute(node_count_query)[0][0]
+
+        # Count total relationships
+        rel_count_query = "MATCH ()-[r]->() RETURN COUNT(r) AS count"
+        rel_count = db.execute(rel_count_query)[0][0]
+
+        if ctx.obj.get("output_mode") == "json":
+            output = {"total_nodes": node_count, "total_relationships": rel_count}
+            typer.echo(json.dumps(output, indent=2))
+        else:
+            typer.secho(
+                "\n📊 Knowledge Graph Statistics\n",
+                fg=typer.colors.BRIGHT_BLUE,
+                bold=True,
+            )
+            typer.echo(f"Total Nodes: {node_count:,}")
+            typer.echo(f"Total Relationships: {rel_count:,}")
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to get stats: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("query-task")
+def graph_query_task(
+    ctx: typer.Context,
+    task_id: int = typer.Argument(..., help="Task ID to query"),
+):
+    """Query knowledge graph for task context (files, commits, symbols)."""
+    try:
+        from idlergear.graph.database import get_database
+
+        db = get_database()
+
+        # Query for task and related entities
+        query = """
+        MATCH (t:Task {id: $task_id})
+        OPTIONAL MATCH (t)-[:IMPLEMENTED_IN]->(f:File)
+        OPTIONAL MATCH (c:Commit)-[:MODIFIES]->(t)
+        OPTIONAL MATCH (f)-[:CONTAINS]->(s:Symbol)
+        RETURN t, COLLECT(DISTINCT f) AS files, COLLECT(DISTINCT c) AS commits, COLLECT(DISTINCT s) AS symbols
+        """
+
+        result = db.execute(query, {"task_id": task_id})
+
+        if not result:
+            typer.secho(
+                f"Task #{task_id} not found in knowledge graph",
+                fg=typer.colors.RED,
+                err=True,
+            )
+            raise typer.Exit(1)
+
+        task, files, commits, symbols = result[0]
+
+        if ctx.obj.get("output_mode") == "json":
+            output = {
+                "task": dict(task),
+                "files": [dict(f) for f in files if f],
+                "commits": [dict(c) for c in commits if c],
+                "symbols": [dict(s) for s in symbols if s],
+            }
+            typer.echo(json.dumps(output, indent=2))
+        else:
+            typer.secho(
+                f"\n📋 Task #{task_id} Context\n",
+                fg=typer.colors.BRIGHT_BLUE,
+                bold=True,
+            )
+
+            if files and any(files):
+                typer.secho(
+                    f"Files ({len([f for f in files if f])}):", fg=typer.colors.GREEN
+                )
+                for f in files:
+                    if f:
+                        typer.echo(f"  - {f.get('path', 'unknown')}")
+
+            if commits and any(commits):
+                typer.secho(
+                    f"\nCommits ({len([c for c in commits if c])}):",
+                    fg=typer.colors.GREEN,
+                )
+                for c in commits:
+                    if c:
+                        typer.echo(
+                            f"  - {c.get('sha', 'unknown')[:8]}: {c.get('message', '')[:60]}"
+                        )
+
+            if symbols and any(symbols):
+                typer.secho(
+                    f"\nSymbols ({len([s for s in symbols if s])}):",
+                    fg=typer.colors.GREEN,
+                )
+                for s in symbols:
+                    if s:
+                        typer.echo(
+                            f"  - {s.get('name', 'unknown')} ({s.get('type', 'unknown')})"
+                        )
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to query task: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("query-file")
+def graph_query_file(
+    ctx: typer.Context,
+    file_path: str = typer.Argument(..., help="File path to query"),
+):
+    """Query knowledge graph for file context (symbols, tasks, commits)."""
+    try:
+        from idlergear.graph.database import get_database
+
+        db = get_database()
+
+        # Query for file and related entities
+        query = """
+        MATCH (f:File {path: $file_path})
+        OPTIONAL MATCH (f)-[:CONTAINS]->(s:Symbol)
+        OPTIONAL MATCH (f)<-[:IMPLEMENTED_IN]-(t:Task)
+        OPTIONAL MATCH (c:Commit)-[:CHANGES]->(f)
+        RETURN f, COLLECT(DISTINCT s) AS symbols, COLLECT(DISTINCT t) AS tasks, COLLECT(DISTINCT c) AS commits
+        """
+
+        result = db.execute(query, {"file_path": file_path})
+
+        if not result:
+            typer.secho(
+                f"File '{file_path}' not found in knowledge graph",
+                fg=typer.colors.RED,
+                err=True,
+            )
+            raise typer.Exit(1)
+
+        file, symbols, tasks, commits = result[0]
+
+        if ctx.obj.get("output_mode") == "json":
+            output = {
+                "file": dict(file),
+                "symbols": [dict(s) for s in symbols if s],
+                "tasks": [dict(t) for t in tasks if t],
+                "commits": [dict(c) for c in commits if c],
+            }
+            typer.echo(json.dumps(output, indent=2))
+        else:
+            typer.secho(
+                f"\n📄 File: {file_path}\n", fg=typer.colors.BRIGHT_BLUE, bold=True
+            )
+
+            if symbols and any(symbols):
+                typer.secho(
+                    f"Symbols ({len([s for s in symbols if s])}):",
+                    fg=typer.colors.GREEN,
+                )
+                for s in symbols:
+                    if s:
+                        typer.echo(
+                            f"  - {s.get('name', 'unknown')} ({s.get('type', 'unknown')}) at line {s.get('line', '?')}"
+                        )
+
+            if tasks and any(tasks):
+                typer.secho(
+                    f"\nRelated Tasks ({len([t for t in tasks if t])}):",
+                    fg=typer.colors.GREEN,
+                )
+                for t in tasks:
+                    if t:
+                        typer.echo(
+                            f"  - #{t.get('id', '?')}: {t.get('title', 'unknown')}"
+                        )
+
+            if commits and any(commits):
+                typer.secho(
+                    f"\nRecent Commits ({len([c for c in commits if c])}):",
+                    fg=typer.colors.GREEN,
+                )
+                for c in commits:
+                    if c:
+                        typer.echo(
+                            f"  - {c.get('sha', 'unknown')[:8]}: {c.get('message', '')[:60]}"
+                        )
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to query file: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("query-symbols")
+def graph_query_symbols(
+    ctx: typer.Context,
+    pattern: str = typer.Argument(
+        ..., help="Symbol name pattern (case-insensitive substring match)"
+    ),
+    limit: int = typer.Option(10, "--limit", help="Maximum number of results"),
+):
+    """Search for code symbols (functions, classes, methods) by name pattern."""
+    try:
+        from idlergear.graph.database import get_database
+
+        db = get_database()
+
+        # Query for symbols matching pattern
+        query = """
+        MATCH (s:Symbol)
+        WHERE toLower(s.name) CONTAINS toLower($pattern)
+        OPTIONAL MATCH (f:File)-[:CONTAINS]->(s)
+        RETURN s, f
+        LIMIT $limit
+        """
+
+        results = db.execute(query, {"pattern": pattern, "limit": limit})
+
+        if not results:
+            typer.secho(
+                f"No symbols found matching '{pattern}'", fg=typer.colors.RED, err=True
+            )
+            raise typer.Exit(1)
+
+        if ctx.obj.get("output_mode") == "json":
+            output = {
+                "pattern": pattern,
+                "count": len(results),
+                "results": [
+                    {"symbol": dict(symbol), "file": dict(file) if file else None}
+                    for symbol, file in results
+                ],
+            }
+            typer.echo(json.dumps(output, indent=2))
+        else:
+            typer.secho(
+                f"\n🔍 Symbols matching '{pattern}' ({len(results)} found)\n",
+                fg=typer.colors.BRIGHT_BLUE,
+                bold=True,
+            )
+
+            for symbol, file in results:
+                name = symbol.get("name", "unknown")
+                sym_type = symbol.get("type", "unknown")
+                line = symbol.get("line", "?")
+                file_path = file.get("path", "unknown") if file else "unknown"
+
+                typer.secho(f"{name}", fg=typer.colors.GREEN, bold=True)
+                typer.echo(f"  Type: {sym_type}")
+                typer.echo(f"  Location: {file_path}:{line}")
+                typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to search symbols: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("impact")
+def graph_impact_analysis(
+    ctx: typer.Context,
+    symbol_name: str = typer.Argument(..., help="Symbol name to analyze"),
+):
+    """Analyze what would be affected if a symbol breaks or changes."""
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.queries import query_impact_analysis
+
+        db = get_database()
+        result = query_impact_analysis(db, symbol_name)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            if not result.get("found"):
+                typer.secho(
+                    f"\n❌ Symbol '{symbol_name}' not found in knowledge graph\n",
+                    fg=typer.colors.RED,
+                )
+                raise typer.Exit(1)
+
+            typer.secho(
+                f"\n💥 Impact Analysis: {symbol_name}\n",
+                fg=typer.colors.BRIGHT_BLUE,
+                bold=True,
+            )
+            typer.echo(f"Defined in: {result['defined_in']}")
+            typer.echo(f"Type: {result['type']}")
+
+            if result["callers"]:
+                typer.secho(
+                    f"\n📞 Callers ({len(result['callers'])}):", fg=typer.colors.YELLOW
+                )
+                for caller in result["callers"]:
+                    typer.echo(f"  - {caller}")
+
+            if result["affected_files"]:
+                typer.secho(
+                    f"\n📄 Affected Files ({len(result['affected_files'])}):",
+                    fg=typer.colors.YELLOW,
+                )
+                for file in result["affected_files"]:
+                    typer.echo(f"  - {file}")
+
+            if result["related_tasks"]:
+                typer.secho(
+                    f"\n📋 Related Tasks ({len(result['related_tasks'])}):",
+                    fg=typer.colors.YELLOW,
+                )
+                for task_id in result["related_tasks"]:
+                    typer.echo(f"  - Task #{task_id}")
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to analyze impact: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("test-coverage")
+def graph_test_coverage(
+    ctx: typer.Context,
+    target: str = typer.Argument(..., help="File path or symbol name"),
+    target_type: str = typer.Option(
+        "file", "--type", help="Target type: file or symbol"
+    ),
+):
+    """Find test files that cover a given file or symbol."""
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.queries import query_test_coverage
+
+        db = get_database()
+        result = query_test_coverage(db, target, target_type)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            typer.secho(
+                f"\n🧪 Test Coverage: {target} ({target_type})\n",
+                fg=typer.colors.BRIGHT_BLUE,
+                bold=True,
+            )
+
+            if result["test_files"]:
+                typer.secho(
+                    f"Test Files ({len(result['test_files'])}):", fg=typer.colors.GREEN
+                )
+                for test_file in result["test_files"]:
+                    typer.echo(f"  - {test_file}")
+            else:
+                typer.secho("No test files found", fg=typer.colors.YELLOW)
+
+            if result["test_functions"]:
+                typer.secho(
+                    f"\nTest Functions ({len(result['test_functions'])}):",
+                    fg=typer.colors.GREEN,
+                )
+                for test_func in result["test_functions"]:
+                    typer.echo(f"  - {test_func}")
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(
+            f"Failed to check test coverage: {e}", fg=typer.colors.RED, err=True
+        )
+        raise typer.Exit(1)
+
+
+@graph_app.command("history")
+def graph_change_history(
+    ctx: typer.Context,
+    symbol_name: str = typer.Argument(..., help="Symbol name to trace"),
+):
+    """Get all commits that touched a specific symbol."""
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.queries import query_change_history
+
+        db = get_database()
+        commits = query_change_history(db, symbol_name)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(
+                json.dumps({"symbol": symbol_name, "commits": commits}, indent=2)
+            )
+        else:
+            typer.secho(
+                f"\n📜 Change History: {symbol_name}\n",
+                fg=typer.colors.BRIGHT_BLUE,
+                bold=True,
+            )
+
+            if not commits:
+                typer.secho("No commits found for this symbol", fg=typer.colors.YELLOW)
+            else:
+                for commit in commits:
+                    typer.secho(f"{commit['hash']}", fg=typer.colors.GREEN, bold=True)
+                    typer.echo(f"  Author: {commit['author']}")
+                    typer.echo(f"  Date: {commit['timestamp']}")
+                    typer.echo(f"  File: {commit['file']}")
+                    typer.echo(f"  Message: {commit['message'][:60]}...")
+                    typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to get change history: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("dependencies")
+def graph_dependency_chain(
+    ctx: typer.Context,
+    file_path: str = typer.Argument(..., help="File path to analyze"),
+    max_depth: int = typer.Option(5, "--max-depth", help="Maximum traversal depth"),
+):
+    """Find transitive dependency chain for a file."""
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.queries import query_dependency_chain
+
+        db = get_database()
+        result = query_dependency_chain(db, file_path, max_depth)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            typer.secho(
+                f"\n🔗 Dependency Chain: {file_path}\n",
+                fg=typer.colors.BRIGHT_BLUE,
+                bold=True,
+            )
+            typer.echo(f"Total dependencies: {result['total_dependencies']}")
+
+            if result["dependencies"]:
+                typer.secho("\nDependencies (by distance):", fg=typer.colors.GREEN)
+                for dep in result["dependencies"]:
+                    typer.echo(f"  [{dep['distance']} hops] {dep['file']}")
+            else:
+                typer.secho("\nNo dependencies found", fg=typer.colors.YELLOW)
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(
+            f"Failed to get dependency chain: {e}", fg=typer.colors.RED, err=True
+        )
+        raise typer.Exit(1)
+
+
+@graph_app.command("orphans")
+def graph_orphan_detection(ctx: typer.Context):
+    """Find orphaned/unused code - functions with no callers, files with no imports."""
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.queries import query_orphan_detection
+
+        db = get_database()
+        result = query_orphan_detection(db)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            typer.secho(
+                "\n🗑️  Orphan Detection\n", fg=typer.colors.BRIGHT_BLUE, bold=True
+            )
+
+            typer.secho(
+                f"Unused Symbols: {result['unused_symbol_count']}",
+                fg=typer.colors.YELLOW,
+                bold=True,
+            )
+            if result["unused_symbols"]:
+                for symbol in result["unused_symbols"][:20]:  # Show first 20
+                    typer.echo(
+                        f"  - {symbol['name']} ({symbol['type']}) in {symbol['file']}:{symbol['line']}"
+                    )
+                if result["unused_symbol_count"] > 20:
+                    typer.echo(f"  ... and {result['unused_symbol_count'] - 20} more")
+
+            typer.echo()
+            typer.secho(
+                f"Unreferenced Files: {result['unreferenced_file_count']}",
+                fg=typer.colors.YELLOW,
+                bold=True,
+            )
+            if result["unreferenced_files"]:
+                for file in result["unreferenced_files"][:20]:  # Show first 20
+                    typer.echo(f"  - {file['file']} ({file['lines']} lines)")
+                if result["unreferenced_file_count"] > 20:
+                    typer.echo(
+                        f"  ... and {result['unreferenced_file_count'] - 20} more"
+                    )
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to detect orphans: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("callers")
+def graph_symbol_callers(
+    ctx: typer.Context,
+    symbol_name: str = typer.Argument(..., help="Symbol to find callers for"),
+):
+    """Find all symbols that call a given symbol (reverse lookup)."""
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.queries import query_symbol_callers
+
+        db = get_database()
+        result = query_symbol_callers(db, symbol_name)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            typer.secho(
+                f"\n📞 Callers of: {symbol_name}\n",
+                fg=typer.colors.BRIGHT_BLUE,
+                bold=True,
+            )
+            typer.echo(f"Total callers: {result['caller_count']}")
+
+            if result["callers"]:
+                typer.secho("\nCaller Functions:", fg=typer.colors.GREEN)
+                for caller in result["callers"]:
+                    typer.echo(
+                        f"  - {caller['name']} ({caller['type']}) in {caller['file']}:{caller['line']}"
+                    )
+            else:
+                typer.secho("\nNo callers found", fg=typer.colors.YELLOW)
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to find callers: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("timeline")
+def graph_file_timeline(
+    ctx: typer.Context,
+    file_path: str = typer.Argument(..., help="File to trace"),
+    limit: int = typer.Option(20, "--limit", help="Max commits to return"),
+):
+    """Get evolution of a file over time via commits."""
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.queries import query_file_timeline
+
+        db = get_database()
+        result = query_file_timeline(db, file_path, limit)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            typer.secho(
+                f"\n📅 Timeline: {file_path}\n", fg=typer.colors.BRIGHT_BLUE, bold=True
+            )
+            typer.echo(f"Total commits: {result['commit_count']}")
+
+            if result["commits"]:
+                typer.secho("\nRecent Commits:", fg=typer.colors.GREEN)
+                for commit in result["commits"]:
+                    typer.secho(f"{commit['hash']}", fg=typer.colors.CYAN, bold=True)
+                    typer.echo(f"  Author: {commit['author']}")
+                    typer.echo(f"  Date: {commit['timestamp']}")
+                    typer.echo(f"  Message: {commit['message'][:60]}...")
+                    typer.echo()
+            else:
+                typer.secho("\nNo commits found for this file", fg=typer.colors.YELLOW)
+
+    except Exception as e:
+        typer.secho(f"Failed to get file timeline: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("task-coverage")
+def graph_task_coverage(ctx: typer.Context):
+    """Find tasks with no associated commits (not yet implemented)."""
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.queries import query_task_coverage
+
+        db = get_database()
+        result = query_task_coverage(db)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            typer.secho(
+                "\n📊 Task Coverage Analysis\n", fg=typer.colors.BRIGHT_BLUE, bold=True
+            )
+            typer.echo(f"Tasks with commits: {result['tasks_with_commits_count']}")
+            typer.echo(
+                f"Tasks without commits: {result['tasks_without_commits_count']}"
+            )
+            typer.echo(f"Coverage: {result['coverage_percentage']:.1f}%")
+
+            if result["tasks_without_commits"]:
+                typer.secho(
+                    f"\nTasks Without Commits ({len(result['tasks_without_commits'])}):",
+                    fg=typer.colors.YELLOW,
+                )
+                for task in result["tasks_without_commits"][:20]:  # Show first 20
+                    priority = task["priority"] or "none"
+                    typer.echo(
+                        f"  - #{task['id']}: {task['title']} (priority: {priority}, state: {task['state']})"
+                    )
+                if result["tasks_without_commits_count"] > 20:
+                    typer.echo(
+                        f"  ... and {result['tasks_without_commits_count'] - 20} more"
+                    )
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(
+            f"Failed to check task coverage: {e}", fg=typer.colors.RED, err=True
+        )
+        raise typer.Exit(1)
+
+
+@graph_app.command("visualize")
+def graph_visualize_export(
+    ctx: typer.Context,
+    output: Path = typer.Argument(
+        ..., help="Output file path (.graphml, .dot, or .json)"
+    ),
+    node_types: Optional[str] = typer.Option(
+        None, help="Comma-separated node types (e.g., 'Task,File,Symbol')"
+    ),
+    relationship_types: Optional[str] = typer.Option(
+        None, help="Comma-separated relationship types"
+    ),
+    max_nodes: int = typer.Option(1000, help="Maximum nodes to export"),
+    format: str = typer.Option(
+        None, help="Format: graphml, dot, json (auto-detected from extension)"
+    ),
+    d3: bool = typer.Option(False, help="Export in D3.js format (for JSON only)"),
+    layout: str = typer.Option(
+        "dot", help="Graphviz layout: dot, neato, fdp, circo, twopi"
+    ),
+):
+    """Export knowledge graph to visualization format.
+
+    Formats:
+    - GraphML (.graphml): For Gephi, Cytoscape, yEd
+    - DOT (.dot): For Graphviz (render with: dot -Tpng output.dot -o output.png)
+    - JSON (.json): For custom visualization or D3.js
+
+    Examples:
+      idlergear graph visualize graph.graphml --node-types "Task,File"
+      idlergear graph visualize graph.dot --max-nodes 100 --layout neato
+      idlergear graph visualize graph.json --d3
+    """
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.visualize import GraphVisualizer
+
+        # Parse node/relationship types
+        node_list = node_types.split(",") if node_types else None
+        rel_list = relationship_types.split(",") if relationship_types else None
+
+        # Auto-detect format from extension
+        if format is None:
+            suffix = output.suffix.lower()
+            if suffix == ".graphml":
+                format = "graphml"
+            elif suffix == ".dot":
+                format = "dot"
+            elif suffix == ".json":
+                format = "json"
+            else:
+                typer.secho(
+                    "Unknown file extension. Please specify --format",
+                    fg=typer.colors.RED,
+                    err=True,
+                )
+                raise typer.Exit(1)
+
+        db = get_database()
+        viz = GraphVisualizer(db)
+
+        # Export based on format
+        if format == "graphml":
+            result = viz.export_graphml(output, node_list, rel_list, max_nodes)
+        elif format == "dot":
+            result = viz.export_dot(output, node_list, rel_list, max_nodes, layout)
+        elif format == "json":
+            json_format = "d3" if d3 else "raw"
+            result = viz.export_json(
+                output, node_list, rel_list, max_nodes, json_format
+            )
+        else:
+            typer.secho(f"Unknown format: {format}", fg=typer.colors.RED, err=True)
+            raise typer.Exit(1)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            typer.secho("\n✅ Graph exported successfully!", fg=typer.colors.GREEN)
+            typer.echo(f"Format: {format}")
+            typer.echo(f"Nodes: {result['nodes']}")
+            typer.echo(f"Edges: {result['edges']}")
+            typer.echo(f"Output: {result['output']}")
+
+            if "render_command" in result:
+                typer.secho("\n💡 Render with:", fg=typer.colors.CYAN)
+                typer.echo(f"  {result['render_command']}")
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to export graph: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("visualize-task")
+def graph_visualize_task(
+    ctx: typer.Context,
+    task_id: int = typer.Argument(..., help="Task ID to visualize"),
+    output: Path = typer.Argument(..., help="Output file path"),
+    depth: int = typer.Option(2, help="Relationship depth (1=direct, 2=2nd degree)"),
+    format: str = typer.Option("dot", help="Format: graphml, dot, json"),
+):
+    """Visualize task and its connected nodes (commits, files, symbols).
+
+    Shows the task's implementation network:
+    - Files modified by the task
+    - Commits implementing the task
+    - Symbols changed
+
+    Example:
+      idlergear graph visualize-task 337 task_337.dot --depth 2
+      dot -Tpng task_337.dot -o task_337.png
+    """
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.visualize import GraphVisualizer
+
+        db = get_database()
+        viz = GraphVisualizer(db)
+
+        result = viz.visualize_task_network(task_id, output, depth, format)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            typer.secho("\n✅ Task network exported!", fg=typer.colors.GREEN)
+            typer.echo(f"Task: #{task_id}")
+            typer.echo(f"Nodes: {result['nodes']}")
+            typer.echo(f"Edges: {result['edges']}")
+            typer.echo(f"Output: {result['output']}")
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Failed to visualize task: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@graph_app.command("visualize-deps")
+def graph_visualize_deps(
+    ctx: typer.Context,
+    file_path: str = typer.Argument(..., help="File path to analyze"),
+    output: Path = typer.Argument(..., help="Output file path"),
+    depth: int = typer.Option(2, help="Import depth (how many hops to follow)"),
+    format: str = typer.Option("dot", help="Format: graphml, dot, json"),
+):
+    """Visualize file dependencies (imports, calls).
+
+    Shows the dependency network:
+    - Files imported by this file
+    - Files that import this file
+    - Transitive dependencies
+
+    Example:
+      idlergear graph visualize-deps src/main.py deps.dot --depth 3
+      dot -Tpng deps.dot -o deps.png
+    """
+    try:
+        from idlergear.graph.database import get_database
+        from idlergear.graph.visualize import GraphVisualizer
+
+        db = get_database()
+        viz = GraphVisualizer(db)
+
+        result = viz.visualize_dependency_graph(file_path, output, depth, format)
+
+        if ctx.obj.get("output_mode") == "json":
+            typer.echo(json.dumps(result, indent=2))
+        else:
+            typer.secho("\n✅ Dependency graph exported!", fg=typer.colors.GREEN)
+            typer.echo(f"File: {file_path}")
+            typer.echo(f"Nodes: {result['nodes']}")
+            typer.echo(f"Edges: {result['edges']}")
+            typer.echo(f"Output: {result['output']}")
+            typer.echo()
+
+    except Exception as e:
+        typer.secho(
+            f"Failed to visualize dependencies: {e}", fg=typer.colors.RED, err=True
+        )
+        raise typer.Exit(1)
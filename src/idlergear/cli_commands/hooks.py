@@ -0,0 +1,131 @@
+"""`idlergear hooks` commands."""
+
+import typer
+
+hooks_app = typer.Typer(help="Manage Claude Code hooks for IdlerGear enforcement")
+
+
+@hooks_app.command("install")
+def hooks_install(
+    force: bool = typer.Option(False, "--force", "-f", help="Overwrite existing hooks"),
+):
+    """Install Claude Code hooks for automatic IdlerGear enforcement.
+
+    Installs three hooks:
+    - SessionStart: Auto-load project context (100% compliance)
+    - PreToolUse: Block forbidden files like TODO.md (0% violations)
+    - Stop: Prompt for knowledge capture before ending
+
+    Examples:
+        idlergear hooks install           # Install hooks (skip existing)
+        idlergear hooks install --force  # Overwrite existing hooks
+    """
+    from idlergear.hooks import install_hooks
+
+    results = install_hooks(force=force)
+
+    typer.echo("Installing Claude Code hooks...")
+    typer.echo()
+
+    for filename, installed in results.items():
+        if installed:
+            typer.secho(f"✓ Installed {filename}", fg=typer.colors.GREEN)
+        else:
+            typer.secho(
+                f"- Skipped {filename} (already exists)", fg=typer.colors.YELLOW
+            )
+
+    typer.echo()
+    typer.echo("Hooks installed in .claude/hooks/")
+    typer.echo()
+    typer.echo("Next steps:")
+    typer.echo("  1. Test hooks: idlergear hooks test")
+    typer.echo("  2. Restart Claude Code to activate")
+    typer.echo()
+    typer.echo("See docs/CLAUDE_CODE_HOOKS.md for details")
+
+
+@hooks_app.command("test")
+def hooks_test():
+    """Test installed hooks."""
+    from idlergear.hooks import test_hooks
+
+    typer.echo("Testing Claude Code hooks...")
+    typer.echo()
+
+    results = test_hooks()
+
+    all_passed = True
+
+    for hook_name, result in results.items():
+        if not result.get("exists"):
+            typer.secho(f"✗ {hook_name}: NOT INSTALLED", fg=typer.colors.RED)
+            all_passed = False
+            continue
+
+        if not result.get("executable"):
+            typer.secho(f"✗ {hook_name}: Not executable", fg=typer.colors.RED)
+            all_passed = False
+            continue
+
+        # Hook-specific tests
+        if hook_name == "session-start":
+            if result.get("exit_code") == 0 and result.get("output_length", 0) > 0:
+                typer.secho(f"✓ {hook_name}: PASSED", fg=typer.colors.GREEN)
+            else:
+                typer.secho(f"✗ {hook_name}: No output", fg=typer.colors.RED)
+                all_passed = False
+
+        elif hook_name == "pre-tool-use":
+            if result.get("blocks_forbidden"):
+                typer.secho(
+                    f"✓ {hook_name}: PASSED (blocks TODO.md)", fg=typer.colors.GREEN
+                )
+            else:
+                typer.secho(
+                    f"✗ {hook_name}: Does not block forbidden files",
+                    fg=typer.colors.RED,
+                )
+                all_passed = False
+
+        elif hook_name == "stop":
+            if result.get("valid_json"):
+                typer.secho(f"✓ {hook_name}: PASSED", fg=typer.colors.GREEN)
+            else:
+                typer.secho(f"✗ {hook_name}: Invalid output", fg=typer.colors.RED)
+                all_passed = False
+
+    typer.echo()
+    if all_passed:
+        typer.secho("All hooks passed!", fg=typer.colors.GREEN, bold=True)
+    else:
+        typer.secho(
+            "Some hooks failed. See docs/CLAUDE_CODE_HOOKS.md for troubleshooting.",
+            fg=typer.colors.YELLOW,
+        )
+
+
+@hooks_app.command("list")
+def hooks_list():
+    """List installed hooks."""
+    from idlergear.hooks import list_hooks
+    from datetime import datetime
+
+    hooks = list_hooks()
+
+    if not hooks:
+        typer.echo("No hooks installed.")
+        typer.echo()
+        typer.echo("Install hooks: idlergear hooks install")
+        return
+
+    typer.echo("Installed hooks:")
+    typer.echo()
+
+    for hook in hooks:
+        executable = "✓" if hook["executable"] else "✗"
+        modified = datetime.fromtimestamp(hook["modified"]).strftime("%Y-%m-%d %H:%M")
+        typer.echo(f"{executable} {hook['name']:<20} {hook['size']:>6}B  {modified}")
+
+    typer.echo()
+    typer.echo("Location: .claude/hooks/")
@@ -0,0 +1,430 @@
+"""`idlergear knowledge` commands."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+knowledge_app = typer.Typer(help="Knowledge decay and relevance management")
+
+
+# ============================================================================
+# Knowledge Management Commands
+# ============================================================================
+
+
+@knowledge_app.command("decay")
+def knowledge_decay(
+    recalculate: bool = typer.Option(
+        False, "--recalculate", help="Recalculate all relevance scores"
+    ),
+    project_path: Optional[Path] = typer.Option(None, "--project", help="Project path"),
+):
+    """Show knowledge decay statistics and optionally recalculate relevance scores."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+    from idlergear.relevance import (
+        decay_sweep,
+        get_relevance_stats,
+        recalculate_all_relevance,
+    )
+
+    if project_path is None:
+        project_path = find_idlergear_root()
+
+    if project_path is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        if recalculate:
+            # Write current scores back to the task and note files
+            typer.echo("Recalculating relevance scores...")
+            result = decay_sweep(project_path, write=True)
+            typer.secho(
+                f"✅ Recalculated {result['count']} items ({result['updated']} files updated)",
+                fg=typer.colors.GREEN,
+            )
+
+        # Get all items
+        task_backend = get_backend("task", project_path=project_path)
+        note_backend = get_backend("note", project_path=project_path)
+
+        tasks = task_backend.list(state="all")
+        notes = note_backend.list()
+
+        all_items = recalculate_all_relevance(tasks + notes)
+
+        # Show statistics
+        stats = get_relevance_stats(all_items)
+        typer.echo("\n## Knowledge Decay Statistics")
+        typer.echo(f"Total items: {stats['count']}")
+        typer.echo(f"Average relevance: {stats['avg']:.3f}")
+        typer.echo(f"Min relevance: {stats['min']:.3f}")
+        typer.echo(f"Max relevance: {stats['max']:.3f}")
+        typer.echo(f"Stale items (< 0.2): {stats['stale_count']}")
+
+    except Exception as e:
+        typer.secho(f"Failed to calculate decay: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@knowledge_app.command("stale")
+def knowledge_stale(
+    threshold: float = typer.Option(
+        0.2, "--threshold", help="Stale relevance threshold"
+    ),
+    project_path: Optional[Path] = typer.Option(None, "--project", help="Project path"),
+):
+    """Show stale knowledge items (low relevance)."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+    from idlergear.relevance import identify_stale_items
+
+    if project_path is None:
+        project_path = find_idlergear_root()
+
+    if project_path is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        # Get all items
+        task_backend = get_backend("task", project_path=project_path)
+        note_backend = get_backend("note", project_path=project_path)
+
+        tasks = task_backend.list(state="all")
+        notes = note_backend.list()
+
+        all_items = tasks + notes
+
+        # Identify stale items
+        stale_items = identify_stale_items(all_items, stale_threshold=threshold)
+
+        typer.echo(f"\n## Stale Items (relevance < {threshold})")
+        typer.echo(f"Found {len(stale_items)} stale items:\n")
+
+        for item in stale_items:
+            item_type = "Task" if "state" in item else "Note"
+            item_id = item.get("id", "?")
+            title = item.get("title") or item.get("content", "")[:50]
+            relevance = item.get("relevance_score", 0.0)
+            typer.echo(
+                f"- {item_type} #{item_id}: {title} [relevance: {relevance:.3f}]"
+            )
+
+        if not stale_items:
+            typer.secho("✅ No stale items found!", fg=typer.colors.GREEN)
+
+    except Exception as e:
+        typer.secho(f"Failed to find stale items: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@knowledge_app.command("prune")
+def knowledge_prune(
+    threshold: float = typer.Option(
+        0.1, "--threshold", help="Prune items below this relevance"
+    ),
+    archive: bool = typer.Option(False, "--archive", help="Archive instead of delete"),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show what would be pruned without doing it"
+    ),
+    project_path: Optional[Path] = typer.Option(None, "--project", help="Project path"),
+):
+    """Archive or delete stale knowledge items."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+    from idlergear.relevance import identify_stale_items
+
+    if project_path is None:
+        project_path = find_idlergear_root()
+
+    if project_path is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        # Get all items
+        task_backend = get_backend("task", project_path=project_path)
+        note_backend = get_backend("note", project_path=project_path)
+
+        tasks = task_backend.list(state="all")
+        notes = note_backend.list()
+
+        all_items = tasks + notes
+
+        # Identify stale items
+        stale_items = identify_stale_items(all_items, stale_threshold=threshold)
+
+        if not stale_items:
+            typer.secho("✅ No items to prune!", fg=typer.colors.GREEN)
+            return
+
+        typer.echo(
+            f"\n## Items to {'archive' if archive else 'delete'} (relevance < {threshold})"
+        )
+        typer.echo(f"Found {len(stale_items)} items:\n")
+
+        for item in stale_items:
+            item_type = "Task" if "state" in item else "Note"
+            item_id = item.get("id", "?")
+            title = item.get("title") or item.get("content", "")[:50]
+            relevance = item.get("relevance_score", 0.0)
+            typer.echo(
+                f"- {item_type} #{item_id}: {title} [relevance: {relevance:.3f}]"
+            )
+
+        if dry_run:
+            typer.echo("\n[Dry run - no changes made]")
+            return
+
+        # Confirm before pruning
+        if not typer.confirm(
+            f"\n{'Archive' if archive else 'Delete'} these {len(stale_items)} items?"
+        ):
+            typer.echo("Cancelled.")
+            return
+
+        # Prune items
+        pruned_count = 0
+        for item in stale_items:
+            item_id = item.get("id")
+            is_task = "state" in item
+
+            try:
+                if is_task:
+                    if archive:
+                        # Close the task as archived
+                        task_backend.update(task_id=item_id, state="closed")
+                    else:
+                        # For now, just close tasks (delete not implemented)
+                        task_backend.update(task_id=item_id, state="closed")
+                else:
+                    if archive:
+                        # For notes, we just leave them (archive not implemented)
+                        pass
+                    else:
+                        # Delete note
+                        note_backend.delete(note_id=item_id)
+
+                pruned_count += 1
+            except Exception as e:
+                typer.secho(
+                    f"Failed to prune item #{item_id}: {e}", fg=typer.colors.RED
+                )
+
+        action = "archived" if archive else "deleted"
+        typer.secho(
+            f"\n✅ {action.capitalize()} {pruned_count} items", fg=typer.colors.GREEN
+        )
+
+    except Exception as e:
+        typer.secho(f"Failed to prune items: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@knowledge_app.command("gaps")
+def knowledge_gaps(
+    gap_type: Optional[str] = typer.Option(
+        None, "--type", help="Filter by gap type (missing_reference, stale_task, etc.)"
+    ),
+    fix: bool = typer.Option(False, "--fix", help="Auto-fix simple gaps"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+    project_path: Optional[Path] = typer.Option(None, "--project", help="Project path"),
+):
+    """Detect knowledge gaps and suggest improvements."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.gap_detector import GapDetector, GapType, GapSeverity
+
+    if project_path is None:
+        project_path = find_idlergear_root()
+
+    if project_path is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        detector = GapDetector(project_root=project_path)
+
+        # Parse gap type filter
+        gap_types = None
+        if gap_type:
+            try:
+                gap_types = [GapType(gap_type)]
+            except ValueError:
+                typer.secho(
+                    f"Unknown gap type: {gap_type}",
+                    fg=typer.colors.RED,
+                )
+                typer.secho(
+                    f"Available types: {', '.join(t.value for t in GapType)}",
+                    fg=typer.colors.YELLOW,
+                )
+                raise typer.Exit(1)
+
+        # Detect gaps
+        gaps = detector.detect_gaps(gap_types=gap_types)
+
+        if json_output:
+            # JSON output
+            output = {
+                "total_gaps": len(gaps),
+                "by_severity": {
+                    "critical": len(
+                        [g for g in gaps if g.severity == GapSeverity.CRITICAL]
+                    ),
+                    "high": len([g for g in gaps if g.severity == GapSeverity.HIGH]),
+                    "medium": len(
+                        [g for g in gaps if g.severity == GapSeverity.MEDIUM]
+                    ),
+                    "low": len([g for g in gaps if g.severity == GapSeverity.LOW]),
+                    "info": len([g for g in gaps if g.severity == GapSeverity.INFO]),
+                },
+                "gaps": [g.to_dict() for g in gaps],
+            }
+            typer.echo(json.dumps(output, indent=2))
+            return
+
+        # Human-readable output
+        if not gaps:
+            typer.secho("💚 No knowledge gaps detected!", fg=typer.colors.GREEN)
+            typer.echo("\nYour project knowledge base looks healthy:")
+            typer.echo("  ✓ References exist for high-activity topics")
+            typer.echo("  ✓ Recent commits are documented")
+            typer.echo("  ✓ Questions have been answered")
+            typer.echo("  ✓ Tasks are organized and up-to-date")
+            return
+
+        typer.secho("\n📊 Knowledge Gap Analysis\n", bold=True)
+
+        # Group by severity
+        by_severity = {
+            GapSeverity.CRITICAL: [],
+            GapSeverity.HIGH: [],
+            GapSeverity.MEDIUM: [],
+            GapSeverity.LOW: [],
+            GapSeverity.INFO: [],
+        }
+
+        for gap in gaps:
+            by_severity[gap.severity].append(gap)
+
+        # Display by severity
+        if by_severity[GapSeverity.CRITICAL]:
+            typer.secho(
+                f"🔴 CRITICAL ({len(by_severity[GapSeverity.CRITICAL])} gaps)",
+                fg=typer.colors.RED,
+                bold=True,
+            )
+            for gap in by_severity[GapSeverity.CRITICAL]:
+                typer.echo(f"  • {gap.message}")
+                typer.secho(f"    → {gap.suggestion}", fg=typer.colors.CYAN)
+                typer.echo()
+
+        if by_severity[GapSeverity.HIGH]:
+            typer.secho(
+                f"🟠 HIGH PRIORITY ({len(by_severity[GapSeverity.HIGH])} gaps)",
+                fg=typer.colors.YELLOW,
+                bold=True,
+            )
+            for gap in by_severity[GapSeverity.HIGH]:
+                typer.echo(f"  • {gap.message}")
+                typer.secho(f"    → {gap.suggestion}", fg=typer.colors.CYAN)
+                if fix and gap.fixable:
+                    typer.secho(
+                        f"    [Auto-fixable: {gap.fix_command}]", fg=typer.colors.GREEN
+                    )
+                typer.echo()
+
+        if by_severity[GapSeverity.MEDIUM]:
+            typer.secho(
+                f"🟡 MEDIUM PRIORITY ({len(by_severity[GapSeverity.MEDIUM])} gaps)",
+                fg=typer.colors.YELLOW,
+            )
+            for gap in by_severity[GapSeverity.MEDIUM]:
+                typer.echo(f"  • {gap.message}")
+                typer.secho(f"    → {gap.suggestion}", fg=typer.colors.CYAN)
+                if fix and gap.fixable:
+                    typer.secho(
+                        f"    [Auto-fixable: {gap.fix_command}]", fg=typer.colors.GREEN
+                    )
+                typer.echo()
+
+        if by_severity[GapSeverity.LOW]:
+            typer.secho(
+                f"🔵 LOW PRIORITY ({len(by_severity[GapSeverity.LOW])} gaps)",
+                fg=typer.colors.BLUE,
+            )
+            for gap in by_severity[GapSeverity.LOW]:
+                typer.echo(f"  • {gap.message}")
+                typer.secho(f"    → {gap.suggestion}", dim=True)
+
+        if by_severity[GapSeverity.INFO]:
+            typer.secho(
+                f"ℹ️  INFO ({len(by_severity[GapSeverity.INFO])} items)",
+                fg=typer.colors.CYAN,
+            )
+            for gap in by_severity[GapSeverity.INFO]:
+                typer.echo(f"  • {gap.message}")
+
+        # Summary
+        typer.echo()
+        fixable_count = len([g for g in gaps if g.fixable])
+        if fix:
+            # Auto-fix gaps
+            if fixable_count > 0:
+                typer.echo(f"\n🔧 Auto-fixing {fixable_count} gaps...")
+                fixed = 0
+                for gap in gaps:
+                    if gap.fixable and gap.fix_command:
+                        try:
+                            import subprocess
+
+                            result = subprocess.run(
+                                gap.fix_command.split(),
+                                capture_output=True,
+                                text=True,
+                            )
+                            if result.returncode == 0:
+                                typer.secho(
+                                    f"  ✓ Fixed: {gap.message}", fg=typer.colors.GREEN
+                                )
+                                fixed += 1
+                            else:
+                                typer.secho(
+                                    f"  ✗ Failed: {gap.message}", fg=typer.colors.RED
+                                )
+                        except Exception as e:
+                            typer.secho(
+                                f"  ✗ Error fixing {gap.message}: {e}",
+                                fg=typer.colors.RED,
+                            )
+
+                typer.secho(
+                    f"\n✅ Fixed {fixed}/{fixable_count} gaps", fg=typer.colors.GREEN
+                )
+            else:
+                typer.echo("No auto-fixable gaps found.")
+        elif fixable_count > 0:
+            typer.secho(
+                f"\n💡 Tip: Run with --fix to automatically fix {fixable_count} gaps",
+                fg=typer.colors.CYAN,
+            )
+
+    except Exception as e:
+        typer.secho(f"Failed to detect gaps: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
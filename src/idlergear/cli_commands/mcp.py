@@ -0,0 +1,425 @@
+"""`idlergear mcp` commands."""
+
+import json
+from typing import Optional
+
+import typer
+
+from idlergear import __version__
+
+mcp_app = typer.Typer(help="MCP server management")
+
+
+# MCP server commands
+@mcp_app.command("reload")
+def mcp_reload():
+    """Reload the MCP server to pick up code changes.
+
+    Sends SIGUSR1 to the running MCP server process, causing it to
+    re-execute itself with the latest code. This is useful after
+    updating IdlerGear (e.g., git pull, pip install) without needing
+    to restart Claude Code.
+
+    The reload is transparent to Claude Code - the stdin/stdout
+    connection is preserved across the reload.
+    """
+    import glob
+    import os
+    import signal
+
+    # Find running MCP server by PID file
+    pid_files = glob.glob("/tmp/idlergear-mcp-*.pid")
+
+    if not pid_files:
+        typer.secho("No running MCP server found.", fg=typer.colors.YELLOW)
+        typer.echo(
+            "The MCP server may not be running, or was started without PID tracking."
+        )
+        raise typer.Exit(1)
+
+    reloaded = 0
+    for pid_file in pid_files:
+        try:
+            pid = int(open(pid_file).read().strip())
+
+            # Check if process exists
+            os.kill(pid, 0)  # Signal 0 just checks existence
+
+            # Send reload signal
+            os.kill(pid, signal.SIGUSR1)
+            typer.secho(
+                f"Sent reload signal to MCP server (PID {pid})", fg=typer.colors.GREEN
+            )
+            reloaded += 1
+
+        except (ValueError, FileNotFoundError):
+            # Invalid or missing PID file
+            try:
+                os.unlink(pid_file)
+            except Exception:
+                pass
+        except ProcessLookupError:
+            # Process doesn't exist, clean up stale PID file
+            try:
+                os.unlink(pid_file)
+            except Exception:
+                pass
+            typer.secho(
+                f"Cleaned up stale PID file: {pid_file}", fg=typer.colors.YELLOW
+            )
+        except PermissionError:
+            typer.secho(
+                f"Permission denied sending signal to PID from {pid_file}",
+                fg=typer.colors.RED,
+            )
+
+    if reloaded == 0:
+        typer.secho("No active MCP servers found to reload.", fg=typer.colors.YELLOW)
+        raise typer.Exit(1)
+    else:
+        typer.echo(
+            f"\nReloaded {reloaded} MCP server(s). New code will be active for next tool call."
+        )
+
+
+@mcp_app.command("status")
+def mcp_status():
+    """Show status of running MCP servers."""
+    import glob
+    import os
+
+    from idlergear.mcp_server import __version__
+
+    pid_files = glob.glob("/tmp/idlergear-mcp-*.pid")
+
+    if not pid_files:
+        typer.secho("No running MCP servers found.", fg=typer.colors.YELLOW)
+        typer.echo(
+            "The MCP server may not be running, or was started without PID tracking."
+        )
+        return
+
+    typer.echo(f"IdlerGear MCP Server version: {__version__}")
+    typer.echo("")
+
+    active = 0
+    for pid_file in pid_files:
+        try:
+            pid = int(open(pid_file).read().strip())
+
+            # Check if process exists
+            os.kill(pid, 0)
+
+            typer.secho(f"  PID {pid}: running", fg=typer.colors.GREEN)
+            active += 1
+
+        except (ValueError, FileNotFoundError):
+            pass
+        except ProcessLookupError:
+            # Stale PID file
+            try:
+                os.unlink(pid_file)
+            except Exception:
+                pass
+
+    if active == 0:
+        typer.secho("No active MCP servers.", fg=typer.colors.YELLOW)
+    else:
+        typer.echo(f"\n{active} active MCP server(s)")
+
+
+@mcp_app.command("generate")
+def mcp_generate(
+    ctx: typer.Context,
+    global_config: bool = typer.Option(
+        False,
+        "--global",
+        "-g",
+        help="Generate global Claude Code config instead of project-level",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would be generated without writing"
+    ),
+    include_idlergear: bool = typer.Option(
+        True, "--idlergear/--no-idlergear", help="Include IdlerGear MCP server"
+    ),
+):
+    """Generate MCP configuration file.
+
+    Creates .mcp.json for project-level config, or updates Claude Code's
+    global config for --global.
+    """
+
+    from idlergear.mcp_config import (
+        generate_project_mcp_config,
+        get_claude_code_config_path,
+        get_project_mcp_path,
+    )
+
+    if global_config:
+        config_path = get_claude_code_config_path()
+    else:
+        config_path = get_project_mcp_path()
+
+    config = generate_project_mcp_config(include_idlergear=include_idlergear)
+    content = json.dumps(config.to_dict(), indent=2)
+
+    if dry_run:
+        typer.echo(f"Would write to {config_path}:")
+        typer.echo(content)
+        return
+
+    if config_path.exists():
+        typer.secho(f"Config already exists: {config_path}", fg=typer.colors.YELLOW)
+        if not typer.confirm("Overwrite?"):
+            raise typer.Exit(0)
+
+    config.save(config_path)
+    typer.secho(f"Generated {config_path}", fg=typer.colors.GREEN)
+
+
+@mcp_app.command("show")
+def mcp_show(
+    ctx: typer.Context,
+    global_config: bool = typer.Option(
+        False, "--global", "-g", help="Show global Claude Code config"
+    ),
+):
+    """Show current MCP configuration."""
+    from idlergear.mcp_config import (
+        get_claude_code_config_path,
+        get_project_mcp_path,
+        load_claude_code_config,
+        load_project_mcp_config,
+    )
+
+    if global_config:
+        config_path = get_claude_code_config_path()
+        config = load_claude_code_config()
+    else:
+        config_path = get_project_mcp_path()
+        config = load_project_mcp_config()
+
+    if config is None:
+        typer.secho(f"No config found at {config_path}", fg=typer.colors.YELLOW)
+        raise typer.Exit(1)
+
+    typer.echo(f"Config: {config_path}")
+    typer.echo("")
+
+    if not config.servers:
+        typer.echo("No MCP servers configured.")
+        return
+
+    for name, server in config.servers.items():
+        typer.secho(f"  {name}:", fg=typer.colors.CYAN, bold=True)
+        typer.echo(f"    command: {server.command}")
+        if server.args:
+            typer.echo(f"    args: {' '.join(server.args)}")
+        if server.env:
+            typer.echo(f"    env: {server.env}")
+        typer.echo(f"    type: {server.type}")
+
+
+@mcp_app.command("check")
+def mcp_check(
+    ctx: typer.Context,
+    global_config: bool = typer.Option(
+        False, "--global", "-g", help="Check global Claude Code config"
+    ),
+):
+    """Validate MCP configuration."""
+    from idlergear.mcp_config import (
+        get_claude_code_config_path,
+        get_project_mcp_path,
+        load_claude_code_config,
+        load_project_mcp_config,
+        validate_mcp_config,
+    )
+
+    if global_config:
+        config_path = get_claude_code_config_path()
+        config = load_claude_code_config()
+    else:
+        config_path = get_project_mcp_path()
+        config = load_project_mcp_config()
+
+    if config is None:
+        typer.secho(f"No config found at {config_path}", fg=typer.colors.YELLOW)
+        raise typer.Exit(1)
+
+    result = validate_mcp_config(config)
+
+    if result.valid and not result.warnings:
+        typer.secho("✓ Configuration is valid", fg=typer.colors.GREEN)
+        return
+
+    if result.issues:
+        typer.secho("Errors:", fg=typer.colors.RED, bold=True)
+        for issue in result.issues:
+            typer.echo(f"  ✗ {issue}")
+
+    if result.warnings:
+        typer.secho("Warnings:", fg=typer.colors.YELLOW, bold=True)
+        for warning in result.warnings:
+            typer.echo(f"  ⚠ {warning}")
+
+    if not result.valid:
+        raise typer.Exit(1)
+
+
+@mcp_app.command("add")
+def mcp_add(
+    ctx: typer.Context,
+    name: str = typer.Argument(..., help="Server name"),
+    command: str = typer.Argument(..., help="Command to run the server"),
+    args: Optional[list[str]] = typer.Option(
+        None, "--arg", "-a", help="Command arguments (can be repeated)"
+    ),
+    server_type: str = typer.Option(
+        "stdio", "--type", "-t", help="Server type (stdio, sse, http)"
+    ),
+    global_config: bool = typer.Option(
+        False, "--global", "-g", help="Add to global Claude Code config"
+    ),
+    overwrite: bool = typer.Option(
+        False, "--overwrite", help="Overwrite if server already exists"
+    ),
+):
+    """Add an MCP server to configuration."""
+    from idlergear.mcp_config import (
+        McpServerConfig,
+        add_server_to_config,
+        get_claude_code_config_path,
+        get_project_mcp_path,
+    )
+
+    if global_config:
+        config_path = get_claude_code_config_path()
+    else:
+        config_path = get_project_mcp_path()
+
+    server = McpServerConfig(
+        name=name,
+        command=command,
+        args=args or [],
+        type=server_type,
+    )
+
+    success, message = add_server_to_config(config_path, server, overwrite=overwrite)
+
+    if success:
+        typer.secho(message, fg=typer.colors.GREEN)
+    else:
+        typer.secho(message, fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@mcp_app.command("remove")
+def mcp_remove(
+    ctx: typer.Context,
+    name: str = typer.Argument(..., help="Server name to remove"),
+    global_config: bool = typer.Option(
+        False, "--global", "-g", help="Remove from global Claude Code config"
+    ),
+):
+    """Remove an MCP server from configuration."""
+    from idlergear.mcp_config import (
+        get_claude_code_config_path,
+        get_project_mcp_path,
+        remove_server_from_config,
+    )
+
+    if global_config:
+        config_path = get_claude_code_config_path()
+    else:
+        config_path = get_project_mcp_path()
+
+    success, message = remove_server_from_config(config_path, name)
+
+    if success:
+        typer.secho(message, fg=typer.colors.GREEN)
+    else:
+        typer.secho(message, fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@mcp_app.command("test")
+def mcp_test_cmd(
+    ctx: typer.Context,
+    server_name: Optional[str] = typer.Argument(
+        None, help="Server name to test (tests all if not specified)"
+    ),
+    global_config: bool = typer.Option(
+        False, "--global", "-g", help="Test servers from global config"
+    ),
+    timeout: float = typer.Option(5.0, "--timeout", help="Timeout in seconds"),
+):
+    """Test MCP server connectivity."""
+    import asyncio
+
+    from idlergear.mcp_config import (
+        get_claude_code_config_path,
+        get_project_mcp_path,
+        load_claude_code_config,
+        load_project_mcp_config,
+        test_mcp_server,
+    )
+
+    if global_config:
+        config_path = get_claude_code_config_path()
+        config = load_claude_code_config()
+    else:
+        config_path = get_project_mcp_path()
+        config = load_project_mcp_config()
+
+    if config is None:
+        typer.secho(f"No config found at {config_path}", fg=typer.colors.YELLOW)
+        raise typer.Exit(1)
+
+    servers_to_test = []
+    if server_name:
+        if server_name not in config.servers:
+            typer.secho(
+                f"Server '{server_name}' not found in config", fg=typer.colors.RED
+            )
+            raise typer.Exit(1)
+        servers_to_test.append(config.servers[server_name])
+    else:
+        servers_to_test = list(config.servers.values())
+
+    if not servers_to_test:
+        typer.echo("No servers to test.")
+        return
+
+    async def run_tests():
+        results = []
+        for server in servers_to_test:
+            typer.echo(f"Testing {server.name}...", nl=False)
+            result = await test_mcp_server(server, timeout=timeout)
+            results.append(result)
+
+            if result.success:
+                typer.secho(
+                    f" OK ({result.response_time_ms:.0f}ms)",
+                    fg=typer.colors.GREEN,
+                )
+                if result.server_info:
+                    info = result.server_info
+                    typer.echo(
+                        f"  Server: {info.get('name', 'unknown')} {info.get('version', '')}"
+                    )
+            else:
+                typer.secho(f" FAILED: {result.error}", fg=typer.colors.RED)
+
+        return results
+
+    results = asyncio.run(run_tests())
+    failed = sum(1 for r in results if not r.success)
+
+    typer.echo("")
+    if failed:
+        typer.secho(f"{failed}/{len(results)} servers failed", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    else:
+        typer.secho(f"All {len(results)} servers OK", fg=typer.colors.GREEN)
@@ -0,0 +1,301 @@
+"""`idlergear milestone` commands."""
+
+import typer
+
+from idlergear.display import display
+
+milestone_app = typer.Typer(help="Milestone management (→ GitHub Milestones)")
+
+
+# Milestone commands
+@milestone_app.command("create")
+def milestone_create(
+    title: str,
+    description: str = typer.Option(
+        None, "--description", "-d", help="Milestone description"
+    ),
+    due_on: str = typer.Option(None, "--due", help="Due date (YYYY-MM-DD)"),
+):
+    """Create a GitHub milestone."""
+    import subprocess
+
+    try:
+        # Build API request
+        data = {"title": title, "state": "open"}
+        if description:
+            data["description"] = description
+        if due_on:
+            data["due_on"] = f"{due_on}T00:00:00Z"
+
+        # Get repo info
+        repo_info = subprocess.run(
+            ["gh", "repo", "view", "--json", "owner,name"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        import json
+
+        repo = json.loads(repo_info.stdout)
+        owner = (
+            repo["owner"]["login"] if isinstance(repo["owner"], dict) else repo["owner"]
+        )
+        name = repo["name"]
+
+        # Create milestone
+        result = subprocess.run(
+            [
+                "gh",
+                "api",
+                f"repos/{owner}/{name}/milestones",
+                "-f",
+                f"title={title}",
+                "-f",
+                "state=open",
+            ]
+            + (["-f", f"description={description}"] if description else [])
+            + (["-f", f"due_on={due_on}T00:00:00Z"] if due_on else []),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        milestone = json.loads(result.stdout)
+        typer.secho(
+            f"Created milestone: {milestone['title']} (#{milestone['number']})",
+            fg=typer.colors.GREEN,
+        )
+
+    except subprocess.CalledProcessError as e:
+        typer.secho(f"Failed to create milestone: {e.stderr}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@milestone_app.command("list")
+def milestone_list(
+    ctx: typer.Context,
+    state: str = typer.Option(
+        "open", "--state", "-s", help="Filter by state: open, closed, all"
+    ),
+):
+    """List GitHub milestones."""
+    import subprocess
+    import json
+
+    try:
+        # Get repo info
+        repo_info = subprocess.run(
+            ["gh", "repo", "view", "--json", "owner,name"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        repo = json.loads(repo_info.stdout)
+        owner = (
+            repo["owner"]["login"] if isinstance(repo["owner"], dict) else repo["owner"]
+        )
+        name = repo["name"]
+
+        # Fetch milestones
+        url = f"repos/{owner}/{name}/milestones"
+        if state in ("open", "closed"):
+            url += f"?state={state}"
+
+        result = subprocess.run(
+            ["gh", "api", url],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        milestones = json.loads(result.stdout)
+
+        # Format for display
+        formatted = []
+        for m in milestones:
+            total = m["open_issues"] + m["closed_issues"]
+            progress = (m["closed_issues"] / total * 100) if total > 0 else 0
+
+            formatted.append(
+                {
+                    "number": m["number"],
+                    "title": m["title"],
+                    "state": m["state"],
+                    "open_issues": m["open_issues"],
+                    "closed_issues": m["closed_issues"],
+                    "progress": f"{progress:.0f}%",
+                    "due_on": m.get("due_on", ""),
+                    "description": m.get("description", ""),
+                }
+            )
+
+        display(formatted, ctx.obj.output_format, "milestones")
+
+    except subprocess.CalledProcessError as e:
+        typer.secho(f"Failed to list milestones: {e.stderr}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@milestone_app.command("show")
+def milestone_show(
+    ctx: typer.Context,
+    milestone: str = typer.Argument(..., help="Milestone number or title"),
+):
+    """Show milestone details."""
+    import subprocess
+    import json
+
+    try:
+        # Get repo info
+        repo_info = subprocess.run(
+            ["gh", "repo", "view", "--json", "owner,name"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        repo = json.loads(repo_info.stdout)
+        owner = (
+            repo["owner"]["login"] if isinstance(repo["owner"], dict) else repo["owner"]
+        )
+        name = repo["name"]
+
+        # Fetch all milestones to find by title if needed
+        result = subprocess.run(
+            ["gh", "api", f"repos/{owner}/{name}/milestones"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        milestones = json.loads(result.stdout)
+
+        # Find milestone by number or title
+        found = None
+        for m in milestones:
+            if str(m["number"]) == milestone or m["title"].lower() == milestone.lower():
+                found = m
+                break
+
+        if not found:
+            typer.secho(f"Milestone '{milestone}' not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+        # Get issues for this milestone
+        issues_result = subprocess.run(
+            [
+                "gh",
+                "issue",
+                "list",
+                "--milestone",
+                found["title"],
+                "--json",
+                "number,title,state",
+                "--limit",
+                "1000",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        issues = json.loads(issues_result.stdout)
+
+        total = found["open_issues"] + found["closed_issues"]
+        progress = (found["closed_issues"] / total * 100) if total > 0 else 0
+
+        # Format for display
+        display_data = {
+            "number": found["number"],
+            "title": found["title"],
+            "state": found["state"],
+            "description": found.get("description", ""),
+            "open_issues": found["open_issues"],
+            "closed_issues": found["closed_issues"],
+            "progress": f"{progress:.0f}%",
+            "due_on": found.get("due_on", ""),
+            "created_at": found.get("created_at", ""),
+            "updated_at": found.get("updated_at", ""),
+            "issues": issues,
+        }
+
+        display(display_data, ctx.obj.output_format, "milestone")
+
+    except subprocess.CalledProcessError as e:
+        typer.secho(f"Failed to show milestone: {e.stderr}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@milestone_app.command("close")
+def milestone_close(
+    milestone: str = typer.Argument(..., help="Milestone number or title"),
+):
+    """Close a milestone."""
+    import subprocess
+    import json
+
+    try:
+        # Get repo info
+        repo_info = subprocess.run(
+            ["gh", "repo", "view", "--json", "owner,name"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        repo = json.loads(repo_info.stdout)
+        owner = (
+            repo["owner"]["login"] if isinstance(repo["owner"], dict) else repo["owner"]
+        )
+        name = repo["name"]
+
+        # Find milestone
+        result = subprocess.run(
+            ["gh", "api", f"repos/{owner}/{name}/milestones"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        milestones = json.loads(result.stdout)
+        found = None
+        for m in milestones:
+            if str(m["number"]) == milestone or m["title"].lower() == milestone.lower():
+                found = m
+                break
+
+        if not found:
+            typer.secho(f"Milestone '{milestone}' not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+        # Close milestone
+        subprocess.run(
+            [
+                "gh",
+                "api",
+                f"repos/{owner}/{name}/milestones/{found['number']}",
+                "-X",
+                "PATCH",
+                "-f",
+                "state=closed",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        typer.secho(f"Closed milestone: {found['title']}", fg=typer.colors.GREEN)
+
+    except subprocess.CalledProcessError as e:
+        typer.secho(f"Failed to close milestone: {e.stderr}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
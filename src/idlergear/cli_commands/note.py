@@ -0,0 +1,220 @@
+"""`idlergear note` commands."""
+
+import typer
+
+from idlergear.cli import validate_labels
+from idlergear.display import display
+
+note_app = typer.Typer(help="Quick notes capture")
+
+
+# Note commands
+@note_app.command("create")
+def note_create(
+    content: str,
+    tag: list[str] = typer.Option([], "--tag", "-t", help="Tags (e.g., explore, idea)"),
+    no_validate: bool = typer.Option(
+        False, "--no-validate", help="Skip tag label validation"
+    ),
+):
+    """Create a quick note."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+    import subprocess
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("note")
+
+    # Validate and potentially create tag labels if any were provided
+    # Tags are stored as "tag:tagname" labels
+    if tag and not no_validate:
+        tag_labels = [f"tag:{t}" for t in tag]
+        valid_labels, invalid_labels = validate_labels(tag_labels)
+
+        if invalid_labels:
+            # Extract tag names from "tag:name" format for display
+            missing_tags = [label.replace("tag:", "") for label in invalid_labels]
+
+            # Ask user if they want to create the missing tag labels
+            create = typer.confirm(
+                f"Create missing tag labels: {', '.join(missing_tags)}?",
+                default=True,
+            )
+
+            if create:
+                for label in invalid_labels:
+                    try:
+                        subprocess.run(
+                            ["gh", "label", "create", label, "--color", "C2E0C6"],
+                            capture_output=True,
+                            text=True,
+                            check=True,
+                        )
+                        typer.secho(
+                            f"  ✓ Created label: {label}", fg=typer.colors.GREEN
+                        )
+                    except subprocess.CalledProcessError:
+                        typer.secho(
+                            f"  ✗ Failed to create label: {label}", fg=typer.colors.RED
+                        )
+                        raise typer.Exit(1)
+            else:
+                typer.secho(
+                    "Cancelled - cannot create note without valid tag labels.",
+                    fg=typer.colors.YELLOW,
+                )
+                raise typer.Exit(1)
+
+    note = backend.create(content, tags=list(tag) if tag else None)
+    tag_str = f" [{', '.join(note['tags'])}]" if note.get("tags") else ""
+    typer.secho(f"Created note #{note['id']}{tag_str}", fg=typer.colors.GREEN)
+
+
+@note_app.command("list")
+def note_list(
+    ctx: typer.Context,
+    tag: str = typer.Option(
+        None, "--tag", "-t", help="Filter by tag (e.g., explore, idea)"
+    ),
+):
+    """List notes."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("note")
+    notes = backend.list(tag=tag)
+    display(notes, ctx.obj.output_format, "notes")
+
+
+@note_app.command("show")
+def note_show(ctx: typer.Context, note_id: int):
+    """Show a note."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("note")
+    note = backend.get(note_id)
+    if note is None:
+        # For JSON output, we want the display function to handle this.
+        if ctx.obj.output_format == "human":
+            typer.secho(f"Note #{note_id} not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+    display(note, ctx.obj.output_format, "note")
+
+
+@note_app.command("edit")
+def note_edit(
+    note_id: int,
+    content: str = typer.Option(None, "--content", "-c", help="New content"),
+    tag: list[str] = typer.Option([], "--tag", "-t", help="Replace tags"),
+    add_tag: list[str] = typer.Option([], "--add-tag", help="Add tags"),
+):
+    """Edit a note."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("note")
+
+    # Determine new tags
+    tags = None
+    if tag:
+        tags = list(tag)
+    elif add_tag:
+        current = backend.get(note_id)
+        if current:
+            tags = list(set(current.get("tags", []) + list(add_tag)))
+
+    # GitHub backend doesn't support partial updates easily, so we merge locally if needed
+    # But get_backend handles the appropriate backend implementation
+    note = backend.update(note_id, content=content, tags=tags)
+    if note is None:
+        typer.secho(f"Note #{note_id} not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    typer.secho(f"Updated note #{note_id}", fg=typer.colors.GREEN)
+
+
+@note_app.command("delete")
+def note_delete(note_id: int):
+    """Delete a note."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("note")
+    if backend.delete(note_id):
+        typer.secho(f"Deleted note #{note_id}", fg=typer.colors.GREEN)
+    else:
+        typer.secho(f"Note #{note_id} not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@note_app.command("promote")
+def note_promote(
+    note_id: int,
+    to: str = typer.Option("task", "--to", "-t", help="Promote to: task, reference"),
+):
+    """Promote a note to another type."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("note")
+    try:
+        result = backend.promote(note_id, to)
+        if result is None:
+            typer.secho(f"Note #{note_id} not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+        typer.secho(
+            f"Promoted note #{note_id} to {to} #{result['id']}", fg=typer.colors.GREEN
+        )
+    except Exception as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@note_app.command("sync")
+def note_sync(target: str = typer.Argument("github")):
+    """Sync notes with remote."""
+    typer.echo(f"Syncing notes to {target}...")
+    # See task #318
@@ -0,0 +1,62 @@
+"""`idlergear otel` commands."""
+
+import typer
+
+otel_app = typer.Typer(help="OpenTelemetry log collection")
+
+
+# OTel commands
+@otel_app.command("start")
+def otel_start_cmd(
+    grpc_port: int = typer.Option(4317, help="gRPC port for OTLP receiver"),
+    http_port: int = typer.Option(4318, help="HTTP port for OTLP receiver"),
+    daemon: bool = typer.Option(False, help="Run in background as daemon"),
+):
+    """Start OpenTelemetry collector."""
+    from .otel import otel_start
+
+    otel_start(grpc_port=grpc_port, http_port=http_port, daemon=daemon)
+
+
+@otel_app.command("stop")
+def otel_stop_cmd():
+    """Stop OpenTelemetry collector."""
+    from .otel import otel_stop
+
+    otel_stop()
+
+
+@otel_app.command("status")
+def otel_status_cmd():
+    """Show OpenTelemetry collector status."""
+    from .otel import otel_status
+
+    otel_status()
+
+
+@otel_app.command("logs")
+def otel_logs_cmd(
+    tail: int = typer.Option(20, help="Show last N logs"),
+    service: str = typer.Option(None, help="Filter by service name"),
+    severity: str = typer.Option(None, help="Filter by severity"),
+    search: str = typer.Option(None, help="Full-text search"),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+):
+    """Query and display collected logs."""
+    from .otel import otel_logs
+
+    otel_logs(
+        tail=tail,
+        service=service,
+        severity=severity,
+        search=search,
+        json_output=json_output,
+    )
+
+
+@otel_app.command("config")
+def otel_config_cmd():
+    """Show OpenTelemetry configuration."""
+    from .otel import otel_config_show
+
+    otel_config_show()
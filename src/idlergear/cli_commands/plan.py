@@ -0,0 +1,490 @@
+"""`idlergear plan` commands."""
+
+import typer
+
+from idlergear.display import display
+
+plan_app = typer.Typer(help="Plan management (→ GitHub Projects)")
+
+
+# Plan commands
+@plan_app.command("create")
+def plan_create(
+    name: str,
+    description: str = typer.Option(None, "--description", "-d", help="Plan description"),
+    title: str = typer.Option(None, "--title", "-t", help="Plan title (alias for description)"),
+    body: str = typer.Option(None, "--body", "-b", help="Plan body (alias for description)"),
+    type: str = typer.Option("feature", "--type", help="Plan type: ephemeral, feature, roadmap, initiative"),
+    milestone: str = typer.Option(None, "--milestone", "-m", help="Milestone name or date"),
+    parent: str = typer.Option(None, "--parent", help="Parent plan name (for hierarchical plans)"),
+    auto_archive: bool = typer.Option(False, "--auto-archive", help="Auto-archive when completed"),
+):
+    """Create a new plan.
+
+    Plans track development work at any scale:
+    - ephemeral: AI multi-step workflows (minutes-hours)
+    - feature: Small feature work (days)
+    - roadmap: Medium initiatives (weeks)
+    - initiative: Large projects with sub-plans (months)
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import create_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    # Support old --title and --body for backward compatibility
+    desc = description or title or body
+    if not desc:
+        typer.secho("Error: Plan description is required. Use --description, --title, or --body", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    try:
+        plan = create_plan(
+            name=name,
+            description=desc,
+            root=root,
+            type=type,
+            milestone=milestone,
+            parent_plan=parent,
+            auto_archive=auto_archive,
+        )
+        typer.secho(f"Created plan: {plan.name} (type={plan.type})", fg=typer.colors.GREEN)
+        if parent:
+            typer.secho(f"  └─ Parent: {parent}", fg=typer.colors.BLUE)
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error creating plan: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("list")
+def plan_list(
+    ctx: typer.Context,
+    status: str = typer.Option(None, "--status", help="Filter by status: active, completed, deprecated, archived"),
+    type: str = typer.Option(None, "--type", help="Filter by type: ephemeral, feature, roadmap, initiative"),
+):
+    """List all plans with optional filters."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import list_plans
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    plans = list_plans(root, status=status, type_filter=type)
+
+    if not plans:
+        if ctx.obj.output_format == "human":
+            filters = []
+            if status:
+                filters.append(f"status={status}")
+            if type:
+                filters.append(f"type={type}")
+            filter_str = f" ({', '.join(filters)})" if filters else ""
+            typer.echo(f"No plans found{filter_str}.")
+        else:
+            typer.echo("[]")
+        return
+
+    # Convert to dict for display
+    plans_data = [p.to_dict() for p in plans]
+    display(plans_data, ctx.obj.output_format, "plans")
+
+
+@plan_app.command("show")
+def plan_show(
+    ctx: typer.Context,
+    name: str,
+):
+    """Show plan details."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import load_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        plan = load_plan(name, root)
+        display(plan.to_dict(), ctx.obj.output_format, "plan")
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error loading plan: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("delete")
+def plan_delete(
+    name: str,
+    permanent: bool = typer.Option(
+        False, "--permanent", help="Permanently delete (skip archiving)"
+    ),
+):
+    """Delete or archive a plan."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import delete_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        delete_plan(name, root, permanent=permanent)
+        if permanent:
+            typer.secho(f"Permanently deleted plan: {name}", fg=typer.colors.GREEN)
+        else:
+            typer.secho(f"Archived plan: {name}", fg=typer.colors.GREEN)
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error deleting plan: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("complete")
+def plan_complete(name: str):
+    """Mark a plan as completed."""
+    from datetime import datetime
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import update_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        plan = update_plan(
+            name, root, status="completed", completed_at=datetime.now().isoformat()
+        )
+        typer.secho(f"Completed plan: {plan.name}", fg=typer.colors.GREEN)
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error completing plan: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("deprecate")
+def plan_deprecate_cmd(
+    name: str,
+    successor: str = typer.Option(None, "--successor", "-s", help="Successor plan name"),
+    reason: str = typer.Option("", "--reason", "-r", help="Deprecation reason"),
+):
+    """Mark a plan as deprecated."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import deprecate_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        plan = deprecate_plan(name, root, successor_name=successor, reason=reason)
+        msg = f"Deprecated plan: {plan.name}"
+        if successor:
+            msg += f" (successor: {successor})"
+        typer.secho(msg, fg=typer.colors.GREEN)
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except ValueError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error deprecating plan: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("archive")
+def plan_archive_cmd(name: str):
+    """Archive a plan (can be restored later)."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import archive_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        plan = archive_plan(name, root)
+        typer.secho(f"Archived plan: {plan.name}", fg=typer.colors.GREEN)
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error archiving plan: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("restore")
+def plan_restore_cmd(
+    name: str,
+    status: str = typer.Option("active", "--status", help="Status to restore to"),
+):
+    """Restore an archived plan."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import restore_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        plan = restore_plan(name, root, new_status=status)
+        typer.secho(
+            f"Restored plan: {plan.name} (status: {plan.status})", fg=typer.colors.GREEN
+        )
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except ValueError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error restoring plan: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("add-file")
+def plan_add_file_cmd(name: str, file_path: str):
+    """Add a file to a plan."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import add_file_to_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        plan = add_file_to_plan(name, file_path, root)
+        typer.secho(
+            f"Added '{file_path}' to plan '{plan.name}'", fg=typer.colors.GREEN
+        )
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error adding file to plan: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("remove-file")
+def plan_remove_file_cmd(name: str, file_path: str):
+    """Remove a file from a plan."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import remove_file_from_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        plan = remove_file_from_plan(name, file_path, root)
+        typer.secho(
+            f"Removed '{file_path}' from plan '{plan.name}'", fg=typer.colors.GREEN
+        )
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error removing file from plan: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("deprecate-file")
+def plan_deprecate_file_cmd(name: str, file_path: str):
+    """Mark a file as deprecated in a plan."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import deprecate_file_in_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        plan = deprecate_file_in_plan(name, file_path, root)
+        typer.secho(
+            f"Deprecated '{file_path}' in plan '{plan.name}'", fg=typer.colors.GREEN
+        )
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error deprecating file: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("files")
+def plan_files_cmd(
+    ctx: typer.Context,
+    name: str,
+    include_deprecated: bool = typer.Option(
+        False, "--deprecated", help="Include deprecated files"
+    ),
+):
+    """List files in a plan."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import get_plan_files
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        files = get_plan_files(name, root, include_deprecated=include_deprecated)
+        display(files, ctx.obj.output_format, "files")
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error listing files: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("hierarchy")
+def plan_hierarchy_cmd(
+    ctx: typer.Context,
+    name: str,
+    max_depth: int = typer.Option(10, "--max-depth", help="Maximum hierarchy depth"),
+):
+    """Show plan hierarchy (parent/child relationships)."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import get_plan_hierarchy
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        hierarchy = get_plan_hierarchy(name, root, max_depth=max_depth)
+        display(hierarchy, ctx.obj.output_format, "hierarchy")
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error getting hierarchy: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("rollup")
+def plan_rollup_cmd(
+    ctx: typer.Context,
+    name: str,
+):
+    """Show rollup statistics for plan and all sub-plans."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import get_plan_rollup_status
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        rollup = get_plan_rollup_status(name, root)
+        display(rollup, ctx.obj.output_format, "rollup")
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error getting rollup: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("root")
+def plan_root_cmd(
+    name: str,
+    max_depth: int = typer.Option(10, "--max-depth", help="Maximum search depth"),
+):
+    """Find the root (top-level) plan for a given plan."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.plans import get_root_plan
+
+    root = find_idlergear_root()
+    if root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        root_plan = get_root_plan(name, root, max_depth=max_depth)
+        typer.secho(f"Root plan: {root_plan}", fg=typer.colors.GREEN)
+    except FileNotFoundError:
+        typer.secho(f"Plan '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error finding root: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@plan_app.command("sync")
+def plan_sync(target: str = typer.Argument("github")):
+    """Sync plans with remote."""
+    typer.echo(f"Syncing plans to {target}...")
+    # See task #320
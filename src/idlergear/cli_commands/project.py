@@ -0,0 +1,325 @@
+"""`idlergear project` commands."""
+
+import typer
+
+project_app = typer.Typer(help="Kanban project boards (→ GitHub Projects v2)")
+
+
+# Project commands
+@project_app.command("create")
+def project_create(
+    title: str,
+    columns: list[str] = typer.Option(
+        [],
+        "--column",
+        "-c",
+        help="Custom columns (default: Backlog, In Progress, Review, Done)",
+    ),
+    github: bool = typer.Option(
+        False, "--github", "-g", help="Also create on GitHub Projects v2"
+    ),
+):
+    """Create a new project board."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.projects import create_project
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        project = create_project(
+            title,
+            columns=list(columns) if columns else None,
+            create_on_github=github,
+        )
+        typer.secho(f"Created project: {project['title']}", fg=typer.colors.GREEN)
+        typer.echo(f"  ID: {project['id']}")
+        typer.echo(f"  Columns: {', '.join(project['columns'])}")
+        if project.get("github_project_number"):
+            typer.echo(f"  GitHub Project: #{project['github_project_number']}")
+    except ValueError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@project_app.command("list")
+def project_list(
+    github: bool = typer.Option(
+        False, "--github", "-g", help="Also list GitHub Projects"
+    ),
+):
+    """List project boards."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.projects import list_github_projects, list_projects
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    projects = list_projects()
+
+    if not projects and not github:
+        typer.echo(
+            "No projects found. Create one with 'idlergear project create <title>'"
+        )
+        return
+
+    if projects:
+        typer.echo("Local Projects:")
+        for proj in projects:
+            gh_link = (
+                f" (GitHub #{proj['github_project_number']})"
+                if proj.get("github_project_number")
+                else ""
+            )
+            typer.echo(f"  {proj['title']}{gh_link}")
+            task_count = sum(len(tasks) for tasks in proj["tasks"].values())
+            typer.echo(f"    {task_count} tasks across {len(proj['columns'])} columns")
+
+    if github:
+        typer.echo("")
+        typer.echo("GitHub Projects:")
+        gh_projects = list_github_projects()
+        if not gh_projects:
+            typer.echo("  No GitHub Projects found (or gh CLI not authenticated)")
+        else:
+            for proj in gh_projects:
+                typer.echo(
+                    f"  #{proj.get('number', '?')}: {proj.get('title', 'Untitled')}"
+                )
+
+
+@project_app.command("show")
+def project_show(name: str):
+    """Show a project board with tasks in each column."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+    from idlergear.projects import get_project
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    project = get_project(name)
+    if project is None:
+        typer.secho(f"Project '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    typer.echo(f"Project: {project['title']}")
+    if project.get("github_project_number"):
+        typer.echo(f"GitHub Project: #{project['github_project_number']}")
+    typer.echo(f"Created: {project['created_at']}")
+    typer.echo("")
+
+    # Show Kanban columns
+    task_backend = get_backend("task")
+
+    for column in project["columns"]:
+        task_ids = project["tasks"].get(column, [])
+        typer.secho(f"═══ {column} ({len(task_ids)}) ═══", bold=True)
+
+        if not task_ids:
+            typer.echo("  (empty)")
+        else:
+            for task_id in task_ids:
+                task = task_backend.get(task_id)
+                if task:
+                    title = task.get("title", "(no title)")[:50]
+                    typer.echo(f"  #{task_id}: {title}")
+                else:
+                    typer.secho(
+                        f"  #{task_id}: (task not found)", fg=typer.colors.YELLOW
+                    )
+        typer.echo("")
+
+
+@project_app.command("delete")
+def project_delete(
+    name: str,
+    github: bool = typer.Option(
+        False, "--github", "-g", help="Also delete from GitHub"
+    ),
+    force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation"),
+):
+    """Delete a project board."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.projects import delete_project, get_project
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    project = get_project(name)
+    if project is None:
+        typer.secho(f"Project '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if not force:
+        confirm_msg = f"Delete project '{project['title']}'?"
+        if github and project.get("github_project_number"):
+            confirm_msg = (
+                f"Delete project '{project['title']}' locally AND from GitHub?"
+            )
+        if not typer.confirm(confirm_msg):
+            typer.echo("Cancelled.")
+            raise typer.Exit(0)
+
+    if delete_project(name, delete_on_github=github):
+        typer.secho(f"Deleted project: {project['title']}", fg=typer.colors.GREEN)
+    else:
+        typer.secho("Failed to delete project.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@project_app.command("add-task")
+def project_add_task(
+    project_name: str,
+    task_id: int,
+    column: str = typer.Option(
+        None, "--column", "-c", help="Target column (default: first column)"
+    ),
+):
+    """Add a task to a project board."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.projects import add_task_to_project
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        project = add_task_to_project(project_name, str(task_id), column)
+        if project is None:
+            typer.secho(f"Project '{project_name}' not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+        target_col = column or project["columns"][0]
+        typer.secho(
+            f"Added task #{task_id} to '{project['title']}' → {target_col}",
+            fg=typer.colors.GREEN,
+        )
+    except ValueError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@project_app.command("remove-task")
+def project_remove_task(project_name: str, task_id: int):
+    """Remove a task from a project board."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.projects import remove_task_from_project
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    project = remove_task_from_project(project_name, str(task_id))
+    if project is None:
+        typer.secho(f"Project '{project_name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    typer.secho(
+        f"Removed task #{task_id} from '{project['title']}'", fg=typer.colors.GREEN
+    )
+
+
+@project_app.command("move")
+def project_move_task(project_name: str, task_id: int, column: str):
+    """Move a task to a different column."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.projects import move_task
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        project = move_task(project_name, str(task_id), column)
+        if project is None:
+            typer.secho(f"Project '{project_name}' not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+        typer.secho(f"Moved task #{task_id} to '{column}'", fg=typer.colors.GREEN)
+    except ValueError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@project_app.command("sync")
+def project_sync(name: str):
+    """Sync a project to GitHub Projects v2."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.projects import sync_project_to_github
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    typer.echo(f"Syncing project '{name}' to GitHub...")
+
+    try:
+        project = sync_project_to_github(name)
+        if project is None:
+            typer.secho(f"Project '{name}' not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+        typer.secho(
+            f"Synced project to GitHub Projects #{project['github_project_number']}",
+            fg=typer.colors.GREEN,
+        )
+    except RuntimeError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@project_app.command("link")
+def project_link(name: str, github_project_number: int):
+    """Link a local project to an existing GitHub Project."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.projects import link_to_github_project
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        project = link_to_github_project(name, github_project_number)
+        if project is None:
+            typer.secho(f"Local project '{name}' not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+        typer.secho(
+            f"Linked '{project['title']}' to GitHub Project #{github_project_number}",
+            fg=typer.colors.GREEN,
+        )
+    except RuntimeError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
@@ -0,0 +1,331 @@
+"""`idlergear reference` commands."""
+
+import json
+
+import typer
+
+from idlergear.cli import OutputFormat
+from idlergear.display import display
+
+reference_app = typer.Typer(help="Reference docs (→ GitHub Wiki)")
+
+
+# Reference commands
+@reference_app.command("add")
+def reference_add(
+    title: str,
+    body: str = typer.Option(None, "--body", "-b", help="Reference body"),
+):
+    """Add a reference document."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("reference")
+    ref = backend.add(title, body=body)
+    typer.secho(f"Added reference: {ref['title']}", fg=typer.colors.GREEN)
+
+
+@reference_app.command("list")
+def reference_list(ctx: typer.Context):
+    """List reference documents."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("reference")
+    refs = backend.list()
+    display(refs, ctx.obj.output_format, "references")
+
+
+@reference_app.command("show")
+def reference_show(ctx: typer.Context, title: str):
+    """Show a reference document."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("reference")
+    ref = backend.get(title)
+    if ref is None and ctx.obj.output_format == "human":
+        typer.secho(f"Reference '{title}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    display(ref, ctx.obj.output_format, "reference")
+
+
+@reference_app.command("edit")
+def reference_edit(
+    title: str,
+    new_title: str = typer.Option(None, "--title", "-t", help="New title"),
+    body: str = typer.Option(None, "--body", "-b", help="New body"),
+):
+    """Edit a reference document."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("reference")
+    ref = backend.update(title, new_title=new_title, body=body)
+    if ref is None:
+        typer.secho(f"Reference '{title}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    typer.secho(f"Updated reference: {ref['title']}", fg=typer.colors.GREEN)
+
+
+@reference_app.command("delete")
+def reference_delete(title: str):
+    """Delete a reference document."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("reference")
+    if backend.delete(title):
+        typer.secho(f"Deleted reference: {title}", fg=typer.colors.GREEN)
+    else:
+        typer.secho(f"Reference '{title}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@reference_app.command("search")
+def reference_search(query: str):
+    """Search reference documents."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("reference")
+    results = backend.search(query)
+    if not results:
+        typer.echo(f"No references found matching '{query}'.")
+        return
+
+    typer.echo(f"Found {len(results)} matching reference(s):")
+    for ref in results:
+        typer.echo(f"  {ref['title']}")
+
+
+@reference_app.command("sync")
+def reference_sync(
+    ctx: typer.Context,
+    push: bool = typer.Option(
+        False, "--push", help="Push local references to GitHub Wiki"
+    ),
+    pull: bool = typer.Option(
+        False, "--pull", help="Pull GitHub Wiki pages to local references"
+    ),
+    status: bool = typer.Option(
+        False, "--status", "-s", help="Show sync status without making changes"
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        "-f",
+        help="Force overwrite on conflicts (with --pull: use remote, with --push: use local)",
+    ),
+    ours: bool = typer.Option(False, "--ours", help="On conflict, keep local version"),
+    theirs: bool = typer.Option(
+        False, "--theirs", help="On conflict, keep remote version"
+    ),
+):
+    """Sync references with GitHub Wiki.
+
+    By default, performs bidirectional sync - pushing local changes and pulling remote changes.
+    Conflicts are reported and must be resolved manually unless --ours or --theirs is specified.
+
+    Examples:
+        idlergear reference sync                # Bidirectional sync
+        idlergear reference sync --push         # Push local to wiki
+        idlergear reference sync --pull         # Pull wiki to local
+        idlergear reference sync --status       # Check what needs syncing
+        idlergear reference sync --ours         # On conflict, keep local
+        idlergear reference sync --theirs       # On conflict, keep remote
+    """
+    from idlergear.wiki import WikiSync
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+
+    sync = WikiSync()
+
+    # Status only
+    if status:
+        # Check what would be synced
+        if output_format == OutputFormat.JSON:
+            # Get counts
+            from idlergear.reference import list_references
+
+            refs = list_references()
+
+            if sync.wiki_dir.exists():
+                sync.pull_wiki()
+                wiki_pages = sync.list_wiki_pages()
+            else:
+                wiki_pages = []
+
+            ref_titles = {r["title"] for r in refs}
+            wiki_titles = {p.title for p in wiki_pages}
+
+            typer.echo(
+                json.dumps(
+                    {
+                        "local_only": list(ref_titles - wiki_titles),
+                        "remote_only": list(wiki_titles - ref_titles),
+                        "both": list(ref_titles & wiki_titles),
+                        "local_count": len(refs),
+                        "remote_count": len(wiki_pages),
+                    }
+                )
+            )
+        else:
+            from idlergear.reference import list_references
+
+            refs = list_references()
+
+            typer.echo("Sync Status:")
+            typer.echo(f"  Local references: {len(refs)}")
+
+            if sync.wiki_dir.exists() or sync.wiki_exists():
+                sync.pull_wiki()
+                wiki_pages = sync.list_wiki_pages()
+                typer.echo(f"  Wiki pages: {len(wiki_pages)}")
+
+                ref_titles = {r["title"] for r in refs}
+                wiki_titles = {p.title for p in wiki_pages}
+
+                local_only = ref_titles - wiki_titles
+                remote_only = wiki_titles - ref_titles
+
+                if local_only:
+                    typer.echo()
+                    typer.echo("  Local only (will be pushed):")
+                    for title in local_only:
+                        typer.echo(f"    + {title}")
+
+                if remote_only:
+                    typer.echo()
+                    typer.echo("  Remote only (will be pulled):")
+                    for title in remote_only:
+                        typer.echo(f"    + {title}")
+
+                if not local_only and not remote_only:
+                    typer.secho("\n  ✓ Already in sync", fg=typer.colors.GREEN)
+            else:
+                typer.echo("  Wiki: Not initialized")
+                typer.echo()
+                typer.echo(
+                    "  Run 'idlergear reference sync --push' to initialize and push references."
+                )
+        return
+
+    # Determine conflict resolution
+    conflict_resolution = "manual"
+    if ours or (push and force):
+        conflict_resolution = "local"
+    elif theirs or (pull and force):
+        conflict_resolution = "remote"
+
+    # Push only
+    if push and not pull:
+        if output_format != OutputFormat.JSON:
+            typer.echo("Pushing references to GitHub Wiki...")
+
+        result = sync.push_references_to_wiki()
+
+        if output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "pushed": result.pushed,
+                        "conflicts": result.conflicts,
+                        "errors": result.errors,
+                    }
+                )
+            )
+        else:
+            typer.echo(str(result))
+        return
+
+    # Pull only
+    if pull and not push:
+        if output_format != OutputFormat.JSON:
+            typer.echo("Pulling GitHub Wiki to references...")
+
+        result = sync.pull_wiki_to_references(overwrite=force)
+
+        if output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "pulled": result.pulled,
+                        "conflicts": result.conflicts,
+                        "errors": result.errors,
+                    }
+                )
+            )
+        else:
+            typer.echo(str(result))
+        return
+
+    # Bidirectional sync (default)
+    if output_format != OutputFormat.JSON:
+        typer.echo("Syncing references with GitHub Wiki...")
+
+    result = sync.sync_bidirectional(conflict_resolution=conflict_resolution)
+
+    if output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                {
+                    "pushed": result.pushed,
+                    "pulled": result.pulled,
+                    "conflicts": result.conflicts,
+                    "errors": result.errors,
+                }
+            )
+        )
+    else:
+        typer.echo(str(result))
+
+        if result.conflicts:
+            typer.echo()
+            typer.echo("To resolve conflicts, use:")
+            typer.echo("  --ours   : Keep local version")
+            typer.echo("  --theirs : Keep remote version")
@@ -0,0 +1,208 @@
+"""`idlergear release` commands."""
+
+import json
+from typing import Optional
+
+import typer
+
+from idlergear.cli import OutputFormat
+
+release_app = typer.Typer(help="Release management (GitHub Releases)")
+
+
+# Release commands
+@release_app.command("list")
+def release_list(
+    ctx: typer.Context,
+    limit: int = typer.Option(
+        10, "--limit", "-n", help="Maximum number of releases to show"
+    ),
+):
+    """List releases from GitHub."""
+    from idlergear.release import check_gh_installed, check_gh_auth, list_releases
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+
+    if not check_gh_installed():
+        typer.secho("GitHub CLI (gh) is not installed.", fg=typer.colors.RED)
+        typer.echo("Install from: https://cli.github.com/")
+        raise typer.Exit(1)
+
+    if not check_gh_auth():
+        typer.secho("Not authenticated with GitHub CLI.", fg=typer.colors.RED)
+        typer.echo("Run: gh auth login")
+        raise typer.Exit(1)
+
+    try:
+        releases = list_releases(limit=limit)
+    except RuntimeError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if output_format == OutputFormat.JSON:
+        typer.echo(json.dumps({"releases": [r.to_dict() for r in releases]}))
+    else:
+        if not releases:
+            typer.echo("No releases found.")
+            return
+
+        typer.secho("Releases:", fg=typer.colors.CYAN, bold=True)
+        for release in releases:
+            status = []
+            if release.is_draft:
+                status.append("draft")
+            if release.is_prerelease:
+                status.append("prerelease")
+            status_str = f" [{', '.join(status)}]" if status else ""
+
+            date_str = ""
+            if release.published_at:
+                date_str = f" ({release.published_at.strftime('%Y-%m-%d')})"
+
+            typer.echo(f"  {release.tag}{date_str}{status_str}")
+
+
+@release_app.command("show")
+def release_show(
+    ctx: typer.Context,
+    tag: str = typer.Argument(..., help="Release tag (e.g., v0.3.27)"),
+):
+    """Show details of a specific release."""
+    from idlergear.release import check_gh_installed, check_gh_auth, get_release
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+
+    if not check_gh_installed():
+        typer.secho("GitHub CLI (gh) is not installed.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if not check_gh_auth():
+        typer.secho("Not authenticated with GitHub CLI.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    release = get_release(tag)
+    if release is None:
+        typer.secho(f"Release not found: {tag}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if output_format == OutputFormat.JSON:
+        typer.echo(json.dumps(release.to_dict()))
+    else:
+        typer.secho(f"Release: {release.tag}", fg=typer.colors.CYAN, bold=True)
+        if release.name != release.tag:
+            typer.echo(f"  Title: {release.name}")
+        if release.published_at:
+            typer.echo(
+                f"  Published: {release.published_at.strftime('%Y-%m-%d %H:%M')}"
+            )
+        if release.is_draft:
+            typer.secho("  Status: Draft", fg=typer.colors.YELLOW)
+        if release.is_prerelease:
+            typer.secho("  Status: Pre-release", fg=typer.colors.YELLOW)
+        if release.url:
+            typer.echo(f"  URL: {release.url}")
+        if release.body:
+            typer.echo("")
+            typer.secho("Notes:", bold=True)
+            typer.echo(release.body)
+
+
+@release_app.command("create")
+def release_create(
+    ctx: typer.Context,
+    tag: str = typer.Argument(..., help="Release tag (e.g., v0.4.0)"),
+    title: Optional[str] = typer.Option(None, "--title", "-t", help="Release title"),
+    notes: Optional[str] = typer.Option(None, "--notes", "-n", help="Release notes"),
+    notes_from_tasks: bool = typer.Option(
+        False, "--notes-from-tasks", help="Generate notes from closed tasks"
+    ),
+    draft: bool = typer.Option(False, "--draft", help="Create as draft release"),
+    prerelease: bool = typer.Option(False, "--prerelease", help="Mark as pre-release"),
+    bump: bool = typer.Option(
+        False, "--bump", help="Run version command before creating release"
+    ),
+    target: Optional[str] = typer.Option(
+        None, "--target", help="Target branch or commit"
+    ),
+):
+    """Create a new release on GitHub.
+
+    Examples:
+        idlergear release create v0.4.0
+        idlergear release create v0.4.0 --notes "What's new..."
+        idlergear release create v0.4.0 --notes-from-tasks
+        idlergear release create v0.4.0 --draft
+        idlergear release create v0.4.0 --bump
+    """
+    from idlergear.release import check_gh_installed, check_gh_auth, create_release
+
+    if not check_gh_installed():
+        typer.secho("GitHub CLI (gh) is not installed.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if not check_gh_auth():
+        typer.secho("Not authenticated with GitHub CLI.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    success, message, url = create_release(
+        tag=tag,
+        title=title,
+        notes=notes,
+        notes_from_tasks=notes_from_tasks,
+        draft=draft,
+        prerelease=prerelease,
+        bump=bump,
+        target=target,
+    )
+
+    if success:
+        typer.secho(message, fg=typer.colors.GREEN)
+        if url:
+            typer.echo(f"URL: {url}")
+    else:
+        typer.secho(message, fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@release_app.command("delete")
+def release_delete(
+    ctx: typer.Context,
+    tag: str = typer.Argument(..., help="Release tag to delete"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
+):
+    """Delete a release from GitHub."""
+    from idlergear.release import check_gh_installed, check_gh_auth, delete_release
+
+    if not check_gh_installed():
+        typer.secho("GitHub CLI (gh) is not installed.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if not check_gh_auth():
+        typer.secho("Not authenticated with GitHub CLI.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if not yes:
+        if not typer.confirm(f"Delete release {tag}?"):
+            raise typer.Exit(0)
+
+    success, message = delete_release(tag, yes=True)
+
+    if success:
+        typer.secho(message, fg=typer.colors.GREEN)
+    else:
+        typer.secho(message, fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@release_app.command("notes")
+def release_notes(
+    ctx: typer.Context,
+    since: Optional[str] = typer.Option(
+        None, "--since", help="Generate notes since this tag"
+    ),
+):
+    """Generate release notes from closed tasks."""
+    from idlergear.release import generate_notes_from_tasks
+
+    notes = generate_notes_from_tasks(since_tag=since)
+    typer.echo(notes)
@@ -0,0 +1,561 @@
+"""`idlergear run` commands."""
+
+from pathlib import Path
+
+import typer
+
+run_app = typer.Typer(help="Script execution and logs")
+
+
+# Run commands
+@run_app.command("start")
+def run_start(
+    command: str,
+    name: str = typer.Option(None, "--name", "-n", help="Run name"),
+    tmux: bool = typer.Option(
+        False, "--tmux", help="Run in a tmux session (allows attaching later)"
+    ),
+    container: bool = typer.Option(
+        False, "--container", help="Run in a container (podman/docker)"
+    ),
+    image: str = typer.Option(
+        None, "--image", help="Container image (required with --container)"
+    ),
+    memory: str = typer.Option(
+        None, "--memory", help="Container memory limit (e.g., '512m', '2g')"
+    ),
+    cpus: str = typer.Option(None, "--cpus", help="Container CPU limit (e.g., '1.5')"),
+):
+    """Start a script/command.
+
+    Examples:
+        idlergear run start "python server.py" --name backend
+        idlergear run start "pytest" --tmux --name tests
+        idlergear run start "npm start" --container --image node:18 --name frontend
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.runs import start_run
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    # Validate container options
+    if container and not image:
+        typer.secho(
+            "Error: --image is required when using --container",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        run = start_run(
+            command,
+            name=name,
+            use_tmux=tmux,
+            use_container=container,
+            container_image=image,
+            container_memory=memory,
+            container_cpus=cpus,
+        )
+        typer.secho(
+            f"Started run '{run['name']}' (PID {run['pid']})", fg=typer.colors.GREEN
+        )
+        typer.echo(f"  Command: {run['command']}")
+
+        if container and run.get("container_id"):
+            typer.echo(f"  Container ID: {run['container_id']}")
+            typer.echo(f"  Image: {image}")
+            if memory:
+                typer.echo(f"  Memory limit: {memory}")
+            if cpus:
+                typer.echo(f"  CPU limit: {cpus}")
+        elif tmux and run.get("tmux_session"):
+            typer.echo(f"  Tmux session: {run['tmux_session']}")
+            typer.echo(f"  Attach: tmux attach-session -t {run['tmux_session']}")
+            typer.echo(f"  Or use: idlergear run attach {run['name']}")
+
+        typer.echo(f"  Logs: idlergear run logs {run['name']}")
+    except RuntimeError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@run_app.command("list")
+def run_list():
+    """List runs."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.runs import list_runs
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    runs = list_runs()
+    if not runs:
+        typer.echo("No runs found.")
+        return
+
+    for run in runs:
+        status_color = (
+            typer.colors.GREEN if run["status"] == "running" else typer.colors.WHITE
+        )
+        typer.echo(f"  {run['name']}", nl=False)
+        typer.secho(f"  [{run['status']}]", fg=status_color, nl=False)
+        if run.get("pid") and run["status"] == "running":
+            typer.echo(f"  PID {run['pid']}", nl=False)
+        typer.echo("")
+
+
+@run_app.command("history")
+def run_history(
+    failed: bool = typer.Option(False, "--failed", "-f", help="Show only failed runs"),
+    status: str = typer.Option(
+        None,
+        "--status",
+        "-s",
+        help="Filter by status (running, stopped, completed, failed)",
+    ),
+    limit: int = typer.Option(None, "--limit", "-l", help="Limit number of results"),
+):
+    """Show run history.
+
+    Examples:
+        idlergear run history              # Recent runs with status
+        idlergear run history --failed     # Only failed runs
+        idlergear run history --limit 20   # Limit results
+        idlergear run history --status completed  # Only completed runs
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.runs import list_runs
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    runs = list_runs()
+    if not runs:
+        typer.echo("No runs found.")
+        return
+
+    # Filter by status
+    if failed:
+        runs = [r for r in runs if r["status"] == "failed"]
+    elif status:
+        runs = [r for r in runs if r["status"] == status]
+
+    # Apply limit
+    if limit:
+        runs = runs[:limit]
+
+    if not runs:
+        typer.echo("No matching runs found.")
+        return
+
+    # Display runs with more detailed information
+    for run in runs:
+        status_color = {
+            "running": typer.colors.GREEN,
+            "completed": typer.colors.BLUE,
+            "failed": typer.colors.RED,
+            "stopped": typer.colors.YELLOW,
+        }.get(run["status"], typer.colors.WHITE)
+
+        typer.echo(f"  {run['name']}", nl=False)
+        typer.secho(f"  [{run['status']}]", fg=status_color, nl=False)
+        if run.get("command"):
+            typer.echo(f"  {run['command']}", nl=False)
+        if run.get("pid") and run["status"] == "running":
+            typer.echo(f"  (PID {run['pid']})", nl=False)
+        typer.echo("")
+
+
+@run_app.command("status")
+def run_status(name: str):
+    """Check run status."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.runs import get_run_status
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    status = get_run_status(name)
+    if status is None:
+        typer.secho(f"Run '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    status_color = (
+        typer.colors.GREEN if status["status"] == "running" else typer.colors.WHITE
+    )
+    typer.echo(f"Run: {status['name']}")
+    typer.secho(f"Status: {status['status']}", fg=status_color)
+    if status.get("command"):
+        typer.echo(f"Command: {status['command']}")
+    if status.get("pid") and status["status"] == "running":
+        typer.echo(f"PID: {status['pid']}")
+    typer.echo(f"Stdout: {status.get('stdout_size', 0)} bytes")
+    typer.echo(f"Stderr: {status.get('stderr_size', 0)} bytes")
+
+
+@run_app.command("logs")
+def run_logs(
+    name: str,
+    tail: int = typer.Option(None, "--tail", "-t", help="Show last N lines"),
+    stderr: bool = typer.Option(
+        False, "--stderr", "-e", help="Show stderr instead of stdout"
+    ),
+):
+    """Show run logs."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.runs import get_run_logs
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    stream = "stderr" if stderr else "stdout"
+    logs = get_run_logs(name, tail=tail, stream=stream)
+
+    if logs is None:
+        typer.secho(f"Run '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if not logs:
+        typer.echo(f"No {stream} output yet.")
+        return
+
+    typer.echo(logs)
+
+
+@run_app.command("stop")
+def run_stop(name: str):
+    """Stop a running process."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.runs import stop_run
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    if stop_run(name):
+        typer.secho(f"Stopped run '{name}'", fg=typer.colors.GREEN)
+    else:
+        typer.secho(f"Run '{name}' is not running or not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@run_app.command("attach")
+def run_attach(name: str):
+    """Attach to a tmux session for a run.
+
+    Only works for runs started with --tmux flag.
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.runs import attach_to_run
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        result = attach_to_run(name)
+        typer.secho(f"Tmux session: {result['tmux_session']}", fg=typer.colors.GREEN)
+        typer.echo(f"  {result['message']}")
+        typer.echo("")
+        typer.echo("To attach to the session, run:")
+        typer.secho(f"  {result['attach_command']}", fg=typer.colors.BRIGHT_CYAN)
+    except RuntimeError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@run_app.command("delete")
+def run_delete(name: str):
+    """Delete a run and its logs."""
+    from idlergear.config import find_idlergear_root
+    from idlergear.runs import delete_run
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    if delete_run(name):
+        typer.secho(f"Deleted run '{name}'", fg=typer.colors.GREEN)
+    else:
+        typer.secho(f"Run '{name}' not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@run_app.command("cleanup")
+def run_cleanup(
+    older_than: int = typer.Option(
+        7, "--older-than", "-d", help="Delete runs older than N days (default: 7)"
+    ),
+    status: str = typer.Option(
+        None,
+        "--status",
+        "-s",
+        help="Only delete runs with this status (e.g., stopped, failed)",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would be deleted without deleting"
+    ),
+):
+    """Clean up old runs.
+
+    Examples:
+        idlergear run cleanup                    # Delete runs older than 7 days
+        idlergear run cleanup --older-than 30   # Delete runs older than 30 days
+        idlergear run cleanup --status failed    # Only delete failed runs
+        idlergear run cleanup --dry-run          # Preview what would be deleted
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.runs import cleanup_runs
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    deleted = cleanup_runs(older_than_days=older_than, status=status, dry_run=dry_run)
+
+    if not deleted:
+        typer.echo("No runs to clean up.")
+        return
+
+    action = "Would delete" if dry_run else "Deleted"
+    for name in deleted:
+        typer.echo(f"  {action}: {name}")
+
+    typer.secho(
+        f"{action} {len(deleted)} run(s)",
+        fg=typer.colors.YELLOW if dry_run else typer.colors.GREEN,
+    )
+
+
+@run_app.command("clean")
+def run_clean(
+    older_than: int = typer.Option(
+        7, "--older-than", "-d", help="Delete runs older than N days (default: 7)"
+    ),
+    status: str = typer.Option(
+        None,
+        "--status",
+        "-s",
+        help="Only delete runs with this status (e.g., stopped, failed)",
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show what would be deleted without deleting"
+    ),
+):
+    """Clean up old runs (alias for cleanup).
+
+    Examples:
+        idlergear run clean                    # Delete runs older than 7 days
+        idlergear run clean --older-than 30   # Delete runs older than 30 days
+        idlergear run clean --status failed    # Only delete failed runs
+        idlergear run clean --dry-run          # Preview what would be deleted
+    """
+    # Just call the cleanup function
+    run_cleanup(older_than=older_than, status=status, dry_run=dry_run)
+
+
+@run_app.command("exec")
+def run_exec(
+    command: str = typer.Argument(..., help="Command to execute"),
+    name: str = typer.Option(None, "--name", "-n", help="Run name"),
+    no_header: bool = typer.Option(
+        False, "--no-header", help="Suppress header/footer output"
+    ),
+    no_register: bool = typer.Option(
+        False, "--no-register", help="Don't register with daemon"
+    ),
+    stream: bool = typer.Option(
+        False, "--stream", "-s", help="Stream logs to daemon for other agents to see"
+    ),
+):
+    """Execute a command with PTY passthrough and tracking.
+
+    This wraps any command while preserving terminal colors and interactivity,
+    and provides AI-visible metadata (run ID, script hash, timestamps).
+
+    Examples:
+        ig run exec "./run_tests.sh"
+        ig run exec "python manage.py migrate" --name django-migrate
+        ig run exec "npm run build" --no-header
+        ig run exec "./long_job.sh" --stream  # Stream logs to daemon
+
+    The output includes header/footer blocks that AI assistants can parse
+    to understand what ran and whether it succeeded.
+    """
+    from idlergear.runs import run_with_pty
+
+    try:
+        result = run_with_pty(
+            command,
+            name=name,
+            show_header=not no_header,
+            register_with_daemon=not no_register,
+            stream_logs=stream,
+        )
+        # Exit with the same code as the wrapped command
+        raise typer.Exit(result["exit_code"])
+    except Exception as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+
+@run_app.command("generate-script")
+def run_generate_script(
+    script_name: str,
+    command: str,
+    output: str = typer.Option(
+        None, "--output", "-o", help="Output file path (default: ./scripts/{name}.sh)"
+    ),
+    venv: str = typer.Option(None, "--venv", help="Virtualenv path"),
+    requirement: list[str] = typer.Option(
+        [], "--requirement", "-r", help="Python packages to install"
+    ),
+    env: list[str] = typer.Option(
+        [], "--env", "-e", help="Environment variables (KEY=VALUE)"
+    ),
+    agent_name: str = typer.Option(
+        None, "--agent-name", help="Agent name for daemon (default: script name)"
+    ),
+    agent_type: str = typer.Option("dev-script", "--agent-type", help="Agent type"),
+    no_register: bool = typer.Option(
+        False, "--no-register", help="Don't register with daemon"
+    ),
+    stream_logs: bool = typer.Option(
+        False, "--stream-logs", help="Stream logs to daemon"
+    ),
+    template: str = typer.Option(
+        None,
+        "--template",
+        "-t",
+        help="Use template (pytest, django-dev, flask-dev, etc)",
+    ),
+):
+    """Generate a dev environment setup script that registers with IdlerGear daemon.
+
+    Examples:
+        # Generate a pytest runner
+        idlergear run generate-script test "pytest -v" --template pytest
+
+        # Custom Django dev server
+        idlergear run generate-script django-dev "python manage.py runserver" \\
+            --venv ./venv --requirement django --env DJANGO_SETTINGS_MODULE=settings
+
+        # With log streaming
+        idlergear run generate-script worker "celery worker" --stream-logs
+    """
+    from pathlib import Path
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.script_generator import (
+        generate_dev_script,
+        generate_script_from_template,
+        save_script,
+    )
+
+    project_root = find_idlergear_root()
+    if project_root is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    # Parse environment variables
+    env_vars = {}
+    for env_var in env:
+        if "=" not in env_var:
+            typer.secho(
+                f"Invalid environment variable: {env_var} (use KEY=VALUE)",
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(1)
+        key, value = env_var.split("=", 1)
+        env_vars[key] = value
+
+    try:
+        # Generate from template or custom
+        if template:
+            script_content = generate_script_from_template(
+                template,
+                script_name,
+                venv_path=venv,
+                env_vars=env_vars if env_vars else None,
+                agent_name=agent_name,
+                agent_type=agent_type,
+                register_with_daemon=not no_register,
+                stream_logs=stream_logs,
+                project_path=project_root,
+            )
+        else:
+            script_content = generate_dev_script(
+                script_name,
+                command,
+                venv_path=venv,
+                requirements=list(requirement) if requirement else None,
+                env_vars=env_vars if env_vars else None,
+                agent_name=agent_name,
+                agent_type=agent_type,
+                register_with_daemon=not no_register,
+                stream_logs=stream_logs,
+                project_path=project_root,
+            )
+
+        # Determine output path
+        if output is None:
+            scripts_dir = project_root / "scripts"
+            scripts_dir.mkdir(exist_ok=True)
+            output = str(scripts_dir / f"{script_name}.sh")
+
+        output_path = Path(output)
+        save_script(script_content, output_path, make_executable=True)
+
+        typer.secho(f"✓ Generated script: {output_path}", fg=typer.colors.GREEN)
+        typer.echo(f"\nRun with: ./{output_path.relative_to(project_root)}")
+        typer.echo("\nFeatures:")
+        if not no_register:
+            typer.echo("  ✓ Auto-registers with IdlerGear daemon")
+        if stream_logs:
+            typer.echo("  ✓ Streams logs to daemon")
+        if venv:
+            typer.echo(f"  ✓ Activates virtualenv: {venv}")
+        if requirement:
+            typer.echo(f"  ✓ Installs packages: {', '.join(requirement)}")
+        if env_vars:
+            typer.echo(f"  ✓ Sets environment variables: {', '.join(env_vars.keys())}")
+
+    except Exception as e:
+        typer.secho(f"Error generating script: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
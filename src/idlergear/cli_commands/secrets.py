@@ -0,0 +1,423 @@
+"""`idlergear secrets` commands."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from idlergear.cli import OutputFormat
+
+secrets_app = typer.Typer(help="Secure local secrets management")
+
+
+# Secrets commands
+@secrets_app.command("init")
+def secrets_init(
+    ctx: typer.Context,
+):
+    """Initialize secrets store for this project.
+
+    Creates an encrypted secrets store for the current project.
+    You will be prompted for a master password.
+    """
+    from getpass import getpass
+    from pathlib import Path
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.secrets import SecretsManager
+
+    project_path = find_idlergear_root() or Path.cwd()
+    manager = SecretsManager(project_path)
+
+    if manager.is_initialized():
+        typer.secho("Secrets store already initialized.", fg=typer.colors.YELLOW)
+        raise typer.Exit(0)
+
+    # Prompt for password
+    typer.echo("Create a master password for encrypting secrets.")
+    typer.echo("This password will be required to access secrets.")
+    typer.echo()
+
+    password = getpass("Master password: ")
+    if not password:
+        typer.secho("Password cannot be empty.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    confirm = getpass("Confirm password: ")
+    if password != confirm:
+        typer.secho("Passwords do not match.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    try:
+        manager.initialize(password)
+        typer.secho("Secrets store initialized.", fg=typer.colors.GREEN)
+        typer.echo(f"Project ID: {manager._get_or_create_project_id()}")
+    except RuntimeError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@secrets_app.command("set")
+def secrets_set(
+    ctx: typer.Context,
+    name: str = typer.Argument(..., help="Secret name (e.g., API_KEY)"),
+    value: Optional[str] = typer.Option(
+        None, "--value", "-v", help="Secret value (prompts if not provided)"
+    ),
+    from_file: Optional[Path] = typer.Option(
+        None, "--from-file", "-f", help="Read value from file"
+    ),
+):
+    """Set a secret value.
+
+    Prompts for the value if not provided via --value or --from-file.
+    Using --value is not recommended as it may appear in shell history.
+    """
+    from getpass import getpass
+    from pathlib import Path
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.secrets import SecretsManager
+
+    project_path = find_idlergear_root() or Path.cwd()
+    manager = SecretsManager(project_path)
+
+    if not manager.is_initialized():
+        typer.secho(
+            "Secrets store not initialized. Run 'idlergear secrets init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    # Get password
+    password = getpass("Master password: ")
+    if not manager.unlock(password):
+        typer.secho("Invalid password.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    # Get value
+    if from_file:
+        if not from_file.exists():
+            typer.secho(f"File not found: {from_file}", fg=typer.colors.RED)
+            raise typer.Exit(1)
+        secret_value = from_file.read_text().strip()
+    elif value:
+        typer.secho(
+            "Warning: Using --value may expose the secret in shell history.",
+            fg=typer.colors.YELLOW,
+        )
+        secret_value = value
+    else:
+        secret_value = getpass(f"Enter value for {name}: ")
+
+    if not secret_value:
+        typer.secho("Value cannot be empty.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    entry = manager.set(name, secret_value)
+    typer.secho(f"Set secret: {name}", fg=typer.colors.GREEN)
+
+
+@secrets_app.command("get")
+def secrets_get(
+    ctx: typer.Context,
+    name: str = typer.Argument(..., help="Secret name"),
+):
+    """Get a secret value (for scripting).
+
+    Outputs the secret value to stdout without any decoration.
+    Useful for piping to other commands.
+    """
+    from getpass import getpass
+    from pathlib import Path
+    import sys
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.secrets import SecretsManager
+
+    project_path = find_idlergear_root() or Path.cwd()
+    manager = SecretsManager(project_path)
+
+    if not manager.is_initialized():
+        typer.secho("Secrets store not initialized.", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+    # Read password from stdin if piped, otherwise prompt
+    if sys.stdin.isatty():
+        password = getpass("Master password: ")
+    else:
+        # When piping, we can't prompt - this is a limitation
+        typer.secho(
+            "Cannot prompt for password in non-interactive mode.",
+            fg=typer.colors.RED,
+            err=True,
+        )
+        raise typer.Exit(1)
+
+    if not manager.unlock(password):
+        typer.secho("Invalid password.", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+    value = manager.get(name)
+    if value is None:
+        typer.secho(f"Secret not found: {name}", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
+
+    # Output value without newline for piping
+    typer.echo(value, nl=False)
+
+
+@secrets_app.command("list")
+def secrets_list(
+    ctx: typer.Context,
+):
+    """List all secrets (names only, never values)."""
+    from getpass import getpass
+    from pathlib import Path
+    from datetime import datetime
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.secrets import SecretsManager
+
+    output_format = ctx.obj.output_format if ctx.obj else OutputFormat.HUMAN
+    project_path = find_idlergear_root() or Path.cwd()
+    manager = SecretsManager(project_path)
+
+    if not manager.is_initialized():
+        typer.secho(
+            "Secrets store not initialized. Run 'idlergear secrets init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    password = getpass("Master password: ")
+    if not manager.unlock(password):
+        typer.secho("Invalid password.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    entries = manager.list()
+
+    if output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                {
+                    "secrets": [
+                        {
+                            "name": e.name,
+                            "created_at": e.created_at.isoformat(),
+                            "updated_at": e.updated_at.isoformat(),
+                        }
+                        for e in entries
+                    ]
+                }
+            )
+        )
+    else:
+        if not entries:
+            typer.echo("No secrets stored.")
+            return
+
+        typer.secho("Secrets:", fg=typer.colors.CYAN, bold=True)
+        for entry in sorted(entries, key=lambda e: e.name):
+            # Calculate relative time
+            age = datetime.now() - entry.updated_at
+            if age.days > 0:
+                age_str = f"{age.days} day{'s' if age.days > 1 else ''} ago"
+            elif age.seconds > 3600:
+                hours = age.seconds // 3600
+                age_str = f"{hours} hour{'s' if hours > 1 else ''} ago"
+            elif age.seconds > 60:
+                mins = age.seconds // 60
+                age_str = f"{mins} minute{'s' if mins > 1 else ''} ago"
+            else:
+                age_str = "just now"
+
+            typer.echo(f"  {entry.name:<30} [set {age_str}]")
+
+
+@secrets_app.command("delete")
+def secrets_delete(
+    ctx: typer.Context,
+    name: str = typer.Argument(..., help="Secret name to delete"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
+):
+    """Delete a secret."""
+    from getpass import getpass
+    from pathlib import Path
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.secrets import SecretsManager
+
+    project_path = find_idlergear_root() or Path.cwd()
+    manager = SecretsManager(project_path)
+
+    if not manager.is_initialized():
+        typer.secho("Secrets store not initialized.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    password = getpass("Master password: ")
+    if not manager.unlock(password):
+        typer.secho("Invalid password.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if not manager.exists(name):
+        typer.secho(f"Secret not found: {name}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if not yes and not typer.confirm(f"Delete secret '{name}'?"):
+        raise typer.Exit(0)
+
+    manager.delete(name)
+    typer.secho(f"Deleted: {name}", fg=typer.colors.GREEN)
+
+
+@secrets_app.command("export")
+def secrets_export(
+    ctx: typer.Context,
+    output_path: Optional[Path] = typer.Argument(
+        None, help="Output file path (default: stdout)"
+    ),
+):
+    """Export secrets to .env format.
+
+    WARNING: Creates an unencrypted file! Do not commit to version control.
+    """
+    from getpass import getpass
+    from pathlib import Path
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.secrets import SecretsManager
+
+    project_path = find_idlergear_root() or Path.cwd()
+    manager = SecretsManager(project_path)
+
+    if not manager.is_initialized():
+        typer.secho("Secrets store not initialized.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    password = getpass("Master password: ")
+    if not manager.unlock(password):
+        typer.secho("Invalid password.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if output_path:
+        typer.secho(
+            "WARNING: This will create an unencrypted file!",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
+        typer.secho(
+            "Do NOT commit this file to version control.",
+            fg=typer.colors.YELLOW,
+            err=True,
+        )
+        if not typer.confirm("Continue?"):
+            raise typer.Exit(0)
+
+        manager.export_env_file(output_path)
+        typer.secho(f"Exported to {output_path}", fg=typer.colors.GREEN, err=True)
+    else:
+        # Output to stdout
+        entries = manager.list()
+        for entry in sorted(entries, key=lambda e: e.name):
+            value = manager.get(entry.name)
+            escaped = (
+                value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+            )
+            typer.echo(f'{entry.name}="{escaped}"')
+
+
+@secrets_app.command("import")
+def secrets_import(
+    ctx: typer.Context,
+    env_file: Path = typer.Argument(..., help="Path to .env file"),
+    overwrite: bool = typer.Option(
+        False, "--overwrite", help="Overwrite existing secrets"
+    ),
+):
+    """Import secrets from .env format file."""
+    from getpass import getpass
+    from pathlib import Path
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.secrets import SecretsManager
+
+    if not env_file.exists():
+        typer.secho(f"File not found: {env_file}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    project_path = find_idlergear_root() or Path.cwd()
+    manager = SecretsManager(project_path)
+
+    if not manager.is_initialized():
+        typer.secho(
+            "Secrets store not initialized. Run 'idlergear secrets init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    password = getpass("Master password: ")
+    if not manager.unlock(password):
+        typer.secho("Invalid password.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    imported = manager.import_env_file(env_file, overwrite=overwrite)
+
+    if imported:
+        typer.secho(f"Imported {len(imported)} secret(s):", fg=typer.colors.GREEN)
+        for name in imported:
+            typer.echo(f"  {name}")
+    else:
+        typer.echo("No new secrets imported.")
+
+
+@secrets_app.command("run")
+def secrets_run(
+    ctx: typer.Context,
+    dry_run: bool = typer.Option(
+        False, "--dry-run", "-n", help="Show secrets that would be injected"
+    ),
+    command: list[str] = typer.Argument(None, help="Command to run"),
+):
+    """Run command with secrets injected as environment variables.
+
+    Example:
+        idlergear secrets run -- python app.py
+        idlergear secrets run -- npm start
+    """
+    from getpass import getpass
+    from pathlib import Path
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.secrets import SecretsManager
+
+    if not command:
+        typer.secho("No command specified. Use -- before command.", fg=typer.colors.RED)
+        typer.echo("Example: idlergear secrets run -- python app.py")
+        raise typer.Exit(1)
+
+    project_path = find_idlergear_root() or Path.cwd()
+    manager = SecretsManager(project_path)
+
+    if not manager.is_initialized():
+        typer.secho("Secrets store not initialized.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    password = getpass("Master password: ")
+    if not manager.unlock(password):
+        typer.secho("Invalid password.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if dry_run:
+        preview = manager.get_run_preview()
+        if not preview:
+            typer.echo("No secrets to inject.")
+        else:
+            typer.secho("Secrets that would be injected:", fg=typer.colors.CYAN)
+            for name, masked in sorted(preview.items()):
+                typer.echo(f"  {name}={masked}")
+        return
+
+    exit_code = manager.run_with_secrets(command)
+    raise typer.Exit(exit_code)
@@ -0,0 +1,944 @@
+"""`idlergear session` commands."""
+
+from pathlib import Path
+
+import typer
+
+session_app = typer.Typer(help="Session state persistence")
+
+
+# ============================================================================
+# Session Commands
+# ============================================================================
+
+
+@session_app.command("save")
+def session_save(
+    name: str = typer.Argument(None, help="Optional name for the session"),
+    next_steps: str = typer.Option(None, "--next", "-n", help="What to do next"),
+    blockers: str = typer.Option(
+        None, "--blockers", "-b", help="What's blocking progress"
+    ),
+):
+    """Save current session state.
+
+    Examples:
+        idlergear session save                    # Auto-name with timestamp
+        idlergear session save fixing-parser      # Named session
+        idlergear session save --next "Run tests" # With next steps
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.sessions import save_session
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    session_file = save_session(name=name, next_steps=next_steps, blockers=blockers)
+    typer.secho(f"Session saved to: {session_file.name}", fg=typer.colors.GREEN)
+
+
+@session_app.command("restore")
+def session_restore(
+    name: str = typer.Argument(None, help="Session name or timestamp to restore"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    """Restore/view a saved session state.
+
+    Examples:
+        idlergear session restore                 # Most recent session
+        idlergear session restore fixing-parser   # By name
+        idlergear session restore 2026-01-01      # By timestamp
+    """
+    import json
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.sessions import format_session_state, load_session
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    state = load_session(name=name)
+    if state is None:
+        if name:
+            typer.secho(f"Session '{name}' not found.", fg=typer.colors.RED)
+        else:
+            typer.secho("No saved sessions found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if json_output:
+        typer.echo(json.dumps(state.to_dict(), indent=2))
+    else:
+        typer.echo(format_session_state(state))
+
+
+@session_app.command("list")
+def session_list(
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    """List all saved sessions.
+
+    Examples:
+        idlergear session list        # List all sessions
+        idlergear session list --json # JSON output
+    """
+    import json
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.sessions import list_sessions
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    sessions = list_sessions()
+
+    if not sessions:
+        typer.secho("No saved sessions.", fg=typer.colors.YELLOW)
+        return
+
+    if json_output:
+        typer.echo(json.dumps(sessions, indent=2))
+    else:
+        typer.secho(
+            f"Saved sessions ({len(sessions)}):", fg=typer.colors.CYAN, bold=True
+        )
+        for session in sessions:
+            name = session["name"]
+            saved_at = session.get("saved_at", "unknown")
+            task = session.get("current_task")
+
+            # Parse saved_at to show relative time
+            try:
+                from datetime import datetime
+
+                dt = datetime.fromisoformat(saved_at.replace("Z", "+00:00"))
+                elapsed = datetime.now() - dt.replace(tzinfo=None)
+                hours = int(elapsed.total_seconds() / 3600)
+                if hours < 1:
+                    time_str = f"{int(elapsed.total_seconds() / 60)}m ago"
+                elif hours < 24:
+                    time_str = f"{hours}h ago"
+                else:
+                    time_str = f"{hours // 24}d ago"
+            except (ValueError, TypeError):
+                time_str = saved_at
+
+            task_str = f" - {task}" if task else ""
+            typer.echo(f"  {name:30s} {time_str:12s}{task_str}")
+
+
+@session_app.command("show")
+def session_show(
+    session_id: str = typer.Argument(..., help="Session ID to show (e.g., s001)"),
+    branch: str = typer.Option("main", "--branch", "-b", help="Branch name"),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    """Show detailed session snapshot.
+
+    Examples:
+        idlergear session show s001       # Show session details
+        idlergear session show s003 --json  # JSON output
+    """
+    import json
+
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_history import SessionHistory
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        history = SessionHistory()
+        snapshot = history.load_snapshot(session_id, branch)
+
+        if snapshot is None:
+            typer.secho(
+                f"Session '{session_id}' not found in branch '{branch}'.",
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(1)
+
+        if json_output:
+            typer.echo(json.dumps(snapshot.to_dict(), indent=2))
+        else:
+            # Format human-readable output
+            typer.secho(
+                f"\nSession: {snapshot.session_id}", fg=typer.colors.CYAN, bold=True
+            )
+            typer.echo(f"Branch: {snapshot.branch}")
+            typer.echo(f"Timestamp: {snapshot.timestamp}")
+            typer.echo(f"Duration: {snapshot.duration_seconds}s")
+
+            if snapshot.parent:
+                typer.echo(f"Parent: {snapshot.parent}")
+
+            # State
+            state = snapshot.state
+            if state:
+                typer.echo("\nState:")
+                if state.get("current_task_id"):
+                    typer.echo(f"  Task: #{state['current_task_id']}")
+                if state.get("working_files"):
+                    typer.echo(f"  Files: {', '.join(state['working_files'][:3])}")
+                if state.get("notes"):
+                    typer.echo(f"  Notes: {state['notes']}")
+
+            # Outcome
+            outcome = snapshot.outcome
+            if outcome:
+                typer.echo("\nOutcome:")
+                if outcome.get("status"):
+                    typer.echo(f"  Status: {outcome['status']}")
+                if outcome.get("goals_achieved"):
+                    typer.echo(f"  Goals: {', '.join(outcome['goals_achieved'])}")
+                if outcome.get("next_steps"):
+                    typer.echo(f"  Next: {', '.join(outcome['next_steps'])}")
+
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("diff")
+def session_diff(
+    session1: str = typer.Argument(..., help="First session ID (e.g., s001)"),
+    session2: str = typer.Argument(..., help="Second session ID (e.g., s002)"),
+    branch: str = typer.Option("main", "--branch", "-b", help="Branch name"),
+):
+    """Compare two session snapshots.
+
+    Examples:
+        idlergear session diff s001 s002  # Compare two sessions
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_history import SessionHistory
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        history = SessionHistory()
+        snap1 = history.load_snapshot(session1, branch)
+        snap2 = history.load_snapshot(session2, branch)
+
+        if snap1 is None:
+            typer.secho(f"Session '{session1}' not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+        if snap2 is None:
+            typer.secho(f"Session '{session2}' not found.", fg=typer.colors.RED)
+            raise typer.Exit(1)
+
+        typer.secho(
+            f"\nComparing {session1} vs {session2}:", fg=typer.colors.CYAN, bold=True
+        )
+
+        # Compare timestamps
+        typer.echo("\nTime:")
+        typer.echo(f"  {session1}: {snap1.timestamp}")
+        typer.echo(f"  {session2}: {snap2.timestamp}")
+
+        # Compare durations
+        typer.echo("\nDuration:")
+        typer.echo(f"  {session1}: {snap1.duration_seconds}s")
+        typer.echo(f"  {session2}: {snap2.duration_seconds}s")
+
+        # Compare tasks
+        task1 = snap1.state.get("current_task_id")
+        task2 = snap2.state.get("current_task_id")
+        if task1 != task2:
+            typer.echo("\nTask changed:")
+            typer.echo(f"  {session1}: #{task1}" if task1 else f"  {session1}: None")
+            typer.echo(f"  {session2}: #{task2}" if task2 else f"  {session2}: None")
+
+        # Compare files
+        files1 = set(snap1.state.get("working_files", []))
+        files2 = set(snap2.state.get("working_files", []))
+
+        added_files = files2 - files1
+        removed_files = files1 - files2
+
+        if added_files or removed_files:
+            typer.echo("\nFiles changed:")
+            if added_files:
+                typer.secho(f"  Added: {', '.join(added_files)}", fg=typer.colors.GREEN)
+            if removed_files:
+                typer.secho(
+                    f"  Removed: {', '.join(removed_files)}", fg=typer.colors.RED
+                )
+
+        # Compare outcomes
+        outcome1 = snap1.outcome.get("status")
+        outcome2 = snap2.outcome.get("status")
+        if outcome1 != outcome2:
+            typer.echo("\nOutcome:")
+            typer.echo(f"  {session1}: {outcome1}")
+            typer.echo(f"  {session2}: {outcome2}")
+
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("checkpoints")
+def session_checkpoints(
+    limit: int = typer.Option(
+        10, "--limit", "-l", help="Number of checkpoints to show"
+    ),
+    json_output: bool = typer.Option(False, "--json", "-j", help="Output as JSON"),
+):
+    """List auto-saved checkpoints.
+
+    Checkpoints are lightweight auto-saves created every 15 minutes
+    for crash recovery.
+
+    Examples:
+        idlergear session checkpoints         # List recent checkpoints
+        idlergear session checkpoints --limit 20  # Show more
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_history import SessionHistory
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        history = SessionHistory()
+        checkpoints = history.list_checkpoints()
+
+        if not checkpoints:
+            typer.secho("No checkpoints found.", fg=typer.colors.YELLOW)
+            typer.echo(
+                "Checkpoints are auto-saved every 15 minutes during active sessions."
+            )
+            return
+
+        # Limit results
+        if limit:
+            checkpoints = checkpoints[-limit:]
+
+        if json_output:
+            import json
+
+            print(json.dumps(checkpoints, indent=2))
+            return
+
+        typer.secho(
+            f"\n📌 Session Checkpoints (showing {len(checkpoints)}):\n", bold=True
+        )
+
+        for cp in reversed(checkpoints):  # Show newest first
+            checkpoint_id = cp["checkpoint_id"]
+            timestamp = cp["timestamp"]
+
+            # Format timestamp
+            try:
+                from datetime import datetime
+
+                dt = datetime.fromisoformat(timestamp)
+                elapsed = datetime.now() - dt
+                hours = int(elapsed.total_seconds() / 3600)
+                if hours < 1:
+                    minutes = int(elapsed.total_seconds() / 60)
+                    time_ago = f"{minutes}m ago"
+                elif hours < 24:
+                    time_ago = f"{hours}h ago"
+                else:
+                    days = hours // 24
+                    time_ago = f"{days}d ago"
+            except (ValueError, TypeError):
+                time_ago = "unknown"
+
+            typer.echo(f"  {checkpoint_id}  {time_ago}  ({timestamp})")
+
+        typer.echo()
+    except Exception as e:
+        typer.secho(f"Error listing checkpoints: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("recover")
+def session_recover(
+    checkpoint_id: str = typer.Option(
+        None, "--checkpoint", "-c", help="Specific checkpoint ID (default: latest)"
+    ),
+):
+    """Recover session state from a checkpoint.
+
+    Loads the checkpoint state and displays it. Use this to recover from a crash
+    or to see what state was auto-saved.
+
+    Examples:
+        idlergear session recover            # Recover from latest checkpoint
+        idlergear session recover --checkpoint c005  # Recover from specific checkpoint
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_history import SessionHistory
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        history = SessionHistory()
+
+        if checkpoint_id:
+            checkpoint = history.load_checkpoint(checkpoint_id)
+        else:
+            checkpoint = history.load_checkpoint()
+
+        if not checkpoint:
+            typer.secho("No checkpoint found.", fg=typer.colors.YELLOW)
+            if checkpoint_id:
+                typer.echo(f"Checkpoint {checkpoint_id} does not exist.")
+            else:
+                typer.echo(
+                    "No checkpoints available. They are created every 15 minutes during active sessions."
+                )
+            return
+
+        # Display checkpoint info
+        cp_id = checkpoint["checkpoint_id"]
+        timestamp = checkpoint["timestamp"]
+        state = checkpoint.get("state", {})
+
+        typer.secho(
+            f"\n💾 Recovered Checkpoint: {cp_id}\n", bold=True, fg=typer.colors.GREEN
+        )
+        typer.echo(f"Saved at: {timestamp}\n")
+
+        # Show state
+        typer.secho("State:", bold=True)
+        if state.get("current_task_id"):
+            typer.echo(f"  Current task: #{state['current_task_id']}")
+        else:
+            typer.echo("  Current task: None")
+
+        if state.get("working_files"):
+            typer.echo(f"  Working files ({len(state['working_files'])}):")
+            for f in state["working_files"][:5]:
+                typer.echo(f"    - {f}")
+            if len(state["working_files"]) > 5:
+                typer.echo(f"    ... and {len(state['working_files']) - 5} more")
+
+        if state.get("notes"):
+            typer.echo(f"  Notes: {state['notes']}")
+
+        typer.echo()
+
+    except Exception as e:
+        typer.secho(f"Error recovering checkpoint: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("stats")
+def session_stats(
+    days: int = typer.Option(7, "--days", "-d", help="Number of days to analyze"),
+    branch: str = typer.Option("main", "--branch", "-b", help="Branch to analyze"),
+):
+    """Show session statistics and analytics.
+
+    Display productivity metrics, session overview, and tool usage
+    statistics for recent sessions.
+
+    Examples:
+        idlergear session stats              # Last 7 days
+        idlergear session stats --days 30    # Last 30 days
+        idlergear session stats --branch experiment  # Specific branch
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_analytics import SessionStats, format_stats_output
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        stats = SessionStats()
+
+        # Get and display overview stats
+        overview = stats.get_overview_stats(days=days, branch=branch)
+        typer.echo(format_stats_output(overview))
+
+        # Get and display tool usage if we have sessions
+        if overview["total_sessions"] > 0:
+            tool_stats = stats.get_tool_usage_stats(days=days, branch=branch)
+            if tool_stats["total_calls"] > 0:
+                typer.echo("\n🔧 Tool Usage:")
+                for tool_stat in tool_stats["tools"][:5]:  # Top 5 tools
+                    typer.echo(
+                        f"  {tool_stat['tool']}: {tool_stat['calls']} calls "
+                        f"({tool_stat['percentage']})"
+                    )
+
+            # Get and display success rate
+            success = stats.get_success_rate(days=days, branch=branch)
+            if success["total_sessions"] > 0:
+                typer.echo("\n✅ Success Rate:")
+                typer.echo(
+                    f"  {success['success_rate']} "
+                    f"({success['successful']}/{success['total_sessions']} sessions)"
+                )
+
+    except RuntimeError as e:
+        typer.secho(str(e), fg=typer.colors.RED)
+        raise typer.Exit(1)
+    except Exception as e:
+        typer.secho(f"Error calculating stats: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("branch")
+def session_branch(
+    branch_name: str,
+    from_session: str = typer.Option(
+        None, "--from", help="Session ID to branch from (default: latest)"
+    ),
+    from_branch: str = typer.Option(
+        "main", "--from-branch", help="Branch to fork from"
+    ),
+    purpose: str = typer.Option(None, "--purpose", "-p", help="Purpose of this branch"),
+):
+    """Create a new session branch.
+
+    Enables git-like branching to try different approaches without losing main work.
+
+    Examples:
+        idlergear session branch experiment-graphql
+        idlergear session branch try-alternative --from main/s002
+        idlergear session branch risky-refactor --purpose "Try new architecture"
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_branching import SessionBranching
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        branching = SessionBranching()
+        branch_info = branching.create_branch(
+            branch_name=branch_name,
+            from_session=from_session,
+            from_branch=from_branch,
+            purpose=purpose,
+        )
+
+        typer.secho(f"✓ Created branch '{branch_name}'", fg=typer.colors.GREEN)
+        typer.echo(f"  Forked from: {branch_info['forked_from']}")
+        if purpose:
+            typer.echo(f"  Purpose: {purpose}")
+        typer.echo(f"\nSwitch to it with: idlergear session checkout {branch_name}")
+
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("checkout")
+def session_checkout(branch_name: str):
+    """Switch to a different session branch.
+
+    Examples:
+        idlergear session checkout experiment-graphql
+        idlergear session checkout main
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_branching import SessionBranching
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        branching = SessionBranching()
+        result = branching.checkout_branch(branch_name)
+
+        typer.secho(f"✓ Switched to branch '{branch_name}'", fg=typer.colors.GREEN)
+        if result["latest_session"]:
+            typer.echo(f"  Latest session: {result['latest_session']}")
+        typer.echo(f"  Total sessions: {result['session_count']}")
+
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("branches")
+def session_branches():
+    """List all session branches.
+
+    Shows all branches with their status, session count, and creation time.
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_branching import SessionBranching
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        branching = SessionBranching()
+        branches = branching.list_branches()
+
+        if not branches:
+            typer.echo("No branches found.")
+            return
+
+        typer.echo("\nSession Branches:\n")
+        for branch in branches:
+            marker = "* " if branch["current"] else "  "
+            color = typer.colors.GREEN if branch["current"] else None
+
+            status_icon = {
+                "active": "🟢",
+                "merged": "✅",
+                "abandoned": "❌",
+            }.get(branch["status"], "")
+
+            typer.secho(f"{marker}{branch['name']}", fg=color, nl=False)
+            typer.echo(f" {status_icon} ({branch['sessions']} sessions)")
+
+            if branch.get("purpose"):
+                typer.echo(f"    Purpose: {branch['purpose']}")
+            if branch.get("forked_from"):
+                typer.echo(f"    Forked from: {branch['forked_from']}")
+
+    except Exception as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("merge")
+def session_merge(
+    source_branch: str,
+    target_branch: str = typer.Option("main", "--to", help="Target branch"),
+):
+    """Merge a branch into target branch.
+
+    Creates a new session in the target branch with the state from
+    the source branch's latest session.
+
+    Examples:
+        idlergear session merge experiment-graphql
+        idlergear session merge feature-a --to develop
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_branching import SessionBranching
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        branching = SessionBranching()
+        result = branching.merge_branch(source_branch, target_branch)
+
+        typer.secho(
+            f"✓ Merged '{source_branch}' into '{target_branch}'",
+            fg=typer.colors.GREEN,
+        )
+        typer.echo(f"  New session: {result['new_session']}")
+        typer.echo(f"  Branch '{source_branch}' marked as merged")
+
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("abandon")
+def session_abandon(
+    branch_name: str,
+    reason: str = typer.Option(None, "--reason", "-r", help="Reason for abandoning"),
+):
+    """Mark a branch as abandoned.
+
+    Use this when an experimental branch didn't work out.
+
+    Examples:
+        idlergear session abandon experiment-graphql --reason "Performance issues"
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_branching import SessionBranching
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        branching = SessionBranching()
+        branching.abandon_branch(branch_name, reason)
+
+        typer.secho(f"✓ Abandoned branch '{branch_name}'", fg=typer.colors.YELLOW)
+        if reason:
+            typer.echo(f"  Reason: {reason}")
+
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("harvest")
+def session_harvest(
+    session_id: str = typer.Option(
+        None, "--session", "-s", help="Session ID to harvest (default: latest)"
+    ),
+    branch: str = typer.Option("main", "--branch", "-b", help="Branch name"),
+    days: int = typer.Option(
+        None, "--days", "-d", help="Harvest recent sessions from last N days"
+    ),
+    save_note: bool = typer.Option(False, "--save", help="Save insights as note"),
+    patterns: bool = typer.Option(
+        False, "--patterns", help="Identify patterns across sessions"
+    ),
+):
+    """Extract knowledge and insights from completed sessions.
+
+    Analyzes sessions to identify lessons learned, patterns, and achievements.
+
+    Examples:
+        idlergear session harvest --session s003
+        idlergear session harvest --days 7 --patterns
+        idlergear session harvest --session s005 --save
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_knowledge import KnowledgeHarvester
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        harvester = KnowledgeHarvester()
+
+        if patterns:
+            # Show patterns across multiple sessions
+            pattern_days = days or 30
+            result = harvester.identify_patterns(days=pattern_days, branch=branch)
+
+            typer.echo(
+                f"\n📊 Patterns (last {pattern_days} days, {result['total_sessions']} sessions):\n"
+            )
+
+            for pattern in result["patterns"]:
+                typer.secho(f"  • {pattern['description']}", fg=typer.colors.CYAN)
+
+        elif days:
+            # Harvest recent sessions
+            harvested = harvester.harvest_recent_sessions(days=days, branch=branch)
+
+            typer.echo(
+                f"\n💡 Knowledge from last {days} days ({len(harvested)} sessions):\n"
+            )
+
+            for knowledge in harvested:
+                session_id = knowledge["session_id"]
+                typer.secho(f"Session {session_id}:", fg=typer.colors.BRIGHT_BLUE)
+
+                for insight in knowledge.get("insights", []):
+                    typer.echo(f"  • {insight.get('content', '')}")
+
+                typer.echo("")
+
+        else:
+            # Harvest single session
+            if not session_id:
+                # Get latest session
+                from idlergear.session_history import SessionHistory
+
+                history = SessionHistory()
+                latest = history.get_latest_snapshot(branch)
+                if not latest:
+                    typer.secho("No sessions found", fg=typer.colors.RED)
+                    raise typer.Exit(1)
+                session_id = latest.session_id
+
+            knowledge = harvester.harvest_session(session_id, branch)
+
+            typer.echo(f"\n💡 Session {session_id} Knowledge:\n")
+            typer.echo(f"  Duration: {knowledge['duration_minutes']} minutes")
+            typer.echo("  Insights:\n")
+
+            for insight in knowledge.get("insights", []):
+                typer.echo(f"    • {insight.get('content', '')}")
+
+            # Save as note if requested
+            if save_note:
+                note = harvester.save_as_note(knowledge)
+                typer.echo(f"\n✓ Saved as note #{note['id']}: {note['title']}")
+
+    except ValueError as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("analyze")
+def session_analyze(
+    session_id: str,
+    branch: str = typer.Option("main", "--branch", "-b", help="Branch name"),
+):
+    """Analyze a specific session for efficiency and insights.
+
+    Provides detailed breakdown of session time, tool usage, and patterns.
+
+    Examples:
+        idlergear session analyze s003
+        idlergear session analyze s005 --branch experiment
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.session_history import SessionHistory
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    try:
+        history = SessionHistory()
+        snapshot = history.load_snapshot(session_id, branch)
+
+        if not snapshot:
+            typer.secho(
+                f"Session '{session_id}' not found in branch '{branch}'",
+                fg=typer.colors.RED,
+            )
+            raise typer.Exit(1)
+
+        # Display analysis
+        typer.echo(f"\n📊 Session {session_id} Analysis\n")
+
+        duration_min = snapshot.duration_seconds // 60
+        duration_sec = snapshot.duration_seconds % 60
+        typer.echo(f"⏱️  Duration: {duration_min}m {duration_sec}s")
+
+        outcome = snapshot.outcome
+        status = outcome.get("status", "unknown")
+        status_icon = "✅" if status == "success" else "❌"
+        typer.echo(f"{status_icon} Outcome: {status}")
+
+        # Task info
+        state = snapshot.state
+        current_task = state.get("current_task_id")
+        if current_task:
+            typer.echo(f"🎯 Task: #{current_task}")
+
+        # Working files
+        working_files = state.get("working_files", [])
+        if working_files:
+            typer.echo(f"\n📁 Files Modified: {len(working_files)}")
+            for file in working_files[:5]:  # Show first 5
+                typer.echo(f"  • {file}")
+            if len(working_files) > 5:
+                typer.echo(f"  ... and {len(working_files) - 5} more")
+
+        # Tool usage
+        tool_usage = outcome.get("tool_usage", {})
+        if tool_usage:
+            typer.echo("\n🔧 Tool Usage:")
+            total_calls = sum(tool_usage.values())
+
+            for tool, count in sorted(
+                tool_usage.items(), key=lambda x: x[1], reverse=True
+            )[:5]:
+                percentage = (count / total_calls * 100) if total_calls > 0 else 0
+                typer.echo(f"  {tool}: {count} calls ({percentage:.1f}%)")
+
+        # Tasks created/completed
+        tasks_created = outcome.get("tasks_created", [])
+        tasks_completed = outcome.get("tasks_completed", [])
+
+        if tasks_created or tasks_completed:
+            typer.echo("\n✅ Tasks:")
+            if tasks_created:
+                typer.echo(f"  Created: {len(tasks_created)}")
+            if tasks_completed:
+                typer.echo(f"  Completed: {len(tasks_completed)}")
+
+    except Exception as e:
+        typer.secho(f"Error: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+
+@session_app.command("monitor")
+def session_monitor(
+    session_file: str = typer.Option(
+        None,
+        "--file",
+        "-f",
+        help="Session file to monitor (auto-detect if not provided)",
+    ),
+):
+    """Monitor active session in real-time.
+
+    Watch your Claude Code session as it happens. See tool calls,
+    task operations, file changes, and more—all in a beautiful TUI.
+
+    Also available as standalone command: idlerwatch
+
+    Examples:
+        idlergear session monitor           # Monitor current session
+        idlergear session monitor --file /path/to/session.jsonl
+        idlerwatch                            # Shortcut command
+    """
+    from pathlib import Path
+    from idlergear.tui import run_monitor
+
+    session_path = Path(session_file) if session_file else None
+
+    try:
+        run_monitor(session_path)
+    except KeyboardInterrupt:
+        # Clean exit on Ctrl+C
+        pass
+    except Exception as e:
+        typer.secho(f"Error running monitor: {e}", fg=typer.colors.RED)
+        raise typer.Exit(1)
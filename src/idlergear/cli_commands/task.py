@@ -0,0 +1,332 @@
+"""`idlergear task` commands."""
+
+import typer
+
+from idlergear.cli import validate_labels
+from idlergear.display import display
+
+task_app = typer.Typer(help="Task management (→ GitHub Issues)")
+
+
+# Task commands
+@task_app.command("create")
+def task_create(
+    title: str,
+    body: str = typer.Option(None, "--body", "-b", help="Task body/description"),
+    labels: list[str] = typer.Option([], "--label", "-l", help="Labels"),
+    priority: str = typer.Option(
+        None, "--priority", "-p", help="Priority: high, medium, low"
+    ),
+    due: str = typer.Option(None, "--due", "-d", help="Due date (YYYY-MM-DD)"),
+    milestone: str = typer.Option(
+        None, "--milestone", "-m", help="Milestone number or title"
+    ),
+    needs_tests: bool = typer.Option(
+        False, "--needs-tests", help="Mark task as requiring test coverage"
+    ),
+    no_validate: bool = typer.Option(
+        False, "--no-validate", help="Skip label validation"
+    ),
+):
+    """Create a new task."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+    import subprocess
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("task")
+
+    # Add needs-tests label if flag is set
+    labels_list = list(labels) if labels else []
+    if needs_tests and "needs-tests" not in labels_list:
+        labels_list.append("needs-tests")
+
+    # Validate and potentially create labels if any were provided
+    if labels_list and not no_validate:
+        valid_labels, invalid_labels = validate_labels(labels_list)
+
+        if invalid_labels:
+            # Ask user if they want to create the missing labels
+            create = typer.confirm(
+                f"Create missing labels: {', '.join(invalid_labels)}?",
+                default=True,
+            )
+
+            if create:
+                for label in invalid_labels:
+                    try:
+                        subprocess.run(
+                            ["gh", "label", "create", label],
+                            capture_output=True,
+                            text=True,
+                            check=True,
+                        )
+                        typer.secho(
+                            f"  ✓ Created label: {label}", fg=typer.colors.GREEN
+                        )
+                    except subprocess.CalledProcessError:
+                        typer.secho(
+                            f"  ✗ Failed to create label: {label}", fg=typer.colors.RED
+                        )
+                        raise typer.Exit(1)
+            else:
+                typer.secho(
+                    "Cancelled - cannot create task without valid labels.",
+                    fg=typer.colors.YELLOW,
+                )
+                raise typer.Exit(1)
+
+    task = backend.create(
+        title,
+        body=body,
+        labels=labels_list if labels_list else None,
+        priority=priority,
+        due=due,
+        milestone=milestone,
+    )
+    typer.secho(f"Created task #{task['id']}: {task['title']}", fg=typer.colors.GREEN)
+
+    # Auto-add to project if configured
+    from idlergear.projects import auto_add_task_if_configured
+    from idlergear.config import get_config_value
+
+    if auto_add_task_if_configured(task["id"]):
+        default_project = get_config_value("projects.default_project")
+        typer.secho(f"  ✓ Added to project '{default_project}'", fg=typer.colors.GREEN)
+
+
+@task_app.command("list")
+def task_list(
+    ctx: typer.Context,
+    state: str = typer.Option(
+        "open", "--state", "-s", help="Filter by state: open, closed, all"
+    ),
+    priority: str = typer.Option(
+        None, "--priority", "-p", help="Filter by priority: high, medium, low"
+    ),
+    labels: list[str] = typer.Option(
+        [], "--label", "-l", help="Filter by labels (can specify multiple)"
+    ),
+    limit: int = typer.Option(None, "--limit", "-n", help="Limit number of results"),
+    preview: bool = typer.Option(
+        False,
+        "--preview",
+        help="Show brief preview instead of full body (token-efficient)",
+    ),
+):
+    """List tasks.
+
+    Examples:
+        idlergear task list                  # List all open tasks
+        idlergear task list --limit 5        # Top 5 tasks only
+        idlergear task list --preview        # Titles only (minimal tokens)
+        idlergear task list --state all      # Include closed tasks
+        idlergear task list --label bug      # Only bug tasks
+    """
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("task")
+    tasks = backend.list(state=state)
+
+    # Filter by priority if specified
+    if priority:
+        tasks = [t for t in tasks if t.get("priority") == priority]
+
+    # Filter by labels if specified
+    if labels:
+        tasks = [
+            t for t in tasks if any(label in t.get("labels", []) for label in labels)
+        ]
+
+    # Apply limit if specified
+    if limit:
+        tasks = tasks[:limit]
+
+    # Strip task bodies if preview mode (token-efficient)
+    if preview:
+        for task in tasks:
+            task["body"] = None
+
+    display(tasks, ctx.obj.output_format, "tasks")
+
+
+@task_app.command("show")
+def task_show(ctx: typer.Context, task_id: int):
+    """Show a task."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+    from idlergear.git import GitServer
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("task")
+    task = backend.get(task_id)
+
+    if task is None and ctx.obj.output_format == "human":
+        typer.secho(f"Task #{task_id} not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    # Add test coverage info if in a git repo
+    try:
+        git = GitServer()
+        coverage = git.get_task_test_coverage(task_id)
+        task["test_coverage"] = coverage
+    except Exception:
+        # Not in a git repo or other error - continue without coverage info
+        pass
+
+    display(task, ctx.obj.output_format, "task")
+
+
+@task_app.command("close")
+def task_close(
+    task_id: int,
+    comment: str = typer.Option(None, "--comment", "-c", help="Closing comment"),
+):
+    """Close a task.
+
+    Optionally provide a closing comment. When using GitHub backend,
+    the comment will be added to the issue.
+    """
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+    from idlergear.git import GitServer
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("task")
+
+    # Get task first to check labels before closing
+    task = backend.get(task_id)
+    if task is None:
+        typer.secho(f"Task #{task_id} not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    # Check if task needs tests but none were added
+    if task.get("labels") and "needs-tests" in task["labels"]:
+        try:
+            git = GitServer()
+            coverage = git.get_task_test_coverage(task_id)
+            if not coverage["has_tests"]:
+                typer.secho(
+                    "⚠️  Warning: Task marked 'needs-tests' but no test files in commits",
+                    fg=typer.colors.YELLOW,
+                )
+                typer.secho(
+                    "   Consider adding tests before closing.",
+                    fg=typer.colors.YELLOW,
+                )
+                if not typer.confirm("Close anyway?", default=False):
+                    typer.secho("Task close aborted.", fg=typer.colors.CYAN)
+                    raise typer.Abort()
+        except typer.Abort:
+            # Re-raise Abort to allow it to propagate
+            raise
+        except Exception:
+            # Not in a git repo or other error - continue without check
+            pass
+
+    # Proceed with close
+    task = backend.close(task_id, comment=comment)
+    if task is None:
+        typer.secho(f"Task #{task_id} not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    typer.secho(f"Closed task #{task_id}: {task['title']}", fg=typer.colors.GREEN)
+    if comment:
+        typer.secho(f"  Comment: {comment}", fg=typer.colors.CYAN)
+
+
+@task_app.command("edit")
+def task_edit(
+    task_id: int,
+    title: str = typer.Option(None, "--title", "-t", help="New title"),
+    body: str = typer.Option(None, "--body", "-b", help="New body"),
+    add_label: list[str] = typer.Option([], "--add-label", help="Add label"),
+    priority: str = typer.Option(
+        None, "--priority", "-p", help="Priority: high, medium, low (empty to clear)"
+    ),
+    due: str = typer.Option(
+        None, "--due", "-d", help="Due date (YYYY-MM-DD, empty to clear)"
+    ),
+):
+    """Edit a task."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("task")
+
+    # Get current task to merge labels
+    current = backend.get(task_id)
+    if current is None:
+        typer.secho(f"Task #{task_id} not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    labels = None
+    if add_label:
+        labels = list(set(current.get("labels", []) + list(add_label)))
+
+    task = backend.update(
+        task_id, title=title, body=body, labels=labels, priority=priority, due=due
+    )
+    typer.secho(f"Updated task #{task_id}", fg=typer.colors.GREEN)
+
+
+@task_app.command("reopen")
+def task_reopen(task_id: int):
+    """Reopen a closed task."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("task")
+    task = backend.reopen(task_id)
+    if task is None:
+        typer.secho(f"Task #{task_id} not found.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    typer.secho(f"Reopened task #{task_id}: {task['title']}", fg=typer.colors.GREEN)
+
+
+@task_app.command("sync")
+def task_sync(target: str = typer.Argument("github")):
+    """Sync tasks with remote."""
+    typer.echo(f"Syncing tasks to {target}...")
+    # See task #317
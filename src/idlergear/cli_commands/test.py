@@ -0,0 +1,750 @@
+"""`idlergear test` commands."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from idlergear.cli import OutputFormat
+
+test_app = typer.Typer(help="Test framework detection and status")
+
+
+# ============================================================================
+# Test commands - Test framework detection and status tracking
+# ============================================================================
+
+
+@test_app.command("detect")
+def test_detect(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory to analyze"),
+):
+    """Detect test framework in use.
+
+    Supports: pytest, cargo test, dotnet test, jest, vitest, go test, rspec
+
+    Examples:
+        idlergear test detect        # Detect in current directory
+        idlergear test detect ./api  # Detect in specific directory
+    """
+    from pathlib import Path
+
+    from idlergear.testing import detect_framework
+
+    project_path = Path(path).resolve()
+    if not project_path.exists():
+        typer.secho(f"Path does not exist: {path}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    config = detect_framework(project_path)
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                {
+                    "framework": config.framework,
+                    "command": config.command,
+                    "test_dir": config.test_dir,
+                    "test_pattern": config.test_pattern,
+                }
+            )
+        )
+    else:
+        if config.framework == "unknown":
+            typer.secho("No test framework detected.", fg=typer.colors.YELLOW)
+            typer.echo("\nSupported frameworks:")
+            typer.echo("  • pytest (Python)")
+            typer.echo("  • cargo test (Rust)")
+            typer.echo("  • dotnet test (.NET)")
+            typer.echo("  • jest/vitest (JavaScript)")
+            typer.echo("  • go test (Go)")
+            typer.echo("  • rspec (Ruby)")
+        else:
+            typer.secho(f"Framework: {config.framework}", fg=typer.colors.GREEN)
+            typer.echo(f"Command: {config.command}")
+            if config.test_dir:
+                typer.echo(f"Test directory: {config.test_dir}")
+            if config.test_pattern:
+                typer.echo(f"Test pattern: {config.test_pattern}")
+
+
+@test_app.command("status")
+def test_status(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory"),
+):
+    """Show last test run status.
+
+    Shows cached results from the most recent test run.
+
+    Examples:
+        idlergear test status        # Show last run status
+        idlergear test status --json # JSON output
+    """
+    from pathlib import Path
+
+    from idlergear.testing import format_status, get_last_result
+
+    project_path = Path(path).resolve()
+    result = get_last_result(project_path)
+
+    if result is None:
+        if ctx.obj.output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps({"status": "no_results", "message": "No test results found"})
+            )
+        else:
+            typer.secho("No test results found.", fg=typer.colors.YELLOW)
+            typer.echo("\nRun tests with: idlergear test run")
+        return
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                {
+                    "framework": result.framework,
+                    "timestamp": result.timestamp,
+                    "duration_seconds": result.duration_seconds,
+                    "total": result.total,
+                    "passed": result.passed,
+                    "failed": result.failed,
+                    "skipped": result.skipped,
+                    "errors": result.errors,
+                    "failed_tests": result.failed_tests,
+                    "command": result.command,
+                    "exit_code": result.exit_code,
+                }
+            )
+        )
+    else:
+        typer.echo(format_status(result))
+
+
+@test_app.command("run")
+def test_run(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory"),
+    args: Optional[str] = typer.Option(
+        None, "--args", "-a", help="Additional arguments to pass to test command"
+    ),
+    verbose: bool = typer.Option(
+        False, "--verbose", "-v", help="Show full test output"
+    ),
+):
+    """Run tests and cache results.
+
+    Detects the test framework and runs tests, parsing and caching the results.
+
+    Examples:
+        idlergear test run                    # Run all tests
+        idlergear test run --args "-k auth"   # Run with extra args
+        idlergear test run --verbose          # Show full output
+    """
+    from pathlib import Path
+
+    from idlergear.testing import detect_framework, format_status, run_tests
+
+    project_path = Path(path).resolve()
+    if not project_path.exists():
+        typer.secho(f"Path does not exist: {path}", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    # Detect framework
+    config = detect_framework(project_path)
+    if config.framework == "unknown":
+        typer.secho("No test framework detected.", fg=typer.colors.RED)
+        typer.echo(
+            "\nSupported frameworks: pytest, cargo, dotnet, jest, vitest, go, rspec"
+        )
+        raise typer.Exit(1)
+
+    # Build command with extra args
+    command = config.command
+    if args:
+        command = f"{command} {args}"
+
+    typer.echo(f"Running: {command}")
+    typer.echo()
+
+    # Run tests
+    result, output = run_tests(project_path, config, extra_args=args)
+
+    if verbose:
+        typer.echo(output)
+        typer.echo()
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                {
+                    "framework": result.framework,
+                    "timestamp": result.timestamp,
+                    "duration_seconds": result.duration_seconds,
+                    "total": result.total,
+                    "passed": result.passed,
+                    "failed": result.failed,
+                    "skipped": result.skipped,
+                    "errors": result.errors,
+                    "failed_tests": result.failed_tests,
+                    "command": result.command,
+                    "exit_code": result.exit_code,
+                    "success": result.exit_code == 0,
+                }
+            )
+        )
+    else:
+        typer.echo(format_status(result))
+
+    # Exit with test exit code
+    if result.exit_code != 0:
+        raise typer.Exit(result.exit_code)
+
+
+@test_app.command("history")
+def test_history(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory"),
+    limit: int = typer.Option(10, "--limit", "-n", help="Number of results to show"),
+):
+    """Show test run history.
+
+    Examples:
+        idlergear test history           # Show last 10 runs
+        idlergear test history -n 5      # Show last 5 runs
+    """
+    from pathlib import Path
+
+    from idlergear.testing import get_history
+
+    project_path = Path(path).resolve()
+    history = get_history(project_path, limit=limit)
+
+    if not history:
+        if ctx.obj.output_format == OutputFormat.JSON:
+            typer.echo(json.dumps([]))
+        else:
+            typer.secho("No test history found.", fg=typer.colors.YELLOW)
+        return
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                [
+                    {
+                        "framework": r.framework,
+                        "timestamp": r.timestamp,
+                        "duration_seconds": r.duration_seconds,
+                        "total": r.total,
+                        "passed": r.passed,
+                        "failed": r.failed,
+                        "exit_code": r.exit_code,
+                    }
+                    for r in history
+                ]
+            )
+        )
+    else:
+        typer.secho(
+            f"Test history ({len(history)} runs):", fg=typer.colors.CYAN, bold=True
+        )
+        typer.echo()
+        for r in history:
+            # Format timestamp nicely
+            try:
+                from datetime import datetime
+
+                dt = datetime.fromisoformat(r.timestamp.replace("Z", "+00:00"))
+                time_str = dt.strftime("%Y-%m-%d %H:%M")
+            except Exception:
+                time_str = r.timestamp[:16]
+
+            # Status indicator
+            if r.failed > 0 or r.errors > 0:
+                status = typer.style("✗", fg=typer.colors.RED)
+            else:
+                status = typer.style("✓", fg=typer.colors.GREEN)
+
+            typer.echo(
+                f"  {status} {time_str} | {r.passed}/{r.total} passed | {r.duration_seconds:.1f}s"
+            )
+
+
+@test_app.command("list")
+def test_list(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory"),
+    files_only: bool = typer.Option(
+        False, "--files", "-f", help="List test files only, not individual tests"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", "-r", help="Re-enumerate tests (don't use cache)"
+    ),
+):
+    """List all tests in the project.
+
+    Enumerates tests using the framework's collection mechanism.
+
+    Examples:
+        idlergear test list           # List all tests
+        idlergear test list --files   # List test files only
+        idlergear test list --refresh # Force re-enumeration
+    """
+    from pathlib import Path
+
+    from idlergear.testing import enumerate_tests, get_enumeration, save_enumeration
+
+    project_path = Path(path).resolve()
+
+    # Use cache unless refresh requested
+    if not refresh:
+        enum = get_enumeration(project_path)
+        if enum is None:
+            enum = enumerate_tests(project_path)
+            if enum:
+                save_enumeration(enum, project_path)
+    else:
+        enum = enumerate_tests(project_path)
+        if enum:
+            save_enumeration(enum, project_path)
+
+    if enum is None:
+        if ctx.obj.output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": "No test framework detected"}))
+        else:
+            typer.secho("No test framework detected.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        if files_only:
+            typer.echo(
+                json.dumps(
+                    {
+                        "framework": enum.framework,
+                        "total_files": enum.total_files,
+                        "files": enum.test_files,
+                    }
+                )
+            )
+        else:
+            typer.echo(json.dumps(enum.to_dict()))
+    else:
+        typer.secho(
+            f"Tests ({enum.framework}): {enum.total_tests} tests in {enum.total_files} files",
+            fg=typer.colors.CYAN,
+            bold=True,
+        )
+        typer.echo()
+
+        if files_only:
+            for f in enum.test_files:
+                typer.echo(f"  {f}")
+        else:
+            # Group by file
+            by_file: dict[str, list[str]] = {}
+            for item in enum.test_items:
+                if item.file not in by_file:
+                    by_file[item.file] = []
+                by_file[item.file].append(item.name)
+
+            for file in sorted(by_file.keys()):
+                typer.secho(f"  {file}", fg=typer.colors.GREEN)
+                for test in by_file[file][:10]:  # Limit per file
+                    typer.echo(f"    - {test}")
+                if len(by_file[file]) > 10:
+                    typer.echo(f"    ... and {len(by_file[file]) - 10} more")
+
+
+@test_app.command("coverage")
+def test_coverage(
+    ctx: typer.Context,
+    file: Optional[str] = typer.Argument(
+        None, help="Source file to check coverage for"
+    ),
+    path: str = typer.Option(".", "--path", "-p", help="Project directory"),
+    refresh: bool = typer.Option(False, "--refresh", "-r", help="Rebuild coverage map"),
+):
+    """Show test coverage mapping.
+
+    Maps source files to their test files using naming conventions.
+
+    Examples:
+        idlergear test coverage                    # Show all mappings
+        idlergear test coverage src/foo.py         # Show tests for specific file
+        idlergear test coverage --refresh          # Rebuild coverage map
+    """
+    from pathlib import Path
+
+    from idlergear.testing import (
+        build_coverage_map,
+        get_coverage_map,
+        get_tests_for_file,
+    )
+
+    project_path = Path(path).resolve()
+
+    if file:
+        # Show tests for specific file
+        tests = get_tests_for_file(file, project_path)
+
+        if ctx.obj.output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"source_file": file, "test_files": tests}))
+        else:
+            if tests:
+                typer.secho(f"Tests for {file}:", fg=typer.colors.CYAN)
+                for t in tests:
+                    typer.echo(f"  - {t}")
+            else:
+                typer.secho(f"No tests found for {file}", fg=typer.colors.YELLOW)
+        return
+
+    # Show full coverage map
+    if refresh:
+        coverage_map = build_coverage_map(project_path)
+    else:
+        coverage_map = get_coverage_map(project_path)
+        if coverage_map is None:
+            coverage_map = build_coverage_map(project_path)
+
+    if coverage_map is None:
+        if ctx.obj.output_format == OutputFormat.JSON:
+            typer.echo(json.dumps({"error": "Could not build coverage map"}))
+        else:
+            typer.secho("Could not build coverage map.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        typer.echo(json.dumps(coverage_map.to_dict()))
+    else:
+        covered = len(coverage_map.mappings)
+        uncovered = len(coverage_map.uncovered)
+        total = covered + uncovered
+        pct = (covered / total * 100) if total > 0 else 0
+
+        typer.secho(
+            f"Coverage Map ({coverage_map.framework}): {covered}/{total} files have tests ({pct:.0f}%)",
+            fg=typer.colors.CYAN,
+            bold=True,
+        )
+        typer.echo()
+
+        if coverage_map.uncovered:
+            typer.secho("Uncovered files:", fg=typer.colors.YELLOW)
+            for f in coverage_map.uncovered[:20]:
+                typer.echo(f"  - {f}")
+            if len(coverage_map.uncovered) > 20:
+                typer.echo(f"  ... and {len(coverage_map.uncovered) - 20} more")
+
+
+@test_app.command("uncovered")
+def test_uncovered(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory"),
+):
+    """List source files without tests.
+
+    Examples:
+        idlergear test uncovered       # List uncovered files
+    """
+    from pathlib import Path
+
+    from idlergear.testing import get_uncovered_files
+
+    project_path = Path(path).resolve()
+    uncovered = get_uncovered_files(project_path)
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        typer.echo(json.dumps({"uncovered": uncovered, "count": len(uncovered)}))
+    else:
+        if uncovered:
+            typer.secho(
+                f"Uncovered files ({len(uncovered)}):",
+                fg=typer.colors.YELLOW,
+                bold=True,
+            )
+            for f in uncovered:
+                typer.echo(f"  - {f}")
+        else:
+            typer.secho("All source files have tests!", fg=typer.colors.GREEN)
+
+
+@test_app.command("changed")
+def test_changed(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory"),
+    since: Optional[str] = typer.Option(
+        None, "--since", "-s", help="Commit hash or ref to compare against"
+    ),
+    run: bool = typer.Option(False, "--run", "-r", help="Actually run the tests"),
+    args: Optional[str] = typer.Option(
+        None, "--args", "-a", help="Additional arguments for test command"
+    ),
+):
+    """Show or run tests for changed files.
+
+    Identifies which tests should run based on files changed since last commit.
+
+    Examples:
+        idlergear test changed                 # Show tests for uncommitted changes
+        idlergear test changed --run           # Run tests for changed files
+        idlergear test changed --since HEAD~3  # Tests for last 3 commits
+    """
+    from pathlib import Path
+
+    from idlergear.testing import (
+        format_status,
+        get_changed_files,
+        get_tests_for_changes,
+        run_changed_tests,
+    )
+
+    project_path = Path(path).resolve()
+
+    if run:
+        # Run the tests
+        result, output = run_changed_tests(project_path, since=since, extra_args=args)
+
+        if ctx.obj.output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "success": result.exit_code == 0,
+                        **result.to_dict(),
+                    }
+                )
+            )
+        else:
+            if result.total == 0 and result.errors == 0:
+                typer.secho(
+                    "No tests to run - no changed files affect tests.",
+                    fg=typer.colors.YELLOW,
+                )
+            else:
+                typer.echo(format_status(result))
+
+        if result.exit_code != 0:
+            raise typer.Exit(result.exit_code)
+    else:
+        # Just show what would run
+        changed = get_changed_files(project_path, since=since)
+        tests = get_tests_for_changes(project_path, since=since)
+
+        if ctx.obj.output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "changed_files": changed,
+                        "tests_to_run": tests,
+                        "changed_count": len(changed),
+                        "test_count": len(tests),
+                    }
+                )
+            )
+        else:
+            typer.secho(
+                f"Changed files: {len(changed)}", fg=typer.colors.CYAN, bold=True
+            )
+            for f in changed[:10]:
+                typer.echo(f"  - {f}")
+            if len(changed) > 10:
+                typer.echo(f"  ... and {len(changed) - 10} more")
+
+            typer.echo()
+            typer.secho(f"Tests to run: {len(tests)}", fg=typer.colors.CYAN, bold=True)
+            for t in tests[:10]:
+                typer.echo(f"  - {t}")
+            if len(tests) > 10:
+                typer.echo(f"  ... and {len(tests) - 10} more")
+
+            if tests:
+                typer.echo()
+                typer.echo("Run with: idlergear test changed --run")
+
+
+@test_app.command("impact")
+def test_impact(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory"),
+    args: Optional[str] = typer.Option(
+        None, "--args", "-a", help="Additional arguments for pytest"
+    ),
+):
+    """Record which tests execute which lines, for `test changed`.
+
+    Runs the whole pytest suite under coverage.py with one coverage context
+    per test. Afterwards `idlergear test changed` selects only the tests
+    that executed the changed lines. Re-record after large changes.
+
+    Requires pytest and coverage.py (pip install coverage).
+
+    Examples:
+        idlergear test impact                  # Record per-test coverage
+        idlergear test impact --args "-m 'not slow'"
+    """
+    from pathlib import Path
+
+    from idlergear.testing import format_status, record_test_impact
+
+    project_path = Path(path).resolve()
+    impact, result, output = record_test_impact(project_path, extra_args=args)
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                {
+                    "recorded": impact is not None,
+                    "tests": len(impact.tests) if impact else 0,
+                    "files": len(impact.lines) if impact else 0,
+                    "result": result.to_dict() if result else None,
+                    "message": None if impact else output[-2000:],
+                }
+            )
+        )
+    elif impact is None:
+        typer.secho("Failed to record test impact:", fg=typer.colors.RED)
+        typer.echo(output[-2000:])
+    else:
+        if result is not None:
+            typer.echo(format_status(result))
+            typer.echo()
+        typer.secho(
+            f"Recorded impact of {len(impact.tests)} tests on {len(impact.lines)} files",
+            fg=typer.colors.GREEN,
+        )
+
+    if impact is None:
+        raise typer.Exit(1)
+
+
+@test_app.command("sync")
+def test_sync(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory"),
+):
+    """Detect and import test runs from outside IdlerGear.
+
+    Checks for tests that ran via IDE, command line, or CI/CD and imports
+    their results into IdlerGear's tracking.
+
+    Examples:
+        idlergear test sync        # Check for external test runs
+    """
+    from pathlib import Path
+
+    from idlergear.testing import (
+        check_external_test_runs,
+        sync_external_runs,
+    )
+
+    project_path = Path(path).resolve()
+
+    # Check for external runs
+    external_runs = check_external_test_runs(project_path)
+
+    if not external_runs:
+        if ctx.obj.output_format == OutputFormat.JSON:
+            typer.echo(
+                json.dumps(
+                    {
+                        "external_detected": False,
+                        "imported": 0,
+                        "message": "No external test runs detected",
+                    }
+                )
+            )
+        else:
+            typer.echo("No external test runs detected.")
+        return
+
+    # Import them
+    imported = sync_external_runs(project_path)
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        typer.echo(
+            json.dumps(
+                {
+                    "external_detected": True,
+                    "external_runs": [r.to_dict() for r in external_runs],
+                    "imported": len(imported),
+                    "results": [r.to_dict() for r in imported],
+                }
+            )
+        )
+    else:
+        typer.secho(
+            f"Detected {len(external_runs)} external test run(s)",
+            fg=typer.colors.CYAN,
+            bold=True,
+        )
+        for run in external_runs:
+            status = "✅" if run.success else "❌" if run.success is False else "❓"
+            typer.echo(f"  {status} {run.cache_path} @ {run.timestamp}")
+            if run.estimated_tests:
+                typer.echo(f"     ~{run.estimated_tests} tests")
+
+        if imported:
+            typer.echo()
+            typer.secho(f"Imported {len(imported)} result(s)", fg=typer.colors.GREEN)
+            for result in imported:
+                typer.echo(f"  - {result.passed} passed, {result.failed} failed")
+        else:
+            typer.echo()
+            typer.secho(
+                "Could not import detailed results (cache may be incomplete)",
+                fg=typer.colors.YELLOW,
+            )
+
+
+@test_app.command("staleness")
+def test_staleness(
+    ctx: typer.Context,
+    path: str = typer.Argument(".", help="Project directory"),
+):
+    """Check how stale test results are.
+
+    Reports when tests were last run and whether tests have run outside
+    of IdlerGear since then.
+
+    Examples:
+        idlergear test staleness   # Check test result freshness
+    """
+    from pathlib import Path
+
+    from idlergear.testing import get_test_staleness
+
+    project_path = Path(path).resolve()
+    staleness = get_test_staleness(project_path)
+
+    if ctx.obj.output_format == OutputFormat.JSON:
+        typer.echo(json.dumps(staleness))
+    else:
+        if staleness["last_run"]:
+            seconds = staleness.get("seconds_ago", 0)
+            if seconds is None:
+                time_ago = "unknown"
+            elif seconds < 60:
+                time_ago = "just now"
+            elif seconds < 3600:
+                mins = int(seconds // 60)
+                time_ago = f"{mins} minute{'s' if mins != 1 else ''} ago"
+            elif seconds < 86400:
+                hours = int(seconds // 3600)
+                time_ago = f"{hours} hour{'s' if hours != 1 else ''} ago"
+            else:
+                days = int(seconds // 86400)
+                time_ago = f"{days} day{'s' if days != 1 else ''} ago"
+
+            typer.secho("Last recorded test run:", bold=True)
+            typer.echo(f"  {time_ago} ({staleness['last_run']})")
+        else:
+            typer.secho("No test runs recorded.", fg=typer.colors.YELLOW)
+
+        if staleness["external_detected"]:
+            typer.echo()
+            typer.secho(
+                "⚠️  External test runs detected!",
+                fg=typer.colors.YELLOW,
+                bold=True,
+            )
+            typer.echo("  Run 'idlergear test sync' to import them.")
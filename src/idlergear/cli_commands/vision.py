@@ -0,0 +1,81 @@
+"""`idlergear vision` commands."""
+
+import typer
+
+from idlergear.display import display
+
+vision_app = typer.Typer(help="Project vision management")
+
+
+# Vision commands
+@vision_app.command("show")
+def vision_show(ctx: typer.Context):
+    """Show the project vision."""
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("vision")
+    vision = backend.get()
+    display(vision, ctx.obj.output_format, "vision")
+
+
+@vision_app.command("edit")
+def vision_edit(
+    content: str = typer.Option(None, "--content", "-c", help="New vision content"),
+):
+    """Edit the project vision."""
+    import os
+    import subprocess
+    import tempfile
+
+    from idlergear.backends.registry import get_backend
+    from idlergear.config import find_idlergear_root
+
+    if find_idlergear_root() is None:
+        typer.secho(
+            "Not in an IdlerGear project. Run 'idlergear init' first.",
+            fg=typer.colors.RED,
+        )
+        raise typer.Exit(1)
+
+    backend = get_backend("vision")
+
+    if content is not None:
+        # Direct content update
+        backend.set(content)
+        typer.secho("Vision updated.", fg=typer.colors.GREEN)
+        return
+
+    # Open in editor
+    editor = os.environ.get("EDITOR", "nano")
+    current_vision = backend.get() or "# Project Vision\n\n"
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
+        f.write(current_vision)
+        temp_path = f.name
+
+    try:
+        subprocess.run([editor, temp_path], check=True)
+        with open(temp_path) as f:
+            new_content = f.read()
+        backend.set(new_content)
+        typer.secho("Vision updated.", fg=typer.colors.GREEN)
+    except subprocess.CalledProcessError:
+        typer.secho("Editor exited with error.", fg=typer.colors.RED)
+        raise typer.Exit(1)
+    finally:
+        os.unlink(temp_path)
+
+
+@vision_app.command("sync")
+def vision_sync(target: str = typer.Argument("github")):
+    """Sync vision with remote."""
+    typer.echo(f"Syncing vision to {target}...")
+    # See task #319
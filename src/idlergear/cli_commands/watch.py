@@ -0,0 +1,310 @@
+"""`idlergear watch` commands."""
+
+import json
+from typing import Optional
+
+import typer
+
+from idlergear.cli import OutputFormat
+
+watch_app = typer.Typer(help="Watch mode for proactive knowledge capture")
+
+
+@watch_app.command("check")
+def watch_check(
+    ctx: typer.Context,
+    act: bool = typer.Option(
+        False, "--act", "-a", help="Automatically create tasks from TODO/FIXME comments"
+    ),
+):
+    """One-shot analysis of project state with suggestions.
+
+    Analyzes git status, scans for TODO/FIXME comments in diff,
+    checks for stale references, and returns actionable suggestions.
+
+    With --act, automatically creates tasks from detected TODO comments.
+
+    Examples:
+        idlergear watch check              # Analyze and show suggestions
+        idlergear watch check --act        # Analyze AND auto-create tasks from TODOs
+        idlergear --output json watch check  # JSON output for AI agents
+    """
+    from idlergear.watch import analyze, analyze_and_act
+
+    if act:
+        status, actions = analyze_and_act(auto_create_tasks=True)
+    else:
+        status = analyze()
+        actions = []
+    output_format = (
+        getattr(ctx.obj, "output_format", OutputFormat.HUMAN)
+        if ctx.obj
+        else OutputFormat.HUMAN
+    )
+
+    if output_format == OutputFormat.JSON:
+        result = status.to_dict()
+        if actions:
+            result["actions"] = [a.to_dict() for a in actions]
+        typer.echo(json.dumps(result, indent=2))
+        return
+
+    # Human-readable output
+    typer.echo("Watch Analysis")
+    typer.echo("=" * 40)
+    typer.echo()
+
+    # Git status summary
+    typer.secho("Git Status:", bold=True)
+    typer.echo(f"  Files changed: {status.files_changed}")
+    typer.echo(f"  Lines added: {status.lines_added}")
+    typer.echo(f"  Lines deleted: {status.lines_deleted}")
+    if status.minutes_since_commit is not None:
+        typer.echo(f"  Time since commit: {status.minutes_since_commit} min")
+    typer.echo()
+
+    # Suggestions
+    if status.suggestions:
+        typer.secho(f"Suggestions ({len(status.suggestions)}):", bold=True)
+        typer.echo()
+
+        for suggestion in status.suggestions:
+            # Color based on severity
+            if suggestion.severity == "action":
+                color = typer.colors.RED
+                icon = "!"
+            elif suggestion.severity == "warning":
+                color = typer.colors.YELLOW
+                icon = "?"
+            else:
+                color = typer.colors.CYAN
+                icon = "i"
+
+            typer.secho(f"  [{icon}] {suggestion.message}", fg=color)
+
+            # Show context for certain categories
+            if suggestion.category == "todo" and suggestion.context.get("file"):
+                typer.echo(f"      File: {suggestion.context['file']}")
+                typer.echo(f"      Text: {suggestion.context.get('text', '')}")
+            elif suggestion.category == "reference" and suggestion.context.get(
+                "related_file"
+            ):
+                typer.echo(f"      Related: {suggestion.context['related_file']}")
+
+        typer.echo()
+    else:
+        typer.secho("No suggestions - project looks good!", fg=typer.colors.GREEN)
+
+    # Show actions taken
+    if actions:
+        typer.echo()
+        typer.secho("Actions Taken:", bold=True)
+        for action in actions:
+            if action.success:
+                typer.secho(f"  ✓ {action.message}", fg=typer.colors.GREEN)
+            else:
+                typer.secho(f"  ✗ {action.message}", fg=typer.colors.RED)
+
+
+@watch_app.command("versions")
+def watch_versions(
+    ctx: typer.Context,
+):
+    """Check for stale file version references in Python code.
+
+    Detects when Python scripts reference old versions of data files
+    (CSV, JSON, etc.) and suggests using the current version instead.
+
+    Examples:
+        idlergear watch versions              # Check for stale data file references
+        idlergear --output json watch versions  # JSON output for AI agents
+    """
+    from idlergear.watch import check_stale_data_references
+    from idlergear.config import find_idlergear_root
+
+    project_root = find_idlergear_root()
+    if project_root is None:
+        if ctx.obj["output"] == "json":
+            typer.echo('{"error": "Not in an IdlerGear project"}')
+        else:
+            typer.secho("Error: Not in an IdlerGear project", fg=typer.colors.RED)
+        raise typer.Exit(1)
+
+    warnings = check_stale_data_references(project_root)
+
+    if ctx.obj["output"] == "json":
+        import json
+
+        typer.echo(json.dumps({"warnings": warnings}, indent=2))
+    else:
+        if not warnings:
+            typer.secho(
+                "✓ No stale file version references found", fg=typer.colors.GREEN
+            )
+        else:
+            typer.secho(
+                f"\nFile Version Analysis ({len(warnings)} issues found)",
+                fg=typer.colors.YELLOW,
+                bold=True,
+            )
+            typer.echo()
+
+            for warning in warnings:
+                typer.secho(
+                    f"⚠️  {warning['source_file']}:{warning['line']}",
+                    fg=typer.colors.YELLOW,
+                )
+                typer.echo(f"    References stale: {warning['stale_file']}")
+                if warning.get("current_file"):
+                    typer.secho(
+                        f"    → Use instead: {warning['current_file']}",
+                        fg=typer.colors.GREEN,
+                    )
+                if warning.get("function"):
+                    typer.echo(f"    Function: {warning['function']}")
+                typer.echo()
+
+            typer.echo()
+            typer.secho(
+                f"Summary: {len(warnings)} stale file references detected",
+                fg=typer.colors.YELLOW,
+            )
+
+
+@watch_app.command("start")
+def watch_start(
+    interval: int = typer.Option(
+        10, "--interval", "-i", help="Check interval in seconds"
+    ),
+    quiet: bool = typer.Option(
+        False, "--quiet", "-q", help="Only show critical suggestions"
+    ),
+    polling: bool = typer.Option(
+        False, "--polling", "-p", help="Use polling instead of file system events"
+    ),
+    force: bool = typer.Option(
+        False, "--force", "-f", help="Start even if watch mode is disabled"
+    ),
+):
+    """Start watching for changes and prompting for knowledge capture.
+
+    This runs in the foreground and monitors file changes in real-time.
+    Press Ctrl+C to stop.
+
+    Examples:
+        idlergear watch start                # Start with defaults
+        idlergear watch start -q             # Only show critical suggestions
+        idlergear watch start -i 5           # Check every 5 seconds
+        idlergear watch start --polling      # Use polling mode (no watchdog)
+    """
+    from idlergear.watch import WatchConfig, run_interactive_watch
+
+    config = WatchConfig.load()
+
+    if not config.enabled and not force:
+        typer.secho("Watch mode is disabled", fg=typer.colors.YELLOW)
+        typer.echo()
+        typer.echo("Enable it with:")
+        typer.echo("  idlergear watch config enabled true")
+        typer.echo()
+        typer.echo("Or start anyway:")
+        typer.echo("  idlergear watch start --force")
+        return
+
+    # Update config with interval if provided
+    if interval != 10:
+        config.poll_interval = interval
+
+    run_interactive_watch(quiet=quiet, use_polling=polling)
+
+
+@watch_app.command("status")
+def watch_status():
+    """Show current watch statistics."""
+    from idlergear.watch import get_watch_stats
+
+    stats = get_watch_stats()
+
+    typer.echo("Watch Status:")
+    typer.echo()
+
+    if stats["changed_files"] > 0:
+        typer.secho(
+            f"  Changed files: {stats['changed_files']}", fg=typer.colors.YELLOW
+        )
+        typer.secho(
+            f"  Changed lines: {stats['changed_lines']}", fg=typer.colors.YELLOW
+        )
+    else:
+        typer.secho("  No uncommitted changes", fg=typer.colors.GREEN)
+
+    typer.echo()
+
+    if stats["todos"] > 0:
+        typer.secho(f"  TODO comments: {stats['todos']}", fg=typer.colors.YELLOW)
+    if stats["fixmes"] > 0:
+        typer.secho(f"  FIXME comments: {stats['fixmes']}", fg=typer.colors.RED)
+    if stats["hacks"] > 0:
+        typer.secho(f"  HACK comments: {stats['hacks']}", fg=typer.colors.MAGENTA)
+
+    if stats["todos"] == 0 and stats["fixmes"] == 0 and stats["hacks"] == 0:
+        typer.secho("  No code markers detected", fg=typer.colors.GREEN)
+
+
+@watch_app.command("config")
+def watch_config(
+    key: Optional[str] = typer.Argument(None, help="Config key"),
+    value: Optional[str] = typer.Argument(None, help="Config value"),
+):
+    """Get or set watch configuration."""
+    from idlergear.watch import WatchConfig
+
+    config = WatchConfig.load()
+
+    if not key:
+        # Show all config
+        typer.echo("Watch configuration:")
+        typer.echo()
+        typer.echo(f"  enabled: {config.enabled}")
+        typer.echo(f"  debounce: {config.debounce}s")
+        typer.echo(f"  files_changed_threshold: {config.files_changed_threshold}")
+        typer.echo(
+            f"  uncommitted_lines_threshold: {config.uncommitted_lines_threshold}"
+        )
+        typer.echo(f"  test_failures_threshold: {config.test_failures_threshold}")
+        typer.echo(f"  detect_todos: {config.detect_todos}")
+        typer.echo(f"  detect_fixmes: {config.detect_fixmes}")
+        typer.echo(f"  detect_hacks: {config.detect_hacks}")
+        return
+
+    if not value:
+        # Get specific value
+        if hasattr(config, key):
+            typer.echo(getattr(config, key))
+        else:
+            typer.secho(f"Unknown config key: {key}", fg=typer.colors.RED)
+        return
+
+    # Set value
+    if key == "enabled":
+        config.enabled = value.lower() == "true"
+    elif key == "debounce":
+        config.debounce = int(value)
+    elif key == "files_changed_threshold":
+        config.files_changed_threshold = int(value)
+    elif key == "uncommitted_lines_threshold":
+        config.uncommitted_lines_threshold = int(value)
+    elif key == "test_failures_threshold":
+        config.test_failures_threshold = int(value)
+    elif key == "detect_todos":
+        config.detect_todos = value.lower() == "true"
+    elif key == "detect_fixmes":
+        config.detect_fixmes = value.lower() == "true"
+    elif key == "detect_hacks":
+        config.detect_hacks = value.lower() == "true"
+    else:
+        typer.secho(f"Unknown config key: {key}", fg=typer.colors.RED)
+        return
+
+    config.save()
+    typer.secho(f"✓ Set watch.{key} = {value}", fg=typer.colors.GREEN)
@@ -0,0 +1,131 @@
+"""`idlergear wiki` commands."""
+
+from typing import Optional
+
+import typer
+
+wiki_app = typer.Typer(help="GitHub Wiki synchronization commands")
+
+
+@wiki_app.command("push")
+def wiki_push():
+    """Push IdlerGear references to GitHub Wiki."""
+    from idlergear.wiki import WikiSync
+
+    typer.echo("Pushing references to GitHub Wiki...")
+    typer.echo()
+
+    sync = WikiSync()
+    result = sync.push_references_to_wiki()
+
+    typer.echo(str(result))
+
+
+@wiki_app.command("pull")
+def wiki_pull(
+    overwrite: bool = typer.Option(
+        False, "--overwrite", help="Overwrite existing references"
+    ),
+):
+    """Pull GitHub Wiki pages into IdlerGear references."""
+    from idlergear.wiki import WikiSync
+
+    typer.echo("Pulling Wiki pages to references...")
+    typer.echo()
+
+    sync = WikiSync()
+    result = sync.pull_wiki_to_references(overwrite=overwrite)
+
+    typer.echo(str(result))
+
+
+@wiki_app.command("sync")
+def wiki_sync(
+    conflict_resolution: str = typer.Option(
+        "manual",
+        "--conflict",
+        help="Conflict resolution strategy (manual, local, remote)",
+    ),
+):
+    """Bidirectional sync between IdlerGear and GitHub Wiki."""
+    from idlergear.wiki import WikiSync
+
+    typer.echo("Syncing IdlerGear ↔ GitHub Wiki...")
+    typer.echo()
+
+    sync = WikiSync()
+    result = sync.sync_bidirectional(conflict_resolution=conflict_resolution)
+
+    typer.echo(str(result))
+
+    if result.conflicts and conflict_resolution == "manual":
+        typer.echo()
+        typer.echo("To resolve conflicts:")
+        typer.echo("  --conflict local   # Use local (IdlerGear) version")
+        typer.echo("  --conflict remote  # Use remote (Wiki) version")
+
+
+@wiki_app.command("status")
+def wiki_status():
+    """Show GitHub Wiki sync status."""
+    from idlergear.wiki import WikiSync
+
+    sync = WikiSync()
+
+    if not sync.wiki_dir.exists():
+        typer.echo("❌ Wiki not cloned")
+        typer.echo()
+        typer.echo("Clone wiki: idlergear wiki pull")
+        return
+
+    # Get git status
+    returncode, stdout, stderr = sync._run_git("status", "--porcelain")
+
+    if returncode != 0:
+        typer.secho(f"Error: {stderr}", fg=typer.colors.RED)
+        return
+
+    # Check for changes
+    if not stdout.strip():
+        typer.secho("✓ Wiki is in sync", fg=typer.colors.GREEN)
+    else:
+        typer.secho("⚠️  Uncommitted changes in wiki:", fg=typer.colors.YELLOW)
+        typer.echo()
+        typer.echo(stdout)
+
+    # Show last commit
+    returncode, stdout, stderr = sync._run_git("log", "-1", "--oneline")
+    if returncode == 0:
+        typer.echo()
+        typer.echo(f"Last commit: {stdout.strip()}")
+
+
+@wiki_app.command("config")
+def wiki_config(
+    key: Optional[str] = typer.Argument(None, help="Config key"),
+    value: Optional[str] = typer.Argument(None, help="Config value"),
+):
+    """Get or set wiki configuration."""
+    from idlergear.wiki import get_wiki_config, set_wiki_config
+
+    if not key:
+        # Show all config
+        config = get_wiki_config()
+        typer.echo("Wiki configuration:")
+        typer.echo()
+        for k, v in config.items():
+            typer.echo(f"  {k}: {v}")
+        return
+
+    if not value:
+        # Get specific value
+        config = get_wiki_config()
+        if key in config:
+            typer.echo(config[key])
+        else:
+            typer.secho(f"Unknown config key: {key}", fg=typer.colors.RED)
+        return
+
+    # Set value
+    set_wiki_config(key, value)
+    typer.secho(f"✓ Set wiki.{key} = {value}", fg=typer.colors.GREEN)
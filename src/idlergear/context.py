@@ -198,13 +198,11 @@ def gather_context(
         # Apply relevance filtering
         relevance_threshold = min_relevance if min_relevance is not None else 0.3
         if not include_stale:
-            from idlergear.relevance import filter_by_relevance, sort_by_relevance
+            from idlergear.relevance import rank_by_relevance
 
-            # Filter out low-relevance tasks
-            tasks = filter_by_relevance(tasks, min_relevance=relevance_threshold)
-
-            # Sort by relevance (highest first), then by priority
-            tasks = sort_by_relevance(tasks, reverse=True)
+            # Score as of now in one batch, drop low-relevance tasks and
+            # sort the rest (highest first)
+            tasks = rank_by_relevance(tasks, min_relevance=relevance_threshold)
         else:
             # Just sort by priority if including stale items
             priority_order = {"high": 0, "medium": 1, "low": 2, None: 3}
@@ -240,13 +238,10 @@ def gather_context(
 
         # Apply relevance filtering
         if not include_stale:
-            from idlergear.relevance import filter_by_relevance, sort_by_relevance
-
-            # Filter out low-relevance notes
-            notes = filter_by_relevance(notes, min_relevance=relevance_threshold)
+            from idlergear.relevance import rank_by_relevance
 
-            # Sort by relevance (highest first)
-            notes = sort_by_relevance(notes, reverse=True)
+            # Filter out low-relevance notes, highest relevance first
+            notes = rank_by_relevance(notes, min_relevance=relevance_threshold)
 
         ctx.recent_notes = notes[:max_notes]
     except Exception as e:
@@ -0,0 +1,133 @@
+"""Fast project context for session start hooks (``idlergear-context``).
+
+Fetches the context snapshot the daemon keeps pre-rendered (see
+``idlergear.daemon.snapshots``) over its Unix socket. Only the standard
+library is imported on that path, so a session start hook pays for an
+interpreter start and one round trip instead of importing the CLI and
+re-reading every knowledge file.
+
+Without a running daemon the context is rendered locally, exactly like
+``idlergear context``, unless ``--daemon-only`` is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import socket
+import sys
+from pathlib import Path
+from typing import Any
+
+# Give up on the daemon quickly; the local fallback is always available
+DEFAULT_TIMEOUT = 2.0
+
+MODES = ("minimal", "standard", "detailed", "full")
+
+
+def find_project_root(start: Path | None = None) -> Path | None:
+    """Find the nearest directory containing .idlergear."""
+    current = (start or Path.cwd()).resolve()
+    for directory in (current, *current.parents):
+        if (directory / ".idlergear").is_dir():
+            return directory
+    return None
+
+
+def fetch_snapshot(
+    project_root: Path, mode: str = "minimal", timeout: float = DEFAULT_TIMEOUT
+) -> dict[str, Any] | None:
+    """Ask the project's daemon for a context snapshot.
+
+    Args:
+        project_root: Project root directory
+        mode: Context mode
+        timeout: Socket timeout in seconds
+
+    Returns:
+        The snapshot ({"mode", "text", "data", "generated", "cached"}), or
+        None if no daemon answered
+    """
+    socket_path = Path(project_root) / ".idlergear" / "daemon.sock"
+    if not socket_path.exists():
+        return None
+
+    request = json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "method": "context.snapshot",
+            "params": {"mode": mode},
+            "id": 1,
+        }
+    ).encode()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            # Length-prefixed framing: 4-byte length + message
+            sock.sendall(len(request).to_bytes(4, "big") + request)
+            while True:
+                length = int.from_bytes(_recv_exactly(sock, 4), "big")
+                message = json.loads(_recv_exactly(sock, length))
+                if message.get("id") == 1:  # Skip broadcast notifications
+                    break
+    except (OSError, ValueError):
+        return None
+
+    if "error" in message:
+        return None
+    return message.get("result")
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            raise ConnectionError("Daemon closed the connection")
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print project context, preferring the daemon's snapshot.
+
+    Returns:
+        Exit code (1 if no context could be produced)
+    """
+    parser = argparse.ArgumentParser(
+        prog="idlergear-context",
+        description="Print project context (served by the daemon when running).",
+    )
+    parser.add_argument("--mode", "-m", choices=MODES, default="minimal")
+    parser.add_argument("--json", action="store_true", help="Output JSON")
+    parser.add_argument(
+        "--daemon-only",
+        action="store_true",
+        help="Fail instead of rendering locally when no daemon is running",
+    )
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    args = parser.parse_args(argv)
+
+    project_root = find_project_root()
+    if project_root is None:
+        return 1
+
+    snapshot = fetch_snapshot(project_root, args.mode, args.timeout)
+    if snapshot is None:
+        if args.daemon_only:
+            return 1
+        from idlergear.daemon.snapshots import render_context
+
+        snapshot = render_context(project_root, args.mode)
+
+    if args.json:
+        print(json.dumps(snapshot["data"], indent=2, default=str))
+    else:
+        print(snapshot["text"])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
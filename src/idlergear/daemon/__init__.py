@@ -1,16 +1,19 @@
 """IdlerGear Daemon - Multi-agent coordination via Unix socket."""
 
+from idlergear.daemon.changes import ChangeFeed, FileChange
 from idlergear.daemon.client import DaemonClient, DaemonError, DaemonNotRunning
 from idlergear.daemon.lifecycle import DaemonLifecycle, ensure_daemon
 from idlergear.daemon.protocol import Notification, Request, Response
 from idlergear.daemon.server import DaemonServer
 
 __all__ = [
+    "ChangeFeed",
     "DaemonClient",
     "DaemonError",
     "DaemonLifecycle",
     "DaemonNotRunning",
     "DaemonServer",
+    "FileChange",
     "Notification",
     "Request",
     "Response",
@@ -0,0 +1,507 @@
+"""Unified file-change feed for the daemon.
+
+One watcher per project replaces each subsystem rescanning or polling on
+its own. Raw filesystem events (watchdog/inotify, or paths pushed by
+clients via ``files.notify``) are coalesced over a debounce window, filtered
+against the exclude patterns, the git index and ``.gitignore``, and
+published as batches of :class:`FileChange`.
+
+Hashes are git blob ids, so the baseline for tracked files comes straight
+from the index without reading them, and saving a file without changing its
+content publishes nothing.
+
+Consumers subscribe with :meth:`ChangeFeed.subscribe`; remote clients get
+the same batches as ``files.changed`` daemon events.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import subprocess
+import threading
+import time
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from idlergear.walker import DEFAULT_EXCLUDE_PATTERNS, DirectoryWalker
+
+logger = logging.getLogger(__name__)
+
+# Files inside .git whose change means the index/HEAD moved
+GIT_STATE_FILES = {".git/index", ".git/HEAD"}
+
+ChangeCallback = Callable[[list["FileChange"]], None]
+
+
+@dataclass
+class FileChange:
+    """A coalesced change to one file."""
+
+    path: str  # Relative to the project root, POSIX separators
+    kind: str  # created, modified, deleted
+    old_hash: str | None
+    new_hash: str | None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "path": self.path,
+            "kind": self.kind,
+            "old_hash": self.old_hash,
+            "new_hash": self.new_hash,
+        }
+
+
+def git_blob_hash(path: str | Path) -> str | None:
+    """Return the git blob id of a file's content (None if unreadable)."""
+    try:
+        with open(path, "rb") as f:
+            content = f.read()
+    except OSError:
+        return None
+    hasher = hashlib.sha1(b"blob %d\0" % len(content))
+    hasher.update(content)
+    return hasher.hexdigest()
+
+
+def _run_git(args: list[str], cwd: Path, input: str | None = None) -> str | None:
+    """Run git and return stdout, or None if git failed."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=cwd,
+            input=input,
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    # check-ignore exits 1 when nothing is ignored
+    if result.returncode not in (0, 1):
+        return None
+    return result.stdout
+
+
+class ChangeFeed:
+    """Coalescing, git-aware file change publisher.
+
+    Example:
+        >>> feed = ChangeFeed(project_root)
+        >>> feed.subscribe(lambda changes: print([c.path for c in changes]))
+        >>> feed.start()          # watchdog + debounce thread
+        >>> feed.notify("src/app.py")
+        >>> feed.flush()          # or wait for the debounce window
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        debounce: float = 0.5,
+        exclude_patterns: list[str] | None = None,
+    ):
+        """Create a feed.
+
+        Args:
+            project_root: Project root to watch
+            debounce: Seconds without new events before a batch is published
+            exclude_patterns: Entry names never reported (defaults to the
+                walker's DEFAULT_EXCLUDE_PATTERNS plus .idlergear)
+        """
+        self.project_root = Path(project_root).resolve()
+        self.debounce = debounce
+        patterns = (
+            exclude_patterns
+            if exclude_patterns is not None
+            else DEFAULT_EXCLUDE_PATTERNS + [".idlergear"]
+        )
+        self._exclude_patterns = patterns
+        self._walker = DirectoryWalker(self.project_root, exclude_patterns=patterns)
+        self._subscribers: list[ChangeCallback] = []
+        self._pending: set[str] = set()
+        self._index_dirty = False
+        self._last_event = 0.0
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._baseline: dict[str, str] | None = None  # path -> blob hash
+        self._tracked: set[str] = set()
+        self._is_git = (self.project_root / ".git").exists()
+        self._thread: threading.Thread | None = None
+        self._observer = None
+        self._stopped = False
+        self.batches_published = 0
+
+    # -- subscription -----------------------------------------------------
+
+    def subscribe(self, callback: ChangeCallback) -> Callable[[], None]:
+        """Register a consumer; returns a function that unsubscribes it.
+
+        Callbacks run on the feed's thread, one batch at a time.
+        """
+        self._subscribers.append(callback)
+
+        def unsubscribe() -> None:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+        return unsubscribe
+
+    def _publish(self, changes: list[FileChange]) -> None:
+        self.batches_published += 1
+        for callback in list(self._subscribers):
+            try:
+                callback(changes)
+            except Exception:
+                logger.exception("File change consumer failed")
+
+    # -- event intake -----------------------------------------------------
+
+    def _relative(self, path: str | Path) -> str | None:
+        full = os.path.abspath(os.path.join(self.project_root, path))
+        rel = os.path.relpath(full, self.project_root)
+        if rel == "." or rel.startswith(".."):
+            return None
+        return rel.replace(os.sep, "/")
+
+    def notify(self, path: str | Path) -> None:
+        """Record that a path (absolute or project-relative) may have changed."""
+        rel = self._relative(path)
+        if rel is None:
+            return
+        if rel in GIT_STATE_FILES:
+            with self._cond:
+                self._index_dirty = True
+                self._last_event = time.monotonic()
+                self._cond.notify_all()
+            return
+        if any(self._walker.is_excluded(part) for part in rel.split("/")):
+            return
+        with self._cond:
+            self._pending.add(rel)
+            self._last_event = time.monotonic()
+            self._cond.notify_all()
+
+    def notify_many(self, paths: Iterable[str | Path]) -> None:
+        """Record several possibly-changed paths."""
+        for path in paths:
+            self.notify(path)
+
+    # -- git baseline -----------------------------------------------------
+
+    def _read_index(self) -> dict[str, str]:
+        """Map tracked paths to their blob ids from the git index."""
+        if not self._is_git:
+            return {}
+        stdout = _run_git(["ls-files", "-s", "-z"], self.project_root)
+        entries = {}
+        for record in (stdout or "").split("\0"):
+            if not record:
+                continue
+            meta, _, path = record.partition("\t")
+            parts = meta.split()
+            if len(parts) >= 2:
+                entries[path] = parts[1]
+        return entries
+
+    def _ensure_baseline(self) -> dict[str, str]:
+        if self._baseline is not None:
+            return self._baseline
+        index = self._read_index()
+        self._tracked = set(index)
+        baseline = dict(index)
+        if self._is_git:
+            # Untracked, non-ignored files: hash them once so later edits
+            # are reported as modifications rather than creations
+            stdout = _run_git(
+                ["ls-files", "--others", "--exclude-standard", "-z"], self.project_root
+            )
+            for path in (stdout or "").split("\0"):
+                if path and not any(
+                    self._walker.is_excluded(part) for part in path.split("/")
+                ):
+                    digest = git_blob_hash(self.project_root / path)
+                    if digest:
+                        baseline[path] = digest
+        else:
+            for entry in self._walker.walk():
+                digest = git_blob_hash(entry.path)
+                if digest:
+                    baseline[entry.rel_path] = digest
+        self._baseline = baseline
+        return baseline
+
+    def _reload_index(self, baseline: dict[str, str]) -> None:
+        """Pick up newly tracked files after the index changed."""
+        index = self._read_index()
+        self._tracked = set(index)
+        for path, digest in index.items():
+            baseline.setdefault(path, digest)
+
+    def _drop_ignored(self, paths: set[str]) -> set[str]:
+        """Remove gitignored paths (one git call for the whole batch)."""
+        if not self._is_git or not paths:
+            return paths
+        stdout = _run_git(
+            ["check-ignore", "--stdin"], self.project_root, input="\n".join(sorted(paths))
+        )
+        if not stdout:
+            return paths
+        return paths - set(stdout.splitlines())
+
+    # -- batching ---------------------------------------------------------
+
+    def _expand(self, pending: set[str], baseline: dict[str, str]) -> set[str]:
+        """Expand directory events into the files they affect."""
+        paths: set[str] = set()
+        for rel in pending:
+            full = self.project_root / rel
+            if full.is_dir():
+                walker = DirectoryWalker(full, exclude_patterns=self._exclude_patterns)
+                paths.update(f"{rel}/{e.rel_path}" for e in walker.walk())
+                continue
+            paths.add(rel)
+            if not full.exists():
+                # A removed directory: everything known below it is gone
+                prefix = rel + "/"
+                paths.update(p for p in baseline if p.startswith(prefix))
+        return paths
+
+    def flush(self) -> list[FileChange]:
+        """Publish the pending batch now and return it."""
+        with self._flush_lock:
+            with self._cond:
+                pending, self._pending = self._pending, set()
+                index_dirty, self._index_dirty = self._index_dirty, False
+
+            baseline = self._ensure_baseline()
+            if index_dirty:
+                self._reload_index(baseline)
+            if not pending:
+                return []
+
+            paths = self._expand(pending, baseline)
+            new_paths = {p for p in paths if p not in baseline and p not in self._tracked}
+            paths -= new_paths - self._drop_ignored(new_paths)
+
+            changes = []
+            for rel in sorted(paths):
+                full = self.project_root / rel
+                new_hash = git_blob_hash(full) if full.is_file() else None
+                old_hash = baseline.get(rel)
+                if new_hash == old_hash:
+                    continue
+                if old_hash is None:
+                    kind = "created"
+                elif new_hash is None:
+                    kind = "deleted"
+                else:
+                    kind = "modified"
+                changes.append(FileChange(rel, kind, old_hash, new_hash))
+                if new_hash is None:
+                    del baseline[rel]
+                else:
+                    baseline[rel] = new_hash
+
+        if changes:
+            self._publish(changes)
+        return changes
+
+    def _run(self) -> None:
+        """Debounce loop: publish once events have been quiet for a while."""
+        while True:
+            with self._cond:
+                while not (self._pending or self._index_dirty) and not self._stopped:
+                    self._cond.wait()
+                while not self._stopped:
+                    remaining = self._last_event + self.debounce - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if self._stopped:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to publish file changes")
+
+    # -- lifecycle --------------------------------------------------------
+
+    def start(self, watch: bool = True) -> bool:
+        """Start the debounce thread and (optionally) the filesystem watcher.
+
+        Args:
+            watch: Also watch the project with watchdog
+
+        Returns:
+            True if a filesystem watcher is running
+        """
+        self._stopped = False
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="idlergear-change-feed", daemon=True
+            )
+            self._thread.start()
+        if not watch or self._observer is not None:
+            return self._observer is not None
+
+        try:
+            from watchdog.events import FileSystemEventHandler
+            from watchdog.observers import Observer
+        except ImportError:
+            logger.info("watchdog not installed; file changes only via files.notify")
+            return False
+
+        feed = self
+
+        class Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.event_type in ("opened", "closed", "closed_no_write"):
+                    return
+                feed.notify(event.src_path)
+                dest = getattr(event, "dest_path", None)
+                if dest:
+                    feed.notify(dest)
+
+        observer = Observer()
+        observer.schedule(Handler(), str(self.project_root), recursive=True)
+        observer.daemon = True
+        observer.start()
+        self._observer = observer
+        return True
+
+    def stop(self) -> None:
+        """Stop watching and the debounce thread."""
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+        self._thread = None
+
+
+# ============================================================================
+# Built-in consumers
+# ============================================================================
+
+
+def annotation_consumer(project_root: Path) -> ChangeCallback:
+    """Move file annotations along with renamed files.
+
+    A rename shows up as a deletion and a creation with the same content
+    hash in one batch.
+    """
+    from idlergear.file_annotation_storage import SQLiteAnnotationStorage
+
+    storage = SQLiteAnnotationStorage(project_root / ".idlergear" / "file_annotations")
+
+    def consume(changes: list[FileChange]) -> None:
+        created = {c.new_hash: c.path for c in changes if c.kind == "created"}
+        for change in changes:
+            if change.kind != "deleted" or change.old_hash not in created:
+                continue
+            entry = storage.load_annotation(change.path)
+            if entry is None:
+                continue
+            entry.path = created[change.old_hash]
+            storage.save_annotation(entry)
+            storage.delete_annotation(change.path)
+
+    return consume
+
+
+def test_map_consumer(project_root: Path) -> ChangeCallback:
+    """Apply changed files to the saved test coverage map, if there is one."""
+    from idlergear.testing import update_coverage_map
+
+    def consume(changes: list[FileChange]) -> None:
+        update_coverage_map([(c.path, c.kind) for c in changes], project_root)
+
+    return consume
+
+
+def graph_consumer(project_root: Path, vectors: bool = True) -> ChangeCallback:
+    """Re-index changed source files in the knowledge graph.
+
+    With ``vectors`` false the populator leaves the semantic code index alone,
+    for when the vector consumer already keeps it up to date.
+    """
+
+    def consume(changes: list[FileChange]) -> None:
+        from idlergear.graph import get_database
+        from idlergear.graph.populators import CodePopulator
+
+        db = get_database(project_path=project_root)
+        # Shares the writer with graph.populate running in the daemon
+        with db.write_lock:
+            CodePopulator(
+                db, repo_path=project_root, enable_vector_search=vectors
+            ).apply_changes(changes)
+
+    return consume
+
+
+def vector_consumer(project_root: Path) -> ChangeCallback:
+    """Re-embed changed source files in the semantic code index.
+
+    The index (and its embedding model) is only opened on the first batch.
+    """
+    index = None
+
+    def consume(changes: list[FileChange]) -> None:
+        nonlocal index
+        if index is None:
+            from idlergear.graph.vector import VectorCodeIndex
+
+            index = VectorCodeIndex(index_path=project_root / ".idlergear" / "code_index")
+        index.apply_changes(changes, project_root)
+
+    return consume
+
+
+def _vector_search_installed() -> bool:
+    import importlib.util
+
+    return all(
+        importlib.util.find_spec(name) is not None
+        for name in ("chromadb", "sentence_transformers")
+    )
+
+
+def register_default_consumers(feed: ChangeFeed) -> list[str]:
+    """Subscribe the built-in consumers to a feed.
+
+    The graph consumer opens the Kuzu database read-write, which blocks other
+    processes from writing it, so it is opt-in via ``daemon.graph_updates``.
+    The vector consumer keeps an embedding model resident in the daemon, so it
+    is opt-in via ``daemon.vector_updates`` and needs an existing code index.
+
+    Returns:
+        Names of the registered consumers
+    """
+    from idlergear.config import get_config_value
+
+    root = feed.project_root
+    consumers: list[tuple[str, Callable[[Path], ChangeCallback]]] = [
+        ("annotations", annotation_consumer)
+    ]
+    vectors = (
+        str(get_config_value("daemon.vector_updates", project_path=root)).lower() == "true"
+        and (root / ".idlergear" / "code_index").is_dir()
+        and _vector_search_installed()
+    )
+    if str(get_config_value("daemon.graph_updates", project_path=root)).lower() == "true":
+        if (root / ".idlergear" / "graph.db").exists():
+            # Leave embedding to the vector consumer rather than doing it twice
+            consumers.append(("graph", partial(graph_consumer, vectors=not vectors)))
+    if vectors:
+        consumers.append(("vectors", vector_consumer))
+    # After the graph, so the test map sees the IMPORTS edges it just wrote
+    consumers.append(("test_map", test_map_consumer))
+
+    for _, factory in consumers:
+        feed.subscribe(factory(root))
+    return [name for name, _ in consumers]
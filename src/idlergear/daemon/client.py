@@ -3,6 +3,7 @@
 import asyncio
 import os
 import signal
+import socket
 from pathlib import Path
 from typing import Any
 
@@ -290,6 +291,80 @@ def get_daemon_client(idlergear_root: Path) -> DaemonClient:
     return DaemonClient(socket_path)
 
 
+def daemon_socket_path(idlergear_root: Path) -> Path | None:
+    """Locate the daemon socket for a project, or None if there is none.
+
+    Accepts either the project root or its ``.idlergear`` directory, since
+    the daemon is started with either.
+    """
+    for candidate in (idlergear_root, idlergear_root / ".idlergear"):
+        socket_path = candidate / "daemon.sock"
+        if socket_path.exists():
+            return socket_path
+    return None
+
+
+def call_daemon(
+    idlergear_root: Path,
+    method: str,
+    params: dict[str, Any] | None = None,
+    timeout: float = 30.0,
+) -> Any:
+    """Call a daemon method with a blocking socket.
+
+    For synchronous code that may already be running inside an event loop
+    (e.g. MCP tool handlers), where ``asyncio.run`` is not available.
+
+    Raises:
+        DaemonNotRunning: If no daemon is listening
+        DaemonError: If the daemon returns an error or the call times out
+    """
+    socket_path = daemon_socket_path(idlergear_root)
+    if socket_path is None:
+        raise DaemonNotRunning(f"Daemon socket not found under {idlergear_root}")
+
+    request = Request(method=method, params=params or {}, id=1)
+    encoded = request.to_json().encode("utf-8")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        try:
+            sock.connect(str(socket_path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            raise DaemonNotRunning("Cannot connect to daemon")
+        sock.sendall(len(encoded).to_bytes(4, "big") + encoded)
+
+        # Skip event notifications until our response arrives
+        while True:
+            length = int.from_bytes(_recv_exactly(sock, 4), "big")
+            message = parse_message(_recv_exactly(sock, length).decode("utf-8"))
+            if isinstance(message, Response) and message.id == request.id:
+                break
+    except socket.timeout:
+        raise DaemonError(-1, "Request timed out")
+    finally:
+        sock.close()
+
+    if message.error:
+        raise DaemonError(
+            message.error["code"],
+            message.error["message"],
+            message.error.get("data"),
+        )
+    return message.result
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            raise DaemonNotRunning("Daemon closed the connection")
+        data += chunk
+    return data
+
+
 async def is_daemon_running(idlergear_root: Path) -> bool:
     """Check if the daemon is running."""
     socket_path = idlergear_root / "daemon.sock"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import threading
 from typing import Any
 
 from idlergear.daemon.server import Connection, DaemonServer
@@ -336,7 +339,81 @@ def register_handlers(server: DaemonServer) -> None:
             "successor": params.get("successor"),
         }
 
+    # Knowledge graph handlers: the daemon can be the single graph writer,
+    # serving reads from its connection pool while a populate runs.
+    populate_lock = threading.Lock()
+
+    async def graph_query(params: dict[str, Any], conn: Connection) -> dict[str, Any]:
+        from idlergear.graph.database import (
+            check_read_query,
+            get_open_database,
+            to_jsonable,
+        )
+
+        if "query" not in params:
+            raise ValueError("Missing 'query' parameter")
+        # Writes go through graph.populate, which also bumps the generation
+        check_read_query(params["query"])
+        db = get_open_database()
+        if db is None:
+            raise ValueError("Knowledge graph is not open in the daemon")
+        columns, rows = await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                db.cached_rows, params["query"], params.get("parameters"), read_only=True
+            ),
+        )
+        return {"columns": columns, "rows": to_jsonable(rows)}
+
+    async def graph_populate(params: dict[str, Any], conn: Connection) -> dict[str, Any]:
+        from idlergear.graph import get_database, populate_all
+
+        if not populate_lock.acquire(blocking=False):
+            raise ValueError("Graph populate already running")
+        loop = asyncio.get_running_loop()
+
+        def on_progress(event: dict[str, Any]) -> None:
+            asyncio.run_coroutine_threadsafe(
+                server.broadcast("graph.progress", event), loop
+            )
+
+        def run() -> dict[str, Any]:
+            get_database(project_path=server.project_root)
+            return populate_all(
+                project_path=server.project_root,
+                max_commits=params.get("max_commits", 100),
+                code_directory=params.get("code_directory", "src"),
+                incremental=params.get("incremental", True),
+                verbose=False,
+                progress_callback=on_progress,
+                profile=params.get("profile", False),
+                rebuild=params.get("rebuild", False),
+            )
+
+        try:
+            return await loop.run_in_executor(None, run)
+        finally:
+            populate_lock.release()
+
+    # Pre-rendered context for session start hooks
+    def on_event(event: str, data: dict[str, Any]) -> None:
+        snapshots = server.context_snapshots
+        if snapshots.on_event(event, data):
+            # Re-render off the event loop so the next request is a hit
+            asyncio.get_running_loop().run_in_executor(None, snapshots.warm)
+
+    server.add_event_listener(on_event)
+
+    async def context_snapshot(params: dict[str, Any], conn: Connection) -> dict[str, Any]:
+        mode = params.get("mode", "minimal")
+        if mode not in ("minimal", "standard", "detailed", "full"):
+            raise ValueError(f"Invalid mode: {mode}")
+        return await asyncio.get_running_loop().run_in_executor(
+            None, server.context_snapshots.get, mode
+        )
+
     # Register all handlers
+    server.register_method("context.snapshot", context_snapshot)
     server.register_method("task.create", task_create)
     server.register_method("task.list", task_list)
     server.register_method("task.get", task_get)
@@ -382,3 +459,6 @@ def register_handlers(server: DaemonServer) -> None:
 
     server.register_method("file.register", file_register)
     server.register_method("file.deprecate", file_deprecate)
+
+    server.register_method("graph.query", graph_query)
+    server.register_method("graph.populate", graph_populate)
@@ -16,9 +16,14 @@ from idlergear.daemon.protocol import (
 from idlergear.daemon.queue import CommandQueue
 from idlergear.daemon.agents import AgentRegistry
 from idlergear.daemon.locks import LockManager
+from idlergear.daemon.changes import ChangeFeed
+from idlergear.daemon.snapshots import ContextSnapshots
 
 logger = logging.getLogger(__name__)
 
+# Seconds between relevance decay sweeps
+DECAY_SWEEP_INTERVAL = 6 * 3600
+
 
 class Connection:
     """Represents a client connection to the daemon."""
@@ -85,6 +90,10 @@ class DaemonServer:
         self.socket_path = socket_path
         self.pid_path = pid_path
         self.storage_path = storage_path
+        # Started with either the project root or its .idlergear directory
+        self.project_root = (
+            storage_path.parent if storage_path.name == ".idlergear" else storage_path
+        )
         self._server: asyncio.Server | None = None
         self._connections: dict[int, Connection] = {}
         self._next_conn_id = 1
@@ -96,6 +105,15 @@ class DaemonServer:
         self.agents = AgentRegistry(storage_path / "agents")
         self.locks = LockManager()
 
+        # File change feed (attached by run_daemon)
+        self.changes: ChangeFeed | None = None
+
+        # Pre-rendered context served by context.snapshot
+        self.context_snapshots = ContextSnapshots(self.project_root)
+
+        # In-process observers of broadcast events
+        self._event_listeners: list[Callable[[str, dict[str, Any]], None]] = []
+
         # Register built-in methods
         self._register_builtin_methods()
 
@@ -144,10 +162,38 @@ class DaemonServer:
         # Message methods
         self.register_method("message.broadcast", self._handle_message_broadcast)
 
+        # File change feed methods
+        self.register_method("files.notify", self._handle_files_notify)
+        self.register_method("files.flush", self._handle_files_flush)
+
     def register_method(self, name: str, handler: MethodHandler) -> None:
         """Register a method handler."""
         self._methods[name] = handler
 
+    def add_event_listener(self, listener: Callable[[str, dict[str, Any]], None]) -> None:
+        """Call listener(event, data) for every broadcast event.
+
+        Listeners run on the event loop and must not block.
+        """
+        self._event_listeners.append(listener)
+
+    def attach_change_feed(
+        self, feed: ChangeFeed, loop: asyncio.AbstractEventLoop
+    ) -> None:
+        """Publish the feed's batches to clients as "files.changed" events.
+
+        Args:
+            feed: Change feed (its callbacks run on the feed thread)
+            loop: Event loop the server runs on
+        """
+        self.changes = feed
+
+        def forward(changes: list) -> None:
+            data = {"changes": [c.to_dict() for c in changes]}
+            asyncio.run_coroutine_threadsafe(self.broadcast("files.changed", data), loop)
+
+        feed.subscribe(forward)
+
     async def _handle_ping(
         self, params: dict[str, Any], conn: Connection
     ) -> dict[str, Any]:
@@ -768,6 +814,29 @@ class DaemonServer:
             "connections": len(self._connections),
         }
 
+    async def _handle_files_notify(
+        self, params: dict[str, Any], conn: Connection
+    ) -> dict[str, Any]:
+        """Handle a client reporting paths it changed (e.g. an edit hook)."""
+        if self.changes is None:
+            raise ValueError("File change feed not running")
+        paths = params.get("paths")
+        if not isinstance(paths, list):
+            raise ValueError("Missing 'paths' parameter")
+        self.changes.notify_many(paths)
+        return {"queued": len(paths)}
+
+    async def _handle_files_flush(
+        self, params: dict[str, Any], conn: Connection
+    ) -> dict[str, Any]:
+        """Handle publishing pending file changes immediately."""
+        if self.changes is None:
+            raise ValueError("File change feed not running")
+        changes = await asyncio.get_running_loop().run_in_executor(
+            None, self.changes.flush
+        )
+        return {"changes": [c.to_dict() for c in changes]}
+
     def _matches_subscription(self, event: str, subscription: str) -> bool:
         """Check if an event matches a subscription pattern.
 
@@ -790,6 +859,12 @@ class DaemonServer:
 
         Supports wildcard subscriptions like "task.*" or "*".
         """
+        for listener in self._event_listeners:
+            try:
+                listener(event, data)
+            except Exception as e:
+                logger.warning(f"Event listener failed for {event}: {e}")
+
         notification = Notification(
             method="event",
             params={"event": event, "data": data},
@@ -922,6 +997,9 @@ class DaemonServer:
         logger.info("Shutting down daemon...")
         self._running = False
 
+        if self.changes is not None:
+            self.changes.stop()
+
         # Close all connections
         for conn in list(self._connections.values()):
             conn.close()
@@ -946,6 +1024,32 @@ class DaemonServer:
             asyncio.create_task(self._shutdown())
 
 
+async def run_decay_sweeps(
+    project_root: Path, interval: float = DECAY_SWEEP_INTERVAL
+) -> None:
+    """Periodically compute relevance statistics and stale items.
+
+    The sweep only reads: current scores are computed when items are read,
+    so nothing needs to be written back on a timer.
+
+    Args:
+        project_root: Project root directory
+        interval: Seconds between sweeps
+    """
+    from idlergear.relevance import decay_sweep
+
+    loop = asyncio.get_running_loop()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            result = await loop.run_in_executor(None, decay_sweep, project_root)
+            logger.info(
+                f"Decay sweep: {result['count']} items, {result['stale_count']} stale"
+            )
+        except Exception as e:
+            logger.warning(f"Decay sweep failed: {e}")
+
+
 def run_daemon(idlergear_root: Path) -> None:
     """Run the daemon process."""
     socket_path = idlergear_root / "daemon.sock"
@@ -968,7 +1072,31 @@ def run_daemon(idlergear_root: Path) -> None:
 
     async def main():
         await server.start()
-        await server.serve_forever()
+
+        # One change feed for every consumer of file changes
+        from idlergear.daemon.changes import register_default_consumers
+
+        try:
+            feed = ChangeFeed(server.project_root)
+            server.attach_change_feed(feed, asyncio.get_running_loop())
+            consumers = register_default_consumers(feed)
+            watching = feed.start()
+            logger.info(
+                f"File change feed started (watching={watching}, consumers={consumers})"
+            )
+        except Exception as e:
+            logger.warning(f"File change feed unavailable: {e}")
+
+        # Render context snapshots before the first session asks for one
+        asyncio.get_running_loop().run_in_executor(None, server.context_snapshots.warm)
+
+        # Keep stored relevance scores from drifting as knowledge ages
+        sweeper = asyncio.create_task(run_decay_sweeps(server.project_root))
+
+        try:
+            await server.serve_forever()
+        finally:
+            sweeper.cancel()
 
     try:
         asyncio.run(main())
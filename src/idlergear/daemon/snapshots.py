@@ -0,0 +1,210 @@
+"""Pre-rendered project context snapshots served by the daemon.
+
+``idlergear context`` cold-starts Python, imports the CLI and re-reads
+vision, plans, tasks, notes and references on every agent session start.
+The daemon instead keeps the rendered context for each mode in memory and
+answers ``context.snapshot`` requests straight from it; the stdlib-only
+``idlergear-context`` client fetches a snapshot in a few milliseconds.
+
+A snapshot is dropped when:
+
+- a knowledge event is broadcast (task/note/plan/... created or updated
+  through the daemon), or the change feed reports a change to a knowledge
+  file (``KNOWLEDGE_DIRS`` or VISION.md),
+- the knowledge directories' modification fingerprint differs (writes by
+  CLI processes the daemon never heard about), or
+- it is older than ``SNAPSHOT_TTL`` (relevance decays and suggestions
+  depend on more than the knowledge files).
+
+Dropped snapshots are re-rendered in the background, so the next session
+start finds a warm one.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# Modes rendered ahead of time ("full" is rendered on demand)
+PRERENDERED_MODES = ("minimal", "standard", "detailed")
+
+# Re-render a snapshot at least this often (seconds)
+SNAPSHOT_TTL = 300.0
+
+# Event prefixes that change gathered context
+KNOWLEDGE_EVENTS = ("task.", "note.", "explore.", "vision.", "plan.", "reference.")
+
+# .idlergear subdirectories read by gather_context
+KNOWLEDGE_DIRS = (
+    "issues",
+    "tasks",
+    "notes",
+    "explorations",
+    "plans",
+    "wiki",
+    "reference",
+)
+
+
+class ContextSnapshots:
+    """Per-mode cache of rendered project context.
+
+    Example:
+        >>> snapshots = ContextSnapshots(Path("."))
+        >>> snapshots.get("minimal")["text"]
+        '# Project Context ...'
+    """
+
+    def __init__(
+        self,
+        project_root: Path,
+        render: Callable[[Path, str], dict[str, Any]] | None = None,
+        ttl: float = SNAPSHOT_TTL,
+    ):
+        """Initialize snapshot cache.
+
+        Args:
+            project_root: Project root directory
+            render: Renderer returning {"text", "data"} for a mode
+                (defaults to gather_context + format_context)
+            ttl: Maximum snapshot age in seconds
+        """
+        self.project_root = Path(project_root)
+        self.ttl = ttl
+        self._render = render or render_context
+        self._snapshots: dict[str, dict[str, Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._render_locks = {mode: threading.Lock() for mode in PRERENDERED_MODES}
+
+    def fingerprint(self) -> tuple[int, int]:
+        """Return (file count, newest mtime) over the knowledge files."""
+        idlergear_dir = self.project_root / ".idlergear"
+        count, newest = 0, 0
+        paths = [self.project_root / "VISION.md", idlergear_dir / "config.toml"]
+        for name in KNOWLEDGE_DIRS:
+            directory = idlergear_dir / name
+            paths.append(directory)
+            try:
+                with os.scandir(directory) as entries:
+                    paths.extend(Path(entry.path) for entry in entries)
+            except OSError:
+                continue
+        for path in paths:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            count += 1
+            newest = max(newest, stat.st_mtime_ns)
+        return count, newest
+
+    def get(self, mode: str) -> dict[str, Any]:
+        """Return the snapshot for a mode, rendering it if missing or stale.
+
+        Args:
+            mode: Context mode (minimal, standard, detailed or full)
+
+        Returns:
+            Dictionary with "mode", "text", "data", "generated" (epoch
+            seconds) and "cached" (False if rendered for this call)
+        """
+        with self._render_locks.setdefault(mode, threading.Lock()):
+            fingerprint = self.fingerprint()
+            with self._lock:
+                snapshot = self._snapshots.get(mode)
+                generation = self._generation
+            if (
+                snapshot is not None
+                and snapshot["fingerprint"] == fingerprint
+                and time.time() - snapshot["generated"] < self.ttl
+            ):
+                return {**_public(snapshot), "cached": True}
+
+            rendered = self._render(self.project_root, mode)
+            snapshot = {
+                "mode": mode,
+                "text": rendered["text"],
+                "data": rendered["data"],
+                "generated": time.time(),
+                "fingerprint": fingerprint,
+            }
+            with self._lock:
+                # An invalidation during rendering makes the result stale
+                if generation == self._generation:
+                    self._snapshots[mode] = snapshot
+            return {**_public(snapshot), "cached": False}
+
+    def invalidate(self) -> None:
+        """Drop every snapshot."""
+        with self._lock:
+            self._generation += 1
+            self._snapshots.clear()
+
+    def warm(self) -> None:
+        """Render every pre-rendered mode that is missing or stale."""
+        for mode in PRERENDERED_MODES:
+            try:
+                self.get(mode)
+            except Exception as e:
+                logger.warning(f"Context snapshot ({mode}) failed: {e}")
+
+    def on_event(self, event: str, data: dict[str, Any]) -> bool:
+        """Invalidate on knowledge events and on knowledge file changes.
+
+        Args:
+            event: Broadcast event name ("files.changed" for change-feed
+                batches)
+            data: Event payload
+
+        Returns:
+            True if the snapshots were invalidated
+        """
+        if event == "files.changed":
+            relevant = any(
+                _is_knowledge_path(change.get("path", ""))
+                for change in data.get("changes", [])
+            )
+        else:
+            relevant = event.startswith(KNOWLEDGE_EVENTS)
+        if relevant:
+            self.invalidate()
+        return relevant
+
+
+def _is_knowledge_path(path: str) -> bool:
+    """Check whether a project-relative path is read by gather_context."""
+    if path in ("VISION.md", ".idlergear/config.toml"):
+        return True
+    parts = path.split("/")
+    return len(parts) > 2 and parts[0] == ".idlergear" and parts[1] in KNOWLEDGE_DIRS
+
+
+def _public(snapshot: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in snapshot.items() if key != "fingerprint"}
+
+
+def render_context(project_root: Path, mode: str) -> dict[str, Any]:
+    """Render context as ``idlergear context`` prints it.
+
+    Args:
+        project_root: Project root directory
+        mode: Context mode
+
+    Returns:
+        Dictionary with "text" (human output) and "data" (JSON output)
+    """
+    import json
+
+    from idlergear.context import format_context, format_context_json, gather_context
+
+    ctx = gather_context(project_path=project_root, mode=mode)
+    # Round-trip so YAML datetimes survive the JSON-RPC response
+    data = json.loads(json.dumps(format_context_json(ctx), default=str))
+    return {"text": format_context(ctx), "data": data}
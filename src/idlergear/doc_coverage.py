@@ -2,7 +2,7 @@
 
 Ensures documentation stays up-to-date by:
 1. Extracting MCP tools from mcp_server.py
-2. Extracting CLI commands from cli.py
+2. Extracting CLI commands from cli.py and the cli_commands/ groups
 3. Checking documentation in SKILLS.md, README.md, etc.
 4. Reporting coverage gaps
 """
@@ -160,11 +160,13 @@ def extract_mcp_tools(mcp_server_file: Path) -> list[MCPTool]:
     return sorted(tools, key=lambda t: t.name)
 
 
-def extract_cli_commands(cli_file: Path) -> list[CLICommand]:
-    """Extract CLI commands from cli.py.
+def extract_cli_commands(cli_file: Path, group: str | None = None) -> list[CLICommand]:
+    """Extract CLI commands from cli.py or a cli_commands/ group module.
 
     Args:
-        cli_file: Path to cli.py
+        cli_file: Path to cli.py or a cli_commands/<group>.py module
+        group: Command group of Typer apps that are not attached with
+            add_typer in the same file (lazily loaded groups)
 
     Returns:
         List of CLICommand objects
@@ -194,7 +196,8 @@ def extract_cli_commands(cli_file: Path) -> list[CLICommand]:
             ):
                 if node.targets and isinstance(node.targets[0], ast.Name):
                     app_name = node.targets[0].id
-                    typer_apps[app_name] = None  # Will be filled in by add_typer
+                    if app_name != "app":
+                        typer_apps.setdefault(app_name, group)
 
         elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Call):
             # Check for app.add_typer(task_app, name="task")
@@ -305,6 +308,9 @@ def get_documentation_coverage(root: Optional[Path] = None) -> DocumentationCove
 
     mcp_tools = extract_mcp_tools(mcp_server_file)
     cli_commands = extract_cli_commands(cli_file)
+    for module in sorted((cli_file.parent / "cli_commands").glob("*.py")):
+        if module.stem != "__init__":
+            cli_commands += extract_cli_commands(module, group=module.stem)
 
     # Documentation files to check
     skills_md = root / "SKILLS.md"
@@ -14,7 +14,9 @@ Features:
 from __future__ import annotations
 
 import http.server
+import importlib.util
 import json
+import os
 import socketserver
 import subprocess
 import threading
@@ -22,6 +24,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
+from idlergear.cache import FileHashCache
+
 SummaryMode = Literal["minimal", "standard", "detailed"]
 
 # Check if pdoc is available
@@ -308,17 +312,55 @@ def generate_module_docs(module_name: str) -> ModuleDoc:
     )
 
 
+def _module_source(module_name: str) -> tuple[Path | None, str]:
+    """Locate a module's source file without importing the module itself.
+
+    Returns:
+        (source path or None, extra fingerprint). For packages the extra
+        fingerprint is the sorted child listing, since adding or removing a
+        submodule changes the package's documentation.
+    """
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError):
+        return None, ""
+    if spec is None or not spec.has_location or not spec.origin:
+        return None, ""
+    origin = Path(spec.origin)
+    if origin.suffix != ".py" or not origin.is_file():
+        return None, ""
+
+    extra = ""
+    if spec.submodule_search_locations:
+        children: list[str] = []
+        for location in spec.submodule_search_locations:
+            try:
+                children.extend(os.listdir(location))
+            except OSError:
+                continue
+        extra = "\0".join(sorted(children))
+    return origin, extra
+
+
 def generate_package_docs(
     package_name: str,
     include_private: bool = False,
     max_depth: int | None = None,
+    use_cache: bool = True,
+    project_path: Path | None = None,
 ) -> dict[str, ModuleDoc]:
     """Generate documentation for a Python package and all its submodules.
 
+    Extracted ModuleDocs are cached in the project's doc cache keyed by each
+    module's source hash, so unchanged modules are neither imported nor
+    re-walked by pdoc on later calls.
+
     Args:
         package_name: The package name (e.g., 'idlergear')
         include_private: Whether to include private modules (starting with _)
         max_depth: Maximum depth of submodules to document (None for unlimited)
+        use_cache: Whether to use the per-project doc cache
+        project_path: Project root for the cache (auto-detected if not provided)
 
     Returns:
         Dictionary mapping module names to their documentation
@@ -329,6 +371,20 @@ def generate_package_docs(
         )
 
     result: dict[str, ModuleDoc] = {}
+    cache = FileHashCache("docs", project_path, ModuleDoc) if use_cache else None
+
+    def _load_module(mod_name: str) -> ModuleDoc:
+        if cache is None:
+            return generate_module_docs(mod_name)
+        source, extra = _module_source(mod_name)
+        if source is None:
+            return generate_module_docs(mod_name)
+        return cache.get_or_compute(
+            f"python:{mod_name}",
+            source,
+            lambda _path: generate_module_docs(mod_name),
+            extra=extra,
+        )
 
     def _process_module(mod_name: str, depth: int = 0) -> None:
         """Process a module and its submodules recursively."""
@@ -341,7 +397,7 @@ def generate_package_docs(
             return
 
         try:
-            mod_doc = generate_module_docs(mod_name)
+            mod_doc = _load_module(mod_name)
             result[mod_name] = mod_doc
 
             # Process submodules
@@ -352,7 +408,11 @@ def generate_package_docs(
             # Skip modules that can't be loaded
             pass
 
-    _process_module(package_name)
+    try:
+        _process_module(package_name)
+    finally:
+        if cache is not None:
+            cache.save()
     return result
 
 
@@ -18,6 +18,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from idlergear.cache import FileHashCache
+
 
 @dataclass
 class DotNetParameter:
@@ -375,10 +377,55 @@ def _parse_method_params(signature: str | None) -> list[str]:
     return params
 
 
+def _make_member(kind: str, member_name: str, signature: str | None, member: ET.Element):
+    """Build the DotNet* object for a non-type member element."""
+    summary = _extract_text(member.find("summary"))
+
+    if kind == "method":
+        # Parse parameters
+        params = []
+        param_types = _parse_method_params(signature)
+
+        for param_elem in member.findall("param"):
+            param_name = param_elem.get("name", "")
+            param_desc = _extract_text(param_elem)
+            param_type = param_types.pop(0) if param_types else None
+            params.append(
+                DotNetParameter(
+                    name=param_name,
+                    type=param_type,
+                    description=param_desc,
+                )
+            )
+
+        # Parse returns
+        returns_elem = member.find("returns")
+        return_desc = _extract_text(returns_elem)
+
+        return DotNetMethod(
+            name=member_name,
+            signature=signature,
+            summary=summary,
+            parameters=params,
+            return_description=return_desc,
+        )
+    elif kind == "property":
+        return DotNetProperty(name=member_name, summary=summary)
+    elif kind == "field":
+        return DotNetField(name=member_name, summary=summary)
+    else:  # event
+        return DotNetEvent(name=member_name, summary=summary)
+
+
 def parse_xml_docs(xml_path: str | Path) -> DotNetAssembly:
     """
     Parse a .NET XML documentation file.
 
+    The file is streamed with ``iterparse``: each <member> element is
+    converted as soon as it is complete and then removed from <members>, so
+    memory use is bounded by the extracted documentation rather than the
+    XML tree.
+
     Args:
         xml_path: Path to the XML documentation file
 
@@ -390,32 +437,34 @@ def parse_xml_docs(xml_path: str | Path) -> DotNetAssembly:
     if not xml_path.exists():
         raise FileNotFoundError(f"XML documentation file not found: {xml_path}")
 
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-
-    # Get assembly name
-    assembly_elem = root.find("assembly/name")
-    assembly_name = assembly_elem.text if assembly_elem is not None else xml_path.stem
-
-    # Parse all members
+    assembly_name = xml_path.stem
     types_by_name: dict[str, DotNetType] = {}
-    namespaces: set[str] = set()
+    # (owning type name, kind, member object) - attached once all types are known
+    pending_members: list[tuple[str, str, Any]] = []
+
+    path_stack: list[str] = []
+    members: ET.Element | None = None
+    for event, elem in ET.iterparse(xml_path, events=("start", "end")):
+        if event == "start":
+            if elem.tag == "members":
+                members = elem
+            path_stack.append(elem.tag)
+            continue
 
-    members = root.find("members")
-    if members is None:
-        return DotNetAssembly(name=assembly_name)
+        path_stack.pop()
+        if elem.tag == "name" and path_stack[-1:] == ["assembly"]:
+            if elem.text:
+                assembly_name = elem.text
+            continue
 
-    # First pass: collect all types
-    for member in members.findall("member"):
-        member_id = member.get("name", "")
+        if elem.tag != "member" or path_stack[-1:] != ["members"]:
+            continue
+
+        member_id = elem.get("name", "")
         kind, full_name, signature = _parse_member_name(member_id)
 
         if kind == "type":
             namespace, type_name = _parse_type_name(full_name)
-            if namespace:
-                namespaces.add(namespace)
-
-            summary = _extract_text(member.find("summary"))
 
             # Determine type kind from name conventions
             type_kind = "class"
@@ -426,20 +475,14 @@ def parse_xml_docs(xml_path: str | Path) -> DotNetAssembly:
             ):
                 type_kind = "interface"
 
-            dotnet_type = DotNetType(
+            types_by_name[full_name] = DotNetType(
                 name=type_name,
                 kind=type_kind,
                 namespace=namespace,
-                summary=summary,
+                summary=_extract_text(elem.find("summary")),
             )
-            types_by_name[full_name] = dotnet_type
 
-    # Second pass: collect members for each type
-    for member in members.findall("member"):
-        member_id = member.get("name", "")
-        kind, full_name, signature = _parse_member_name(member_id)
-
-        if kind in ("method", "property", "field", "event"):
+        elif kind in ("method", "property", "field", "event"):
             # Find the owning type
             type_name = full_name.rsplit(".", 1)[0] if "." in full_name else None
             member_name = (
@@ -450,60 +493,26 @@ def parse_xml_docs(xml_path: str | Path) -> DotNetAssembly:
             if "`" in str(type_name):
                 type_name = type_name.split("`")[0]
 
-            if type_name and type_name in types_by_name:
-                dotnet_type = types_by_name[type_name]
-                summary = _extract_text(member.find("summary"))
-
-                if kind == "method":
-                    # Parse parameters
-                    params = []
-                    param_types = _parse_method_params(signature)
-
-                    for param_elem in member.findall("param"):
-                        param_name = param_elem.get("name", "")
-                        param_desc = _extract_text(param_elem)
-                        param_type = param_types.pop(0) if param_types else None
-                        params.append(
-                            DotNetParameter(
-                                name=param_name,
-                                type=param_type,
-                                description=param_desc,
-                            )
-                        )
-
-                    # Parse returns
-                    returns_elem = member.find("returns")
-                    return_desc = _extract_text(returns_elem)
-
-                    method = DotNetMethod(
-                        name=member_name,
-                        signature=signature,
-                        summary=summary,
-                        parameters=params,
-                        return_description=return_desc,
-                    )
-                    dotnet_type.methods.append(method)
-
-                elif kind == "property":
-                    prop = DotNetProperty(
-                        name=member_name,
-                        summary=summary,
-                    )
-                    dotnet_type.properties.append(prop)
-
-                elif kind == "field":
-                    fld = DotNetField(
-                        name=member_name,
-                        summary=summary,
-                    )
-                    dotnet_type.fields.append(fld)
-
-                elif kind == "event":
-                    evt = DotNetEvent(
-                        name=member_name,
-                        summary=summary,
-                    )
-                    dotnet_type.events.append(evt)
+            if type_name:
+                pending_members.append(
+                    (type_name, kind, _make_member(kind, member_name, signature, elem))
+                )
+
+        # Detach the processed member; clearing it alone would leave an
+        # empty element per member in the tree
+        members.clear()
+
+    # Attach members to their owning types (types may appear after members)
+    attribute_for_kind = {
+        "method": "methods",
+        "property": "properties",
+        "field": "fields",
+        "event": "events",
+    }
+    for type_name, kind, obj in pending_members:
+        dotnet_type = types_by_name.get(type_name)
+        if dotnet_type is not None:
+            getattr(dotnet_type, attribute_for_kind[kind]).append(obj)
 
     # Organize types by namespace
     namespace_map: dict[str, DotNetNamespace] = {}
@@ -522,6 +531,34 @@ def parse_xml_docs(xml_path: str | Path) -> DotNetAssembly:
     )
 
 
+def load_xml_docs(
+    xml_path: str | Path, project_path: Path | None = None
+) -> DotNetAssembly:
+    """Parse a .NET XML documentation file through the per-project doc cache.
+
+    The parsed DotNetAssembly is keyed by the XML file's content hash, so a
+    rebuild that leaves the docs unchanged costs only a stat (or a hash).
+
+    Args:
+        xml_path: Path to the XML documentation file
+        project_path: Project root for the cache (auto-detected if not provided)
+
+    Returns:
+        DotNetAssembly with parsed documentation
+    """
+    xml_path = Path(xml_path)
+
+    if not xml_path.exists():
+        raise FileNotFoundError(f"XML documentation file not found: {xml_path}")
+
+    cache = FileHashCache("docs", project_path, DotNetAssembly)
+    assembly = cache.get_or_compute(
+        f"dotnet:{xml_path.resolve()}", xml_path, parse_xml_docs
+    )
+    cache.save()
+    return assembly
+
+
 def detect_dotnet_project(path: str | Path | None = None) -> dict[str, Any]:
     """
     Detect .NET project configuration.
@@ -757,7 +794,7 @@ def generate_dotnet_docs_json(
     """
     import json
 
-    assembly = parse_xml_docs(xml_path)
+    assembly = load_xml_docs(xml_path)
 
     if mode == "full":
         data = assembly.to_dict()
@@ -767,6 +804,28 @@ def generate_dotnet_docs_json(
     return json.dumps(data, indent=indent)
 
 
+def _is_xml_docs_file(xml_file: Path) -> bool:
+    """Check whether an XML file is compiler doc output.
+
+    Only the start of the document is read: doc files begin with
+    <assembly>...</assembly><members> under the root element.
+    """
+    seen_assembly = False
+    try:
+        for depth, (event, elem) in enumerate(
+            ET.iterparse(xml_file, events=("start",))
+        ):
+            if elem.tag == "assembly":
+                seen_assembly = True
+            elif elem.tag == "members":
+                return seen_assembly
+            if depth > 16:
+                return False
+    except (ET.ParseError, OSError):
+        pass
+    return False
+
+
 def find_xml_docs(path: str | Path | None = None) -> list[Path]:
     """
     Find XML documentation files in a .NET project.
@@ -791,13 +850,8 @@ def find_xml_docs(path: str | Path | None = None) -> list[Path]:
         if ".nuget" in str(xml_file) or "packages" in str(xml_file):
             continue
 
-        try:
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
-            if root.find("assembly") is not None and root.find("members") is not None:
-                xml_docs.append(xml_file)
-        except (ET.ParseError, OSError):
-            pass
+        if _is_xml_docs_file(xml_file):
+            xml_docs.append(xml_file)
 
     return xml_docs
 
@@ -16,6 +16,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
 
+from idlergear.cache import FileHashCache
+from idlergear.config import find_idlergear_root
+
 SummaryMode = Literal["minimal", "standard", "detailed"]
 
 
@@ -465,11 +468,16 @@ def parse_rust_file(file_path: Path) -> RustModule:
     return module
 
 
-def parse_rust_crate(path: Path | str = ".") -> RustCrate:
+def parse_rust_crate(path: Path | str = ".", use_cache: bool = True) -> RustCrate:
     """Parse a Rust crate and extract documentation.
 
+    Parsed modules are cached per file (keyed by content hash) in the doc
+    cache of the enclosing IdlerGear project, so only changed .rs files are
+    re-parsed on later calls.
+
     Args:
         path: Path to the crate root
+        use_cache: Whether to use the per-project doc cache
 
     Returns:
         RustCrate with all module documentation
@@ -490,17 +498,35 @@ def parse_rust_crate(path: Path | str = ".") -> RustCrate:
     if not src_dir.exists():
         return crate
 
+    cache = (
+        FileHashCache("docs", find_idlergear_root(str(path)), RustModule)
+        if use_cache
+        else None
+    )
+    crate_key = str(path.resolve())
+
+    def _parse(rs_file: Path) -> RustModule:
+        module = parse_rust_file(rs_file)
+        # Set relative path
+        module.path = str(rs_file.relative_to(path))
+        return module
+
     # Parse all .rs files
-    for rs_file in src_dir.rglob("*.rs"):
+    for rs_file in sorted(src_dir.rglob("*.rs")):
         try:
-            module = parse_rust_file(rs_file)
-            # Set relative path
-            module.path = str(rs_file.relative_to(path))
+            if cache is None:
+                module = _parse(rs_file)
+            else:
+                module = cache.get_or_compute(
+                    f"rust:{crate_key}:{rs_file.relative_to(path)}", rs_file, _parse
+                )
             crate.modules.append(module)
         except Exception:
             # Skip files that can't be parsed
             pass
 
+    if cache is not None:
+        cache.save()
     return crate
 
 
@@ -5,18 +5,29 @@ The `idlergear doctor` command checks for:
 2. File installation status - Are all managed files up to date?
 3. Lingering/legacy files - Are there files that should be cleaned up?
 4. Unmanaged knowledge files - Are there files that should be migrated?
+
+Checks are independent, so run_doctor() runs them concurrently with a
+per-check timeout. Results of deterministic checks are cached in
+.idlergear/cache/doctor.json, keyed by a fingerprint of the inputs each
+check reads (file sizes/mtimes, git HEAD, config hash), so a repeat run only
+re-executes checks whose inputs changed.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
+import os
+import threading
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from idlergear import __version__
 from idlergear.config import find_idlergear_root
+from idlergear.git import read_head
 from idlergear.upgrade import parse_version, get_project_version
 
 
@@ -48,6 +59,16 @@ class CheckResult:
             "details": self.details,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CheckResult":
+        return cls(
+            name=data["name"],
+            status=CheckStatus(data["status"]),
+            message=data["message"],
+            fix=data.get("fix"),
+            details=data.get("details") or {},
+        )
+
 
 @dataclass
 class DoctorReport:
@@ -908,10 +929,20 @@ def check_file_annotations(project_path: Path) -> CheckResult:
             details={"impact": "Missing 93% token savings on file discovery"},
         )
 
-    # Count annotation files
-    annotation_files = list(annotations_dir.glob("**/*.json"))
+    from idlergear.file_annotation_storage import (
+        FileAnnotationStorage,
+        SQLiteAnnotationStorage,
+    )
+
+    # Count annotations in the packed store, or legacy per-file JSON
+    if (annotations_dir / SQLiteAnnotationStorage.DB_NAME).exists():
+        storage = SQLiteAnnotationStorage(annotations_dir)
+        annotated = len(storage.list_paths())
+        storage.close()
+    else:
+        annotated = len(FileAnnotationStorage(annotations_dir).list_paths())
 
-    if len(annotation_files) == 0:
+    if annotated == 0:
         return CheckResult(
             name="file_annotations",
             status=CheckStatus.WARNING,
@@ -923,7 +954,7 @@ def check_file_annotations(project_path: Path) -> CheckResult:
     return CheckResult(
         name="file_annotations",
         status=CheckStatus.OK,
-        message=f"File annotations ready ({len(annotation_files)} files annotated)",
+        message=f"File annotations ready ({annotated} files annotated)",
         details={"impact": "93% token savings enabled"},
     )
 
@@ -1035,11 +1066,212 @@ def check_rag_index(project_path: Path) -> CheckResult:
 # ============================================================================
 
 
-def run_doctor(project_path: Path | None = None) -> DoctorReport:
+# Default per-check timeout in seconds
+CHECK_TIMEOUT = 10.0
+
+# Files whose presence/content decides which test framework is detected
+FRAMEWORK_MARKERS = [
+    ".",
+    "pyproject.toml",
+    "pytest.ini",
+    "conftest.py",
+    "tests/conftest.py",
+    "requirements.txt",
+    "requirements-dev.txt",
+    "Cargo.toml",
+    "package.json",
+    "go.mod",
+    ".rspec",
+    "spec",
+]
+
+DOCTOR_CACHE_FILE = "doctor.json"
+
+
+@dataclass
+class DoctorCheck:
+    """A registered health check.
+
+    ``inputs`` returns the project-relative paths the check reads; their
+    size/mtime (plus git HEAD when ``uses_git`` is set) fingerprint the
+    cached result. Checks without inputs (e.g. time-dependent ones) always
+    run.
+    """
+
+    name: str
+    run: Callable[[Path], CheckResult | list[CheckResult]]
+    inputs: Callable[[Path], list[str]] | None = None
+    uses_git: bool = False
+    extra: Callable[[], str] | None = None
+    timeout: float = CHECK_TIMEOUT
+
+
+def _installed_file_inputs(project_path: Path) -> list[str]:
+    from idlergear.install import HOOK_SCRIPTS
+
+    paths = [
+        ".claude/rules/idlergear.md",
+        ".claude/skills/idlergear",
+        ".claude/skills/idlergear/SKILL.md",
+        ".claude/hooks",
+        ".claude/commands",
+    ]
+    paths.extend(f".claude/hooks/{name}" for name in HOOK_SCRIPTS)
+    commands_dir = project_path / ".claude" / "commands"
+    if commands_dir.is_dir():
+        paths.extend(
+            f".claude/commands/{p.name}" for p in sorted(commands_dir.glob("*.md"))
+        )
+    return paths
+
+
+def _orphaned_file_inputs(project_path: Path) -> list[str]:
+    return [".claude", ".claude/hooks", ".claude/commands"]
+
+
+def _source_tree_inputs(project_path: Path) -> list[str]:
+    """Directories of the source tree (their mtimes change on add/remove)."""
+    from idlergear.walker import DirectoryWalker
+
+    walker = DirectoryWalker(project_path)
+    dirs = [e.rel_path for e in walker.walk(include_dirs=True) if e.is_dir]
+    return FRAMEWORK_MARKERS + dirs
+
+
+def _rag_available() -> str:
+    import importlib.util
+
+    return str(importlib.util.find_spec("llama_index") is not None)
+
+
+DOCTOR_CHECKS: list[DoctorCheck] = [
+    # Configuration checks
+    DoctorCheck(
+        "initialization",
+        check_initialization,
+        lambda p: [".idlergear", ".idlergear/config.toml", ".idlergear/config.json"],
+    ),
+    DoctorCheck("version", check_version, lambda p: [".idlergear/config.toml"]),
+    # File installation checks
+    DoctorCheck("mcp_config", check_mcp_config, lambda p: [".mcp.json"]),
+    DoctorCheck("hooks_config", check_hooks_config, lambda p: [".claude/hooks.json"]),
+    DoctorCheck("installed_files", check_installed_files, _installed_file_inputs),
+    # Legacy and unmanaged file checks
+    DoctorCheck("legacy_files", check_legacy_files, lambda p: list(LEGACY_FILES)),
+    DoctorCheck("unmanaged_files", check_unmanaged_knowledge_files, lambda p: ["."]),
+    DoctorCheck("orphaned_files", check_orphaned_claude_files, _orphaned_file_inputs),
+    # Token-saving feature checks
+    DoctorCheck(
+        "file_annotations", check_file_annotations, lambda p: [".idlergear/file_annotations"]
+    ),
+    DoctorCheck("knowledge_graph", check_knowledge_graph, lambda p: [".idlergear/graph.db"]),
+    DoctorCheck(
+        "rag_index",
+        check_rag_index,
+        lambda p: [".idlergear/vector_index"],
+        extra=_rag_available,
+    ),
+    # Test health checks (staleness and external runs depend on the clock /
+    # third-party caches, so they always run)
+    DoctorCheck("test_staleness", check_test_staleness),
+    DoctorCheck(
+        "test_failures",
+        check_test_failures,
+        lambda p: FRAMEWORK_MARKERS + [".idlergear/tests/last-run.json"],
+    ),
+    DoctorCheck(
+        "test_coverage", check_test_coverage_gaps, _source_tree_inputs, uses_git=True
+    ),
+    DoctorCheck("external_tests", check_external_test_runs),
+    # Documentation coverage check
+    DoctorCheck(
+        "doc_coverage",
+        check_documentation_coverage,
+        lambda p: [
+            "src/idlergear/mcp_server.py",
+            "src/idlergear/cli.py",
+            "src/idlergear/cli_commands",
+            *sorted(
+                str(f.relative_to(p))
+                for f in (p / "src/idlergear/cli_commands").glob("*.py")
+            ),
+            "SKILLS.md",
+            "README.md",
+            "AGENTS.md",
+        ],
+    ),
+]
+
+
+def _config_hash(project_path: Path) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    for name in ("config.toml", "config.json"):
+        try:
+            hasher.update((project_path / ".idlergear" / name).read_bytes())
+        except OSError:
+            pass
+    return hasher.hexdigest()
+
+
+def check_fingerprint(check: DoctorCheck, project_path: Path, config_hash: str) -> str | None:
+    """Fingerprint the inputs of a check, or None if it is not cacheable."""
+    if check.inputs is None:
+        return None
+    parts = [__version__, config_hash]
+    if check.uses_git:
+        parts.append(read_head(project_path))
+    if check.extra is not None:
+        parts.append(check.extra())
+    for rel in check.inputs(project_path):
+        try:
+            st = os.stat(project_path / rel)
+            parts.append(f"{rel}:{st.st_size}:{st.st_mtime_ns}")
+        except OSError:
+            parts.append(f"{rel}:-")
+    return hashlib.blake2b("\n".join(parts).encode(), digest_size=16).hexdigest()
+
+
+def _load_doctor_cache(cache_file: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != __version__:
+        return {}
+    return data.get("checks", {})
+
+
+def _save_doctor_cache(cache_file: Path, entries: dict[str, Any]) -> None:
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".tmp.{os.getpid()}")
+        tmp.write_text(json.dumps({"version": __version__, "checks": entries}))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+
+
+def _as_list(result: CheckResult | list[CheckResult]) -> list[CheckResult]:
+    return result if isinstance(result, list) else [result]
+
+
+def run_doctor(
+    project_path: Path | None = None,
+    use_cache: bool = True,
+    max_workers: int | None = None,
+    timeout: float | None = None,
+) -> DoctorReport:
     """Run all health checks and return a complete report.
 
+    Checks run concurrently; results appear in registration order. A check
+    that exceeds its timeout or raises is reported as a warning (and not
+    cached) instead of blocking the report.
+
     Args:
         project_path: Path to project root. If None, will auto-detect.
+        use_cache: Reuse cached results for checks whose inputs are unchanged.
+        max_workers: Number of worker threads (default: one per check).
+        timeout: Override the per-check timeout in seconds.
 
     Returns:
         DoctorReport with all check results.
@@ -1047,8 +1279,6 @@ def run_doctor(project_path: Path | None = None) -> DoctorReport:
     if project_path is None:
         project_path = find_idlergear_root()
 
-    checks = []
-
     if project_path is None:
         # Not in an IdlerGear project
         return DoctorReport(
@@ -1065,33 +1295,91 @@ def run_doctor(project_path: Path | None = None) -> DoctorReport:
             project_version=None,
         )
 
-    # Configuration checks
-    checks.append(check_initialization(project_path))
-    checks.append(check_version(project_path))
-
-    # File installation checks
-    checks.append(check_mcp_config(project_path))
-    checks.append(check_hooks_config(project_path))
-    checks.extend(check_installed_files(project_path))
+    project_path = Path(project_path)
+    from idlergear.cache import get_cache_dir
 
-    # Legacy and unmanaged file checks
-    checks.extend(check_legacy_files(project_path))
-    checks.extend(check_unmanaged_knowledge_files(project_path))
-    checks.extend(check_orphaned_claude_files(project_path))
-
-    # Token-saving feature checks
-    checks.append(check_file_annotations(project_path))
-    checks.append(check_knowledge_graph(project_path))
-    checks.append(check_rag_index(project_path))
+    cache_file = get_cache_dir(project_path) / DOCTOR_CACHE_FILE
+    cached = _load_doctor_cache(cache_file) if use_cache else {}
+    config_hash = _config_hash(project_path)
 
-    # Test health checks
-    checks.append(check_test_staleness(project_path))
-    checks.append(check_test_failures(project_path))
-    checks.append(check_test_coverage_gaps(project_path))
-    checks.append(check_external_test_runs(project_path))
-
-    # Documentation coverage check
-    checks.append(check_documentation_coverage(project_path))
+    results: dict[str, list[CheckResult]] = {}
+    fingerprints: dict[str, str | None] = {}
+    pending: list[DoctorCheck] = []
+    for check in DOCTOR_CHECKS:
+        try:
+            fingerprint = check_fingerprint(check, project_path, config_hash)
+        except Exception:
+            fingerprint = None
+        fingerprints[check.name] = fingerprint
+        entry = cached.get(check.name)
+        if fingerprint is not None and entry and entry.get("fingerprint") == fingerprint:
+            results[check.name] = [CheckResult.from_dict(r) for r in entry["results"]]
+        else:
+            pending.append(check)
+
+    if pending:
+        # Daemon threads rather than an executor: a hung check must not keep
+        # the process alive after the report is printed.
+        slots = threading.BoundedSemaphore(max_workers or len(pending))
+        started: dict[str, float] = {}
+        outcomes: dict[str, list[CheckResult] | BaseException] = {}
+
+        def run_check(check: DoctorCheck) -> None:
+            with slots:
+                started[check.name] = time.monotonic()
+                try:
+                    outcomes[check.name] = _as_list(check.run(project_path))
+                except BaseException as e:  # reported, never raised
+                    outcomes[check.name] = e
+
+        threads = []
+        for check in pending:
+            thread = threading.Thread(
+                target=run_check, args=(check,), name=f"doctor-{check.name}", daemon=True
+            )
+            thread.start()
+            threads.append((check, thread))
+
+        for check, thread in threads:
+            limit = check.timeout if timeout is None else timeout
+            thread.join(limit)
+            start = started.get(check.name)
+            if thread.is_alive() and start is not None:
+                # Waited while queued behind other checks: allow the full budget
+                thread.join(max(limit - (time.monotonic() - start), 0))
+
+            outcome = outcomes.get(check.name)
+            if outcome is None:
+                results[check.name] = [
+                    CheckResult(
+                        name=check.name,
+                        status=CheckStatus.WARNING,
+                        message=f"Check timed out after {limit:g}s",
+                    )
+                ]
+                cached.pop(check.name, None)
+            elif isinstance(outcome, BaseException):
+                results[check.name] = [
+                    CheckResult(
+                        name=check.name,
+                        status=CheckStatus.WARNING,
+                        message=f"Check failed: {outcome}",
+                    )
+                ]
+                cached.pop(check.name, None)
+            else:
+                results[check.name] = outcome
+                fingerprint = fingerprints[check.name]
+                if fingerprint is not None:
+                    cached[check.name] = {
+                        "fingerprint": fingerprint,
+                        "results": [r.to_dict() for r in outcome],
+                    }
+
+        if use_cache:
+            _save_doctor_cache(cache_file, cached)
+
+    checks = [r for check in DOCTOR_CHECKS for r in results.get(check.name, [])]
 
     return DoctorReport(
         checks=checks,
@@ -1,19 +1,31 @@
-"""File annotation storage backend - one file per annotation.
+"""File annotation storage backends.
 
-This module provides a storage backend for file annotations that stores
-each annotation in a separate JSON file, enabling:
+Two backends share one interface:
+
+``SQLiteAnnotationStorage`` (the default) packs every annotation into a
+single SQLite database with secondary indexes on status, tags and
+components and a full-text index on descriptions, so searches and listings
+are indexed queries instead of a walk over thousands of small files.
+
+``FileAnnotationStorage`` stores each annotation in a separate JSON file,
+enabling:
 - Git-friendly diffs (only changed annotations show up)
 - No merge conflicts (different files = no conflicts)
-- Infinite scalability (no monolithic file to load)
 - Selective version control (can .gitignore specific directories)
 - Consistency with tasks/notes/plans storage pattern
+
+The packed store can export to (and import from) the one-file-per-annotation
+layout, which remains available as a human-readable snapshot.
 """
 
 import json
+import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 from idlergear.file_registry import FileEntry, FileStatus, PatternRule
 
@@ -108,7 +120,10 @@ class FileAnnotationStorage:
 
         data["updated"] = now
 
-        # Write atomically (write to temp file, then rename)
+        self._write_json(annotation_path, data)
+
+    def _write_json(self, annotation_path: Path, data: Dict[str, Any]) -> None:
+        """Write an annotation file atomically (temp file, then rename)."""
         temp_path = annotation_path.with_suffix(".json.tmp")
         with open(temp_path, "w") as f:
             json.dump(data, f, indent=2)
@@ -168,16 +183,16 @@ class FileAnnotationStorage:
 
         return False
 
-    def list_annotations(self) -> List[FileEntry]:
-        """List all annotations by walking directory tree.
+    def list_paths(self) -> List[str]:
+        """List annotated file paths without loading the annotations.
 
         Returns:
-            List of all FileEntry objects
+            List of original file paths
         """
         if not self.base_path.exists():
             return []
 
-        annotations = []
+        paths = []
 
         # Walk directory tree
         for json_file in self.base_path.rglob("*.json"):
@@ -188,14 +203,92 @@ class FileAnnotationStorage:
             # Extract original file path from annotation path
             # e.g., ".idlergear/file_annotations/src/api/auth.py.json" -> "src/api/auth.py"
             relative = json_file.relative_to(self.base_path)
-            file_path = str(relative)[:-5]  # Remove .json extension
+            paths.append(relative.as_posix()[:-5])  # Remove .json extension
 
+        return paths
+
+    def list_annotations(self) -> List[FileEntry]:
+        """List all annotations by walking directory tree.
+
+        Returns:
+            List of all FileEntry objects
+        """
+        annotations = []
+
+        for file_path in self.list_paths():
             entry = self.load_annotation(file_path)
             if entry:
                 annotations.append(entry)
 
         return annotations
 
+    def search(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        components: Optional[List[str]] = None,
+        status: Optional[FileStatus] = None,
+    ) -> List[FileEntry]:
+        """Search annotations by description, tags, components, or status.
+
+        Args:
+            query: Substring to find in descriptions (case-insensitive)
+            tags: Filter by tags (OR logic - matches if any tag matches)
+            components: Filter by component names (OR logic)
+            status: Filter by file status
+
+        Returns:
+            List of matching FileEntry objects
+        """
+        results = []
+
+        for entry in self.list_annotations():
+            # Filter by status
+            if status and entry.status != status:
+                continue
+
+            # Full-text search in description
+            if query:
+                if not entry.description:
+                    continue
+                if query.lower() not in entry.description.lower():
+                    continue
+
+            # Filter by tags (OR logic)
+            if tags:
+                if not entry.tags:
+                    continue
+                if not any(tag in entry.tags for tag in tags):
+                    continue
+
+            # Filter by components (OR logic)
+            if components:
+                if not entry.components:
+                    continue
+                if not any(comp in entry.components for comp in components):
+                    continue
+
+            results.append(entry)
+
+        return results
+
+    def list_tags(self) -> Dict[str, Dict[str, Any]]:
+        """List all tags with usage counts.
+
+        Returns:
+            Dictionary mapping tag name to {"count": int, "files": [paths]}
+        """
+        tag_map: Dict[str, Dict[str, Any]] = {}
+
+        for entry in self.list_annotations():
+            for tag in entry.tags:
+                if tag not in tag_map:
+                    tag_map[tag] = {"count": 0, "files": []}
+                tag_map[tag]["count"] += 1
+                tag_map[tag]["files"].append(entry.path)
+
+        return tag_map
+
     def save_patterns(self, patterns: Dict[str, PatternRule]) -> None:
         """Save pattern rules to patterns.json.
 
@@ -233,6 +326,399 @@ class FileAnnotationStorage:
             return {}
 
 
+class SQLiteAnnotationStorage(FileAnnotationStorage):
+    """Storage backend packing all file annotations into one SQLite database.
+
+    Layout:
+        .idlergear/file_annotations/
+            annotations.db             # All annotations (WAL mode)
+            patterns.json              # Pattern rules (single file)
+
+    Each annotation is one row holding the same JSON document the
+    one-file-per-annotation backend writes, plus indexed columns:
+
+    - ``annotations.status`` (B-tree index)
+    - ``annotation_tags`` / ``annotation_components`` (tag -> path indexes)
+    - ``annotations_fts`` (FTS5 trigram index on descriptions, giving
+      case-insensitive substring search)
+
+    An existing one-file-per-annotation directory is imported automatically
+    the first time the database is created, and ``export_json`` writes that
+    layout back out as a human-readable snapshot.
+    """
+
+    SCHEMA_VERSION = 1
+    DB_NAME = "annotations.db"
+
+    def __init__(self, base_path: Optional[Path] = None):
+        """Initialize storage backend.
+
+        Args:
+            base_path: Base directory for the database and patterns.json.
+                      Defaults to .idlergear/file_annotations/
+        """
+        super().__init__(base_path)
+        self.db_path = self.base_path / self.DB_NAME
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        created = not self.db_path.exists()
+
+        self.conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, isolation_level=None
+        )
+        self.conn.row_factory = sqlite3.Row
+
+        # Enable WAL mode for better concurrency
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+
+        # Serializes write transactions on the shared connection
+        self._lock = threading.Lock()
+        self._init_schema()
+
+        if created:
+            self.import_json()
+
+    def _init_schema(self) -> None:
+        """Create the schema if missing (safe to race with other processes)."""
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS schema_version (
+                version INTEGER NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS annotations (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                status TEXT NOT NULL,
+                description TEXT,
+                data TEXT NOT NULL,
+                created TEXT NOT NULL,
+                updated TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_annotations_status ON annotations(status);
+
+            CREATE TABLE IF NOT EXISTS annotation_tags (
+                tag TEXT NOT NULL,
+                path TEXT NOT NULL,
+                PRIMARY KEY (tag, path)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_annotation_tags_path ON annotation_tags(path);
+
+            CREATE TABLE IF NOT EXISTS annotation_components (
+                component TEXT NOT NULL,
+                path TEXT NOT NULL,
+                PRIMARY KEY (component, path)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_annotation_components_path
+                ON annotation_components(path);
+            """
+        )
+        if self.conn.execute("SELECT version FROM schema_version").fetchone() is None:
+            self.conn.execute(
+                "INSERT INTO schema_version (version) VALUES (?)", (self.SCHEMA_VERSION,)
+            )
+
+        try:
+            self.conn.executescript(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS annotations_fts USING fts5(
+                    description,
+                    content='annotations',
+                    content_rowid='id',
+                    tokenize='trigram'
+                );
+
+                -- Triggers to keep FTS in sync
+                CREATE TRIGGER IF NOT EXISTS annotations_fts_insert
+                AFTER INSERT ON annotations BEGIN
+                    INSERT INTO annotations_fts(rowid, description)
+                    VALUES (new.id, new.description);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS annotations_fts_delete
+                AFTER DELETE ON annotations BEGIN
+                    INSERT INTO annotations_fts(annotations_fts, rowid, description)
+                    VALUES ('delete', old.id, old.description);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS annotations_fts_update
+                AFTER UPDATE ON annotations BEGIN
+                    INSERT INTO annotations_fts(annotations_fts, rowid, description)
+                    VALUES ('delete', old.id, old.description);
+                    INSERT INTO annotations_fts(rowid, description)
+                    VALUES (new.id, new.description);
+                END;
+                """
+            )
+            self._fts = True
+        except sqlite3.OperationalError:
+            # SQLite < 3.34 has no trigram tokenizer; fall back to LIKE scans
+            self._fts = False
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one write transaction."""
+        with self._lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self.conn
+            except BaseException:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
+    def _upsert(
+        self,
+        conn: sqlite3.Connection,
+        entry: FileEntry,
+        created: str,
+        updated: str,
+    ) -> None:
+        """Insert or replace one annotation row and its index rows."""
+        data = entry.to_dict()
+        data["path"] = entry.path
+        # created is preserved on update by the ON CONFLICT clause
+        conn.execute(
+            """
+            INSERT INTO annotations (path, status, description, data, created, updated)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                status = excluded.status,
+                description = excluded.description,
+                data = excluded.data,
+                updated = excluded.updated
+            """,
+            (
+                entry.path,
+                entry.status.value,
+                entry.description,
+                json.dumps(data),
+                created,
+                updated,
+            ),
+        )
+        conn.execute("DELETE FROM annotation_tags WHERE path = ?", (entry.path,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO annotation_tags (tag, path) VALUES (?, ?)",
+            [(tag, entry.path) for tag in entry.tags],
+        )
+        conn.execute("DELETE FROM annotation_components WHERE path = ?", (entry.path,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO annotation_components (component, path) VALUES (?, ?)",
+            [(component, entry.path) for component in entry.components],
+        )
+
+    @staticmethod
+    def _entry(row: sqlite3.Row) -> Optional[FileEntry]:
+        try:
+            return FileEntry.from_dict(row["path"], json.loads(row["data"]))
+        except (json.JSONDecodeError, KeyError, ValueError):
+            return None
+
+    def save_annotation(self, entry: FileEntry) -> None:
+        """Save (insert or update) one annotation.
+
+        Args:
+            entry: FileEntry to save
+        """
+        self.save_annotations([entry])
+
+    def save_annotations(self, entries: Iterable[FileEntry]) -> int:
+        """Save many annotations in a single transaction.
+
+        Args:
+            entries: FileEntry objects to save
+
+        Returns:
+            Number of annotations saved
+        """
+        now = datetime.now().astimezone().isoformat()
+        count = 0
+        with self._transaction() as conn:
+            for entry in entries:
+                self._upsert(conn, entry, now, now)
+                count += 1
+        return count
+
+    def load_annotation(self, file_path: str) -> Optional[FileEntry]:
+        """Load one annotation.
+
+        Args:
+            file_path: Path to original file
+
+        Returns:
+            FileEntry if annotation exists, None otherwise
+        """
+        row = self.conn.execute(
+            "SELECT path, data FROM annotations WHERE path = ?", (file_path,)
+        ).fetchone()
+        return self._entry(row) if row else None
+
+    def delete_annotation(self, file_path: str) -> bool:
+        """Delete one annotation.
+
+        Args:
+            file_path: Path to original file
+
+        Returns:
+            True if annotation was deleted, False if not found
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM annotations WHERE path = ?", (file_path,))
+            conn.execute("DELETE FROM annotation_tags WHERE path = ?", (file_path,))
+            conn.execute("DELETE FROM annotation_components WHERE path = ?", (file_path,))
+        return cursor.rowcount > 0
+
+    def list_paths(self) -> List[str]:
+        """List annotated file paths without loading the annotations.
+
+        Returns:
+            List of original file paths, sorted
+        """
+        rows = self.conn.execute("SELECT path FROM annotations ORDER BY path")
+        return [row["path"] for row in rows]
+
+    def list_annotations(self) -> List[FileEntry]:
+        """List all annotations.
+
+        Returns:
+            List of all FileEntry objects, sorted by path
+        """
+        rows = self.conn.execute("SELECT path, data FROM annotations ORDER BY path")
+        return [entry for entry in map(self._entry, rows) if entry]
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        components: Optional[List[str]] = None,
+        status: Optional[FileStatus] = None,
+    ) -> List[FileEntry]:
+        """Search annotations using the secondary and full-text indexes.
+
+        Args:
+            query: Substring to find in descriptions (case-insensitive)
+            tags: Filter by tags (OR logic - matches if any tag matches)
+            components: Filter by component names (OR logic)
+            status: Filter by file status
+
+        Returns:
+            List of matching FileEntry objects, sorted by path
+        """
+        conditions = []
+        params: List[Any] = []
+
+        if status:
+            conditions.append("status = ?")
+            params.append(status.value)
+        if tags:
+            conditions.append(
+                "path IN (SELECT path FROM annotation_tags WHERE tag IN "
+                f"({', '.join('?' * len(tags))}))"
+            )
+            params.extend(tags)
+        if components:
+            conditions.append(
+                "path IN (SELECT path FROM annotation_components WHERE component IN "
+                f"({', '.join('?' * len(components))}))"
+            )
+            params.extend(components)
+        if query:
+            if self._fts and len(query) >= 3:
+                # Trigram tokens need at least three characters
+                conditions.append(
+                    "id IN (SELECT rowid FROM annotations_fts WHERE annotations_fts MATCH ?)"
+                )
+                params.append('"' + query.replace('"', '""') + '"')
+            else:
+                conditions.append("description LIKE ? ESCAPE '\\'")
+                escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.append(f"%{escaped}%")
+
+        sql = "SELECT path, data FROM annotations"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        rows = self.conn.execute(sql + " ORDER BY path", params)
+
+        results = [entry for entry in map(self._entry, rows) if entry]
+        if query:
+            # LIKE and trigram matching fold ASCII case only; match str.lower()
+            needle = query.lower()
+            results = [e for e in results if e.description and needle in e.description.lower()]
+        return results
+
+    def list_tags(self) -> Dict[str, Dict[str, Any]]:
+        """List all tags with usage counts.
+
+        Returns:
+            Dictionary mapping tag name to {"count": int, "files": [paths]}
+        """
+        tag_map: Dict[str, Dict[str, Any]] = {}
+        rows = self.conn.execute("SELECT tag, path FROM annotation_tags ORDER BY tag, path")
+        for row in rows:
+            info = tag_map.setdefault(row["tag"], {"count": 0, "files": []})
+            info["count"] += 1
+            info["files"].append(row["path"])
+        return tag_map
+
+    def import_json(self, directory: Optional[Path] = None) -> int:
+        """Import a one-file-per-annotation directory.
+
+        Timestamps from the JSON files are kept. Existing annotations for
+        the same paths are overwritten.
+
+        Args:
+            directory: Directory to import (default: base_path)
+
+        Returns:
+            Number of annotations imported
+        """
+        source = FileAnnotationStorage(directory or self.base_path)
+        now = datetime.now().astimezone().isoformat()
+        count = 0
+        with self._transaction() as conn:
+            for file_path in source.list_paths():
+                try:
+                    with open(source._get_annotation_path(file_path)) as f:
+                        data = json.load(f)
+                    entry = FileEntry.from_dict(file_path, data)
+                except (OSError, json.JSONDecodeError, KeyError, ValueError):
+                    continue  # Corrupted file - skip it
+                self._upsert(
+                    conn, entry, data.get("created", now), data.get("updated", now)
+                )
+                count += 1
+        return count
+
+    def export_json(self, directory: Optional[Path] = None) -> int:
+        """Export annotations to the one-file-per-annotation layout.
+
+        Args:
+            directory: Target directory (default: base_path)
+
+        Returns:
+            Number of annotation files written
+        """
+        target = FileAnnotationStorage(directory or self.base_path)
+        rows = self.conn.execute(
+            "SELECT path, data, created, updated FROM annotations ORDER BY path"
+        )
+        count = 0
+        for row in rows:
+            data = json.loads(row["data"])
+            data["created"] = row["created"]
+            data["updated"] = row["updated"]
+            annotation_path = target._get_annotation_path(row["path"])
+            annotation_path.parent.mkdir(parents=True, exist_ok=True)
+            target._write_json(annotation_path, data)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
+
+
 def migrate_from_legacy(
     legacy_path: Path,
     storage: FileAnnotationStorage,
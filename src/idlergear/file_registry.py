@@ -12,7 +12,7 @@ from datetime import datetime
 from enum import Enum
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Pattern
+from typing import Any, Dict, Iterable, List, Optional, Pattern
 
 
 class FileStatus(Enum):
@@ -108,6 +108,17 @@ class PatternRule:
         - Patterns without / match anywhere in the path (basename)
         - Patterns with / match from the start
         """
+        regex = self._translate(pattern)
+
+        # If pattern has no /, match basename anywhere in tree
+        if "/" not in pattern:
+            return f"^(?:.*/)?{regex}$"
+
+        return f"^{regex}$"
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """Translate a glob to an unanchored regex body."""
         # Escape special regex characters except * and ?
         escaped = re.escape(pattern)
 
@@ -121,13 +132,7 @@ class PatternRule:
         regex = regex.replace(r"\*", "[^/]*")
 
         # ? matches single character
-        regex = regex.replace(r"\?", ".")
-
-        # If pattern has no /, match basename anywhere in tree
-        if "/" not in pattern:
-            return f"^(?:.*/)?{regex}$"
-
-        return f"^{regex}$"
+        return regex.replace(r"\?", ".")
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -148,10 +153,160 @@ class PatternRule:
         )
 
 
+class _PrefixIndex:
+    """Wildcard globs indexed by their leading literal text.
+
+    Globs sharing a literal head (``archive/`` in ``archive/**/*``) are
+    merged into one alternation of named groups over the rest of the glob,
+    looked up by slicing the head off the target. Globs starting with a
+    wildcard share a single alternation. Alternatives are tried left to
+    right, so each alternation reports its earliest rule.
+    """
+
+    def __init__(self) -> None:
+        self._alternatives: Dict[str, List[str]] = {}
+        self._regexes: Dict[str, Pattern] = {}
+        self._lengths: List[int] = []
+
+    @staticmethod
+    def _head(glob: str) -> str:
+        """Return the literal text before the first wildcard."""
+        end = min((i for i in (glob.find("*"), glob.find("?")) if i >= 0), default=len(glob))
+        if end and glob.startswith("/**", end - 1):
+            end -= 1  # "/**" also matches zero components, slash included
+        return glob[:end]
+
+    def add(self, index: int, glob: str) -> None:
+        """Add rule ``index`` (call in priority order)."""
+        head = self._head(glob)
+        body = PatternRule._translate(glob[len(head) :])
+        self._alternatives.setdefault(head, []).append(f"(?P<r{index}>{body})")
+
+    def compile(self) -> None:
+        """Compile the alternations once all rules are added."""
+        self._regexes = {
+            head: re.compile("|".join(alternatives))
+            for head, alternatives in self._alternatives.items()
+        }
+        self._lengths = sorted({len(head) for head in self._regexes})
+
+    def match(self, target: str, start: int = 0) -> Optional[int]:
+        """Return the earliest rule matching ``target[start:]`` in full."""
+        best = None
+        for length in self._lengths:
+            end = start + length
+            if end > len(target):
+                break
+            regex = self._regexes.get(target[start:end])
+            if regex is not None:
+                match = regex.fullmatch(target, end)
+                if match:
+                    index = int(match.lastgroup[1:])
+                    if best is None or index < best:
+                        best = index
+        return best
+
+
+class PatternMatcher:
+    """All pattern rules compiled into one matcher.
+
+    Trying each rule's regex in turn costs one Python-level match per rule
+    for every path checked. Instead, literal patterns become dictionary
+    lookups and wildcard patterns are indexed by their leading literal
+    text, so each path only reaches the few rules that can match it:
+
+    - basename rules (no /, and no ? or ** that could cross a /) are
+      matched against the basename; those starting with a wildcard
+      (``*.bak``) are indexed reversed, against the reversed basename
+    - rules that may start at any directory (``**/`` prefix, or no / but a
+      ? or **) are matched against each suffix of the path that starts a
+      path component
+    - everything else is matched against the full path
+
+    Rules keep their priority: when several match, the earliest rule wins,
+    exactly as when trying each rule in order.
+
+    Example:
+        >>> matcher = PatternMatcher(registry.patterns.values())
+        >>> matcher.match("archive/2024/data.csv")
+        PatternRule(pattern='archive/**/*', status=<FileStatus.ARCHIVED: 'archived'>, ...)
+    """
+
+    def __init__(self, rules: Iterable[PatternRule]):
+        """Compile rules.
+
+        Args:
+            rules: Pattern rules in priority order (first wins)
+        """
+        self.rules = list(rules)
+        self._paths: Dict[str, int] = {}
+        self._names: Dict[str, int] = {}
+        self._name_index = _PrefixIndex()
+        self._reversed_name_index = _PrefixIndex()
+        self._suffix_index = _PrefixIndex()
+        self._path_index = _PrefixIndex()
+
+        for index, rule in enumerate(self.rules):
+            pattern = rule.pattern
+            if "*" not in pattern and "?" not in pattern:
+                literals = self._paths if "/" in pattern else self._names
+                literals.setdefault(pattern, index)
+            elif "/" not in pattern and "?" not in pattern and "**" not in pattern:
+                # Only [^/]* wildcards: the pattern can only match a basename
+                if pattern[0] == "*" and pattern[-1] != "*":
+                    self._reversed_name_index.add(index, pattern[::-1])
+                else:
+                    self._name_index.add(index, pattern)
+            elif "/" not in pattern:
+                # ? or ** may cross a /, so try every starting component
+                self._suffix_index.add(index, pattern)
+            elif pattern.startswith("**/"):
+                self._suffix_index.add(index, pattern[3:])
+            else:
+                self._path_index.add(index, pattern)
+
+        for prefix_index in (
+            self._name_index,
+            self._reversed_name_index,
+            self._suffix_index,
+            self._path_index,
+        ):
+            prefix_index.compile()
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def match_index(self, path: str) -> Optional[int]:
+        """Return the index of the highest-priority rule matching ``path``."""
+        name = path.rpartition("/")[2]
+        candidates = [
+            self._paths.get(path),
+            self._names.get(name),
+            self._name_index.match(name),
+            self._reversed_name_index.match(name[::-1]),
+            self._path_index.match(path),
+        ]
+        start = 0
+        while True:
+            candidates.append(self._suffix_index.match(path, start))
+            start = path.find("/", start) + 1
+            if not start:
+                break
+
+        found = [index for index in candidates if index is not None]
+        return min(found) if found else None
+
+    def match(self, path: str) -> Optional[PatternRule]:
+        """Return the highest-priority rule matching ``path``, if any."""
+        index = self.match_index(path)
+        return None if index is None else self.rules[index]
+
+
 class FileRegistry:
     """Registry for tracking file status and deprecation.
 
-    Storage: Uses one-file-per-annotation for git-friendly diffs and scalability.
+    Storage: Packs annotations into one indexed SQLite database
+    (SQLiteAnnotationStorage), exportable as one JSON file per annotation.
     Backward compatible: Auto-migrates from legacy single-file format.
 
     Performance optimizations:
@@ -175,11 +330,11 @@ class FileRegistry:
         Args:
             registry_path: Legacy path or base directory. Defaults to .idlergear/
             lazy_load: If True, delay loading until first access (default: True)
-            storage_backend: Storage backend to use (FileAnnotationStorage).
-                           If None, creates default backend.
+            storage_backend: Storage backend to use (SQLiteAnnotationStorage or
+                           FileAnnotationStorage). If None, creates default backend.
         """
         # Import here to avoid circular dependency
-        from idlergear.file_annotation_storage import FileAnnotationStorage
+        from idlergear.file_annotation_storage import SQLiteAnnotationStorage
 
         # Determine paths
         if registry_path is None:
@@ -196,7 +351,7 @@ class FileRegistry:
 
         # Create storage backend
         if storage_backend is None:
-            storage_backend = FileAnnotationStorage(base_path / "file_annotations")
+            storage_backend = SQLiteAnnotationStorage(base_path / "file_annotations")
 
         self.storage = storage_backend
         self.registry_path = legacy_path  # Keep for backward compatibility (tests expect this)
@@ -205,6 +360,7 @@ class FileRegistry:
         # In-memory cache for performance
         self.files: Dict[str, FileEntry] = {}
         self.patterns: Dict[str, PatternRule] = {}
+        self._matcher: Optional[PatternMatcher] = None
         self._status_cache: Dict[str, tuple[Optional[FileStatus], float]] = {}
         self._event_callbacks: Dict[str, list] = {
             "file_registered": [],
@@ -221,13 +377,23 @@ class FileRegistry:
     def _clear_cache(self) -> None:
         """Clear the status lookup cache."""
         self._status_cache.clear()
+        self._matcher = None
+
+    def _match_pattern(self, path: str) -> Optional[PatternRule]:
+        """Find the first pattern rule matching ``path``.
+
+        The combined matcher is compiled on first use and dropped with the
+        status cache whenever the rules change.
+        """
+        if self._matcher is None:
+            self._matcher = PatternMatcher(self.patterns.values())
+        return self._matcher.match(path)
 
     def _auto_migrate_if_needed(self) -> None:
         """Auto-migrate from legacy format if detected."""
         if self._legacy_path and self._legacy_path.exists():
             # Check if migration is needed (legacy file exists, new storage doesn't)
-            annotations = self.storage.list_annotations()
-            if len(annotations) == 0:
+            if not self.storage.list_paths():
                 # Migrate
                 from idlergear.file_annotation_storage import migrate_from_legacy
                 report = migrate_from_legacy(self._legacy_path, self.storage, backup=True)
@@ -249,6 +415,7 @@ class FileRegistry:
 
             # Load patterns
             self.patterns = self.storage.load_patterns()
+            self._matcher = None
             self._patterns_loaded = True
             self._loaded = True
 
@@ -440,11 +607,11 @@ class FileRegistry:
             return status
 
         # Check pattern rules
-        for rule in self.patterns.values():
-            if rule.matches(path):
-                status = rule.status
-                self._status_cache[path] = (status, time.time())
-                return status
+        rule = self._match_pattern(path)
+        if rule:
+            status = rule.status
+            self._status_cache[path] = (status, time.time())
+            return status
 
         # Cache negative result
         self._status_cache[path] = (None, time.time())
@@ -489,20 +656,12 @@ class FileRegistry:
                 results[path] = status
                 continue
 
-            # Check pattern rules
-            matched = False
-            for rule in self.patterns.values():
-                if rule.matches(path):
-                    status = rule.status
-                    self._status_cache[path] = (status, current_time)
-                    results[path] = status
-                    matched = True
-                    break
-
-            if not matched:
-                # Cache negative result
-                self._status_cache[path] = (None, current_time)
-                results[path] = None
+            # Check pattern rules (one combined match per path)
+            rule = self._match_pattern(path)
+            status = rule.status if rule else None
+            # Negative results are cached too
+            self._status_cache[path] = (status, current_time)
+            results[path] = status
 
         return results
 
@@ -560,11 +719,8 @@ class FileRegistry:
             return entry.reason
 
         # Check pattern rules
-        for rule in self.patterns.values():
-            if rule.matches(path):
-                return rule.reason
-
-        return None
+        rule = self._match_pattern(path)
+        return rule.reason if rule else None
 
     def list_files(
         self, status_filter: Optional[FileStatus] = None
@@ -700,43 +856,14 @@ class FileRegistry:
         """
         self._ensure_loaded()
 
-        # Load all annotations from storage
-        all_entries = self.storage.list_annotations()
+        results = self.storage.search(
+            query=query, tags=tags, components=components, status=status
+        )
 
         # Update cache
-        for entry in all_entries:
+        for entry in results:
             self.files[entry.path] = entry
 
-        results = []
-
-        for entry in all_entries:
-            # Filter by status
-            if status and entry.status != status:
-                continue
-
-            # Full-text search in description
-            if query:
-                if not entry.description:
-                    continue
-                if query.lower() not in entry.description.lower():
-                    continue
-
-            # Filter by tags (OR logic)
-            if tags:
-                if not entry.tags:
-                    continue
-                if not any(tag in entry.tags for tag in tags):
-                    continue
-
-            # Filter by components (OR logic)
-            if components:
-                if not entry.components:
-                    continue
-                if not any(comp in entry.components for comp in components):
-                    continue
-
-            results.append(entry)
-
         return results
 
     def get_annotation(self, path: str) -> Optional[FileEntry]:
@@ -776,23 +903,7 @@ class FileRegistry:
         """
         self._ensure_loaded()
 
-        # Load all annotations from storage
-        all_entries = self.storage.list_annotations()
-
-        # Update cache
-        for entry in all_entries:
-            self.files[entry.path] = entry
-
-        tag_map: Dict[str, Dict[str, Any]] = {}
-
-        for entry in all_entries:
-            for tag in entry.tags:
-                if tag not in tag_map:
-                    tag_map[tag] = {"count": 0, "files": []}
-                tag_map[tag]["count"] += 1
-                tag_map[tag]["files"].append(entry.path)
-
-        return tag_map
+        return self.storage.list_tags()
 
     def audit_project(
         self,
@@ -825,15 +936,17 @@ class FileRegistry:
             },
         }
 
-        # 1. Check access log
-        access_log_path = self.registry_path.parent / "access_log.jsonl"
-        if access_log_path.exists():
+        # 1. Check access log (hourly rollups + the partial first hour)
+        from idlergear.access_log import get_access_log
+
+        access_log = get_access_log(self.registry_path.parent)
+        if access_log.exists():
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=since_hours)
-            accessed_files = self._parse_access_log(access_log_path, cutoff_time)
+            accessed_files = access_log.summarize(cutoff_time)
 
             # Filter for deprecated files only
             for file_path, access_data in accessed_files.items():
-                entry = self.files.get(file_path)
+                entry = self.get_entry(file_path)
                 if entry and entry.status == FileStatus.DEPRECATED:
                     report["accessed"].append({
                         "file": file_path,
@@ -854,130 +967,33 @@ class FileRegistry:
 
         return report
 
-    def _parse_access_log(
-        self,
-        log_path: Path,
-        cutoff_time: datetime,
-    ) -> Dict[str, Dict[str, Any]]:
-        """Parse access log and aggregate by file.
-
-        Args:
-            log_path: Path to access_log.jsonl
-            cutoff_time: Only include entries after this time
-
-        Returns:
-            Dictionary mapping file paths to access statistics
-        """
-        from datetime import datetime
-
-        accessed = {}
-
-        try:
-            with open(log_path) as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-
-                    try:
-                        entry = json.loads(line)
-
-                        # Parse timestamp
-                        timestamp_str = entry.get("timestamp")
-                        if not timestamp_str:
-                            continue
-
-                        try:
-                            # Handle ISO format with timezone
-                            timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-                        except ValueError:
-                            continue
-
-                        # Skip if before cutoff
-                        if timestamp < cutoff_time:
-                            continue
-
-                        file_path = entry.get("file_path")
-                        if not file_path:
-                            continue
-
-                        # Initialize or update statistics
-                        if file_path not in accessed:
-                            accessed[file_path] = {
-                                "count": 0,
-                                "last_accessed": timestamp.isoformat(),
-                                "agents": set(),
-                                "tools": set(),
-                            }
-
-                        accessed[file_path]["count"] += 1
-
-                        # Update last accessed time if more recent
-                        if timestamp.isoformat() > accessed[file_path]["last_accessed"]:
-                            accessed[file_path]["last_accessed"] = timestamp.isoformat()
-
-                        # Track agents and tools
-                        agent_id = entry.get("agent_id", "unknown")
-                        accessed[file_path]["agents"].add(agent_id)
-
-                        tool = entry.get("tool", "unknown")
-                        accessed[file_path]["tools"].add(tool)
-
-                    except json.JSONDecodeError:
-                        continue  # Skip malformed lines
-
-        except FileNotFoundError:
-            pass  # Log doesn't exist yet
-
-        # Convert sets to lists for JSON serialization
-        for file_data in accessed.values():
-            file_data["agents"] = list(file_data["agents"])
-            file_data["tools"] = list(file_data["tools"])
-
-        return accessed
-
     def _scan_code_for_deprecated_files(self) -> List[Dict[str, Any]]:
-        """Scan Python files for references to deprecated files.
+        """Scan project files for quoted references to deprecated files.
+
+        All text files are scanned (not only Python), one Aho-Corasick pass
+        per file, in parallel, with results cached by file content hash.
 
         Returns:
             List of code references found
         """
-        references = []
+        from idlergear.reference_scan import scan_references
 
-        # Get list of deprecated files
-        deprecated_files = [
-            entry.path for entry in self.files.values()
-            if entry.status == FileStatus.DEPRECATED
-        ]
+        # Get deprecated files (indexed query on the annotation store)
+        deprecated = {
+            entry.path: entry for entry in self.storage.search(status=FileStatus.DEPRECATED)
+        }
 
-        if not deprecated_files:
-            return references
+        if not deprecated:
+            return []
 
-        # Scan Python files
         project_root = self.registry_path.parent.parent
-        for py_file in project_root.glob("**/*.py"):
-            # Skip virtual environments, test files, .git
-            if any(part in py_file.parts for part in ["venv", ".venv", "env", ".git", ".tox", "__pycache__"]):
-                continue
-
-            try:
-                content = py_file.read_text()
-                lines = content.split("\n")
-
-                for line_num, line in enumerate(lines, 1):
-                    # Check if line contains any deprecated file path
-                    for dep_file in deprecated_files:
-                        # Look for path in string literals (quoted)
-                        if dep_file in line and (f'"{dep_file}"' in line or f"'{dep_file}'" in line):
-                            entry = self.files[dep_file]
-                            references.append({
-                                "file": str(py_file.relative_to(project_root)),
-                                "line": line_num,
-                                "code": line.strip(),
-                                "deprecated_file": dep_file,
-                                "current_version": entry.current_version,
-                            })
-
-            except (UnicodeDecodeError, PermissionError):
-                continue  # Skip files we can't read
-
-        return references
+        return [
+            {
+                "file": ref["file"],
+                "line": ref["line"],
+                "code": ref["code"],
+                "deprecated_file": ref["target"],
+                "current_version": deprecated[ref["target"]].current_version,
+            }
+            for ref in scan_references(project_root, list(deprecated))
+        ]
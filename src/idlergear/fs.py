@@ -13,19 +13,15 @@ Features:
 """
 
 import hashlib
+import mmap
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Union
 import fnmatch
 
-# Try to import gitignore parser, fall back to basic pattern matching
-try:
-    from gitignore_parser import parse_gitignore
-
-    HAS_GITIGNORE_PARSER = True
-except ImportError:
-    HAS_GITIGNORE_PARSER = False
+from idlergear.walker import DEFAULT_EXCLUDE_PATTERNS, DirectoryWalker
 
 
 class FilesystemError(Exception):
@@ -44,22 +40,12 @@ class FilesystemServer:
     """IdlerGear filesystem operations server."""
 
     DEFAULT_ALLOWED_DIRS = [os.getcwd()]
-    DEFAULT_EXCLUDE_PATTERNS = [
-        ".git",
-        "__pycache__",
-        "*.pyc",
-        "node_modules",
-        ".venv",
-        "venv",
-        "*.egg-info",
-        "dist",
-        "build",
-        ".tox",
-        ".pytest_cache",
-        ".mypy_cache",
-        ".coverage",
-        "htmlcov",
-    ]
+    DEFAULT_EXCLUDE_PATTERNS = DEFAULT_EXCLUDE_PATTERNS
+    # Threads used to walk top-level subtrees in search_files
+    WALK_WORKERS = min(8, os.cpu_count() or 1)
+    # Threads and total content budget for read_multiple_files
+    READ_WORKERS = 8
+    MAX_TOTAL_READ_BYTES = 10 * 1024 * 1024
 
     def __init__(self, allowed_dirs: Optional[List[str]] = None):
         """
@@ -100,15 +86,35 @@ class FilesystemServer:
             f"{[str(d) for d in self.allowed_dirs]}"
         )
 
-    def read_file(self, path: str) -> Dict[str, Any]:
+    def read_file(
+        self,
+        path: str,
+        start_line: Optional[int] = None,
+        end_line: Optional[int] = None,
+        offset: Optional[int] = None,
+        length: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
-        Read file contents.
+        Read file contents, optionally a line or byte range.
+
+        Ranged and size-limited reads memory-map the file, so only the
+        requested slice is decoded no matter how large the file is.
 
         Args:
             path: Path to file
+            start_line: First line to return (1-based, inclusive)
+            end_line: Last line to return (1-based, inclusive)
+            offset: Byte offset to start reading at
+            length: Number of bytes to read from offset
+            max_bytes: Truncate the returned content to this many bytes
 
         Returns:
-            {"content": str, "path": str, "size": int}
+            {"content": str, "path": str, "size": int, "truncated": bool}
+            plus range metadata ("offset"/"length"/"next_offset" for byte
+            reads, "start_line"/"end_line"/"next_line" for line reads, plus
+            "next_offset" when a single line exceeds max_bytes)
+            so callers can page through large files.
         """
         file_path = self._check_access(path)
 
@@ -118,31 +124,203 @@ class FilesystemServer:
         if not file_path.is_file():
             raise FilesystemError(f"Not a file: {path}")
 
+        if start_line is not None and start_line < 1:
+            raise FilesystemError(f"start_line must be >= 1, got {start_line}")
+        if (offset is not None and offset < 0) or (length is not None and length < 0):
+            raise FilesystemError("offset and length must be non-negative")
+
+        size = file_path.stat().st_size
+        line_range = start_line is not None or end_line is not None
+        byte_range = offset is not None or length is not None
+
+        if line_range:
+            return self._read_lines(file_path, size, start_line or 1, end_line, max_bytes)
+
+        if byte_range or (max_bytes is not None and size > max_bytes):
+            start = offset or 0
+            limit = length if length is not None else size - start
+            if max_bytes is not None:
+                limit = min(limit, max_bytes)
+            return self._read_bytes(file_path, size, start, limit)
+
         content = file_path.read_text()
 
         return {
             "content": content,
             "path": str(file_path),
-            "size": file_path.stat().st_size,
+            "size": size,
+            "truncated": False,
+        }
+
+    @staticmethod
+    def _char_boundary(
+        data: Union[bytes, mmap.mmap], pos: int, size: int, start: int = 0
+    ) -> int:
+        """Move pos to a UTF-8 character boundary, never below start.
+
+        Backs up so a multi-byte sequence is not split. If that would leave
+        nothing after start, moves forward past the character instead, so a
+        limit smaller than one character still makes progress.
+        """
+        boundary = pos
+        floor = max(start, pos - 3)
+        while boundary < size and boundary > floor and (data[boundary] & 0xC0) == 0x80:
+            boundary -= 1
+        if boundary == start < pos:
+            boundary = pos
+            while boundary < size and (data[boundary] & 0xC0) == 0x80:
+                boundary += 1
+        return boundary
+
+    def _read_bytes(
+        self, file_path: Path, size: int, start: int, limit: int
+    ) -> Dict[str, Any]:
+        """Read up to limit bytes from start using mmap."""
+        start = min(start, size)
+        end = min(size, start + max(limit, 0))
+        content = ""
+        if end > start:
+            with open(file_path, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                end = self._char_boundary(mm, end, size, start)
+                content = mm[start:end].decode("utf-8", errors="replace")
+
+        result = {
+            "content": content,
+            "path": str(file_path),
+            "size": size,
+            "offset": start,
+            "length": end - start,
+            "truncated": end < size,
         }
+        if end < size:
+            result["next_offset"] = end
+        return result
 
-    def read_multiple_files(self, paths: List[str]) -> List[Dict[str, Any]]:
+    def _read_lines(
+        self,
+        file_path: Path,
+        size: int,
+        start_line: int,
+        end_line: Optional[int],
+        max_bytes: Optional[int],
+    ) -> Dict[str, Any]:
+        """Read a 1-based inclusive line range using mmap."""
+        result: Dict[str, Any] = {
+            "content": "",
+            "path": str(file_path),
+            "size": size,
+            "start_line": start_line,
+            "end_line": start_line - 1,
+            "truncated": False,
+        }
+        if size == 0:
+            return result
+
+        with open(file_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            # Skip to the start of start_line
+            start = 0
+            line = 1
+            while line < start_line:
+                nl = mm.find(b"\n", start)
+                if nl == -1:
+                    return result  # Range starts past the last line
+                start = nl + 1
+                line += 1
+            if start >= size:
+                return result
+
+            # Find the end of end_line (or EOF)
+            end = start
+            last_line = line - 1
+            while end < size and (end_line is None or last_line < end_line):
+                nl = mm.find(b"\n", end)
+                end = size if nl == -1 else nl + 1
+                last_line += 1
+                if max_bytes is not None and end - start >= max_bytes:
+                    break
+
+            partial = False
+            if max_bytes is not None and end - start > max_bytes:
+                # Cut mid-line; the partial line is not counted as complete
+                end = self._char_boundary(mm, start + max_bytes, size, start)
+                last_line -= 1
+                partial = True
+
+            result["content"] = mm[start:end].decode("utf-8", errors="replace")
+            result["end_line"] = last_line
+            if partial or end < size:
+                result["truncated"] = True
+                result["next_line"] = last_line + 1
+            if partial and last_line < start_line:
+                # The first line alone exceeds max_bytes: page through the
+                # rest of it by byte offset and continue after it by line
+                result["next_offset"] = end
+                result["next_line"] = start_line + 1
+        return result
+
+    def read_multiple_files(
+        self,
+        paths: List[str],
+        max_total_bytes: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Read multiple files at once.
 
+        Files are read concurrently in a thread pool. A total byte budget is
+        shared across the batch in request order: files that would exceed it
+        are truncated (see read_file metadata), and once it is exhausted the
+        remaining files are returned without content.
+
         Args:
             paths: List of file paths
+            max_total_bytes: Total content budget for the batch
+                (defaults to MAX_TOTAL_READ_BYTES)
+            max_workers: Thread pool size (defaults to READ_WORKERS)
 
         Returns:
-            List of file contents (same format as read_file)
+            List of file contents (same format as read_file), in input order
         """
-        results = []
+        budget = self.MAX_TOTAL_READ_BYTES if max_total_bytes is None else max_total_bytes
+
+        # Plan the budget up front from cheap stat() calls
+        limits: List[Optional[int]] = []
+        remaining = budget
         for path in paths:
             try:
-                results.append(self.read_file(path))
+                # Check access first so nothing is revealed about other paths
+                size = self._check_access(path).stat().st_size
+            except (OSError, FilesystemError):
+                limits.append(None)  # read_file reports the error
+                continue
+            limits.append(None if size <= remaining else remaining)
+            remaining = max(0, remaining - size)
+
+        def read_one(item: tuple) -> Dict[str, Any]:
+            path, limit = item
+            try:
+                if limit == 0:
+                    file_path = self._check_access(path)
+                    return {
+                        "path": str(file_path),
+                        "content": "",
+                        "size": file_path.stat().st_size,
+                        "truncated": True,
+                        "skipped": "total byte budget exhausted",
+                    }
+                return self.read_file(path, max_bytes=limit)
             except Exception as e:
-                results.append({"path": path, "error": str(e)})
-        return results
+                return {"path": path, "error": str(e)}
+
+        workers = max_workers or self.READ_WORKERS
+        if len(paths) <= 1 or workers <= 1:
+            return [read_one(item) for item in zip(paths, limits)]
+        with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            return list(pool.map(read_one, zip(paths, limits)))
 
     def write_file(self, path: str, content: str) -> Dict[str, Any]:
         """
@@ -244,14 +422,18 @@ class FilesystemServer:
         path: str = ".",
         max_depth: int = 3,
         exclude_patterns: Optional[List[str]] = None,
+        use_gitignore: bool = True,
     ) -> Dict[str, Any]:
         """
         Generate directory tree structure.
 
+        Excluded and gitignored directories are pruned without being listed.
+
         Args:
             path: Root directory
             max_depth: Maximum recursion depth
             exclude_patterns: Patterns to exclude
+            use_gitignore: Whether to respect .gitignore files
 
         Returns:
             Tree structure with nested entries
@@ -265,36 +447,46 @@ class FilesystemServer:
             raise FilesystemError(f"Not a directory: {path}")
 
         exclude = exclude_patterns or self.DEFAULT_EXCLUDE_PATTERNS
+        walker = DirectoryWalker(
+            dir_path, exclude_patterns=exclude, use_gitignore=use_gitignore
+        )
 
-        def build_tree(current_path: Path, depth: int) -> Dict[str, Any]:
-            if depth > max_depth:
-                return None
-
-            stat = current_path.stat()
-            node = {
-                "name": current_path.name,
-                "type": "directory" if current_path.is_dir() else "file",
-                "size": stat.st_size,
-                "modified": stat.st_mtime,
-            }
-
-            if current_path.is_dir():
-                children = []
-                for item in sorted(current_path.iterdir()):
-                    # Check exclude patterns
-                    if any(fnmatch.fnmatch(item.name, p) for p in exclude):
-                        continue
-
-                    child = build_tree(item, depth + 1)
-                    if child:
-                        children.append(child)
-
-                if children:
-                    node["children"] = children
-
-            return node
-
-        return build_tree(dir_path, 0)
+        def build_children(path: str, rel: str, specs: tuple, depth: int) -> list:
+            # Children sit at depth + 1; stop listing once that exceeds max_depth
+            if depth >= max_depth:
+                return []
+            children = []
+            for entry in walker.scandir(path, rel, specs):
+                stat = entry.stat()
+                node = {
+                    "name": entry.name,
+                    "type": "directory" if entry.is_dir else "file",
+                    "size": stat.st_size,
+                    "modified": stat.st_mtime,
+                }
+                if entry.is_dir:
+                    grandchildren = build_children(
+                        entry.path,
+                        entry.rel_path,
+                        walker.child_specs(entry, specs),
+                        depth + 1,
+                    )
+                    if grandchildren:
+                        node["children"] = grandchildren
+                children.append(node)
+            return children
+
+        stat = dir_path.stat()
+        tree = {
+            "name": dir_path.name,
+            "type": "directory",
+            "size": stat.st_size,
+            "modified": stat.st_mtime,
+        }
+        children = build_children(str(dir_path), "", walker.root_specs(), 0)
+        if children:
+            tree["children"] = children
+        return tree
 
     def move_file(self, source: str, destination: str) -> Dict[str, Any]:
         """
@@ -330,6 +522,9 @@ class FilesystemServer:
         """
         Search for files matching pattern.
 
+        Excluded directories (e.g. node_modules, .git) and gitignored paths
+        are pruned before they are descended into.
+
         Args:
             path: Root directory to search
             pattern: Glob pattern (e.g., "*.py", "test_*.py")
@@ -348,31 +543,21 @@ class FilesystemServer:
             raise FilesystemError(f"Directory not found: {path}")
 
         exclude = exclude_patterns or self.DEFAULT_EXCLUDE_PATTERNS
-
-        # Load gitignore if available
-        gitignore_matcher = None
-        if use_gitignore and HAS_GITIGNORE_PARSER:
-            gitignore_path = dir_path / ".gitignore"
-            if gitignore_path.exists():
-                gitignore_matcher = parse_gitignore(gitignore_path)
+        walker = DirectoryWalker(
+            dir_path, exclude_patterns=exclude, use_gitignore=use_gitignore
+        )
 
         matches = []
-        for item in dir_path.rglob(pattern):
-            # Check access (must be within allowed dirs)
-            try:
-                self._check_access(item)
-            except SecurityError:
-                continue
-
-            # Check exclude patterns
-            if any(fnmatch.fnmatch(item.name, p) for p in exclude):
-                continue
-
-            # Check gitignore
-            if gitignore_matcher and gitignore_matcher(str(item)):
-                continue
-
-            matches.append(str(item))
+        for entry in walker.walk(
+            pattern=pattern, include_dirs=True, workers=self.WALK_WORKERS
+        ):
+            # Entries are lexically inside dir_path; only symlinks can escape
+            if entry.entry.is_symlink():
+                try:
+                    self._check_access(entry.path)
+                except SecurityError:
+                    continue
+            matches.append(entry.path)
 
         return {
             "matches": sorted(matches),
@@ -72,6 +72,54 @@ def is_test_file(filepath: str) -> bool:
     return False
 
 
+def read_head(repo_path: Path) -> str:
+    """
+    Read the current commit of a repository without spawning git.
+
+    Args:
+        repo_path: Repository root
+
+    Returns:
+        Commit hash (or the ref name if it can't be resolved), "" if not a repo
+    """
+    git_dir = Path(repo_path) / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return ""
+    if not head.startswith("ref: "):
+        return head
+    ref = head[5:]
+    try:
+        return (git_dir / ref).read_text().strip()
+    except OSError:
+        pass
+    try:
+        for line in (git_dir / "packed-refs").read_text().splitlines():
+            if line.endswith(" " + ref):
+                return line.split(" ", 1)[0]
+    except OSError:
+        pass
+    return ref
+
+
+def index_stamp(repo_path: Path) -> str:
+    """
+    Cheap fingerprint of the git index (changes on add/reset/commit).
+
+    Args:
+        repo_path: Repository root
+
+    Returns:
+        "size:mtime_ns" of .git/index, "" if there is none
+    """
+    try:
+        st = os.stat(Path(repo_path) / ".git" / "index")
+    except OSError:
+        return ""
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
 class GitServer:
     """Git operations server for MCP."""
 
@@ -9,7 +9,7 @@ Example:
     >>> print(context)  # Token-efficient task context
 """
 
-from .database import get_database, GraphDatabase
+from .database import get_database, query_database, GraphDatabase, GraphLockedError
 from .schema import initialize_schema, validate_schema
 from .queries import (
     query_task_context,
@@ -34,7 +34,9 @@ from .lazy_init import ensure_graph_populated, reset_initialization_flag
 
 __all__ = [
     "get_database",
+    "query_database",
     "GraphDatabase",
+    "GraphLockedError",
     "initialize_schema",
     "validate_schema",
     "query_task_context",
@@ -0,0 +1,212 @@
+"""Bulk loading for full graph rebuilds.
+
+Row-by-row population runs a MATCH and a CREATE for every node and edge.
+For a full rebuild the high-volume populators (git history and code
+symbols) instead stage their nodes and edges as CSV files, which Kuzu loads
+with ``COPY FROM`` into a freshly created database. The finished database
+then replaces the live one in a single rename (see ``replace_database``),
+so readers see either the old graph or the complete new one.
+"""
+
+import csv
+import threading
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .database import GraphDatabase
+
+
+def _csv_value(value: Any) -> Any:
+    """Format a property value the way Kuzu's CSV reader expects it."""
+    if value is None:
+        return ""  # Empty fields load as NULL
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+class BulkStager:
+    """Stages node and edge rows in CSV files for ``COPY FROM``.
+
+    Table layouts are read from the target database's schema, so rows may
+    supply any subset of a table's properties. Nodes are deduplicated on
+    their primary key, the first row staged winning (matching the
+    check-then-create behavior of the populators), and edges whose
+    endpoints were never staged are dropped, just as a MATCH on a missing
+    node creates nothing. Kuzu loads empty strings as NULL.
+
+    Thread-safe: populators running in parallel stages may share a stager.
+
+    Example:
+        >>> stager = BulkStager(db, staging_dir)
+        >>> stager.add_node("File", {"path": "src/app.py", "language": "python"})
+        >>> stager.add_node("Symbol", {"id": "src/app.py:1:main", "name": "main"})
+        >>> stager.add_edge("CONTAINS", "src/app.py", "src/app.py:1:main")
+        >>> stager.load(db)
+    """
+
+    def __init__(self, db: GraphDatabase, staging_dir: Path):
+        """Initialize stager.
+
+        Args:
+            db: Database the rows will be loaded into (schema initialized)
+            staging_dir: Directory for the CSV files
+        """
+        self.staging_dir = Path(staging_dir)
+        self.staging_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # Node table -> (primary key, columns); rel table -> (from, to, columns)
+        self._node_tables: Dict[str, Tuple[str, List[str]]] = {}
+        self._rel_tables: Dict[str, Tuple[str, str, List[str]]] = {}
+        self._keys: Dict[str, set] = {}
+        self._files: Dict[str, Any] = {}
+        self._writers: Dict[str, Any] = {}
+        self._counts: Dict[str, int] = {}
+        self._describe(db.get_connection())
+
+    def _describe(self, conn) -> None:
+        tables = conn.execute("CALL show_tables() RETURN name, type").get_all()
+        for name, kind in tables:
+            info = conn.execute(f"CALL table_info('{name}') RETURN *")
+            fields = info.get_column_names()
+            columns = []
+            primary_key = None
+            while info.has_next():
+                row = dict(zip(fields, info.get_next()))
+                columns.append(row["name"])
+                if row.get("primary key"):
+                    primary_key = row["name"]
+            if kind == "NODE":
+                self._node_tables[name] = (primary_key, columns)
+            elif kind == "REL":
+                ends = conn.execute(f"CALL show_connection('{name}') RETURN *").get_all()
+                # COPY needs explicit from/to options for multi-pair tables
+                if len(ends) == 1:
+                    self._rel_tables[name] = (ends[0][0], ends[0][1], columns)
+
+    def _writer(self, table: str, header: List[str]):
+        writer = self._writers.get(table)
+        if writer is None:
+            handle = open(self.staging_dir / f"{table}.csv", "w", newline="")
+            writer = csv.writer(handle)
+            writer.writerow(header)
+            self._files[table] = handle
+            self._writers[table] = writer
+            self._counts[table] = 0
+        return writer
+
+    def has_node(self, table: str, key: Any) -> bool:
+        """Check whether a node with primary key ``key`` has been staged."""
+        with self._lock:
+            return key in self._keys.get(table, ())
+
+    def add_node(self, table: str, row: Dict[str, Any]) -> bool:
+        """Stage a node.
+
+        Args:
+            table: Node table name
+            row: Property values; must include the primary key
+
+        Returns:
+            True if staged, False if a node with the same key already was
+
+        Raises:
+            ValueError: If the table or a property is not in the schema
+        """
+        if table not in self._node_tables:
+            raise ValueError(f"Unknown node table: {table}")
+        primary_key, columns = self._node_tables[table]
+        unknown = set(row) - set(columns)
+        if unknown:
+            raise ValueError(f"Unknown {table} properties: {', '.join(sorted(unknown))}")
+
+        key = row[primary_key]
+        with self._lock:
+            keys = self._keys.setdefault(table, set())
+            if key in keys:
+                return False
+            keys.add(key)
+            self._writer(table, columns).writerow([_csv_value(row.get(c)) for c in columns])
+            self._counts[table] += 1
+        return True
+
+    def add_edge(
+        self,
+        table: str,
+        source: Any,
+        target: Any,
+        properties: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Stage an edge between two staged nodes.
+
+        Args:
+            table: Relationship table name
+            source: Primary key of the source node
+            target: Primary key of the target node
+            properties: Optional edge property values
+
+        Returns:
+            True if staged, False if either endpoint was never staged
+
+        Raises:
+            ValueError: If the table or a property is not in the schema
+        """
+        if table not in self._rel_tables:
+            raise ValueError(f"Unknown relationship table: {table}")
+        from_table, to_table, columns = self._rel_tables[table]
+        properties = properties or {}
+        unknown = set(properties) - set(columns)
+        if unknown:
+            raise ValueError(f"Unknown {table} properties: {', '.join(sorted(unknown))}")
+
+        with self._lock:
+            if source not in self._keys.get(from_table, ()) or target not in self._keys.get(
+                to_table, ()
+            ):
+                return False
+            writer = self._writer(table, ["from", "to"] + columns)
+            writer.writerow(
+                [source, target] + [_csv_value(properties.get(c)) for c in columns]
+            )
+            self._counts[table] += 1
+        return True
+
+    def load(self, db: GraphDatabase) -> Dict[str, int]:
+        """COPY every staged file into ``db``, nodes before edges.
+
+        Args:
+            db: Target database (normally the one passed to ``__init__``)
+
+        Returns:
+            Dictionary mapping table name to rows loaded, plus "rows" (total)
+        """
+        self.close()
+        counts = dict(self._counts)
+
+        conn = db.get_connection()
+        ordered = [t for t in counts if t in self._node_tables] + [
+            t for t in counts if t in self._rel_tables
+        ]
+        for table in ordered:
+            path = str(self.staging_dir / f"{table}.csv").replace("'", "\\'")
+            if table in self._node_tables:
+                columns = self._node_tables[table][1]
+            else:
+                columns = self._rel_tables[table][2]
+            target = f"{table}({', '.join(columns)})" if columns else table
+            # Messages and docstrings may contain quoted newlines
+            conn.execute(f"COPY {target} FROM '{path}' (HEADER=true, PARALLEL=false)")
+
+        counts["rows"] = sum(counts.values())
+        return counts
+
+    def close(self) -> None:
+        """Close any open staging files without loading them."""
+        with self._lock:
+            for handle in self._files.values():
+                handle.close()
+            self._files.clear()
+            self._writers.clear()
@@ -1,13 +1,128 @@
-"""Kuzu graph database connection management."""
-
+"""Kuzu graph database connection management.
+
+Kuzu allows one read-write ``Database`` per directory, or any number of
+read-only ones, across processes. Within a process a ``Database`` can serve
+many ``Connection`` objects at once. This module builds on that:
+
+- ``GraphDatabase`` keeps one writer connection (``get_connection()``,
+  guarded by ``write_lock``) plus a small pool of read connections
+  (``read_connection()``).
+- ``get_database()`` returns the process-wide instance used by populators.
+- ``query_database()`` is for query-only callers: it reuses the process
+  instance when there is one, otherwise opens the database read-only just
+  for the duration of the query, and when another process holds the write
+  lock it sends the query to the daemon, which may be that writer.
+
+Queries run as prepared statements with bound parameters, and read results
+are cached in an LRU keyed on (database, query, parameters, generation).
+Populators bump the generation (``bumps_generation``) after writing, which
+invalidates the cache in every process sharing the database. Query text
+from clients (the daemon's ``graph.query``) is limited to single read
+statements, run in a read-only transaction, so nothing else can write.
+"""
+
+import functools
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import warnings
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple
 
 try:
     import kuzu
 except ImportError:
     kuzu = None  # Handle gracefully if not installed
 
+# Read connections kept open per database
+DEFAULT_POOL_SIZE = 4
+# Prepared statements kept per connection
+PREPARED_CACHE_SIZE = 128
+# Read query results kept per process
+RESULT_CACHE_SIZE = 256
+
+# Clauses a read-only statement can start with; CALL only as a table function,
+# since ``CALL name=value`` changes connection settings
+_READ_CLAUSE = re.compile(
+    r"(?:MATCH|OPTIONAL\s+MATCH|UNWIND|WITH|RETURN)\b|CALL\s+\w+\s*\(", re.IGNORECASE
+)
+# String literals, quoted identifiers and comments, which may contain ';'
+_NON_CODE = re.compile(
+    r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|`[^`]*`|//[^\n]*|/\*.*?\*/", re.DOTALL
+)
+
+
+def check_read_query(query: str) -> None:
+    """Reject anything but a single statement that reads the graph.
+
+    Queries from clients run against the daemon's read-write database, so
+    writes, transaction control, ``COPY``/``EXPORT`` and further statements
+    after a ``;`` are refused up front. Combine with ``fetch_rows(...,
+    read_only=True)``, which also runs the statement in a read-only
+    transaction.
+
+    Raises:
+        ValueError: If the query is not a single read statement
+    """
+    code = _NON_CODE.sub(" ", query).strip().rstrip(";")
+    if ";" in code:
+        raise ValueError("Only a single statement is allowed")
+    if not _READ_CLAUSE.match(code.lstrip()):
+        raise ValueError("Only read queries (MATCH, UNWIND, WITH, RETURN, CALL) are allowed")
+
+
+class LRUCache:
+    """Small thread-safe LRU mapping."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return self._data[key]
+            self.misses += 1
+            return default
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_result_cache = LRUCache(RESULT_CACHE_SIZE)
+
+
+def clear_result_cache() -> None:
+    """Drop all cached query results (for testing)."""
+    _result_cache.clear()
+
+
+class GraphLockedError(RuntimeError):
+    """The database directory is locked by another process."""
+
 
 class GraphDatabase:
     """Manages connection to Kuzu graph database.
@@ -25,12 +140,24 @@ class GraphDatabase:
         >>> result = conn.execute("MATCH (t:Task) RETURN t LIMIT 5")
     """
 
-    def __init__(self, db_path: Optional[Path] = None, project_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        project_path: Optional[Path] = None,
+        read_only: bool = False,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ):
         """Initialize graph database connection.
 
         Args:
             db_path: Path to database directory. If not provided, auto-detects project root.
             project_path: Project root path. If not provided, auto-detects from current directory.
+            read_only: Open without taking the write lock, so other read-only
+                processes can open the database at the same time
+            pool_size: Maximum number of pooled read connections
+
+        Raises:
+            GraphLockedError: If another process holds a conflicting lock
         """
         if kuzu is None:
             raise ImportError(
@@ -55,21 +182,229 @@ class GraphDatabase:
 
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Create database
-        self.db = kuzu.Database(str(self.db_path))
+        self.read_only = read_only
+
+        # Single writer; pooled readers
+        self.write_lock = threading.RLock()
+        self._pool_size = max(1, pool_size)
+        self._pool_lock = threading.Lock()
+        # Checked-out read connections, which close() and replace_database()
+        # wait for; new readers wait while ``_draining`` is set
+        self._readers = 0
+        self._readers_changed = threading.Condition()
+        self._draining = False
+        self._closed = False
+
+        self._generation_path = self.db_path.with_name(self.db_path.name + ".generation")
+        self._generation_lock = threading.Lock()
+        self._open()
+
+    def _open(self) -> None:
+        """Open the Kuzu database and writer connection with an empty pool."""
+        try:
+            self.db = kuzu.Database(str(self.db_path), read_only=self.read_only)
+        except RuntimeError as e:
+            if "lock" in str(e).lower():
+                raise GraphLockedError(
+                    f"Graph database is in use by another process: {self.db_path}"
+                ) from e
+            raise
         self.conn = kuzu.Connection(self.db)
+        self._pool: "queue.LifoQueue[kuzu.Connection]" = queue.LifoQueue()
+        self._pool_created = 0
+        # Prepared statements belong to the connection that prepared them
+        self._prepared: dict = {}
 
     def get_connection(self) -> "kuzu.Connection":
         """Get database connection.
 
+        This is the writer connection. Code that writes from several threads
+        should hold ``write_lock`` around its statements (see ``writer()``).
+
         Returns:
             Active Kuzu connection
         """
         return self.conn
 
+    @contextmanager
+    def writer(self) -> Iterator["kuzu.Connection"]:
+        """Hold the write lock and yield the writer connection.
+
+        Raises:
+            PermissionError: If the database was opened read-only
+        """
+        if self.read_only:
+            raise PermissionError("Graph database is open read-only")
+        with self.write_lock:
+            yield self.conn
+
+    @contextmanager
+    def read_connection(self) -> Iterator["kuzu.Connection"]:
+        """Borrow a pooled connection for read queries.
+
+        Connections are created on demand up to ``pool_size``; further
+        callers wait until one is returned. Reads on pooled connections run
+        concurrently with each other and with the writer.
+
+        Example:
+            >>> with db.read_connection() as conn:
+            ...     result = conn.execute("MATCH (f:File) RETURN count(f)")
+        """
+        with self._readers_changed:
+            while self._draining:
+                self._readers_changed.wait()
+            if self._closed:
+                raise RuntimeError("Graph database is closed")
+            self._readers += 1
+        try:
+            conn = self._acquire()
+            try:
+                yield conn
+            finally:
+                self._pool.put(conn)
+        finally:
+            with self._readers_changed:
+                self._readers -= 1
+                self._readers_changed.notify_all()
+
+    @contextmanager
+    def _drained(self) -> Iterator[None]:
+        """Hold off new readers and wait for checked-out connections to return."""
+        with self._readers_changed:
+            while self._draining:
+                self._readers_changed.wait()
+            self._draining = True
+            while self._readers:
+                self._readers_changed.wait()
+        try:
+            yield
+        finally:
+            with self._readers_changed:
+                self._draining = False
+                self._readers_changed.notify_all()
+
+    def _acquire(self) -> "kuzu.Connection":
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            if self._pool_created < self._pool_size:
+                self._pool_created += 1
+                return kuzu.Connection(self.db)
+        return self._pool.get()
+
+    def _statement(self, conn: "kuzu.Connection", query: str):
+        """Return the prepared statement for ``query`` on ``conn``."""
+        cache = self._prepared.get(id(conn))
+        if cache is None:
+            cache = self._prepared.setdefault(id(conn), LRUCache(PREPARED_CACHE_SIZE))
+        statement = cache.get(query)
+        if statement is None:
+            # Kuzu flags prepare() as deprecated in favour of execute(query,
+            # params), but that re-plans every call (about twice as slow here)
+            with warnings.catch_warnings():
+                warnings.filterwarnings(
+                    "ignore", message="The use of separate prepare", category=DeprecationWarning
+                )
+                statement = conn.prepare(query)
+            if not statement.is_success():
+                # Let execute() raise Kuzu's own error for the query
+                return None
+            cache.put(query, statement)
+        return statement
+
+    def run(
+        self, conn: "kuzu.Connection", query: str, parameters: Optional[dict] = None
+    ) -> "kuzu.QueryResult":
+        """Execute ``query`` on ``conn`` as a prepared statement.
+
+        The query is parsed and planned once per connection; later calls
+        only bind ``parameters``. Use ``$name`` placeholders for every value
+        rather than formatting values into the query text.
+        """
+        statement = self._statement(conn, query)
+        if statement is None:
+            return conn.execute(query, parameters or {})
+        return conn.execute(statement, parameters or {})
+
+    def fetch_rows(
+        self, query: str, parameters: Optional[dict] = None, read_only: bool = False
+    ) -> Tuple[List[str], List[list]]:
+        """Run a read query on a pooled connection and materialize the rows.
+
+        Args:
+            query: Cypher query string
+            parameters: Optional query parameters
+            read_only: Run inside a read-only transaction, so Kuzu refuses
+                any write in the query (for query text from clients)
+
+        Returns:
+            Tuple of (column names, rows)
+        """
+        with self.read_connection() as conn:
+            if read_only:
+                conn.execute("BEGIN TRANSACTION READ ONLY")
+            try:
+                result = self.run(conn, query, parameters)
+                columns = result.get_column_names()
+                rows = []
+                while result.has_next():
+                    rows.append(result.get_next())
+            finally:
+                if read_only:
+                    try:
+                        conn.execute("ROLLBACK")
+                    except RuntimeError:
+                        pass  # Kuzu already rolled back the failed statement
+        return columns, rows
+
+    def cached_rows(
+        self, query: str, parameters: Optional[dict] = None, read_only: bool = False
+    ) -> Tuple[List[str], List[list]]:
+        """Like ``fetch_rows``, served from the result cache when possible.
+
+        Entries are keyed on the current generation, so they stop matching
+        once a populator bumps it. Callers must not mutate the returned rows.
+        """
+        key = (
+            str(self.db_path),
+            query,
+            json.dumps(parameters or {}, sort_keys=True, default=str),
+            self.generation,
+        )
+        cached = _result_cache.get(key)
+        if cached is None:
+            cached = self.fetch_rows(query, parameters, read_only=read_only)
+            _result_cache.put(key, cached)
+        return cached
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever populators change the graph.
+
+        Stored next to the database so every process opening it agrees.
+        """
+        try:
+            return int(self._generation_path.read_text())
+        except (OSError, ValueError):
+            return 0
+
+    def bump_generation(self) -> int:
+        """Mark the graph as changed, invalidating cached query results.
+
+        Returns:
+            The new generation
+        """
+        with self._generation_lock:
+            generation = self.generation + 1
+            tmp = self._generation_path.with_name(self._generation_path.name + ".tmp")
+            tmp.write_text(str(generation))
+            os.replace(tmp, self._generation_path)
+            return generation
+
     def execute(self, query: str, parameters: Optional[dict] = None) -> "kuzu.QueryResult":
-        """Execute a Cypher query.
+        """Execute a Cypher query on the writer connection.
 
         Args:
             query: Cypher query string
@@ -81,12 +416,30 @@ class GraphDatabase:
         Example:
             >>> result = db.execute("MATCH (t:Task {id: $id}) RETURN t", {"id": 278})
         """
-        # See task #323
-        return self.conn.execute(query)
+        with self.write_lock:
+            return self.run(self.conn, query, parameters)
 
     def close(self):
-        """Close database connection."""
+        """Close database connection.
+
+        Waits for borrowed read connections to be returned; later reads
+        raise ``RuntimeError``.
+        """
+        with self._drained():
+            if self._closed:
+                return
+            self._closed = True
+            self._close_connections()
+
+    def _close_connections(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+        self._prepared.clear()
         self.conn.close()
+        self.db.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -101,15 +454,23 @@ class GraphDatabase:
 _db_instance: Optional[GraphDatabase] = None
 
 
-def get_database(db_path: Optional[Path] = None, project_path: Optional[Path] = None) -> GraphDatabase:
+def get_database(
+    db_path: Optional[Path] = None,
+    project_path: Optional[Path] = None,
+    read_only: bool = False,
+) -> GraphDatabase:
     """Get or create database instance.
 
     Uses project-local database at .idlergear/graph.db.
     Requires IdlerGear to be initialized (run 'idlergear init').
 
+    A read-write instance satisfies read-only requests; asking for
+    read-write while the instance is read-only reopens it.
+
     Args:
         db_path: Optional custom database path (overrides auto-detection)
         project_path: Optional project root path (for auto-detection)
+        read_only: Open the database without the write lock
 
     Returns:
         GraphDatabase instance
@@ -123,9 +484,36 @@ def get_database(db_path: Optional[Path] = None, project_path: Optional[Path] =
     """
     global _db_instance
 
+    if _db_instance is not None and _db_instance.read_only and not read_only:
+        reset_database()
+
     if _db_instance is None:
-        _db_instance = GraphDatabase(db_path, project_path)
+        _db_instance = GraphDatabase(db_path, project_path, read_only=read_only)
+
+    return _db_instance
+
+
+def bumps_generation(method: Callable) -> Callable:
+    """Bump ``self.db``'s generation after a populator method writes.
+
+    Applied to populator entry points so cached query results are
+    invalidated however the method exits.
+    """
 
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            bump = getattr(self.db, "bump_generation", None)
+            if bump is not None:
+                bump()
+
+    return wrapper
+
+
+def get_open_database() -> Optional[GraphDatabase]:
+    """Return the process-wide instance if one is open, without opening one."""
     return _db_instance
 
 
@@ -135,3 +523,179 @@ def reset_database():
     if _db_instance is not None:
         _db_instance.close()
         _db_instance = None
+
+
+def replace_database(db: GraphDatabase, new_path: Path) -> None:
+    """Swap the database built at ``new_path`` in for ``db``.
+
+    In-flight writes (``write_lock``) and borrowed read connections finish
+    first, and new reads wait. ``db`` then closes its database, ``new_path``
+    is renamed over its path in one step, and ``db`` reopens on it, so
+    holders of ``db`` (such as the daemon) carry on with the new graph.
+    Other processes that already had the old database open keep reading
+    it. Bumps the generation afterwards.
+
+    Args:
+        db: Live database to replace; open on the new database on return
+        new_path: Closed database to move into place
+    """
+    with db.write_lock, db._drained():
+        db._close_connections()
+        try:
+            live_path = db.db_path
+            if live_path.is_dir():
+                # Older Kuzu releases stored a database as a directory
+                stale = live_path.with_name(live_path.name + ".old")
+                shutil.rmtree(stale, ignore_errors=True)
+                os.replace(live_path, stale)
+                os.replace(new_path, live_path)
+                shutil.rmtree(stale, ignore_errors=True)
+            else:
+                os.replace(new_path, live_path)
+            # A closed database has checkpointed its write-ahead log
+            live_path.with_name(live_path.name + ".wal").unlink(missing_ok=True)
+            db._open()
+        except BaseException:
+            db._closed = True
+            raise
+
+    db.bump_generation()
+
+
+class QueryRows:
+    """Materialized query result with the ``has_next``/``get_next`` interface
+    of ``kuzu.QueryResult``."""
+
+    def __init__(self, columns: List[str], rows: List[list]):
+        self._columns = columns
+        self._rows = rows
+        self._index = 0
+
+    def has_next(self) -> bool:
+        return self._index < len(self._rows)
+
+    def get_next(self) -> list:
+        row = self._rows[self._index]
+        self._index += 1
+        return row
+
+    def get_column_names(self) -> List[str]:
+        return list(self._columns)
+
+    def get_all(self) -> List[list]:
+        rows = self._rows[self._index :]
+        self._index = len(self._rows)
+        return rows
+
+
+class DaemonGraphDatabase:
+    """Read-only stand-in for ``GraphDatabase`` that queries via the daemon.
+
+    Used when another process (normally the daemon) holds the write lock.
+    ``get_connection().execute()`` returns ``QueryRows``, so query helpers
+    written against ``GraphDatabase`` work unchanged.
+    """
+
+    read_only = True
+
+    def __init__(self, idlergear_root: Path, timeout: float = 30.0):
+        self.idlergear_root = idlergear_root
+        self.timeout = timeout
+
+    def get_connection(self) -> "DaemonGraphDatabase":
+        return self
+
+    @contextmanager
+    def read_connection(self) -> Iterator["DaemonGraphDatabase"]:
+        yield self
+
+    def fetch_rows(
+        self, query: str, parameters: Optional[dict] = None
+    ) -> Tuple[List[str], List[list]]:
+        from idlergear.daemon.client import call_daemon
+
+        result = call_daemon(
+            self.idlergear_root,
+            "graph.query",
+            {"query": query, "parameters": parameters or {}},
+            timeout=self.timeout,
+        )
+        return result["columns"], result["rows"]
+
+    # The daemon caches results on its side
+    cached_rows = fetch_rows
+
+    def execute(self, query: str, parameters: Optional[dict] = None) -> QueryRows:
+        return QueryRows(*self.fetch_rows(query, parameters))
+
+    def close(self):
+        pass
+
+
+@contextmanager
+def query_database(project_path: Optional[Path] = None) -> Iterator[Any]:
+    """Yield a database handle for read-only queries.
+
+    Prefers, in order:
+    1. The process-wide instance, if this process already has one open
+    2. A read-only instance opened for this block and closed afterwards,
+       so the process never keeps the lock while idle
+    3. The daemon, when another process holds the write lock
+
+    Args:
+        project_path: Project root (auto-detected if not provided)
+
+    Raises:
+        GraphLockedError: If the database is locked and no daemon is running
+        RuntimeError: If IdlerGear is not initialized
+
+    Example:
+        >>> with query_database() as db:
+        ...     context = query_task_context(db, task_id=278)
+    """
+    if _db_instance is not None:
+        yield _db_instance
+        return
+
+    from idlergear.config import find_idlergear_root
+
+    root = project_path or find_idlergear_root()
+    if root is None:
+        raise RuntimeError(
+            "IdlerGear not initialized. Run 'idlergear init' in your project directory first."
+        )
+
+    try:
+        db = GraphDatabase(project_path=root, read_only=True)
+    except GraphLockedError:
+        from idlergear.daemon.client import DaemonNotRunning, daemon_socket_path
+
+        if daemon_socket_path(root) is None:
+            raise
+        try:
+            yield DaemonGraphDatabase(root)
+        except DaemonNotRunning:
+            raise GraphLockedError(
+                "Graph database is locked by another process and the daemon is not running"
+            )
+        return
+
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert Kuzu result values (nodes, dates, ids) to JSON-safe values."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, dict):
+        return {str(k): to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_jsonable(v) for v in value]
+    return str(value)
@@ -60,10 +60,8 @@ def ensure_graph_populated(
             if verbose:
                 print("📊 Knowledge graph empty, populating (one-time)...")
 
-            # NOTE: This will still hit lock issue if called from MCP server
-            # since get_database() above already acquired the lock.
-            # Full solution requires MCP server to release lock before calling this.
-            # For CLI usage, this works fine.
+            # populate_all() reuses the instance opened above, so this only
+            # fails (GraphLockedError) when another process is the writer.
             from .populate_all import populate_all
 
             try:
@@ -9,6 +9,11 @@ This parser provides:
 - Comment preservation (AST discards comments)
 - Exact position tracking
 
+Extraction uses one combined query per language, compiled once and shared
+by all parser instances. A single capture pass over the tree yields
+functions, classes, methods, imports, comments and call sites in document
+order; enclosing classes are tracked on a stack instead of walking parents.
+
 Usage:
     >>> parser = TreeSitterParser()
     >>> result = parser.parse_file(Path("src/main.py"))
@@ -17,12 +22,27 @@ Usage:
 """
 
 import tree_sitter_languages
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple, Union
 from pathlib import Path
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+_JS_QUERY = """
+    (function_declaration) @function
+    (lexical_declaration
+        (variable_declarator
+            name: (identifier)
+            value: (arrow_function)) @arrow)
+    (class_declaration) @class
+    (method_definition) @method
+    (import_statement) @import
+    (comment) @comment
+    (call_expression function: (_) @callee)
+    (new_expression constructor: (_) @callee)
+"""
+
 
 class TreeSitterParser:
     """Multi-language code parser using tree-sitter.
@@ -54,10 +74,56 @@ class TreeSitterParser:
         ".kt": "kotlin",
     }
 
+    # One extraction query per language. The capture name says what each
+    # node is; @callee captures the callee expression of a call site.
+    EXTRACTION_QUERIES = {
+        "python": """
+            (function_definition) @function
+            (class_definition) @class
+            (import_statement) @import
+            (import_from_statement) @import_from
+            (comment) @comment
+            (call function: (_) @callee)
+        """,
+        "javascript": _JS_QUERY,
+        "typescript": _JS_QUERY,
+        "rust": """
+            (function_item) @function
+            (struct_item) @class
+            (enum_item) @class
+            (impl_item) @impl
+            (use_declaration) @use
+            (line_comment) @comment
+            (block_comment) @comment
+            (call_expression function: (_) @callee)
+        """,
+        "go": """
+            (function_declaration) @function
+            (method_declaration) @method
+            (type_spec type: [(struct_type) (interface_type)]) @class
+            (import_declaration) @import
+            (comment) @comment
+            (call_expression function: (_) @callee)
+        """,
+    }
+
+    # Callee node type -> (receiver field, name field)
+    _MEMBER_CALLEES = {
+        "attribute": ("object", "attribute"),
+        "member_expression": ("object", "property"),
+        "field_expression": ("value", "field"),
+        "scoped_identifier": ("path", "name"),
+        "selector_expression": ("operand", "field"),
+    }
+
+    # Language objects and compiled queries, shared by all instances
+    _languages: Dict[str, Any] = {}
+    _queries: Dict[str, Any] = {}
+    _compile_lock = threading.Lock()
+
     def __init__(self):
         """Initialize tree-sitter parser."""
-        self._parsers = {}  # Cache parsers by language
-        self._languages = {}  # Cache language objects
+        self._parsers = {}  # Cache parsers by language (not thread-safe)
 
     def get_parser(self, language: str):
         """Get or create parser for a language.
@@ -81,9 +147,33 @@ class TreeSitterParser:
         Returns:
             tree_sitter.Language object
         """
-        if language not in self._languages:
-            self._languages[language] = tree_sitter_languages.get_language(language)
-        return self._languages[language]
+        cls = type(self)
+        if language not in cls._languages:
+            cls._languages[language] = tree_sitter_languages.get_language(language)
+        return cls._languages[language]
+
+    def get_query(self, language: str):
+        """Get the compiled extraction query for a language.
+
+        Queries are compiled on first use and cached on the class.
+
+        Args:
+            language: Language name
+
+        Returns:
+            tree_sitter.Query, or None if extraction isn't implemented
+        """
+        cls = type(self)
+        query = cls._queries.get(language)
+        if query is None and language in self.EXTRACTION_QUERIES:
+            with cls._compile_lock:
+                query = cls._queries.get(language)
+                if query is None:
+                    query = self.get_language(language).query(
+                        self.EXTRACTION_QUERIES[language]
+                    )
+                    cls._queries[language] = query
+        return query
 
     def parse_file(self, file_path: Path) -> Optional[Dict[str, Any]]:
         """Parse a source file and extract symbols.
@@ -94,8 +184,10 @@ class TreeSitterParser:
         Returns:
             Dictionary with:
                 - symbols: List of functions/classes/methods
-                - imports: List of import statements
+                - imports: List of import statements, with ``bindings``
+                  (local name -> module/symbol) where supported
                 - comments: List of comments (NEW!)
+                - calls: List of call sites (name, receiver, line)
                 - language: Detected language
 
             None if file can't be parsed (unsupported language, read error)
@@ -109,74 +201,209 @@ class TreeSitterParser:
             return None
 
         try:
-            code = file_path.read_text(encoding="utf-8")
+            source = file_path.read_bytes()
+            source.decode("utf-8")
         except (UnicodeDecodeError, PermissionError, FileNotFoundError) as e:
             logger.debug(f"Can't read {file_path}: {e}")
             return None
 
         try:
-            parser = self.get_parser(language)
-            tree = parser.parse(bytes(code, "utf8"))
-
-            # Extract symbols based on language
-            symbols, imports, comments = self._extract_all(tree, code, language)
-
-            return {
-                "symbols": symbols,
-                "imports": imports,
-                "comments": comments,
-                "language": language,
-            }
-
+            return self.parse_source(source, language)
         except Exception as e:
             logger.error(f"Error parsing {file_path}: {e}")
             return None
 
+    def parse_source(self, source: Union[bytes, str], language: str) -> Dict[str, Any]:
+        """Parse source code in a given language.
+
+        Args:
+            source: Source code (UTF-8 bytes or str)
+            language: Language name
+
+        Returns:
+            Same dictionary as parse_file()
+        """
+        if isinstance(source, str):
+            source = source.encode("utf-8")
+        tree = self.get_parser(language).parse(source)
+        symbols, imports, comments, calls = self._extract_all(tree, source, language)
+        return {
+            "symbols": symbols,
+            "imports": imports,
+            "comments": comments,
+            "calls": calls,
+            "language": language,
+        }
+
     def _extract_all(
-        self, tree, code: str, language: str
-    ) -> Tuple[List[Dict], List[Dict], List[Dict]]:
-        """Extract symbols, imports, and comments from parse tree.
+        self, tree, source: bytes, language: str
+    ) -> Tuple[List[Dict], List[Dict], List[Dict], List[Dict]]:
+        """Extract symbols, imports, comments and calls in one capture pass.
 
         Args:
             tree: tree-sitter parse tree
-            code: Source code string
+            source: Source code bytes the tree was parsed from
             language: Language name
 
         Returns:
-            Tuple of (symbols, imports, comments)
+            Tuple of (symbols, imports, comments, calls)
         """
-        if language == "python":
-            return self._extract_python(tree, code)
-        elif language in ("javascript", "typescript"):
-            return self._extract_javascript(tree, code)
-        elif language == "rust":
-            return self._extract_rust(tree, code)
-        elif language == "go":
-            return self._extract_go(tree, code)
-        # TODO: Add more languages as needed
-
-        # Default: empty results for unsupported language
-        logger.warning(f"Extraction not implemented for {language}")
-        return [], [], []
-
-    def _extract_docstring(self, node, code: str) -> str:
+        query = self.get_query(language)
+        if query is None:
+            # TODO: Add more languages as needed
+            logger.warning(f"Extraction not implemented for {language}")
+            return [], [], [], []
+
+        def text(node) -> str:
+            return source[node.start_byte:node.end_byte].decode("utf-8", "replace")
+
+        handle_symbol = {
+            "python": self._python_symbol,
+            "javascript": self._javascript_symbol,
+            "typescript": self._javascript_symbol,
+            "rust": self._rust_symbol,
+            "go": self._go_symbol,
+        }[language]
+        import_bindings = {
+            "python": self._python_import_bindings,
+            "javascript": self._javascript_import_bindings,
+            "typescript": self._javascript_import_bindings,
+            "rust": self._rust_use_bindings,
+            "go": self._go_import_bindings,
+        }[language]
+
+        symbols: List[Dict] = []
+        imports: List[Dict] = []
+        comments: List[Dict] = []
+        calls: List[Dict] = []
+        # Open classes/impls as (end_byte, name), innermost last
+        owners: List[Tuple[int, Optional[str]]] = []
+
+        for node, tag in query.captures(tree.root_node):
+            while owners and owners[-1][0] <= node.start_byte:
+                owners.pop()
+            line = node.start_point[0] + 1
+
+            if tag == "comment":
+                comments.append({"text": text(node), "line": line})
+            elif tag == "callee":
+                callee = self._describe_callee(node, text)
+                if callee:
+                    calls.append({"name": callee[0], "receiver": callee[1], "line": line})
+            elif tag in ("import", "import_from", "use"):
+                imports.append({
+                    "text": text(node),
+                    "line": line,
+                    "type": tag,
+                    "bindings": import_bindings(node, text),
+                })
+            else:
+                owner = owners[-1][1] if owners else None
+                symbol, opens = handle_symbol(node, tag, text, owner)
+                if symbol:
+                    symbol.setdefault("line_start", line)
+                    symbol.setdefault("line_end", node.end_point[0] + 1)
+                    symbol.setdefault("code", text(node))
+                    symbols.append(symbol)
+                if opens is not None:
+                    owners.append((node.end_byte, opens))
+
+        return symbols, imports, comments, calls
+
+    # ------------------------------------------------------------------
+    # Per-language symbol handlers
+    #
+    # Each takes (node, capture tag, text, enclosing owner name) and returns
+    # (symbol dict or None, owner name this node opens or None).
+    # ------------------------------------------------------------------
+
+    def _python_symbol(self, node, tag: str, text: Callable, owner: Optional[str]):
+        name_node = node.child_by_field_name("name")
+        if name_node is None:
+            return None, None
+        name = text(name_node)
+        docstring = self._extract_docstring(node, text)
+        if tag == "class":
+            return {"name": name, "type": "class", "docstring": docstring}, name
+        if owner:
+            return {"name": f"{owner}.{name}", "type": "method", "docstring": docstring}, None
+        return {"name": name, "type": "function", "docstring": docstring}, None
+
+    def _javascript_symbol(self, node, tag: str, text: Callable, owner: Optional[str]):
+        name_node = node.child_by_field_name("name")
+        if name_node is None:
+            return None, None
+        name = text(name_node)
+        if tag == "class":
+            return {"name": name, "type": "class"}, name
+        if tag == "method":
+            full_name = f"{owner}.{name}" if owner else name
+            return {"name": full_name, "type": "method"}, None
+        return {"name": name, "type": "function"}, None
+
+    def _rust_symbol(self, node, tag: str, text: Callable, owner: Optional[str]):
+        if tag == "impl":
+            type_node = node.child_by_field_name("type")
+            if type_node is not None and type_node.type in ("generic_type", "scoped_type_identifier"):
+                type_node = type_node.child_by_field_name(
+                    "type" if type_node.type == "generic_type" else "name"
+                )
+            impl_type = text(type_node) if type_node is not None else None
+            return None, impl_type
+
+        name_node = node.child_by_field_name("name")
+        if name_node is None:
+            return None, None
+        name = text(name_node)
+        if tag == "class":  # Structs and enums are treated as classes
+            return {"name": name, "type": "class"}, None
+        if owner:
+            return {"name": f"{owner}.{name}", "type": "method"}, None
+        return {"name": name, "type": "function"}, None
+
+    def _go_symbol(self, node, tag: str, text: Callable, owner: Optional[str]):
+        name_node = node.child_by_field_name("name")
+        if name_node is None:
+            return None, None
+        name = text(name_node)
+
+        if tag == "class":  # Structs and interfaces are treated as classes
+            declaration = node.parent
+            specs = [c for c in declaration.children if c.type == "type_spec"]
+            span = declaration if len(specs) == 1 else node
+            return {
+                "name": name,
+                "type": "class",
+                "line_start": span.start_point[0] + 1,
+                "line_end": span.end_point[0] + 1,
+                "code": text(span),
+            }, None
+
+        if tag == "method":
+            receiver_type = None
+            receiver = node.child_by_field_name("receiver")
+            for param in receiver.named_children if receiver else ():
+                type_node = param.child_by_field_name("type")
+                if type_node is not None and type_node.type in ("type_identifier", "pointer_type"):
+                    receiver_type = text(type_node).lstrip("*")
+                    break
+            full_name = f"{receiver_type}.{name}" if receiver_type else name
+            return {"name": full_name, "type": "method"}, None
+
+        return {"name": name, "type": "function"}, None
+
+    def _extract_docstring(self, node, text: Callable) -> str:
         """Extract docstring from a Python function or class node.
 
         Args:
             node: tree-sitter node for function_definition or class_definition
-            code: Source code string
+            text: Returns the source text of a node
 
         Returns:
             Docstring text, or empty string if none found
         """
-        # Find the body node
-        body_node = None
-        for child in node.children:
-            if child.type == "block":
-                body_node = child
-                break
-
-        if not body_node or len(body_node.children) == 0:
+        body_node = node.child_by_field_name("body")
+        if not body_node or body_node.child_count == 0:
             return ""
 
         # Check if first child is an expression statement with a string
@@ -185,7 +412,7 @@ class TreeSitterParser:
             for child in first_stmt.children:
                 if child.type == "string":
                     # Extract string content (remove quotes)
-                    doc_text = code[child.start_byte:child.end_byte]
+                    doc_text = text(child)
                     # Remove triple quotes or single quotes
                     if doc_text.startswith('"""') or doc_text.startswith("'''"):
                         return doc_text[3:-3].strip()
@@ -195,566 +422,168 @@ class TreeSitterParser:
 
         return ""
 
-    def _extract_python(self, tree, code: str) -> Tuple[List[Dict], List[Dict], List[Dict]]:
-        """Extract Python symbols, imports, and comments.
+    # ------------------------------------------------------------------
+    # Call sites
+    # ------------------------------------------------------------------
 
-        Returns:
-            (symbols, imports, comments)
-        """
-        symbols = []
-        imports = []
-        comments = []
-
-        lang = self.get_language("python")
-        root = tree.root_node
-
-        # Query for function definitions (not inside classes)
-        func_query = lang.query("""
-            (function_definition
-                name: (identifier) @func_name) @func
-        """)
-
-        for node, tag in func_query.captures(root):
-            if tag == "func":
-                # Skip if this is a method (inside a class)
-                parent = node.parent
-                while parent:
-                    if parent.type == "class_definition":
-                        # This is a method, skip it (will be handled in class processing)
-                        break
-                    parent = parent.parent
-                else:
-                    # This is a top-level function
-                    name_node = None
-                    for child in node.children:
-                        if child.type == "identifier":
-                            name_node = child
-                            break
-
-                    if name_node:
-                        docstring = self._extract_docstring(node, code)
-                        symbols.append({
-                            "name": code[name_node.start_byte:name_node.end_byte],
-                            "type": "function",
-                            "line_start": node.start_point[0] + 1,  # 1-indexed
-                            "line_end": node.end_point[0] + 1,
-                            "code": code[node.start_byte:node.end_byte],
-                            "docstring": docstring,
-                        })
-
-        # Query for class definitions
-        class_query = lang.query("""
-            (class_definition
-                name: (identifier) @class_name) @class
-        """)
-
-        for node, tag in class_query.captures(root):
-            if tag == "class":
-                name_node = None
-                for child in node.children:
-                    if child.type == "identifier":
-                        name_node = child
-                        break
-
-                if name_node:
-                    class_name = code[name_node.start_byte:name_node.end_byte]
-                    docstring = self._extract_docstring(node, code)
-                    symbols.append({
-                        "name": class_name,
-                        "type": "class",
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                        "docstring": docstring,
-                    })
-
-                    # Extract methods from this class
-                    body_node = None
-                    for child in node.children:
-                        if child.type == "block":
-                            body_node = child
-                            break
-
-                    if body_node:
-                        # Find all function definitions in the class body
-                        method_query = lang.query("""
-                            (function_definition
-                                name: (identifier) @method_name) @method
-                        """)
-
-                        for method_node, method_tag in method_query.captures(body_node):
-                            if method_tag == "method":
-                                method_name_node = None
-                                for child in method_node.children:
-                                    if child.type == "identifier":
-                                        method_name_node = child
-                                        break
-
-                                if method_name_node:
-                                    method_name = code[method_name_node.start_byte:method_name_node.end_byte]
-                                    method_docstring = self._extract_docstring(method_node, code)
-                                    symbols.append({
-                                        "name": f"{class_name}.{method_name}",
-                                        "type": "method",
-                                        "line_start": method_node.start_point[0] + 1,
-                                        "line_end": method_node.end_point[0] + 1,
-                                        "code": code[method_node.start_byte:method_node.end_byte],
-                                        "docstring": method_docstring,
-                                    })
-
-        # Query for comments
-        comment_query = lang.query("""
-            (comment) @comment
-        """)
-
-        for node, tag in comment_query.captures(root):
-            if tag == "comment":
-                comments.append({
-                    "text": code[node.start_byte:node.end_byte],
-                    "line": node.start_point[0] + 1,
-                })
+    def _describe_callee(self, node, text: Callable) -> Optional[Tuple[str, Optional[str]]]:
+        """Split a callee expression into (name, receiver).
 
-        # Query for imports
-        import_query = lang.query("""
-            (import_statement) @import
-            (import_from_statement) @import_from
-        """)
-
-        for node, tag in import_query.captures(root):
-            if tag == "import" or tag == "import_from":
-                imports.append({
-                    "text": code[node.start_byte:node.end_byte],
-                    "line": node.start_point[0] + 1,
-                    "type": tag,
-                })
-
-        return symbols, imports, comments
-
-    def _extract_javascript(self, tree, code: str) -> Tuple[List[Dict], List[Dict], List[Dict]]:
-        """Extract JavaScript/TypeScript symbols, imports, and comments.
-
-        Returns:
-            (symbols, imports, comments)
+        For member or path calls (``obj.f()``, ``mod::f()``) the receiver is
+        the receiver expression text. Receivers that are not plain names
+        (``a().f()``) are reported as ``"?"`` so resolvers know the target
+        type is unknown.
         """
-        symbols = []
-        imports = []
-        comments = []
-
-        # Determine language (javascript or typescript based on file extension)
-        # Both share similar syntax, so we'll detect based on calling context
-        lang_name = "javascript"  # Default to javascript
-        try:
-            lang = self.get_language(lang_name)
-        except Exception as e:
-            logger.error(f"Failed to get language {lang_name}: {e}")
-            return [], [], []
-        root = tree.root_node
-
-        # Query for function declarations
-        func_query = lang.query("""
-            (function_declaration
-                name: (identifier) @func_name) @func
-        """)
-
-        for node, tag in func_query.captures(root):
-            if tag == "func":
-                # Find function name node
-                name_node = None
-                for child in node.children:
-                    if child.type == "identifier":
-                        name_node = child
-                        break
-
-                if name_node:
-                    symbols.append({
-                        "name": code[name_node.start_byte:name_node.end_byte],
-                        "type": "function",
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for arrow functions (const foo = () => {})
-        arrow_query = lang.query("""
-            (lexical_declaration
-                (variable_declarator
-                    name: (identifier) @arrow_name
-                    value: (arrow_function))) @arrow
-        """)
-
-        for node, tag in arrow_query.captures(root):
-            if tag == "arrow_name":
-                # Find the variable_declarator parent
-                parent = node.parent
-                if parent:
-                    symbols.append({
-                        "name": code[node.start_byte:node.end_byte],
-                        "type": "function",
-                        "line_start": parent.start_point[0] + 1,
-                        "line_end": parent.end_point[0] + 1,
-                        "code": code[parent.start_byte:parent.end_byte],
-                    })
-
-        # Query for class declarations
-        class_query = lang.query("""
-            (class_declaration
-                name: (identifier) @class_name) @class
-        """)
-
-        for node, tag in class_query.captures(root):
-            if tag == "class":
-                name_node = None
-                for child in node.children:
-                    if child.type == "identifier":
-                        name_node = child
-                        break
-
-                if name_node:
-                    symbols.append({
-                        "name": code[name_node.start_byte:name_node.end_byte],
-                        "type": "class",
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for method definitions (inside classes)
-        method_query = lang.query("""
-            (method_definition
-                name: (property_identifier) @method_name) @method
-        """)
-
-        for node, tag in method_query.captures(root):
-            if tag == "method":
-                name_node = None
-                for child in node.children:
-                    if child.type == "property_identifier":
-                        name_node = child
-                        break
-
-                if name_node:
-                    # Try to find parent class name
-                    parent = node.parent
-                    while parent and parent.type != "class_declaration":
-                        parent = parent.parent
-
-                    class_name = "unknown"
-                    if parent:
-                        for child in parent.children:
-                            if child.type == "identifier":
-                                class_name = code[child.start_byte:child.end_byte]
-                                break
-
-                    method_name = code[name_node.start_byte:name_node.end_byte]
-                    full_name = f"{class_name}.{method_name}" if class_name != "unknown" else method_name
-
-                    symbols.append({
-                        "name": full_name,
-                        "type": "method",
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for comments
-        comment_query = lang.query("""
-            (comment) @comment
-        """)
-
-        for node, tag in comment_query.captures(root):
-            if tag == "comment":
-                comments.append({
-                    "text": code[node.start_byte:node.end_byte],
-                    "line": node.start_point[0] + 1,
-                })
-
-        # Query for import statements
-        import_query = lang.query("""
-            (import_statement) @import
-        """)
-
-        for node, tag in import_query.captures(root):
-            if tag == "import":
-                imports.append({
-                    "text": code[node.start_byte:node.end_byte],
-                    "line": node.start_point[0] + 1,
-                    "type": "import",
-                })
+        if node.type in ("identifier", "property_identifier", "field_identifier"):
+            return text(node), None
 
-        return symbols, imports, comments
-
-    def _extract_rust(self, tree, code: str) -> Tuple[List[Dict], List[Dict], List[Dict]]:
-        """Extract Rust symbols, imports (use statements), and comments.
-
-        Returns:
-            (symbols, imports, comments)
-        """
-        symbols = []
-        imports = []
-        comments = []
-
-        lang = self.get_language("rust")
-        root = tree.root_node
-
-        # Query for function definitions
-        func_query = lang.query("""
-            (function_item
-                name: (identifier) @func_name) @func
-        """)
-
-        for node, tag in func_query.captures(root):
-            if tag == "func":
-                # Find function name node
-                name_node = None
-                for child in node.children:
-                    if child.type == "identifier":
-                        name_node = child
-                        break
-
-                if name_node:
-                    symbols.append({
-                        "name": code[name_node.start_byte:name_node.end_byte],
-                        "type": "function",
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for struct definitions
-        struct_query = lang.query("""
-            (struct_item
-                name: (type_identifier) @struct_name) @struct
-        """)
-
-        for node, tag in struct_query.captures(root):
-            if tag == "struct":
-                name_node = None
-                for child in node.children:
-                    if child.type == "type_identifier":
-                        name_node = child
-                        break
-
-                if name_node:
-                    symbols.append({
-                        "name": code[name_node.start_byte:name_node.end_byte],
-                        "type": "class",  # Treat struct as class for consistency
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for impl blocks (methods)
-        impl_query = lang.query("""
-            (impl_item
-                type: (type_identifier) @impl_type
-                body: (declaration_list
-                    (function_item
-                        name: (identifier) @method_name) @method))
-        """)
-
-        captures_dict = {}
-        for node, tag in impl_query.captures(root):
-            if tag == "impl_type":
-                captures_dict["impl_type"] = code[node.start_byte:node.end_byte]
-            elif tag == "method" and "impl_type" in captures_dict:
-                # Find method name
-                name_node = None
-                for child in node.children:
-                    if child.type == "identifier":
-                        name_node = child
-                        break
-
-                if name_node:
-                    method_name = code[name_node.start_byte:name_node.end_byte]
-                    full_name = f"{captures_dict['impl_type']}.{method_name}"
-
-                    symbols.append({
-                        "name": full_name,
-                        "type": "method",
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for enum definitions
-        enum_query = lang.query("""
-            (enum_item
-                name: (type_identifier) @enum_name) @enum
-        """)
-
-        for node, tag in enum_query.captures(root):
-            if tag == "enum":
-                name_node = None
-                for child in node.children:
-                    if child.type == "type_identifier":
-                        name_node = child
-                        break
-
-                if name_node:
-                    symbols.append({
-                        "name": code[name_node.start_byte:name_node.end_byte],
-                        "type": "class",  # Treat enum as class for consistency
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for comments (both line and block comments)
-        comment_query = lang.query("""
-            (line_comment) @comment
-            (block_comment) @comment
-        """)
-
-        for node, tag in comment_query.captures(root):
-            if tag == "comment":
-                comments.append({
-                    "text": code[node.start_byte:node.end_byte],
-                    "line": node.start_point[0] + 1,
-                })
-
-        # Query for use statements (imports)
-        use_query = lang.query("""
-            (use_declaration) @use
-        """)
-
-        for node, tag in use_query.captures(root):
-            if tag == "use":
-                imports.append({
-                    "text": code[node.start_byte:node.end_byte],
-                    "line": node.start_point[0] + 1,
-                    "type": "use",
-                })
-
-        return symbols, imports, comments
-
-    def _extract_go(self, tree, code: str) -> Tuple[List[Dict], List[Dict], List[Dict]]:
-        """Extract Go symbols, imports, and comments.
-
-        Returns:
-            (symbols, imports, comments)
-        """
-        symbols = []
-        imports = []
-        comments = []
-
-        lang = self.get_language("go")
-        root = tree.root_node
-
-        # Query for function declarations
-        func_query = lang.query("""
-            (function_declaration
-                name: (identifier) @func_name) @func
-        """)
-
-        for node, tag in func_query.captures(root):
-            if tag == "func":
-                # Find function name node
-                name_node = None
-                for child in node.children:
-                    if child.type == "identifier":
-                        name_node = child
-                        break
-
-                if name_node:
-                    symbols.append({
-                        "name": code[name_node.start_byte:name_node.end_byte],
-                        "type": "function",
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for method declarations (functions with receivers)
-        method_query = lang.query("""
-            (method_declaration
-                receiver: (parameter_list
-                    (parameter_declaration
-                        type: (_) @receiver_type))
-                name: (field_identifier) @method_name) @method
-        """)
-
-        for node, tag in method_query.captures(root):
-            if tag == "method":
-                # Find method name and receiver type
-                method_name = None
-                receiver_type = None
-
-                for child in node.children:
-                    if child.type == "field_identifier":
-                        method_name = code[child.start_byte:child.end_byte]
-                    elif child.type == "parameter_list":
-                        # Extract receiver type from parameter_list
-                        for param in child.children:
-                            if param.type == "parameter_declaration":
-                                for p_child in param.children:
-                                    if p_child.type in ["type_identifier", "pointer_type"]:
-                                        receiver_type = code[p_child.start_byte:p_child.end_byte]
-                                        # Strip * from pointer types
-                                        if receiver_type.startswith("*"):
-                                            receiver_type = receiver_type[1:]
-                                        break
-
-                if method_name:
-                    full_name = f"{receiver_type}.{method_name}" if receiver_type else method_name
-                    symbols.append({
-                        "name": full_name,
-                        "type": "method",
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for type declarations (structs, interfaces)
-        type_query = lang.query("""
-            (type_declaration
-                (type_spec
-                    name: (type_identifier) @type_name
-                    type: [(struct_type) (interface_type)])) @type_decl
-        """)
-
-        for node, tag in type_query.captures(root):
-            if tag == "type_decl":
-                # Find type name
-                name_node = None
-                for child in node.children:
-                    if child.type == "type_spec":
-                        for spec_child in child.children:
-                            if spec_child.type == "type_identifier":
-                                name_node = spec_child
-                                break
-
-                if name_node:
-                    symbols.append({
-                        "name": code[name_node.start_byte:name_node.end_byte],
-                        "type": "class",  # Treat struct/interface as class
-                        "line_start": node.start_point[0] + 1,
-                        "line_end": node.end_point[0] + 1,
-                        "code": code[node.start_byte:node.end_byte],
-                    })
-
-        # Query for comments
-        comment_query = lang.query("""
-            (comment) @comment
-        """)
-
-        for node, tag in comment_query.captures(root):
-            if tag == "comment":
-                comments.append({
-                    "text": code[node.start_byte:node.end_byte],
-                    "line": node.start_point[0] + 1,
-                })
+        fields = self._MEMBER_CALLEES.get(node.type)
+        if fields is None:
+            return None
+        receiver_node = node.child_by_field_name(fields[0])
+        name_node = node.child_by_field_name(fields[1])
+        if name_node is None:
+            return None
 
-        # Query for import declarations
-        import_query = lang.query("""
-            (import_declaration) @import
-        """)
+        name = text(name_node)
+        if receiver_node is None:
+            return name, None
+        receiver = text(receiver_node)
+        if not all(part.isidentifier() for part in receiver.replace("::", ".").split(".")):
+            receiver = "?"
+        return name, receiver
+
+    # ------------------------------------------------------------------
+    # Import bindings
+    #
+    # A binding maps a local name to what it refers to:
+    #   {"name": local name (None for side-effect imports),
+    #    "module": module spec as written,
+    #    "symbol": imported symbol name (None when the module itself is bound)}
+    # ------------------------------------------------------------------
+
+    def _python_import_bindings(self, node, text: Callable) -> List[Dict]:
+        """Bindings for ``import a.b as c`` / ``from .a import b as c``."""
+        bindings = []
+
+        if node.type == "import_statement":
+            for child in node.children_by_field_name("name"):
+                if child.type == "aliased_import":
+                    module = text(child.child_by_field_name("name"))
+                    local = text(child.child_by_field_name("alias"))
+                else:
+                    module = local = text(child)
+                bindings.append({"name": local, "module": module, "symbol": None})
+            return bindings
 
-        for node, tag in import_query.captures(root):
-            if tag == "import":
-                imports.append({
-                    "text": code[node.start_byte:node.end_byte],
-                    "line": node.start_point[0] + 1,
-                    "type": "import",
+        module_node = node.child_by_field_name("module_name")
+        module = text(module_node) if module_node else ""
+        for child in node.children:
+            if child.type == "wildcard_import":
+                bindings.append({"name": "*", "module": module, "symbol": None})
+        for child in node.children_by_field_name("name"):
+            if child.type == "aliased_import":
+                symbol = text(child.child_by_field_name("name"))
+                local = text(child.child_by_field_name("alias"))
+            else:
+                symbol = local = text(child)
+            bindings.append({"name": local, "module": module, "symbol": symbol})
+        return bindings
+
+    def _javascript_import_bindings(self, node, text: Callable) -> List[Dict]:
+        """Bindings for ES module ``import`` statements."""
+        source = node.child_by_field_name("source")
+        if source is None:
+            return []
+        module = text(source).strip("'\"`")
+
+        bindings = []
+        for clause in node.children:
+            if clause.type != "import_clause":
+                continue
+            for child in clause.children:
+                if child.type == "identifier":
+                    bindings.append({"name": text(child), "module": module, "symbol": "default"})
+                elif child.type == "namespace_import":
+                    for ident in child.children:
+                        if ident.type == "identifier":
+                            bindings.append({"name": text(ident), "module": module, "symbol": None})
+                elif child.type == "named_imports":
+                    for spec in child.children:
+                        if spec.type != "import_specifier":
+                            continue
+                        symbol = text(spec.child_by_field_name("name"))
+                        alias = spec.child_by_field_name("alias")
+                        local = text(alias) if alias else symbol
+                        bindings.append({"name": local, "module": module, "symbol": symbol})
+        return bindings or [{"name": None, "module": module, "symbol": None}]
+
+    def _rust_use_bindings(self, node, text: Callable) -> List[Dict]:
+        """Bindings for ``use`` declarations, expanding nested use lists."""
+        bindings = []
+
+        def bind(path: List[str], alias: Optional[str] = None) -> None:
+            if not path:
+                return
+            if path[-1] == "self":  # use a::{self} binds the module a
+                path = path[:-1]
+                if not path:
+                    return
+            bindings.append({
+                "name": alias or path[-1],
+                "module": "::".join(path[:-1]),
+                "symbol": path[-1],
+            })
+
+        def walk(item, prefix: List[str]) -> None:
+            if item.type == "use_as_clause":
+                path = item.child_by_field_name("path")
+                alias = item.child_by_field_name("alias")
+                bind(prefix + text(path).split("::"), text(alias) if alias else None)
+            elif item.type == "scoped_use_list":
+                path = item.child_by_field_name("path")
+                inner = prefix + (text(path).split("::") if path else [])
+                walk(item.child_by_field_name("list"), inner)
+            elif item.type == "use_list":
+                for child in item.named_children:
+                    walk(child, prefix)
+            elif item.type == "use_wildcard":
+                path = text(item).rstrip("*").rstrip(":")
+                bindings.append({
+                    "name": "*",
+                    "module": "::".join(prefix + (path.split("::") if path else [])),
+                    "symbol": None,
                 })
-
-        return symbols, imports, comments
+            elif item.type in ("identifier", "scoped_identifier", "crate", "self", "super"):
+                bind(prefix + text(item).split("::"))
+
+        argument = node.child_by_field_name("argument")
+        if argument is not None:
+            walk(argument, [])
+        return bindings
+
+    def _go_import_bindings(self, node, text: Callable) -> List[Dict]:
+        """Bindings for Go import declarations (packages bind by name)."""
+        bindings = []
+        specs = []
+        for child in node.children:
+            if child.type == "import_spec":
+                specs.append(child)
+            elif child.type == "import_spec_list":
+                specs.extend(c for c in child.children if c.type == "import_spec")
+
+        for spec in specs:
+            path_node = spec.child_by_field_name("path")
+            if path_node is None:
+                continue
+            module = text(path_node).strip('"`')
+            alias_node = spec.child_by_field_name("name")
+            alias = text(alias_node) if alias_node else None
+            if alias == "_":
+                local = None
+            elif alias == ".":
+                local = "*"
+            else:
+                local = alias or module.rsplit("/", 1)[-1]
+            bindings.append({"name": local, "module": module, "symbol": None})
+        return bindings
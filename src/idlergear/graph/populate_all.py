@@ -1,9 +1,16 @@
 """Unified script to populate entire knowledge graph."""
 
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
 
-from .database import get_database
+from .bulk import BulkStager
+from .database import GraphDatabase, get_database, replace_database
 from .schema import initialize_schema
 from .populators import (
     GitPopulator,
@@ -18,6 +25,265 @@ from .populators import (
     PlanPopulator,
 )
 
+# Stages that do not depend on each other run in parallel worker threads
+DEFAULT_MAX_WORKERS = 4
+
+
+class Stage(NamedTuple):
+    """One populator in the population DAG.
+
+    Attributes:
+        name: Key in the results dict and ``step`` in progress events
+        title: Human-readable description for verbose output
+        depends_on: Stages whose nodes this stage reads or links to
+        run: Callable taking the (serialized) database, returning counts
+        summary: Callable turning the counts into verbose output lines
+        items_key: Count used for the items/sec throughput figure
+    """
+
+    name: str
+    title: str
+    depends_on: Tuple[str, ...]
+    run: Callable[[Any], Dict[str, int]]
+    summary: Callable[[Dict[str, int]], List[str]]
+    items_key: str
+
+
+class _SerializedConnection:
+    """Connection proxy that lets one stage at a time talk to Kuzu.
+
+    Populators share a single Kuzu connection, which only runs one query at
+    a time. Holding the writer lock per statement (rather than per stage)
+    lets git subprocesses, parsing and API calls of other stages overlap
+    while database access stays strictly serialized.
+    """
+
+    def __init__(self, conn, lock: threading.RLock):
+        self._conn = conn
+        self._lock = lock
+
+    def execute(self, *args, **kwargs):
+        with self._lock:
+            return self._conn.execute(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class _SerializedDatabase:
+    """Database facade handing out the single serialized writer connection."""
+
+    def __init__(self, db):
+        self._db = db
+        # Share the database's writer lock with other writers in this process
+        self._lock = getattr(db, "write_lock", None) or threading.RLock()
+        self._conn = _SerializedConnection(db.get_connection(), self._lock)
+
+    def get_connection(self):
+        return self._conn
+
+    def execute(self, *args, **kwargs):
+        with self._lock:
+            return self._db.execute(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+
+def _stage_order(stages: List[Stage]) -> List[str]:
+    """Validate the DAG and return stage names in a dependency-respecting order.
+
+    Raises:
+        ValueError: If a stage depends on an unknown stage or on itself transitively
+    """
+    names = {stage.name for stage in stages}
+    remaining = {stage.name: set(stage.depends_on) for stage in stages}
+    for name, deps in remaining.items():
+        unknown = deps - names
+        if unknown:
+            raise ValueError(f"Stage '{name}' depends on unknown stage(s): {sorted(unknown)}")
+
+    order: List[str] = []
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps - set(order)]
+        if not ready:
+            raise ValueError(f"Dependency cycle between stages: {sorted(remaining)}")
+        for name in ready:
+            order.append(name)
+            del remaining[name]
+    return order
+
+
+def run_stages(
+    stages: List[Stage],
+    db,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    on_event: Optional[Callable[[str, str, Dict[str, Any]], None]] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Run stages as soon as their dependencies finish.
+
+    A failing stage records ``{"error": ...}`` and does not stop the stages
+    that depend on it, matching the old sequential behaviour where every
+    populator ran regardless of earlier failures.
+
+    Args:
+        stages: Stages to run
+        db: Database handed (serialized) to each stage
+        max_workers: Maximum number of stages running at once
+        on_event: Called with (stage name, status, payload) on start/finish
+
+    Returns:
+        Tuple of (results per stage, timings per stage). Timings hold
+        ``start`` (offset from scheduler start), ``elapsed``, ``items``,
+        ``items_per_sec`` and ``status``.
+    """
+    _stage_order(stages)
+    by_name = {stage.name: stage for stage in stages}
+    serialized = _SerializedDatabase(db)
+    emit = on_event or (lambda name, status, payload: None)
+
+    results: Dict[str, Dict[str, Any]] = {}
+    timings: Dict[str, Dict[str, Any]] = {}
+    done: set = set()
+    pending = list(by_name)
+    origin = time.perf_counter()
+
+    def execute(stage: Stage) -> Dict[str, Any]:
+        started = time.perf_counter()
+        emit(stage.name, "started", {})
+        try:
+            result, status = stage.run(serialized), "complete"
+        except Exception as e:
+            result, status = {"error": str(e)}, "error"
+        elapsed = time.perf_counter() - started
+        items = result.get(stage.items_key, 0) if status == "complete" else 0
+        timing = {
+            "start": started - origin,
+            "elapsed": elapsed,
+            "items": items,
+            "items_per_sec": items / elapsed if elapsed > 0 else 0.0,
+            "status": status,
+        }
+        results[stage.name] = result
+        timings[stage.name] = timing
+        emit(
+            stage.name,
+            status,
+            {
+                **result,
+                "elapsed": round(elapsed, 3),
+                "items_per_sec": round(timing["items_per_sec"], 1),
+            },
+        )
+        return result
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        running = {}
+        while pending or running:
+            for name in [n for n in pending if set(by_name[n].depends_on) <= done]:
+                pending.remove(name)
+                running[executor.submit(execute, by_name[name])] = name
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done.add(running.pop(future))
+                future.result()
+
+    # Keep results in declaration order regardless of completion order
+    ordered = {stage.name: results[stage.name] for stage in stages}
+    return ordered, {stage.name: timings[stage.name] for stage in stages}
+
+
+def bulk_stages(
+    stages: List[Stage],
+    stager: BulkStager,
+    project_path: Path,
+    max_commits: int,
+    code_directory: str,
+) -> List[Stage]:
+    """Rewrite the population DAG for a bulk rebuild.
+
+    The git and code stages stage their rows instead of inserting them, a
+    ``load`` stage COPYs the staged files into the database, and stages
+    that read git or code nodes wait for ``load`` instead.
+
+    Args:
+        stages: Stages as built by ``populate_all``
+        stager: Stager shared by the git and code stages
+        project_path: Project root
+        max_commits: Maximum commits to stage
+        code_directory: Directory to scan for code
+
+    Returns:
+        The rewritten stages
+    """
+    staged = {
+        "git": lambda db: GitPopulator(db, project_path).stage(
+            stager, max_commits=max_commits
+        ),
+        "code": lambda db: CodePopulator(db, project_path).stage_directory(
+            stager, code_directory
+        ),
+    }
+    rewritten = []
+    for stage in stages:
+        if stage.name in staged:
+            stage = stage._replace(run=staged[stage.name])
+        elif set(stage.depends_on) & set(staged):
+            depends_on = [d for d in stage.depends_on if d not in staged] + ["load"]
+            stage = stage._replace(depends_on=tuple(depends_on))
+        rewritten.append(stage)
+        if stage.name == "code":
+            rewritten.append(
+                Stage(
+                    "load",
+                    "Bulk loading staged nodes and edges",
+                    tuple(staged),
+                    stager.load,
+                    lambda r: [f"{r['rows']:,} rows loaded with COPY"],
+                    "rows",
+                )
+            )
+    return rewritten
+
+
+def _remove_database(path: Path) -> None:
+    """Delete a closed database and its sidecar files."""
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+    for suffix in (".wal", ".generation", CommitTaskLinker.WATERMARK_SUFFIX):
+        path.with_name(path.name + suffix).unlink(missing_ok=True)
+
+
+def format_profile(profile: Dict[str, Any]) -> str:
+    """Render the per-stage timing report produced by ``populate_all(profile=True)``.
+
+    Args:
+        profile: ``results["profile"]`` from populate_all
+
+    Returns:
+        Multi-line table of start offset, elapsed time and throughput per stage
+    """
+    stages = profile["stages"]
+    lines = [
+        f"{'stage':<14}{'start':>9}{'elapsed':>10}{'items':>9}{'items/s':>11}  status",
+        "-" * 60,
+    ]
+    for name, timing in sorted(stages.items(), key=lambda item: item[1]["start"]):
+        lines.append(
+            f"{name:<14}{timing['start']:>8.2f}s{timing['elapsed']:>9.2f}s"
+            f"{timing['items']:>9}{timing['items_per_sec']:>11.1f}  {timing['status']}"
+        )
+    busy = sum(timing["elapsed"] for timing in stages.values())
+    wall = profile["wall_time"]
+    lines.append("-" * 60)
+    lines.append(
+        f"wall time {wall:.2f}s, stage time {busy:.2f}s "
+        f"({busy / wall if wall > 0 else 0:.1f}x overlap)"
+    )
+    return "\n".join(lines)
+
 
 def populate_all(
     project_path: Optional[Path] = None,
@@ -27,20 +293,35 @@ def populate_all(
     incremental: bool = True,
     verbose: bool = True,
     progress_callback: Optional[callable] = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    profile: bool = False,
+    rebuild: bool = False,
 ) -> Dict[str, Dict[str, int]]:
     """Populate entire knowledge graph in one command.
 
-    Runs all populators in the correct order:
+    Runs all populators as a dependency graph; a stage starts as soon as
+    the stages it reads from have finished:
     1. Git history (commits, files)
-    2. Code symbols (functions, classes)
+    2. Code symbols (functions, classes) - after git
     3. Tasks (GitHub Issues)
-    4. Plans (Plan Objects)
-    5. Commit-task linking (parse commit messages)
-    6. References (.idlergear/reference/)
-    7. Wiki (GitHub wiki)
-    8. Person (git authors, contributors)
-    9. Dependencies (requirements.txt, package.json, etc.)
-    10. Tests (test files and test cases)
+    4. Plans (Plan Objects) - after tasks, code and references
+    5. Commit-task linking (parse commit messages) - after git and tasks
+    6. References (.idlergear/reference/) - after code and tasks
+    7. Wiki (GitHub wiki) - after code and tasks
+    8. Person (git authors, contributors) - after git and code
+    9. Dependencies (requirements.txt, package.json, etc.) - after code
+    10. Tests (test files and test cases) - after code
+
+    Independent stages run in worker threads so their git, file and
+    network I/O overlaps, while every database statement goes through a
+    single serialized Kuzu connection.
+
+    With ``rebuild=True`` the graph is built from scratch in a new database
+    next to the live one: git history and code symbols are staged as CSV
+    files and bulk loaded with ``COPY FROM`` (see ``bulk_stages``), the
+    remaining populators run against the new database, and it then replaces
+    the live database in a single rename. Readers keep seeing the old graph
+    until the swap, and if any stage fails the old graph is kept.
 
     Args:
         project_path: Path to project (defaults to current directory)
@@ -50,11 +331,21 @@ def populate_all(
         incremental: Skip already-indexed data
         verbose: Print progress messages
         progress_callback: Optional callback function for progress events.
-                          Called with dict like {"step": "git", "status": "complete", "commits": 100}
+                          Called with dict like {"step": "git", "status": "complete", "commits": 100}.
+                          Completed and failed stages also carry "elapsed" (seconds)
+                          and "items_per_sec".
+        max_workers: Maximum number of stages running at once (1 = sequential)
+        profile: Include per-stage timings under ``results["profile"]``
+                 (see ``format_profile``)
+        rebuild: Rebuild the whole graph with bulk loading (implies
+                 ``incremental=False``)
 
     Returns:
         Dictionary with results from each populator
 
+    Raises:
+        RuntimeError: If any stage of a rebuild fails
+
     Example:
         >>> from idlergear.graph import populate_all
         >>> results = populate_all(max_commits=100, incremental=True)
@@ -67,6 +358,14 @@ def populate_all(
     """
     project_path = project_path or Path.cwd()
     db = get_database()
+    print_lock = threading.Lock()
+
+    if rebuild:
+        live = db
+        build_path = live.db_path.with_name(live.db_path.name + ".rebuild")
+        _remove_database(build_path)  # Left over from an interrupted rebuild
+        db = GraphDatabase(build_path)
+        incremental = False
 
     # Helper function to emit progress
     def emit_progress(step: str, status: str, **kwargs):
@@ -89,198 +388,183 @@ def populate_all(
         if verbose:
             print(f"Schema already exists or error: {e}")
 
-    results = {}
-
-    # 1. Populate git history
-    emit_progress("git", "started")
-    if verbose:
-        print("\n📊 Populating git history...")
-    try:
-        git_pop = GitPopulator(db, project_path)
-        results["git"] = git_pop.populate(
-            max_commits=max_commits, incremental=incremental
-        )
-        emit_progress("git", "complete", **results["git"])
-        if verbose:
-            print(f"  ✓ {results['git']['commits']} commits indexed")
-            print(f"  ✓ {results['git']['files']} files indexed")
-            print(f"  ✓ {results['git']['relationships']} relationships created")
-    except Exception as e:
-        emit_progress("git", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["git"] = {"error": str(e)}
-
-    # 2. Populate code symbols
-    emit_progress("code", "started")
-    if verbose:
-        print("\n📊 Populating code symbols...")
-    try:
-        code_pop = CodePopulator(db, project_path)
-        results["code"] = code_pop.populate_directory(
-            code_directory, incremental=incremental
-        )
-        emit_progress("code", "complete", **results["code"])
-        if verbose:
-            print(f"  ✓ {results['code']['files']} files scanned")
-            print(f"  ✓ {results['code']['symbols']} symbols indexed")
-            print(f"  ✓ {results['code']['relationships']} relationships created")
-    except Exception as e:
-        emit_progress("code", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["code"] = {"error": str(e)}
-
-    # 3. Populate tasks
-    emit_progress("tasks", "started")
-    if verbose:
-        print("\n📊 Populating tasks...")
-    try:
-        task_pop = TaskPopulator(db, project_path)
-        results["tasks"] = task_pop.populate(state="all", incremental=incremental)
-        emit_progress("tasks", "complete", **results["tasks"])
-        if verbose:
-            print(f"  ✓ {results['tasks']['tasks']} tasks indexed")
-            if results["tasks"].get("updated", 0) > 0:
-                print(f"  ✓ {results['tasks']['updated']} tasks updated")
-    except Exception as e:
-        emit_progress("tasks", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["tasks"] = {"error": str(e)}
-
-    # 4. Populate plans
-    emit_progress("plans", "started")
-    if verbose:
-        print("\n📊 Populating plans...")
-    try:
-        plan_pop = PlanPopulator(db, project_path)
-        results["plans"] = plan_pop.populate(incremental=incremental)
-        emit_progress("plans", "complete", **results["plans"])
-        if verbose:
-            print(f"  ✓ {results['plans']['plans']} plans indexed")
-            if results["plans"].get("updated", 0) > 0:
-                print(f"  ✓ {results['plans']['updated']} plans updated")
-            print(f"  ✓ {results['plans']['relationships']} relationships created")
-    except Exception as e:
-        emit_progress("plans", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["plans"] = {"error": str(e)}
-
-    # 5. Link commits to tasks
-    emit_progress("links", "started")
-    if verbose:
-        print("\n📊 Linking commits to tasks...")
-    try:
-        linker = CommitTaskLinker(db, project_path)
-        results["links"] = linker.link_all(incremental=incremental)
-        emit_progress("links", "complete", **results["links"])
-        if verbose:
-            print(f"  ✓ {results['links']['links_created']} commit-task links created")
-            print(f"  ✓ {results['links']['tasks_linked']} tasks linked")
-            print(f"  ✓ {results['links']['commits_linked']} commits linked")
-    except Exception as e:
-        emit_progress("links", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["links"] = {"error": str(e)}
-
-    # 6. Populate references
-    emit_progress("references", "started")
-    if verbose:
-        print("\n📊 Populating references...")
-    try:
-        ref_pop = ReferencePopulator(db, project_path)
-        results["references"] = ref_pop.populate(incremental=incremental)
-        emit_progress("references", "complete", **results["references"])
-        if verbose:
-            print(f"  ✓ {results['references']['references']} references indexed")
-            if results["references"].get("updated", 0) > 0:
-                print(f"  ✓ {results['references']['updated']} references updated")
-            print(f"  ✓ {results['references']['relationships']} code links created")
-    except Exception as e:
-        emit_progress("references", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["references"] = {"error": str(e)}
-
-    # 7. Populate wiki
-    emit_progress("wiki", "started")
-    if verbose:
-        print("\n📊 Populating wiki documentation...")
-    try:
-        wiki_pop = WikiPopulator(db, wiki_url=wiki_url)
-        results["wiki"] = wiki_pop.populate(incremental=incremental)
-        emit_progress("wiki", "complete", **results["wiki"])
-        if verbose:
-            print(f"  ✓ {results['wiki']['documents']} wiki pages indexed")
-            if results["wiki"].get("updated", 0) > 0:
-                print(f"  ✓ {results['wiki']['updated']} pages updated")
-            print(f"  ✓ {results['wiki']['relationships']} code links created")
-    except Exception as e:
-        emit_progress("wiki", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["wiki"] = {"error": str(e)}
-
-    # 8. Populate persons (contributors)
-    emit_progress("persons", "started")
-    if verbose:
-        print("\n📊 Populating persons (contributors)...")
-    try:
-        person_pop = PersonPopulator(db, project_path)
-        results["persons"] = person_pop.populate(
-            incremental=incremental, calculate_ownership=True
-        )
-        emit_progress("persons", "complete", **results["persons"])
-        if verbose:
-            print(f"  ✓ {results['persons']['persons']} contributors indexed")
-            print(f"  ✓ {results['persons']['authored']} commit authorships linked")
-            print(f"  ✓ {results['persons']['owns']} file ownerships calculated")
-    except Exception as e:
-        emit_progress("persons", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["persons"] = {"error": str(e)}
-
-    # 9. Populate dependencies
-    emit_progress("dependencies", "started")
-    if verbose:
-        print("\n📊 Populating dependencies...")
-    try:
-        dep_pop = DependencyPopulator(db, project_path)
-        results["dependencies"] = dep_pop.populate(incremental=incremental)
-        emit_progress("dependencies", "complete", **results["dependencies"])
-        if verbose:
-            print(f"  ✓ {results['dependencies']['dependencies']} dependencies indexed")
-            print(
-                f"  ✓ {results['dependencies']['relationships']} file-dependency links created"
+    stages = [
+        Stage(
+            "git",
+            "Populating git history",
+            (),
+            lambda db: GitPopulator(db, project_path).populate(
+                max_commits=max_commits, incremental=incremental
+            ),
+            lambda r: [
+                f"{r['commits']} commits indexed",
+                f"{r['files']} files indexed",
+                f"{r['relationships']} relationships created",
+            ],
+            "commits",
+        ),
+        Stage(
+            "code",
+            "Populating code symbols",
+            ("git",),
+            lambda db: CodePopulator(db, project_path).populate_directory(
+                code_directory, incremental=incremental
+            ),
+            lambda r: [
+                f"{r['files']} files scanned",
+                f"{r['symbols']} symbols indexed",
+                f"{r['relationships']} relationships created",
+            ],
+            "files",
+        ),
+        Stage(
+            "tasks",
+            "Populating tasks",
+            (),
+            lambda db: TaskPopulator(db, project_path).populate(
+                state="all", incremental=incremental
+            ),
+            lambda r: [f"{r['tasks']} tasks indexed"]
+            + ([f"{r['updated']} tasks updated"] if r.get("updated", 0) > 0 else []),
+            "tasks",
+        ),
+        Stage(
+            "plans",
+            "Populating plans",
+            ("tasks", "code", "references"),
+            lambda db: PlanPopulator(db, project_path).populate(incremental=incremental),
+            lambda r: [f"{r['plans']} plans indexed"]
+            + ([f"{r['updated']} plans updated"] if r.get("updated", 0) > 0 else [])
+            + [f"{r['relationships']} relationships created"],
+            "plans",
+        ),
+        Stage(
+            "links",
+            "Linking commits to tasks",
+            ("git", "tasks"),
+            lambda db: CommitTaskLinker(db, project_path).link_all(incremental=incremental),
+            lambda r: [
+                f"{r['links_created']} commit-task links created",
+                f"{r['tasks_linked']} tasks linked",
+                f"{r['commits_linked']} commits linked",
+            ],
+            "links_created",
+        ),
+        Stage(
+            "references",
+            "Populating references",
+            ("code", "tasks"),
+            lambda db: ReferencePopulator(db, project_path).populate(incremental=incremental),
+            lambda r: [f"{r['references']} references indexed"]
+            + ([f"{r['updated']} references updated"] if r.get("updated", 0) > 0 else [])
+            + [f"{r['relationships']} code links created"],
+            "references",
+        ),
+        Stage(
+            "wiki",
+            "Populating wiki documentation",
+            ("code", "tasks"),
+            lambda db: WikiPopulator(db, wiki_url=wiki_url).populate(incremental=incremental),
+            lambda r: [f"{r['documents']} wiki pages indexed"]
+            + ([f"{r['updated']} pages updated"] if r.get("updated", 0) > 0 else [])
+            + [f"{r['relationships']} code links created"],
+            "documents",
+        ),
+        Stage(
+            "persons",
+            "Populating persons (contributors)",
+            ("git", "code"),
+            lambda db: PersonPopulator(db, project_path).populate(
+                incremental=incremental, calculate_ownership=True
+            ),
+            lambda r: [
+                f"{r['persons']} contributors indexed",
+                f"{r['authored']} commit authorships linked",
+                f"{r['owns']} file ownerships calculated",
+            ],
+            "persons",
+        ),
+        Stage(
+            "dependencies",
+            "Populating dependencies",
+            ("code",),
+            lambda db: DependencyPopulator(db, project_path).populate(incremental=incremental),
+            lambda r: [
+                f"{r['dependencies']} dependencies indexed",
+                f"{r['relationships']} file-dependency links created",
+            ],
+            "dependencies",
+        ),
+        Stage(
+            "tests",
+            "Populating tests",
+            ("code",),
+            lambda db: TestPopulator(db, project_path).populate(
+                incremental=incremental, link_coverage=True
+            ),
+            lambda r: [
+                f"{r['tests']} tests indexed",
+                f"{r['covers']} coverage links created",
+            ],
+            "tests",
+        ),
+    ]
+    if rebuild:
+        staging_dir = Path(tempfile.mkdtemp(prefix="graph-staging-", dir=build_path.parent))
+        stager = BulkStager(db, staging_dir)
+        stages = bulk_stages(stages, stager, project_path, max_commits, code_directory)
+    by_name = {stage.name: stage for stage in stages}
+
+    def on_event(name: str, status: str, payload: Dict[str, Any]):
+        emit_progress(name, status, **payload)
+        if not verbose or status == "started":
+            return
+        # Print each stage's block atomically once it finishes
+        stage = by_name[name]
+        if status == "error":
+            lines = [f"  ✗ Error: {payload['error']}"]
+        else:
+            lines = [f"  ✓ {line}" for line in stage.summary(payload)]
+        with print_lock:
+            print(f"\n📊 {stage.title}... ({payload['elapsed']:.2f}s)")
+            print("\n".join(lines))
+
+    started = time.perf_counter()
+    if rebuild:
+        swapped = False
+        try:
+            results, timings = run_stages(
+                stages, db, max_workers=max_workers, on_event=on_event
             )
-    except Exception as e:
-        emit_progress("dependencies", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["dependencies"] = {"error": str(e)}
-
-    # 10. Populate tests
-    emit_progress("tests", "started")
-    if verbose:
-        print("\n📊 Populating tests...")
-    try:
-        test_pop = TestPopulator(db, project_path)
-        results["tests"] = test_pop.populate(
-            incremental=incremental, link_coverage=True
+            # A partial graph would silently lose whatever the stage adds
+            failed = [name for name, result in results.items() if "error" in result]
+            if failed:
+                raise RuntimeError(
+                    "Graph rebuild failed; keeping the existing graph: "
+                    + "; ".join(f"{n}: {results[n]['error']}" for n in failed)
+                )
+            db.close()
+            replace_database(live, build_path)
+            swapped = True
+            # The linker's watermark describes the new database
+            suffix = CommitTaskLinker.WATERMARK_SUFFIX
+            watermark = build_path.with_name(build_path.name + suffix)
+            if watermark.exists():
+                os.replace(watermark, live.db_path.with_name(live.db_path.name + suffix))
+            emit_progress("swap", "complete")
+            if verbose:
+                print("\n✓ Rebuilt graph swapped into place")
+        finally:
+            stager.close()
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            if not swapped:
+                db.close()
+            _remove_database(build_path)
+    else:
+        results, timings = run_stages(
+            stages, db, max_workers=max_workers, on_event=on_event
         )
-        emit_progress("tests", "complete", **results["tests"])
-        if verbose:
-            print(f"  ✓ {results['tests']['tests']} tests indexed")
-            print(f"  ✓ {results['tests']['covers']} coverage links created")
-    except Exception as e:
-        emit_progress("tests", "error", error=str(e))
-        if verbose:
-            print(f"  ✗ Error: {e}")
-        results["tests"] = {"error": str(e)}
+    wall_time = time.perf_counter() - started
 
     # Summary
     if verbose:
@@ -320,15 +604,48 @@ def populate_all(
 
         print(f"\nTotal nodes indexed: ~{total_nodes:,}")
         print(f"Total relationships created: ~{total_relationships:,}")
+        print(f"Completed in {wall_time:.2f}s")
         print("\n💡 Query the graph with:")
         print("  idlergear_graph_query_task(task_id=N)")
         print("  idlergear_graph_query_file(file_path='...')")
         print("  idlergear_graph_query_symbols(pattern='...')")
         print("=" * 60)
 
+    if profile:
+        results["profile"] = {"wall_time": wall_time, "stages": timings}
+
     return results
 
 
+def populate_in_daemon(
+    project_path: Optional[Path] = None,
+    timeout: float = 3600.0,
+    **options: Any,
+) -> Dict[str, Dict[str, int]]:
+    """Ask the daemon to run populate_all as the graph's single writer.
+
+    Used when ``populate_all`` fails with ``GraphLockedError`` because the
+    daemon already holds the database open for writing.
+
+    Args:
+        project_path: Project root (auto-detected if not provided)
+        timeout: Seconds to wait for the daemon to finish
+        **options: populate_all keyword arguments (max_commits,
+                   code_directory, incremental, profile, rebuild)
+
+    Returns:
+        Dictionary with results from each populator
+
+    Raises:
+        DaemonNotRunning: If no daemon is running for the project
+    """
+    from idlergear.config import find_idlergear_root
+    from idlergear.daemon.client import call_daemon
+
+    root = project_path or find_idlergear_root() or Path.cwd()
+    return call_daemon(root, "graph.populate", options, timeout=timeout)
+
+
 def populate_all_quick(
     project_path: Optional[Path] = None,
 ) -> Dict[str, Dict[str, int]]:
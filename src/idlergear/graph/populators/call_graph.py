@@ -0,0 +1,500 @@
+"""Resolve call sites and imports into CALLS / IMPORTS edges.
+
+TreeSitterParser reports, per file, the import bindings (local name ->
+module/symbol) and the call sites (name, receiver, line). This module turns
+those into graph edges entirely in memory:
+
+1. A SymbolIndex holds every Symbol in the graph, keyed by file and name.
+2. Each file's imports are resolved to repository files (Python modules,
+   relative JS/TS modules, Rust ``crate``/``self``/``super`` paths and Go
+   packages under the ``go.mod`` module path), forming an import table.
+3. Each call is attributed to its innermost enclosing symbol and its callee
+   looked up through the import table, the file (or Go package) itself, the
+   enclosing class for ``self``/``this`` calls, and finally a unique method
+   name across the repository.
+
+Calls into code outside the repository (stdlib, third-party packages) are
+left unresolved rather than guessed.
+"""
+
+from __future__ import annotations
+
+import posixpath
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Receivers that refer to the enclosing class/type
+SELF_RECEIVERS = {"self", "this", "cls", "Self"}
+
+JS_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+RUST_CRATE_ROOTS = ("lib.rs", "main.rs")
+
+
+class SymbolRef(NamedTuple):
+    """A Symbol node as seen by the resolver."""
+
+    id: str
+    name: str
+    file_path: str
+    type: str
+    line_start: int
+    line_end: int
+
+    @property
+    def short_name(self) -> str:
+        """Name without the owning class (``Greeter.greet`` -> ``greet``)."""
+        return self.name.rsplit(".", 1)[-1]
+
+    @property
+    def owner(self) -> Optional[str]:
+        """Owning class/type of a method, if any."""
+        return self.name.rsplit(".", 1)[0] if "." in self.name else None
+
+
+class ImportTarget(NamedTuple):
+    """What an import binding refers to.
+
+    ``symbol`` is None when the binding names a module (or Go package).
+    """
+
+    files: Tuple[str, ...]
+    symbol: Optional[str]
+
+
+class ImportTable(NamedTuple):
+    """Resolved imports of one file."""
+
+    bindings: Dict[str, ImportTarget]
+    wildcards: List[ImportTarget]
+    files: Dict[str, int]  # Imported file -> line of first import
+
+
+class SymbolIndex:
+    """In-memory index of symbols by file, name and method name."""
+
+    def __init__(self, symbols: Iterable[SymbolRef] = ()):
+        self._by_file: Dict[str, Dict[str, List[SymbolRef]]] = defaultdict(dict)
+        self._methods: Dict[str, List[SymbolRef]] = defaultdict(list)
+        for symbol in symbols:
+            self.add(symbol)
+
+    def add(self, symbol: SymbolRef) -> None:
+        """Add a symbol to the index."""
+        self._by_file[symbol.file_path].setdefault(symbol.name, []).append(symbol)
+        if symbol.owner:
+            self._methods[symbol.short_name].append(symbol)
+
+    def remove_file(self, file_path: str) -> None:
+        """Drop all symbols of a file."""
+        by_name = self._by_file.pop(file_path, {})
+        for symbols in by_name.values():
+            for symbol in symbols:
+                if symbol.owner:
+                    methods = self._methods[symbol.short_name]
+                    methods[:] = [m for m in methods if m.file_path != file_path]
+
+    def has_file(self, file_path: str) -> bool:
+        """Check whether any symbols are indexed for a file."""
+        return bool(self._by_file.get(file_path))
+
+    def files_in_dir(self, directory: str, suffix: str = "") -> Tuple[str, ...]:
+        """Indexed files directly inside a directory."""
+        return tuple(
+            sorted(
+                path
+                for path in self._by_file
+                if posixpath.dirname(path) == directory and path.endswith(suffix)
+            )
+        )
+
+    def lookup(self, files: Iterable[str], name: str) -> List[SymbolRef]:
+        """Symbols with exactly this (possibly qualified) name in the files."""
+        found = []
+        for path in files:
+            found.extend(self._by_file.get(path, {}).get(name, ()))
+        return found
+
+    def methods_named(self, name: str) -> List[SymbolRef]:
+        """All methods with this short name."""
+        return self._methods.get(name, [])
+
+    def enclosing(self, file_path: str, line: int) -> Optional[SymbolRef]:
+        """Innermost symbol of a file whose line range contains line."""
+        best = None
+        for symbols in self._by_file.get(file_path, {}).values():
+            for symbol in symbols:
+                if symbol.line_start <= line <= symbol.line_end and (
+                    best is None
+                    or symbol.line_end - symbol.line_start < best.line_end - best.line_start
+                ):
+                    best = symbol
+        return best
+
+
+class CallGraphBuilder:
+    """Resolve a file's imports and calls against a SymbolIndex.
+
+    Example:
+        >>> builder = CallGraphBuilder(repo_path, index)
+        >>> table = builder.import_table("src/app.py", "python", parsed["imports"])
+        >>> edges = builder.resolve_calls("src/app.py", "python", parsed["calls"], table)
+    """
+
+    def __init__(self, repo_path: Path, index: SymbolIndex):
+        self.repo_path = Path(repo_path)
+        self.index = index
+        self._exists_cache: Dict[str, bool] = {}
+        self._go_modules: Dict[str, Optional[Tuple[str, str]]] = {}
+
+    # ------------------------------------------------------------------
+    # Imports
+    # ------------------------------------------------------------------
+
+    def import_table(
+        self, rel_path: str, language: str, imports: List[Dict]
+    ) -> ImportTable:
+        """Resolve the import bindings of a file.
+
+        Args:
+            rel_path: File containing the imports (relative, POSIX)
+            language: Parser language name
+            imports: Parsed imports carrying ``bindings``
+
+        Returns:
+            ImportTable with resolved bindings and imported files
+        """
+        bindings: Dict[str, ImportTarget] = {}
+        wildcards: List[ImportTarget] = []
+        files: Dict[str, int] = {}
+
+        for import_info in imports:
+            for binding in import_info.get("bindings", ()):
+                target = self._resolve_binding(rel_path, language, binding)
+                if target is None:
+                    continue
+                for path in target.files:
+                    if path != rel_path:
+                        files.setdefault(path, import_info.get("line", 0))
+                name = binding.get("name")
+                if name == "*":
+                    wildcards.append(target)
+                elif name:
+                    bindings[name] = target
+
+        return ImportTable(bindings, wildcards, files)
+
+    def _resolve_binding(
+        self, rel_path: str, language: str, binding: Dict
+    ) -> Optional[ImportTarget]:
+        module = binding.get("module") or ""
+        symbol = binding.get("symbol")
+
+        if language == "python":
+            return self._resolve_python(rel_path, module, symbol)
+        if language in ("javascript", "typescript"):
+            path = self._resolve_js_module(rel_path, module)
+            return ImportTarget((path,), symbol) if path else None
+        if language == "rust":
+            return self._resolve_rust(rel_path, module, symbol)
+        if language == "go":
+            files = self._resolve_go_package(rel_path, module)
+            return ImportTarget(files, None) if files else None
+        return None
+
+    def _exists(self, rel_path: str) -> bool:
+        if rel_path not in self._exists_cache:
+            self._exists_cache[rel_path] = (
+                self.index.has_file(rel_path) or (self.repo_path / rel_path).is_file()
+            )
+        return self._exists_cache[rel_path]
+
+    def _python_module_file(self, module_path: str) -> Optional[str]:
+        """Find ``a/b.py`` or ``a/b/__init__.py`` for a module path."""
+        for candidate in (f"{module_path}.py", f"{module_path}/__init__.py"):
+            candidate = posixpath.normpath(candidate)
+            if not candidate.startswith("..") and self._exists(candidate):
+                return candidate
+        return None
+
+    def _python_package_init(self, directory: str) -> Optional[str]:
+        candidate = posixpath.join(directory, "__init__.py") if directory else "__init__.py"
+        return candidate if self._exists(candidate) else None
+
+    def _python_module(self, rel_path: str, module: str) -> Optional[str]:
+        level = len(module) - len(module.lstrip("."))
+        dotted = module[level:].replace(".", "/")
+        from_dir = posixpath.dirname(rel_path)
+
+        if level:
+            base = from_dir
+            for _ in range(level - 1):
+                base = posixpath.dirname(base)
+            if not dotted:
+                return self._python_package_init(base)
+            return self._python_module_file(posixpath.join(base, dotted))
+
+        for root in (from_dir, "", "src"):
+            found = self._python_module_file(posixpath.join(root, dotted) if root else dotted)
+            if found:
+                return found
+        return None
+
+    def _resolve_python(
+        self, rel_path: str, module: str, symbol: Optional[str]
+    ) -> Optional[ImportTarget]:
+        if symbol:
+            # from pkg import mod binds a submodule when one exists
+            submodule = module + symbol if module.endswith(".") else f"{module}.{symbol}"
+            path = self._python_module(rel_path, submodule)
+            if path:
+                return ImportTarget((path,), None)
+        path = self._python_module(rel_path, module)
+        return ImportTarget((path,), symbol) if path else None
+
+    def _resolve_js_module(self, rel_path: str, module: str) -> Optional[str]:
+        if not module.startswith("."):
+            return None  # Package import (node_modules)
+        base = posixpath.normpath(posixpath.join(posixpath.dirname(rel_path), module))
+        candidates = [base] if base.endswith(JS_EXTENSIONS) else []
+        candidates += [base + ext for ext in JS_EXTENSIONS]
+        candidates += [posixpath.join(base, "index" + ext) for ext in JS_EXTENSIONS]
+        for candidate in candidates:
+            if not candidate.startswith("..") and self._exists(candidate):
+                return candidate
+        return None
+
+    def _rust_crate_dir(self, rel_path: str) -> str:
+        directory = posixpath.dirname(rel_path)
+        probe = directory
+        while True:
+            if any(
+                self._exists(posixpath.join(probe, root) if probe else root)
+                for root in RUST_CRATE_ROOTS
+            ):
+                return probe
+            if not probe:
+                return directory
+            probe = posixpath.dirname(probe)
+
+    @staticmethod
+    def _rust_self_dir(rel_path: str) -> str:
+        directory, name = posixpath.split(rel_path)
+        if name in RUST_CRATE_ROOTS or name == "mod.rs":
+            return directory
+        return posixpath.join(directory, name[: -len(".rs")])
+
+    def _rust_module_file(
+        self, base: str, segments: List[str], crate_dir: str
+    ) -> Optional[str]:
+        """File defining the module at base/segments."""
+        if not segments:
+            if base == crate_dir:
+                for root in RUST_CRATE_ROOTS:
+                    candidate = posixpath.join(base, root) if base else root
+                    if self._exists(candidate):
+                        return candidate
+                return None
+            candidates = [base + ".rs", posixpath.join(base, "mod.rs")]
+        else:
+            path = posixpath.join(base, *segments) if base else posixpath.join(*segments)
+            candidates = [path + ".rs", posixpath.join(path, "mod.rs")]
+        for candidate in candidates:
+            if self._exists(candidate):
+                return candidate
+        return None
+
+    def rust_module(self, rel_path: str, path: str) -> Optional[str]:
+        """Resolve a Rust module path (``crate::a``, ``super::b``, ``c``) to a file."""
+        segments = [s for s in path.split("::") if s]
+        crate_dir = self._rust_crate_dir(rel_path)
+        if not segments:
+            return None
+
+        if segments[0] == "crate":
+            bases = [crate_dir]
+            segments = segments[1:]
+        elif segments[0] in ("self", "super"):
+            base = self._rust_self_dir(rel_path)
+            if segments[0] == "self":
+                segments = segments[1:]
+            while segments and segments[0] == "super":
+                base = posixpath.dirname(base)
+                segments = segments[1:]
+            bases = [base]
+        else:
+            # Child module declared with `mod`, or a crate-root module
+            bases = [self._rust_self_dir(rel_path), crate_dir]
+
+        for base in bases:
+            found = self._rust_module_file(base, segments, crate_dir)
+            if found:
+                return found
+        return None
+
+    def _resolve_rust(
+        self, rel_path: str, module: str, symbol: Optional[str]
+    ) -> Optional[ImportTarget]:
+        if symbol:
+            path = self.rust_module(rel_path, f"{module}::{symbol}" if module else symbol)
+            if path:
+                return ImportTarget((path,), None)
+        path = self.rust_module(rel_path, module) if module else None
+        return ImportTarget((path,), symbol) if path else None
+
+    def _go_module(self, rel_path: str) -> Optional[Tuple[str, str]]:
+        """Return (module path, module dir) from the nearest go.mod."""
+        directory = posixpath.dirname(rel_path)
+        if directory in self._go_modules:
+            return self._go_modules[directory]
+
+        result = None
+        probe = directory
+        while True:
+            go_mod = self.repo_path / probe / "go.mod"
+            if go_mod.is_file():
+                try:
+                    for line in go_mod.read_text(encoding="utf-8").splitlines():
+                        if line.startswith("module "):
+                            result = (line.split()[1].strip('"'), probe)
+                            break
+                except OSError:
+                    pass
+                break
+            if not probe:
+                break
+            probe = posixpath.dirname(probe)
+
+        self._go_modules[directory] = result
+        return result
+
+    def _resolve_go_package(self, rel_path: str, module: str) -> Tuple[str, ...]:
+        go_module = self._go_module(rel_path)
+        if go_module is None:
+            return ()
+        module_path, module_dir = go_module
+        if module == module_path:
+            directory = module_dir
+        elif module.startswith(module_path + "/"):
+            rest = module[len(module_path) + 1 :]
+            directory = posixpath.join(module_dir, rest) if module_dir else rest
+        else:
+            return ()  # Standard library or external module
+        return self.index.files_in_dir(directory, ".go")
+
+    # ------------------------------------------------------------------
+    # Calls
+    # ------------------------------------------------------------------
+
+    def _local_files(self, rel_path: str, language: str) -> Tuple[str, ...]:
+        if language == "go":
+            # Everything in a Go package shares one namespace
+            return self.index.files_in_dir(posixpath.dirname(rel_path), ".go") or (rel_path,)
+        return (rel_path,)
+
+    def resolve_calls(
+        self,
+        rel_path: str,
+        language: str,
+        calls: List[Dict],
+        table: ImportTable,
+    ) -> Counter:
+        """Resolve call sites of a file.
+
+        Args:
+            rel_path: File containing the calls
+            language: Parser language name
+            calls: Parsed call sites
+            table: The file's resolved imports
+
+        Returns:
+            Counter of (caller symbol id, callee symbol id) -> number of calls
+        """
+        edges: Counter = Counter()
+        local_files = self._local_files(rel_path, language)
+
+        for call in calls:
+            caller = self.index.enclosing(rel_path, call["line"])
+            if caller is None:
+                continue  # Module-level code has no Symbol to hang the edge on
+            for callee in self._resolve_callee(
+                call["name"], call.get("receiver"), caller, rel_path, language, local_files, table
+            ):
+                edges[(caller.id, callee.id)] += 1
+
+        return edges
+
+    def _resolve_callee(
+        self,
+        name: str,
+        receiver: Optional[str],
+        caller: SymbolRef,
+        rel_path: str,
+        language: str,
+        local_files: Tuple[str, ...],
+        table: ImportTable,
+    ) -> List[SymbolRef]:
+        index = self.index
+
+        if receiver is None:
+            target = table.bindings.get(name)
+            if target is not None:
+                symbol = target.symbol if target.symbol not in (None, "default") else name
+                return index.lookup(target.files, symbol)
+            found = index.lookup(local_files, name)
+            if found:
+                return found
+            for wildcard in table.wildcards:
+                found = index.lookup(wildcard.files, name)
+                if found:
+                    return found
+            return []
+
+        if receiver in SELF_RECEIVERS:
+            owner = caller.owner or (caller.name if caller.type == "class" else None)
+            if owner:
+                found = index.lookup(local_files, f"{owner}.{name}")
+                if found:
+                    return found
+            return self._unique_method(name, rel_path)
+
+        target = table.bindings.get(receiver)
+        if target is not None:
+            if target.symbol is None:
+                return index.lookup(target.files, name)
+            return index.lookup(target.files, f"{target.symbol}.{name}")
+
+        # Class/type defined locally: Greeter.create(), Foo::new()
+        found = index.lookup(local_files, f"{receiver}.{name}")
+        if found:
+            return found
+
+        if language == "rust" and receiver != "?":
+            module_file = self.rust_module(rel_path, receiver)
+            if module_file:
+                return index.lookup((module_file,), name)
+
+        return self._unique_method(name, rel_path)
+
+    def _unique_method(self, name: str, rel_path: str) -> List[SymbolRef]:
+        """Best guess for obj.name() when obj's type is unknown.
+
+        Accepts a method only if it is the single candidate in the caller's
+        file, else in its directory, else in the whole repository.
+        """
+        if name.startswith("__"):
+            return []
+        methods = self.index.methods_named(name)
+        if not methods:
+            return []
+        directory = posixpath.dirname(rel_path)
+        for scope in (
+            [m for m in methods if m.file_path == rel_path],
+            [m for m in methods if posixpath.dirname(m.file_path) == directory],
+            methods,
+        ):
+            if len(scope) == 1:
+                return scope
+            if scope:
+                return []
+        return []
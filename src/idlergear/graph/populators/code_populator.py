@@ -4,8 +4,10 @@ import hashlib
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Set
 
-from ..database import GraphDatabase
+from ..bulk import BulkStager
+from ..database import GraphDatabase, bumps_generation
 from ..parsers import TreeSitterParser
+from .call_graph import CallGraphBuilder, SymbolIndex, SymbolRef
 
 try:
     from ..vector import VectorCodeIndex
@@ -22,7 +24,9 @@ class CodePopulator:
     for multi-language support (Python, JavaScript, TypeScript, Rust, Go, C/C++, Java).
     Falls back to Python AST for unsupported files.
 
-    Creates Symbol nodes with CONTAINS relationships to File nodes.
+    Creates Symbol nodes with CONTAINS relationships to File nodes. After
+    parsing, a resolution stage links call sites and imports into CALLS
+    (Symbol -> Symbol) and IMPORTS (File -> File) edges; see ``resolve_calls``.
 
     Example:
         >>> from idlergear.graph import get_database
@@ -50,6 +54,9 @@ class CodePopulator:
         self.repo_path = repo_path or Path.cwd()
         self._processed_files: Set[str] = set()
         self._parser = TreeSitterParser()  # Multi-language parser
+        # Parsed imports/calls awaiting resolution, by relative path
+        self._pending_links: Dict[str, Dict[str, Any]] = {}
+        self._symbol_index: Optional[SymbolIndex] = None
 
         # Initialize vector search if enabled and available
         self.vector_index = vector_index
@@ -62,6 +69,7 @@ class CodePopulator:
                 logging.warning(f"Failed to initialize vector search: {e}")
                 self.vector_index = None
 
+    @bumps_generation
     def populate_directory(
         self,
         directory: str = "src",
@@ -107,12 +115,104 @@ class CodePopulator:
                     relationships_added += result["relationships"]
                     self._processed_files.add(rel_path)
 
+        links = self.resolve_calls()
+
         return {
             "files": files_processed,
             "symbols": symbols_added,
-            "relationships": relationships_added,
+            "relationships": relationships_added + links["imports"] + links["calls"],
+            "calls": links["calls"],
         }
 
+    def stage_directory(
+        self,
+        stager: BulkStager,
+        directory: str = "src",
+        extensions: Optional[List[str]] = None,
+    ) -> Dict[str, int]:
+        """Stage a directory's symbols for a bulk rebuild instead of inserting them.
+
+        Stages the File, Symbol, CONTAINS, IMPORTS and CALLS rows that
+        ``populate_directory(incremental=False)`` would create in an empty
+        database. Call sites are resolved in memory against the staged
+        symbols.
+
+        Args:
+            stager: Stager collecting rows for ``COPY FROM``
+            directory: Directory to scan (relative to repo_path)
+            extensions: File extensions to process (default: all supported languages)
+
+        Returns:
+            Dictionary with counts: files, symbols, relationships, calls
+        """
+        if extensions is None:
+            extensions = list(TreeSitterParser.SUPPORTED_LANGUAGES.keys())
+
+        scan_path = self.repo_path / directory
+        if not scan_path.exists():
+            return {"files": 0, "symbols": 0, "relationships": 0, "calls": 0}
+
+        # Nothing is in the database yet; resolve against what gets staged
+        self._symbol_index = SymbolIndex()
+        files_processed = 0
+        symbols_added = 0
+        relationships_added = 0
+
+        for ext in extensions:
+            for file_path in scan_path.rglob(f"*{ext}"):
+                rel_path = str(file_path.relative_to(self.repo_path))
+                parse_result = self._parser.parse_file(file_path)
+                if not parse_result:
+                    continue
+
+                language = parse_result.get("language", "unknown")
+                if not stager.has_node("File", rel_path):
+                    stager.add_node("File", self._file_row(rel_path, file_path, language))
+
+                inserted = []
+                for symbol in self._convert_treesitter_symbols(parse_result["symbols"], rel_path):
+                    symbol_id = f"{rel_path}:{symbol['line_start']}:{symbol['name']}"
+                    if not stager.add_node("Symbol", self._symbol_row(symbol_id, symbol)):
+                        continue
+                    symbols_added += 1
+                    inserted.append((symbol_id, symbol))
+                    self._symbol_index.add(SymbolRef(
+                        symbol_id, symbol["name"], rel_path, symbol["type"],
+                        symbol["line_start"], symbol["line_end"],
+                    ))
+                    if stager.add_edge("CONTAINS", rel_path, symbol_id):
+                        relationships_added += 1
+
+                self._index_vectors(rel_path, inserted)
+                self._queue_links(rel_path, parse_result)
+                files_processed += 1
+                self._processed_files.add(rel_path)
+
+        _, import_rows, call_rows = self._link_rows()
+        imports = 0
+        for row in import_rows:
+            # Targets outside the scanned tree become placeholder files
+            stager.add_node("File", {"path": row["target"], "file_exists": False})
+            if stager.add_edge(
+                "IMPORTS",
+                row["source"],
+                row["target"],
+                {"line": row["line"], "import_type": row["kind"]},
+            ):
+                imports += 1
+        calls = sum(
+            stager.add_edge("CALLS", row["caller"], row["callee"], {"call_count": row["count"]})
+            for row in call_rows
+        )
+
+        return {
+            "files": files_processed,
+            "symbols": symbols_added,
+            "relationships": relationships_added + imports + calls,
+            "calls": calls,
+        }
+
+    @bumps_generation
     def populate_file(self, file_path: str) -> Dict[str, int]:
         """Populate graph with symbols from a single file.
 
@@ -126,10 +226,130 @@ class CodePopulator:
         if not full_path.exists():
             return {"symbols": 0, "relationships": 0}
 
-        return self._populate_file(file_path, full_path) or {
+        result = self._populate_file(file_path, full_path) or {
             "symbols": 0,
             "relationships": 0,
         }
+        links = self.resolve_calls()
+        result["relationships"] += links["imports"] + links["calls"]
+        return result
+
+    @bumps_generation
+    def remove_file(self, rel_path: str, deleted: bool = False) -> int:
+        """Drop a file's symbols and outgoing imports from the graph.
+
+        The File node itself is kept so commit history edges survive.
+
+        Args:
+            rel_path: Relative path to the file
+            deleted: Also mark the File node as no longer existing
+
+        Returns:
+            Number of symbols removed
+        """
+        conn = self.db.get_connection()
+        self._queue_callers_of(rel_path)
+        result = conn.execute(
+            "MATCH (f:File {path: $path})-[:CONTAINS]->(s:Symbol) RETURN COUNT(s)",
+            {"path": rel_path},
+        )
+        removed = result.get_next()[0] if result.has_next() else 0
+
+        conn.execute(
+            "MATCH (f:File {path: $path})-[:CONTAINS]->(s:Symbol) DETACH DELETE s",
+            {"path": rel_path},
+        )
+        conn.execute(
+            "MATCH (f:File {path: $path})-[r:IMPORTS]->(:File) DELETE r",
+            {"path": rel_path},
+        )
+        if deleted:
+            conn.execute(
+                "MATCH (f:File {path: $path}) SET f.file_exists = false",
+                {"path": rel_path},
+            )
+        if self.vector_index:
+            self.vector_index.delete_by_file(rel_path)
+        if self._symbol_index is not None:
+            self._symbol_index.remove_file(rel_path)
+        self._processed_files.discard(rel_path)
+        self._pending_links.pop(rel_path, None)
+        return removed
+
+    def _queue_callers_of(self, rel_path: str) -> None:
+        """Re-queue files whose CALLS point into rel_path.
+
+        Removing a file's symbols detaches incoming CALLS edges, so the
+        callers are re-parsed and re-resolved along with the file.
+        """
+        result = self.db.get_connection().execute(
+            """
+            MATCH (f:File)-[:CONTAINS]->(:Symbol)-[:CALLS]->(s:Symbol)
+            WHERE s.file_path = $path AND f.path <> $path
+            RETURN DISTINCT f.path
+            """,
+            {"path": rel_path},
+        )
+        while result.has_next():
+            caller_path = result.get_next()[0]
+            if caller_path in self._pending_links:
+                continue
+            parse_result = self._parser.parse_file(self.repo_path / caller_path)
+            if parse_result:
+                self._queue_links(caller_path, parse_result)
+
+    @bumps_generation
+    def apply_changes(self, changes: List[Any]) -> Dict[str, int]:
+        """Update the graph for a batch of file changes.
+
+        Args:
+            changes: Objects with ``path`` and ``kind`` attributes (created,
+                modified, deleted), e.g. daemon ``FileChange`` batches
+
+        Returns:
+            Dictionary with counts: files, symbols, removed
+        """
+        extensions = tuple(TreeSitterParser.SUPPORTED_LANGUAGES.keys())
+        files = symbols = removed = 0
+
+        for change in changes:
+            if not change.path.endswith(extensions):
+                continue
+            removed += self.remove_file(change.path, deleted=change.kind == "deleted")
+            if change.kind == "deleted":
+                continue
+
+            full_path = self.repo_path / change.path
+            result = self._populate_file(change.path, full_path)
+            if result:
+                self._update_file_hash(change.path, full_path)
+                files += 1
+                symbols += result["symbols"]
+                self._processed_files.add(change.path)
+
+        links = self.resolve_calls()
+        return {
+            "files": files,
+            "symbols": symbols,
+            "removed": removed,
+            "calls": links["calls"],
+        }
+
+    def _update_file_hash(self, rel_path: str, full_path: Path) -> None:
+        """Refresh the stored hash/size of an existing File node."""
+        content = full_path.read_bytes()
+        self.db.get_connection().execute(
+            """
+            MATCH (f:File {path: $path})
+            SET f.hash = $hash, f.size = $size, f.lines = $lines, f.file_exists = true
+            """,
+            {
+                "path": rel_path,
+                "hash": hashlib.sha1(content).hexdigest()[:8],
+                "size": len(content),
+                "lines": len(content.splitlines()),
+            },
+        )
 
     def _should_skip_file(self, rel_path: str, full_path: Path) -> bool:
         """Check if file should be skipped in incremental mode."""
@@ -165,7 +385,6 @@ class CodePopulator:
 
         # Extract symbols, imports, comments
         symbols = self._convert_treesitter_symbols(parse_result["symbols"], rel_path)
-        imports = parse_result.get("imports", [])
         comments = parse_result.get("comments", [])
         language = parse_result.get("language", "unknown")
 
@@ -175,7 +394,7 @@ class CodePopulator:
         # Insert symbols and create relationships
         symbols_added = 0
         relationships_added = 0
-        vector_indexed_symbols = []  # Collect for batch vector indexing
+        inserted = []  # Collect for batch vector indexing
 
         for symbol in symbols:
             # Create symbol ID: file_path:line_number:name
@@ -184,24 +403,40 @@ class CodePopulator:
             # Insert symbol
             if self._insert_symbol(symbol_id, symbol):
                 symbols_added += 1
+                if self._symbol_index is not None:
+                    self._symbol_index.add(SymbolRef(
+                        symbol_id, symbol["name"], rel_path, symbol["type"],
+                        symbol["line_start"], symbol["line_end"],
+                    ))
 
                 # Create CONTAINS relationship
                 if self._create_contains_relationship(rel_path, symbol_id):
                     relationships_added += 1
 
-                # Collect for vector indexing
-                if self.vector_index and "code" in symbol:
-                    vector_indexed_symbols.append({
-                        "symbol_id": symbol_id,
-                        "name": symbol["name"],
-                        "type": symbol["type"],
-                        "code": symbol.get("code", symbol.get("docstring", "")),
-                        "file_path": rel_path,
-                        "line_start": symbol["line_start"],
-                        "line_end": symbol["line_end"],
-                    })
-
-        # Batch index symbols in vector database
+                inserted.append((symbol_id, symbol))
+
+        self._index_vectors(rel_path, inserted)
+
+        # Imports and calls are linked once every file's symbols are known
+        self._queue_links(rel_path, parse_result)
+
+        return {"symbols": symbols_added, "relationships": relationships_added}
+
+    def _index_vectors(self, rel_path: str, symbols: List[tuple]) -> None:
+        """Batch index (symbol_id, symbol) pairs in the vector database."""
+        vector_indexed_symbols = [
+            {
+                "symbol_id": symbol_id,
+                "name": symbol["name"],
+                "type": symbol["type"],
+                "code": symbol.get("code", symbol.get("docstring", "")),
+                "file_path": rel_path,
+                "line_start": symbol["line_start"],
+                "line_end": symbol["line_end"],
+            }
+            for symbol_id, symbol in symbols
+            if "code" in symbol
+        ]
         if self.vector_index and vector_indexed_symbols:
             try:
                 self.vector_index.index_symbols_batch(
@@ -211,22 +446,125 @@ class CodePopulator:
                 import logging
                 logging.warning(f"Failed to vector index {rel_path}: {e}")
 
-        # Process imports and create IMPORTS relationships
-        for import_info in imports:
-            # Handle both tree-sitter format (text-based) and AST format (module-based)
-            if "module" in import_info:
-                # AST format
-                resolved_path = self._resolve_import_path(
-                    import_info["module"], rel_path
-                )
-                if resolved_path and self._create_imports_relationship(
-                    rel_path, resolved_path, import_info["line"]
-                ):
-                    relationships_added += 1
-            # For tree-sitter format, we would need to parse the import text
-            # For now, skip tree-sitter imports (can be enhanced later)
+    def _queue_links(self, rel_path: str, parse_result: Dict[str, Any]) -> None:
+        """Remember a file's imports and call sites for resolve_calls()."""
+        self._pending_links[rel_path] = {
+            "language": parse_result.get("language", "unknown"),
+            "imports": parse_result.get("imports", []),
+            "calls": parse_result.get("calls", []),
+        }
 
-        return {"symbols": symbols_added, "relationships": relationships_added}
+    def _load_symbol_index(self) -> SymbolIndex:
+        """Load every Symbol in the graph into an in-memory index."""
+        if self._symbol_index is None:
+            result = self.db.get_connection().execute("""
+                MATCH (s:Symbol)
+                RETURN s.id, s.name, s.file_path, s.type, s.line_start, s.line_end
+            """)
+            index = SymbolIndex()
+            while result.has_next():
+                row = result.get_next()
+                if row[2] and row[4] is not None and row[5] is not None:
+                    index.add(SymbolRef(*row))
+            self._symbol_index = index
+        return self._symbol_index
+
+    def _link_rows(self) -> tuple:
+        """Resolve the queued imports and call sites in memory.
+
+        Callees are looked up in per-file import tables plus a global symbol
+        index. Clears the queue.
+
+        Returns:
+            Tuple of (queued paths, import rows, call rows)
+        """
+        builder = CallGraphBuilder(self.repo_path, self._load_symbol_index())
+        import_rows = []
+        call_counts: Dict[tuple, int] = {}
+
+        for rel_path, links in self._pending_links.items():
+            table = builder.import_table(rel_path, links["language"], links["imports"])
+            for target, line in table.files.items():
+                import_rows.append({
+                    "source": rel_path,
+                    "target": target,
+                    "line": line,
+                    "kind": links["language"],
+                })
+            edges = builder.resolve_calls(
+                rel_path, links["language"], links["calls"], table
+            )
+            for edge, count in edges.items():
+                call_counts[edge] = call_counts.get(edge, 0) + count
+
+        paths = list(self._pending_links)
+        self._pending_links = {}
+        call_rows = [
+            {"caller": caller, "callee": callee, "count": count}
+            for (caller, callee), count in call_counts.items()
+        ]
+        return paths, import_rows, call_rows
+
+    @bumps_generation
+    def resolve_calls(self) -> Dict[str, int]:
+        """Resolve queued imports and call sites into graph edges.
+
+        Callees are looked up in memory (per-file import tables plus a
+        global symbol index) and the resulting IMPORTS and CALLS edges are
+        written in bulk, replacing any previous outgoing edges of the
+        queued files.
+
+        Returns:
+            Dictionary with counts: imports, calls
+        """
+        if not self._pending_links:
+            return {"imports": 0, "calls": 0}
+
+        paths, import_rows, call_rows = self._link_rows()
+
+        conn = self.db.get_connection()
+        conn.execute(
+            """
+            MATCH (f:File)-[:CONTAINS]->(:Symbol)-[r:CALLS]->(:Symbol)
+            WHERE f.path IN $paths
+            DELETE r
+            """,
+            {"paths": paths},
+        )
+        conn.execute(
+            "MATCH (f:File)-[r:IMPORTS]->(:File) WHERE f.path IN $paths DELETE r",
+            {"paths": paths},
+        )
+
+        if import_rows:
+            conn.execute(
+                """
+                UNWIND $rows AS row
+                MERGE (t:File {path: row.target})
+                ON CREATE SET t.file_exists = false
+                """,
+                {"rows": import_rows},
+            )
+            conn.execute(
+                """
+                UNWIND $rows AS row
+                MATCH (a:File {path: row.source}), (b:File {path: row.target})
+                CREATE (a)-[:IMPORTS {line: row.line, import_type: row.kind}]->(b)
+                """,
+                {"rows": import_rows},
+            )
+
+        if call_rows:
+            conn.execute(
+                """
+                UNWIND $rows AS row
+                MATCH (a:Symbol {id: row.caller}), (b:Symbol {id: row.callee})
+                CREATE (a)-[:CALLS {call_count: row.count}]->(b)
+                """,
+                {"rows": call_rows},
+            )
+
+        return {"imports": len(import_rows), "calls": len(call_rows)}
 
 
     def _convert_treesitter_symbols(
@@ -277,26 +615,47 @@ class CodePopulator:
         exists = result.get_next()[0] > 0 if result.has_next() else False
 
         if not exists:
-            # Create file node
-            stat = full_path.stat()
-            size = stat.st_size
-            lines = len(full_path.read_text().splitlines())
-
+            conn.execute(
+                """
+                CREATE (f:File {
+                    path: $path,
+                    language: $language,
+                    size: $size,
+                    lines: $lines,
+                    last_modified: timestamp($last_modified),
+                    file_exists: $file_exists,
+                    hash: $hash
+                })
+                """,
+                self._file_row(rel_path, full_path, language),
+            )
+
+    def _file_row(self, rel_path: str, full_path: Path, language: str) -> Dict[str, Any]:
+        """Build the File node properties for a source file."""
+        stat = full_path.stat()
+        content = full_path.read_bytes()
+        return {
+            "path": rel_path,
+            "language": language,
+            "size": stat.st_size,
+            "lines": len(full_path.read_text().splitlines()),
+            "last_modified": "1970-01-01T00:00:00",
+            "file_exists": True,
             # Calculate file hash
-            content = full_path.read_bytes()
-            file_hash = hashlib.sha1(content).hexdigest()[:8]
-
-            conn.execute(f"""
-                CREATE (f:File {{
-                    path: '{rel_path}',
-                    language: '{language}',
-                    size: {size},
-                    lines: {lines},
-                    last_modified: timestamp('1970-01-01T00:00:00'),
-                    file_exists: true,
-                    hash: '{file_hash}'
-                }})
-            """)
+            "hash": hashlib.sha1(content).hexdigest()[:8],
+        }
+
+    def _symbol_row(self, symbol_id: str, symbol: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the Symbol node properties for a converted symbol."""
+        return {
+            "id": symbol_id,
+            "name": symbol["name"],
+            "type": symbol["type"],
+            "file_path": symbol["file_path"],
+            "line_start": symbol["line_start"],
+            "line_end": symbol["line_end"],
+            "docstring": symbol["docstring"],
+        }
 
     def _escape_cypher_string(self, value: str) -> str:
         """Escape string value for Cypher query.
@@ -317,18 +676,11 @@ class CodePopulator:
         """
         conn = self.db.get_connection()
 
-        # Escape all string values for Cypher
-        safe_id = self._escape_cypher_string(symbol_id)
-        safe_name = self._escape_cypher_string(symbol["name"])
-        safe_type = self._escape_cypher_string(symbol["type"])
-        safe_file_path = self._escape_cypher_string(symbol["file_path"])
-        safe_docstring = self._escape_cypher_string(symbol["docstring"])
-
         # Check if exists
-        result = conn.execute(f"""
-            MATCH (s:Symbol {{id: '{safe_id}'}})
-            RETURN COUNT(s) AS count
-        """)
+        result = conn.execute(
+            "MATCH (s:Symbol {id: $id}) RETURN COUNT(s) AS count",
+            {"id": symbol_id},
+        )
 
         exists = result.get_next()[0] > 0 if result.has_next() else False
 
@@ -336,17 +688,20 @@ class CodePopulator:
             return False  # Already exists
 
         # Insert symbol
-        conn.execute(f"""
-            CREATE (s:Symbol {{
-                id: '{safe_id}',
-                name: '{safe_name}',
-                type: '{safe_type}',
-                file_path: '{safe_file_path}',
-                line_start: {symbol["line_start"]},
-                line_end: {symbol["line_end"]},
-                docstring: '{safe_docstring}'
-            }})
-        """)
+        conn.execute(
+            """
+            CREATE (s:Symbol {
+                id: $id,
+                name: $name,
+                type: $type,
+                file_path: $file_path,
+                line_start: $line_start,
+                line_end: $line_end,
+                docstring: $docstring
+            })
+            """,
+            self._symbol_row(symbol_id, symbol),
+        )
 
         return True
 
@@ -1,10 +1,13 @@
 """Links commits to tasks by parsing commit messages."""
 
+import json
+import os
 import re
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List, Set
+from typing import Optional, Dict, List
 
-from ..database import GraphDatabase
+from ..database import GraphDatabase, bumps_generation
 
 
 class CommitTaskLinker:
@@ -33,9 +36,15 @@ class CommitTaskLinker:
         # "Closes #123", "Fixes #456", "Resolves #789"
         r'(?:[Cc]lose[sd]?|[Ff]ix(?:e[sd])?|[Rr]esolve[sd]?)\s+#(\d+)',
         # Standalone "#123" (but not in URLs or other contexts)
-        r'(?:^|\s)#(\d+)(?:\s|,|$)',
+        r'(?:^|\s)#(\d+)(?=\s|,|$)',
     ]
 
+    # All patterns in one pass over the message; one group per pattern
+    TASK_REF = re.compile("|".join(f"(?:{pattern})" for pattern in PATTERNS))
+
+    # Linker progress is kept next to the database, like its generation
+    WATERMARK_SUFFIX = ".links"
+
     def __init__(self, db: GraphDatabase, project_path: Optional[Path] = None):
         """Initialize commit-task linker.
 
@@ -45,61 +54,137 @@ class CommitTaskLinker:
         """
         self.db = db
         self.project_path = project_path or Path.cwd()
-        self._linked_pairs: Set[tuple[str, int]] = set()
-
+        db_path = getattr(db, "db_path", None)
+        self._watermark_path = (
+            Path(db_path).with_name(Path(db_path).name + self.WATERMARK_SUFFIX)
+            if db_path
+            else None
+        )
+
+    @bumps_generation
     def link_all(self, incremental: bool = True) -> Dict[str, int]:
-        """Link all commits to tasks by parsing commit messages.
+        """Link commits to tasks by parsing commit messages.
+
+        In incremental mode only commits newer than the watermark left by
+        the previous run are scanned, plus earlier references to tasks that
+        were not in the graph yet. The watermark (latest commit timestamp
+        scanned, plus the commit and link counts it covered) is discarded
+        and every commit rescanned when the counts show that commits arrived
+        out of order or links were lost, e.g. after a rebuild.
 
         Args:
-            incremental: If True, skip already-linked commit-task pairs
+            incremental: If True, only scan commits added since the last run
 
         Returns:
-            Dictionary with counts: links_created, tasks_linked, commits_linked
+            Dictionary with counts: links_created, tasks_linked,
+            commits_linked, commits_scanned
         """
         conn = self.db.get_connection()
 
-        # Get all commits from database
         try:
-            commits_result = conn.execute("""
-                MATCH (c:Commit)
-                RETURN c.hash as hash, c.message as message
-            """)
+            total_commits = self._count(conn, "MATCH (c:Commit) RETURN count(c)")
+            total_links = self._count(conn, "MATCH ()-[r:IMPLEMENTED_IN]->() RETURN count(r)")
+            watermark = self._load_watermark() if incremental else None
+            commits = None
+            if (
+                watermark
+                and watermark["links"] == total_links
+                and watermark["commits"] <= total_commits
+            ):
+                commits = self._fetch_commits(conn, watermark["timestamp"])
+                if watermark["commits"] + len(commits) != total_commits:
+                    commits = None  # Some commits predate the watermark
+            if commits is None:
+                commits = self._fetch_commits(conn)
         except Exception as e:
             print(f"Error fetching commits: {e}")
-            return {"links_created": 0, "tasks_linked": 0, "commits_linked": 0}
-
-        links_created = 0
-        commits_linked_set = set()
-        tasks_linked_set = set()
-
-        commits = commits_result.get_as_df()
-        for _, row in commits.iterrows():
-            commit_hash = row['hash']
-            message = row['message']
-
-            # Extract task IDs from commit message
-            task_ids = self._extract_task_ids(message)
-
-            for task_id in task_ids:
-                # Skip if already linked (incremental mode)
-                if incremental and self._is_linked(commit_hash, task_id):
-                    continue
-
-                # Create IMPLEMENTED_IN relationship
-                if self._link_commit_to_task(commit_hash, task_id):
-                    links_created += 1
-                    commits_linked_set.add(commit_hash)
-                    tasks_linked_set.add(task_id)
-
+            return {
+                "links_created": 0,
+                "tasks_linked": 0,
+                "commits_linked": 0,
+                "commits_scanned": 0,
+            }
+
+        rows = [
+            {"task_id": task_id, "hash": commit_hash}
+            for commit_hash, message, _ in commits
+            for task_id in self._extract_task_ids(message)
+        ]
+        if watermark:
+            rows += watermark.get("pending", [])
+        # A statement does not see its own CREATEs; drop duplicate pairs
+        rows = [dict(pair) for pair in dict.fromkeys(tuple(row.items()) for row in rows)]
+
+        created = []
+        pending = []
+        if rows:
+            try:
+                created = self._link_commits_to_tasks(conn, rows)
                 # Infer MODIFIES relationships (Task → File via Commit)
-                self._infer_task_file_relationships(task_id, commit_hash)
+                self._infer_task_file_relationships(conn, rows)
+                pending = self._missing_tasks(conn, rows)
+            except Exception as e:
+                print(f"Error linking commits to tasks: {e}")
+                rows = None  # Leave the watermark alone so the next run retries
+
+        if rows is not None:
+            timestamps = [ts for _, _, ts in commits if ts is not None]
+            if watermark:
+                timestamps.append(datetime.fromisoformat(watermark["timestamp"]))
+            self._save_watermark({
+                "timestamp": max(timestamps).isoformat() if timestamps else None,
+                "commits": total_commits,
+                "links": total_links + len(created),
+                "pending": pending,
+            })
 
         return {
-            "links_created": links_created,
-            "tasks_linked": len(tasks_linked_set),
-            "commits_linked": len(commits_linked_set),
+            "links_created": len(created),
+            "tasks_linked": len({task_id for task_id, _ in created}),
+            "commits_linked": len({commit_hash for _, commit_hash in created}),
+            "commits_scanned": len(commits),
         }
 
+    @staticmethod
+    def _count(conn, query: str) -> int:
+        result = conn.execute(query)
+        return result.get_next()[0] if result.has_next() else 0
+
+    def _fetch_commits(self, conn, since: Optional[str] = None) -> List[tuple]:
+        """Return (hash, message, timestamp) of commits newer than ``since``."""
+        if since is None:
+            result = conn.execute(
+                "MATCH (c:Commit) RETURN c.hash, c.message, c.timestamp"
+            )
+        else:
+            result = conn.execute(
+                """
+                MATCH (c:Commit) WHERE c.timestamp > $since
+                RETURN c.hash, c.message, c.timestamp
+                """,
+                {"since": datetime.fromisoformat(since)},
+            )
+        commits = []
+        while result.has_next():
+            commits.append(tuple(result.get_next()))
+        return commits
+
+    def _load_watermark(self) -> Optional[Dict]:
+        if self._watermark_path is None:
+            return None
+        try:
+            watermark = json.loads(self._watermark_path.read_text())
+            return watermark if watermark.get("timestamp") else None
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _save_watermark(self, watermark: Dict) -> None:
+        if self._watermark_path is None:
+            return
+        tmp = self._watermark_path.with_name(self._watermark_path.name + ".tmp")
+        tmp.write_text(json.dumps(watermark))
+        os.replace(tmp, self._watermark_path)
+
     def _extract_task_ids(self, message: str) -> List[int]:
         """Extract task IDs from commit message.
 
@@ -113,113 +198,75 @@ class CommitTaskLinker:
             return []
 
         task_ids = []
-        for pattern in self.PATTERNS:
-            matches = re.finditer(pattern, message)
-            for match in matches:
-                try:
-                    task_id = int(match.group(1))
-                    if task_id not in task_ids:
-                        task_ids.append(task_id)
-                except (ValueError, IndexError):
-                    continue
+        for match in self.TASK_REF.finditer(message):
+            task_id = int(next(group for group in match.groups() if group))
+            if task_id not in task_ids:
+                task_ids.append(task_id)
 
         return task_ids
 
-    def _is_linked(self, commit_hash: str, task_id: int) -> bool:
-        """Check if commit is already linked to task."""
-        conn = self.db.get_connection()
-
-        try:
-            result = conn.execute("""
-                MATCH (t:Task {id: $task_id})-[:IMPLEMENTED_IN]->(c:Commit {hash: $hash})
-                RETURN count(*) as count
-            """, {"task_id": task_id, "hash": commit_hash})
-
-            if result.has_next():
-                count = result.get_next()[0]
-                return count > 0
-        except Exception:
-            pass
-
-        return False
-
-    def _link_commit_to_task(self, commit_hash: str, task_id: int) -> bool:
-        """Create IMPLEMENTED_IN relationship between task and commit.
+    def _link_commits_to_tasks(self, conn, rows: List[Dict]) -> List[tuple]:
+        """Create missing IMPLEMENTED_IN relationships in one statement.
 
         Args:
-            commit_hash: Git commit hash
-            task_id: Task ID
+            conn: Database connection
+            rows: {"task_id", "hash"} pairs; pairs whose task or commit is
+                  not in the graph are skipped
 
         Returns:
-            True if link created successfully
+            (task_id, commit_hash) of the links created
         """
-        conn = self.db.get_connection()
-
-        try:
-            # Check if both nodes exist
-            task_exists = conn.execute(
-                "MATCH (t:Task {id: $id}) RETURN t",
-                {"id": task_id}
-            ).has_next()
-
-            commit_exists = conn.execute(
-                "MATCH (c:Commit {hash: $hash}) RETURN c",
-                {"hash": commit_hash}
-            ).has_next()
-
-            if not task_exists or not commit_exists:
-                return False
-
-            # Create relationship
-            conn.execute("""
-                MATCH (t:Task {id: $task_id}), (c:Commit {hash: $hash})
-                CREATE (t)-[:IMPLEMENTED_IN]->(c)
-            """, {"task_id": task_id, "hash": commit_hash})
-
-            return True
-        except Exception as e:
-            print(f"Error linking task {task_id} to commit {commit_hash}: {e}")
-            return False
-
-    def _infer_task_file_relationships(self, task_id: int, commit_hash: str) -> None:
+        result = conn.execute(
+            """
+            UNWIND $rows AS row
+            MATCH (t:Task {id: row.task_id}), (c:Commit {hash: row.hash})
+            WHERE NOT EXISTS { MATCH (t)-[:IMPLEMENTED_IN]->(c) }
+            CREATE (t)-[:IMPLEMENTED_IN]->(c)
+            RETURN t.id, c.hash
+            """,
+            {"rows": rows},
+        )
+        created = []
+        while result.has_next():
+            created.append(tuple(result.get_next()))
+        return created
+
+    def _missing_tasks(self, conn, rows: List[Dict]) -> List[Dict]:
+        """Return the rows whose task is not in the graph (yet)."""
+        result = conn.execute(
+            """
+            UNWIND $rows AS row
+            OPTIONAL MATCH (t:Task {id: row.task_id})
+            WITH row, t WHERE t IS NULL
+            RETURN DISTINCT row.task_id, row.hash
+            """,
+            {"rows": rows},
+        )
+        missing = []
+        while result.has_next():
+            task_id, commit_hash = result.get_next()
+            missing.append({"task_id": task_id, "hash": commit_hash})
+        return missing
+
+    def _infer_task_file_relationships(self, conn, rows: List[Dict]) -> None:
         """Infer MODIFIES relationships from Task to Files via Commit.
 
         If a task is implemented in a commit, and that commit changes files,
         create MODIFIES relationships from the task to those files.
 
         Args:
-            task_id: Task ID
-            commit_hash: Git commit hash
+            conn: Database connection
+            rows: {"task_id", "hash"} pairs to infer from
         """
-        conn = self.db.get_connection()
-
-        try:
-            # Get files changed by this commit
-            files_result = conn.execute("""
-                MATCH (c:Commit {hash: $hash})-[r:CHANGES]->(f:File)
-                RETURN f.path as path, r.status as status
-            """, {"hash": commit_hash})
-
-            files = files_result.get_as_df()
-            for _, row in files.iterrows():
-                file_path = row['path']
-                change_type = row['status']
-
-                # Check if MODIFIES relationship already exists
-                exists = conn.execute("""
-                    MATCH (t:Task {id: $task_id})-[:MODIFIES]->(f:File {path: $path})
-                    RETURN count(*) as count
-                """, {"task_id": task_id, "path": file_path}).get_next()[0] > 0
-
-                if not exists:
-                    # Create MODIFIES relationship
-                    conn.execute("""
-                        MATCH (t:Task {id: $task_id}), (f:File {path: $path})
-                        CREATE (t)-[:MODIFIES {change_type: $change_type}]->(f)
-                    """, {
-                        "task_id": task_id,
-                        "path": file_path,
-                        "change_type": change_type or "modified"
-                    })
-        except Exception as e:
-            print(f"Error inferring file relationships for task {task_id}: {e}")
+        conn.execute(
+            """
+            UNWIND $rows AS row
+            MATCH (t:Task {id: row.task_id})-[:IMPLEMENTED_IN]->(c:Commit {hash: row.hash})
+                  -[r:CHANGES]->(f:File)
+            WITH t.id AS task_id, f.path AS path, min(r.status) AS status
+            MATCH (t:Task {id: task_id}), (f:File {path: path})
+            WHERE NOT EXISTS { MATCH (t)-[:MODIFIES]->(f) }
+            CREATE (t)-[:MODIFIES {change_type: coalesce(status, 'modified')}]->(f)
+            """,
+            {"rows": rows},
+        )
@@ -10,7 +10,7 @@ try:
 except ImportError:
     tomli = None  # type: ignore
 
-from ..database import GraphDatabase
+from ..database import GraphDatabase, bumps_generation
 
 
 class DependencyPopulator:
@@ -46,6 +46,7 @@ class DependencyPopulator:
         self.project_path = project_path or Path.cwd()
         self._processed_deps: Set[str] = set()
 
+    @bumps_generation
     def populate(
         self,
         incremental: bool = True,
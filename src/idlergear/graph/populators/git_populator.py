@@ -6,7 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Set
 
-from ..database import GraphDatabase
+from ..bulk import BulkStager
+from ..database import GraphDatabase, bumps_generation
 from idlergear.git import GitServer, GitCommit
 
 
@@ -33,6 +34,7 @@ class GitPopulator:
         self._processed_commits: Set[str] = set()
         self._processed_files: Set[str] = set()
 
+    @bumps_generation
     def populate(
         self,
         max_commits: int = 100,
@@ -108,10 +110,70 @@ class GitPopulator:
         """)
         return result.get_next()[0] > 0 if result.has_next() else False
 
-    def _insert_commit(self, commit: GitCommit) -> None:
-        """Insert commit node into database."""
-        conn = self.db.get_connection()
+    def stage(
+        self,
+        stager: BulkStager,
+        max_commits: int = 100,
+        since: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """Stage git history for a bulk rebuild instead of inserting it.
+
+        Stages the same commits, files and CHANGES relationships that
+        ``populate(incremental=False)`` would create in an empty database.
+
+        Args:
+            stager: Stager collecting rows for ``COPY FROM``
+            max_commits: Maximum number of commits to process
+            since: Only process commits since this date (e.g., "2025-01-01")
+
+        Returns:
+            Dictionary with counts: commits, files, relationships
+        """
+        commits = self.git.log(
+            repo_path=str(self.repo_path),
+            max_count=max_commits,
+            since=since,
+        )
+
+        commits_added = 0
+        files_added = 0
+        relationships_added = 0
+
+        for commit in commits:
+            if not stager.add_node("Commit", self._commit_row(commit)):
+                continue
+            commits_added += 1
+
+            file_stats = self._get_file_stats(commit.hash)
+            for file_path in commit.files:
+                if not stager.has_node("File", file_path):
+                    file_info = self._get_file_info(file_path)
+                    if file_info and stager.add_node(
+                        "File", self._file_row(file_path, file_info)
+                    ):
+                        files_added += 1
+
+                stats = file_stats.get(file_path, {})
+                if stager.add_edge(
+                    "CHANGES",
+                    commit.hash,
+                    file_path,
+                    {
+                        "insertions": stats.get("insertions", 0),
+                        "deletions": stats.get("deletions", 0),
+                        "status": stats.get("status", "modified"),
+                    },
+                ):
+                    relationships_added += 1
+
+        return {
+            "commits": commits_added,
+            "files": files_added,
+            "relationships": relationships_added,
+        }
 
+    def _commit_row(self, commit: GitCommit) -> Dict[str, Any]:
+        """Build the Commit node properties for a commit."""
         # Parse timestamp
         # Git format: "2026-01-18 10:42:33 -0500"
         # Kuzu format: "2026-01-18T10:42:33" (no timezone)
@@ -126,9 +188,6 @@ class GitPopulator:
         # Replace first space with T for ISO format
         timestamp_str = timestamp_str.replace(" ", "T", 1)
 
-        # Escape quotes and newlines in message for Cypher
-        message = commit.message.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n")
-
         # Get branch name (simplified - just current branch)
         try:
             branch_result = subprocess.run(
@@ -147,42 +206,71 @@ class GitPopulator:
         except subprocess.CalledProcessError:
             branch = "unknown"
 
-        conn.execute(f"""
-            CREATE (c:Commit {{
-                hash: '{commit.hash}',
-                short_hash: '{commit.short_hash}',
-                message: '{message}',
-                author: '{commit.author}',
-                timestamp: timestamp('{timestamp_str}'),
-                branch: '{branch}'
-            }})
-        """)
+        return {
+            "hash": commit.hash,
+            "short_hash": commit.short_hash,
+            "message": commit.message,
+            "author": commit.author,
+            "timestamp": timestamp_str,
+            "branch": branch,
+        }
+
+    def _file_row(self, file_path: str, file_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the File node properties from ``_get_file_info`` output."""
+        return {
+            "path": file_path,
+            "language": file_info.get("language", "unknown"),
+            "size": file_info.get("size", 0),
+            "lines": file_info.get("lines", 0),
+            "last_modified": file_info.get("last_modified", datetime.now().isoformat()),
+            "file_exists": file_info.get("exists", True),
+            "hash": file_info.get("hash", ""),
+        }
+
+    def _insert_commit(self, commit: GitCommit) -> None:
+        """Insert commit node into database."""
+        conn = self.db.get_connection()
+        conn.execute(
+            """
+            CREATE (c:Commit {
+                hash: $hash,
+                short_hash: $short_hash,
+                message: $message,
+                author: $author,
+                timestamp: timestamp($timestamp),
+                branch: $branch
+            })
+            """,
+            self._commit_row(commit),
+        )
 
     def _insert_file(self, file_path: str, file_info: Dict[str, Any]) -> None:
         """Insert or update file node."""
         conn = self.db.get_connection()
 
         # Check if file exists
-        result = conn.execute(f"""
-            MATCH (f:File {{path: '{file_path}'}})
-            RETURN COUNT(f) AS count
-        """)
+        result = conn.execute(
+            "MATCH (f:File {path: $path}) RETURN COUNT(f) AS count",
+            {"path": file_path},
+        )
         exists = result.get_next()[0] > 0 if result.has_next() else False
 
         if not exists:
             # Create new file node
-            timestamp_str = file_info.get("last_modified", datetime.now().isoformat())
-            conn.execute(f"""
-                CREATE (f:File {{
-                    path: '{file_path}',
-                    language: '{file_info.get("language", "unknown")}',
-                    size: {file_info.get("size", 0)},
-                    lines: {file_info.get("lines", 0)},
-                    last_modified: timestamp('{timestamp_str}'),
-                    file_exists: {str(file_info.get("exists", True)).lower()},
-                    hash: '{file_info.get("hash", "")}'
-                }})
-            """)
+            conn.execute(
+                """
+                CREATE (f:File {
+                    path: $path,
+                    language: $language,
+                    size: $size,
+                    lines: $lines,
+                    last_modified: timestamp($last_modified),
+                    file_exists: $file_exists,
+                    hash: $hash
+                })
+                """,
+                self._file_row(file_path, file_info),
+            )
 
     def _create_changes_relationship(
         self,
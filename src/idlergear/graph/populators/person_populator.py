@@ -1,12 +1,22 @@
 """Populates graph database with Person nodes from git commit authors."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, Set
+from typing import Optional, Dict, Any, List, Set
+import json
+import os
 import subprocess
 import re
 
-from ..database import GraphDatabase
+from ..database import GraphDatabase, bumps_generation
+
+# Blame results per file, keyed by the file's blob hash at HEAD
+BLAME_CACHE_FILE = "blame.json"
+BLAME_CACHE_VERSION = 1
+
+# Upper bound on concurrent `git blame` processes
+MAX_BLAME_WORKERS = 8
 
 
 class PersonPopulator:
@@ -35,6 +45,7 @@ class PersonPopulator:
         self.repo_path = repo_path or Path.cwd()
         self._processed_persons: Set[str] = set()
 
+    @bumps_generation
     def populate(
         self,
         incremental: bool = True,
@@ -219,8 +230,21 @@ class PersonPopulator:
 
         return count
 
-    def _calculate_file_ownership(self) -> int:
-        """Calculate file ownership based on git blame data."""
+    def _calculate_file_ownership(self, max_workers: Optional[int] = None) -> int:
+        """Calculate file ownership based on git blame data.
+
+        Blame is computed at HEAD and cached per (path, blob hash), so only
+        files whose committed content changed are re-blamed. Misses run as
+        concurrent ``git blame`` processes (at most ``max_workers``). A file's
+        OWNS edges are rewritten in one batch, and only when they differ
+        from what is already stored.
+
+        Args:
+            max_workers: Maximum concurrent blame processes
+
+        Returns:
+            Number of OWNS relationships written
+        """
         conn = self.db.get_connection()
         count = 0
 
@@ -231,39 +255,144 @@ class PersonPopulator:
             while result.has_next():
                 files.append(result.get_next()[0])
 
+            blobs = self._get_head_blobs()
+            cache = self._load_blame_cache()
+            lines_by_file: Dict[str, Dict[str, int]] = {}
+            to_blame = []
+
             for file_path in files:
-                # Get blame data for file
-                ownership = self._get_file_ownership(file_path)
-
-                # Create OWNS relationships
-                for email, data in ownership.items():
-                    try:
-                        conn.execute("""
-                            MATCH (p:Person {email: $email})
-                            MATCH (f:File {path: $path})
-                            CREATE (p)-[:OWNS {
-                                ownership_percent: $percent,
-                                lines_contributed: $lines
-                            }]->(f)
-                        """, {
-                            "email": email,
-                            "path": file_path,
-                            "percent": data["percent"],
-                            "lines": data["lines"],
-                        })
-                        count += 1
-                    except Exception as e:
-                        print(f"Error creating OWNS relationship for {file_path}: {e}")
+                blob = blobs.get(file_path)
+                if blob is None:
+                    continue  # Not committed, nothing to blame
+                entry = cache.get(file_path)
+                if entry and entry.get("blob") == blob:
+                    lines_by_file[file_path] = entry["lines"]
+                else:
+                    to_blame.append(file_path)
+
+            if to_blame:
+                workers = max_workers or min(MAX_BLAME_WORKERS, os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    for file_path, lines in zip(to_blame, pool.map(self._blame_lines, to_blame)):
+                        if lines is None:
+                            continue  # Blame failed; retry next run
+                        lines_by_file[file_path] = lines
+                        cache[file_path] = {"blob": blobs[file_path], "lines": lines}
+
+            self._save_blame_cache({p: cache[p] for p in files if p in cache})
+            count = self._replace_ownership(lines_by_file)
 
         except Exception as e:
             print(f"Error calculating file ownership: {e}")
 
         return count
 
-    def _get_file_ownership(self, file_path: str) -> Dict[str, Dict[str, Any]]:
-        """Get ownership data for a file using git blame."""
-        ownership = {}
+    def _replace_ownership(self, lines_by_file: Dict[str, Dict[str, int]]) -> int:
+        """Write OWNS edges for files whose stored edges are out of date."""
+        conn = self.db.get_connection()
+
+        persons = set()
+        result = conn.execute("MATCH (p:Person) RETURN p.email")
+        while result.has_next():
+            persons.add(result.get_next()[0])
+
+        existing: Dict[str, List[tuple]] = {}
+        result = conn.execute("""
+            MATCH (p:Person)-[r:OWNS]->(f:File)
+            RETURN f.path, p.email, r.lines_contributed
+        """)
+        while result.has_next():
+            path, email, lines = result.get_next()
+            existing.setdefault(path, []).append((email, lines))
+
+        stale = []
+        rows = []
+        for file_path, lines in lines_by_file.items():
+            ownership = self._ownership_from_lines(lines)
+            wanted = sorted(
+                (email, data["lines"]) for email, data in ownership.items() if email in persons
+            )
+            if sorted(existing.get(file_path, [])) == wanted:
+                continue
+            stale.append(file_path)
+            rows.extend(
+                {
+                    "email": email,
+                    "path": file_path,
+                    "percent": data["percent"],
+                    "lines": data["lines"],
+                }
+                for email, data in ownership.items()
+                if email in persons
+            )
+
+        if stale:
+            conn.execute(
+                "MATCH (:Person)-[r:OWNS]->(f:File) WHERE f.path IN $paths DELETE r",
+                {"paths": stale},
+            )
+        if rows:
+            conn.execute("""
+                UNWIND $rows AS row
+                MATCH (p:Person {email: row.email}), (f:File {path: row.path})
+                CREATE (p)-[:OWNS {
+                    ownership_percent: row.percent,
+                    lines_contributed: row.lines
+                }]->(f)
+            """, {"rows": rows})
+
+        return len(rows)
+
+    def _get_head_blobs(self) -> Dict[str, str]:
+        """Map tracked paths to their blob hash at HEAD."""
+        result = subprocess.run(
+            ["git", "-C", str(self.repo_path), "ls-tree", "-r", "-z", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        blobs = {}
+        if result.returncode != 0:
+            return blobs
+        for record in result.stdout.split("\0"):
+            meta, _, path = record.partition("\t")
+            parts = meta.split()
+            if len(parts) == 3 and parts[1] == "blob":
+                blobs[path] = parts[2]
+        return blobs
+
+    def _blame_cache_path(self) -> Optional[Path]:
+        idlergear_dir = Path(self.repo_path) / ".idlergear"
+        if not idlergear_dir.is_dir():
+            return None  # Don't create .idlergear in repos that don't use it
+        return idlergear_dir / "cache" / BLAME_CACHE_FILE
+
+    def _load_blame_cache(self) -> Dict[str, Dict[str, Any]]:
+        path = self._blame_cache_path()
+        if path is None or not path.exists():
+            return {}
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != BLAME_CACHE_VERSION:
+            return {}
+        return data.get("files", {})
+
+    def _save_blame_cache(self, files: Dict[str, Dict[str, Any]]) -> None:
+        path = self._blame_cache_path()
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".tmp.{os.getpid()}")
+            tmp.write_text(json.dumps({"version": BLAME_CACHE_VERSION, "files": files}))
+            os.replace(tmp, path)
+        except OSError:
+            pass
 
+    def _blame_lines(self, file_path: str) -> Optional[Dict[str, int]]:
+        """Count lines per author email at HEAD, or None if blame fails."""
         try:
             result = subprocess.run(
                 [
@@ -271,40 +400,56 @@ class PersonPopulator:
                     "-C",
                     str(self.repo_path),
                     "blame",
-                    "--line-porcelain",
+                    "--porcelain",
+                    "HEAD",
+                    "--",
                     file_path,
                 ],
                 capture_output=True,
                 text=True,
+                errors="replace",
                 check=False,  # File might not exist or be tracked
             )
+        except OSError:
+            return None
+
+        if result.returncode != 0:
+            return None
+
+        # Porcelain output: a "<sha> <orig> <final> [<count>]" header per
+        # line, author details only the first time a commit appears, then
+        # the line content prefixed by a tab.
+        emails: Dict[str, str] = {}
+        lines_per_commit: Dict[str, int] = {}
+        current = None
+        for line in result.stdout.split("\n"):
+            if line.startswith("\t"):
+                if current:
+                    lines_per_commit[current] = lines_per_commit.get(current, 0) + 1
+            elif line.startswith("author-mail "):
+                match = re.search(r"<(.+?)>", line)
+                if match and current:
+                    emails[current] = match.group(1)
+            else:
+                head = line.split(" ", 1)[0]
+                if len(head) in (40, 64) and all(c in "0123456789abcdef" for c in head):
+                    current = head
+
+        counts: Dict[str, int] = {}
+        for commit, lines in lines_per_commit.items():
+            email = emails.get(commit)
+            if email:
+                counts[email] = counts.get(email, 0) + lines
+        return counts
+
+    @staticmethod
+    def _ownership_from_lines(lines: Dict[str, int]) -> Dict[str, Dict[str, Any]]:
+        total = sum(lines.values())
+        return {
+            email: {"lines": count, "percent": (count / total) * 100.0 if total else 0.0}
+            for email, count in lines.items()
+        }
 
-            if result.returncode != 0:
-                return ownership
-
-            # Parse blame output
-            current_email = None
-            total_lines = 0
-
-            for line in result.stdout.split("\n"):
-                if line.startswith("author-mail"):
-                    # Extract email from <email>
-                    match = re.search(r"<(.+?)>", line)
-                    if match:
-                        current_email = match.group(1)
-                        total_lines += 1
-
-                        if current_email not in ownership:
-                            ownership[current_email] = {"lines": 0, "percent": 0.0}
-
-                        ownership[current_email]["lines"] += 1
-
-            # Calculate percentages
-            if total_lines > 0:
-                for email in ownership:
-                    ownership[email]["percent"] = (ownership[email]["lines"] / total_lines) * 100.0
-
-        except Exception:
-            pass
-
-        return ownership
+    def _get_file_ownership(self, file_path: str) -> Dict[str, Dict[str, Any]]:
+        """Get ownership data for a file using git blame."""
+        return self._ownership_from_lines(self._blame_lines(file_path) or {})
@@ -7,7 +7,7 @@ from typing import Any, Dict, Optional, Set
 from idlergear.config import find_idlergear_root
 from idlergear.plans import list_plans
 
-from ..database import GraphDatabase
+from ..database import GraphDatabase, bumps_generation
 
 
 class PlanPopulator:
@@ -37,6 +37,7 @@ class PlanPopulator:
         self.project_path = project_path or Path.cwd()
         self._processed_plans: Set[str] = set()
 
+    @bumps_generation
     def populate(
         self,
         status: Optional[str] = None,
@@ -6,7 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, List, Set
 
-from ..database import GraphDatabase
+from ..database import GraphDatabase, bumps_generation
 
 
 class ReferencePopulator:
@@ -34,6 +34,7 @@ class ReferencePopulator:
         self.ref_dir = self.project_path / ".idlergear" / "reference"
         self._processed_refs: Set[str] = set()
 
+    @bumps_generation
     def populate(self, incremental: bool = True) -> Dict[str, int]:
         """Populate graph with reference files.
 
@@ -4,7 +4,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, Set
 
-from ..database import GraphDatabase
+from ..database import GraphDatabase, bumps_generation
 from idlergear.tasks import list_tasks
 
 
@@ -32,6 +32,7 @@ class TaskPopulator:
         self.project_path = project_path or Path.cwd()
         self._processed_tasks: Set[int] = set()
 
+    @bumps_generation
     def populate(
         self,
         state: str = "all",
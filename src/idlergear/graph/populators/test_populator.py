@@ -5,7 +5,7 @@ from typing import Optional, Dict, Any, Set, List
 import re
 import ast
 
-from ..database import GraphDatabase
+from ..database import GraphDatabase, bumps_generation
 
 
 class TestPopulator:
@@ -39,6 +39,7 @@ class TestPopulator:
         self.project_path = project_path or Path.cwd()
         self._processed_tests: Set[str] = set()
 
+    @bumps_generation
     def populate(
         self,
         incremental: bool = True,
@@ -7,7 +7,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, List, Set
 
-from ..database import GraphDatabase
+from ..database import GraphDatabase, bumps_generation
 
 
 class WikiPopulator:
@@ -41,6 +41,7 @@ class WikiPopulator:
         self.wiki_path = wiki_path or Path("/tmp/idlergear.wiki")
         self._processed_docs: Set[str] = set()
 
+    @bumps_generation
     def populate(self, incremental: bool = True) -> Dict[str, int]:
         """Populate graph with wiki documentation.
 
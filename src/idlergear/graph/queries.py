@@ -1,6 +1,11 @@
 """Common query patterns for IdlerGear knowledge graph.
 
 Provides token-efficient queries for context retrieval.
+
+Every query binds its values as ``$parameters`` so the query text is
+constant, which lets the database reuse prepared statements and cache
+results (see ``GraphDatabase.cached_rows``). Only variable-length path
+bounds, which Cypher cannot parameterize, are formatted in as integers.
 """
 
 from typing import Any, Optional, List, Dict
@@ -9,6 +14,11 @@ from .database import GraphDatabase
 from .lazy_init import ensure_graph_populated
 
 
+def _rows(db: GraphDatabase, query: str, parameters: Optional[dict] = None) -> List[list]:
+    """Run a read query through the result cache and return its rows."""
+    return db.cached_rows(query, parameters)[1]
+
+
 def query_task_context(db: GraphDatabase, task_id: int) -> Dict[str, Any]:
     """Get token-efficient context for a task.
 
@@ -32,11 +42,11 @@ def query_task_context(db: GraphDatabase, task_id: int) -> Dict[str, Any]:
     # Skip lazy init if db is provided (e.g., in tests)
     ensure_graph_populated(db=db, verbose=False)
 
-    conn = db.get_connection()
-
     # Get full task context (multi-hop query)
-    result = conn.execute(f"""
-        MATCH (t:Task {{id: {task_id}}})
+    rows = _rows(
+        db,
+        """
+        MATCH (t:Task {id: $task_id})
         OPTIONAL MATCH (t)-[:MODIFIES]->(f:File)
         OPTIONAL MATCH (t)-[:IMPLEMENTED_IN]->(c:Commit)
         OPTIONAL MATCH (f)-[:CONTAINS]->(s:Symbol)
@@ -45,12 +55,14 @@ def query_task_context(db: GraphDatabase, task_id: int) -> Dict[str, Any]:
                COLLECT(DISTINCT f.path) AS files,
                COLLECT(DISTINCT c.short_hash) AS commits,
                COLLECT(DISTINCT s.name) AS symbols
-    """)
+        """,
+        {"task_id": task_id},
+    )
 
-    if not result.has_next():
+    if not rows:
         return {}
 
-    row = result.get_next()
+    row = rows[0]
     return {
         "task_id": task_id,
         "title": row[0],
@@ -77,11 +89,11 @@ def query_file_context(db: GraphDatabase, file_path: str) -> Dict[str, Any]:
     # Skip lazy init if db is provided (e.g., in tests)
     ensure_graph_populated(db=db, verbose=False)
 
-    conn = db.get_connection()
-
     # Get file context
-    result = conn.execute(f"""
-        MATCH (f:File {{path: '{file_path}'}})
+    rows = _rows(
+        db,
+        """
+        MATCH (f:File {path: $path})
         OPTIONAL MATCH (t:Task)-[:MODIFIES]->(f)
         OPTIONAL MATCH (f)-[:IMPORTS]->(imported:File)
         OPTIONAL MATCH (f)-[:CONTAINS]->(s:Symbol)
@@ -90,12 +102,14 @@ def query_file_context(db: GraphDatabase, file_path: str) -> Dict[str, Any]:
                COLLECT(DISTINCT t.id) AS tasks,
                COLLECT(DISTINCT imported.path) AS imports,
                COLLECT(DISTINCT s.name) AS symbols
-    """)
+        """,
+        {"path": file_path},
+    )
 
-    if not result.has_next():
+    if not rows:
         return {}
 
-    row = result.get_next()
+    row = rows[0]
     return {
         "file_path": file_path,
         "language": row[0],
@@ -121,42 +135,31 @@ def query_recent_changes(db: GraphDatabase, limit: int = 10) -> List[Dict[str, A
         >>> for change in changes:
         >>>     print(f"{change['hash']}: {change['message']}")
     """
-    conn = db.get_connection()
-
-    # First get recent commits
-    result = conn.execute(f"""
+    # Recent commits with their files in one query
+    rows = _rows(
+        db,
+        """
         MATCH (c:Commit)
+        WITH c ORDER BY c.timestamp DESC LIMIT $limit
+        OPTIONAL MATCH (c)-[:CHANGES]->(f:File)
         RETURN c.short_hash AS hash,
                c.message AS message,
                c.timestamp AS timestamp,
-               c.hash AS commit_hash
-        ORDER BY c.timestamp DESC
-        LIMIT {limit}
-    """)
-
-    changes = []
-    while result.has_next():
-        row = result.get_next()
-        commit_hash = row[3]
-
-        # Get files for this commit
-        files_result = conn.execute(f"""
-            MATCH (c:Commit {{hash: '{commit_hash}'}})-[:CHANGES]->(f:File)
-            RETURN f.path
-        """)
-
-        files = []
-        while files_result.has_next():
-            files.append(files_result.get_next()[0])
-
-        changes.append({
+               COLLECT(f.path) AS files
+        ORDER BY timestamp DESC
+        """,
+        {"limit": limit},
+    )
+
+    return [
+        {
             "hash": row[0],
             "message": row[1],
             "timestamp": row[2],
-            "files": files,
-        })
-
-    return changes
+            "files": [f for f in row[3] if f] if row[3] else [],
+        }
+        for row in rows
+    ]
 
 
 def query_related_files(db: GraphDatabase, file_path: str, max_hops: int = 2) -> List[str]:
@@ -174,20 +177,17 @@ def query_related_files(db: GraphDatabase, file_path: str, max_hops: int = 2) ->
         >>> related = query_related_files(db, "src/idlergear/cli.py")
         >>> print(related)  # ['src/idlergear/tasks.py', 'src/idlergear/backends/...']
     """
-    conn = db.get_connection()
-
     # Find files within N hops via IMPORTS
-    result = conn.execute(f"""
-        MATCH (f1:File {{path: '{file_path}'}})-[:IMPORTS*1..{max_hops}]->(f2:File)
+    rows = _rows(
+        db,
+        f"""
+        MATCH (f1:File {{path: $path}})-[:IMPORTS*1..{int(max_hops)}]->(f2:File)
         RETURN DISTINCT f2.path AS path
-    """)
-
-    related = []
-    while result.has_next():
-        row = result.get_next()
-        related.append(row[0])
+        """,
+        {"path": file_path},
+    )
 
-    return related
+    return [row[0] for row in rows]
 
 
 def query_symbols_by_name(db: GraphDatabase, name_pattern: str, limit: int = 10) -> List[Dict[str, Any]]:
@@ -210,22 +210,23 @@ def query_symbols_by_name(db: GraphDatabase, name_pattern: str, limit: int = 10)
     # Skip lazy init if db is provided (e.g., in tests)
     ensure_graph_populated(db=db, verbose=False)
 
-    conn = db.get_connection()
-
     # Case-insensitive search
-    result = conn.execute(f"""
+    rows = _rows(
+        db,
+        """
         MATCH (s:Symbol)
-        WHERE toLower(s.name) CONTAINS toLower('{name_pattern}')
+        WHERE toLower(s.name) CONTAINS toLower($pattern)
         RETURN s.name AS name,
                s.type AS type,
                s.file_path AS file,
                s.line_start AS line
-        LIMIT {limit}
-    """)
+        LIMIT $limit
+        """,
+        {"pattern": name_pattern, "limit": limit},
+    )
 
     symbols = []
-    while result.has_next():
-        row = result.get_next()
+    for row in rows:
         symbols.append({
             "name": row[0],
             "type": row[1],
@@ -257,11 +258,11 @@ def query_impact_analysis(db: GraphDatabase, symbol_name: str) -> Dict[str, Any]
         >>> impact = query_impact_analysis(db, "process_task")
         >>> print(f"Would affect {len(impact['files'])} files")
     """
-    conn = db.get_connection()
-
     # Find the symbol(s) and trace their impact
-    result = conn.execute(f"""
-        MATCH (s:Symbol {{name: '{symbol_name}'}})
+    rows = _rows(
+        db,
+        """
+        MATCH (s:Symbol {name: $name})
         OPTIONAL MATCH (f:File)-[:CONTAINS]->(s)
         OPTIONAL MATCH (caller:Symbol)-[:CALLS]->(s)
         OPTIONAL MATCH (caller_file:File)-[:CONTAINS]->(caller)
@@ -272,12 +273,14 @@ def query_impact_analysis(db: GraphDatabase, symbol_name: str) -> Dict[str, Any]
             COLLECT(DISTINCT caller.name) AS callers,
             COLLECT(DISTINCT caller_file.path) AS affected_files,
             COLLECT(DISTINCT t.id) AS related_tasks
-    """)
+        """,
+        {"name": symbol_name},
+    )
 
-    if not result.has_next():
+    if not rows:
         return {"symbol": symbol_name, "found": False}
 
-    row = result.get_next()
+    row = rows[0]
     return {
         "symbol": symbol_name,
         "found": True,
@@ -304,12 +307,12 @@ def query_test_coverage(db: GraphDatabase, target: str, target_type: str = "file
         >>> coverage = query_test_coverage(db, "src/idlergear/tasks.py", "file")
         >>> print(f"Covered by {len(coverage['test_files'])} tests")
     """
-    conn = db.get_connection()
-
     if target_type == "file":
         # Find test files that import or reference this file
-        result = conn.execute(f"""
-            MATCH (f:File {{path: '{target}'}})
+        rows = _rows(
+            db,
+            """
+            MATCH (f:File {path: $target})
             OPTIONAL MATCH (test:File)-[:IMPORTS]->(f)
             WHERE test.path CONTAINS 'test_' OR test.path CONTAINS '/tests/'
             OPTIONAL MATCH (test)-[:CONTAINS]->(test_sym:Symbol)
@@ -317,23 +320,29 @@ def query_test_coverage(db: GraphDatabase, target: str, target_type: str = "file
             RETURN DISTINCT
                 COLLECT(DISTINCT test.path) AS test_files,
                 COLLECT(DISTINCT test_sym.name) AS test_functions
-        """)
+            """,
+            {"target": target},
+        )
     else:  # symbol
         # Find test symbols that might reference this symbol
-        result = conn.execute(f"""
-            MATCH (s:Symbol {{name: '{target}'}})
+        rows = _rows(
+            db,
+            """
+            MATCH (s:Symbol {name: $target})
             OPTIONAL MATCH (test_sym:Symbol)-[:CALLS]->(s)
             WHERE toLower(test_sym.name) CONTAINS 'test'
             OPTIONAL MATCH (test_file:File)-[:CONTAINS]->(test_sym)
             RETURN DISTINCT
                 COLLECT(DISTINCT test_file.path) AS test_files,
                 COLLECT(DISTINCT test_sym.name) AS test_functions
-        """)
+            """,
+            {"target": target},
+        )
 
-    if not result.has_next():
+    if not rows:
         return {"target": target, "type": target_type, "test_files": [], "test_functions": []}
 
-    row = result.get_next()
+    row = rows[0]
     return {
         "target": target,
         "type": target_type,
@@ -342,6 +351,34 @@ def query_test_coverage(db: GraphDatabase, target: str, target_type: str = "file
     }
 
 
+def query_file_imports(
+    db: GraphDatabase, importers: List[str], imported: List[str]
+) -> List[tuple]:
+    """Find IMPORTS edges from some files to others.
+
+    Args:
+        db: Graph database instance
+        importers: Paths of the importing files
+        imported: Paths of the imported files
+
+    Returns:
+        List of (importing path, imported path) tuples
+
+    Example:
+        >>> edges = query_file_imports(db, ["tests/test_tasks.py"], ["src/idlergear/tasks.py"])
+    """
+    rows = _rows(
+        db,
+        """
+        MATCH (a:File)-[:IMPORTS]->(b:File)
+        WHERE a.path IN $importers AND b.path IN $imported
+        RETURN DISTINCT a.path, b.path
+        """,
+        {"importers": list(importers), "imported": list(imported)},
+    )
+    return [(row[0], row[1]) for row in rows]
+
+
 def query_change_history(db: GraphDatabase, symbol_name: str) -> List[Dict[str, Any]]:
     """Get all commits that touched a specific symbol.
 
@@ -359,11 +396,11 @@ def query_change_history(db: GraphDatabase, symbol_name: str) -> List[Dict[str,
         >>> for commit in history:
         >>>     print(f"{commit['hash']}: {commit['message']}")
     """
-    conn = db.get_connection()
-
     # Find commits that changed files containing this symbol
-    result = conn.execute(f"""
-        MATCH (s:Symbol {{name: '{symbol_name}'}})
+    rows = _rows(
+        db,
+        """
+        MATCH (s:Symbol {name: $name})
         MATCH (f:File)-[:CONTAINS]->(s)
         MATCH (c:Commit)-[:CHANGES]->(f)
         RETURN DISTINCT
@@ -373,11 +410,12 @@ def query_change_history(db: GraphDatabase, symbol_name: str) -> List[Dict[str,
             c.author_name AS author,
             f.path AS file_path
         ORDER BY c.timestamp DESC
-    """)
+        """,
+        {"name": symbol_name},
+    )
 
     history = []
-    while result.has_next():
-        row = result.get_next()
+    for row in rows:
         history.append({
             "hash": row[0],
             "message": row[1],
@@ -406,21 +444,22 @@ def query_dependency_chain(db: GraphDatabase, file_path: str, max_depth: int = 5
         >>> deps = query_dependency_chain(db, "src/idlergear/mcp_server.py")
         >>> print(f"Depends on {len(deps['dependencies'])} files")
     """
-    conn = db.get_connection()
-
     # Get transitive dependencies via IMPORTS
-    result = conn.execute(f"""
-        MATCH path = (f:File {{path: '{file_path}'}})-[:IMPORTS*1..{max_depth}]->(dep:File)
+    rows = _rows(
+        db,
+        f"""
+        MATCH path = (f:File {{path: $path}})-[:IMPORTS*1..{int(max_depth)}]->(dep:File)
         WITH dep, MIN(length(path)) AS depth
         RETURN DISTINCT
             dep.path AS file,
             depth AS distance
         ORDER BY distance ASC
-    """)
+        """,
+        {"path": file_path},
+    )
 
     dependencies = []
-    while result.has_next():
-        row = result.get_next()
+    for row in rows:
         dependencies.append({
             "file": row[0],
             "distance": row[1],
@@ -446,10 +485,8 @@ def query_orphan_detection(db: GraphDatabase) -> Dict[str, Any]:
         >>> orphans = query_orphan_detection(db)
         >>> print(f"Found {len(orphans['unused_symbols'])} unused symbols")
     """
-    conn = db.get_connection()
-
     # Find symbols with no callers
-    unused_symbols_result = conn.execute("""
+    unused_symbol_rows = _rows(db, """
         MATCH (s:Symbol)
         WHERE NOT exists((s)<-[:CALLS]-())
         AND s.type IN ['function', 'method']
@@ -463,8 +500,7 @@ def query_orphan_detection(db: GraphDatabase) -> Dict[str, Any]:
     """)
 
     unused_symbols = []
-    while unused_symbols_result.has_next():
-        row = unused_symbols_result.get_next()
+    for row in unused_symbol_rows:
         unused_symbols.append({
             "name": row[0],
             "file": row[1],
@@ -473,7 +509,7 @@ def query_orphan_detection(db: GraphDatabase) -> Dict[str, Any]:
         })
 
     # Find files with no incoming imports (excluding entry points)
-    unreferenced_files_result = conn.execute("""
+    unreferenced_file_rows = _rows(db, """
         MATCH (f:File)
         WHERE NOT exists((f)<-[:IMPORTS]-())
         AND NOT f.path CONTAINS '__main__'
@@ -485,8 +521,7 @@ def query_orphan_detection(db: GraphDatabase) -> Dict[str, Any]:
     """)
 
     unreferenced_files = []
-    while unreferenced_files_result.has_next():
-        row = unreferenced_files_result.get_next()
+    for row in unreferenced_file_rows:
         unreferenced_files.append({
             "file": row[0],
             "lines": row[1],
@@ -515,11 +550,11 @@ def query_symbol_callers(db: GraphDatabase, symbol_name: str) -> Dict[str, Any]:
         >>> for caller in callers['callers']:
         >>>     print(f"{caller['name']} in {caller['file']}")
     """
-    conn = db.get_connection()
-
     # Find callers via CALLS relationship
-    result = conn.execute(f"""
-        MATCH (target:Symbol {{name: '{symbol_name}'}})
+    rows = _rows(
+        db,
+        """
+        MATCH (target:Symbol {name: $name})
         OPTIONAL MATCH (caller:Symbol)-[:CALLS]->(target)
         OPTIONAL MATCH (f:File)-[:CONTAINS]->(caller)
         RETURN DISTINCT
@@ -528,11 +563,12 @@ def query_symbol_callers(db: GraphDatabase, symbol_name: str) -> Dict[str, Any]:
             f.path AS file,
             caller.line_start AS line
         ORDER BY file, line
-    """)
+        """,
+        {"name": symbol_name},
+    )
 
     callers = []
-    while result.has_next():
-        row = result.get_next()
+    for row in rows:
         if row[0]:  # Only add if caller exists
             callers.append({
                 "name": row[0],
@@ -564,11 +600,11 @@ def query_file_timeline(db: GraphDatabase, file_path: str, limit: int = 20) -> D
         >>> for event in timeline['commits']:
         >>>     print(f"{event['date']}: {event['message']}")
     """
-    conn = db.get_connection()
-
     # Get commits affecting this file
-    result = conn.execute(f"""
-        MATCH (f:File {{path: '{file_path}'}})
+    rows = _rows(
+        db,
+        """
+        MATCH (f:File {path: $path})
         MATCH (c:Commit)-[:CHANGES]->(f)
         RETURN
             c.short_hash AS hash,
@@ -576,12 +612,13 @@ def query_file_timeline(db: GraphDatabase, file_path: str, limit: int = 20) -> D
             c.timestamp AS timestamp,
             c.author_name AS author
         ORDER BY c.timestamp DESC
-        LIMIT {limit}
-    """)
+        LIMIT $limit
+        """,
+        {"path": file_path, "limit": limit},
+    )
 
     commits = []
-    while result.has_next():
-        row = result.get_next()
+    for row in rows:
         commits.append({
             "hash": row[0],
             "message": row[1],
@@ -609,10 +646,8 @@ def query_task_coverage(db: GraphDatabase) -> Dict[str, Any]:
         >>> coverage = query_task_coverage(db)
         >>> print(f"{len(coverage['tasks_without_commits'])} tasks have no commits")
     """
-    conn = db.get_connection()
-
     # Find tasks with no commits
-    result = conn.execute("""
+    rows = _rows(db, """
         MATCH (t:Task)
         WHERE NOT exists((c:Commit)-[:MODIFIES]->(t))
         RETURN
@@ -625,8 +660,7 @@ def query_task_coverage(db: GraphDatabase) -> Dict[str, Any]:
     """)
 
     tasks_without_commits = []
-    while result.has_next():
-        row = result.get_next()
+    for row in rows:
         tasks_without_commits.append({
             "id": row[0],
             "title": row[1],
@@ -635,15 +669,13 @@ def query_task_coverage(db: GraphDatabase) -> Dict[str, Any]:
         })
 
     # Find tasks WITH commits for comparison
-    with_commits_result = conn.execute("""
+    with_commits_rows = _rows(db, """
         MATCH (t:Task)
         WHERE exists((c:Commit)-[:MODIFIES]->(t))
         RETURN COUNT(t) AS count
     """)
 
-    with_commits_count = 0
-    if with_commits_result.has_next():
-        with_commits_count = with_commits_result.get_next()[0]
+    with_commits_count = with_commits_rows[0][0] if with_commits_rows else 0
 
     return {
         "tasks_without_commits": tasks_without_commits,
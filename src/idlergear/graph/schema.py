@@ -105,6 +105,9 @@ def initialize_schema(db: GraphDatabase, drop_existing: bool = False) -> None:
         _create_node_tables(conn)
         _create_relationship_tables(conn)
 
+    # Tables may have been dropped or recreated; cached results are stale
+    db.bump_generation()
+
 
 def _drop_tables(conn):
     """Drop all existing tables (for clean rebuild)."""
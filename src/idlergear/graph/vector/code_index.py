@@ -350,6 +350,54 @@ class VectorCodeIndex:
             logger.error(f"Failed to clear index: {e}")
             raise
 
+    def apply_changes(self, changes: List[Any], repo_path: Path) -> Dict[str, int]:
+        """Re-embed the symbols of changed files and drop deleted files.
+
+        Args:
+            changes: Objects with ``path`` and ``kind`` attributes (created,
+                modified, deleted), e.g. daemon ``FileChange`` batches
+            repo_path: Repository root the paths are relative to
+
+        Returns:
+            Dictionary with counts: files, indexed, removed
+        """
+        from ..parsers import TreeSitterParser
+
+        extensions = tuple(TreeSitterParser.SUPPORTED_LANGUAGES.keys())
+        parser: Optional[TreeSitterParser] = None
+        files = indexed = removed = 0
+
+        for change in changes:
+            if not change.path.endswith(extensions):
+                continue
+            removed += self.delete_by_file(change.path)
+            if change.kind == "deleted":
+                continue
+
+            parser = parser or TreeSitterParser()
+            parse_result = parser.parse_file(Path(repo_path) / change.path)
+            if not parse_result:
+                continue
+            symbols = [
+                {
+                    # Same IDs as CodePopulator, so either can replace the other's
+                    "symbol_id": f"{change.path}:{symbol['line_start']}:{symbol['name']}",
+                    "name": symbol["name"],
+                    "type": symbol["type"],
+                    "code": symbol["code"],
+                    "file_path": change.path,
+                    "line_start": symbol["line_start"],
+                    "line_end": symbol["line_end"],
+                }
+                for symbol in parse_result["symbols"]
+                if symbol.get("code")
+            ]
+            # The file's old symbols are gone, so skip the existing-ID scan
+            indexed += self.index_symbols_batch(symbols, incremental=False)
+            files += 1
+
+        return {"files": files, "indexed": indexed, "removed": removed}
+
     def delete_by_file(self, file_path: str) -> int:
         """Delete all symbols from a specific file.
 
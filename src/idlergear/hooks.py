@@ -13,8 +13,8 @@ if [ ! -d ".idlergear" ]; then
     exit 0  # Silent exit if not an IdlerGear project
 fi
 
-# Get context (minimal mode for speed)
-CONTEXT=$(idlergear context 2>/dev/null || echo "")
+# Get context (minimal mode for speed; served by the daemon when running)
+CONTEXT=$(idlergear-context 2>/dev/null || idlergear context 2>/dev/null || echo "")
 
 if [ -n "$CONTEXT" ]; then
     cat <<EOF
@@ -61,43 +61,55 @@ except Exception as e:
     fi
 fi
 
-# Build context by reading files directly (no Python startup overhead)
+# Prefer the daemon's pre-rendered context snapshot (one socket round trip)
+SNAPSHOT=""
+if command -v idlergear-context &>/dev/null; then
+    SNAPSHOT=$(idlergear-context --mode minimal --daemon-only --timeout 0.3 2>/dev/null)
+fi
+
 CONTEXT=""
 
-# Read vision (VISION.md in repo root)
-if [ -f "VISION.md" ]; then
-    VISION=$(cat "VISION.md" 2>/dev/null | head -20)
-    if [ -n "$VISION" ]; then
-        CONTEXT="${CONTEXT}## Vision\n${VISION}\n\n"
+if [ -n "$SNAPSHOT" ]; then
+    # Keep literal backslashes through the echo -e below
+    CONTEXT="${SNAPSHOT//\\/\\\\}\n\n"
+else
+    # No daemon yet: build context by reading files directly (no Python startup overhead)
+
+    # Read vision (VISION.md in repo root)
+    if [ -f "VISION.md" ]; then
+        VISION=$(cat "VISION.md" 2>/dev/null | head -20)
+        if [ -n "$VISION" ]; then
+            CONTEXT="${CONTEXT}## Vision\n${VISION}\n\n"
+        fi
     fi
-fi
 
-# Count open tasks
-TASK_COUNT=0
-if [ -d ".idlergear/tasks" ]; then
-    TASK_COUNT=$(ls -1 ".idlergear/tasks/"*.md 2>/dev/null | wc -l)
-fi
+    # Count open tasks
+    TASK_COUNT=0
+    if [ -d ".idlergear/tasks" ]; then
+        TASK_COUNT=$(ls -1 ".idlergear/tasks/"*.md 2>/dev/null | wc -l)
+    fi
 
-if [ "$TASK_COUNT" -gt 0 ]; then
-    CONTEXT="${CONTEXT}## Open Tasks: ${TASK_COUNT}\n"
-    # Show first 5 task titles (from YAML frontmatter)
-    for f in $(ls -1t ".idlergear/tasks/"*.md 2>/dev/null | head -5); do
-        TITLE=$(grep "^title:" "$f" 2>/dev/null | head -1 | sed "s/^title: *['\"]*//" | sed "s/['\"]* *$//")
-        if [ -n "$TITLE" ]; then
-            CONTEXT="${CONTEXT}- ${TITLE}\n"
-        fi
-    done
-    CONTEXT="${CONTEXT}\n"
-fi
+    if [ "$TASK_COUNT" -gt 0 ]; then
+        CONTEXT="${CONTEXT}## Open Tasks: ${TASK_COUNT}\n"
+        # Show first 5 task titles (from YAML frontmatter)
+        for f in $(ls -1t ".idlergear/tasks/"*.md 2>/dev/null | head -5); do
+            TITLE=$(grep "^title:" "$f" 2>/dev/null | head -1 | sed "s/^title: *['\"]*//" | sed "s/['\"]* *$//")
+            if [ -n "$TITLE" ]; then
+                CONTEXT="${CONTEXT}- ${TITLE}\n"
+            fi
+        done
+        CONTEXT="${CONTEXT}\n"
+    fi
 
-# Count notes
-NOTE_COUNT=0
-if [ -d ".idlergear/notes" ]; then
-    NOTE_COUNT=$(ls -1 ".idlergear/notes/"*.md 2>/dev/null | wc -l)
-fi
+    # Count notes
+    NOTE_COUNT=0
+    if [ -d ".idlergear/notes" ]; then
+        NOTE_COUNT=$(ls -1 ".idlergear/notes/"*.md 2>/dev/null | wc -l)
+    fi
 
-if [ "$NOTE_COUNT" -gt 0 ]; then
-    CONTEXT="${CONTEXT}## Recent Notes: ${NOTE_COUNT}\n\n"
+    if [ "$NOTE_COUNT" -gt 0 ]; then
+        CONTEXT="${CONTEXT}## Recent Notes: ${NOTE_COUNT}\n\n"
+    fi
 fi
 
 # Check for pending messages in any inbox
@@ -70,10 +70,9 @@ def get_indexing_status() -> Dict[str, Any]:
 
     # Get file annotation status
     try:
-        from idlergear.file_annotation_storage import FileAnnotationStorage
-        storage = FileAnnotationStorage()
-        annotations = storage.list_annotations()
-        annotated_files = len(annotations)
+        from idlergear.file_annotation_storage import SQLiteAnnotationStorage
+        storage = SQLiteAnnotationStorage()
+        annotated_files = len(storage.list_paths())
     except Exception:
         annotated_files = 0
 
@@ -155,15 +154,14 @@ def _index_file_annotations_batch(batch_size: int = 5) -> Dict[str, Any]:
         Dictionary with results
     """
     from idlergear.config import find_idlergear_root
-    from idlergear.file_annotation_storage import FileAnnotationStorage
+    from idlergear.file_annotation_storage import SQLiteAnnotationStorage
 
     root = find_idlergear_root() or Path.cwd()
     state = _load_state()
 
     # Get already annotated files
-    storage = FileAnnotationStorage()
-    existing_annotations = storage.list_annotations()
-    annotated_paths = {a.path for a in existing_annotations}
+    storage = SQLiteAnnotationStorage()
+    annotated_paths = set(storage.list_paths())
 
     # Find unannotated Python files
     src_dirs = [root / "src", root / "lib", root / "app"]
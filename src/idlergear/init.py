@@ -110,6 +110,14 @@ def init_project(path: str = ".") -> None:
         # Add graph database to gitignore (large, project-specific)
         if ".idlergear/graph.db" not in content:
             additions.append(".idlergear/graph.db")
+        # Add derived-data caches to gitignore (rebuildable)
+        if ".idlergear/cache/" not in content:
+            additions.append(".idlergear/cache/")
+        # Add the access journal to gitignore (folded into files on update)
+        if ".idlergear/access_journal.jsonl" not in content:
+            additions.append(".idlergear/access_journal.jsonl")
+        if ".idlergear/access_journal.lock" not in content:
+            additions.append(".idlergear/access_journal.lock")
 
         if additions:
             with open(gitignore_path, "a") as f:
@@ -446,6 +446,9 @@ from idlergear.fs import FilesystemServer
 # Initialize filesystem server
 fs_server = None
 
+# Default content cap for idlergear_fs_read_file; larger files are paged
+MCP_READ_MAX_BYTES = 1024 * 1024
+
 
 def _get_fs_server() -> FilesystemServer:
     """Get or create filesystem server instance."""
@@ -546,7 +549,10 @@ def _log_file_access(
     allowed: bool,
     agent_id: str | None = None,
 ) -> None:
-    """Log file access attempts to .idlergear/access_log.jsonl.
+    """Log file access attempts to the project's access log.
+
+    Entries are buffered and written by a background thread to the daily
+    segment .idlergear/access_log.jsonl (see idlergear.access_log).
 
     Args:
         tool: Tool name (Read, Write, Edit, Bash)
@@ -562,8 +568,7 @@ def _log_file_access(
         if root is None:
             return  # Can't log if not initialized
 
-        log_file = Path(root) / ".idlergear" / "access_log.jsonl"
-        log_file.parent.mkdir(parents=True, exist_ok=True)
+        from idlergear.access_log import get_access_log
 
         entry = {
             "timestamp": datetime.now(UTC).isoformat(),
@@ -574,8 +579,7 @@ def _log_file_access(
             "agent_id": agent_id or _registered_agent_id,
         }
 
-        with open(log_file, "a") as f:
-            f.write(json.dumps(entry) + "\n")
+        get_access_log(Path(root) / ".idlergear").append(entry)
     except Exception:
         # Don't fail tool calls if logging fails
         pass
@@ -2449,18 +2453,38 @@ This ensures messages don't derail your work - only context ones are shown immed
         # Filesystem tools
         Tool(
             name="idlergear_fs_read_file",
-            description="Read file contents. Returns content, path, and size. Use this instead of cat or Read tool for better performance.",
+            description="Read file contents. Returns content, path, size and truncation info. Supports line ranges (start_line/end_line) and byte ranges (offset/length) for paging through large files without loading them. Use this instead of cat or Read tool for better performance.",
             inputSchema={
                 "type": "object",
                 "properties": {
                     "path": {"type": "string", "description": "Path to file"},
+                    "start_line": {
+                        "type": "integer",
+                        "description": "First line to return (1-based, inclusive)",
+                    },
+                    "end_line": {
+                        "type": "integer",
+                        "description": "Last line to return (1-based, inclusive)",
+                    },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Byte offset to start reading at",
+                    },
+                    "length": {
+                        "type": "integer",
+                        "description": "Number of bytes to read from offset",
+                    },
+                    "max_bytes": {
+                        "type": "integer",
+                        "description": "Truncate content to this many bytes (default: 1 MiB). Use next_offset/next_line from the result to continue.",
+                    },
                 },
                 "required": ["path"],
             },
         ),
         Tool(
             name="idlergear_fs_read_multiple",
-            description="Read multiple files at once. More efficient than calling read_file multiple times.",
+            description="Read multiple files at once, concurrently. More efficient than calling read_file multiple times. A total byte budget is shared across the batch; files beyond it are truncated or skipped (see truncated/skipped in results).",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -2469,6 +2493,10 @@ This ensures messages don't derail your work - only context ones are shown immed
                         "items": {"type": "string"},
                         "description": "List of file paths",
                     },
+                    "max_total_bytes": {
+                        "type": "integer",
+                        "description": "Total content budget in bytes (default: 10 MiB)",
+                    },
                 },
                 "required": ["paths"],
             },
@@ -5302,7 +5330,8 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
 
         elif name == "idlergear_graph_populate_all":
             from idlergear.graph import populate_all
-            from idlergear.graph.database import reset_database
+            from idlergear.graph.database import GraphLockedError, reset_database
+            from idlergear.graph.populate_all import populate_in_daemon
 
             # Release database lock before populate to avoid lock contention
             reset_database()
@@ -5319,12 +5348,18 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                     progress_events.append(event)
 
                 # Run with progress tracking
-                result = populate_all(
-                    max_commits=max_commits,
-                    incremental=incremental,
-                    verbose=False,
-                    progress_callback=progress_callback,
-                )
+                try:
+                    result = populate_all(
+                        max_commits=max_commits,
+                        incremental=incremental,
+                        verbose=False,
+                        progress_callback=progress_callback,
+                    )
+                except GraphLockedError:
+                    # The daemon holds the graph open; let it do the writing
+                    result = populate_in_daemon(
+                        max_commits=max_commits, incremental=incremental
+                    )
 
                 # Calculate summary statistics
                 total_nodes = sum(
@@ -5368,81 +5403,81 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                     }
                 )
             finally:
-                # Reacquire connection for subsequent queries
-                # (get_database() will create new instance on next call)
-                pass
+                # Don't keep the write lock while idle; queries reopen the
+                # database read-only (get_database() reopens it for writes)
+                reset_database()
 
         # Advanced graph query handlers (Issue #335)
         elif name == "idlergear_graph_impact_analysis":
-            from idlergear.graph import get_database
+            from idlergear.graph.database import query_database
             from idlergear.graph.queries import query_impact_analysis
 
-            db = get_database()
-            result = query_impact_analysis(db, arguments["symbol_name"])
+            with query_database() as db:
+                result = query_impact_analysis(db, arguments["symbol_name"])
             return _format_result(result)
 
         elif name == "idlergear_graph_test_coverage":
-            from idlergear.graph import get_database
+            from idlergear.graph.database import query_database
             from idlergear.graph.queries import query_test_coverage
 
-            db = get_database()
-            result = query_test_coverage(
-                db, arguments["target"], arguments.get("target_type", "file")
-            )
+            with query_database() as db:
+                result = query_test_coverage(
+                    db, arguments["target"], arguments.get("target_type", "file")
+                )
             return _format_result(result)
 
         elif name == "idlergear_graph_change_history":
-            from idlergear.graph import get_database
+            from idlergear.graph.database import query_database
             from idlergear.graph.queries import query_change_history
 
-            db = get_database()
-            result = query_change_history(db, arguments["symbol_name"])
+            with query_database() as db:
+                result = query_change_history(db, arguments["symbol_name"])
             return _format_result(
                 {"symbol": arguments["symbol_name"], "commits": result}
             )
 
         elif name == "idlergear_graph_dependency_chain":
-            from idlergear.graph import get_database
+            from idlergear.graph.database import query_database
             from idlergear.graph.queries import query_dependency_chain
 
-            db = get_database()
-            result = query_dependency_chain(
-                db, arguments["file_path"], arguments.get("max_depth", 5)
-            )
+            with query_database() as db:
+                result = query_dependency_chain(
+                    db, arguments["file_path"], arguments.get("max_depth", 5)
+                )
             return _format_result(result)
 
         elif name == "idlergear_graph_orphan_detection":
-            from idlergear.graph import get_database
+            from idlergear.graph.database import query_database
             from idlergear.graph.queries import query_orphan_detection
 
-            db = get_database()
-            result = query_orphan_detection(db)
+            with query_database() as db:
+                result = query_orphan_detection(db)
             return _format_result(result)
 
         elif name == "idlergear_graph_symbol_callers":
-            from idlergear.graph import get_database
+            from idlergear.graph.database import query_database
             from idlergear.graph.queries import query_symbol_callers
 
-            db = get_database()
-            result = query_symbol_callers(db, arguments["symbol_name"])
+            with query_database() as db:
+                result = query_symbol_callers(db, arguments["symbol_name"])
             return _format_result(result)
 
         elif name == "idlergear_graph_file_timeline":
-            from idlergear.graph import get_database
+            from idlergear.graph.database import query_database
             from idlergear.graph.queries import query_file_timeline
 
-            db = get_database()
-            result = query_file_timeline(
-                db, arguments["file_path"], arguments.get("limit", 20)
-            )
+            with query_database() as db:
+                result = query_file_timeline(
+                    db, arguments["file_path"], arguments.get("limit", 20)
+                )
             return _format_result(result)
 
         elif name == "idlergear_graph_task_coverage":
-            from idlergear.graph import get_database
+            from idlergear.graph.database import query_database
             from idlergear.graph.queries import query_task_coverage
 
-            db = get_database()
-            result = query_task_coverage(db)
+            with query_database() as db:
+                result = query_task_coverage(db)
             return _format_result(result)
 
         # Graph visualization handlers
@@ -6167,7 +6202,14 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 raise ValueError(warning)
 
             fs = _get_fs_server()
-            result = fs.read_file(file_path)
+            result = fs.read_file(
+                file_path,
+                start_line=arguments.get("start_line"),
+                end_line=arguments.get("end_line"),
+                offset=arguments.get("offset"),
+                length=arguments.get("length"),
+                max_bytes=arguments.get("max_bytes", MCP_READ_MAX_BYTES),
+            )
 
             # If there was a warning (e.g., write to deprecated), include it
             if warning:
@@ -6193,7 +6235,9 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                 raise ValueError(error_msg)
 
             fs = _get_fs_server()
-            result = fs.read_multiple_files(paths)
+            result = fs.read_multiple_files(
+                paths, max_total_bytes=arguments.get("max_total_bytes")
+            )
             return _format_result(result)
 
         elif name == "idlergear_fs_write_file":
@@ -7224,7 +7268,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
             from idlergear.docs_dotnet import (
                 detect_dotnet_project,
                 find_xml_docs,
-                parse_xml_docs,
+                load_xml_docs,
                 generate_dotnet_summary,
             )
 
@@ -7269,7 +7313,7 @@ async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
                             "hint": "Build with <GenerateDocumentationFile>true</GenerateDocumentationFile>",
                         }
                     )
-                assembly = parse_xml_docs(xml_docs[0])
+                assembly = load_xml_docs(xml_docs[0])
                 summary = generate_dotnet_summary(assembly, mode=mode)
                 return [TextContent(type="text", text=json.dumps(summary, indent=2))]
             else:
@@ -86,25 +86,33 @@ def list_notes(
     if notes_dir is None or not notes_dir.exists():
         return []
 
+    from idlergear.relevance import score_items
+
     notes = []
     for filepath in sorted(notes_dir.glob("*.md")):
-        note = load_note_from_file(filepath)
+        note = load_note_from_file(filepath, score=False)
         if note:
             if tag is None or tag in note.get("tags", []):
                 notes.append(note)
 
+    score_items(notes)
     return sorted(notes, key=lambda n: n.get("id", 0))
 
 
-def load_note_from_file(filepath: Path) -> dict[str, Any] | None:
-    """Load a note from a file path."""
+def load_note_from_file(filepath: Path, score: bool = True) -> dict[str, Any] | None:
+    """Load a note from a file path.
+
+    Args:
+        filepath: Path to the note's markdown file
+        score: Compute relevance_score now (listings score in one batch)
+    """
     if not filepath.exists():
         return None
 
     content = filepath.read_text()
     frontmatter, body = parse_frontmatter(content)
 
-    return {
+    note = {
         "id": frontmatter.get("id"),
         "content": body.strip(),
         "tags": frontmatter.get("tags", []),
@@ -115,6 +123,11 @@ def load_note_from_file(filepath: Path) -> dict[str, Any] | None:
         "path": str(filepath),
     }
 
+    # Merge journaled accesses; relevance is scored as of now
+    from idlergear.access_journal import get_access_journal
+
+    return get_access_journal(filepath.parent.parent).merge("note", note, score=score)
+
 
 def get_note(
     note_id: int,
@@ -126,7 +139,7 @@ def get_note(
     Args:
         note_id: ID of the note to retrieve
         project_path: Optional project path override
-        update_access: If True, updates access timestamp and relevance score
+        update_access: If True, records the access in the access journal
 
     Returns the note data, or None if not found.
     """
@@ -156,29 +169,14 @@ def get_note(
 
 
 def _update_note_access(filepath: Path, note: dict[str, Any]) -> None:
-    """Update note access timestamp and relevance score."""
-    from datetime import datetime, timezone
-    from idlergear.relevance import calculate_relevance
-    from idlergear.storage import parse_iso
-
-    content = filepath.read_text()
-    frontmatter, body = parse_frontmatter(content)
-
-    frontmatter["accessed"] = now_iso()
-    frontmatter["access_count"] = frontmatter.get("access_count", 0) + 1
+    """Record a note access in the access journal.
 
-    # Recalculate relevance score
-    created = parse_iso(frontmatter.get("created", ""))
-    if created:
-        frontmatter["relevance_score"] = calculate_relevance(
-            created=created,
-            accessed=datetime.now(timezone.utc),
-            access_count=frontmatter["access_count"],
-        )
+    The markdown file is left untouched; the access is folded into its
+    frontmatter on the next update or journal compaction.
+    """
+    from idlergear.access_journal import get_access_journal
 
-    # Save updated note
-    new_content = render_frontmatter(frontmatter, body.strip() + "\n")
-    filepath.write_text(new_content)
+    get_access_journal(filepath.parent.parent).record("note", note["id"])
 
 
 def update_note(
@@ -202,35 +200,28 @@ def update_note(
         return None
 
     filepath = Path(note["path"])
-    file_content = filepath.read_text()
-    frontmatter, old_content = parse_frontmatter(file_content)
-
-    # Update access metadata
-    from datetime import datetime, timezone
-    from idlergear.relevance import calculate_relevance
-    from idlergear.storage import parse_iso
-
-    frontmatter["accessed"] = now_iso()
-    frontmatter["access_count"] = frontmatter.get("access_count", 0) + 1
-
-    # Recalculate relevance score
-    created = parse_iso(frontmatter.get("created", ""))
-    if created:
-        frontmatter["relevance_score"] = calculate_relevance(
-            created=created,
-            accessed=datetime.now(timezone.utc),
-            access_count=frontmatter["access_count"],
-        )
 
-    # Update tags if provided
-    if tags is not None:
-        frontmatter["tags"] = tags
+    from idlergear.access_journal import get_access_journal
+    from idlergear.relevance import item_relevance
+
+    journal = get_access_journal(filepath.parent.parent)
+    with journal.folding("note", note_id, filepath) as (frontmatter, old_content):
+        # The file is rewritten anyway: fold in journaled accesses plus this one
+        frontmatter["accessed"] = now_iso()
+        frontmatter["access_count"] = frontmatter.get("access_count", 0) + 1
+        score = item_relevance(frontmatter)
+        if score is not None:
+            frontmatter["relevance_score"] = score
+
+        # Update tags if provided
+        if tags is not None:
+            frontmatter["tags"] = tags
 
-    # Use new content or keep old
-    new_content = content if content is not None else old_content.strip()
+        # Use new content or keep old
+        new_content = content if content is not None else old_content.strip()
 
-    new_file_content = render_frontmatter(frontmatter, new_content.strip() + "\n")
-    filepath.write_text(new_file_content)
+        new_file_content = render_frontmatter(frontmatter, new_content.strip() + "\n")
+        filepath.write_text(new_file_content)
 
     return {
         "id": note_id,
@@ -246,7 +237,7 @@ def delete_note(note_id: int, project_path: Path | None = None) -> bool:
 
     Returns True if deleted, False if not found.
     """
-    note = get_note(note_id, project_path)
+    note = get_note(note_id, project_path, update_access=False)
     if note is None:
         return False
 
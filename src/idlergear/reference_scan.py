@@ -0,0 +1,240 @@
+"""Multi-pattern scanning for quoted file path references.
+
+``audit --code-scan`` looks for string literals naming deprecated files
+(``"src/old.py"`` or ``'src/old.py'``) anywhere in the project. Checking
+every line against every deprecated path costs O(lines x paths); instead
+all quoted variants are compiled into one Aho-Corasick automaton, so each
+file is scanned in a single pass whatever the number of paths.
+
+Files are read and scanned in a thread pool fed by the pruned walker, and
+per-file results are cached by content hash (``FileHashCache``), so a
+repeated audit only rescans files that changed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from idlergear.cache import FileHashCache
+from idlergear.walker import DEFAULT_EXCLUDE_PATTERNS, DirectoryWalker
+
+# Bytes sniffed for NUL to skip binary files
+BINARY_SNIFF_BYTES = 8192
+
+# .idlergear holds annotations that name every deprecated file
+SCAN_EXCLUDE_PATTERNS = DEFAULT_EXCLUDE_PATTERNS + ["env", ".idlergear"]
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton matching many strings in one pass.
+
+    While the automaton is at its root state, the scan jumps straight to
+    the next character that can start a pattern with a compiled regex
+    search. Patterns that start with a quote therefore cost a C-level
+    search per quote instead of a Python step per character.
+
+    Example:
+        >>> automaton = AhoCorasick(['"a.py"', "'a.py'"])
+        >>> list(automaton.finditer('load("a.py")'))
+        [(5, 0)]
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """Build the automaton.
+
+        Args:
+            patterns: Strings to find (empty strings are ignored)
+        """
+        self.patterns = list(patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                state = next_state
+            self._out[state] += (index,)
+
+        # Breadth-first: failure links point at the longest proper suffix
+        # that is also a trie path; outputs inherit the suffix's outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+        starts = "".join(self._goto[0])
+        self._skip = re.compile(f"[{re.escape(starts)}]") if starts else None
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (start offset, pattern index) for every occurrence.
+
+        Overlapping occurrences are all reported, in order of end offset.
+        """
+        if self._skip is None:
+            return
+        goto, fail, out = self._goto, self._fail, self._out
+        search = self._skip.search
+        state = 0
+        i, n = 0, len(text)
+        while i < n:
+            if not state:
+                match = search(text, i)
+                if match is None:
+                    return
+                i = match.start()
+            char = text[i]
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in out[state]:
+                yield i - len(self.patterns[index]) + 1, index
+            i += 1
+
+
+class ReferenceScanner:
+    """Find quoted references to a set of paths in project files.
+
+    A line references a path when it contains the path in double or single
+    quotes. Each (line, path) pair is reported once.
+
+    Example:
+        >>> scanner = ReferenceScanner(["src/old.py"])
+        >>> scanner.scan_text('run("src/old.py")\\n')
+        [(1, 'run("src/old.py")', 'src/old.py')]
+    """
+
+    def __init__(self, targets: Sequence[str]):
+        """Compile the scanner.
+
+        Args:
+            targets: Paths to look for, in reporting order
+        """
+        self.targets = list(dict.fromkeys(targets))
+        patterns = []
+        for target in self.targets:
+            patterns.extend((f'"{target}"', f"'{target}'"))
+        self._automaton = AhoCorasick(patterns)
+        self.fingerprint = hashlib.blake2b(
+            "\0".join(sorted(self.targets)).encode(), digest_size=16
+        ).hexdigest()
+
+    def scan_text(self, text: str) -> List[Tuple[int, str, str]]:
+        """Scan text for references.
+
+        Args:
+            text: File content
+
+        Returns:
+            List of (line number, stripped line, target) sorted by line,
+            then by target order
+        """
+        hits = set()
+        line_num, line_start = 1, 0
+        for start, index in self._automaton.finditer(text):
+            # Offsets arrive in increasing order; count newlines as we go
+            line_num += text.count("\n", line_start, start)
+            line_start = start
+            hits.add((line_num, index // 2))
+
+        if not hits:
+            return []
+        lines = text.split("\n")
+        return [
+            (line, lines[line - 1].strip(), self.targets[target])
+            for line, target in sorted(hits)
+        ]
+
+    def scan_file(self, path: Path) -> List[Tuple[int, str, str]]:
+        """Scan one file; binary and non-UTF-8 files have no references."""
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return []
+        if b"\0" in content[:BINARY_SNIFF_BYTES]:
+            return []
+        try:
+            text = content.decode("utf-8")
+        except UnicodeDecodeError:
+            return []
+        return self.scan_text(text)
+
+
+def scan_references(
+    root: Path,
+    targets: Sequence[str],
+    workers: int = 8,
+    use_cache: bool = True,
+    project_path: Optional[Path] = None,
+) -> List[Dict[str, object]]:
+    """Scan every text file under root for quoted references to targets.
+
+    Args:
+        root: Directory to scan (gitignored and excluded trees are pruned)
+        targets: Paths to look for
+        workers: Threads reading and scanning files
+        use_cache: Reuse per-file results for files whose content is unchanged
+        project_path: Project root for the cache (defaults to root)
+
+    Returns:
+        List of {"file", "line", "code", "target"} dicts, sorted by file
+        and line
+    """
+    if not targets:
+        return []
+
+    scanner = ReferenceScanner(targets)
+    cache = (
+        FileHashCache("references", project_path or root, List[Tuple[int, str, str]])
+        if use_cache
+        else None
+    )
+    walker = DirectoryWalker(root, exclude_patterns=SCAN_EXCLUDE_PATTERNS)
+
+    def scan(entry) -> Tuple[str, List[Tuple[int, str, str]]]:
+        path = Path(entry.path)
+        try:
+            if cache is None:
+                return entry.rel_path, scanner.scan_file(path)
+            hits = cache.get_or_compute(
+                entry.rel_path, path, scanner.scan_file, extra=scanner.fingerprint
+            )
+        except OSError:
+            return entry.rel_path, []  # Vanished or unreadable mid-scan
+        return entry.rel_path, hits
+
+    entries = [e for e in walker.walk(workers=workers) if not e.is_dir]
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        results = list(pool.map(scan, entries))
+
+    if cache is not None:
+        seen = {rel_path for rel_path, _ in results}
+        cache.prune(lambda key: key in seen)
+        cache.save()
+
+    references = []
+    for rel_path, hits in sorted(results, key=lambda result: result[0]):
+        for line, code, target in hits:
+            references.append({"file": rel_path, "line": line, "code": code, "target": target})
+    return references
@@ -2,16 +2,36 @@
 
 Implements time-based decay functions to automatically reduce the relevance
 of old, unaccessed knowledge items while boosting frequently accessed items.
+
+Single items are scored with ``calculate_relevance``. Listings, context
+filtering and the decay sweep score whole batches with ``score_batch``,
+which works on arrays of POSIX timestamps in one vectorized pass (NumPy
+when installed, a tight pure-Python loop otherwise).
 """
 
 from __future__ import annotations
 
+import importlib.util
 import math
 from datetime import datetime, timezone
-from typing import Literal
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Literal, Sequence
 
 DecayFunction = Literal["exponential", "linear", "step"]
 
+# NumPy is optional: batches fall back to pure Python without it. It is only
+# imported for the first large batch, keeping it out of CLI start-up.
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# Below this size NumPy's array setup costs more than it saves
+NUMPY_MIN_BATCH = 64
+
+SECONDS_PER_DAY = 86400
+
+# Score given to items without a valid created timestamp
+DEFAULT_RELEVANCE = 0.5
+
 
 def calculate_relevance(
     created: datetime,
@@ -88,6 +108,214 @@ def calculate_relevance(
     return round(score, 3)
 
 
+def _as_datetime(value: object) -> datetime | None:
+    """Coerce a frontmatter timestamp (ISO string or YAML datetime)."""
+    if isinstance(value, datetime):
+        return value
+    from idlergear.storage import parse_iso
+
+    return parse_iso(str(value)) if value else None
+
+
+def item_relevance(
+    item: dict,
+    decay_function: DecayFunction = "exponential",
+    half_life_days: int = 30,
+    access_boost: float = 0.1,
+) -> float | None:
+    """Calculate the current relevance of a task or note.
+
+    Args:
+        item: Item with 'created', optionally 'accessed' and 'access_count'
+        decay_function: Type of decay curve
+        half_life_days: Days until 50% relevance
+        access_boost: Boost per access
+
+    Returns:
+        Relevance score, or None if the item has no valid 'created' timestamp
+    """
+    created = _as_datetime(item.get("created"))
+    if created is None:
+        return None
+
+    return calculate_relevance(
+        created=created,
+        accessed=_as_datetime(item.get("accessed")),
+        access_count=item.get("access_count") or 0,
+        decay_function=decay_function,
+        half_life_days=half_life_days,
+        access_boost=access_boost,
+    )
+
+
+def score_batch(
+    created: Sequence[float],
+    accessed: Sequence[float | None],
+    access_counts: Sequence[int],
+    now: datetime | None = None,
+    decay_function: DecayFunction = "exponential",
+    half_life_days: int = 30,
+    access_boost: float = 0.1,
+) -> list[float]:
+    """Calculate relevance scores for many items in one pass.
+
+    Scores match ``calculate_relevance`` for the same inputs.
+
+    Args:
+        created: Creation times as POSIX timestamps
+        accessed: Last access times as POSIX timestamps (None if never)
+        access_counts: Number of accesses per item
+        now: Reference time (defaults to the current time)
+        decay_function: Type of decay curve
+        half_life_days: Days until 50% relevance
+        access_boost: Boost per access (capped at 0.3 total)
+
+    Returns:
+        Relevance scores (0.0-1.0), in input order
+
+    Example:
+        >>> score_batch([0.0, 0.0], [None, 86400.0 * 29], [0, 5],
+        ...             now=datetime.fromtimestamp(86400 * 30, timezone.utc))
+        [0.5, 1.0]
+    """
+    now_ts = (now or datetime.now(timezone.utc)).timestamp()
+    if NUMPY_AVAILABLE and len(created) >= NUMPY_MIN_BATCH:
+        return _score_batch_numpy(
+            created, accessed, access_counts, now_ts, decay_function, half_life_days, access_boost
+        )
+
+    days = [
+        (now_ts - (created_ts if accessed_ts is None else accessed_ts)) / SECONDS_PER_DAY
+        for created_ts, accessed_ts in zip(created, accessed)
+    ]
+    if decay_function == "exponential":
+        decay_rate = math.log(2) / half_life_days
+        exp = math.exp
+        decay = [exp(-decay_rate * d) for d in days]
+    elif decay_function == "linear":
+        max_age_days = half_life_days * 2
+        decay = [max(0.0, 1.0 - (d / max_age_days)) for d in days]
+    elif decay_function == "step":
+        decay = [
+            1.0 if d < half_life_days else 0.5 if d < half_life_days * 3 else 0.1
+            for d in days
+        ]
+    else:
+        decay = [1.0] * len(days)
+
+    return [
+        round(min(score + min(access_boost * count, 0.3), 1.0), 3)
+        for score, count in zip(decay, access_counts)
+    ]
+
+
+def _score_batch_numpy(
+    created: Sequence[float],
+    accessed: Sequence[float | None],
+    access_counts: Sequence[int],
+    now_ts: float,
+    decay_function: DecayFunction,
+    half_life_days: int,
+    access_boost: float,
+) -> list[float]:
+    """NumPy implementation of ``score_batch``."""
+    import numpy as np
+
+    created_arr = np.asarray(created, dtype=np.float64)
+    accessed_arr = np.array(
+        [math.nan if ts is None else ts for ts in accessed], dtype=np.float64
+    )
+    last = np.where(np.isnan(accessed_arr), created_arr, accessed_arr)
+    days_since = (now_ts - last) / SECONDS_PER_DAY
+
+    if decay_function == "exponential":
+        score = np.exp(-(math.log(2) / half_life_days) * days_since)
+    elif decay_function == "linear":
+        score = np.maximum(0.0, 1.0 - days_since / (half_life_days * 2))
+    elif decay_function == "step":
+        score = np.select(
+            [days_since < half_life_days, days_since < half_life_days * 3],
+            [1.0, 0.5],
+            default=0.1,
+        )
+    else:
+        score = np.ones_like(days_since)
+
+    boost = np.minimum(access_boost * np.asarray(access_counts, dtype=np.float64), 0.3)
+    return np.round(np.minimum(score + boost, 1.0), 3).tolist()
+
+
+def _timestamp(value: Any) -> float | None:
+    """POSIX timestamp of a frontmatter timestamp, or None if invalid."""
+    if isinstance(value, str):
+        return _parse_timestamp(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return None
+
+
+@lru_cache(maxsize=1 << 17)
+def _parse_timestamp(value: str) -> float | None:
+    """Parse an ISO timestamp (cached: the same items are ranked repeatedly)."""
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def score_items(
+    items: list[dict],
+    now: datetime | None = None,
+    decay_function: DecayFunction = "exponential",
+    half_life_days: int = 30,
+    access_boost: float = 0.1,
+    default: float | None = None,
+) -> list[dict]:
+    """Set 'relevance_score' on a list of items using one batch computation.
+
+    Args:
+        items: Items with 'created', optionally 'accessed' and 'access_count'
+        now: Reference time (defaults to the current time)
+        decay_function: Type of decay curve
+        half_life_days: Days until 50% relevance
+        access_boost: Boost per access
+        default: Score for items without a valid 'created' timestamp
+            (None keeps their existing score)
+
+    Returns:
+        Same list with updated relevance_score fields
+    """
+    scored, created, accessed, counts = [], [], [], []
+    for item in items:
+        created_ts = _timestamp(item.get("created"))
+        if created_ts is None:
+            if default is not None:
+                item["relevance_score"] = default
+            continue
+        scored.append(item)
+        created.append(created_ts)
+        accessed.append(_timestamp(item.get("accessed")))
+        counts.append(item.get("access_count") or 0)
+
+    scores = score_batch(
+        created,
+        accessed,
+        counts,
+        now=now,
+        decay_function=decay_function,
+        half_life_days=half_life_days,
+        access_boost=access_boost,
+    )
+    for item, score in zip(scored, scores):
+        item["relevance_score"] = score
+    return items
+
+
 def calculate_all_relevance(
     items: list[dict],
     decay_function: DecayFunction = "exponential",
@@ -107,33 +335,34 @@ def calculate_all_relevance(
     Returns:
         Same list with updated relevance_score fields
     """
-    for item in items:
-        created_str = item.get("created")
-        accessed_str = item.get("accessed")
+    # No created timestamp: assign default low relevance
+    return score_items(
+        items,
+        decay_function=decay_function,
+        half_life_days=half_life_days,
+        access_boost=access_boost,
+        default=DEFAULT_RELEVANCE,
+    )
 
-        if not created_str:
-            # No created timestamp, assign default low relevance
-            item["relevance_score"] = 0.5
-            continue
 
-        created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-        accessed = (
-            datetime.fromisoformat(accessed_str.replace("Z", "+00:00"))
-            if accessed_str
-            else None
-        )
-        access_count = item.get("access_count", 0)
-
-        item["relevance_score"] = calculate_relevance(
-            created=created,
-            accessed=accessed,
-            access_count=access_count,
-            decay_function=decay_function,
-            half_life_days=half_life_days,
-            access_boost=access_boost,
-        )
+# Name used by the knowledge CLI
+recalculate_all_relevance = calculate_all_relevance
 
-    return items
+
+def rank_by_relevance(
+    items: list[dict], min_relevance: float = 0.3, limit: int | None = None
+) -> list[dict]:
+    """Score items as of now, then filter and sort them by relevance.
+
+    Args:
+        items: Items with 'created', optionally 'accessed' and 'access_count'
+        min_relevance: Minimum relevance threshold (0.0-1.0)
+        limit: Maximum number of items to return (None = no limit)
+
+    Returns:
+        Items at or above the threshold, highest relevance first
+    """
+    return filter_by_relevance(score_items(items), min_relevance=min_relevance, limit=limit)
 
 
 def filter_by_relevance(
@@ -191,3 +420,145 @@ def sort_by_relevance(items: list[dict], reverse: bool = True) -> list[dict]:
     """
     items.sort(key=lambda x: x.get("relevance_score", 0.0), reverse=reverse)
     return items
+
+
+def identify_stale_items(items: list[dict], stale_threshold: float = 0.2) -> list[dict]:
+    """Score items as of now and return those below the stale threshold.
+
+    Args:
+        items: Items with 'created', optionally 'accessed' and 'access_count'
+        stale_threshold: Relevance threshold for considering an item stale
+
+    Returns:
+        List of stale items sorted by relevance (lowest first)
+    """
+    return get_stale_items(score_items(items), threshold=stale_threshold)
+
+
+def get_relevance_stats(items: list[dict], stale_threshold: float = 0.2) -> dict[str, Any]:
+    """Summarize the relevance scores of a list of items.
+
+    Args:
+        items: List of items with 'relevance_score' field
+        stale_threshold: Relevance threshold for counting stale items
+
+    Returns:
+        Dictionary with count, avg, min, max and stale_count
+    """
+    scores = [item.get("relevance_score", 1.0) for item in items]
+    if not scores:
+        return {"count": 0, "avg": 0.0, "min": 0.0, "max": 0.0, "stale_count": 0}
+    return {
+        "count": len(scores),
+        "avg": sum(scores) / len(scores),
+        "min": min(scores),
+        "max": max(scores),
+        "stale_count": sum(1 for score in scores if score < stale_threshold),
+    }
+
+
+def decay_sweep(
+    project_path: Path | None = None,
+    tolerance: float = 0.05,
+    stale_threshold: float = 0.2,
+    write: bool = False,
+) -> dict[str, Any]:
+    """Score every task and note and report relevance statistics.
+
+    Scores are computed lazily when items are read, so by default the sweep
+    only reads: journaled accesses are merged in memory, and the daemon runs
+    it periodically to report stale items without touching any file.
+
+    With ``write`` the stored ``relevance_score`` is refreshed as well. That
+    holds the access journal's lock, so it cannot race ``update_task``,
+    ``update_note`` or a compaction: journaled accesses are folded into the
+    files, and only files whose stored score is off by more than
+    ``tolerance`` are rewritten, keeping git churn low.
+
+    Args:
+        project_path: Project root (defaults to the current project)
+        tolerance: Largest stored-score error left unwritten
+        stale_threshold: Relevance threshold for stale items
+        write: Write current scores back to the files
+
+    Returns:
+        Relevance statistics (see ``get_relevance_stats``) plus "stale", the
+        stale items (kind, id, title, relevance_score), and "updated", the
+        number of files rewritten
+    """
+    from idlergear.access_journal import get_access_journal
+    from idlergear.config import find_idlergear_root
+    from idlergear.storage import render_frontmatter
+
+    if project_path is None:
+        project_path = find_idlergear_root()
+    if project_path is None:
+        raise RuntimeError("IdlerGear not initialized. Run 'idlergear init' first.")
+
+    journal = get_access_journal(project_path / ".idlergear")
+    if not write:
+        files = _sweep_files(project_path)
+        items = [
+            journal.merge(kind, dict(frontmatter), score=False)
+            for kind, _, frontmatter, _ in files
+        ]
+        score_items(items)
+        return _sweep_result(files, items, stale_threshold, updated=0)
+
+    with journal.locked():
+        journal.compact()
+        files = _sweep_files(project_path)
+        items = [dict(frontmatter) for _, _, frontmatter, _ in files]
+        score_items(items)
+
+        updated = 0
+        for (_, filepath, frontmatter, body), item in zip(files, items):
+            score = item.get("relevance_score")
+            stored = frontmatter.get("relevance_score")
+            if score is None or (
+                isinstance(stored, (int, float)) and abs(score - stored) <= tolerance
+            ):
+                continue
+            frontmatter["relevance_score"] = score
+            filepath.write_text(render_frontmatter(frontmatter, body.strip() + "\n"))
+            updated += 1
+        return _sweep_result(files, items, stale_threshold, updated=updated)
+
+
+def _sweep_files(project_path: Path) -> list[tuple[str, Path, dict, str]]:
+    """Read every task and note file as (kind, path, frontmatter, body)."""
+    from idlergear.notes import get_notes_dir
+    from idlergear.storage import parse_frontmatter
+    from idlergear.tasks import get_tasks_dir
+
+    files = []
+    dirs = (("task", get_tasks_dir(project_path)), ("note", get_notes_dir(project_path)))
+    for kind, directory in dirs:
+        if directory is None or not directory.exists():
+            continue
+        for filepath in sorted(directory.glob("*.md")):
+            frontmatter, body = parse_frontmatter(filepath.read_text())
+            if frontmatter:
+                files.append((kind, filepath, frontmatter, body))
+    return files
+
+
+def _sweep_result(
+    files: list[tuple[str, Path, dict, str]],
+    items: list[dict],
+    stale_threshold: float,
+    updated: int,
+) -> dict[str, Any]:
+    stats = get_relevance_stats(items, stale_threshold=stale_threshold)
+    stats["stale"] = [
+        {
+            "kind": kind,
+            "id": item.get("id"),
+            "title": item.get("title"),
+            "relevance_score": item["relevance_score"],
+        }
+        for (kind, _, _, _), item in zip(files, items)
+        if item.get("relevance_score", 1.0) < stale_threshold
+    ]
+    stats["updated"] = updated
+    return stats
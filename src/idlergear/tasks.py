@@ -142,25 +142,33 @@ def list_tasks(
     if tasks_dir is None or not tasks_dir.exists():
         return []
 
+    from idlergear.relevance import score_items
+
     tasks = []
     for filepath in sorted(tasks_dir.glob("*.md")):
-        task = load_task_from_file(filepath)
+        task = load_task_from_file(filepath, score=False)
         if task:
             if state == "all" or task.get("state") == state:
                 tasks.append(task)
 
+    score_items(tasks)
     return sorted(tasks, key=lambda t: t.get("id", 0))
 
 
-def load_task_from_file(filepath: Path) -> dict[str, Any] | None:
-    """Load a task from a file path."""
+def load_task_from_file(filepath: Path, score: bool = True) -> dict[str, Any] | None:
+    """Load a task from a file path.
+
+    Args:
+        filepath: Path to the task's markdown file
+        score: Compute relevance_score now (listings score in one batch)
+    """
     if not filepath.exists():
         return None
 
     content = filepath.read_text()
     frontmatter, body = parse_frontmatter(content)
 
-    return {
+    task = {
         "id": frontmatter.get("id"),
         "title": frontmatter.get("title", "Untitled"),
         "body": body.strip() if body else None,
@@ -178,6 +186,11 @@ def load_task_from_file(filepath: Path) -> dict[str, Any] | None:
         "path": str(filepath),
     }
 
+    # Merge journaled accesses; relevance is scored as of now
+    from idlergear.access_journal import get_access_journal
+
+    return get_access_journal(filepath.parent.parent).merge("task", task, score=score)
+
 
 def get_task(
     task_id: int,
@@ -189,7 +202,7 @@ def get_task(
     Args:
         task_id: ID of the task to retrieve
         project_path: Optional project path override
-        update_access: If True, updates access timestamp and relevance score
+        update_access: If True, records the access in the access journal
 
     Returns the task data, or None if not found.
     """
@@ -201,33 +214,11 @@ def get_task(
     for filepath in tasks_dir.glob("*.md"):
         task = load_task_from_file(filepath)
         if task and task.get("id") == task_id:
-            # Update access tracking if requested
+            # Journal the access instead of rewriting the file
             if update_access:
-                from datetime import datetime, timezone
-                from idlergear.relevance import calculate_relevance
-                from idlergear.storage import parse_iso
-
-                # Update access metadata
-                content = filepath.read_text()
-                frontmatter, body = parse_frontmatter(content)
-
-                frontmatter["accessed"] = now_iso()
-                frontmatter["access_count"] = frontmatter.get("access_count", 0) + 1
-
-                # Recalculate relevance score
-                created = parse_iso(frontmatter.get("created", ""))
-                if created:
-                    frontmatter["relevance_score"] = calculate_relevance(
-                        created=created,
-                        accessed=datetime.now(timezone.utc),
-                        access_count=frontmatter["access_count"],
-                    )
-
-                # Save updated task
-                new_content = render_frontmatter(frontmatter, body.strip() + "\n")
-                filepath.write_text(new_content)
-
-                # Reload to get updated data
+                from idlergear.access_journal import get_access_journal
+
+                get_access_journal(tasks_dir.parent).record("task", task_id)
                 task = load_task_from_file(filepath)
 
             return task
@@ -266,50 +257,43 @@ def update_task(
         return None
 
     filepath = Path(task["path"])
-    content = filepath.read_text()
-    frontmatter, old_body = parse_frontmatter(content)
-
-    # Update access metadata
-    from datetime import datetime, timezone
-    from idlergear.relevance import calculate_relevance
-    from idlergear.storage import parse_iso
-
-    frontmatter["accessed"] = now_iso()
-    frontmatter["access_count"] = frontmatter.get("access_count", 0) + 1
-
-    # Recalculate relevance score
-    created = parse_iso(frontmatter.get("created", ""))
-    if created:
-        frontmatter["relevance_score"] = calculate_relevance(
-            created=created,
-            accessed=datetime.now(timezone.utc),
-            access_count=frontmatter["access_count"],
-        )
-
-    # Update fields if provided
-    if title is not None:
-        frontmatter["title"] = title
-    if state is not None:
-        frontmatter["state"] = state
-    if labels is not None:
-        frontmatter["labels"] = labels
-    if assignees is not None:
-        frontmatter["assignees"] = assignees
-    if priority is not None:
-        if priority == "":
-            frontmatter.pop("priority", None)
-        else:
-            frontmatter["priority"] = priority
-    if due is not None:
-        if due == "":
-            frontmatter.pop("due", None)
-        else:
-            frontmatter["due"] = due
-
-    new_body = body if body is not None else old_body
-
-    new_content = render_frontmatter(frontmatter, new_body.strip() + "\n")
-    filepath.write_text(new_content)
+
+    from idlergear.access_journal import get_access_journal
+    from idlergear.relevance import item_relevance
+
+    journal = get_access_journal(filepath.parent.parent)
+    with journal.folding("task", task_id, filepath) as (frontmatter, old_body):
+        # The file is rewritten anyway: fold in journaled accesses plus this one
+        frontmatter["accessed"] = now_iso()
+        frontmatter["access_count"] = frontmatter.get("access_count", 0) + 1
+        score = item_relevance(frontmatter)
+        if score is not None:
+            frontmatter["relevance_score"] = score
+
+        # Update fields if provided
+        if title is not None:
+            frontmatter["title"] = title
+        if state is not None:
+            frontmatter["state"] = state
+        if labels is not None:
+            frontmatter["labels"] = labels
+        if assignees is not None:
+            frontmatter["assignees"] = assignees
+        if priority is not None:
+            if priority == "":
+                frontmatter.pop("priority", None)
+            else:
+                frontmatter["priority"] = priority
+        if due is not None:
+            if due == "":
+                frontmatter.pop("due", None)
+            else:
+                frontmatter["due"] = due
+
+        new_body = body if body is not None else old_body
+
+        new_content = render_frontmatter(frontmatter, new_body.strip() + "\n")
+        filepath.write_text(new_content)
 
     updated_task = load_task_from_file(filepath)
 
@@ -1,8 +1,12 @@
 """Test framework detection and result tracking for IdlerGear."""
 
+import base64
 import json
 import re
+import shlex
+import sqlite3
 import subprocess
+import tempfile
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -12,6 +16,7 @@ from typing import Any
 
 from idlergear.config import find_idlergear_root
 from idlergear.storage import now_iso
+from idlergear.walker import walk_files
 
 
 class TestFramework(str, Enum):
@@ -1307,6 +1312,7 @@ class CoverageMap:
     mappings: dict[str, list[str]]  # source_file -> [test_files]
     reverse_mappings: dict[str, list[str]]  # test_file -> [source_files]
     uncovered: list[str]  # source files without tests
+    test_files: list[str] | None = None  # all test files (None in old maps)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -1316,6 +1322,7 @@ class CoverageMap:
             "mappings": self.mappings,
             "reverse_mappings": self.reverse_mappings,
             "uncovered": self.uncovered,
+            "test_files": self.test_files,
         }
 
     @classmethod
@@ -1327,6 +1334,7 @@ class CoverageMap:
             mappings=data.get("mappings", {}),
             reverse_mappings=data.get("reverse_mappings", {}),
             uncovered=data.get("uncovered", []),
+            test_files=data.get("test_files"),
         )
 
 
@@ -1336,6 +1344,10 @@ def build_coverage_map(project_path: Path | None = None) -> CoverageMap | None:
     Uses convention-based mapping:
     - src/foo.py -> tests/test_foo.py
     - src/bar/baz.py -> tests/bar/test_baz.py
+    - src/bar/__init__.py -> tests/test_bar_*.py
+
+    When the knowledge graph exists, test files are also linked to every
+    source file they import.
     """
     if project_path is None:
         project_path = find_idlergear_root()
@@ -1356,145 +1368,338 @@ def build_coverage_map(project_path: Path | None = None) -> CoverageMap | None:
     if enum is None:
         return None
 
-    test_files = set(enum.test_files)
+    test_files = sorted(set(enum.test_files))
+    pairs = _coverage_pairs(source_files, test_files, framework, project_path)
+    coverage_map = _coverage_map_from_pairs(framework, source_files, test_files, pairs)
+
+    # Save to cache
+    save_coverage_map(coverage_map, project_path)
+
+    return coverage_map
+
+
+def update_coverage_map(
+    changes: list[tuple[str, str]], project_path: Path | None = None
+) -> CoverageMap | None:
+    """Apply changed files to the saved coverage map.
+
+    Only links involving the changed files are recomputed, so keeping the map
+    current does not re-enumerate tests or walk the tree. Edits to existing
+    source files never change the map; edits to test files only matter when
+    the knowledge graph supplies import edges.
+
+    Args:
+        changes: (path, kind) pairs, kind being "created", "modified" or "deleted"
+        project_path: Project root
+
+    Returns:
+        The updated map, or None if no map has been saved yet
+    """
+    if project_path is None:
+        project_path = find_idlergear_root()
+    if project_path is None:
+        project_path = Path.cwd()
+
+    coverage_map = get_coverage_map(project_path)
+    if coverage_map is None:
+        return None
+    if coverage_map.test_files is None:
+        # Saved before test files were recorded; nothing to update from
+        return build_coverage_map(project_path)
+
+    framework = coverage_map.framework
+    sources = set(coverage_map.mappings) | set(coverage_map.uncovered)
+    tests = set(coverage_map.test_files)
+    use_imports = _graph_path(project_path).exists()
+
+    changed_sources: set[str] = set()
+    changed_tests: set[str] = set()
+    for path, kind in changes:
+        if _is_test_file(path, framework):
+            known, changed = tests, changed_tests
+            if kind == "modified" and path in tests and not use_imports:
+                continue
+        elif _is_source_file(path, framework):
+            known, changed = sources, changed_sources
+            if kind == "modified" and path in sources:
+                continue
+        else:
+            continue
+        if kind == "deleted":
+            known.discard(path)
+        else:
+            known.add(path)
+        changed.add(path)
+
+    if not changed_sources and not changed_tests:
+        return coverage_map
+
+    pairs = {
+        (source, test)
+        for source, source_tests in coverage_map.mappings.items()
+        for test in source_tests
+        if source not in changed_sources and test not in changed_tests
+    }
+    pairs |= _coverage_pairs(
+        sorted(sources & changed_sources), sorted(tests), framework, project_path
+    )
+    pairs |= _coverage_pairs(
+        sorted(sources), sorted(tests & changed_tests), framework, project_path
+    )
+
+    coverage_map = _coverage_map_from_pairs(
+        framework, sorted(sources), sorted(tests), pairs
+    )
+    save_coverage_map(coverage_map, project_path)
+    return coverage_map
+
 
-    # Build mappings
+def _coverage_map_from_pairs(
+    framework: str,
+    source_files: list[str],
+    test_files: list[str],
+    pairs: set[tuple[str, str]],
+) -> CoverageMap:
+    """Assemble a CoverageMap from (source, test) links."""
     mappings: dict[str, list[str]] = {}
     reverse_mappings: dict[str, list[str]] = {}
-    uncovered: list[str] = []
-
-    for source_file in source_files:
-        # Find likely test files for this source
-        likely_tests = _find_tests_for_source(source_file, test_files, framework)
-
-        if likely_tests:
-            mappings[source_file] = likely_tests
-            for test in likely_tests:
-                if test not in reverse_mappings:
-                    reverse_mappings[test] = []
-                reverse_mappings[test].append(source_file)
-        else:
-            uncovered.append(source_file)
+    for source, test in sorted(pairs):
+        mappings.setdefault(source, []).append(test)
+        reverse_mappings.setdefault(test, []).append(source)
 
-    coverage_map = CoverageMap(
+    return CoverageMap(
         framework=framework,
         timestamp=now_iso(),
         mappings=mappings,
-        reverse_mappings=reverse_mappings,
-        uncovered=uncovered,
+        reverse_mappings=dict(sorted(reverse_mappings.items())),
+        uncovered=[f for f in source_files if f not in mappings],
+        test_files=test_files,
     )
 
-    # Save to cache
-    save_coverage_map(coverage_map, project_path)
 
-    return coverage_map
+def _coverage_pairs(
+    source_files: list[str],
+    test_files: list[str],
+    framework: str,
+    project_path: Path,
+) -> set[tuple[str, str]]:
+    """Link source files to the test files that likely test them.
 
+    Source files are indexed by module name, and each test file is looked up
+    under the names it refers to (see ``_test_keys``), so the cost is linear
+    in the number of files. Import edges from the knowledge graph are added
+    on top.
+
+    Returns:
+        Set of (source file, test file) pairs
+    """
+    if not source_files or not test_files:
+        return set()
+
+    by_name: dict[str, list[str]] = {}
+    for source in source_files:
+        by_name.setdefault(_source_key(source), []).append(source)
+
+    pairs: set[tuple[str, str]] = set()
+    for test in test_files:
+        for key in _test_keys(test, framework):
+            for source in by_name.get(key, ()):
+                pairs.add((source, test))
+
+    for test, source in _graph_imports(project_path, test_files, source_files):
+        pairs.add((source, test))
+
+    return pairs
+
+
+# Leading test directories that say nothing about the code under test
+_TEST_ROOTS = {"tests", "test", "spec", "specs", "__tests__"}
+
+# Module file names that stand for their directory
+_PACKAGE_FILES = {"__init__", "mod", "index"}
+
+_NAME_SEPARATORS = re.compile(r"[_.\-]+")
+
+
+def _normalize_name(name: str) -> str:
+    return "_".join(t for t in _NAME_SEPARATORS.split(name.lower()) if t)
+
+
+def _source_key(source_file: str) -> str:
+    """Name a source file is matched under: foo for foo.py and foo/__init__.py."""
+    path = Path(source_file)
+    stem = path.stem
+    if stem in _PACKAGE_FILES and path.parent.name:
+        stem = path.parent.name
+    return _normalize_name(stem)
+
+
+def _test_subject(test_file: str, framework: str) -> str:
+    """Strip the test marker from a test file name (test_foo.py -> foo)."""
+    name = Path(test_file).name
+    stem = Path(test_file).stem
+
+    if framework == TestFramework.PYTEST.value:
+        if stem.startswith("test_"):
+            return stem[len("test_") :]
+        return stem.removesuffix("_test")
+    if framework in (TestFramework.JEST.value, TestFramework.VITEST.value):
+        # foo.test.ts and foo.spec.js test foo; __tests__/foo.js tests foo
+        match = re.match(r"(.+?)\.(?:test|spec)\.", name)
+        return match.group(1) if match else stem
+    if framework == TestFramework.DOTNET.value:
+        return stem.removesuffix("Tests").removesuffix("Test")
+    if framework == TestFramework.RSPEC.value:
+        return stem.removesuffix("_spec")
+    return stem.removesuffix("_test")
+
+
+def _test_keys(test_file: str, framework: str) -> set[str]:
+    """Source module names a test file refers to.
+
+    pytest, cargo and JavaScript tests refer to every run of words in their
+    name (test_daemon_changes.py -> daemon, changes, daemon_changes) and to
+    the directories they sit in below the test root (tests/graph/...). Go
+    and RSpec tests are paired by exact name, .NET tests by class name.
+    """
+    subject = _test_subject(test_file, framework)
+
+    if framework == TestFramework.DOTNET.value:
+        return {subject.lower(), subject.rsplit(".", 1)[-1].lower()}
+    if framework in (TestFramework.GO.value, TestFramework.RSPEC.value):
+        return {_normalize_name(subject)}
+
+    tokens = _normalize_name(subject).split("_")
+    keys = {
+        "_".join(tokens[i:j])
+        for i in range(len(tokens))
+        for j in range(i + 1, len(tokens) + 1)
+        if tokens[i]
+    }
+
+    directories = list(Path(test_file).parent.parts)
+    while directories and directories[0] in _TEST_ROOTS:
+        directories.pop(0)
+    keys.update(
+        _normalize_name(d) for d in directories if d not in _TEST_ROOTS
+    )
+    return keys
 
-def _get_source_files(project_path: Path, framework: str) -> list[str]:
-    """Get all source files for a project."""
-    source_files: list[str] = []
+
+def _is_test_file(path: str, framework: str) -> bool:
+    """Whether a project-relative path is a test file for the framework."""
+    rel = Path(path)
+    name = rel.name
 
     if framework == TestFramework.PYTEST.value:
-        # Python source files
-        for pattern in ["src/**/*.py", "**/*.py"]:
-            for path in project_path.glob(pattern):
-                rel = str(path.relative_to(project_path))
-                # Skip test files, venv, etc.
-                if (
-                    "test" not in rel.lower()
-                    and "venv" not in rel
-                    and ".venv" not in rel
-                    and "__pycache__" not in rel
-                    and "conftest" not in rel
-                ):
-                    source_files.append(rel)
+        return name.endswith(".py") and (
+            name.startswith("test_") or name.endswith("_test.py")
+        )
+    if framework == TestFramework.CARGO.value:
+        return name.endswith(".rs") and (
+            rel.parent.name == "tests" or name.endswith("_test.rs")
+        )
+    if framework == TestFramework.GO.value:
+        return name.endswith("_test.go")
+    if framework in (TestFramework.JEST.value, TestFramework.VITEST.value):
+        if rel.suffix not in (".js", ".ts", ".jsx", ".tsx"):
+            return False
+        return (
+            ".test." in name or ".spec." in name or "__tests__" in rel.parts
+        )
+    if framework == TestFramework.DOTNET.value:
+        return name.endswith(("Tests.cs", "Test.cs"))
+    if framework == TestFramework.RSPEC.value:
+        return rel.parts[0] == "spec" and name.endswith("_spec.rb")
+    return False
 
-    elif framework == TestFramework.CARGO.value:
-        for path in project_path.glob("src/**/*.rs"):
-            rel = str(path.relative_to(project_path))
-            if "_test" not in rel and "tests/" not in rel:
-                source_files.append(rel)
 
-    elif framework == TestFramework.GO.value:
-        for path in project_path.glob("**/*.go"):
-            rel = str(path.relative_to(project_path))
-            if "_test.go" not in rel and "vendor/" not in rel:
-                source_files.append(rel)
+def _is_source_file(path: str, framework: str) -> bool:
+    """Whether a project-relative path is a source file for the framework."""
+    if _is_test_file(path, framework):
+        return False
 
-    elif framework in (TestFramework.JEST.value, TestFramework.VITEST.value):
-        for pattern in ["src/**/*.js", "src/**/*.ts", "src/**/*.jsx", "src/**/*.tsx"]:
-            for path in project_path.glob(pattern):
-                rel = str(path.relative_to(project_path))
-                if (
-                    ".test." not in rel
-                    and ".spec." not in rel
-                    and "node_modules" not in rel
-                ):
-                    source_files.append(rel)
+    rel = Path(path)
+    parts = rel.parts
 
-    elif framework == TestFramework.DOTNET.value:
-        for path in project_path.glob("**/*.cs"):
-            rel = str(path.relative_to(project_path))
-            if "Test" not in rel and "bin/" not in rel and "obj/" not in rel:
-                source_files.append(rel)
+    if framework == TestFramework.PYTEST.value:
+        return (
+            rel.suffix == ".py"
+            and rel.name != "conftest.py"
+            and not any(p in _TEST_ROOTS or "venv" in p for p in parts[:-1])
+        )
+    if framework == TestFramework.CARGO.value:
+        return rel.suffix == ".rs" and parts[0] == "src" and "tests" not in parts
+    if framework == TestFramework.GO.value:
+        return rel.suffix == ".go" and "vendor" not in parts
+    if framework in (TestFramework.JEST.value, TestFramework.VITEST.value):
+        return rel.suffix in (".js", ".ts", ".jsx", ".tsx") and parts[0] == "src"
+    if framework == TestFramework.DOTNET.value:
+        return (
+            rel.suffix == ".cs"
+            and "Test" not in path
+            and "bin" not in parts
+            and "obj" not in parts
+        )
+    if framework == TestFramework.RSPEC.value:
+        return rel.suffix == ".rb" and parts[0] in ("lib", "app")
+    return False
 
-    elif framework == TestFramework.RSPEC.value:
-        for pattern in ["lib/**/*.rb", "app/**/*.rb"]:
-            for path in project_path.glob(pattern):
-                rel = str(path.relative_to(project_path))
-                if "_spec" not in rel:
-                    source_files.append(rel)
 
-    return sorted(set(source_files))
+def _graph_path(project_path: Path) -> Path:
+    return project_path / ".idlergear" / "graph.db"
 
 
-def _find_tests_for_source(
-    source_file: str, test_files: set[str], framework: str
-) -> list[str]:
-    """Find test files that likely test a source file."""
-    matches: list[str] = []
-    source_path = Path(source_file)
-    source_name = source_path.stem
-
-    for test_file in test_files:
-        test_path = Path(test_file)
-        test_name = test_path.stem
-
-        # Convention: test_foo.py tests foo.py
-        if framework == TestFramework.PYTEST.value:
-            if test_name == f"test_{source_name}" or test_name == f"{source_name}_test":
-                matches.append(test_file)
-            # Also match if directory structure is similar
-            elif source_name in test_name:
-                matches.append(test_file)
-
-        elif framework == TestFramework.CARGO.value:
-            if test_name == f"{source_name}_test" or source_name in test_name:
-                matches.append(test_file)
-
-        elif framework == TestFramework.GO.value:
-            if test_name == f"{source_name}_test":
-                matches.append(test_file)
-
-        elif framework in (TestFramework.JEST.value, TestFramework.VITEST.value):
-            base_name = (
-                source_name.replace(".tsx", "")
-                .replace(".jsx", "")
-                .replace(".ts", "")
-                .replace(".js", "")
-            )
-            if base_name in test_name:
-                matches.append(test_file)
+def _graph_imports(
+    project_path: Path, test_files: list[str], source_files: list[str]
+) -> list[tuple[str, str]]:
+    """(test file, source file) import edges from the knowledge graph.
+
+    Returns an empty list when the project has no graph or it cannot be read,
+    leaving the name-based mapping on its own.
+    """
+    if not _graph_path(project_path).exists():
+        return []
+
+    try:
+        from idlergear.graph import query_database
+        from idlergear.graph.queries import query_file_imports
+
+        with query_database(project_path) as db:
+            return query_file_imports(db, test_files, source_files)
+    except Exception:
+        return []
+
 
-        elif framework == TestFramework.DOTNET.value:
-            if f"{source_name}Tests" in test_name or f"{source_name}Test" in test_name:
-                matches.append(test_file)
+def _get_source_files(project_path: Path, framework: str) -> list[str]:
+    """Get all source files for a project.
+
+    Uses the shared pruned walker, so virtualenvs, node_modules, build output
+    and gitignored paths are never descended into.
+    """
+    if framework == TestFramework.PYTEST.value:
+        roots, suffixes = [""], (".py",)
+    elif framework == TestFramework.CARGO.value:
+        roots, suffixes = ["src"], (".rs",)
+    elif framework == TestFramework.GO.value:
+        roots, suffixes = [""], (".go",)
+    elif framework in (TestFramework.JEST.value, TestFramework.VITEST.value):
+        roots, suffixes = ["src"], (".js", ".ts", ".jsx", ".tsx")
+    elif framework == TestFramework.DOTNET.value:
+        roots, suffixes = [""], (".cs",)
+    elif framework == TestFramework.RSPEC.value:
+        roots, suffixes = ["lib", "app"], (".rb",)
+    else:
+        return []
 
-        elif framework == TestFramework.RSPEC.value:
-            if test_name == f"{source_name}_spec":
-                matches.append(test_file)
+    source_files: set[str] = set()
+    for top in roots:
+        for rel in walk_files(project_path / top, suffixes=suffixes):
+            rel = f"{top}/{rel}" if top else rel
+            if _is_source_file(rel, framework):
+                source_files.add(rel)
 
-    return matches
+    return sorted(source_files)
 
 
 def save_coverage_map(
@@ -1616,7 +1821,11 @@ def get_tests_for_changes(
 ) -> list[str]:
     """Get test files that should run based on changed files.
 
-    Returns list of test file paths.
+    When per-test impact data has been recorded (see ``record_test_impact``),
+    it selects the individual tests that executed the changed lines; the
+    coverage map covers files the recording did not measure.
+
+    Returns list of test file paths and pytest node IDs.
     """
     if project_path is None:
         project_path = find_idlergear_root()
@@ -1627,24 +1836,42 @@ def get_tests_for_changes(
     if not changed:
         return []
 
-    # Build coverage map if needed
-    coverage_map = get_coverage_map(project_path)
-    if coverage_map is None:
+    impacted: list[str] = []
+    impact = get_impact_map(project_path)
+    if impact is not None:
+        impacted, changed = select_impacted_tests(impact, changed, project_path)
+        if not changed:
+            return sorted(impacted)
+
+    # Build coverage map if needed, or fold in files added or removed since
+    if get_coverage_map(project_path) is None:
         coverage_map = build_coverage_map(project_path)
+    else:
+        coverage_map = update_coverage_map(
+            [
+                (file, "modified" if (project_path / file).exists() else "deleted")
+                for file in changed
+            ],
+            project_path,
+        )
     if coverage_map is None:
-        return []
+        return sorted(impacted)
 
+    test_files = set(coverage_map.test_files or coverage_map.reverse_mappings)
     tests_to_run: set[str] = set()
 
     for file in changed:
         # If it's a test file itself, include it
-        if file in coverage_map.reverse_mappings:
+        if file in test_files:
             tests_to_run.add(file)
 
         # If it's a source file, include its tests
         if file in coverage_map.mappings:
             tests_to_run.update(coverage_map.mappings[file])
 
+    # Whole test files already include their selected tests
+    tests_to_run.update(t for t in impacted if t.split("::", 1)[0] not in tests_to_run)
+
     return sorted(tests_to_run)
 
 
@@ -1732,6 +1959,412 @@ def run_changed_tests(
     return run_tests(project_path, modified_config, extra_args=test_args)
 
 
+# =============================================================================
+# Test Impact Analysis
+# =============================================================================
+
+# Run by ``coverage run``: pytest with each test measured in its own context
+_IMPACT_RUNNER = """\
+import os
+import sys
+
+import coverage
+import pytest
+
+
+class ImpactContexts:
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        cov = coverage.Coverage.current()
+        if cov is not None:
+            cov.switch_context(item.nodeid)
+        yield
+        if cov is not None:
+            cov.switch_context("")
+
+
+# Like python -m pytest, which puts the working directory on sys.path
+sys.path.insert(0, os.getcwd())
+sys.exit(pytest.main(sys.argv[1:], plugins=[ImpactContexts()]))
+"""
+
+_IMPACT_RCFILE = """\
+[run]
+data_file = {data_file}
+relative_files = True
+source = .
+omit = .idlergear/*
+"""
+
+
+@dataclass
+class ImpactMap:
+    """Which tests executed which source lines in a recorded run.
+
+    Test sets are bitmaps over ``tests``: bit i stands for ``tests[i]``.
+    """
+
+    framework: str
+    timestamp: str
+    commit: str  # commit the line numbers refer to
+    tests: list[str]  # pytest node IDs
+    lines: dict[str, dict[int, int]]  # source_file -> line -> test bitmap
+
+    def tests_for(self, bitmap: int) -> list[str]:
+        """Node IDs of the tests in a bitmap."""
+        return [test for i, test in enumerate(self.tests) if bitmap >> i & 1]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary.
+
+        Lines are grouped by test bitmap and stored as ranges, since most
+        lines of a function are executed by the same tests.
+        """
+        files: dict[str, list[list[str]]] = {}
+        for source_file, line_tests in sorted(self.lines.items()):
+            groups: dict[int, list[int]] = {}
+            for line, bitmap in sorted(line_tests.items()):
+                groups.setdefault(bitmap, []).append(line)
+            files[source_file] = [
+                [_encode_bitmap(bitmap), _format_ranges(lines)]
+                for bitmap, lines in groups.items()
+            ]
+        return {
+            "framework": self.framework,
+            "timestamp": self.timestamp,
+            "commit": self.commit,
+            "tests": self.tests,
+            "files": files,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ImpactMap":
+        """Create from dictionary."""
+        lines: dict[str, dict[int, int]] = {}
+        for source_file, groups in data.get("files", {}).items():
+            line_tests = lines.setdefault(source_file, {})
+            for encoded, ranges in groups:
+                bitmap = _decode_bitmap(encoded)
+                for line in _parse_ranges(ranges):
+                    line_tests[line] = bitmap
+        return cls(
+            framework=data.get("framework", "unknown"),
+            timestamp=data.get("timestamp", ""),
+            commit=data.get("commit", ""),
+            tests=data.get("tests", []),
+            lines=lines,
+        )
+
+
+def _encode_bitmap(bitmap: int) -> str:
+    return base64.b64encode(
+        bitmap.to_bytes((bitmap.bit_length() + 7) // 8, "little")
+    ).decode("ascii")
+
+
+def _decode_bitmap(encoded: str) -> int:
+    return int.from_bytes(base64.b64decode(encoded), "little")
+
+
+def _format_ranges(numbers: list[int]) -> str:
+    """Format sorted numbers as ranges: [1, 2, 3, 7] -> "1-3,7"."""
+    ranges: list[str] = []
+    start = prev = numbers[0]
+    for n in numbers[1:] + [None]:
+        if n is not None and n == prev + 1:
+            prev = n
+            continue
+        ranges.append(str(start) if start == prev else f"{start}-{prev}")
+        if n is not None:
+            start = prev = n
+    return ",".join(ranges)
+
+
+def _parse_ranges(ranges: str) -> list[int]:
+    numbers: list[int] = []
+    for part in ranges.split(","):
+        start, _, end = part.partition("-")
+        numbers.extend(range(int(start), int(end or start) + 1))
+    return numbers
+
+
+def record_test_impact(
+    project_path: Path | None = None,
+    extra_args: str | None = None,
+) -> tuple[ImpactMap | None, TestResult | None, str]:
+    """Run the test suite under coverage.py, recording what each test executes.
+
+    Each test runs in its own coverage.py dynamic context, so the recorded
+    data says which tests executed every source line. The run's results are
+    saved like ``run_tests``. Only pytest is supported; coverage.py must be
+    installed in the project's environment.
+
+    Args:
+        project_path: Project root
+        extra_args: Additional pytest arguments (avoid pytest-xdist, whose
+            workers are not measured)
+
+    Returns:
+        Tuple of (ImpactMap or None on failure, TestResult or None, output)
+    """
+    if project_path is None:
+        project_path = find_idlergear_root()
+    if project_path is None:
+        project_path = Path.cwd()
+
+    config = detect_framework(project_path)
+    if config is None or config.framework != TestFramework.PYTEST.value:
+        return None, None, "Test impact recording requires pytest."
+
+    check = subprocess.run(
+        ["python", "-c", "import coverage"],
+        cwd=project_path,
+        capture_output=True,
+        text=True,
+    )
+    if check.returncode != 0:
+        return None, None, "Test impact recording requires coverage.py: pip install coverage"
+
+    commit = _snapshot_commit(project_path)
+
+    with tempfile.TemporaryDirectory(prefix="idlergear-impact-") as tmp:
+        tmp_path = Path(tmp)
+        runner = tmp_path / "run_pytest.py"
+        runner.write_text(_IMPACT_RUNNER)
+        rcfile = tmp_path / "coveragerc"
+        data_file = tmp_path / ".coverage"
+        rcfile.write_text(_IMPACT_RCFILE.format(data_file=data_file))
+
+        run_config = TestConfig(
+            framework=config.framework,
+            command=(
+                f"python -m coverage run --rcfile={shlex.quote(str(rcfile))} "
+                f"{shlex.quote(str(runner))}"
+            ),
+            test_dir=config.test_dir,
+            test_pattern=config.test_pattern,
+        )
+        result, output = run_tests(project_path, run_config, extra_args=extra_args)
+
+        if not data_file.exists():
+            return None, result, output
+        impact = _read_impact_data(data_file, commit)
+
+    save_impact_map(impact, project_path)
+    return impact, result, output
+
+
+def _snapshot_commit(project_path: Path) -> str:
+    """Commit matching the working tree, for diffing against later.
+
+    ``git stash create`` records uncommitted edits to tracked files as a
+    dangling commit without touching the working tree or stash list; with
+    a clean tree it prints nothing and HEAD is used.
+    """
+    for command in (["git", "stash", "create"], ["git", "rev-parse", "HEAD"]):
+        try:
+            proc = subprocess.run(
+                command, cwd=project_path, capture_output=True, text=True
+            )
+        except Exception:
+            return ""
+        if proc.returncode == 0 and proc.stdout.strip():
+            return proc.stdout.strip()
+    return ""
+
+
+def _read_impact_data(data_file: Path, commit: str) -> ImpactMap:
+    """Build an ImpactMap from a coverage.py data file.
+
+    Reads coverage.py's SQLite schema directly (``file``, ``context`` and
+    ``line_bits`` tables, lines stored as numbits), so coverage.py is only
+    needed in the environment that ran the tests.
+    """
+    framework = TestFramework.PYTEST.value
+    test_ids: dict[str, int] = {}
+    lines: dict[str, dict[int, int]] = {}
+
+    conn = sqlite3.connect(data_file)
+    try:
+        rows = conn.execute(
+            "SELECT file.path, context.context, line_bits.numbits"
+            " FROM line_bits"
+            " JOIN file ON file.id = line_bits.file_id"
+            " JOIN context ON context.id = line_bits.context_id"
+            " ORDER BY context.context, file.path"
+        ).fetchall()
+    finally:
+        conn.close()
+
+    for path, context, numbits in rows:
+        # Lines run at import time are recorded without a test context
+        if not context:
+            continue
+        path = Path(path).as_posix()
+        if _is_test_file(path, framework):
+            continue
+        # Parametrized cases share their function's bit
+        test_id = context.split("[", 1)[0]
+        bit = 1 << test_ids.setdefault(test_id, len(test_ids))
+
+        line_tests = lines.setdefault(path, {})
+        executed = int.from_bytes(numbits, "little")
+        line = 0
+        while executed:
+            if executed & 1:
+                line_tests[line] = line_tests.get(line, 0) | bit
+            executed >>= 1
+            line += 1
+
+    return ImpactMap(
+        framework=framework,
+        timestamp=now_iso(),
+        commit=commit,
+        tests=list(test_ids),
+        lines=lines,
+    )
+
+
+def save_impact_map(impact: ImpactMap, project_path: Path | None = None) -> None:
+    """Save recorded test impact data."""
+    tests_dir = get_tests_dir(project_path)
+    if tests_dir is None:
+        return
+
+    tests_dir.mkdir(parents=True, exist_ok=True)
+    impact_file = tests_dir / "impact.json"
+    impact_file.write_text(json.dumps(impact.to_dict()) + "\n")
+
+
+def get_impact_map(project_path: Path | None = None) -> ImpactMap | None:
+    """Get recorded test impact data."""
+    tests_dir = get_tests_dir(project_path)
+    if tests_dir is None:
+        return None
+
+    impact_file = tests_dir / "impact.json"
+    if not impact_file.exists():
+        return None
+
+    try:
+        return ImpactMap.from_dict(json.loads(impact_file.read_text()))
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def select_impacted_tests(
+    impact: ImpactMap, changed: list[str], project_path: Path
+) -> tuple[list[str], list[str]]:
+    """Select the recorded tests that executed changed lines.
+
+    Changed lines are taken from a diff against the commit the data was
+    recorded at. A change to a line no test executed on its own (import-time
+    code such as signatures and constants, or code that never ran) selects
+    every test that executed the file.
+
+    Args:
+        impact: Recorded impact data
+        changed: Changed files
+        project_path: Project root
+
+    Returns:
+        Tuple of (selected test node IDs, changed files without impact data)
+    """
+    changed_lines = _changed_lines(
+        project_path, impact.commit, [f for f in changed if f in impact.lines]
+    )
+
+    selected = 0
+    unknown: list[str] = []
+    for file in changed:
+        line_tests = impact.lines.get(file)
+        if line_tests is None:
+            unknown.append(file)
+            continue
+
+        any_test = 0
+        for bitmap in line_tests.values():
+            any_test |= bitmap
+        touched = changed_lines.get(file)
+        if touched is None:
+            selected |= any_test
+            continue
+        for line in touched:
+            selected |= line_tests.get(line, any_test)
+
+    return impact.tests_for(selected), unknown
+
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? ")
+
+
+def _changed_lines(
+    project_path: Path, commit: str, files: list[str]
+) -> dict[str, set[int]]:
+    """Lines of each file changed since a commit, numbered as in that commit.
+
+    Files missing from the result could not be diffed (untracked, or the
+    commit is unknown) and should be treated as wholly changed.
+    """
+    if not commit or not files:
+        return {}
+    try:
+        proc = subprocess.run(
+            [
+                "git",
+                "diff",
+                "-U0",
+                "--no-color",
+                "--no-ext-diff",
+                "--no-renames",
+                commit,
+                "--",
+                *files,
+            ],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+        )
+        untracked = subprocess.run(
+            ["git", "ls-files", "--others", "--exclude-standard", "--", *files],
+            cwd=project_path,
+            capture_output=True,
+            text=True,
+        )
+    except Exception:
+        return {}
+    if proc.returncode != 0 or untracked.returncode != 0:
+        return {}
+
+    # Files the diff does not mention are unchanged since the recording
+    changed: dict[str, set[int]] = {file: set() for file in files}
+    for file in untracked.stdout.splitlines():
+        changed.pop(file, None)
+
+    current: set[int] | None = None
+    in_header = False
+    for line in proc.stdout.splitlines():
+        if line.startswith("diff --git "):
+            current, in_header = None, True
+        elif in_header and line.startswith("--- "):
+            path = line[4:]
+            if path.startswith("a/"):
+                current = changed.setdefault(path[2:], set())
+        elif match := _HUNK_HEADER.match(line):
+            in_header = False
+            if current is None:
+                continue
+            start = int(match.group(1))
+            count = int(match.group(2) or 1)
+            if count == 0:
+                # Pure insertion after line `start`: both neighbours are affected
+                current.update({start, start + 1})
+            else:
+                current.update(range(start, start + count))
+
+    return changed
+
+
 # =============================================================================
 # External Test Detection (#136)
 # =============================================================================
@@ -5,12 +5,39 @@ Provides abstract base class for all views and view manager for switching betwee
 
 from __future__ import annotations
 
-from typing import Any
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
 
 from textual.reactive import reactive
 from textual.widgets import Static, Tree
+from textual.widgets.tree import TreeNode
 from textual.containers import Container
 
+# Number of children materialised each time a lazy group is expanded or paged
+PAGE_SIZE = 200
+
+
+@dataclass
+class LazyGroup:
+    """Children of a tree node that are only created when the node is shown.
+
+    Attributes:
+        items: Backing items for the group (not copied)
+        add_child: Callable that adds the child node for one item
+        loaded: Number of items already added as tree leaves
+        more_node: The "show next N" leaf, if more items remain
+    """
+
+    items: Sequence[Any]
+    add_child: Callable[[TreeNode, Any], Any]
+    loaded: int = 0
+    more_node: TreeNode | None = None
+
+    @property
+    def remaining(self) -> int:
+        """Number of items not yet added to the tree."""
+        return len(self.items) - self.loaded
+
 
 class BaseView(Static):
     """Abstract base class for all TUI views.
@@ -42,6 +69,10 @@ class BaseView(Static):
         self._tree: Tree[dict] | None = None
         self._rebuilding = False  # Flag to prevent recursive rebuilds
         self._data_loaded = False  # Track if data has been loaded (for lazy loading)
+        self.page_size = PAGE_SIZE
+        self._lazy_groups: dict[TreeNode, LazyGroup] = {}
+        self._more_nodes: dict[TreeNode, TreeNode] = {}  # "show next" leaf -> group
+        self._model_cache: dict[str, tuple[dict[str, Any], Any]] = {}
 
         # Setup logging
         import logging
@@ -69,6 +100,103 @@ class BaseView(Static):
             f"{self.__class__.__name__} must implement refresh_data()"
         )
 
+    def cached_model(self, key: str, builder: Callable[[dict[str, Any]], Any]) -> Any:
+        """Return a model derived from ``self.data``, building it at most once.
+
+        Grouping thousands of items is only redone when the data dict is
+        replaced (e.g. by refresh_data()), not on every tree rebuild.
+
+        Args:
+            key: Name of the model within this view
+            builder: Callable that derives the model from the data dict
+        """
+        data = self.data
+        cached = self._model_cache.get(key)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        model = builder(data)
+        self._model_cache[key] = (data, model)
+        return model
+
+    def add_lazy_group(
+        self,
+        parent: TreeNode,
+        label: str,
+        items: Sequence[Any],
+        add_child: Callable[[TreeNode, Any], Any],
+        data: dict[str, Any] | None = None,
+        expand: bool = False,
+    ) -> TreeNode:
+        """Add a group node whose children are created on first expand.
+
+        Only the first page of children is materialised; a trailing
+        "show next N" leaf loads further pages on selection. Children may
+        themselves be lazy groups.
+
+        Args:
+            parent: Node to add the group under
+            label: Group label
+            items: Items backing the group's children
+            add_child: Callable ``(node, item)`` that adds one child to node
+            data: Data for the group node itself
+            expand: Expand (and populate) the group immediately
+
+        Returns:
+            The group node
+        """
+        node = parent.add(
+            label, data=data, expand=expand and bool(items), allow_expand=bool(items)
+        )
+        self._lazy_groups[node] = LazyGroup(items=items, add_child=add_child)
+        if expand:
+            self.load_next_page(node)
+        return node
+
+    def load_next_page(self, node: TreeNode) -> int:
+        """Materialise the next page of a lazy group's children.
+
+        Args:
+            node: Group node created by add_lazy_group()
+
+        Returns:
+            Number of children added
+        """
+        group = self._lazy_groups.get(node)
+        if group is None or group.remaining <= 0:
+            return 0
+
+        if group.more_node is not None:
+            self._more_nodes.pop(group.more_node, None)
+            group.more_node.remove()
+            group.more_node = None
+
+        end = min(group.loaded + self.page_size, len(group.items))
+        for item in group.items[group.loaded : end]:
+            group.add_child(node, item)
+        added = end - group.loaded
+        group.loaded = end
+
+        if group.remaining > 0:
+            next_count = min(self.page_size, group.remaining)
+            group.more_node = node.add_leaf(
+                f"… show next {next_count} ({group.remaining} more)"
+            )
+            self._more_nodes[group.more_node] = node
+        return added
+
+    def on_tree_node_expanded(self, event: Tree.NodeExpanded) -> None:
+        """Populate lazy groups the first time they are expanded."""
+        group = self._lazy_groups.get(event.node)
+        if group is not None and group.loaded == 0:
+            self.load_next_page(event.node)
+
+    def on_tree_node_selected(self, event: Tree.NodeSelected) -> None:
+        """Load the next page when a "show next N" leaf is selected."""
+        group_node = self._more_nodes.get(event.node)
+        if group_node is not None:
+            self.load_next_page(group_node)
+            event.stop()
+
     def on_mount(self) -> None:
         """Called when view is mounted."""
         self.logger.info(f"on_mount() - View {self.view_id} ({self.view_name}) mounting")
@@ -112,6 +240,7 @@ class BaseView(Static):
             if self._tree is None:
                 # First time - create and mount tree
                 self.logger.debug(f"_rebuild_tree() - Creating initial tree for {self.view_name}")
+                self._reset_lazy_groups()
                 self._tree = self.compose_tree()
                 self._tree.show_root = True
                 self._tree.show_guides = True
@@ -133,6 +262,7 @@ class BaseView(Static):
                     self.logger.warning(f"_rebuild_tree() - Error removing tree: {e}")
 
                 # Create and mount new tree
+                self._reset_lazy_groups()
                 self._tree = self.compose_tree()
                 self._tree.show_root = True
                 self._tree.show_guides = True
@@ -146,6 +276,11 @@ class BaseView(Static):
         finally:
             self._rebuilding = False
 
+    def _reset_lazy_groups(self) -> None:
+        """Forget lazy groups belonging to the previous tree."""
+        self._lazy_groups.clear()
+        self._more_nodes.clear()
+
     def watch_data(self, data: dict[str, Any]) -> None:
         """React to data changes."""
         if self._rebuilding:
@@ -15,6 +15,120 @@ from idlergear.file_registry import FileRegistry
 
 from .base_view import BaseView
 
+PRIORITY_ORDER = ["critical", "high", "medium", "low", "none"]
+
+
+def _add_task_leaf(node, task: dict) -> None:
+    node.add_leaf(f"#{task['id']} {task['title']}", data={"type": "task", "task": task})
+
+
+def _add_note_leaf(node, note: dict) -> None:
+    # Extract first line of content as title
+    content = note.get("content", "")
+    title = content.split("\n")[0][:50] if content else f"Note {note['id']}"
+    node.add_leaf(f"#{note['id']} {title}", data={"type": "note", "note": note})
+
+
+def _add_reference_leaf(node, ref: dict) -> None:
+    node.add_leaf(
+        ref.get("title", "Untitled"), data={"type": "reference", "reference": ref}
+    )
+
+
+def _add_file_leaf(node, file_info: dict) -> None:
+    node.add_leaf(Path(file_info["path"]).name, data={"type": "file", "file": file_info})
+
+
+def _add_gap_leaf(node, gap: dict) -> None:
+    node.add_leaf(gap.get("description", "Unknown gap"), data={"type": "gap", "gap": gap})
+
+
+def _add_suggestion_leaf(node, entry: tuple[int, dict]) -> None:
+    i, suggestion = entry
+    priority = suggestion.get("priority", 0)
+    confidence = int(suggestion.get("confidence", 0.0) * 100)
+    title = suggestion.get("title", "")
+    node.add_leaf(f"{i}. [{priority}/10, {confidence}%] {title}")
+
+
+def _group_tasks_by_priority(data: dict) -> dict[str, list[dict]]:
+    """Group open tasks by priority, in priority order, skipping empty groups."""
+    by_priority: dict[str, list[dict]] = {p: [] for p in PRIORITY_ORDER}
+    for task in data.get("tasks", []):
+        priority = task.get("priority") or "none"
+        by_priority.setdefault(priority, []).append(task)
+    return {p: tasks for p, tasks in by_priority.items() if tasks}
+
+
+def _group_notes_by_tag(data: dict) -> dict[str, list[dict]]:
+    """Group notes by tag (sorted), with untagged notes under "untagged"."""
+    by_tag: dict[str, list[dict]] = {}
+    for note in data.get("notes", []):
+        for tag in note.get("tags") or ["untagged"]:
+            by_tag.setdefault(tag, []).append(note)
+    return dict(sorted(by_tag.items()))
+
+
+def _group_files_by_dir(data: dict) -> dict[str, list[dict]]:
+    """Group annotated files by parent directory (sorted)."""
+    by_dir: dict[str, list[dict]] = {}
+    for file_info in data.get("files", []):
+        path = Path(file_info.get("path", ""))
+        dir_name = str(path.parent) if path.parent != Path(".") else "root"
+        by_dir.setdefault(dir_name, []).append(file_info)
+    return dict(sorted(by_dir.items()))
+
+
+def _group_tasks_by_milestone(data: dict) -> dict[str, list[dict]]:
+    """Group tasks by milestone (sorted), with "No Milestone" for the rest."""
+    by_milestone: dict[str, list[dict]] = {}
+    for task in data.get("tasks", []):
+        milestone = task.get("milestone") or "No Milestone"
+        by_milestone.setdefault(milestone, []).append(task)
+    return dict(sorted(by_milestone.items()))
+
+
+def _group_gaps_by_severity(data: dict) -> dict[str, list[dict]]:
+    """Group gaps by severity, highest first."""
+    by_severity: dict[str, list[dict]] = {"high": [], "medium": [], "low": []}
+    for gap in data.get("gaps", []):
+        by_severity.setdefault(gap.get("severity", "low"), []).append(gap)
+    return by_severity
+
+
+def _group_tasks_by_time(data: dict) -> dict[str, list[dict]]:
+    """Bucket tasks into today / this week / this month / older by creation."""
+    now = datetime.now(timezone.utc)
+    today = now.date()
+    week_ago = now - timedelta(days=7)
+    month_ago = now - timedelta(days=30)
+
+    buckets: dict[str, list[dict]] = {
+        "Today": [],
+        "This Week": [],
+        "This Month": [],
+        "Older": [],
+    }
+    for task in data.get("tasks", []):
+        created_str = task.get("created")
+        if not created_str:
+            buckets["Older"].append(task)
+            continue
+
+        try:
+            created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
+            if created.date() == today:
+                buckets["Today"].append(task)
+            elif created >= week_ago:
+                buckets["This Week"].append(task)
+            elif created >= month_ago:
+                buckets["This Month"].append(task)
+            else:
+                buckets["Older"].append(task)
+        except:
+            buckets["Older"].append(task)
+    return buckets
+
 
 class ByTypeView(BaseView):
     """View 1: Organize by knowledge type (tasks, notes, references, files)."""
@@ -25,114 +139,79 @@ class ByTypeView(BaseView):
         )
 
     def compose_tree(self) -> Tree[dict]:
-        """Organize by type: tasks, notes, references, files."""
+        """Organize by type: tasks, notes, references, files.
+
+        Group nodes are lazy: their children are only created when expanded,
+        a page at a time, so large knowledge bases open quickly.
+        """
         root = Tree("📚 Knowledge Base (By Type)")
         root.data = {}
         root.root.expand()  # Expand root node by default
 
         # Tasks organized by priority
-        tasks = self.data.get("tasks", [])
-        if tasks:
+        by_priority = self.cached_model("tasks_by_priority", _group_tasks_by_priority)
+        if by_priority:
             task_node = root.root.add("📋 Tasks", data={"type": "tasks"}, expand=True)
-
-            # Group by priority
-            by_priority = {
-                "critical": [],
-                "high": [],
-                "medium": [],
-                "low": [],
-                "none": [],
-            }
-            for task in tasks:
-                priority = task.get("priority") or "none"
-                by_priority[priority].append(task)
-
-            for priority in ["critical", "high", "medium", "low", "none"]:
-                tasks_in_priority = by_priority[priority]
-                if tasks_in_priority:
-                    priority_label = (
-                        priority.upper() if priority != "none" else "No Priority"
-                    )
-                    priority_node = task_node.add(
-                        f"[{priority_label}] ({len(tasks_in_priority)})",
-                        data={"type": "priority", "priority": priority},
-                    )
-                    for task in tasks_in_priority[:10]:  # Limit to 10 per priority
-                        priority_node.add_leaf(
-                            f"#{task['id']} {task['title']}",
-                            data={"type": "task", "task": task},
-                        )
+            for priority, tasks_in_priority in by_priority.items():
+                priority_label = (
+                    priority.upper() if priority != "none" else "No Priority"
+                )
+                self.add_lazy_group(
+                    task_node,
+                    f"[{priority_label}] ({len(tasks_in_priority)})",
+                    tasks_in_priority,
+                    _add_task_leaf,
+                    data={"type": "priority", "priority": priority},
+                )
 
         # Notes organized by tags
-        notes = self.data.get("notes", [])
-        if notes:
+        by_tag = self.cached_model("notes_by_tag", _group_notes_by_tag)
+        if by_tag:
             note_node = root.root.add("📝 Notes", data={"type": "notes"}, expand=True)
-
-            # Group by tags
-            by_tag = {}
-            for note in notes:
-                tags = note.get("tags", [])
-                if not tags:
-                    tags = ["untagged"]
-                for tag in tags:
-                    if tag not in by_tag:
-                        by_tag[tag] = []
-                    by_tag[tag].append(note)
-
-            for tag, tag_notes in sorted(by_tag.items()):
-                tag_node = note_node.add(
-                    f"#{tag} ({len(tag_notes)})", data={"type": "tag", "tag": tag}
+            for tag, tag_notes in by_tag.items():
+                self.add_lazy_group(
+                    note_node,
+                    f"#{tag} ({len(tag_notes)})",
+                    tag_notes,
+                    _add_note_leaf,
+                    data={"type": "tag", "tag": tag},
                 )
-                for note in tag_notes[:10]:  # Limit to 10 per tag
-                    # Extract first line of content as title
-                    content = note.get('content', '')
-                    title = content.split('\n')[0][:50] if content else f"Note {note['id']}"
-                    tag_node.add_leaf(
-                        f"#{note['id']} {title}",
-                        data={"type": "note", "note": note},
-                    )
 
-        # References organized by category
+        # References
         references = self.data.get("references", [])
         if references:
-            ref_node = root.root.add(
-                "📖 References", data={"type": "references"}, expand=False
+            self.add_lazy_group(
+                root.root,
+                "📖 References",
+                references,
+                _add_reference_leaf,
+                data={"type": "references"},
             )
-            for ref in references[:20]:  # Limit to 20
-                ref_node.add_leaf(
-                    ref.get("title", "Untitled"),
-                    data={"type": "reference", "reference": ref},
-                )
 
-        # Files organized by directory
-        files = self.data.get("files", [])
-        if files:
-            file_node = root.root.add(
-                "📁 Annotated Files", data={"type": "files"}, expand=False
+        # Files organized by directory (directories are paged too)
+        by_dir = self.cached_model("files_by_dir", _group_files_by_dir)
+        if by_dir:
+            self.add_lazy_group(
+                root.root,
+                "📁 Annotated Files",
+                list(by_dir.items()),
+                self._add_directory_group,
+                data={"type": "files"},
             )
 
-            # Group by directory
-            by_dir = {}
-            for file_info in files:
-                path = Path(file_info.get("path", ""))
-                dir_name = str(path.parent) if path.parent != Path(".") else "root"
-                if dir_name not in by_dir:
-                    by_dir[dir_name] = []
-                by_dir[dir_name].append(file_info)
-
-            for dir_name, dir_files in sorted(by_dir.items()):
-                dir_node = file_node.add(
-                    f"{dir_name}/ ({len(dir_files)})",
-                    data={"type": "directory", "path": dir_name},
-                )
-                for file_info in dir_files[:10]:
-                    dir_node.add_leaf(
-                        Path(file_info["path"]).name,
-                        data={"type": "file", "file": file_info},
-                    )
-
         return root
 
+    def _add_directory_group(self, parent, entry: tuple[str, list[dict]]) -> None:
+        """Add a lazy directory node listing its annotated files."""
+        dir_name, dir_files = entry
+        self.add_lazy_group(
+            parent,
+            f"{dir_name}/ ({len(dir_files)})",
+            dir_files,
+            _add_file_leaf,
+            data={"type": "directory", "path": dir_name},
+        )
+
     async def refresh_data(self) -> None:
         """Load all knowledge types."""
         self.logger.info(f"refresh_data() - ByTypeView starting data load")
@@ -213,27 +292,16 @@ class ByProjectView(BaseView):
         root = Tree("📊 Knowledge Base (By Project)")
         root.data = {}
 
-        # Group tasks by milestone
-        tasks = self.data.get("tasks", [])
-        by_milestone = {}
-
-        for task in tasks:
-            milestone = task.get("milestone") or "No Milestone"
-            if milestone not in by_milestone:
-                by_milestone[milestone] = []
-            by_milestone[milestone].append(task)
-
-        for milestone, milestone_tasks in sorted(by_milestone.items()):
-            milestone_node = root.root.add(
+        by_milestone = self.cached_model("tasks_by_milestone", _group_tasks_by_milestone)
+        for milestone, milestone_tasks in by_milestone.items():
+            self.add_lazy_group(
+                root.root,
                 f"{milestone} ({len(milestone_tasks)})",
+                milestone_tasks,
+                _add_task_leaf,
                 data={"type": "milestone", "milestone": milestone},
-                expand=True if milestone != "No Milestone" else False,
+                expand=milestone != "No Milestone",
             )
-            for task in milestone_tasks[:20]:
-                milestone_node.add_leaf(
-                    f"#{task['id']} {task['title']}",
-                    data={"type": "task", "task": task},
-                )
 
         return root
 
@@ -270,68 +338,16 @@ class ByTimeView(BaseView):
         root = Tree("🕐 Knowledge Base (By Time)")
         root.data = {}
 
-        now = datetime.now(timezone.utc)
-        today = now.date()
-        week_ago = now - timedelta(days=7)
-        month_ago = now - timedelta(days=30)
-
-        # Categorize tasks by time
-        today_items = []
-        week_items = []
-        month_items = []
-        older_items = []
-
-        tasks = self.data.get("tasks", [])
-        for task in tasks:
-            created_str = task.get("created")
-            if not created_str:
-                older_items.append(task)
-                continue
-
-            try:
-                created = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-                if created.date() == today:
-                    today_items.append(task)
-                elif created >= week_ago:
-                    week_items.append(task)
-                elif created >= month_ago:
-                    month_items.append(task)
-                else:
-                    older_items.append(task)
-            except:
-                older_items.append(task)
-
-        # Add time-based nodes
-        if today_items:
-            today_node = root.root.add(f"Today ({len(today_items)})", expand=True)
-            for task in today_items[:20]:
-                today_node.add_leaf(
-                    f"#{task['id']} {task['title']}",
-                    data={"type": "task", "task": task},
-                )
-
-        if week_items:
-            week_node = root.root.add(f"This Week ({len(week_items)})", expand=True)
-            for task in week_items[:20]:
-                week_node.add_leaf(
-                    f"#{task['id']} {task['title']}",
-                    data={"type": "task", "task": task},
-                )
-
-        if month_items:
-            month_node = root.root.add(f"This Month ({len(month_items)})", expand=False)
-            for task in month_items[:20]:
-                month_node.add_leaf(
-                    f"#{task['id']} {task['title']}",
-                    data={"type": "task", "task": task},
-                )
-
-        if older_items:
-            older_node = root.root.add(f"Older ({len(older_items)})", expand=False)
-            for task in older_items[:20]:
-                older_node.add_leaf(
-                    f"#{task['id']} {task['title']}",
-                    data={"type": "task", "task": task},
+        # Recent buckets start expanded; older ones load on demand
+        buckets = self.cached_model("tasks_by_time", _group_tasks_by_time)
+        for bucket, bucket_tasks in buckets.items():
+            if bucket_tasks:
+                self.add_lazy_group(
+                    root.root,
+                    f"{bucket} ({len(bucket_tasks)})",
+                    bucket_tasks,
+                    _add_task_leaf,
+                    expand=bucket in ("Today", "This Week"),
                 )
 
         return root
@@ -373,24 +389,16 @@ class GapsView(BaseView):
         if not gaps:
             root.root.add_leaf("No knowledge gaps detected")
         else:
-            # Group by severity
-            by_severity = {"high": [], "medium": [], "low": []}
-            for gap in gaps:
-                severity = gap.get("severity", "low")
-                by_severity[severity].append(gap)
-
-            for severity in ["high", "medium", "low"]:
-                gaps_in_severity = by_severity[severity]
+            by_severity = self.cached_model("gaps_by_severity", _group_gaps_by_severity)
+            for severity, gaps_in_severity in by_severity.items():
                 if gaps_in_severity:
-                    severity_node = root.root.add(
+                    self.add_lazy_group(
+                        root.root,
                         f"{severity.upper()} ({len(gaps_in_severity)})",
+                        gaps_in_severity,
+                        _add_gap_leaf,
                         expand=(severity == "high"),
                     )
-                    for gap in gaps_in_severity[:20]:
-                        severity_node.add_leaf(
-                            gap.get("description", "Unknown gap"),
-                            data={"type": "gap", "gap": gap},
-                        )
 
         return root
 
@@ -434,15 +442,16 @@ class ActivityView(BaseView):
         root = Tree("📅 Activity & Suggestions")
         root.data = {}
 
-        # Show suggestions first (most important)
+        # Show the top 5 suggestions first (most important)
         suggestions = self.data.get("suggestions", [])
         if suggestions:
-            sugg_node = root.root.add("💡 Suggested Next Steps", expand=True)
-            for i, suggestion in enumerate(suggestions[:5], 1):
-                priority = suggestion.get("priority", 0)
-                confidence = int(suggestion.get("confidence", 0.0) * 100)
-                title = suggestion.get("title", "")
-                sugg_node.add_leaf(f"{i}. [{priority}/10, {confidence}%] {title}")
+            self.add_lazy_group(
+                root.root,
+                "💡 Suggested Next Steps",
+                list(enumerate(suggestions[:5], 1)),
+                _add_suggestion_leaf,
+                expand=True,
+            )
         else:
             root.root.add_leaf("No suggestions at this time")
 
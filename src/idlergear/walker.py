@@ -0,0 +1,401 @@
+"""Pruned, gitignore-aware directory walker.
+
+A single ``os.scandir``-based walker shared by the filesystem server, test
+mapping and file registry scans. Excluded directories (``.git``,
+``node_modules``, virtualenvs, ...) and directories matched by any
+``.gitignore`` on the way down are pruned *before* they are descended into,
+so large vendored trees cost nothing.
+
+Top-level subtrees can optionally be spread across a thread pool.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Union
+
+DEFAULT_EXCLUDE_PATTERNS = [
+    ".git",
+    "__pycache__",
+    "*.pyc",
+    "node_modules",
+    ".venv",
+    "venv",
+    "*.egg-info",
+    "dist",
+    "build",
+    ".tox",
+    ".pytest_cache",
+    ".mypy_cache",
+    ".coverage",
+    "htmlcov",
+]
+
+
+def _translate_gitignore(pattern: str) -> str:
+    """Translate a gitignore glob (without flags) into a regex."""
+    i, n = 0, len(pattern)
+    out = []
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern[i : i + 3] == "**/":
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern[i : i + 2] == "**":
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = pattern.find("]", i + 1)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1 : j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+@dataclass
+class _GitignoreRule:
+    regex: re.Pattern
+    negate: bool
+    dir_only: bool
+    anchored: bool
+
+
+class GitignoreSpec:
+    """Rules from one ``.gitignore`` file, relative to its directory."""
+
+    def __init__(self, base: str, lines: Iterable[str]):
+        """Parse gitignore lines.
+
+        Args:
+            base: Directory containing the .gitignore, relative to the walk
+                root in POSIX form ("" for the root itself)
+            lines: Lines of the .gitignore file
+        """
+        self.base = base
+        self.rules: List[_GitignoreRule] = []
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            if line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            line = line.lstrip("/")
+            self.rules.append(
+                _GitignoreRule(
+                    regex=re.compile(_translate_gitignore(line) + r"\Z"),
+                    negate=negate,
+                    dir_only=dir_only,
+                    anchored=anchored,
+                )
+            )
+
+    @classmethod
+    def from_file(cls, base: str, path: Union[str, Path]) -> Optional["GitignoreSpec"]:
+        """Load a .gitignore file, returning None if unreadable or empty."""
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                spec = cls(base, f)
+        except OSError:
+            return None
+        return spec if spec.rules else None
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """Check a path against these rules.
+
+        Args:
+            rel_path: Path relative to the walk root (POSIX form)
+            is_dir: Whether the path is a directory
+
+        Returns:
+            True if ignored, False if re-included by a negation,
+            None if no rule matched
+        """
+        if self.base:
+            prefix = self.base + "/"
+            if not rel_path.startswith(prefix):
+                return None
+            rel_path = rel_path[len(prefix) :]
+        name = rel_path.rsplit("/", 1)[-1]
+
+        result = None
+        for rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            target = rel_path if rule.anchored else name
+            if rule.regex.match(target):
+                result = not rule.negate
+        return result
+
+
+def _is_gitignored(specs: Sequence[GitignoreSpec], rel_path: str, is_dir: bool) -> bool:
+    """Evaluate nested gitignore specs; deeper files override shallower ones."""
+    ignored = False
+    for spec in specs:
+        result = spec.match(rel_path, is_dir)
+        if result is not None:
+            ignored = result
+    return ignored
+
+
+class WalkEntry(NamedTuple):
+    """A file or directory yielded by the walker."""
+
+    path: str  # Absolute path
+    rel_path: str  # Path relative to the walk root, POSIX separators
+    name: str
+    is_dir: bool
+    entry: os.DirEntry  # For cached stat() access
+
+    def stat(self) -> os.stat_result:
+        """Return the entry's stat (cached by os.scandir where possible)."""
+        return self.entry.stat()
+
+
+class DirectoryWalker:
+    """Walk a directory tree, pruning excluded and gitignored directories.
+
+    Example:
+        >>> walker = DirectoryWalker("/path/to/project")
+        >>> py_files = [e.rel_path for e in walker.walk(suffixes=(".py",))]
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        exclude_patterns: Optional[Sequence[str]] = None,
+        use_gitignore: bool = True,
+    ):
+        """Initialize walker.
+
+        Args:
+            root: Directory to walk
+            exclude_patterns: fnmatch patterns matched against entry names;
+                matching directories are not descended into
+                (defaults to DEFAULT_EXCLUDE_PATTERNS)
+            use_gitignore: Honour .gitignore files at and below root
+        """
+        self.root = os.path.abspath(root)
+        patterns = DEFAULT_EXCLUDE_PATTERNS if exclude_patterns is None else exclude_patterns
+        self._exclude = (
+            re.compile("|".join(fnmatch.translate(p) for p in patterns))
+            if patterns
+            else None
+        )
+        self.use_gitignore = use_gitignore
+
+    def is_excluded(self, name: str) -> bool:
+        """Check whether an entry name matches an exclude pattern."""
+        return bool(self._exclude and self._exclude.match(name))
+
+    def _load_specs(
+        self, dir_path: str, dir_rel: str, specs: tuple
+    ) -> tuple:
+        if not self.use_gitignore:
+            return specs
+        spec = GitignoreSpec.from_file(dir_rel, os.path.join(dir_path, ".gitignore"))
+        return specs + (spec,) if spec else specs
+
+    def scandir(
+        self, dir_path: str, dir_rel: str = "", specs: tuple = ()
+    ) -> List[WalkEntry]:
+        """List one directory, filtered and sorted by name.
+
+        Args:
+            dir_path: Absolute directory path
+            dir_rel: The directory's path relative to root ("" for root)
+            specs: Gitignore specs in effect for this directory (including
+                any .gitignore inside it)
+
+        Returns:
+            Entries that are neither excluded nor gitignored
+        """
+        entries = []
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    name = entry.name
+                    if self.is_excluded(name):
+                        continue
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    rel = f"{dir_rel}/{name}" if dir_rel else name
+                    if specs and _is_gitignored(specs, rel, is_dir):
+                        continue
+                    entries.append(WalkEntry(entry.path, rel, name, is_dir, entry))
+        except (PermissionError, FileNotFoundError, NotADirectoryError):
+            return []
+        entries.sort(key=lambda e: e.name)
+        return entries
+
+    def root_specs(self) -> tuple:
+        """Gitignore specs in effect at the walk root."""
+        return self._load_specs(self.root, "", ())
+
+    def child_specs(self, entry: WalkEntry, specs: tuple) -> tuple:
+        """Gitignore specs in effect inside a directory entry."""
+        return self._load_specs(entry.path, entry.rel_path, specs)
+
+    def _walk_from(
+        self,
+        dir_path: str,
+        dir_rel: str,
+        specs: tuple,
+        depth: int,
+        max_depth: Optional[int],
+        include_dirs: bool,
+    ) -> Iterator[WalkEntry]:
+        stack = [(dir_path, dir_rel, specs, depth)]
+        while stack:
+            path, rel, dir_specs, level = stack.pop()
+            subdirs = []
+            for entry in self.scandir(path, rel, dir_specs):
+                if entry.is_dir:
+                    if include_dirs:
+                        yield entry
+                    if max_depth is None or level < max_depth:
+                        subdirs.append(entry)
+                else:
+                    yield entry
+            # Reverse so directories are visited in sorted order
+            for entry in reversed(subdirs):
+                stack.append(
+                    (entry.path, entry.rel_path, self.child_specs(entry, dir_specs), level + 1)
+                )
+
+    def walk(
+        self,
+        pattern: Optional[str] = None,
+        suffixes: Optional[Sequence[str]] = None,
+        include_dirs: bool = False,
+        max_depth: Optional[int] = None,
+        workers: int = 1,
+    ) -> Iterator[WalkEntry]:
+        """Yield entries below root.
+
+        Args:
+            pattern: Optional glob; matched against the entry name, or against
+                the relative path when it contains "/"
+            suffixes: Optional file suffixes to keep (e.g. (".py", ".pyi"))
+            include_dirs: Also yield directories
+            max_depth: Maximum directory depth to descend (0 = root only)
+            workers: Walk top-level subdirectories in this many threads
+
+        Yields:
+            Matching entries. Order is deterministic but not globally sorted.
+        """
+        if pattern and "/" in pattern:
+            path_regex = re.compile(fnmatch.translate(pattern))
+            suffix_regex = re.compile(fnmatch.translate("*/" + pattern))
+
+            def matches(e: WalkEntry) -> bool:
+                return bool(path_regex.match(e.rel_path) or suffix_regex.match(e.rel_path))
+
+        elif pattern and pattern not in ("*", "**"):
+            name_regex = re.compile(fnmatch.translate(pattern))
+
+            def matches(e: WalkEntry) -> bool:
+                return bool(name_regex.match(e.name))
+
+        else:
+
+            def matches(e: WalkEntry) -> bool:
+                return True
+
+        suffix_tuple = tuple(suffixes) if suffixes else None
+
+        def keep(e: WalkEntry) -> bool:
+            if suffix_tuple and (e.is_dir or not e.name.endswith(suffix_tuple)):
+                return False
+            return matches(e)
+
+        for entry in self._iter(include_dirs, max_depth, workers):
+            if keep(entry):
+                yield entry
+
+    def _iter(
+        self, include_dirs: bool, max_depth: Optional[int], workers: int
+    ) -> Iterator[WalkEntry]:
+        specs = self.root_specs()
+        if workers <= 1:
+            yield from self._walk_from(self.root, "", specs, 0, max_depth, include_dirs)
+            return
+
+        # Fan out: the root listing is done here, each top-level subtree is
+        # walked in a worker thread (os.scandir releases the GIL).
+        top = self.scandir(self.root, "", specs)
+        subdirs = [e for e in top if e.is_dir]
+        descend = max_depth is None or max_depth > 0
+
+        def walk_subtree(entry: WalkEntry) -> List[WalkEntry]:
+            return list(
+                self._walk_from(
+                    entry.path,
+                    entry.rel_path,
+                    self.child_specs(entry, specs),
+                    1,
+                    max_depth,
+                    include_dirs,
+                )
+            )
+
+        for entry in top:
+            if not entry.is_dir or include_dirs:
+                yield entry
+        if not descend or not subdirs:
+            return
+        with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as pool:
+            for results in pool.map(walk_subtree, subdirs):
+                yield from results
+
+
+def walk_files(
+    root: Union[str, Path],
+    pattern: Optional[str] = None,
+    suffixes: Optional[Sequence[str]] = None,
+    exclude_patterns: Optional[Sequence[str]] = None,
+    use_gitignore: bool = True,
+    workers: int = 1,
+) -> List[str]:
+    """List files below root as sorted POSIX paths relative to root.
+
+    Convenience wrapper around DirectoryWalker.walk() for callers that only
+    need relative file paths.
+    """
+    if not os.path.isdir(root):
+        return []
+    walker = DirectoryWalker(root, exclude_patterns=exclude_patterns, use_gitignore=use_gitignore)
+    return sorted(
+        e.rel_path for e in walker.walk(pattern=pattern, suffixes=suffixes, workers=workers)
+    )
@@ -5,12 +5,13 @@ Phase 1: One-shot analysis via `idlergear watch check`
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator
 
 from idlergear.config import find_idlergear_root, get_config_value
 
@@ -70,8 +71,53 @@ def _run_git(args: list[str], cwd: Path | None = None) -> tuple[int, str, str]:
         return 1, "", "git not available"
 
 
-def get_git_status(project_root: Path) -> dict[str, Any]:
-    """Get current git status with file and line counts."""
+def _parse_porcelain(stdout: str) -> dict[str, tuple[str, str]]:
+    """Parse `git status --porcelain` into {path: (status_code, display_path)}.
+
+    Renames are keyed by their destination path.
+    """
+    entries = {}
+    for line in stdout.split("\n"):
+        if not line:
+            continue
+        display = line[3:]
+        entries[display.split(" -> ")[-1]] = (line[:2], display)
+    return entries
+
+
+def _parse_numstat(stdout: str) -> dict[str, tuple[int, int]]:
+    """Parse `git diff --numstat` into {path: (added, deleted)}."""
+    stats = {}
+    for line in stdout.split("\n"):
+        if not line:
+            continue
+        parts = line.split("\t")
+        if len(parts) >= 3:
+            try:
+                added = int(parts[0]) if parts[0] != "-" else 0
+                deleted = int(parts[1]) if parts[1] != "-" else 0
+            except ValueError:
+                continue
+            stats[parts[2]] = (added, deleted)
+    return stats
+
+
+def _merge_numstat(
+    *stats: dict[str, tuple[int, int]],
+) -> dict[str, tuple[int, int]]:
+    """Sum several numstat maps (e.g. unstaged + staged) per path."""
+    merged: dict[str, tuple[int, int]] = {}
+    for stat in stats:
+        for path, (added, deleted) in stat.items():
+            old_added, old_deleted = merged.get(path, (0, 0))
+            merged[path] = (old_added + added, old_deleted + deleted)
+    return merged
+
+
+def _build_git_status(
+    entries: dict[str, tuple[str, str]], numstat: dict[str, tuple[int, int]]
+) -> dict[str, Any]:
+    """Build the get_git_status() result from parsed porcelain and numstat."""
     status = {
         "files_changed": 0,
         "files_staged": 0,
@@ -83,17 +129,7 @@ def get_git_status(project_root: Path) -> dict[str, Any]:
         "untracked_files": [],
     }
 
-    # Get modified/staged files
-    returncode, stdout, _ = _run_git(["status", "--porcelain"], cwd=project_root)
-    if returncode != 0:
-        return status
-
-    for line in stdout.strip().split("\n"):
-        if not line:
-            continue
-        status_code = line[:2]
-        filepath = line[3:]
-
+    for status_code, filepath in entries.values():
         if status_code[0] in "MADRC":  # Staged
             status["files_staged"] += 1
             status["staged_files"].append(filepath)
@@ -104,43 +140,29 @@ def get_git_status(project_root: Path) -> dict[str, Any]:
             status["files_untracked"] += 1
             status["untracked_files"].append(filepath)
 
-    # Get line counts from diff
-    returncode, stdout, _ = _run_git(["diff", "--numstat"], cwd=project_root)
-    if returncode == 0:
-        for line in stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("\t")
-            if len(parts) >= 2:
-                try:
-                    added = int(parts[0]) if parts[0] != "-" else 0
-                    deleted = int(parts[1]) if parts[1] != "-" else 0
-                    status["lines_added"] += added
-                    status["lines_deleted"] += deleted
-                except ValueError:
-                    pass
-
-    # Also check staged diff
-    returncode, stdout, _ = _run_git(
-        ["diff", "--cached", "--numstat"], cwd=project_root
-    )
-    if returncode == 0:
-        for line in stdout.strip().split("\n"):
-            if not line:
-                continue
-            parts = line.split("\t")
-            if len(parts) >= 2:
-                try:
-                    added = int(parts[0]) if parts[0] != "-" else 0
-                    deleted = int(parts[1]) if parts[1] != "-" else 0
-                    status["lines_added"] += added
-                    status["lines_deleted"] += deleted
-                except ValueError:
-                    pass
+    for added, deleted in numstat.values():
+        status["lines_added"] += added
+        status["lines_deleted"] += deleted
 
     return status
 
 
+def get_git_status(project_root: Path) -> dict[str, Any]:
+    """Get current git status with file and line counts."""
+    # Get modified/staged files
+    returncode, stdout, _ = _run_git(["status", "--porcelain"], cwd=project_root)
+    if returncode != 0:
+        return _build_git_status({}, {})
+    entries = _parse_porcelain(stdout)
+
+    # Get line counts from diff, plus the staged diff
+    _, unstaged, _ = _run_git(["diff", "--numstat"], cwd=project_root)
+    _, staged, _ = _run_git(["diff", "--cached", "--numstat"], cwd=project_root)
+    numstat = _merge_numstat(_parse_numstat(unstaged), _parse_numstat(staged))
+
+    return _build_git_status(entries, numstat)
+
+
 def get_minutes_since_last_commit(project_root: Path) -> int | None:
     """Get minutes since the last commit."""
     returncode, stdout, _ = _run_git(["log", "-1", "--format=%ct"], cwd=project_root)
@@ -156,34 +178,28 @@ def get_minutes_since_last_commit(project_root: Path) -> int | None:
         return None
 
 
-def scan_diff_for_todos(project_root: Path) -> list[dict[str, Any]]:
-    """Scan the current diff for TODO/FIXME/HACK comments."""
-    todos = []
-
-    # Get the diff (both staged and unstaged)
-    returncode, stdout, _ = _run_git(["diff", "HEAD"], cwd=project_root)
-    if returncode != 0:
-        # Try just unstaged diff
-        returncode, stdout, _ = _run_git(["diff"], cwd=project_root)
-        if returncode != 0:
-            return todos
+# Patterns to look for in added diff lines
+TODO_PATTERNS = [
+    re.compile(r"^\+.*(?://|#|/\*)\s*(TODO|FIXME|HACK|XXX):\s*(.+)", re.IGNORECASE),
+    re.compile(r"^\+.*<!--\s*(TODO|FIXME):\s*(.+?)-->", re.IGNORECASE),
+]
 
-    # Patterns to look for
-    patterns = [
-        r"^\+.*(?://|#|/\*)\s*(TODO|FIXME|HACK|XXX):\s*(.+)",
-        r"^\+.*<!--\s*(TODO|FIXME):\s*(.+?)-->",
-    ]
 
+def _parse_diff_todos(diff: str) -> list[dict[str, Any]]:
+    """Extract TODO/FIXME/HACK comments from the added lines of a diff."""
+    todos = []
     current_file = None
-    for line in stdout.split("\n"):
+    for line in diff.split("\n"):
         # Track current file
         if line.startswith("+++ b/"):
             current_file = line[6:]
             continue
+        if not line.startswith("+"):
+            continue
 
         # Check for TODO patterns in added lines
-        for pattern in patterns:
-            match = re.search(pattern, line, re.IGNORECASE)
+        for pattern in TODO_PATTERNS:
+            match = pattern.search(line)
             if match:
                 todos.append(
                     {
@@ -194,10 +210,22 @@ def scan_diff_for_todos(project_root: Path) -> list[dict[str, Any]]:
                     }
                 )
                 break
-
     return todos
 
 
+def scan_diff_for_todos(project_root: Path) -> list[dict[str, Any]]:
+    """Scan the current diff for TODO/FIXME/HACK comments."""
+    # Get the diff (both staged and unstaged)
+    returncode, stdout, _ = _run_git(["diff", "HEAD"], cwd=project_root)
+    if returncode != 0:
+        # Try just unstaged diff
+        returncode, stdout, _ = _run_git(["diff"], cwd=project_root)
+        if returncode != 0:
+            return []
+
+    return _parse_diff_todos(stdout)
+
+
 def get_newly_added_files(project_root: Path) -> list[str]:
     """Get list of newly added files from git diff and untracked files.
 
@@ -258,8 +286,22 @@ def is_source_file(filepath: str) -> bool:
     return any(filepath.endswith(ext) for ext in source_extensions)
 
 
-def check_reference_staleness(project_root: Path) -> list[dict[str, Any]]:
-    """Check if any references are stale compared to related code files."""
+# Code files compared against wiki pages by check_reference_staleness()
+STALENESS_CODE_EXTENSIONS = [".py", ".js", ".ts", ".go", ".rs"]
+
+
+def _find_stale_references(
+    project_root: Path, code_files: Callable[[], Iterable[tuple[str, float]]]
+) -> list[dict[str, Any]]:
+    """Match old wiki pages against newer, similarly named code files.
+
+    Args:
+        project_root: Project root
+        code_files: Returns (relative path, mtime) pairs of candidate code files
+
+    Returns:
+        One entry per stale reference
+    """
     stale = []
 
     # Get threshold from config (default: 7 days)
@@ -281,54 +323,54 @@ def check_reference_staleness(project_root: Path) -> list[dict[str, Any]]:
             ref_mtime = datetime.fromtimestamp(ref_file.stat().st_mtime)
             age_days = (datetime.now() - ref_mtime).days
 
-            if age_days > threshold_days:
-                # Check if there are recent changes to potentially related code
-                ref_name = ref_file.stem.lower().replace("-", " ").replace("_", " ")
-
-                # Simple heuristic: look for files with similar names
-                for code_ext in ["*.py", "*.js", "*.ts", "*.go", "*.rs"]:
-                    for code_file in project_root.glob(f"**/{code_ext}"):
-                        if ".idlergear" in str(code_file) or "venv" in str(code_file):
-                            continue
-                        code_name = (
-                            code_file.stem.lower().replace("-", " ").replace("_", " ")
-                        )
+            if age_days <= threshold_days:
+                continue
 
-                        # Check if names are similar
-                        if ref_name in code_name or code_name in ref_name:
-                            code_mtime = datetime.fromtimestamp(
-                                code_file.stat().st_mtime
-                            )
-                            if code_mtime > ref_mtime:
-                                stale.append(
-                                    {
-                                        "reference": ref_file.name,
-                                        "reference_age_days": age_days,
-                                        "related_file": str(
-                                            code_file.relative_to(project_root)
-                                        ),
-                                        "code_updated": code_mtime.isoformat(),
-                                    }
-                                )
-                                break
-                    else:
-                        continue
-                    break
+            # Simple heuristic: look for recently changed files with similar names
+            ref_name = ref_file.stem.lower().replace("-", " ").replace("_", " ")
+            for rel_path, mtime in code_files():
+                code_name = (
+                    Path(rel_path).stem.lower().replace("-", " ").replace("_", " ")
+                )
+                if ref_name in code_name or code_name in ref_name:
+                    code_mtime = datetime.fromtimestamp(mtime)
+                    if code_mtime > ref_mtime:
+                        stale.append(
+                            {
+                                "reference": ref_file.name,
+                                "reference_age_days": age_days,
+                                "related_file": rel_path,
+                                "code_updated": code_mtime.isoformat(),
+                            }
+                        )
+                        break
 
     return stale
 
 
+def check_reference_staleness(project_root: Path) -> list[dict[str, Any]]:
+    """Check if any references are stale compared to related code files."""
+
+    def code_files() -> Iterator[tuple[str, float]]:
+        for code_ext in STALENESS_CODE_EXTENSIONS:
+            for code_file in project_root.glob(f"**/*{code_ext}"):
+                if ".idlergear" in str(code_file) or "venv" in str(code_file):
+                    continue
+                yield (
+                    str(code_file.relative_to(project_root)),
+                    code_file.stat().st_mtime,
+                )
+
+    return _find_stale_references(project_root, code_files)
+
+
 def check_stale_data_references(project_root: Path) -> list[dict[str, Any]]:
     """Check for Python files referencing stale versions of data files.
 
     Returns:
         List of warnings about stale data file references
     """
-    import ast
-    from idlergear.data_file_detector import (
-        detect_stale_data_references,
-        extract_file_references,
-    )
+    from idlergear.data_file_detector import detect_stale_data_references
     from idlergear.git_version_detector import detect_versioned_files
 
     warnings = []
@@ -355,30 +397,306 @@ def check_stale_data_references(project_root: Path) -> list[dict[str, Any]]:
     ]
 
     for py_file in python_files:
+        rel_path = str(py_file.relative_to(project_root))
+        refs = _python_file_references(py_file, rel_path)
+        if refs:
+            warnings.extend(
+                detect_stale_data_references(refs, versioned_files, project_root)
+            )
+
+    return warnings
+
+
+def _python_file_references(py_file: Path, rel_path: str) -> list[dict[str, Any]]:
+    """Extract data file references from a Python file ([] if unparseable)."""
+    import ast
+    from idlergear.data_file_detector import extract_file_references
+
+    try:
+        tree = ast.parse(py_file.read_text())
+    except (SyntaxError, UnicodeDecodeError, OSError, ValueError):
+        # Skip files we can't parse
+        return []
+    return extract_file_references(tree, rel_path)
+
+
+# Directories never scanned for code files (matches the glob-based checks)
+WATCH_EXCLUDE_PATTERNS = [
+    ".git",
+    ".idlergear",
+    "__pycache__",
+    "node_modules",
+    "venv",
+    ".venv",
+    "virtualenv",
+    "site-packages",
+]
+
+
+def _under(path: str, prefixes: list[str]) -> bool:
+    """Check whether path equals or lies below any of the prefixes."""
+    return any(path == p or path.startswith(p + "/") for p in prefixes)
+
+
+class WatchState:
+    """Per-file analysis inputs cached between watch batches.
+
+    The first refresh() scans the whole project. Later refreshes re-run git
+    and file scans only for the paths that changed and merge the results
+    into the cached per-file diff stats, status codes, TODO findings and
+    code/data-reference indexes. A new HEAD or index (commit, stage,
+    checkout) can change every file's status, so it triggers a full rescan.
+
+    Example:
+        >>> state = WatchState(project_root)
+        >>> state.refresh()                     # full scan
+        >>> state.refresh(["src/app.py"])       # only src/app.py
+        >>> status = analyze(project_root, state=state)
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root)
+        self.entries: dict[str, tuple[str, str]] = {}  # porcelain status
+        self.numstat: dict[str, tuple[int, int]] = {}  # unstaged + staged
+        self.todos: dict[str, list[dict[str, Any]]] = {}
+        self.full_scans = 0
+        self.partial_scans = 0
+        self._stamp: tuple[str, str] | None = None
+        self._last_commit: int | None = None
+        # Built lazily, then kept up to date per path
+        self._code_files: dict[str, float] | None = None
+        self._data_refs: dict[str, list[dict[str, Any]]] | None = None
+        self._versioned: dict[str, list] | None = None
+        self._data_warnings: dict[str, list[dict[str, Any]]] = {}
+
+    # -- refresh ----------------------------------------------------------
+
+    def refresh(self, changed_paths: Iterable[str] | None = None) -> None:
+        """Bring cached inputs up to date.
+
+        Args:
+            changed_paths: Paths (absolute or project-relative) that changed
+                since the last refresh. None forces a full rescan.
+        """
+        from idlergear.git import index_stamp, read_head
+
+        stamp = (read_head(self.project_root), index_stamp(self.project_root))
+        if changed_paths is None or stamp != self._stamp:
+            self._full_scan()
+            self._stamp = stamp
+            return
+
+        paths = sorted(
+            {rel for rel in map(self._relative, changed_paths) if rel is not None}
+        )
+        if paths:
+            self._scan_paths(paths)
+
+    def _relative(self, path: str) -> str | None:
+        full = os.path.abspath(os.path.join(self.project_root, path))
+        rel = os.path.relpath(full, self.project_root)
+        if rel == "." or rel.startswith(".."):
+            return None
+        return rel.replace(os.sep, "/")
+
+    def _full_scan(self) -> None:
+        root = self.project_root
+        self.full_scans += 1
+
+        _, stdout, _ = _run_git(
+            ["--no-optional-locks", "status", "--porcelain", "-uall"], cwd=root
+        )
+        self.entries = _parse_porcelain(stdout)
+
+        _, unstaged, _ = _run_git(["diff", "--numstat"], cwd=root)
+        _, staged, _ = _run_git(["diff", "--cached", "--numstat"], cwd=root)
+        self.numstat = _merge_numstat(_parse_numstat(unstaged), _parse_numstat(staged))
+
+        returncode, diff, _ = _run_git(["diff", "HEAD"], cwd=root)
+        if returncode != 0:
+            _, diff, _ = _run_git(["diff"], cwd=root)
+        self.todos = self._group_todos(_parse_diff_todos(diff))
+
+        returncode, stdout, _ = _run_git(["log", "-1", "--format=%ct"], cwd=root)
         try:
-            content = py_file.read_text()
-            tree = ast.parse(content)
+            self._last_commit = int(stdout.strip()) if returncode == 0 else None
+        except ValueError:
+            self._last_commit = None
+
+        self._code_files = None
+        self._data_refs = None
+        self._versioned = None
+        self._data_warnings = {}
+
+    def _scan_paths(self, paths: list[str]) -> None:
+        root = self.project_root
+        self.partial_scans += 1
+
+        _, stdout, _ = _run_git(
+            ["--no-optional-locks", "status", "--porcelain", "-uall", "--"] + paths,
+            cwd=root,
+        )
+        self._replace(self.entries, paths, _parse_porcelain(stdout))
+
+        _, unstaged, _ = _run_git(["diff", "--numstat", "--"] + paths, cwd=root)
+        _, staged, _ = _run_git(["diff", "--cached", "--numstat", "--"] + paths, cwd=root)
+        self._replace(
+            self.numstat,
+            paths,
+            _merge_numstat(_parse_numstat(unstaged), _parse_numstat(staged)),
+        )
 
-            rel_path = str(py_file.relative_to(project_root))
-            refs = extract_file_references(tree, rel_path)
+        returncode, diff, _ = _run_git(["diff", "HEAD", "--"] + paths, cwd=root)
+        if returncode != 0:
+            _, diff, _ = _run_git(["diff", "--"] + paths, cwd=root)
+        self._replace(self.todos, paths, self._group_todos(_parse_diff_todos(diff)))
+
+        if self._code_files is not None:
+            code_files = self._scan_code_files(paths)
+            self._replace(self._code_files, paths, code_files)
+        if self._data_refs is not None:
+            self._replace(
+                self._data_refs,
+                paths,
+                {
+                    p: _python_file_references(root / p, p)
+                    for p in code_files
+                    if p.endswith(".py")
+                },
+            )
+            for path in list(self._data_warnings):
+                if _under(path, paths):
+                    del self._data_warnings[path]
+
+    @staticmethod
+    def _replace(cache: dict, paths: list[str], fresh: dict) -> None:
+        """Drop cached entries at/below paths, then merge fresh results."""
+        for key in [k for k in cache if _under(k, paths)]:
+            del cache[key]
+        cache.update(fresh)
+
+    @staticmethod
+    def _group_todos(todos: list[dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+        grouped: dict[str, list[dict[str, Any]]] = {}
+        for todo in todos:
+            grouped.setdefault(todo["file"], []).append(todo)
+        return grouped
 
-            if refs:
-                file_warnings = detect_stale_data_references(
-                    refs, versioned_files, project_root
-                )
-                warnings.extend(file_warnings)
+    def _scan_code_files(self, paths: list[str] | None = None) -> dict[str, float]:
+        """Map code files (all, or those at/below paths) to their mtime."""
+        from idlergear.walker import DirectoryWalker
 
-        except (SyntaxError, UnicodeDecodeError, PermissionError):
-            # Skip files we can't parse
-            continue
+        def walker(root: Path) -> DirectoryWalker:
+            return DirectoryWalker(
+                root, exclude_patterns=WATCH_EXCLUDE_PATTERNS, use_gitignore=False
+            )
 
-    return warnings
+        suffixes = tuple(STALENESS_CODE_EXTENSIONS)
+        found: dict[str, float] = {}
+        if paths is None:
+            for entry in walker(self.project_root).walk(suffixes=suffixes):
+                found[entry.rel_path] = entry.stat().st_mtime
+            return found
+
+        excluded = walker(self.project_root).is_excluded
+        for rel in paths:
+            if any(excluded(part) for part in rel.split("/")):
+                continue
+            full = self.project_root / rel
+            if full.is_dir():
+                for entry in walker(full).walk(suffixes=suffixes):
+                    found[f"{rel}/{entry.rel_path}"] = entry.stat().st_mtime
+            elif rel.endswith(suffixes):
+                try:
+                    found[rel] = full.stat().st_mtime
+                except OSError:
+                    pass
+        return found
+
+    # -- results ----------------------------------------------------------
+
+    def git_status(self) -> dict[str, Any]:
+        """Same shape as get_git_status(), from cached per-file data."""
+        return _build_git_status(dict(sorted(self.entries.items())), self.numstat)
+
+    def minutes_since_last_commit(self) -> int | None:
+        """Same as get_minutes_since_last_commit(), without running git."""
+        if self._last_commit is None:
+            return None
+        delta = datetime.now() - datetime.fromtimestamp(self._last_commit)
+        return int(delta.total_seconds() / 60)
+
+    def todo_findings(self) -> list[dict[str, Any]]:
+        """Same as scan_diff_for_todos(), from cached per-file findings."""
+        return [todo for path in sorted(self.todos) for todo in self.todos[path]]
+
+    def newly_added_files(self) -> list[str]:
+        """Same as get_newly_added_files(), from cached status codes."""
+        return [
+            path
+            for path, (code, _) in sorted(self.entries.items())
+            if code == "??" or "A" in code
+        ]
+
+    def reference_staleness(self) -> list[dict[str, Any]]:
+        """Same as check_reference_staleness(), using the code file index."""
+        if self._code_files is None:
+            self._code_files = self._scan_code_files()
+        by_ext = sorted(
+            self._code_files.items(),
+            key=lambda item: (
+                STALENESS_CODE_EXTENSIONS.index(os.path.splitext(item[0])[1]),
+                item[0],
+            ),
+        )
+        return _find_stale_references(self.project_root, lambda: by_ext)
 
+    def stale_data_references(self) -> list[dict[str, Any]]:
+        """Same as check_stale_data_references(), re-parsing changed files only."""
+        from idlergear.data_file_detector import detect_stale_data_references
+        from idlergear.git_version_detector import detect_versioned_files
 
-def analyze(project_root: Path | None = None) -> WatchStatus:
+        if self._versioned is None:
+            # ls-files based: only changes with the index (full rescan)
+            self._versioned = detect_versioned_files(
+                self.project_root, include_renames=False
+            )
+        if not self._versioned:
+            return []
+
+        if self._data_refs is None:
+            if self._code_files is None:
+                self._code_files = self._scan_code_files()
+            self._data_refs = {
+                path: _python_file_references(self.project_root / path, path)
+                for path in self._code_files
+                if path.endswith(".py")
+            }
+
+        warnings = []
+        for path in sorted(self._data_refs):
+            refs = self._data_refs[path]
+            if not refs:
+                continue
+            if path not in self._data_warnings:
+                self._data_warnings[path] = detect_stale_data_references(
+                    refs, self._versioned, self.project_root
+                )
+            warnings.extend(self._data_warnings[path])
+        return warnings
+
+
+def analyze(
+    project_root: Path | None = None, state: WatchState | None = None
+) -> WatchStatus:
     """Analyze the project and return suggestions.
 
     This is the main entry point for `idlergear watch check`.
+
+    Args:
+        project_root: Project root (auto-detected if not provided)
+        state: Refreshed WatchState to read git status, TODOs and staleness
+            inputs from instead of rescanning the whole project
     """
     if project_root is None:
         project_root = find_idlergear_root()
@@ -407,8 +725,12 @@ def analyze(project_root: Path | None = None) -> WatchStatus:
         return f"s{suggestion_id}"
 
     # Get git status
-    git_status = get_git_status(project_root)
-    minutes_since_commit = get_minutes_since_last_commit(project_root)
+    if state is not None:
+        git_status = state.git_status()
+        minutes_since_commit = state.minutes_since_last_commit()
+    else:
+        git_status = get_git_status(project_root)
+        minutes_since_commit = get_minutes_since_last_commit(project_root)
 
     # Get thresholds from config
     try:
@@ -614,7 +936,10 @@ def analyze(project_root: Path | None = None) -> WatchStatus:
     scan_todos_config = get_config_value("watch.scan_todos")
     scan_todos = str(scan_todos_config).lower() == "true" if scan_todos_config else True
     if scan_todos:
-        todos = scan_diff_for_todos(project_root)
+        if state is not None:
+            todos = state.todo_findings()
+        else:
+            todos = scan_diff_for_todos(project_root)
         for todo in todos:
             suggestions.append(
                 Suggestion(
@@ -634,7 +959,10 @@ def analyze(project_root: Path | None = None) -> WatchStatus:
         else True
     )
     if check_staleness:
-        stale_refs = check_reference_staleness(project_root)
+        if state is not None:
+            stale_refs = state.reference_staleness()
+        else:
+            stale_refs = check_reference_staleness(project_root)
         for stale in stale_refs:
             suggestions.append(
                 Suggestion(
@@ -654,7 +982,10 @@ def analyze(project_root: Path | None = None) -> WatchStatus:
         else True
     )
     if check_data_versions:
-        stale_data_refs = check_stale_data_references(project_root)
+        if state is not None:
+            stale_data_refs = state.stale_data_references()
+        else:
+            stale_data_refs = check_stale_data_references(project_root)
         for stale in stale_data_refs:
             suggestions.append(
                 Suggestion(
@@ -670,7 +1001,10 @@ def analyze(project_root: Path | None = None) -> WatchStatus:
     try:
         from idlergear.testing import get_tests_for_file
 
-        new_files = get_newly_added_files(project_root)
+        if state is not None:
+            new_files = state.newly_added_files()
+        else:
+            new_files = get_newly_added_files(project_root)
         new_source_files = [f for f in new_files if is_source_file(f)]
 
         for new_file in new_source_files:
@@ -981,6 +1315,7 @@ class FileWatcher:
         self._callbacks: list[callable] = []
         self._use_watchdog = False
         self._observer = None
+        self._state: WatchState | None = None
 
         # Check if watchdog is available
         try:
@@ -1037,12 +1372,20 @@ class FileWatcher:
         self._events.append(event)
         self._debounce_timer = self.config.debounce
 
-    def _check_and_notify(self) -> None:
-        """Check for changes and notify if there are suggestions."""
+    def _check_and_notify(self, changed_paths: list[str] | None = None) -> None:
+        """Check for changes and notify if there are suggestions.
+
+        Args:
+            changed_paths: Paths touched since the last check; only these are
+                re-analyzed. None re-analyzes everything.
+        """
         if self.project_root is None:
             return
 
-        status = analyze(self.project_root)
+        if self._state is None:
+            self._state = WatchState(self.project_root)
+        self._state.refresh(changed_paths)
+        status = analyze(self.project_root, state=self._state)
 
         # Only notify if there are new/different suggestions
         if self._last_status is None or self._has_changes(status):
@@ -1091,6 +1434,9 @@ class FileWatcher:
                 )
 
             def on_moved(self, event):
+                self.watcher._on_file_change(
+                    "deleted", event.src_path, event.is_directory
+                )
                 self.watcher._on_file_change(
                     "moved", event.dest_path, event.is_directory
                 )
@@ -1109,8 +1455,10 @@ class FileWatcher:
                 if self._debounce_timer > 0:
                     self._debounce_timer -= 1
                     if self._debounce_timer <= 0:
-                        self._check_and_notify()
-                        self._events.clear()
+                        # Swap the batch out so events arriving during
+                        # analysis land in the next one
+                        events, self._events = self._events, []
+                        self._check_and_notify([e.path for e in events])
         finally:
             observer.stop()
             observer.join()
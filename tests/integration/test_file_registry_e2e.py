@@ -15,6 +15,8 @@ from unittest.mock import patch, Mock
 
 import pytest
 
+from idlergear.access_log import flush_access_logs
+
 
 @pytest.fixture
 def temp_project(tmp_path):
@@ -33,8 +35,8 @@ def mock_fs_server():
     class MockFS:
         """Mock filesystem server without directory restrictions."""
 
-        def read_file(self, path):
-            """Read file without restrictions."""
+        def read_file(self, path, **range_args):
+            """Read file without restrictions (range arguments are ignored)."""
             file_path = Path(path)
             if not file_path.exists():
                 return {"error": f"File not found: {path}"}
@@ -47,7 +49,7 @@ def mock_fs_server():
             file_path.write_text(content)
             return {"success": True, "path": str(path), "size": len(content)}
 
-        def read_multiple_files(self, paths):
+        def read_multiple_files(self, paths, **budget_args):
             """Read multiple files."""
             results = []
             for path in paths:
@@ -148,7 +150,8 @@ class TestDataVersioningWorkflow:
             assert content["path"] == str(data_v2)
             assert "col1,col2,col3" in content["content"]
 
-        # Step 6: Verify access log
+        # Step 6: Verify access log (appends are buffered)
+        flush_access_logs()
         log_file = temp_project / ".idlergear" / "access_log.jsonl"
         assert log_file.exists()
 
@@ -0,0 +1,136 @@
+"""Tests for the task and note access journal."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from idlergear import access_journal
+from idlergear.access_journal import get_access_journal
+from idlergear.notes import create_note, get_note, list_notes
+from idlergear.storage import parse_frontmatter, render_frontmatter
+from idlergear.tasks import close_task, create_task, get_task, list_tasks
+
+
+def _frontmatter(path: str) -> dict:
+    return parse_frontmatter(Path(path).read_text())[0]
+
+
+class TestAccessJournal:
+    """Tests for journaled access tracking."""
+
+    def test_reads_do_not_rewrite_files(self, temp_project):
+        task = create_task("Read me")
+        before = Path(task["path"]).read_text()
+
+        for _ in range(3):
+            shown = get_task(task["id"])
+
+        assert Path(task["path"]).read_text() == before
+        assert shown["access_count"] == 3
+        assert shown["accessed"] is not None
+        assert list_tasks()[0]["access_count"] == 3
+        assert get_task(task["id"], update_access=False)["access_count"] == 3
+
+    def test_update_folds_pending_accesses(self, temp_project):
+        task = create_task("Fold me")
+        get_task(task["id"])
+        get_task(task["id"])
+
+        closed = close_task(task["id"])
+
+        # Two reads plus the update itself, counted once
+        assert _frontmatter(task["path"])["access_count"] == 3
+        assert closed["access_count"] == 3
+        assert get_task(task["id"], update_access=False)["access_count"] == 3
+
+    def test_accesses_during_fold_stay_pending(self, temp_project):
+        task = create_task("Busy")
+        get_task(task["id"])
+        journal = get_access_journal(temp_project / ".idlergear")
+        path = Path(task["path"])
+
+        with journal.folding("task", task["id"], path) as (frontmatter, body):
+            journal.record("task", task["id"])  # A read while the file is written
+            path.write_text(render_frontmatter(frontmatter, body))
+
+        assert _frontmatter(task["path"])["access_count"] == 1
+        assert get_task(task["id"], update_access=False)["access_count"] == 2
+
+    def test_compact_folds_everything_and_trims(self, temp_project, monkeypatch):
+        task = create_task("Task")
+        note = create_note("Note")
+        get_task(task["id"])
+        get_note(note["id"])
+        get_note(note["id"])
+
+        journal = get_access_journal(temp_project / ".idlergear")
+        assert journal.compact() == 2
+        assert journal.path.read_bytes() == b""
+        assert _frontmatter(task["path"])["access_count"] == 1
+        assert _frontmatter(note["path"])["access_count"] == 2
+        assert list_notes()[0]["access_count"] == 2
+
+        # Compaction also kicks in on its own once the journal is large
+        monkeypatch.setattr(access_journal, "COMPACT_BYTES", 0)
+        get_note(note["id"])
+        assert _frontmatter(note["path"])["access_count"] == 3
+        assert journal.path.read_bytes() == b""
+
+    def test_crash_before_emptying_journal_does_not_double_count(
+        self, temp_project, monkeypatch
+    ):
+        task = create_task("Task")
+        get_task(task["id"])
+        get_task(task["id"])
+        journal = get_access_journal(temp_project / ".idlergear")
+
+        def crash(self, target):
+            raise OSError("crashed")
+
+        monkeypatch.setattr(Path, "replace", crash)
+        try:
+            journal.compact()
+        except OSError:
+            pass
+        monkeypatch.undo()
+
+        # The file has the accesses and the journal's fold record says so
+        assert _frontmatter(task["path"])["access_count"] == 2
+        assert get_task(task["id"], update_access=False)["access_count"] == 2
+        assert journal.compact() == 0
+        assert _frontmatter(task["path"])["access_count"] == 2
+
+    def test_concurrent_appends_and_compactions(self, temp_project, monkeypatch):
+        import threading
+
+        task = create_task("Hot")
+        monkeypatch.setattr(access_journal, "COMPACT_BYTES", 2000)
+
+        def reader():
+            # A journal per thread, like separate processes
+            journal = access_journal.AccessJournal(temp_project / ".idlergear")
+            for _ in range(100):
+                journal.record("task", task["id"])
+
+        threads = [threading.Thread(target=reader) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert get_task(task["id"], update_access=False)["access_count"] == 400
+        get_access_journal(temp_project / ".idlergear").compact()
+        assert _frontmatter(task["path"])["access_count"] == 400
+
+    def test_relevance_is_scored_at_read_time(self, temp_project):
+        task = create_task("Old")
+        path = Path(task["path"])
+        frontmatter, body = parse_frontmatter(path.read_text())
+        created = datetime.now(timezone.utc) - timedelta(days=30)
+        frontmatter["created"] = created.isoformat().replace("+00:00", "Z")
+        path.write_text(render_frontmatter(frontmatter, body))
+
+        # The stored 1.0 is stale: 30 days is one half-life
+        assert frontmatter["relevance_score"] == 1.0
+        assert get_task(task["id"], update_access=False)["relevance_score"] == 0.5
+        # Decay restarts from the journaled access
+        assert get_task(task["id"])["relevance_score"] == 1.0
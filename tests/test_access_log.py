@@ -0,0 +1,131 @@
+"""Tests for the rotating, time-indexed access log."""
+
+import gzip
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from idlergear import access_log as access_log_module
+from idlergear.access_log import AccessLog
+
+NOW = datetime(2026, 3, 10, 12, 30, tzinfo=timezone.utc)
+
+
+def _entry(hours_ago: float, file_path: str = "a.py", agent: str = "agent-1", tool: str = "Read"):
+    return {
+        "timestamp": (NOW - timedelta(hours=hours_ago)).isoformat(),
+        "tool": tool,
+        "file_path": file_path,
+        "status": "deprecated",
+        "allowed": False,
+        "agent_id": agent,
+    }
+
+
+def _brute_force(entries, since):
+    """What re-reading every line would report."""
+    result = {}
+    for entry in entries:
+        ts = datetime.fromisoformat(entry["timestamp"])
+        if ts < since:
+            continue
+        data = result.setdefault(entry["file_path"], {"count": 0, "last": ts, "agents": set(), "tools": set()})
+        data["count"] += 1
+        data["last"] = max(data["last"], ts)
+        data["agents"].add(entry["agent_id"])
+        data["tools"].add(entry["tool"])
+    return {
+        path: (d["count"], d["last"].isoformat(), d["agents"], d["tools"])
+        for path, d in result.items()
+    }
+
+
+def _normalize(summary):
+    return {
+        path: (d["count"], d["last_accessed"], set(d["agents"]), set(d["tools"]))
+        for path, d in summary.items()
+    }
+
+
+@pytest.fixture
+def log(tmp_path):
+    log = AccessLog(tmp_path)
+    yield log
+    log.close()
+
+
+def test_appends_are_buffered_until_flush(log):
+    log.append(_entry(1))
+    assert not log.active_path.exists()
+
+    assert log.flush() == 1
+    lines = log.active_path.read_text().splitlines()
+    assert json.loads(lines[0])["file_path"] == "a.py"
+
+
+def test_background_writer_flushes(tmp_path, monkeypatch):
+    monkeypatch.setattr(access_log_module, "FLUSH_INTERVAL", 0.01)
+    log = AccessLog(tmp_path)
+    log.append(_entry(1))
+
+    deadline = time.monotonic() + 5
+    while not log.active_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert log.active_path.exists()
+
+
+def test_summary_matches_full_scan_and_rotates_daily(log):
+    # 30 hours across two days, several files, agents and tools
+    entries = [
+        _entry(h / 2, f"f{h % 3}.py", f"agent-{h % 2}", "Read" if h % 4 else "Edit")
+        for h in range(60, -1, -1)
+    ]
+    for entry in entries:
+        log.append(entry)
+    log.flush()
+
+    # Earlier days are compressed; today stays in the active segment
+    segments = sorted(p.name for p in log.segment_dir.glob("*.jsonl.gz"))
+    assert segments == ["2026-03-09.jsonl.gz"]
+    with gzip.open(log.segment_dir / segments[0], "rt") as f:
+        rotated = [json.loads(line) for line in f]
+    assert all(e["timestamp"].startswith("2026-03-09") for e in rotated)
+
+    for hours in (0.25, 1, 5.5, 13, 48):
+        since = NOW - timedelta(hours=hours)
+        assert _normalize(log.summarize(since)) == _brute_force(entries, since), hours
+
+
+def test_recent_audit_skips_old_segments(log):
+    log.append(_entry(30, "old.py"))
+    log.append(_entry(0.5, "new.py"))
+    log.flush()
+
+    # Unreadable old segment: a recent audit must not open it
+    (log.segment_dir / "2026-03-09.jsonl.gz").write_bytes(b"not gzip")
+    assert set(log.summarize(NOW - timedelta(hours=2))) == {"new.py"}
+
+
+def test_legacy_log_is_split_into_segments(tmp_path):
+    entries = [_entry(50), _entry(26, "b.py"), _entry(2, "c.py")]
+    (tmp_path / "access_log.jsonl").write_text(
+        "\n".join(json.dumps(e) for e in entries) + "\nnot json\n"
+    )
+    log = AccessLog(tmp_path)
+
+    since = NOW - timedelta(hours=72)
+    assert _normalize(log.summarize(since)) == _brute_force(entries, since)
+    assert log.flush() == 0
+
+    log.append(_entry(1, "d.py"))
+    log.flush()
+    assert sorted(p.name for p in log.segment_dir.glob("*.gz")) == [
+        "2026-03-08.jsonl.gz",
+        "2026-03-09.jsonl.gz",
+    ]
+    # The malformed line stays with the newest day it followed
+    assert len(log.active_path.read_text().splitlines()) == 3
+    assert set(log.summarize(since)) == {"a.py", "b.py", "c.py", "d.py"}
+    log.close()
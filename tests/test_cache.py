@@ -0,0 +1,150 @@
+"""Tests for the file-hash keyed cache."""
+
+import json
+import os
+
+from idlergear.cache import FileHashCache, file_hash
+
+
+def _project(tmp_path):
+    (tmp_path / ".idlergear").mkdir()
+    return tmp_path
+
+
+def test_get_or_compute_reuses_until_content_changes(tmp_path):
+    """Values are recomputed only when the file content changes."""
+    project = _project(tmp_path)
+    source = project / "a.txt"
+    source.write_text("one")
+    calls = []
+
+    def compute(path):
+        calls.append(path)
+        return path.read_text().upper()
+
+    cache = FileHashCache("test", project)
+    assert cache.get_or_compute("a", source, compute) == "ONE"
+    assert cache.get_or_compute("a", source, compute) == "ONE"
+    assert len(calls) == 1
+
+    source.write_text("two")
+    assert cache.get_or_compute("a", source, compute) == "TWO"
+    assert len(calls) == 2
+
+
+def test_touch_without_change_is_a_hit(tmp_path):
+    """A new mtime with the same content does not recompute."""
+    project = _project(tmp_path)
+    source = project / "a.txt"
+    source.write_text("same")
+
+    cache = FileHashCache("test", project)
+    cache.get_or_compute("a", source, lambda p: 1)
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+
+    assert cache.get_or_compute("a", source, lambda p: 2) == 1
+
+
+def test_extra_fingerprint_invalidates(tmp_path):
+    """Changing the extra fingerprint forces a recompute."""
+    project = _project(tmp_path)
+    source = project / "a.txt"
+    source.write_text("x")
+
+    cache = FileHashCache("test", project)
+    cache.get_or_compute("a", source, lambda p: 1, extra="v1")
+
+    assert cache.get_or_compute("a", source, lambda p: 2, extra="v2") == 2
+
+
+def test_save_and_reload(tmp_path):
+    """Saved entries are visible to a new cache instance."""
+    project = _project(tmp_path)
+    source = project / "a.txt"
+    source.write_text("x")
+
+    cache = FileHashCache("test", project)
+    cache.put("a", source, {"value": 42})
+    cache.save()
+
+    assert (project / ".idlergear" / "cache" / "test.json").exists()
+    assert FileHashCache("test", project).get("a", source) == {"value": 42}
+
+
+def test_prune_and_clear(tmp_path):
+    """prune drops unwanted keys; clear removes the cache file."""
+    project = _project(tmp_path)
+    source = project / "a.txt"
+    source.write_text("x")
+
+    cache = FileHashCache("test", project)
+    cache.put("keep", source, 1)
+    cache.put("drop", source, 2)
+
+    assert cache.prune(lambda key: key == "keep") == 1
+    assert cache.keys() == ["keep"]
+
+    cache.save()
+    cache.clear()
+    assert not cache.path.exists()
+
+
+def test_file_hash_is_content_based(tmp_path):
+    """Identical content hashes identically."""
+    (tmp_path / "a").write_text("data")
+    (tmp_path / "b").write_text("data")
+
+    assert file_hash(tmp_path / "a") == file_hash(tmp_path / "b")
+
+
+def test_dataclass_values_round_trip(tmp_path):
+    """Dataclass values are stored as JSON and rebuilt with nested types."""
+    from idlergear.docs_dotnet import DotNetMethod, DotNetParameter, DotNetType
+
+    project = _project(tmp_path)
+    source = project / "a.xml"
+    source.write_text("x")
+    value = DotNetType(
+        name="Outer",
+        methods=[DotNetMethod(name="Run", parameters=[DotNetParameter(name="x")])],
+        nested_types=[DotNetType(name="Inner", bases=["Base"])],
+    )
+
+    cache = FileHashCache("test", project, DotNetType)
+    cache.put("a", source, value)
+    cache.save()
+
+    loaded = FileHashCache("test", project, DotNetType).get("a", source)
+    assert loaded == value
+    assert isinstance(loaded.nested_types[0], DotNetType)
+
+
+def test_untrusted_cache_files_are_ignored(tmp_path):
+    """Foreign, stale or malformed cache contents are misses, not errors."""
+    project = _project(tmp_path)
+    source = project / "a.txt"
+    source.write_text("x")
+    cache_file = project / ".idlergear" / "cache" / "test.json"
+    cache_file.parent.mkdir()
+
+    cache = FileHashCache("test", project, list[tuple[int, str]])
+    cache.put("a", source, [(1, "one")])
+    cache.put("b", source, [(2, "two")])
+    cache.save()
+    data = json.loads(cache_file.read_text())
+
+    data["entries"]["a"][4] = {"not": "a list"}
+    data["entries"]["b"] = "garbage"
+    cache_file.write_text(json.dumps(data))
+    reloaded = FileHashCache("test", project, list[tuple[int, str]])
+    assert reloaded.get("a", source) is None
+    assert reloaded.get("b", source) is None
+    assert reloaded.get_or_compute("a", source, lambda p: [(3, "three")]) == [(3, "three")]
+
+    data["version"] = "0:other"
+    cache_file.write_text(json.dumps(data))
+    assert FileHashCache("test", project).keys() == []
+
+    cache_file.write_bytes(b"\x80\x04not json")
+    assert FileHashCache("test", project).keys() == []
@@ -0,0 +1,133 @@
+"""Tests for call-site extraction and in-memory call resolution."""
+
+from pathlib import Path
+
+import pytest
+
+from idlergear.graph.parsers import TreeSitterParser
+from idlergear.graph.populators.call_graph import (
+    CallGraphBuilder,
+    SymbolIndex,
+    SymbolRef,
+)
+
+
+def _parse(tmp_path: Path, name: str, code: str) -> dict:
+    path = tmp_path / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(code)
+    return TreeSitterParser().parse_file(path)
+
+
+class TestCallExtraction:
+    """TreeSitterParser call sites and import bindings."""
+
+    def test_python_calls_and_bindings(self, tmp_path):
+        result = _parse(
+            tmp_path,
+            "mod.py",
+            "from ..a.b import c as d\n"
+            "import x.y as z\n"
+            "def f():\n"
+            "    d(1); self.g(); z.h(); make().run()\n",
+        )
+        assert result["imports"][0]["bindings"] == [
+            {"name": "d", "module": "..a.b", "symbol": "c"}
+        ]
+        assert result["imports"][1]["bindings"] == [
+            {"name": "z", "module": "x.y", "symbol": None}
+        ]
+        calls = {(c["name"], c["receiver"]) for c in result["calls"]}
+        assert calls == {("d", None), ("g", "self"), ("h", "z"), ("run", "?"), ("make", None)}
+
+    def test_typescript_symbols_and_bindings(self, tmp_path):
+        result = _parse(
+            tmp_path,
+            "main.ts",
+            'import def, { a as b } from "./x";\n'
+            "class K { m(): void { b(); } }\n",
+        )
+        assert [s["name"] for s in result["symbols"]] == ["K", "K.m"]
+        assert result["imports"][0]["bindings"] == [
+            {"name": "def", "module": "./x", "symbol": "default"},
+            {"name": "b", "module": "./x", "symbol": "a"},
+        ]
+
+    def test_rust_use_list_bindings(self, tmp_path):
+        result = _parse(tmp_path, "lib.rs", "use crate::a::{b, c::d as e, self};\n")
+        assert result["imports"][0]["bindings"] == [
+            {"name": "b", "module": "crate::a", "symbol": "b"},
+            {"name": "e", "module": "crate::a::c", "symbol": "d"},
+            {"name": "a", "module": "crate", "symbol": "a"},
+        ]
+
+    def test_go_import_bindings(self, tmp_path):
+        result = _parse(
+            tmp_path,
+            "main.go",
+            'package main\nimport (\n u "example.com/m/util"\n "fmt"\n)\n',
+        )
+        assert result["imports"][0]["bindings"] == [
+            {"name": "u", "module": "example.com/m/util", "symbol": None},
+            {"name": "fmt", "module": "fmt", "symbol": None},
+        ]
+
+
+class TestCallGraphBuilder:
+    """Resolution against a SymbolIndex without a database."""
+
+    @pytest.fixture
+    def index(self):
+        return SymbolIndex([
+            SymbolRef("a.py:1:run", "run", "a.py", "function", 1, 5),
+            SymbolRef("a.py:7:Job", "Job", "a.py", "class", 7, 12),
+            SymbolRef("a.py:8:Job.start", "Job.start", "a.py", "method", 8, 9),
+            SymbolRef("a.py:10:Job.stop", "Job.stop", "a.py", "method", 10, 12),
+            SymbolRef("b.py:1:helper", "helper", "b.py", "function", 1, 2),
+            SymbolRef("c.py:1:Other.stop", "Other.stop", "c.py", "method", 1, 2),
+        ])
+
+    def test_enclosing_picks_innermost(self, index):
+        assert index.enclosing("a.py", 8).name == "Job.start"
+        assert index.enclosing("a.py", 7).name == "Job"
+        assert index.enclosing("a.py", 6) is None
+
+    def test_resolves_imports_self_and_locals(self, tmp_path, index):
+        (tmp_path / "a.py").write_text("")
+        (tmp_path / "b.py").write_text("")
+        builder = CallGraphBuilder(tmp_path, index)
+        table = builder.import_table(
+            "a.py",
+            "python",
+            [{"line": 1, "bindings": [{"name": "h", "module": "b", "symbol": "helper"}]}],
+        )
+        assert table.files == {"b.py": 1}
+
+        edges = builder.resolve_calls(
+            "a.py",
+            "python",
+            [
+                {"name": "h", "receiver": None, "line": 2},
+                {"name": "h", "receiver": None, "line": 3},
+                {"name": "stop", "receiver": "self", "line": 9},
+                {"name": "Job", "receiver": None, "line": 4},
+                {"name": "print", "receiver": None, "line": 4},
+            ],
+            table,
+        )
+        assert edges == {
+            ("a.py:1:run", "b.py:1:helper"): 2,
+            ("a.py:8:Job.start", "a.py:10:Job.stop"): 1,
+            ("a.py:1:run", "a.py:7:Job"): 1,
+        }
+
+    def test_ambiguous_method_left_unresolved(self, tmp_path, index):
+        builder = CallGraphBuilder(tmp_path, index)
+        table = builder.import_table("b.py", "python", [])
+        calls = [{"name": "stop", "receiver": "obj", "line": 1}]
+        # Job.stop and Other.stop both match: no guess
+        assert builder.resolve_calls("b.py", "python", calls, table) == {}
+
+        index.remove_file("c.py")
+        edges = builder.resolve_calls("b.py", "python", calls, table)
+        assert edges == {("b.py:1:helper", "a.py:10:Job.stop"): 1}
@@ -0,0 +1,119 @@
+"""Import-time budget for the idlergear CLI.
+
+Hooks and agents run ``idlergear`` many times per session, so start-up cost
+matters. These tests run the CLI under ``python -X importtime`` and fail if
+a basic invocation imports heavy optional dependencies, loads sub-command
+groups it does not need, or goes over its import-time budget.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from idlergear.cli_commands import SUBCOMMANDS, load_subcommand
+
+# Optional dependencies that must only load inside the commands using them
+HEAVY_MODULES = (
+    "chromadb",
+    "grpc",
+    "kuzu",
+    "llama_index",
+    "numpy",
+    "opentelemetry",
+    "pandas",
+    "sentence_transformers",
+    "textual",
+    "torch",
+)
+
+# Total import time of an invocation (all modules, seconds)
+TOTAL_BUDGET = 1.0
+
+# Import time of idlergear's own modules (seconds)
+IDLERGEAR_BUDGET = 0.15
+
+RUN_CLI = """\
+import atexit, json, sys
+atexit.register(lambda: print("MODULES " + json.dumps(sorted(sys.modules)), file=sys.stderr))
+from idlergear.cli import app
+sys.argv = ["idlergear", *sys.argv[1:]]
+app()
+"""
+
+
+def profile_cli(args, cwd, pycache):
+    """Run the CLI under -X importtime.
+
+    Returns:
+        Tuple of (loaded module names, total seconds, idlergear seconds)
+    """
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(pycache))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    command = [sys.executable, "-X", "importtime", "-c", RUN_CLI, *args]
+    # The first run writes bytecode; measure the second like an installed CLI
+    subprocess.run(command, cwd=cwd, env=env, capture_output=True, timeout=60)
+    result = subprocess.run(
+        command, cwd=cwd, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    modules, total, own = set(), 0, 0
+    for line in result.stderr.splitlines():
+        if line.startswith("MODULES "):
+            modules = set(json.loads(line[len("MODULES ") :]))
+        elif line.startswith("import time:") and "self [us]" not in line:
+            self_us, _, name = line[len("import time:") :].split("|")
+            total += int(self_us)
+            if name.strip().split(".")[0] == "idlergear":
+                own += int(self_us)
+    return modules, total / 1e6, own / 1e6
+
+
+@pytest.mark.parametrize(
+    "args,group",
+    [
+        (["--help"], None),
+        (["--no-upgrade", "task", "list"], "task"),
+    ],
+)
+def test_cli_import_budget(args, group, temp_project, tmp_path):
+    modules, total, own = profile_cli(args, temp_project, tmp_path / "pycache")
+
+    heavy = sorted(
+        name for name in modules if name.split(".")[0] in HEAVY_MODULES
+    )
+    assert heavy == [], f"idlergear {' '.join(args)} imported {heavy}"
+
+    groups = {
+        name.rsplit(".", 1)[1]
+        for name in modules
+        if name.startswith("idlergear.cli_commands.")
+    }
+    assert groups == ({group} if group else set())
+
+    assert total < TOTAL_BUDGET, f"imports took {total:.3f}s"
+    assert own < IDLERGEAR_BUDGET, f"idlergear modules took {own:.3f}s"
+
+
+def test_subcommand_registry_matches_modules():
+    for name, (_, help_text) in SUBCOMMANDS.items():
+        assert load_subcommand(name).info.help == help_text
+
+
+def test_numpy_loads_only_for_large_batches():
+    """The heavy-module check above is only meaningful with numpy installed."""
+    pytest.importorskip("numpy")
+    code = """\
+import sys
+from idlergear import relevance
+relevance.score_batch([0.0], [None], [0])
+assert "numpy" not in sys.modules
+n = relevance.NUMPY_MIN_BATCH
+relevance.score_batch([0.0] * n, [None] * n, [0] * n)
+assert "numpy" in sys.modules
+"""
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
@@ -259,3 +259,197 @@ class TestCodePopulator:
 
         # Should still process the other files
         assert stats["files"] >= 2
+
+
+class TestApplyChanges:
+    """Tests for incremental updates from file change batches."""
+
+    @staticmethod
+    def _symbols(db, path):
+        result = db.get_connection().execute(
+            "MATCH (f:File {path: $path})-[:CONTAINS]->(s:Symbol) RETURN s.name",
+            {"path": path},
+        )
+        names = set()
+        while result.has_next():
+            names.add(result.get_next()[0])
+        return names
+
+    def test_modified_file_replaces_symbols(self, temp_db, temp_code_repo):
+        from types import SimpleNamespace
+
+        populator = CodePopulator(temp_db, temp_code_repo, enable_vector_search=False)
+        populator.populate_directory("src")
+        assert "world" in self._symbols(temp_db, "src/simple.py")
+
+        (temp_code_repo / "src" / "simple.py").write_text("def renamed():\n    pass\n")
+        stats = populator.apply_changes(
+            [SimpleNamespace(path="src/simple.py", kind="modified")]
+        )
+
+        assert stats["files"] == 1
+        assert stats["removed"] > 0
+        assert self._symbols(temp_db, "src/simple.py") == {"renamed"}
+        # Other files untouched
+        assert "Calculator" in self._symbols(temp_db, "src/utils.py")
+
+    def test_deleted_file_marked_and_emptied(self, temp_db, temp_code_repo):
+        from types import SimpleNamespace
+
+        populator = CodePopulator(temp_db, temp_code_repo, enable_vector_search=False)
+        populator.populate_directory("src")
+
+        (temp_code_repo / "src" / "utils.py").unlink()
+        populator.apply_changes([SimpleNamespace(path="src/utils.py", kind="deleted")])
+
+        assert self._symbols(temp_db, "src/utils.py") == set()
+        result = temp_db.get_connection().execute(
+            "MATCH (f:File {path: 'src/utils.py'}) RETURN f.file_exists"
+        )
+        assert result.get_next()[0] is False
+
+    def test_non_source_changes_ignored(self, temp_db, temp_code_repo):
+        from types import SimpleNamespace
+
+        populator = CodePopulator(temp_db, temp_code_repo, enable_vector_search=False)
+        stats = populator.apply_changes([SimpleNamespace(path="README.md", kind="created")])
+        assert stats == {"files": 0, "symbols": 0, "removed": 0, "calls": 0}
+
+
+@pytest.fixture
+def call_graph_repo():
+    """Repository with cross-file calls in several languages."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo_path = Path(tmpdir)
+        files = {
+            "src/pkg/__init__.py": "",
+            "src/pkg/helpers.py": (
+                "def normalize(value):\n"
+                "    return value.strip()\n"
+                "\n"
+                "\n"
+                "class Store:\n"
+                "    def save(self, item):\n"
+                "        return self.validate(item)\n"
+                "\n"
+                "    def validate(self, item):\n"
+                "        return normalize(item)\n"
+            ),
+            "src/pkg/app.py": (
+                "from .helpers import normalize, Store\n"
+                "from . import helpers\n"
+                "\n"
+                "\n"
+                "def handle(raw):\n"
+                "    clean = normalize(raw)\n"
+                "    Store().save(clean)\n"
+                "    return helpers.normalize(clean)\n"
+            ),
+            "web/util.ts": "export function format(x: string): string { return x; }\n",
+            "web/main.ts": (
+                'import { format as fmt } from "./util";\n'
+                "export function render(v: string) { return fmt(v); }\n"
+            ),
+            "rs/src/lib.rs": (
+                "mod net;\n"
+                "use crate::net::client::connect;\n"
+                "pub fn start() { connect(); net::client::Client::new(); }\n"
+            ),
+            "rs/src/net/mod.rs": "pub mod client;\n",
+            "rs/src/net/client.rs": (
+                "pub struct Client {}\n"
+                "impl Client { pub fn new() -> Client { Client {} } }\n"
+                "pub fn connect() {}\n"
+            ),
+            "gosvc/go.mod": "module example.com/svc\n",
+            "gosvc/util/util.go": "package util\nfunc Help() int { return 1 }\n",
+            "gosvc/main.go": (
+                "package main\n"
+                'import "example.com/svc/util"\n'
+                "func run() { util.Help(); other() }\n"
+            ),
+            "gosvc/other.go": "package main\nfunc other() {}\n",
+        }
+        for rel_path, content in files.items():
+            path = repo_path / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        yield repo_path
+
+
+class TestCallGraph:
+    """Tests for CALLS/IMPORTS resolution."""
+
+    @staticmethod
+    def _calls(db):
+        result = db.get_connection().execute(
+            "MATCH (a:Symbol)-[r:CALLS]->(b:Symbol) RETURN a.id, b.id, r.call_count"
+        )
+        calls = {}
+        while result.has_next():
+            caller, callee, count = result.get_next()
+            calls[(caller, callee)] = count
+        return calls
+
+    def test_calls_resolved_across_languages(self, temp_db, call_graph_repo):
+        populator = CodePopulator(temp_db, call_graph_repo, enable_vector_search=False)
+        stats = populator.populate_directory(".")
+
+        calls = self._calls(temp_db)
+        assert calls[("src/pkg/app.py:5:handle", "src/pkg/helpers.py:1:normalize")] == 2
+        assert ("src/pkg/app.py:5:handle", "src/pkg/helpers.py:5:Store") in calls
+        assert ("src/pkg/helpers.py:6:Store.save", "src/pkg/helpers.py:9:Store.validate") in calls
+        assert ("web/main.ts:2:render", "web/util.ts:1:format") in calls
+        assert ("rs/src/lib.rs:3:start", "rs/src/net/client.rs:3:connect") in calls
+        assert ("rs/src/lib.rs:3:start", "rs/src/net/client.rs:2:Client.new") in calls
+        assert ("gosvc/main.go:3:run", "gosvc/util/util.go:2:Help") in calls
+        assert ("gosvc/main.go:3:run", "gosvc/other.go:2:other") in calls
+        assert stats["calls"] == len(calls)
+
+    def test_imports_edges_created(self, temp_db, call_graph_repo):
+        populator = CodePopulator(temp_db, call_graph_repo, enable_vector_search=False)
+        populator.populate_directory(".")
+
+        result = temp_db.get_connection().execute(
+            "MATCH (a:File)-[r:IMPORTS]->(b:File) RETURN a.path, b.path, r.import_type"
+        )
+        edges = set()
+        while result.has_next():
+            edges.add(tuple(result.get_next()))
+        assert ("src/pkg/app.py", "src/pkg/helpers.py", "python") in edges
+        assert ("web/main.ts", "web/util.ts", "typescript") in edges
+        assert ("gosvc/main.go", "gosvc/util/util.go", "go") in edges
+
+    def test_callers_and_impact_queries(self, temp_db, call_graph_repo):
+        from idlergear.graph.queries import query_impact_analysis, query_symbol_callers
+
+        CodePopulator(temp_db, call_graph_repo, enable_vector_search=False).populate_directory(".")
+
+        callers = query_symbol_callers(temp_db, "normalize")
+        assert {c["name"] for c in callers["callers"]} == {"handle", "Store.validate"}
+
+        impact = query_impact_analysis(temp_db, "Store.validate")
+        assert impact["callers"] == ["Store.save"]
+
+    def test_external_calls_not_linked(self, temp_db, call_graph_repo):
+        (call_graph_repo / "src" / "pkg" / "ext.py").write_text(
+            "import os\n\n\ndef cwd():\n    return os.getcwd()\n"
+        )
+        CodePopulator(temp_db, call_graph_repo, enable_vector_search=False).populate_directory("src")
+
+        assert not [edge for edge in self._calls(temp_db) if edge[0].startswith("src/pkg/ext.py")]
+
+    def test_apply_changes_relinks_callers(self, temp_db, call_graph_repo):
+        from types import SimpleNamespace
+
+        populator = CodePopulator(temp_db, call_graph_repo, enable_vector_search=False)
+        populator.populate_directory(".")
+
+        helpers = call_graph_repo / "src" / "pkg" / "helpers.py"
+        helpers.write_text("\n\n" + helpers.read_text())  # Shift every symbol id
+        populator.apply_changes([SimpleNamespace(path="src/pkg/helpers.py", kind="modified")])
+
+        calls = self._calls(temp_db)
+        assert calls[("src/pkg/app.py:5:handle", "src/pkg/helpers.py:3:normalize")] == 2
+        assert ("src/pkg/helpers.py:8:Store.save", "src/pkg/helpers.py:11:Store.validate") in calls
+        assert not [edge for edge in calls if edge[1] == "src/pkg/helpers.py:1:normalize"]
@@ -0,0 +1,103 @@
+"""Tests for incremental commit-task linking."""
+
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from idlergear.graph import GraphDatabase, initialize_schema
+from idlergear.graph.database import reset_database
+from idlergear.graph.populators import CommitTaskLinker
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary graph database with a file and two tasks."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = GraphDatabase(Path(tmpdir) / "test_graph.db")
+        initialize_schema(db)
+        db.execute("CREATE (:File {path: 'a.py'})")
+        for task_id in (1, 2):
+            db.execute("CREATE (:Task {id: $id})", {"id": task_id})
+        yield db
+        db.close()
+        reset_database()
+
+
+def _commit(db, commit_hash: str, message: str, day: int) -> None:
+    db.execute(
+        "CREATE (:Commit {hash: $hash, message: $message, timestamp: $ts})",
+        {"hash": commit_hash, "message": message, "ts": datetime(2026, 1, day)},
+    )
+    db.execute(
+        """
+        MATCH (c:Commit {hash: $hash}), (f:File {path: 'a.py'})
+        CREATE (c)-[:CHANGES {status: 'modified'}]->(f)
+        """,
+        {"hash": commit_hash},
+    )
+
+
+def _count(db, pattern: str) -> int:
+    return db.execute(f"MATCH {pattern} RETURN COUNT(*)").get_next()[0]
+
+
+def test_extract_task_ids():
+    linker = CommitTaskLinker.__new__(CommitTaskLinker)
+    message = "Task: #5, closes #6 and fixes #7 #8\nSee http://x/#9"
+    assert sorted(linker._extract_task_ids(message)) == [5, 6, 7, 8]
+    assert linker._extract_task_ids("") == []
+
+
+class TestLinkAll:
+    """Watermark-based incremental linking."""
+
+    def test_rerun_scans_only_new_commits(self, temp_db):
+        linker = CommitTaskLinker(temp_db)
+        _commit(temp_db, "c1", "Fix #1", day=1)
+
+        result = linker.link_all()
+        assert result == {
+            "links_created": 1,
+            "tasks_linked": 1,
+            "commits_linked": 1,
+            "commits_scanned": 1,
+        }
+        assert _count(temp_db, "(:Task {id: 1})-[:MODIFIES]->(:File)") == 1
+
+        assert linker.link_all()["commits_scanned"] == 0
+
+        _commit(temp_db, "c2", "Task #2, refs #1", day=2)
+        result = linker.link_all()
+        assert (result["commits_scanned"], result["links_created"]) == (1, 2)
+        # One MODIFIES edge per task and file, however many commits
+        assert _count(temp_db, "()-[:MODIFIES]->()") == 2
+        assert _count(temp_db, "()-[:IMPLEMENTED_IN]->()") == 3
+
+    def test_references_to_future_tasks_are_retried(self, temp_db):
+        linker = CommitTaskLinker(temp_db)
+        _commit(temp_db, "c1", "Closes #3", day=1)
+        assert linker.link_all()["links_created"] == 0
+
+        temp_db.execute("CREATE (:Task {id: 3})")
+        result = linker.link_all()
+        assert (result["commits_scanned"], result["links_created"]) == (0, 1)
+
+    def test_out_of_order_commit_triggers_full_scan(self, temp_db):
+        linker = CommitTaskLinker(temp_db)
+        _commit(temp_db, "c2", "Fix #1", day=2)
+        linker.link_all()
+
+        # Older than the watermark, e.g. from a merged branch
+        _commit(temp_db, "c1", "Fix #2", day=1)
+        result = linker.link_all()
+        assert (result["commits_scanned"], result["links_created"]) == (2, 1)
+
+    def test_lost_links_trigger_full_scan(self, temp_db):
+        linker = CommitTaskLinker(temp_db)
+        _commit(temp_db, "c1", "Fix #1", day=1)
+        linker.link_all()
+
+        temp_db.execute("MATCH ()-[r:IMPLEMENTED_IN]->() DELETE r")
+        assert linker.link_all()["links_created"] == 1
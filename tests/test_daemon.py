@@ -1,6 +1,7 @@
 """Tests for IdlerGear daemon functionality."""
 
 import json
+import subprocess
 
 import pytest
 
@@ -1092,3 +1093,58 @@ class TestDaemonResilience:
             await client.disconnect()
         finally:
             daemon_lifecycle.stop()
+
+
+class TestGraphDaemon:
+    """Tests for the daemon acting as the single knowledge graph writer."""
+
+    @pytest.fixture
+    def daemon_lifecycle(self, temp_project):
+        """Get a lifecycle manager for the temp project."""
+        root = temp_project / ".idlergear"
+        return DaemonLifecycle(root)
+
+    def test_queries_route_to_daemon_writer(self, daemon_lifecycle, temp_project):
+        """Query-only callers fall back to the daemon while it holds the lock."""
+        from idlergear.daemon.client import call_daemon
+        from idlergear.graph.database import query_database, reset_database
+        from idlergear.graph.populate_all import populate_in_daemon
+
+        reset_database()
+        daemon_lifecycle.start(wait=True)
+        try:
+            # graph.query never opens the database itself
+            with pytest.raises(DaemonError, match="not open"):
+                call_daemon(temp_project, "graph.query", {"query": "RETURN 1"})
+
+            results = populate_in_daemon(temp_project, max_commits=5, timeout=120)
+            assert "tasks" in results
+
+            with query_database(temp_project) as db:
+                assert type(db).__name__ == "DaemonGraphDatabase"
+                result = db.get_connection().execute(
+                    "MATCH (t:Task) WHERE t.id >= $min RETURN count(t) AS n",
+                    {"min": 0},
+                )
+                assert result.get_column_names() == ["n"]
+                assert result.get_next() == [results["tasks"]["tasks"]]
+                assert not result.has_next()
+
+            # A rebuild swaps the database under the daemon, which keeps serving
+            for args in (
+                ["init", "-q"],
+                ["add", "-A"],
+                ["-c", "user.name=T", "-c", "user.email=t@example.com", "commit", "-qm", "init"],
+            ):
+                subprocess.run(["git", *args], cwd=temp_project, check=True)
+            populate_in_daemon(temp_project, max_commits=5, timeout=120, rebuild=True)
+            rows = call_daemon(
+                temp_project, "graph.query", {"query": "MATCH (t:Task) RETURN count(t)"}
+            )["rows"]
+            assert rows == [[results["tasks"]["tasks"]]]
+
+            # Only graph.populate writes, so cached reads can't go stale
+            with pytest.raises(DaemonError, match="read-only"):
+                call_daemon(temp_project, "graph.query", {"query": "MATCH (t:Task) DELETE t"})
+        finally:
+            daemon_lifecycle.stop()
@@ -0,0 +1,250 @@
+"""Tests for the daemon file-change feed."""
+
+import subprocess
+import time
+
+import pytest
+
+from idlergear.daemon.changes import (
+    ChangeFeed,
+    FileChange,
+    annotation_consumer,
+    git_blob_hash,
+    register_default_consumers,
+)
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """A small committed git repository."""
+    _git(tmp_path, "init")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test User")
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('hi')\n")
+    (tmp_path / "README.md").write_text("# Readme\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-m", "init")
+    return tmp_path
+
+
+def _collect(feed):
+    batches = []
+    feed.subscribe(batches.append)
+    return batches
+
+
+class TestGitBlobHash:
+    def test_matches_git(self, git_repo):
+        expected = subprocess.run(
+            ["git", "hash-object", "src/app.py"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert git_blob_hash(git_repo / "src" / "app.py") == expected
+
+    def test_missing_file(self, tmp_path):
+        assert git_blob_hash(tmp_path / "nope") is None
+
+
+class TestChangeFeed:
+    def test_modification_uses_index_baseline(self, git_repo):
+        feed = ChangeFeed(git_repo)
+        batches = _collect(feed)
+        old = git_blob_hash(git_repo / "src" / "app.py")
+
+        (git_repo / "src" / "app.py").write_text("print('bye')\n")
+        feed.notify(git_repo / "src" / "app.py")
+        changes = feed.flush()
+
+        assert changes == [
+            FileChange("src/app.py", "modified", old, git_blob_hash(git_repo / "src" / "app.py"))
+        ]
+        assert batches == [changes]
+
+    def test_events_coalesced_and_noop_saves_dropped(self, git_repo):
+        feed = ChangeFeed(git_repo)
+        batches = _collect(feed)
+
+        for _ in range(5):
+            feed.notify("src/app.py")
+        (git_repo / "README.md").write_text("# Readme\n")  # same content
+        feed.notify("README.md")
+        (git_repo / "src" / "app.py").write_text("x = 1\n")
+
+        changes = feed.flush()
+        assert [c.path for c in changes] == ["src/app.py"]
+        assert feed.flush() == []
+        assert len(batches) == 1
+
+    def test_create_delete_and_ignored(self, git_repo):
+        feed = ChangeFeed(git_repo)
+        feed.flush()  # load baseline
+
+        (git_repo / "src" / "new.py").write_text("y = 2\n")
+        (git_repo / "debug.log").write_text("noise\n")
+        (git_repo / "README.md").unlink()
+        feed.notify_many(["src/new.py", "debug.log", "README.md"])
+        changes = {c.path: c for c in feed.flush()}
+
+        assert set(changes) == {"src/new.py", "README.md"}
+        assert changes["src/new.py"].kind == "created"
+        assert changes["src/new.py"].old_hash is None
+        assert changes["README.md"].kind == "deleted"
+        assert changes["README.md"].new_hash is None
+
+    def test_directory_events(self, git_repo):
+        feed = ChangeFeed(git_repo)
+        feed.flush()
+
+        import shutil
+
+        shutil.rmtree(git_repo / "src")
+        feed.notify("src")
+        assert [(c.path, c.kind) for c in feed.flush()] == [("src/app.py", "deleted")]
+
+        (git_repo / "lib").mkdir()
+        (git_repo / "lib" / "a.py").write_text("a = 1\n")
+        feed.notify("lib")
+        assert [(c.path, c.kind) for c in feed.flush()] == [("lib/a.py", "created")]
+
+    def test_excluded_paths_ignored(self, git_repo):
+        feed = ChangeFeed(git_repo)
+        (git_repo / "node_modules").mkdir()
+        (git_repo / "node_modules" / "x.js").write_text("1")
+        feed.notify("node_modules/x.js")
+        feed.notify(git_repo.parent / "outside.txt")
+        assert feed.flush() == []
+
+    def test_consumer_errors_isolated(self, git_repo):
+        feed = ChangeFeed(git_repo)
+
+        def broken(changes):
+            raise RuntimeError("boom")
+
+        feed.subscribe(broken)
+        batches = _collect(feed)
+        (git_repo / "src" / "app.py").write_text("z = 3\n")
+        feed.notify("src/app.py")
+        feed.flush()
+        assert len(batches) == 1
+
+    def test_unsubscribe(self, git_repo):
+        feed = ChangeFeed(git_repo)
+        batches = []
+        unsubscribe = feed.subscribe(batches.append)
+        unsubscribe()
+        (git_repo / "src" / "app.py").write_text("z = 3\n")
+        feed.notify("src/app.py")
+        feed.flush()
+        assert batches == []
+
+    def test_debounce_thread_publishes(self, git_repo):
+        feed = ChangeFeed(git_repo, debounce=0.05)
+        batches = _collect(feed)
+        feed.start(watch=False)
+        try:
+            (git_repo / "src" / "app.py").write_text("w = 4\n")
+            feed.notify("src/app.py")
+            deadline = time.monotonic() + 5
+            while not batches and time.monotonic() < deadline:
+                time.sleep(0.02)
+        finally:
+            feed.stop()
+        assert [c.path for c in batches[0]] == ["src/app.py"]
+
+
+class TestAnnotationConsumer:
+    def test_rename_moves_annotation(self, git_repo):
+        from idlergear.file_annotation_storage import SQLiteAnnotationStorage
+        from idlergear.file_registry import FileEntry, FileStatus
+
+        storage = SQLiteAnnotationStorage(git_repo / ".idlergear" / "file_annotations")
+        storage.save_annotation(
+            FileEntry(path="src/app.py", status=FileStatus.CURRENT, description="App")
+        )
+
+        feed = ChangeFeed(git_repo)
+        feed.subscribe(annotation_consumer(git_repo))
+        feed.flush()
+        (git_repo / "src" / "app.py").rename(git_repo / "src" / "main.py")
+        feed.notify_many(["src/app.py", "src/main.py"])
+        feed.flush()
+
+        assert storage.load_annotation("src/app.py") is None
+        assert storage.load_annotation("src/main.py").description == "App"
+
+
+class TestDefaultConsumers:
+    def test_graph_and_vector_updates_are_opt_in(self, git_repo):
+        assert register_default_consumers(ChangeFeed(git_repo)) == [
+            "annotations",
+            "test_map",
+        ]
+
+    def test_vector_consumer_takes_over_embedding(self, git_repo, monkeypatch):
+        from idlergear.config import set_config_value
+        from idlergear.daemon import changes
+
+        monkeypatch.setattr(changes, "_vector_search_installed", lambda: True)
+        (git_repo / ".idlergear" / "graph.db").mkdir(parents=True)
+        (git_repo / ".idlergear" / "code_index").mkdir()
+        set_config_value("daemon.graph_updates", True, project_path=git_repo)
+        set_config_value("daemon.vector_updates", True, project_path=git_repo)
+        graph_factories = []
+        monkeypatch.setattr(
+            changes, "graph_consumer", lambda root, vectors=True: graph_factories.append(vectors)
+        )
+
+        names = register_default_consumers(ChangeFeed(git_repo))
+
+        assert names == ["annotations", "graph", "vectors", "test_map"]
+        assert graph_factories == [False]
+
+
+class TestDaemonFilesMethods:
+    @pytest.mark.asyncio
+    async def test_notify_flush_and_broadcast(self, git_repo):
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from idlergear.daemon.server import DaemonServer
+
+        storage = git_repo / ".idlergear"
+        storage.mkdir()
+        server = DaemonServer(storage / "daemon.sock", storage / "daemon.pid", storage)
+        broadcasts = []
+
+        async def fake_broadcast(event, data):
+            broadcasts.append((event, data))
+
+        server.broadcast = fake_broadcast
+        server.attach_change_feed(ChangeFeed(git_repo), asyncio.get_running_loop())
+
+        (git_repo / "src" / "app.py").write_text("v = 5\n")
+        conn = MagicMock()
+        assert await server._handle_files_notify({"paths": ["src/app.py"]}, conn) == {
+            "queued": 1
+        }
+        result = await server._handle_files_flush({}, conn)
+        await asyncio.sleep(0.05)
+
+        assert [c["path"] for c in result["changes"]] == ["src/app.py"]
+        assert broadcasts[0][0] == "files.changed"
+        assert broadcasts[0][1]["changes"][0]["kind"] == "modified"
+
+    @pytest.mark.asyncio
+    async def test_notify_without_feed(self, tmp_path):
+        from unittest.mock import MagicMock
+
+        from idlergear.daemon.server import DaemonServer
+
+        server = DaemonServer(tmp_path / "d.sock", tmp_path / "d.pid", tmp_path)
+        with pytest.raises(ValueError):
+            await server._handle_files_notify({"paths": []}, MagicMock())
@@ -0,0 +1,98 @@
+"""Tests for daemon-served context snapshots."""
+
+import os
+
+import pytest
+
+from idlergear.context_client import fetch_snapshot, main
+from idlergear.daemon.client import DaemonClient
+from idlergear.daemon.lifecycle import DaemonLifecycle
+from idlergear.daemon.snapshots import ContextSnapshots
+
+
+@pytest.fixture
+def counting_snapshots(temp_project):
+    calls = []
+
+    def render(project_root, mode):
+        calls.append(mode)
+        return {"text": f"{mode} #{len(calls)}", "data": {"mode": mode}}
+
+    return ContextSnapshots(temp_project, render=render), calls
+
+
+def test_snapshot_is_cached_until_knowledge_changes(counting_snapshots, temp_project):
+    snapshots, calls = counting_snapshots
+
+    first = snapshots.get("minimal")
+    second = snapshots.get("minimal")
+    assert (first["cached"], second["cached"]) == (False, True)
+    assert second["text"] == first["text"]
+    assert calls == ["minimal"]
+
+    # A write the daemon never heard about changes the fingerprint
+    note = temp_project / ".idlergear" / "notes" / "001-new.md"
+    note.write_text("---\nid: 1\n---\nNew note\n")
+    os.utime(note, ns=(0, 2**62))
+    assert snapshots.get("minimal")["cached"] is False
+    assert calls == ["minimal", "minimal"]
+
+
+def test_snapshot_expires_after_ttl(temp_project):
+    calls = []
+    snapshots = ContextSnapshots(
+        temp_project,
+        render=lambda root, mode: calls.append(mode) or {"text": "", "data": {}},
+        ttl=0,
+    )
+    snapshots.get("standard")
+    snapshots.get("standard")
+    assert calls == ["standard", "standard"]
+
+
+def test_events_invalidate_only_for_knowledge(counting_snapshots):
+    snapshots, calls = counting_snapshots
+    snapshots.warm()
+    assert calls == ["minimal", "standard", "detailed"]
+
+    assert not snapshots.on_event("agent.registered", {})
+    source_change = {"changes": [{"path": "src/app.py", "kind": "modified"}]}
+    assert not snapshots.on_event("files.changed", source_change)
+    assert snapshots.get("minimal")["cached"] is True
+
+    assert snapshots.on_event("task.created", {"id": 1})
+    assert snapshots.get("minimal")["cached"] is False
+
+    note_change = {"changes": [{"path": ".idlergear/notes/002-x.md", "kind": "added"}]}
+    assert snapshots.on_event("files.changed", note_change)
+    assert snapshots.on_event("files.changed", {"changes": [{"path": "VISION.md"}]})
+
+
+def test_client_without_daemon(temp_project, capsys):
+    assert fetch_snapshot(temp_project) is None
+    assert main(["--daemon-only"]) == 1
+
+    # Falls back to rendering locally
+    assert main(["--mode", "minimal"]) == 0
+    assert capsys.readouterr().out.strip()
+
+
+@pytest.mark.asyncio
+async def test_client_fetches_snapshot_from_daemon(temp_project):
+    lifecycle = DaemonLifecycle(temp_project / ".idlergear")
+    lifecycle.start(wait=True)
+    client = DaemonClient(lifecycle.socket_path)
+    try:
+        before = fetch_snapshot(temp_project, "minimal", timeout=10.0)
+        assert before is not None
+        assert "Snapshot test task" not in before["text"]
+
+        await client.connect()
+        await client.call("task.create", {"title": "Snapshot test task"})
+
+        after = fetch_snapshot(temp_project, "minimal", timeout=10.0)
+        assert "Snapshot test task" in after["text"]
+        assert after["data"]["open_tasks"][0]["title"] == "Snapshot test task"
+    finally:
+        await client.disconnect()
+        lifecycle.stop()
@@ -312,6 +312,35 @@ class TestParseXmlDocs:
             assert dtype.name == "IService"
             assert dtype.kind == "interface"
 
+    def test_processed_members_are_detached(self, tmp_path, monkeypatch):
+        """Parsed <member> elements don't pile up under <members>."""
+        from idlergear import docs_dotnet
+
+        members = "".join(
+            f'<member name="F:Ns.Widget.F{i}"><summary>Field {i}.</summary></member>'
+            for i in range(50)
+        )
+        xml_path = tmp_path / "Big.xml"
+        xml_path.write_text(
+            '<?xml version="1.0"?><doc><members>'
+            f'<member name="T:Ns.Widget"><summary>W.</summary></member>{members}'
+            "</members></doc>"
+        )
+        sizes = []
+        iterparse = docs_dotnet.ET.iterparse
+
+        def watching_iterparse(*args, **kwargs):
+            for event, elem in iterparse(*args, **kwargs):
+                if event == "end" and elem.tag == "members":
+                    sizes.append(len(elem))
+                yield event, elem
+
+        monkeypatch.setattr(docs_dotnet.ET, "iterparse", watching_iterparse)
+        assembly = parse_xml_docs(xml_path)
+
+        assert len(assembly.namespaces[0].types[0].fields) == 50
+        assert sizes == [0]
+
     def test_parse_file_not_found(self):
         """Test that FileNotFoundError is raised for missing file."""
         with pytest.raises(FileNotFoundError):
@@ -568,3 +597,63 @@ class TestCliIntegration:
             data = json.loads(result.output)
             assert data["detected"] is True
             assert data.get("language") == "dotnet"
+
+
+class TestStreamingXmlDocs:
+    """Tests for iterparse-based parsing and the doc cache."""
+
+    XML = """<?xml version="1.0"?>
+<doc>
+    <assembly><name>Streamed</name></assembly>
+    <members>
+        <member name="M:App.Widget.Render(System.Int32)">
+            <summary>Renders.</summary>
+            <param name="width">Width.</param>
+        </member>
+        <member name="T:App.Widget">
+            <summary>A widget.</summary>
+        </member>
+        <member name="E:App.Widget.Changed">
+            <summary>Raised on change.</summary>
+        </member>
+    </members>
+</doc>"""
+
+    def test_members_before_type_are_attached(self):
+        """Members listed before their type still attach to it."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            xml_path = Path(tmpdir) / "Streamed.xml"
+            xml_path.write_text(self.XML)
+
+            assembly = parse_xml_docs(xml_path)
+
+            widget = assembly.namespaces[0].types[0]
+            assert assembly.name == "Streamed"
+            assert widget.methods[0].name == "Render"
+            assert widget.methods[0].parameters[0].type == "System.Int32"
+            assert widget.events[0].summary == "Raised on change."
+
+    def test_load_xml_docs_uses_cache(self, monkeypatch):
+        """load_xml_docs parses unchanged files only once."""
+        import idlergear.docs_dotnet as docs_dotnet
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / ".idlergear").mkdir()
+            xml_path = root / "Streamed.xml"
+            xml_path.write_text(self.XML)
+
+            calls = []
+            original = docs_dotnet.parse_xml_docs
+
+            def counting_parse(path):
+                calls.append(path)
+                return original(path)
+
+            monkeypatch.setattr(docs_dotnet, "parse_xml_docs", counting_parse)
+
+            first = docs_dotnet.load_xml_docs(xml_path, project_path=root)
+            second = docs_dotnet.load_xml_docs(xml_path, project_path=root)
+
+            assert len(calls) == 1
+            assert second.to_dict() == first.to_dict()
@@ -585,3 +585,37 @@ version = "0.1.0"
             assert data["crate"] == "test_crate"
             assert data["language"] == "rust"
             assert data["mode"] == "minimal"
+
+
+class TestRustDocCache:
+    """Tests for per-file caching in parse_rust_crate."""
+
+    def test_only_changed_files_are_reparsed(self, monkeypatch):
+        """Unchanged .rs files come from the doc cache."""
+        import idlergear.docs_rust as docs_rust
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / ".idlergear").mkdir()
+            (root / "Cargo.toml").write_text('[package]\nname = "c"\n')
+            (root / "src").mkdir()
+            (root / "src" / "lib.rs").write_text("pub fn a() {}\n")
+            (root / "src" / "util.rs").write_text("pub fn b() {}\n")
+
+            parsed = []
+            original = docs_rust.parse_rust_file
+
+            def counting_parse(file_path):
+                parsed.append(file_path.name)
+                return original(file_path)
+
+            monkeypatch.setattr(docs_rust, "parse_rust_file", counting_parse)
+
+            first = docs_rust.parse_rust_crate(root)
+            (root / "src" / "util.rs").write_text("pub fn b() {}\npub fn c() {}\n")
+            second = docs_rust.parse_rust_crate(root)
+
+            assert sorted(parsed) == ["lib.rs", "util.rs", "util.rs"]
+            assert [m.path for m in second.modules] == [m.path for m in first.modules]
+            util = next(m for m in second.modules if m.path.endswith("util.rs"))
+            assert {f.name for f in util.functions} == {"b", "c"}
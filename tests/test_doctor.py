@@ -863,3 +863,118 @@ class TestRunDoctorWithTestChecks:
         assert "test_failures" in check_names
         assert "test_coverage" in check_names
         assert "external_tests" in check_names
+
+
+class TestParallelCachedDoctor:
+    """Tests for concurrent execution and result caching in run_doctor."""
+
+    def _counting_check(self, monkeypatch, name, inputs, calls, result=None, run=None):
+        from idlergear import doctor
+        from idlergear.doctor import CheckResult, CheckStatus, DoctorCheck
+
+        def default_run(project_path):
+            calls.append(name)
+            return result or CheckResult(name=name, status=CheckStatus.OK, message="ok")
+
+        check = DoctorCheck(name, run or default_run, inputs)
+        monkeypatch.setattr(doctor, "DOCTOR_CHECKS", [check])
+        return check
+
+    def test_cached_result_reused_until_input_changes(self, temp_project, monkeypatch):
+        import os
+
+        from idlergear.doctor import run_doctor
+
+        calls = []
+        watched = temp_project / "watched.txt"
+        watched.write_text("one")
+        self._counting_check(monkeypatch, "counting", lambda p: ["watched.txt"], calls)
+
+        first = run_doctor(temp_project)
+        second = run_doctor(temp_project)
+        assert calls == ["counting"]
+        assert [c.to_dict() for c in first.checks] == [c.to_dict() for c in second.checks]
+
+        watched.write_text("changed")
+        st = watched.stat()
+        os.utime(watched, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        run_doctor(temp_project)
+        assert calls == ["counting", "counting"]
+
+    def test_config_change_invalidates_cache(self, temp_project, monkeypatch):
+        from idlergear.doctor import run_doctor
+
+        calls = []
+        self._counting_check(monkeypatch, "counting", lambda p: [], calls)
+
+        run_doctor(temp_project)
+        config = temp_project / ".idlergear" / "config.toml"
+        config.write_text(config.read_text() + "\n# changed\n")
+        run_doctor(temp_project)
+        assert calls == ["counting", "counting"]
+
+    def test_uncacheable_and_no_cache_always_run(self, temp_project, monkeypatch):
+        from idlergear.doctor import run_doctor
+
+        calls = []
+        self._counting_check(monkeypatch, "clock", None, calls)
+        run_doctor(temp_project)
+        run_doctor(temp_project)
+        assert calls == ["clock", "clock"]
+
+        calls.clear()
+        self._counting_check(monkeypatch, "counting", lambda p: [], calls)
+        run_doctor(temp_project)
+        run_doctor(temp_project, use_cache=False)
+        assert calls == ["counting", "counting"]
+
+    def test_slow_check_times_out(self, temp_project, monkeypatch):
+        import threading
+
+        from idlergear import doctor
+        from idlergear.doctor import CheckResult, CheckStatus, DoctorCheck, run_doctor
+
+        release = threading.Event()
+
+        def slow(project_path):
+            release.wait(5)
+            return CheckResult(name="slow", status=CheckStatus.OK, message="ok")
+
+        def fast(project_path):
+            return CheckResult(name="fast", status=CheckStatus.OK, message="ok")
+
+        monkeypatch.setattr(
+            doctor,
+            "DOCTOR_CHECKS",
+            [DoctorCheck("slow", slow, lambda p: []), DoctorCheck("fast", fast)],
+        )
+        try:
+            report = run_doctor(temp_project, timeout=0.2)
+        finally:
+            release.set()
+
+        assert [c.name for c in report.checks] == ["slow", "fast"]
+        assert report.checks[0].status == CheckStatus.WARNING
+        assert "timed out" in report.checks[0].message
+        assert report.checks[1].status == CheckStatus.OK
+
+    def test_failing_check_reported_not_raised(self, temp_project, monkeypatch):
+        from idlergear.doctor import CheckStatus, run_doctor
+
+        def boom(project_path):
+            raise RuntimeError("kaput")
+
+        self._counting_check(monkeypatch, "boom", lambda p: [], [], run=boom)
+        report = run_doctor(temp_project)
+
+        assert report.checks[0].status == CheckStatus.WARNING
+        assert "kaput" in report.checks[0].message
+
+    def test_results_keep_registration_order(self, temp_project):
+        from idlergear.doctor import DOCTOR_CHECKS, run_doctor
+
+        report = run_doctor(temp_project, use_cache=False)
+        names = [c.name for c in report.checks]
+        assert names.index("initialization") < names.index("mcp_config")
+        assert names.index("mcp_config") < names.index("knowledge_graph")
+        assert len(DOCTOR_CHECKS) >= 15
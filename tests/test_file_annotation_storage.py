@@ -6,7 +6,11 @@ from pathlib import Path
 
 import pytest
 
-from idlergear.file_annotation_storage import FileAnnotationStorage, migrate_from_legacy
+from idlergear.file_annotation_storage import (
+    FileAnnotationStorage,
+    SQLiteAnnotationStorage,
+    migrate_from_legacy,
+)
 from idlergear.file_registry import FileEntry, FileStatus, PatternRule
 
 
@@ -278,3 +282,114 @@ def test_scalability():
         # Verify only that file changed
         updated = storage.load_annotation("src/file_500.py")
         assert updated.description == "UPDATED"
+
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    storage = SQLiteAnnotationStorage(tmp_path / "file_annotations")
+    yield storage
+    storage.close()
+
+
+def _entries():
+    return [
+        FileEntry(
+            path="src/api/auth.py",
+            status=FileStatus.CURRENT,
+            description="Authentication API endpoints",
+            tags=["api", "auth"],
+            components=["AuthController"],
+        ),
+        FileEntry(
+            path="src/api/old_auth.py",
+            status=FileStatus.DEPRECATED,
+            description="Legacy AUTHENTICATION (50% done)",
+            tags=["auth"],
+        ),
+        FileEntry(
+            path="src/db.py",
+            status=FileStatus.CURRENT,
+            description="Database models",
+            components=["User"],
+        ),
+    ]
+
+
+class TestSQLiteAnnotationStorage:
+    """Packed single-database backend."""
+
+    def test_save_load_preserves_created(self, sqlite_storage):
+        entry = _entries()[0]
+        sqlite_storage.save_annotation(entry)
+        created = sqlite_storage.conn.execute("SELECT created FROM annotations").fetchone()[0]
+
+        entry.tags = ["api"]
+        sqlite_storage.save_annotation(entry)
+
+        loaded = sqlite_storage.load_annotation("src/api/auth.py")
+        assert loaded.tags == ["api"] and loaded.components == ["AuthController"]
+        row = sqlite_storage.conn.execute("SELECT created, updated FROM annotations").fetchone()
+        assert row[0] == created and row[1] >= created
+        # Tag index follows the update
+        assert set(sqlite_storage.list_tags()) == {"api"}
+        assert sqlite_storage.load_annotation("missing.py") is None
+
+    def test_search_matches_file_backend(self, sqlite_storage, tmp_path):
+        files = FileAnnotationStorage(tmp_path / "json")
+        for entry in _entries():
+            files.save_annotation(entry)
+        assert sqlite_storage.save_annotations(_entries()) == 3
+
+        queries = [
+            {"query": "authentication"},
+            {"query": "API"},
+            {"query": "50%"},
+            {"query": "nothing here"},
+            {"tags": ["auth"], "status": FileStatus.CURRENT},
+            {"tags": ["api", "missing"]},
+            {"components": ["User", "AuthController"], "query": "data"},
+        ]
+        for kwargs in queries:
+            expected = sorted(e.path for e in files.search(**kwargs))
+            assert [e.path for e in sqlite_storage.search(**kwargs)] == expected, kwargs
+
+        assert sqlite_storage.list_tags() == {
+            "api": {"count": 1, "files": ["src/api/auth.py"]},
+            "auth": {"count": 2, "files": ["src/api/auth.py", "src/api/old_auth.py"]},
+        }
+
+    def test_delete_removes_index_rows(self, sqlite_storage):
+        sqlite_storage.save_annotations(_entries())
+
+        assert sqlite_storage.delete_annotation("src/api/auth.py") is True
+        assert sqlite_storage.delete_annotation("src/api/auth.py") is False
+
+        assert sqlite_storage.list_paths() == ["src/api/old_auth.py", "src/db.py"]
+        assert sqlite_storage.search(query="endpoints") == []
+        assert sqlite_storage.search(components=["AuthController"]) == []
+
+    def test_imports_existing_json_and_exports_it_back(self, tmp_path):
+        base = tmp_path / "file_annotations"
+        legacy = FileAnnotationStorage(base)
+        for entry in _entries():
+            legacy.save_annotation(entry)
+        with open(base / "src" / "db.py.json") as f:
+            original = json.load(f)
+
+        storage = SQLiteAnnotationStorage(base)
+        assert storage.list_paths() == ["src/api/auth.py", "src/api/old_auth.py", "src/db.py"]
+        assert [e.path for e in storage.search(tags=["auth"])] == [
+            "src/api/auth.py",
+            "src/api/old_auth.py",
+        ]
+
+        assert storage.export_json(tmp_path / "export") == 3
+        with open(tmp_path / "export" / "src" / "db.py.json") as f:
+            assert json.load(f) == original
+        storage.close()
+
+        # Only a newly created database imports; reopening keeps its contents
+        legacy.delete_annotation("src/db.py")
+        storage = SQLiteAnnotationStorage(base)
+        assert len(storage.list_annotations()) == 3
+        storage.close()
@@ -6,7 +6,13 @@ from pathlib import Path
 
 import pytest
 
-from idlergear.file_registry import FileEntry, FileRegistry, FileStatus, PatternRule
+from idlergear.file_registry import (
+    FileEntry,
+    FileRegistry,
+    FileStatus,
+    PatternMatcher,
+    PatternRule,
+)
 
 
 def test_file_status_enum():
@@ -79,6 +85,46 @@ def test_pattern_rule_glob_patterns():
     assert not rule.matches("file12.txt")
 
 
+def test_pattern_matcher_matches_rules_in_priority_order():
+    """The combined matcher agrees with trying each rule in turn."""
+    patterns = [
+        "docs/*.md",
+        "*.bak",
+        "archive/**/*",
+        "README",
+        "src/legacy/old.py",
+        "file?.txt",
+        "**/generated/*.py",
+        "*.py",
+        "*",
+    ]
+    rules = [PatternRule(pattern=p, status=FileStatus.DEPRECATED) for p in patterns]
+    matcher = PatternMatcher(rules)
+    paths = [
+        "docs/guide.md",
+        "docs/sub/guide.md",
+        "a/b/c.bak",
+        "archive/x.bak",
+        "archive/deep/data.csv",
+        "README",
+        "pkg/README",
+        "src/legacy/old.py",
+        "legacy/old.py",
+        "dir/file1.txt",
+        "file12.txt",
+        "generated/x.py",
+        "src/generated/x.py",
+        "src/app.py",
+        "dir/",
+    ]
+
+    for path in paths:
+        expected = next((r for r in rules if r.matches(path)), None)
+        assert matcher.match(path) is expected, path
+
+    assert PatternMatcher([]).match("anything") is None
+
+
 def test_file_registry_init():
     """Test FileRegistry initialization."""
     with tempfile.TemporaryDirectory() as tmpdir:
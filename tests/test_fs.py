@@ -185,3 +185,132 @@ class TestFilesystemServer:
 
         assert "allowed_directories" in result
         assert str(temp_dir) in result["allowed_directories"]
+
+    def test_search_files_prunes_excluded_dirs(self, fs_server, temp_dir):
+        """Test that excluded directories are not searched."""
+        (temp_dir / "app.js").write_text("")
+        (temp_dir / "node_modules" / "lib").mkdir(parents=True)
+        (temp_dir / "node_modules" / "lib" / "dep.js").write_text("")
+
+        result = fs_server.search_files(str(temp_dir), pattern="*.js")
+
+        assert result["matches"] == [str(temp_dir.resolve() / "app.js")]
+
+    def test_search_files_respects_nested_gitignore(self, fs_server, temp_dir):
+        """Test that .gitignore files below the search root are honoured."""
+        (temp_dir / ".gitignore").write_text("*.log\n")
+        (temp_dir / "pkg").mkdir()
+        (temp_dir / "pkg" / ".gitignore").write_text("generated/\n")
+        (temp_dir / "pkg" / "generated").mkdir()
+        (temp_dir / "pkg" / "generated" / "out.py").write_text("")
+        (temp_dir / "pkg" / "mod.py").write_text("")
+        (temp_dir / "pkg" / "debug.log").write_text("")
+
+        result = fs_server.search_files(str(temp_dir), pattern="*")
+        names = {Path(p).name for p in result["matches"]}
+
+        assert "mod.py" in names
+        assert "out.py" not in names
+        assert "generated" not in names
+        assert "debug.log" not in names
+
+    def test_directory_tree_respects_max_depth(self, fs_server, temp_dir):
+        """Test that directory_tree stops listing below max_depth."""
+        (temp_dir / "a" / "b").mkdir(parents=True)
+        (temp_dir / "a" / "b" / "deep.txt").write_text("")
+
+        result = fs_server.directory_tree(str(temp_dir), max_depth=1)
+
+        a_node = result["children"][0]
+        assert a_node["name"] == "a"
+        assert "children" not in a_node
+
+    def test_read_file_line_range(self, fs_server, temp_dir):
+        """Test reading a line range reports paging metadata."""
+        test_file = temp_dir / "lines.txt"
+        test_file.write_text("".join(f"line {i}\n" for i in range(1, 11)))
+
+        result = fs_server.read_file(str(test_file), start_line=3, end_line=4)
+
+        assert result["content"] == "line 3\nline 4\n"
+        assert result["end_line"] == 4
+        assert result["truncated"] is True
+        assert result["next_line"] == 5
+
+        tail = fs_server.read_file(str(test_file), start_line=10)
+        assert tail["content"] == "line 10\n"
+        assert tail["truncated"] is False
+
+    def test_read_file_byte_range(self, fs_server, temp_dir):
+        """Test reading a byte range with mmap."""
+        test_file = temp_dir / "data.csv"
+        test_file.write_text("a,b\n1,2\n3,4\n")
+
+        result = fs_server.read_file(str(test_file), offset=4, length=4)
+
+        assert result["content"] == "1,2\n"
+        assert result["size"] == 12
+        assert result["next_offset"] == 8
+
+    def test_read_file_max_bytes_keeps_utf8_intact(self, fs_server, temp_dir):
+        """Test truncation does not split multi-byte characters."""
+        test_file = temp_dir / "utf8.txt"
+        test_file.write_text("aé" * 10, encoding="utf-8")
+
+        result = fs_server.read_file(str(test_file), max_bytes=2)
+
+        assert result["content"] == "a"
+        assert result["truncated"] is True
+        assert result["next_offset"] == 1
+
+    def test_read_file_limit_smaller_than_a_character(self, fs_server, temp_dir):
+        """Test a byte limit inside a multi-byte character still advances."""
+        test_file = temp_dir / "utf8.txt"
+        test_file.write_text("éé", encoding="utf-8")
+
+        result = fs_server.read_file(str(test_file), offset=0, length=1)
+
+        assert result["content"] == "é"
+        assert result["length"] == 2
+        assert result["next_offset"] == 2
+
+    def test_read_file_first_line_longer_than_max_bytes(self, fs_server, temp_dir):
+        """Test paging past a line longer than max_bytes."""
+        test_file = temp_dir / "minified.js"
+        test_file.write_text("x" * 100 + "\nshort\n")
+
+        result = fs_server.read_file(str(test_file), start_line=1, max_bytes=10)
+
+        assert result["content"] == "x" * 10
+        assert result["truncated"] is True
+        assert result["next_offset"] == 10
+        assert result["next_line"] == 2
+
+        rest = fs_server.read_file(str(test_file), start_line=result["next_line"])
+        assert rest["content"] == "short\n"
+
+    def test_read_multiple_files_checks_access_first(self, fs_server, temp_dir):
+        """Test files outside the allowed dirs are not stat'ed or sized."""
+        with tempfile.TemporaryDirectory() as outside_dir:
+            outside = Path(outside_dir) / "secret.txt"
+            outside.write_text("x" * 10)
+
+            result = fs_server.read_multiple_files([str(outside)])
+
+        assert "Access denied" in result[0]["error"]
+        assert "size" not in result[0]
+
+    def test_read_multiple_files_budget(self, fs_server, temp_dir):
+        """Test the total byte budget truncates and skips files in order."""
+        paths = []
+        for i in range(3):
+            path = temp_dir / f"f{i}.txt"
+            path.write_text("x" * 10)
+            paths.append(str(path))
+
+        result = fs_server.read_multiple_files(paths, max_total_bytes=15)
+
+        assert [r["content"] for r in result] == ["x" * 10, "x" * 5, ""]
+        assert result[0]["truncated"] is False
+        assert result[1]["truncated"] is True
+        assert "skipped" in result[2]
@@ -63,6 +63,153 @@ class TestGraphDatabase:
             # Connection should be closed after exit
 
 
+class TestConnectionManager:
+    """Tests for pooled reads, the writer lock and read-only mode."""
+
+    def test_read_connections_are_pooled(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with GraphDatabase(Path(tmpdir) / "pool.db", pool_size=2) as db:
+                with db.read_connection() as first:
+                    with db.read_connection() as second:
+                        assert first is not second
+                        assert first is not db.get_connection()
+                with db.read_connection() as again:
+                    assert again in (first, second)
+                assert db._pool_created == 2
+
+    def test_concurrent_reads_while_writing(self):
+        import threading
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with GraphDatabase(Path(tmpdir) / "rw.db", pool_size=3) as db:
+                initialize_schema(db)
+                errors = []
+
+                def read():
+                    try:
+                        for _ in range(20):
+                            columns, rows = db.fetch_rows(
+                                "MATCH (t:Task) RETURN count(t) AS n"
+                            )
+                            assert columns == ["n"]
+                    except Exception as e:  # pragma: no cover - reported below
+                        errors.append(e)
+
+                readers = [threading.Thread(target=read) for _ in range(3)]
+                for thread in readers:
+                    thread.start()
+                with db.writer() as conn:
+                    for i in range(20):
+                        conn.execute(
+                            "CREATE (:Task {id: $id, title: 't', state: 'open'})",
+                            {"id": i},
+                        )
+                for thread in readers:
+                    thread.join()
+
+                assert not errors
+                assert db.fetch_rows("MATCH (t:Task) RETURN count(t)")[1] == [[20]]
+
+    def test_swap_waits_for_running_query(self):
+        import threading
+
+        from idlergear.graph.database import replace_database
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with GraphDatabase(Path(tmpdir) / "new.db") as new:
+                new.execute("CREATE NODE TABLE T(id INT64, PRIMARY KEY(id))")
+                new.execute("CREATE (:T {id: 1}), (:T {id: 2})")
+
+            with GraphDatabase(Path(tmpdir) / "live.db") as db:
+                db.execute("CREATE NODE TABLE T(id INT64, PRIMARY KEY(id))")
+                db.execute("CREATE (:T {id: 1})")
+                borrowed, release = threading.Event(), threading.Event()
+                seen = []
+
+                def query():
+                    with db.read_connection() as conn:
+                        borrowed.set()
+                        release.wait(5)
+                        seen.append(conn.execute("MATCH (t:T) RETURN count(t)").get_next())
+
+                reader = threading.Thread(target=query)
+                reader.start()
+                borrowed.wait(5)
+                swap = threading.Thread(
+                    target=replace_database, args=(db, Path(tmpdir) / "new.db")
+                )
+                swap.start()
+                swap.join(0.2)
+                # The swap waits for the borrowed connection
+                assert swap.is_alive()
+                release.set()
+                reader.join(5)
+                swap.join(5)
+
+                assert seen == [[1]]
+                # The same instance now serves the rebuilt graph
+                assert db.fetch_rows("MATCH (t:T) RETURN count(t)")[1] == [[2]]
+
+    def test_read_only_rejects_writes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "ro.db"
+            with GraphDatabase(db_path) as db:
+                initialize_schema(db)
+
+            with GraphDatabase(db_path, read_only=True) as first:
+                # Any number of read-only openers may share the database
+                with GraphDatabase(db_path, read_only=True) as second:
+                    assert second.fetch_rows("MATCH (t:Task) RETURN count(t)")[1] == [[0]]
+                with pytest.raises(PermissionError):
+                    with first.writer():
+                        pass
+
+    def test_locked_database_raises(self):
+        import subprocess
+        import sys
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "locked.db"
+            with GraphDatabase(db_path):
+                code = (
+                    "import sys\n"
+                    "from idlergear.graph import GraphDatabase, GraphLockedError\n"
+                    "try:\n"
+                    f"    GraphDatabase({str(db_path)!r}, read_only=True)\n"
+                    "except GraphLockedError:\n"
+                    "    sys.exit(3)\n"
+                )
+                proc = subprocess.run([sys.executable, "-c", code])
+            assert proc.returncode == 3
+
+    def test_query_database_opens_read_only_and_releases(self, temp_project):
+        from idlergear.graph.database import get_open_database, query_database
+
+        reset_database()
+        with GraphDatabase(temp_project / ".idlergear" / "graph.db") as db:
+            initialize_schema(db)
+
+        with query_database(temp_project) as db:
+            assert db.read_only
+            assert query_task_context(db, 1) == {}
+        # Nothing stays open, so another process could take the write lock
+        assert get_open_database() is None
+        with GraphDatabase(temp_project / ".idlergear" / "graph.db"):
+            pass
+
+    def test_get_database_upgrades_read_only_instance(self, temp_project):
+        reset_database()
+        with GraphDatabase(temp_project / ".idlergear" / "graph.db") as db:
+            initialize_schema(db)
+        try:
+            assert get_database(project_path=temp_project, read_only=True).read_only
+            writable = get_database(project_path=temp_project)
+            assert not writable.read_only
+            assert get_database(project_path=temp_project, read_only=True) is writable
+        finally:
+            reset_database()
+
+
 class TestSchemaInitialization:
     """Tests for schema creation and validation."""
 
@@ -349,3 +496,112 @@ class TestQueryFunctions:
 
         result = query_related_files(temp_db, "src/main.py")
         assert result == []
+
+
+class TestPreparedQueries:
+    """Tests for parameter binding, prepared statements and the result cache."""
+
+    def _add_file(self, db, path):
+        db.execute(
+            """
+            CREATE (f:File {path: $path, language: 'python', size: 1, lines: 3,
+                            last_modified: timestamp('2025-01-18T12:00:00'),
+                            file_exists: true, hash: 'h'})
+            """,
+            {"path": path},
+        )
+
+    def test_execute_binds_parameters(self, temp_db):
+        result = temp_db.execute("RETURN $a + $b AS total", {"a": 40, "b": 2})
+        assert result.get_next()[0] == 42
+
+    def test_quotes_in_values(self, temp_db):
+        """Values are bound, not formatted into the query text."""
+        initialize_schema(temp_db)
+        self._add_file(temp_db, "src/it's.py")
+
+        context = query_file_context(temp_db, "src/it's.py")
+        assert context["lines"] == 3
+
+    def test_statements_prepared_once_per_connection(self, temp_db):
+        initialize_schema(temp_db)
+        for path in ("a.py", "b.py", "c.py"):
+            self._add_file(temp_db, path)
+
+        statements = temp_db._prepared[id(temp_db.get_connection())]
+        assert len(statements) == 1
+
+    def test_prepare_warning_suppressed_only_locally(self, temp_db):
+        import warnings
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            assert temp_db.fetch_rows("RETURN $a", {"a": 1})[1] == [[1]]
+        assert not any("prepare" in str(f[1]) for f in warnings.filters)
+
+    def test_results_cached_until_generation_bump(self, temp_db):
+        from idlergear.graph.database import _result_cache, clear_result_cache
+
+        clear_result_cache()
+        initialize_schema(temp_db)
+        self._add_file(temp_db, "a.py")
+        generation = temp_db.generation
+
+        query = "MATCH (f:File) RETURN count(f)"
+        assert temp_db.cached_rows(query)[1] == [[1]]
+        self._add_file(temp_db, "b.py")
+        # Writes outside a populator don't invalidate on their own
+        assert temp_db.cached_rows(query)[1] == [[1]]
+        assert _result_cache.hits == 1
+
+        assert temp_db.bump_generation() == generation + 1
+        assert temp_db.cached_rows(query)[1] == [[2]]
+
+    def test_read_only_rows_refuse_writes(self, temp_db):
+        initialize_schema(temp_db)
+        self._add_file(temp_db, "a.py")
+
+        query = "MATCH (f:File) SET f.lines = 99 RETURN f.lines"
+        with pytest.raises(RuntimeError, match="read-only"):
+            temp_db.fetch_rows(query, read_only=True)
+        rows = temp_db.fetch_rows("MATCH (f:File) RETURN f.lines", read_only=True)[1]
+        assert rows == [[3]]
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "CREATE (:File {path: 'x'})",
+            "MATCH (f:File) RETURN f; COMMIT; CREATE (:File {path: 'x'})",
+            "COPY (MATCH (f:File) RETURN f.path) TO '/tmp/files.csv'",
+            "CALL threads=1",
+            "COMMIT",
+        ],
+    )
+    def test_check_read_query_rejects(self, query):
+        from idlergear.graph.database import check_read_query
+
+        with pytest.raises(ValueError):
+            check_read_query(query)
+
+    def test_check_read_query_accepts_reads(self):
+        from idlergear.graph.database import check_read_query
+
+        check_read_query("// files\nMATCH (f:File) WHERE f.path = 'a;b' RETURN f;")
+        check_read_query("optional match (f:File) return f")
+        check_read_query("CALL show_tables() RETURN *")
+
+    def test_generation_shared_across_instances(self, temp_db):
+        other = GraphDatabase.__new__(GraphDatabase)
+        other._generation_path = temp_db._generation_path
+        temp_db.bump_generation()
+        assert other.generation == temp_db.generation
+
+    def test_populators_bump_generation(self, temp_db):
+        from idlergear.graph.populators import CodePopulator
+
+        initialize_schema(temp_db)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            (Path(tmpdir) / "mod.py").write_text("def f():\n    pass\n")
+            before = temp_db.generation
+            CodePopulator(temp_db, repo_path=Path(tmpdir)).populate_file("mod.py")
+            assert temp_db.generation > before
@@ -6,6 +6,8 @@ from unittest.mock import patch
 
 import pytest
 
+from idlergear.access_log import flush_access_logs
+
 
 @pytest.fixture
 def temp_project(tmp_path):
@@ -201,6 +203,7 @@ class TestFileAccessLogging:
         with patch("idlergear.mcp_server.find_idlergear_root", return_value=temp_project):
             _log_file_access("Read", str(old_file), "deprecated", False, "test-agent")
 
+        flush_access_logs()
         assert log_file.exists()
         log_entries = [json.loads(line) for line in log_file.read_text().strip().split("\n")]
 
@@ -222,6 +225,7 @@ class TestFileAccessLogging:
         with patch("idlergear.mcp_server.find_idlergear_root", return_value=temp_project):
             _log_file_access("Read", str(test_file), "current", True)
 
+        flush_access_logs()
         assert log_file.exists()
         log_entries = [json.loads(line) for line in log_file.read_text().strip().split("\n")]
 
@@ -345,6 +349,7 @@ class TestAccessLog:
         with patch("idlergear.mcp_server.find_idlergear_root", return_value=temp_project):
             _check_file_access(str(old_file), "read")
 
+        flush_access_logs()
         assert log_file.exists()
 
     def test_access_log_multiple_entries(self, temp_project, deprecated_file, archived_file):
@@ -358,5 +363,6 @@ class TestAccessLog:
             _check_file_access(str(old_file), "read")
             _check_file_access(str(archived_file), "read")
 
+        flush_access_logs()
         log_entries = [json.loads(line) for line in log_file.read_text().strip().split("\n")]
         assert len(log_entries) == 2
@@ -0,0 +1,107 @@
+"""Tests for PersonPopulator file ownership."""
+
+import subprocess
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from idlergear.graph import GraphDatabase, initialize_schema
+from idlergear.graph.database import reset_database
+from idlergear.graph.populators import GitPopulator, PersonPopulator
+
+
+def _git(repo: Path, *args: str, email: str = "alice@example.com") -> None:
+    subprocess.run(
+        ["git", "-c", f"user.email={email}", "-c", "user.name=Dev", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary graph database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = GraphDatabase(Path(tmpdir) / "test_graph.db")
+        initialize_schema(db)
+        yield db
+        db.close()
+        reset_database()
+
+
+@pytest.fixture
+def owned_repo():
+    """Git repo where two authors contributed to one file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        repo = Path(tmpdir)
+        (repo / ".idlergear").mkdir()
+        _git(repo, "init", "-q")
+        (repo / "app.py").write_text("a = 1\nb = 2\nc = 3\n")
+        (repo / "lib.py").write_text("x = 1\n")
+        _git(repo, "add", "app.py", "lib.py")
+        _git(repo, "commit", "-q", "-m", "Initial")
+        (repo / "app.py").write_text("a = 1\nb = 2\nc = 3\nd = 4\n")
+        _git(repo, "commit", "-q", "-am", "Add d", email="bob@example.com")
+        yield repo
+
+
+def _owns(db):
+    result = db.get_connection().execute("""
+        MATCH (p:Person)-[r:OWNS]->(f:File)
+        RETURN f.path, p.email, r.lines_contributed, r.ownership_percent
+    """)
+    rows = []
+    while result.has_next():
+        rows.append(tuple(result.get_next()))
+    return sorted(rows)
+
+
+class TestFileOwnership:
+    """Tests for blame-based OWNS relationships."""
+
+    def test_ownership_percentages(self, temp_db, owned_repo):
+        GitPopulator(temp_db, owned_repo).populate()
+        PersonPopulator(temp_db, owned_repo).populate()
+
+        assert _owns(temp_db) == [
+            ("app.py", "alice@example.com", 3, 75.0),
+            ("app.py", "bob@example.com", 1, 25.0),
+            ("lib.py", "alice@example.com", 1, 100.0),
+        ]
+
+    def test_rerun_does_not_duplicate_edges(self, temp_db, owned_repo):
+        GitPopulator(temp_db, owned_repo).populate()
+        PersonPopulator(temp_db, owned_repo).populate()
+        before = _owns(temp_db)
+
+        stats = PersonPopulator(temp_db, owned_repo).populate()
+
+        assert stats["owns"] == 0
+        assert _owns(temp_db) == before
+
+    def test_only_changed_files_reblamed(self, temp_db, owned_repo, monkeypatch):
+        GitPopulator(temp_db, owned_repo).populate()
+        PersonPopulator(temp_db, owned_repo).populate()
+        assert (owned_repo / ".idlergear" / "cache" / "blame.json").exists()
+
+        (owned_repo / "lib.py").write_text("x = 1\ny = 2\n")
+        _git(owned_repo, "commit", "-q", "-am", "Grow lib", email="bob@example.com")
+
+        blamed = []
+        original = PersonPopulator._blame_lines
+
+        def spy(self, file_path):
+            blamed.append(file_path)
+            return original(self, file_path)
+
+        monkeypatch.setattr(PersonPopulator, "_blame_lines", spy)
+        stats = PersonPopulator(temp_db, owned_repo).populate()
+
+        assert blamed == ["lib.py"]
+        assert stats["owns"] == 2
+        assert [r for r in _owns(temp_db) if r[0] == "lib.py"] == [
+            ("lib.py", "alice@example.com", 1, 50.0),
+            ("lib.py", "bob@example.com", 1, 50.0),
+        ]
@@ -0,0 +1,330 @@
+"""Tests for the populate_all stage scheduler."""
+
+import importlib
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from idlergear.graph import GraphDatabase, initialize_schema
+from idlergear.graph.bulk import BulkStager
+from idlergear.graph.database import reset_database
+from idlergear.graph.populate_all import (
+    Stage,
+    _stage_order,
+    format_profile,
+    populate_all,
+    run_stages,
+)
+from idlergear.graph.populators import DependencyPopulator, GitPopulator
+
+# The package re-exports the function under the module's name
+populate_all_module = importlib.import_module("idlergear.graph.populate_all")
+
+
+@pytest.fixture
+def temp_db():
+    """Create a temporary graph database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db = GraphDatabase(Path(tmpdir) / "test_graph.db")
+        initialize_schema(db)
+        yield db
+        db.close()
+        reset_database()
+
+
+def _stage(name, depends_on=(), run=None, items_key="items"):
+    return Stage(
+        name,
+        name,
+        tuple(depends_on),
+        run or (lambda db: {"items": 1}),
+        lambda r: [],
+        items_key,
+    )
+
+
+class TestStageOrder:
+    """DAG validation."""
+
+    def test_dependencies_come_first(self):
+        stages = [_stage("c", ["b"]), _stage("b", ["a"]), _stage("a")]
+        assert _stage_order(stages) == ["a", "b", "c"]
+
+    def test_unknown_dependency(self):
+        with pytest.raises(ValueError, match="unknown"):
+            _stage_order([_stage("a", ["missing"])])
+
+    def test_cycle(self):
+        with pytest.raises(ValueError, match="cycle"):
+            _stage_order([_stage("a", ["b"]), _stage("b", ["a"])])
+
+
+class TestRunStages:
+    """Concurrent execution with a single serialized connection."""
+
+    def test_independent_stages_overlap(self, temp_db):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(db):
+            # Deadlocks (and times out) unless both stages run at once
+            barrier.wait()
+            return {"items": 1}
+
+        stages = [_stage("a", run=meet), _stage("b", run=meet)]
+        results, timings = run_stages(stages, temp_db, max_workers=2)
+
+        assert results == {"a": {"items": 1}, "b": {"items": 1}}
+        assert all(t["status"] == "complete" for t in timings.values())
+
+    def test_dependents_wait_for_dependencies(self, temp_db):
+        finished = []
+
+        def record(name, delay=0.0):
+            def run(db):
+                time.sleep(delay)
+                finished.append(name)
+                return {"items": 1}
+
+            return run
+
+        stages = [
+            _stage("code", ["git"], run=record("code")),
+            _stage("git", run=record("git", delay=0.05)),
+            _stage("tasks", run=record("tasks")),
+        ]
+        results, _ = run_stages(stages, temp_db, max_workers=4)
+
+        assert finished.index("git") < finished.index("code")
+        assert list(results) == ["code", "git", "tasks"]
+
+    def test_queries_are_serialized(self, temp_db):
+        active = []
+        overlaps = []
+        conn = temp_db.get_connection()
+        original = conn.execute
+
+        def tracking_execute(*args, **kwargs):
+            active.append(1)
+            if len(active) > 1:
+                overlaps.append(True)
+            time.sleep(0.001)
+            try:
+                return original(*args, **kwargs)
+            finally:
+                active.pop()
+
+        temp_db.conn = type("Conn", (), {"execute": staticmethod(tracking_execute)})()
+
+        def write(prefix):
+            def run(db):
+                c = db.get_connection()
+                for i in range(20):
+                    c.execute(
+                        "CREATE (:Person {name: $name, email: $email})",
+                        {"name": f"{prefix}{i}", "email": f"{prefix}{i}@x"},
+                    )
+                return {"items": 20}
+
+            return run
+
+        stages = [_stage(p, run=write(p)) for p in "abc"]
+        _, timings = run_stages(stages, temp_db, max_workers=3)
+        temp_db.conn = conn
+
+        assert not overlaps
+        result = conn.execute("MATCH (p:Person) RETURN COUNT(p)")
+        assert result.get_next()[0] == 60
+        assert all(t["items"] == 20 and t["items_per_sec"] > 0 for t in timings.values())
+
+    def test_error_does_not_block_dependents(self, temp_db):
+        events = []
+
+        def fail(db):
+            raise RuntimeError("boom")
+
+        stages = [_stage("git", run=fail), _stage("code", ["git"])]
+        results, timings = run_stages(
+            stages,
+            temp_db,
+            on_event=lambda name, status, payload: events.append((name, status)),
+        )
+
+        assert results["git"] == {"error": "boom"}
+        assert results["code"] == {"items": 1}
+        assert timings["git"]["status"] == "error"
+        assert ("git", "error") in events and ("code", "complete") in events
+
+
+def test_format_profile():
+    profile = {
+        "wall_time": 2.0,
+        "stages": {
+            "code": {"start": 1.0, "elapsed": 1.0, "items": 50, "items_per_sec": 50.0, "status": "complete"},
+            "git": {"start": 0.0, "elapsed": 1.0, "items": 10, "items_per_sec": 10.0, "status": "complete"},
+            "tasks": {"start": 0.0, "elapsed": 2.0, "items": 0, "items_per_sec": 0.0, "status": "error"},
+        },
+    }
+    report = format_profile(profile)
+    lines = report.splitlines()
+
+    assert lines[2].startswith("git") and lines[-3].startswith("code")
+    assert "2.0x overlap" in lines[-1]
+
+
+def _git_repo(path: Path, files: dict, message: str = "init") -> None:
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    for name, text in files.items():
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        (path / name).write_text(text)
+    subprocess.run(["git", "add", "."], cwd=path, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=T", "-c", "user.email=t@x", "commit", "-qm", message],
+        cwd=path,
+        check=True,
+    )
+
+
+def _count(db, pattern: str) -> int:
+    return db.execute(f"MATCH {pattern} RETURN COUNT(*)").get_next()[0]
+
+
+def test_populate_all_reports_progress(tmp_path, monkeypatch):
+    """End-to-end run on a tiny git repository."""
+    # populate_all initializes the schema itself
+    db = GraphDatabase(tmp_path / ".idlergear" / "graph.db")
+    _git_repo(tmp_path, {"src/app.py": "def main():\n    return 1\n"})
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(populate_all_module, "get_database", lambda: db)
+
+    events = []
+    results = populate_all(
+        project_path=tmp_path,
+        verbose=False,
+        progress_callback=events.append,
+        profile=True,
+    )
+
+    assert results["git"]["commits"] == 1
+    assert results["code"]["symbols"] == 1
+    assert set(results["profile"]["stages"]) == set(results) - {"profile"}
+
+    completed = {e["step"]: e for e in events if e["status"] in ("complete", "error")}
+    assert "elapsed" in completed["git"] and "items_per_sec" in completed["git"]
+    started = [e["step"] for e in events if e["status"] == "started"]
+    assert started.index("git") < started.index("code")
+    db.close()
+
+
+class TestBulkStager:
+    """Staging rows as CSV and loading them with COPY."""
+
+    def test_load_round_trips_values(self, temp_db, tmp_path):
+        stager = BulkStager(temp_db, tmp_path / "staging")
+        message = 'Fix "quoted", comma\nsecond line \\ backslash'
+        assert stager.add_node("Commit", {
+            "hash": "abc", "message": message, "timestamp": "2026-01-18T10:42:33",
+        })
+        assert not stager.add_node("Commit", {"hash": "abc", "message": "dup"})
+        assert stager.add_node("File", {"path": "a.py", "lines": 3, "file_exists": True})
+        assert stager.add_edge("CHANGES", "abc", "a.py", {"insertions": 2})
+        # Endpoint never staged: dropped, like a MATCH on a missing node
+        assert not stager.add_edge("CHANGES", "abc", "missing.py")
+
+        counts = stager.load(temp_db)
+
+        assert counts == {"Commit": 1, "File": 1, "CHANGES": 1, "rows": 3}
+        row = temp_db.execute(
+            "MATCH (c:Commit)-[r:CHANGES]->(f:File) "
+            "RETURN c.message, c.author, r.insertions, f.lines, f.file_exists"
+        ).get_next()
+        assert row == [message, None, 2, 3, True]
+
+    def test_rejects_unknown_tables_and_properties(self, temp_db, tmp_path):
+        stager = BulkStager(temp_db, tmp_path / "staging")
+        with pytest.raises(ValueError, match="Unknown node table"):
+            stager.add_node("Nope", {"id": 1})
+        with pytest.raises(ValueError, match="colour"):
+            stager.add_node("File", {"path": "a.py", "colour": "red"})
+        stager.close()
+
+
+class TestRebuild:
+    """populate_all(rebuild=True) bulk loads a new database and swaps it in."""
+
+    FILES = {
+        "src/util.py": "def helper():\n    return 1\n",
+        "src/app.py": "from util import helper\n\ndef main():\n    return helper()\n",
+    }
+    PATTERNS = [
+        "(c:Commit)",
+        "(f:File)",
+        "(s:Symbol)",
+        "()-[r:CHANGES]->()",
+        "()-[r:CONTAINS]->()",
+        "()-[r:CALLS]->()",
+    ]
+
+    def _populate(self, tmp_path, monkeypatch, **options):
+        db = GraphDatabase(tmp_path / ".idlergear" / "graph.db")
+        monkeypatch.setattr(populate_all_module, "get_database", lambda: db)
+        try:
+            return populate_all(project_path=tmp_path, verbose=False, **options)
+        finally:
+            db.close()
+
+    def test_rebuild_matches_row_by_row_population(self, tmp_path, monkeypatch):
+        _git_repo(tmp_path, self.FILES, message="Add 'app'\n\nWith a body")
+        monkeypatch.chdir(tmp_path)
+
+        self._populate(tmp_path, monkeypatch, incremental=False)
+        with GraphDatabase(tmp_path / ".idlergear" / "graph.db") as db:
+            expected = {p: _count(db, p) for p in self.PATTERNS}
+            generation = db.generation
+            # Present only in the old graph
+            db.execute("CREATE (:Commit {hash: 'stale'})")
+
+        events = []
+        results = self._populate(
+            tmp_path, monkeypatch, rebuild=True, progress_callback=events.append
+        )
+
+        assert results["load"]["rows"] > 0
+        assert ("swap", "complete") in [(e["step"], e["status"]) for e in events]
+        with GraphDatabase(tmp_path / ".idlergear" / "graph.db") as db:
+            assert {p: _count(db, p) for p in self.PATTERNS} == expected
+            assert expected["()-[r:CALLS]->()"] == 1
+            assert db.generation > generation
+        leftovers = [p.name for p in (tmp_path / ".idlergear").iterdir()]
+        assert not [n for n in leftovers if "rebuild" in n or "staging" in n]
+
+    def test_failed_rebuild_keeps_existing_graph(self, tmp_path, monkeypatch):
+        _git_repo(tmp_path, self.FILES)
+        monkeypatch.chdir(tmp_path)
+        self._populate(tmp_path, monkeypatch)
+
+        def fail(self, stager, **kwargs):
+            raise RuntimeError("git exploded")
+
+        monkeypatch.setattr(GitPopulator, "stage", fail)
+        with pytest.raises(RuntimeError, match="git exploded"):
+            self._populate(tmp_path, monkeypatch, rebuild=True)
+        monkeypatch.undo()
+
+        # Stages after the bulk load count too
+        def fail_dependencies(self, **kwargs):
+            raise RuntimeError("manifest exploded")
+
+        monkeypatch.setattr(DependencyPopulator, "populate", fail_dependencies)
+        with GraphDatabase(tmp_path / ".idlergear" / "graph.db") as db:
+            db.execute("CREATE (:Commit {hash: 'only-in-old-graph'})")
+        with pytest.raises(RuntimeError, match="dependencies: manifest exploded"):
+            self._populate(tmp_path, monkeypatch, rebuild=True)
+
+        with GraphDatabase(tmp_path / ".idlergear" / "graph.db") as db:
+            assert _count(db, "(c:Commit)") == 2
+        leftovers = [p.name for p in (tmp_path / ".idlergear").iterdir()]
+        assert not [n for n in leftovers if "rebuild" in n or "staging" in n]
@@ -0,0 +1,77 @@
+"""Tests for multi-pattern reference scanning."""
+
+import random
+
+from idlergear.file_registry import FileRegistry, FileStatus
+from idlergear.reference_scan import AhoCorasick, ReferenceScanner, scan_references
+
+
+def test_aho_corasick_matches_naive_search():
+    rng = random.Random(7)
+    for _ in range(200):
+        patterns = ["".join(rng.choice("ab'") for _ in range(rng.randint(1, 4))) for _ in range(5)]
+        text = "".join(rng.choice("ab'\n") for _ in range(60))
+        expected = sorted(
+            (start, index)
+            for index, pattern in enumerate(patterns)
+            for start in range(len(text))
+            if text.startswith(pattern, start)
+        )
+        assert sorted(AhoCorasick(patterns).finditer(text)) == expected
+
+
+def test_scanner_reports_each_quoted_reference_once_per_line():
+    scanner = ReferenceScanner(["src/old.py", "old.py"])
+    text = "\n".join(
+        [
+            "import old  # src/old.py unquoted",
+            "load('src/old.py'); load(\"src/old.py\")",
+            "x = 'old.py'",
+            "y = '/abs/src/old.py'",
+        ]
+    )
+    assert scanner.scan_text(text) == [
+        (2, "load('src/old.py'); load(\"src/old.py\")", "src/old.py"),
+        (3, "x = 'old.py'", "old.py"),
+    ]
+
+
+def test_scan_references_covers_all_languages_and_caches(tmp_path):
+    (tmp_path / ".idlergear").mkdir()
+    (tmp_path / ".idlergear" / "notes.json").write_text('{"path": "data/v1.csv"}')
+    (tmp_path / "app.py").write_text('open("data/v1.csv")\n')
+    (tmp_path / "web").mkdir()
+    (tmp_path / "web" / "load.js").write_text("\nfetch('data/v1.csv');\n")
+    (tmp_path / "blob.bin").write_bytes(b"\0'data/v1.csv'")
+
+    refs = scan_references(tmp_path, ["data/v1.csv"])
+    assert [(r["file"], r["line"]) for r in refs] == [("app.py", 1), ("web/load.js", 2)]
+
+    cache_file = tmp_path / ".idlergear" / "cache" / "references.json"
+    assert cache_file.exists()
+    (tmp_path / "app.py").write_text("pass\n")
+    refs = scan_references(tmp_path, ["data/v1.csv"])
+    assert [r["file"] for r in refs] == ["web/load.js"]
+
+
+def test_audit_code_scan_uses_stored_deprecations(tmp_path):
+    idlergear_dir = tmp_path / ".idlergear"
+    idlergear_dir.mkdir()
+    registry = FileRegistry(idlergear_dir / "file_registry.json")
+    registry.deprecate_file("old.py", successor="new.py")
+    (tmp_path / "main.py").write_text("path = 'old.py'\n")
+
+    # A fresh registry has nothing in its in-memory cache
+    report = FileRegistry(idlergear_dir / "file_registry.json").audit_project(
+        include_code_scan=True
+    )
+
+    assert report["code_references"] == [
+        {
+            "file": "main.py",
+            "line": 1,
+            "code": "path = 'old.py'",
+            "deprecated_file": "old.py",
+            "current_version": "new.py",
+        }
+    ]
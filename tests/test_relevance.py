@@ -0,0 +1,157 @@
+"""Tests for relevance scoring and the decay sweep."""
+
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from idlergear import relevance
+from idlergear.context import gather_context
+from idlergear.relevance import (
+    calculate_relevance,
+    decay_sweep,
+    rank_by_relevance,
+    score_batch,
+    score_items,
+)
+from idlergear.storage import parse_frontmatter, render_frontmatter
+from idlergear.tasks import create_task, get_task
+
+NOW = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def _random_inputs(count: int):
+    rng = random.Random(11)
+    created, accessed, counts = [], [], []
+    for _ in range(count):
+        created_ts = NOW.timestamp() - rng.uniform(0, 200 * 86400)
+        created.append(created_ts)
+        accessed.append(
+            None if rng.random() < 0.3 else rng.uniform(created_ts, NOW.timestamp())
+        )
+        counts.append(rng.randint(0, 6))
+    return created, accessed, counts
+
+
+def _expected(created, accessed, counts, decay_function, monkeypatch):
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return NOW
+
+    monkeypatch.setattr(relevance, "datetime", FrozenDatetime)
+    to_dt = lambda ts: datetime.fromtimestamp(ts, timezone.utc)  # noqa: E731
+    expected = [
+        calculate_relevance(
+            to_dt(c),
+            to_dt(a) if a is not None else None,
+            n,
+            decay_function=decay_function,
+        )
+        for c, a, n in zip(created, accessed, counts)
+    ]
+    monkeypatch.undo()
+    return expected
+
+
+@pytest.mark.parametrize("decay_function", ["exponential", "linear", "step"])
+def test_score_batch_matches_single_item_scoring(decay_function, monkeypatch):
+    created, accessed, counts = _random_inputs(500)
+    expected = _expected(created, accessed, counts, decay_function, monkeypatch)
+
+    monkeypatch.setattr(relevance, "NUMPY_AVAILABLE", False)
+    assert score_batch(created, accessed, counts, now=NOW, decay_function=decay_function) == expected
+
+
+@pytest.mark.parametrize("decay_function", ["exponential", "linear", "step"])
+def test_numpy_scoring_matches(decay_function, monkeypatch):
+    pytest.importorskip("numpy")
+    created, accessed, counts = _random_inputs(500)
+
+    vectorized = score_batch(created, accessed, counts, now=NOW, decay_function=decay_function)
+    monkeypatch.setattr(relevance, "NUMPY_AVAILABLE", False)
+    plain = score_batch(created, accessed, counts, now=NOW, decay_function=decay_function)
+    # Rounding to 3 places may differ by one unit at exact ties
+    assert vectorized == pytest.approx(plain, abs=0.0011)
+
+
+def test_score_items_and_ranking():
+    old = (NOW - timedelta(days=90)).isoformat()
+    items = [
+        {"id": 1, "created": old},
+        {"id": 2, "created": old, "accessed": (NOW - timedelta(days=1)).isoformat()},
+        {"id": 3, "created": NOW},  # YAML may load unquoted timestamps as datetimes
+        {"id": 4, "relevance_score": 0.9},  # No created: existing score is kept
+    ]
+
+    score_items(items, now=NOW)
+    assert [item["relevance_score"] for item in items] == [0.125, 0.977, 1.0, 0.9]
+
+    now = datetime.now(timezone.utc)
+    items = [
+        {"id": 1, "created": (now - timedelta(days=90)).isoformat()},
+        {"id": 2, "created": (now - timedelta(days=10)).isoformat()},
+        {"id": 3, "created": now.isoformat()},
+    ]
+    ranked = rank_by_relevance(items, min_relevance=0.3)
+    assert [item["id"] for item in ranked] == [3, 2]
+
+
+def _age_task(task: dict, days: int) -> None:
+    path = Path(task["path"])
+    frontmatter, body = parse_frontmatter(path.read_text())
+    created = datetime.now(timezone.utc) - timedelta(days=days)
+    frontmatter["created"] = created.isoformat().replace("+00:00", "Z")
+    path.write_text(render_frontmatter(frontmatter, body))
+
+
+def test_decay_sweep_only_reads_by_default(temp_project):
+    create_task("Fresh")
+    stale = create_task("Stale")
+    accessed = create_task("Accessed")
+    _age_task(stale, 120)
+    get_task(accessed["id"])
+    before = {p: p.read_text() for p in Path(stale["path"]).parent.glob("*.md")}
+
+    result = decay_sweep(temp_project)
+
+    assert result["count"] == 3
+    assert result["updated"] == 0
+    assert result["stale"] == [
+        {"kind": "task", "id": stale["id"], "title": "Stale", "relevance_score": 0.062}
+    ]
+    assert {p: p.read_text() for p in before} == before
+    # The access is still journaled, not lost
+    assert get_task(accessed["id"], update_access=False)["access_count"] == 1
+
+
+def test_decay_sweep_rewrites_only_drifted_files(temp_project):
+    fresh = create_task("Fresh")
+    stale = create_task("Stale")
+    accessed = create_task("Accessed")
+    _age_task(stale, 120)
+    get_task(accessed["id"])
+    fresh_before = Path(fresh["path"]).read_text()
+
+    result = decay_sweep(temp_project, write=True)
+
+    assert result["count"] == 3
+    assert result["updated"] == 1
+    assert result["stale_count"] == 1
+    assert Path(fresh["path"]).read_text() == fresh_before
+    assert parse_frontmatter(Path(stale["path"]).read_text())[0]["relevance_score"] == 0.062
+    # Journaled accesses were folded in
+    assert parse_frontmatter(Path(accessed["path"]).read_text())[0]["access_count"] == 1
+    assert decay_sweep(temp_project, write=True)["updated"] == 0
+
+
+def test_context_filters_by_current_relevance(temp_project):
+    create_task("Current work")
+    _age_task(create_task("Forgotten"), 120)
+
+    titles = [t["title"] for t in gather_context(temp_project, min_relevance=0.3).open_tasks]
+    assert titles == ["Current work"]
+
+    with_stale = gather_context(temp_project, include_stale=True).open_tasks
+    assert {t["title"] for t in with_stale} == {"Current work", "Forgotten"}
@@ -3,6 +3,7 @@
 import json
 from unittest.mock import patch
 
+import pytest
 
 from idlergear.testing import (
     TestFramework,
@@ -859,3 +860,210 @@ class TestSyncExternalRuns:
         assert len(imported) == 1
         assert imported[0].passed == 2
         assert imported[0].failed == 0
+
+
+class TestCoverageMap:
+    """Source/test mapping and incremental updates."""
+
+    def _project(self, tmp_path):
+        (tmp_path / "pyproject.toml").write_text('[tool.pytest]\ntestpaths = ["tests"]')
+        (tmp_path / ".idlergear" / "tests").mkdir(parents=True)
+        for rel in (
+            "src/pkg/__init__.py",
+            "src/pkg/io.py",
+            "src/pkg/version.py",
+            "src/pkg/daemon/__init__.py",
+            "src/pkg/daemon/changes.py",
+            "tests/conftest.py",
+            "tests/test_version.py",
+            "tests/test_daemon_changes.py",
+        ):
+            (tmp_path / rel).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / rel).write_text("")
+        return tmp_path
+
+    def _build(self, project):
+        from idlergear.testing import _enumerate_pytest_files, build_coverage_map
+
+        with patch(
+            "idlergear.testing.enumerate_tests", side_effect=_enumerate_pytest_files
+        ):
+            return build_coverage_map(project)
+
+    def test_maps_by_name_and_package(self, tmp_path):
+        coverage_map = self._build(self._project(tmp_path))
+
+        assert coverage_map.mappings == {
+            "src/pkg/daemon/__init__.py": ["tests/test_daemon_changes.py"],
+            "src/pkg/daemon/changes.py": ["tests/test_daemon_changes.py"],
+            "src/pkg/version.py": ["tests/test_version.py"],
+        }
+        # "io" is not a word of test_version
+        assert coverage_map.uncovered == ["src/pkg/__init__.py", "src/pkg/io.py"]
+        assert coverage_map.test_files == [
+            "tests/test_daemon_changes.py",
+            "tests/test_version.py",
+        ]
+
+    def test_maps_imports_from_graph(self, tmp_path):
+        project = self._project(tmp_path)
+        with patch(
+            "idlergear.testing._graph_imports",
+            return_value=[("tests/test_version.py", "src/pkg/io.py")],
+        ):
+            coverage_map = self._build(project)
+
+        assert coverage_map.mappings["src/pkg/io.py"] == ["tests/test_version.py"]
+        assert coverage_map.reverse_mappings["tests/test_version.py"] == [
+            "src/pkg/io.py",
+            "src/pkg/version.py",
+        ]
+
+    def test_incremental_update_matches_rebuild(self, tmp_path):
+        from idlergear.testing import get_coverage_map, update_coverage_map
+
+        project = self._project(tmp_path)
+        self._build(project)
+
+        (project / "src" / "pkg" / "version.py").unlink()
+        (project / "tests" / "test_io.py").write_text("")
+        (project / "src" / "pkg" / "daemon" / "server.py").write_text("")
+        updated = update_coverage_map(
+            [
+                ("src/pkg/version.py", "deleted"),
+                ("tests/test_io.py", "created"),
+                ("src/pkg/daemon/server.py", "created"),
+                ("src/pkg/io.py", "modified"),
+            ],
+            project,
+        )
+
+        assert updated.mappings["src/pkg/io.py"] == ["tests/test_io.py"]
+        assert "tests/test_version.py" not in updated.reverse_mappings
+        rebuilt = self._build(project)
+        assert updated.mappings == rebuilt.mappings
+        assert updated.reverse_mappings == rebuilt.reverse_mappings
+        assert updated.uncovered == rebuilt.uncovered
+        assert get_coverage_map(project).mappings == rebuilt.mappings
+
+    def test_update_without_saved_map(self, tmp_path):
+        from idlergear.testing import update_coverage_map
+
+        project = self._project(tmp_path)
+        assert update_coverage_map([("src/pkg/io.py", "created")], project) is None
+
+
+class TestImpactMap:
+    """Per-test impact recording and selection."""
+
+    OPS = (
+        "LIMIT = 100\n\n\n"
+        "def add(a, b):\n    return a + b\n\n\n"
+        "def mul(a, b):\n"
+        "    total = 0\n"
+        "    for _ in range(b):\n"
+        "        total = add(total, a)\n"
+        "    return total\n"
+    )
+
+    def _project(self, tmp_path):
+        import subprocess
+
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.pytest.ini_options]\npythonpath = ["src"]\n'
+        )
+        (tmp_path / ".idlergear").mkdir()
+        (tmp_path / ".gitignore").write_text(".idlergear/\n")
+        (tmp_path / "src" / "calc").mkdir(parents=True)
+        (tmp_path / "src" / "calc" / "__init__.py").write_text("")
+        (tmp_path / "src" / "calc" / "ops.py").write_text(self.OPS)
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "tests" / "test_add.py").write_text(
+            "import pytest\nfrom calc.ops import add\n\n\n"
+            "@pytest.mark.parametrize('a', [1, 2])\n"
+            "def test_add(a):\n    assert add(a, 1) == a + 1\n"
+        )
+        (tmp_path / "tests" / "test_mul.py").write_text(
+            "from calc.ops import mul\n\n\nclass TestMul:\n"
+            "    def test_mul(self):\n        assert mul(3, 4) == 12\n\n"
+            "    def test_zero(self):\n        assert mul(3, 0) == 0\n"
+        )
+        for args in (
+            ["init", "-q"],
+            ["add", "."],
+            ["-c", "user.email=t@example.com", "-c", "user.name=T", "commit", "-qm", "init"],
+        ):
+            subprocess.run(["git", *args], cwd=tmp_path, check=True)
+        return tmp_path
+
+    def _impact(self):
+        from idlergear.testing import ImpactMap
+
+        return ImpactMap(
+            framework="pytest",
+            timestamp="2024-01-01T12:00:00",
+            commit="",
+            tests=[
+                "tests/test_add.py::test_add",
+                "tests/test_mul.py::TestMul::test_mul",
+                "tests/test_mul.py::TestMul::test_zero",
+            ],
+            lines={
+                "src/calc/ops.py": {5: 0b011, 9: 0b110, 10: 0b110, 11: 0b010, 12: 0b110}
+            },
+        )
+
+    def test_round_trip(self):
+        from idlergear.testing import ImpactMap
+
+        impact = self._impact()
+        data = impact.to_dict()
+        assert data["files"]["src/calc/ops.py"] == [
+            ["Aw==", "5"],
+            ["Bg==", "9-10,12"],
+            ["Ag==", "11"],
+        ]
+        assert ImpactMap.from_dict(json.loads(json.dumps(data))) == impact
+
+    def test_selects_tests_for_changed_lines(self, tmp_path):
+        from idlergear.testing import _snapshot_commit, select_impacted_tests
+
+        project = self._project(tmp_path)
+        impact = self._impact()
+        impact.commit = _snapshot_commit(project)
+        ops = project / "src" / "calc" / "ops.py"
+
+        ops.write_text(self.OPS.replace("add(total, a)", "add(a, total)"))
+        assert select_impacted_tests(impact, ["src/calc/ops.py", "README.md"], project) == (
+            ["tests/test_mul.py::TestMul::test_mul"],
+            ["README.md"],
+        )
+
+        # Import-time lines select every test of the file
+        ops.write_text(self.OPS.replace("LIMIT = 100", "LIMIT = 10"))
+        assert select_impacted_tests(impact, ["src/calc/ops.py"], project)[0] == impact.tests
+
+        # Unchanged since the recording
+        ops.write_text(self.OPS)
+        assert select_impacted_tests(impact, ["src/calc/ops.py"], project)[0] == []
+
+    def test_record_and_run_changed(self, tmp_path):
+        pytest.importorskip("coverage")
+        from idlergear.testing import get_tests_for_changes, record_test_impact
+
+        project = self._project(tmp_path)
+        impact, result, output = record_test_impact(project)
+        assert impact is not None, output
+        assert result.passed == 4
+        assert impact.lines == self._impact().lines
+        assert sorted(impact.tests) == self._impact().tests
+
+        ops = project / "src" / "calc" / "ops.py"
+        ops.write_text(self.OPS.replace("add(total, a)", "add(a, total)"))
+        (project / "tests" / "test_add.py").write_text(
+            (project / "tests" / "test_add.py").read_text() + "# edited\n"
+        )
+        assert get_tests_for_changes(project) == [
+            "tests/test_add.py",
+            "tests/test_mul.py::TestMul::test_mul",
+        ]
@@ -0,0 +1,105 @@
+"""Tests for TreeSitterParser single-pass extraction."""
+
+from idlergear.graph.parsers import TreeSitterParser
+
+
+def _names(result):
+    return [(s["name"], s["type"]) for s in result["symbols"]]
+
+
+class TestQueryCache:
+    """Extraction queries are compiled once per language."""
+
+    def test_query_shared_across_instances(self):
+        first = TreeSitterParser().get_query("python")
+        second = TreeSitterParser().get_query("python")
+        assert first is not None
+        assert first is second
+
+    def test_unsupported_language_has_no_query(self):
+        parser = TreeSitterParser()
+        assert parser.get_query("cobol") is None
+        result = parser.parse_source("int main() { return 0; }", "c")
+        assert result["symbols"] == []
+
+
+class TestSinglePassExtraction:
+    """Symbols, imports, comments and calls from one capture pass."""
+
+    def test_python_methods_use_innermost_class(self):
+        result = TreeSitterParser().parse_source(
+            "import os\n"
+            "# top comment\n"
+            "class Outer:\n"
+            '    """Outer doc."""\n'
+            "    def run(self):\n"
+            "        class Inner:\n"
+            "            def go(self):\n"
+            "                os.getcwd()\n"
+            "\n"
+            "def helper():\n"
+            "    pass\n",
+            "python",
+        )
+        assert _names(result) == [
+            ("Outer", "class"),
+            ("Outer.run", "method"),
+            ("Inner", "class"),
+            ("Inner.go", "method"),
+            ("helper", "function"),
+        ]
+        assert result["symbols"][0]["docstring"] == "Outer doc."
+        assert result["symbols"][0]["line_start"] == 3
+        assert result["comments"] == [{"text": "# top comment", "line": 2}]
+        assert result["calls"] == [{"name": "getcwd", "receiver": "os", "line": 8}]
+
+    def test_rust_impl_functions_are_methods_only(self):
+        result = TreeSitterParser().parse_source(
+            "struct Client {}\n"
+            "impl Client {\n"
+            "    fn new() -> Self { Client {} }\n"
+            "}\n"
+            "fn connect() {}\n",
+            "rust",
+        )
+        assert _names(result) == [
+            ("Client", "class"),
+            ("Client.new", "method"),
+            ("connect", "function"),
+        ]
+
+    def test_go_methods_and_types(self):
+        result = TreeSitterParser().parse_source(
+            "package p\n"
+            "type Server struct{}\n"
+            "func (s *Server) Start() {}\n"
+            "func Run() {}\n",
+            "go",
+        )
+        assert _names(result) == [
+            ("Server", "class"),
+            ("Server.Start", "method"),
+            ("Run", "function"),
+        ]
+        assert result["symbols"][0]["code"] == "type Server struct{}"
+
+    def test_javascript_arrow_and_class_methods(self):
+        result = TreeSitterParser().parse_source(
+            "class Widget { render() {} }\n"
+            "const make = () => new Widget();\n",
+            "javascript",
+        )
+        assert _names(result) == [
+            ("Widget", "class"),
+            ("Widget.render", "method"),
+            ("make", "function"),
+        ]
+        assert result["calls"] == [{"name": "Widget", "receiver": None, "line": 2}]
+
+    def test_non_ascii_source_positions(self):
+        result = TreeSitterParser().parse_source(
+            '# café ✓\ndef résumé():\n    """Ünïcode."""\n', "python"
+        )
+        assert result["comments"][0]["text"] == "# café ✓"
+        assert result["symbols"][0]["name"] == "résumé"
+        assert result["symbols"][0]["docstring"] == "Ünïcode."
@@ -426,3 +426,67 @@ def test_by_type_view_groups_tasks_by_priority(temp_project):
 
     # Should handle all priority levels without errors
     assert tree is not None
+
+
+def _set_view_data(view, data):
+    """Assign view data without triggering a (mount-requiring) tree rebuild."""
+    view.set_reactive(type(view).data, data)
+
+
+def test_by_type_view_groups_are_lazy(temp_project):
+    """Collapsed groups create no leaves until expanded."""
+    view = ByTypeView(project_root=temp_project)
+    _set_view_data(view, {
+        "tasks": [
+            {"id": i, "title": f"Task {i}", "priority": "high"} for i in range(500)
+        ],
+        "files": [{"path": f"src/mod{i}.py"} for i in range(1000)],
+    })
+
+    tree = view.compose_tree()
+    task_node = tree.root.children[0]
+    high_node = task_node.children[0]
+    files_node = tree.root.children[1]
+
+    assert str(high_node.label) == "[HIGH] (500)"
+    assert len(high_node.children) == 0
+    assert len(files_node.children) == 0
+
+    # Expanding loads one page plus a "show next" leaf
+    assert view.load_next_page(high_node) == 200
+    assert len(high_node.children) == 201
+    assert "show next 200" in str(high_node.children[-1].label)
+
+
+def test_lazy_group_pages_until_exhausted(temp_project):
+    """Paging replaces the "show next" leaf until all items are loaded."""
+    view = ByTimeView(project_root=temp_project)
+    view.page_size = 2
+    _set_view_data(view, {"tasks": [{"id": i, "title": f"T{i}"} for i in range(5)]})
+
+    tree = view.compose_tree()
+    older = tree.root.children[0]
+
+    view.load_next_page(older)
+    view.load_next_page(older)
+    assert view.load_next_page(older) == 1
+    assert [str(n.label) for n in older.children] == [
+        f"#{i} T{i}" for i in range(5)
+    ]
+    assert view.load_next_page(older) == 0
+
+
+def test_by_type_view_model_is_cached_per_data(temp_project):
+    """Grouping is reused across rebuilds until the data dict changes."""
+    view = ByTypeView(project_root=temp_project)
+    data = {"tasks": [{"id": 1, "title": "A", "priority": "low"}]}
+    _set_view_data(view, data)
+
+    view.compose_tree()
+    first = view._model_cache["tasks_by_priority"][1]
+    view.compose_tree()
+    assert view._model_cache["tasks_by_priority"][1] is first
+
+    _set_view_data(view, {"tasks": []})
+    view.compose_tree()
+    assert view._model_cache["tasks_by_priority"][1] == {}
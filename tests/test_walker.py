@@ -0,0 +1,111 @@
+"""Tests for the pruned, gitignore-aware directory walker."""
+
+from pathlib import Path
+
+import pytest
+
+from idlergear.walker import DirectoryWalker, GitignoreSpec, walk_files
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Create a small project tree."""
+    files = [
+        "README.md",
+        "src/pkg/__init__.py",
+        "src/pkg/core.py",
+        "src/pkg/data.json",
+        "tests/test_core.py",
+        "node_modules/left-pad/index.js",
+        ".venv/lib/site.py",
+        "build/out.py",
+    ]
+    for rel in files:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    return tmp_path
+
+
+def test_walk_prunes_default_excludes(tree):
+    """Excluded directories are never yielded or descended into."""
+    files = walk_files(tree)
+
+    assert files == [
+        "README.md",
+        "src/pkg/__init__.py",
+        "src/pkg/core.py",
+        "src/pkg/data.json",
+        "tests/test_core.py",
+    ]
+
+
+def test_walk_filters_by_suffix_and_pattern(tree):
+    """Suffix and glob filters select matching files only."""
+    assert walk_files(tree, suffixes=(".py",)) == [
+        "src/pkg/__init__.py",
+        "src/pkg/core.py",
+        "tests/test_core.py",
+    ]
+    assert walk_files(tree, pattern="test_*.py") == ["tests/test_core.py"]
+    assert walk_files(tree, pattern="pkg/*.json") == ["src/pkg/data.json"]
+
+
+def test_walk_parallel_matches_serial(tree):
+    """Fanning subtrees out to threads yields the same entries."""
+    walker = DirectoryWalker(tree)
+    serial = sorted(e.rel_path for e in walker.walk(include_dirs=True))
+    parallel = sorted(e.rel_path for e in walker.walk(include_dirs=True, workers=4))
+
+    assert serial == parallel
+
+
+def test_walk_max_depth(tree):
+    """max_depth limits how far the walker descends."""
+    walker = DirectoryWalker(tree)
+    rels = {e.rel_path for e in walker.walk(include_dirs=True, max_depth=1)}
+
+    assert "src/pkg" in rels
+    assert "src/pkg/core.py" not in rels
+
+
+def test_nested_gitignore(tree):
+    """A nested .gitignore applies only below its own directory."""
+    (tree / ".gitignore").write_text("*.json\n")
+    (tree / "src" / ".gitignore").write_text("/pkg/core.py\n!data.json\n")
+
+    files = walk_files(tree)
+
+    assert "src/pkg/core.py" not in files
+    assert "src/pkg/data.json" in files
+    assert "tests/test_core.py" in files
+
+
+def test_gitignore_disabled(tree):
+    """use_gitignore=False ignores .gitignore files."""
+    (tree / ".gitignore").write_text("src/\n")
+
+    assert "src/pkg/core.py" in walk_files(tree, use_gitignore=False)
+    assert "src/pkg/core.py" not in walk_files(tree)
+
+
+@pytest.mark.parametrize(
+    "pattern,path,is_dir,expected",
+    [
+        ("*.log", "a/b/debug.log", False, True),
+        ("/build", "build", True, True),
+        ("/build", "src/build", True, None),
+        ("docs/", "docs", False, None),
+        ("docs/", "docs", True, True),
+        ("**/cache", "x/y/cache", True, True),
+        ("lib/**/gen", "lib/a/b/gen", True, True),
+    ],
+)
+def test_gitignore_spec_match(pattern, path, is_dir, expected):
+    """Gitignore patterns follow git's anchoring and dir-only rules."""
+    assert GitignoreSpec("", [pattern]).match(path, is_dir) is expected
+
+
+def test_walk_files_missing_root(tmp_path):
+    """A missing root yields no files."""
+    assert walk_files(tmp_path / "missing") == []
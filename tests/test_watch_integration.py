@@ -185,3 +185,120 @@ def test_watch_handles_no_versioned_files(temp_git_project):
     ]
 
     assert len(data_version_suggestions) == 0
+
+
+def _git(project_path, *args):
+    subprocess.run(["git", *args], cwd=project_path, check=True, capture_output=True)
+
+
+def _comparable(status):
+    return [(s.category, s.message) for s in status.suggestions], (
+        status.files_changed,
+        status.lines_added,
+        status.lines_deleted,
+    )
+
+
+def test_incremental_state_matches_full_analysis(temp_git_project):
+    """Per-path refreshes merge to the same result as a full analysis."""
+    from idlergear.watch import WatchState, analyze
+
+    project_path = temp_git_project
+    (project_path / "a.py").write_text("x = 1\n")
+    (project_path / "b.py").write_text("y = 2\n")
+    _git(project_path, "add", ".")
+    _git(project_path, "commit", "-m", "init")
+
+    state = WatchState(project_path)
+    state.refresh()
+    assert state.full_scans == 1
+
+    (project_path / "a.py").write_text("x = 1\n# TODO: handle errors\n")
+    state.refresh([str(project_path / "a.py")])
+    assert state.full_scans == 1
+    assert state.partial_scans == 1
+    assert [t["file"] for t in state.todo_findings()] == ["a.py"]
+
+    (project_path / "c.py").write_text("z = 3  # FIXME: naming\n")
+    state.refresh(["c.py"])
+    assert "c.py" in state.newly_added_files()
+
+    (project_path / "a.py").write_text("x = 1\n")
+    state.refresh(["a.py"])
+    assert [t["file"] for t in state.todo_findings()] == []
+
+    assert state.git_status() == _full_git_status(project_path)
+    assert _comparable(analyze(project_path, state=state)) == _comparable(
+        analyze(project_path)
+    )
+
+
+def _full_git_status(project_path):
+    from idlergear.watch import WatchState
+
+    fresh = WatchState(project_path)
+    fresh.refresh()
+    return fresh.git_status()
+
+
+def test_incremental_state_rescans_after_commit(temp_git_project):
+    """A new HEAD invalidates every cached path."""
+    from idlergear.watch import WatchState
+
+    project_path = temp_git_project
+    (project_path / "a.py").write_text("x = 1\n")
+    _git(project_path, "add", ".")
+    _git(project_path, "commit", "-m", "init")
+
+    (project_path / "a.py").write_text("x = 2\n")
+    state = WatchState(project_path)
+    state.refresh()
+    assert state.git_status()["files_changed"] == 1
+
+    _git(project_path, "commit", "-am", "second")
+    state.refresh([])
+    assert state.full_scans == 2
+    assert state.git_status()["files_changed"] == 0
+
+
+def test_incremental_stale_data_reference(temp_git_project):
+    """Only the changed Python file is re-parsed for data references."""
+    from idlergear.watch import WatchState
+
+    project_path = temp_git_project
+    (project_path / "data.csv").write_text("a,b\n")
+    (project_path / "data_old.csv").write_text("a,b\n")
+    (project_path / "analysis.py").write_text("x = 1\n")
+    _git(project_path, "add", ".")
+    _git(project_path, "commit", "-m", "init")
+
+    state = WatchState(project_path)
+    state.refresh()
+    assert state.stale_data_references() == []
+
+    (project_path / "analysis.py").write_text(
+        "import pandas as pd\ndf = pd.read_csv('data_old.csv')\n"
+    )
+    state.refresh(["analysis.py"])
+    warnings = state.stale_data_references()
+    assert len(warnings) == 1
+    assert warnings[0]["stale_file"] == "data_old.csv"
+
+
+def test_file_watcher_reanalyzes_only_changed_paths(temp_git_project):
+    """The watcher keeps one WatchState and feeds it each debounced batch."""
+    from idlergear.watch import FileWatcher, WatchConfig
+
+    project_path = temp_git_project
+    (project_path / "a.py").write_text("x = 1\n")
+    _git(project_path, "add", ".")
+    _git(project_path, "commit", "-m", "init")
+
+    watcher = FileWatcher(config=WatchConfig(), project_root=project_path)
+    watcher._check_and_notify([])
+    (project_path / "a.py").write_text("x = 2\n")
+    watcher._check_and_notify([str(project_path / "a.py")])
+
+    assert watcher._state.full_scans == 1
+    assert watcher._state.partial_scans == 1
+    assert watcher._last_status.files_changed == 1